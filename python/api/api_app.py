@@ -12,34 +12,50 @@ Data endpoints (#298):
   GET /api/v1/brokers/{broker}/symbols
   GET /api/v1/brokers/{broker}/symbols/{symbol}/coverage
   GET /api/v1/brokers/{broker}/symbols/{symbol}/bars
+
+Index and bar-file access go through one long-lived ApiDataService (app.state).
 """
 
-from fastapi import FastAPI, Request
+from contextlib import asynccontextmanager
+
+from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
+from python.api.api_data_service import ApiDataService, get_data_service
 from python.api.endpoints import bars_router, broker_router, reports_router
 from python.configuration.app_config_manager import AppConfigManager
-from python.data_management.index.bars_index_manager import BarsIndexManager
 from python.framework.exceptions.api_errors import ApiException
+from python.framework.exceptions.run_catalog_errors import AmbiguousRunIdError
 from python.framework.types.api.api_types import BrokerListResponse, HealthResponse, TimeframeInfo, TimeframeListResponse
 from python.framework.utils.timeframe_config_utils import TimeframeConfig
 
 
-def create_app() -> FastAPI:
+def create_app(data_service: ApiDataService = None) -> FastAPI:
     """
     Create and configure the FastAPI application.
 
+    Args:
+        data_service: Shared data access (default: new ApiDataService over the configured data)
+
     Returns:
         Configured FastAPI instance with CORS, error handler, and routes registered.
     """
     app_version = AppConfigManager().get_version()
 
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        # Load the index once at startup (requests reload only on index file change)
+        app.state.data_service.bar_index()
+        yield
+
     app = FastAPI(
         title='FiniexTestingIDE API',
         version=app_version,
         description='Read-only HTTP interface for tick and bar data.',
+        lifespan=lifespan,
     )
+    app.state.data_service = data_service or ApiDataService()
 
     app.add_middleware(
         CORSMiddleware,
@@ -60,6 +76,15 @@ def create_app() -> FastAPI:
             content={'error': exc.error, 'detail': exc.detail},
         )
 
+    @app.exception_handler(AmbiguousRunIdError)
+    async def ambiguous_run_handler(request: Request, exc: AmbiguousRunIdError) -> JSONResponse:
+        # A bare run id shared by several runs — the client picks one by its reference
+        return JSONResponse(
+            status_code=409,
+            content={'error': 'ambiguous_run_id',
+                     'detail': f"{exc} — address the run as '<owner>/<run_id>'"},
+        )
+
     @app.get('/api/v1/health', response_model=HealthResponse)
     def health() -> HealthResponse:
         return HealthResponse(status='ok', version=app_version)
@@ -72,10 +97,8 @@ def create_app() -> FastAPI:
         ])
 
     @app.get('/api/v1/brokers', response_model=BrokerListResponse)
-    def list_brokers() -> BrokerListResponse:
-        index = BarsIndexManager()
-        index.load_index()
-        return BrokerListResponse(brokers=index.list_broker_types())
+    def list_brokers(data: ApiDataService = Depends(get_data_service)) -> BrokerListResponse:
+        return BrokerListResponse(brokers=data.bar_index().list_broker_types())
 
     app.include_router(broker_router.router, prefix='/api/v1')
     app.include_router(bars_router.router, prefix='/api/v1')
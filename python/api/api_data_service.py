@@ -0,0 +1,283 @@
+"""
+FiniexTestingIDE — API Data Service
+
+App-level, long-lived data access for the HTTP API. Created once per application
+(app.state.data_service) and shared by all requests:
+
+- Bar index: loaded once, rebuilt (fresh manager, swapped in) only when the index file's mtime changes
+- Bar files: small LRU of opened Parquet files with per-row-group timestamp bounds;
+  range queries read only the row groups overlapping the range
+- Results are column arrays — responses are built without per-row pandas access;
+  level-of-detail buckets are aggregated on the arrays (aggregate_bars)
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+from fastapi import Request
+
+from python.data_management.index.bars_index_manager import BarsIndexManager
+
+BAR_COLUMNS = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+
+
+@dataclass
+class BarColumns:
+    """
+    Bars of one range query as column arrays.
+
+    Args:
+        t: Bar open times, UTC unix seconds (int64)
+        o / h / l / c / v: Prices and volume (float64)
+    """
+    t: np.ndarray
+    o: np.ndarray
+    h: np.ndarray
+    l: np.ndarray
+    c: np.ndarray
+    v: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.t)
+
+
+class BarFileHandle:
+    """
+    An opened bar Parquet file with the timestamp bounds of every row group.
+
+    Bounds come from the row-group statistics; a row group without statistics
+    is read once for its timestamp column. The handle is shared by all request threads;
+    reads on its ParquetFile are serialized by a per-handle lock.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: Bar parquet file
+        """
+        stat = path.stat()
+        self.path = path
+        self.file_state: Tuple[int, int] = (stat.st_size, stat.st_mtime_ns)
+        self.parquet = pq.ParquetFile(path)
+        self._read_lock = threading.Lock()
+
+        ts_idx = self.parquet.schema_arrow.get_field_index('timestamp')
+        bounds = [self._row_group_bounds(i, ts_idx)
+                  for i in range(self.parquet.num_row_groups)]
+        self.rg_min = np.array([b[0] for b in bounds], dtype=np.int64)
+        self.rg_max = np.array([b[1] for b in bounds], dtype=np.int64)
+
+    def read_range(self, from_utc: datetime, to_utc: datetime, limit: int) -> BarColumns:
+        """
+        Bars with from_utc <= timestamp <= to_utc, at most limit.
+
+        Args:
+            from_utc: Range start (UTC)
+            to_utc: Range end (UTC)
+            limit: Maximum number of bars (earliest first)
+
+        Returns:
+            BarColumns of the range
+        """
+        from_ns, to_ns = _ns(from_utc), _ns(to_utc)
+        groups = np.flatnonzero((self.rg_min <= to_ns) & (self.rg_max >= from_ns)).tolist()
+        if not groups:
+            return _empty_columns()
+
+        with self._read_lock:
+            table = self.parquet.read_row_groups(groups, columns=BAR_COLUMNS)
+        ts = _to_ns(table.column('timestamp').to_pandas())
+        selected = np.flatnonzero((ts >= from_ns) & (ts <= to_ns))[:limit]
+
+        def column(name: str) -> np.ndarray:
+            return table.column(name).to_numpy()[selected].astype(np.float64, copy=False)
+
+        return BarColumns(
+            t=ts[selected] // 1_000_000_000,
+            o=column('open'),
+            h=column('high'),
+            l=column('low'),
+            c=column('close'),
+            v=column('volume'),
+        )
+
+    def _row_group_bounds(self, row_group: int, ts_idx: int) -> Tuple[int, int]:
+        """(min, max) timestamp of a row group as UTC ns."""
+        stats = self.parquet.metadata.row_group(row_group).column(ts_idx).statistics
+        if stats is not None and stats.has_min_max:
+            return _ns(stats.min), _ns(stats.max)
+        ts = _to_ns(self.parquet.read_row_group(
+            row_group, columns=['timestamp']).column(0).to_pandas())
+        return int(ts.min()), int(ts.max())
+
+
+class ApiDataService:
+    """
+    Shared index and bar-file access for the API routers.
+
+    Thread-safe: sync endpoints run concurrently in the server's thread pool. The service
+    state is guarded by one lock, each opened bar file by its own (BarFileHandle).
+    """
+
+    def __init__(
+        self,
+        index_factory: Callable[[], BarsIndexManager] = BarsIndexManager,
+        max_open_files: int = 16
+    ):
+        """
+        Args:
+            index_factory: Creates the bar index manager (default: configured data dir)
+            max_open_files: Size of the bar-file LRU
+        """
+        self._index_factory = index_factory
+        self._max_open_files = max_open_files
+        self._lock = threading.Lock()
+
+        self._bar_index: Optional[BarsIndexManager] = None
+        self._bar_index_mtime: Optional[int] = None
+        self._files: 'OrderedDict[Path, BarFileHandle]' = OrderedDict()
+
+    def bar_index(self) -> BarsIndexManager:
+        """
+        The bar index — loaded once, reloaded when the index file changed.
+
+        A reload builds a fresh manager and swaps it in; a manager already handed out
+        is never mutated, so a request keeps a consistent index while another reloads.
+
+        Returns:
+            Loaded BarsIndexManager
+        """
+        with self._lock:
+            current, loaded_mtime = self._bar_index, self._bar_index_mtime
+        if current is not None and self._index_file_mtime(current) == loaded_mtime:
+            return current
+
+        fresh = self._index_factory()
+        # mtime before the load: a change during the load triggers the next reload
+        mtime = self._index_file_mtime(fresh)
+        fresh.load_index()
+        with self._lock:
+            self._bar_index, self._bar_index_mtime = fresh, mtime
+        return fresh
+
+    def read_bars(self, bar_file: Path, from_utc: datetime, to_utc: datetime, limit: int) -> BarColumns:
+        """
+        Bars of one bar file within a time range.
+
+        Args:
+            bar_file: Bar parquet file (from the index)
+            from_utc: Range start (UTC)
+            to_utc: Range end (UTC)
+            limit: Maximum number of bars
+
+        Returns:
+            BarColumns of the range
+        """
+        return self._file_handle(Path(bar_file)).read_range(from_utc, to_utc, limit)
+
+    def _file_handle(self, path: Path) -> BarFileHandle:
+        """Opened handle from the LRU; reopened if the file changed on disk."""
+        stat = path.stat()
+        with self._lock:
+            handle = self._files.get(path)
+            if handle is not None and handle.file_state == (stat.st_size, stat.st_mtime_ns):
+                self._files.move_to_end(path)
+                return handle
+
+        handle = BarFileHandle(path)
+        with self._lock:
+            self._files[path] = handle
+            self._files.move_to_end(path)
+            while len(self._files) > self._max_open_files:
+                self._files.popitem(last=False)
+        return handle
+
+    @staticmethod
+    def _index_file_mtime(index: BarsIndexManager) -> int:
+        """mtime_ns of the index file (0 if missing)."""
+        try:
+            return Path(index.index_file).stat().st_mtime_ns
+        except (OSError, TypeError):
+            return 0
+
+
+def get_data_service(request: Request) -> ApiDataService:
+    """FastAPI dependency: the application's data service."""
+    return request.app.state.data_service
+
+
+def bar_rows(bars: BarColumns) -> List[Dict]:
+    """
+    Response rows from column arrays (one tolist() per column, no per-row pandas).
+
+    Args:
+        bars: Range query result
+
+    Returns:
+        List of {'t','o','h','l','c','v'} dicts
+    """
+    return [
+        {'t': t, 'o': o, 'h': h, 'l': l, 'c': c, 'v': v}
+        for t, o, h, l, c, v in zip(
+            bars.t.tolist(), bars.o.tolist(), bars.h.tolist(),
+            bars.l.tolist(), bars.c.tolist(), bars.v.tolist())
+    ]
+
+
+def aggregate_bars(bars: BarColumns, bucket_seconds: int) -> BarColumns:
+    """
+    Aggregate bars into epoch-aligned buckets, preserving extremes.
+
+    open = first open, high = max high, low = min low, close = last close,
+    volume = sum. Buckets without source bars (gaps, weekends) are omitted.
+
+    Args:
+        bars: Source bars, ascending by time
+        bucket_seconds: Bucket width in seconds
+
+    Returns:
+        BarColumns with one bar per non-empty bucket (t = bucket start)
+    """
+    if len(bars) == 0:
+        return bars
+
+    bucket_ids = bars.t // bucket_seconds
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(bucket_ids)) + 1))
+    ends = np.append(starts[1:], len(bars)) - 1
+
+    return BarColumns(
+        t=bucket_ids[starts] * bucket_seconds,
+        o=bars.o[starts],
+        h=np.maximum.reduceat(bars.h, starts),
+        l=np.minimum.reduceat(bars.l, starts),
+        c=bars.c[ends],
+        v=np.add.reduceat(bars.v, starts),
+    )
+
+
+def _ns(moment) -> int:
+    """A datetime as UTC int64 ns (naive read as UTC)."""
+    ts = pd.Timestamp(moment)
+    if ts.tzinfo is None:
+        ts = ts.tz_localize('UTC')
+    return int(ts.value)
+
+
+def _to_ns(timestamps: pd.Series) -> np.ndarray:
+    """A timestamp Series as UTC int64 ns (naive read as UTC)."""
+    if timestamps.dt.tz is None:
+        timestamps = timestamps.dt.tz_localize('UTC')
+    return np.asarray(timestamps.dt.as_unit('ns').array.asi8, dtype=np.int64)
+
+
+def _empty_columns() -> BarColumns:
+    empty_f = np.empty(0, dtype=np.float64)
+    return BarColumns(t=np.empty(0, dtype=np.int64), o=empty_f, h=empty_f,
+                      l=empty_f, c=empty_f, v=empty_f)
@@ -3,16 +3,26 @@ Coverage and bars endpoints.
 
 GET /api/v1/brokers/{broker}/symbols/{symbol}/coverage
 GET /api/v1/brokers/{broker}/symbols/{symbol}/bars?timeframe=M30&from=<iso>&to=<iso>
+GET /api/v1/brokers/{broker}/symbols/{symbol}/bars/lod?from=<iso>&to=<iso>&pixels=1200
 """
 
+import math
 from datetime import datetime, timezone
+from typing import List, Tuple
 
 import pandas as pd
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Depends, Query
 
+from python.api.api_data_service import (
+    ApiDataService,
+    aggregate_bars,
+    bar_rows,
+    get_data_service,
+)
 from python.data_management.index.bars_index_manager import BarsIndexManager
 from python.framework.exceptions.api_errors import ApiException
 from python.framework.types.api.api_types import (
+    BarLodResponse,
     BarResponse,
     CoverageResponse,
 )
@@ -22,11 +32,8 @@ router = APIRouter()
 
 MAX_BARS = 10_000
 
-
-def _load_index() -> BarsIndexManager:
-    index = BarsIndexManager()
-    index.load_index()
-    return index
+# LOD mode: finest stored timeframe whose bars in the range stay within this read budget
+LOD_MAX_SOURCE_BARS = 200_000
 
 
 def _require_broker_symbol(index: BarsIndexManager, broker: str, symbol: str) -> None:
@@ -36,6 +43,49 @@ def _require_broker_symbol(index: BarsIndexManager, broker: str, symbol: str) ->
         raise ApiException(404, 'not_found', f"Symbol '{symbol}' not found for broker '{broker}'.")
 
 
+def _validate_range(from_time: datetime, to_time: datetime) -> Tuple[datetime, datetime]:
+    from_utc = _utc(from_time)
+    to_utc = _utc(to_time)
+    if from_utc >= to_utc:
+        raise ApiException(400, 'invalid_range', "'from' must be earlier than 'to'.")
+    return from_utc, to_utc
+
+
+def _select_lod(timeframes: List[str], from_utc: datetime, to_utc: datetime, pixels: int) -> Tuple[str, int]:
+    """
+    Pick the source timeframe and bucket width for a pixel budget.
+
+    Source: the finest stored timeframe with at most LOD_MAX_SOURCE_BARS bars in the
+    range (coarsest stored timeframe otherwise). Bucket: the smallest multiple of the
+    source timeframe that yields at most `pixels` epoch-aligned buckets.
+
+    Returns:
+        (source timeframe, bucket width in seconds)
+    """
+    stored = sorted(
+        (tf for tf in timeframes if TimeframeConfig.exists(tf)),
+        key=TimeframeConfig.get_minutes,
+    )
+    span = (to_utc - from_utc).total_seconds()
+    source = next(
+        (tf for tf in stored if span / (TimeframeConfig.get_minutes(tf) * 60) <= LOD_MAX_SOURCE_BARS),
+        stored[-1],
+    )
+    tf_seconds = TimeframeConfig.get_minutes(source) * 60
+
+    def bucket_for(divisor: int) -> int:
+        return max(1, math.ceil(span / divisor / tf_seconds)) * tf_seconds
+
+    def bucket_count(bucket: int) -> int:
+        return int(to_utc.timestamp()) // bucket - int(from_utc.timestamp()) // bucket + 1
+
+    bucket = bucket_for(pixels)
+    if bucket_count(bucket) > pixels:
+        # Alignment can add one bucket; span / (pixels - 1) always fits
+        bucket = bucket_for(pixels - 1)
+    return source, bucket
+
+
 def _utc(dt: datetime) -> datetime:
     if dt.tzinfo is None:
         return dt.replace(tzinfo=timezone.utc)
@@ -43,9 +93,13 @@ def _utc(dt: datetime) -> datetime:
 
 
 @router.get('/brokers/{broker}/symbols/{symbol}/coverage', response_model=CoverageResponse)
-def get_coverage(broker: str, symbol: str) -> CoverageResponse:
+def get_coverage(
+    broker: str,
+    symbol: str,
+    data: ApiDataService = Depends(get_data_service),
+) -> CoverageResponse:
     """Return available date range and timeframes for a broker/symbol pair."""
-    index = _load_index()
+    index = data.bar_index()
     _require_broker_symbol(index, broker, symbol)
 
     stats = index.get_symbol_stats(broker, symbol)
@@ -69,12 +123,13 @@ def get_bars(
     timeframe: str,
     from_time: datetime = Query(..., alias='from'),
     to_time: datetime = Query(..., alias='to'),
+    data: ApiDataService = Depends(get_data_service),
 ) -> list[BarResponse]:
     """
     Return OHLCV bars for a broker/symbol/timeframe within a date range.
 
     Timestamps in the response are UTC unix seconds.
-    Capped at MAX_BARS per request.
+    Capped at MAX_BARS per request. Only the row groups overlapping the range are read.
     """
     if not TimeframeConfig.exists(timeframe):
         raise ApiException(
@@ -82,13 +137,9 @@ def get_bars(
             f"Timeframe '{timeframe}' is not valid. Valid: {TimeframeConfig.sorted()}",
         )
 
-    from_utc = _utc(from_time)
-    to_utc = _utc(to_time)
+    from_utc, to_utc = _validate_range(from_time, to_time)
 
-    if from_utc >= to_utc:
-        raise ApiException(400, 'invalid_range', "'from' must be earlier than 'to'.")
-
-    index = _load_index()
+    index = data.bar_index()
     _require_broker_symbol(index, broker, symbol)
 
     bar_file = index.get_bar_file(broker, symbol, timeframe)
@@ -98,18 +149,53 @@ def get_bars(
             f"No bars for '{broker}/{symbol}' at timeframe '{timeframe}'.",
         )
 
-    df = pd.read_parquet(bar_file)
-    mask = (df['timestamp'] >= from_utc) & (df['timestamp'] <= to_utc)
-    df = df[mask].head(MAX_BARS)
-
-    return [
-        BarResponse(
-            t=int(row['timestamp'].timestamp()),
-            o=row['open'],
-            h=row['high'],
-            l=row['low'],
-            c=row['close'],
-            v=row['volume'],
+    return bar_rows(data.read_bars(bar_file, from_utc, to_utc, MAX_BARS))
+
+
+@router.get('/brokers/{broker}/symbols/{symbol}/bars/lod', response_model=BarLodResponse)
+def get_bars_lod(
+    broker: str,
+    symbol: str,
+    pixels: int,
+    from_time: datetime = Query(..., alias='from'),
+    to_time: datetime = Query(..., alias='to'),
+    data: ApiDataService = Depends(get_data_service),
+) -> BarLodResponse:
+    """
+    Return bars downsampled to a pixel budget (level of detail).
+
+    At most `pixels` bars for any range: the finest stored timeframe that fits the
+    read budget is aggregated into equal buckets (first open, max high, min low,
+    last close, summed volume) so price extremes survive any zoom level.
+    """
+    if not 2 <= pixels <= MAX_BARS:
+        raise ApiException(
+            400, 'invalid_pixels',
+            f"'pixels' must be between 2 and {MAX_BARS}, got {pixels}.",
+        )
+
+    from_utc, to_utc = _validate_range(from_time, to_time)
+
+    index = data.bar_index()
+    _require_broker_symbol(index, broker, symbol)
+
+    timeframes = index.get_available_timeframes(broker, symbol)
+    if not timeframes:
+        raise ApiException(404, 'not_found', f"No bar data for '{broker}/{symbol}'.")
+
+    source, bucket_seconds = _select_lod(timeframes, from_utc, to_utc, pixels)
+    bar_file = index.get_bar_file(broker, symbol, source)
+    if bar_file is None:
+        raise ApiException(
+            404, 'not_found',
+            f"No bars for '{broker}/{symbol}' at timeframe '{source}'.",
         )
-        for _, row in df.iterrows()
-    ]
+
+    max_source_bars = int((to_utc - from_utc).total_seconds()) // (TimeframeConfig.get_minutes(source) * 60) + 1
+    bars = data.read_bars(bar_file, from_utc, to_utc, max_source_bars)
+
+    return BarLodResponse(
+        source_timeframe=source,
+        bucket_seconds=bucket_seconds,
+        bars=bar_rows(aggregate_bars(bars, bucket_seconds)),
+    )
@@ -4,10 +4,10 @@ Broker and symbol endpoints.
 GET /api/v1/brokers/{broker}/symbols
 """
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
+from python.api.api_data_service import ApiDataService, get_data_service
 from python.configuration.market_config_manager import MarketConfigManager
-from python.data_management.index.bars_index_manager import BarsIndexManager
 from python.framework.exceptions.api_errors import ApiException
 from python.framework.types.api.api_types import SymbolInfo, SymbolListResponse
 
@@ -15,10 +15,9 @@ router = APIRouter()
 
 
 @router.get('/brokers/{broker}/symbols', response_model=SymbolListResponse)
-def list_symbols(broker: str) -> SymbolListResponse:
+def list_symbols(broker: str, data: ApiDataService = Depends(get_data_service)) -> SymbolListResponse:
     """List all symbols available for a broker, including market type."""
-    index = BarsIndexManager()
-    index.load_index()
+    index = data.bar_index()
 
     if broker not in index.list_broker_types():
         raise ApiException(404, 'not_found', f"Broker '{broker}' not found in bar index.")
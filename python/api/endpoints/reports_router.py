@@ -4,27 +4,81 @@ Reports API router (#391) — read-only access to persisted run reports.
 The first consumer of the unified reporting model: serves a run's trade-history
 report (the same canonical model the console + CSV render), with parameter
 filtering pre-applied so the frontend renders, not derives.
+
+Per-run endpoints are conditional: each response carries a strong ETag derived from the
+artifact's file state + the query, and a matching `If-None-Match` is answered 304 without
+reading or parsing the artifact.
 """
 
+import json
+from dataclasses import asdict
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Iterator, Optional
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Request, Response
+from fastapi.responses import StreamingResponse
 
 from python.framework.exceptions.api_errors import ApiException
+from python.framework.reporting.io.aggregated_portfolio_report_io import AGGREGATED_PORTFOLIO_ARTIFACT
+from python.framework.reporting.io.broker_report_io import BROKER_ARTIFACT
+from python.framework.reporting.io.execution_stats_report_io import EXECUTION_STATS_ARTIFACT
+from python.framework.reporting.io.feed_stability_report_io import FEED_STABILITY_ARTIFACT
+from python.framework.reporting.io.order_history_report_io import ORDER_HISTORY_ARTIFACT
+from python.framework.reporting.io.pending_orders_report_io import PENDING_ORDERS_ARTIFACT
+from python.framework.reporting.io.portfolio_report_io import PORTFOLIO_ARTIFACT
+from python.framework.reporting.io.profiling_report_io import PROFILING_ARTIFACT
+from python.framework.reporting.io.run_summary_io import RUN_SUMMARY_ARTIFACT
+from python.framework.reporting.io.scenario_details_report_io import SCENARIO_DETAILS_ARTIFACT
+from python.framework.reporting.io.signal_report_io import SIGNAL_ARTIFACT
+from python.framework.reporting.io.trade_history_report_io import TRADE_HISTORY_ARTIFACT
+from python.framework.reporting.io.warnings_errors_report_io import WARNINGS_ERRORS_ARTIFACT
+from python.framework.reporting.io.worker_decision_report_io import WORKER_DECISION_ARTIFACT
 from python.framework.reporting.store.report_store import ReportStore
 from python.framework.types.api.report_types import (
     AggregatedPortfolioReport, BrokerReport, ExecutionStatsReport, FeedStabilityReport,
-    OrderHistoryReport, PendingOrdersReport, PortfolioReport, ProfilingReport, RunSummary,
-    ScenarioDetailsReport, SignalReport, TradeHistoryReport, WarningsErrorsReport,
-    WorkerDecisionReport)
+    OrderHistoryPage, OrderHistoryReport, PendingOrdersReport, PortfolioReport,
+    ProfilingReport, RunInfo, RunListResponse, RunSummary, ScenarioDetailsReport,
+    SignalReport, TradeHistoryPage,
+    TradeHistoryReport, WarningsErrorsReport, WorkerDecisionReport)
 
 router = APIRouter()
 
+# Cursor pages of the row-shaped reports (trade / order history)
+PAGE_DEFAULT_LIMIT = 500
+PAGE_MAX_LIMIT = 5_000
+
+NDJSON_MEDIA_TYPE = 'application/x-ndjson'
+NDJSON_FLUSH_ROWS = 1_000
+
+
+@router.get('/reports/runs', response_model=RunListResponse)
+def list_runs(
+    group: Optional[str] = Query(None, description="Filter by group ('scenario_sets', 'autotrader')"),
+    owner: Optional[str] = Query(None, description='Filter by scenario set / autotrader profile'),
+) -> RunListResponse:
+    """
+    The runs of the logs tree (from the run catalog), newest first.
+
+    Args:
+        group / owner: Optional filters
 
-@router.get('/reports/runs/{run_id}/trade-history', response_model=TradeHistoryReport)
+    Returns:
+        The RunListResponse
+    """
+    store = ReportStore()
+    runs = [
+        RunInfo(**asdict(entry), reference=store.run_reference(entry))
+        for entry in store.list_run_entries()
+        if (group is None or entry.group == group) and (owner is None or entry.owner == owner)
+    ]
+    return RunListResponse(runs=runs, count=len(runs))
+
+
+@router.get('/reports/runs/{run_id:path}/trade-history', response_model=TradeHistoryReport)
 def get_trade_history(
     run_id: str,
+    request: Request,
+    response: Response,
     symbol: Optional[str] = Query(None, description='Filter by symbol'),
     close_reason: Optional[str] = Query(
         None, description="Filter by close reason ('sl_triggered', 'tp_triggered', ...)"),
@@ -35,13 +89,17 @@ def get_trade_history(
     Trade-history report for a run, filtered by the query parameters.
 
     Args:
-        run_id: The run-timestamp directory name
+        run_id: The run reference (run id, or `<owner>/<run_id>` where runs share it)
         symbol / close_reason / start / end: Optional filters
 
     Returns:
         The filtered TradeHistoryReport (404 if the run has no trade-history artifact)
     """
-    report = ReportStore().get_trade_history(
+    store = ReportStore()
+    not_modified = _conditional(request, response, store, run_id, TRADE_HISTORY_ARTIFACT)
+    if not_modified is not None:
+        return not_modified
+    report = store.get_trade_history(
         run_id,
         symbol=symbol,
         close_reason=close_reason,
@@ -55,9 +113,11 @@ def get_trade_history(
     return report
 
 
-@router.get('/reports/runs/{run_id}/order-history', response_model=OrderHistoryReport)
+@router.get('/reports/runs/{run_id:path}/order-history', response_model=OrderHistoryReport)
 def get_order_history(
     run_id: str,
+    request: Request,
+    response: Response,
     symbol: Optional[str] = Query(None, description='Filter by symbol'),
     status: Optional[str] = Query(
         None, description="Filter by order status ('executed', 'rejected', ...)"),
@@ -66,13 +126,17 @@ def get_order_history(
     Order-history report for a run, filtered by the query parameters.
 
     Args:
-        run_id: The run-timestamp directory name
+        run_id: The run reference (run id, or `<owner>/<run_id>` where runs share it)
         symbol / status: Optional filters
 
     Returns:
         The filtered OrderHistoryReport (404 if the run has no order-history artifact)
     """
-    report = ReportStore().get_order_history(run_id, symbol=symbol, status=status)
+    store = ReportStore()
+    not_modified = _conditional(request, response, store, run_id, ORDER_HISTORY_ARTIFACT)
+    if not_modified is not None:
+        return not_modified
+    report = store.get_order_history(run_id, symbol=symbol, status=status)
     if report is None:
         raise ApiException(
             404, 'run_not_found',
@@ -80,18 +144,172 @@ def get_order_history(
     return report
 
 
-@router.get('/reports/runs/{run_id}/portfolio', response_model=PortfolioReport)
-def get_portfolio(run_id: str) -> PortfolioReport:
+@router.get('/reports/runs/{run_id:path}/trade-history/page', response_model=TradeHistoryPage)
+def get_trade_history_page(
+    run_id: str,
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = Query(None, description='next_cursor of the previous page'),
+    limit: int = Query(PAGE_DEFAULT_LIMIT, description=f'Rows per page (1..{PAGE_MAX_LIMIT})'),
+    symbol: Optional[str] = Query(None, description='Filter by symbol'),
+    close_reason: Optional[str] = Query(
+        None, description="Filter by close reason ('sl_triggered', 'tp_triggered', ...)"),
+    start: Optional[str] = Query(None, description='ISO-8601 UTC; entry_time lower bound'),
+    end: Optional[str] = Query(None, description='ISO-8601 UTC; entry_time upper bound'),
+) -> TradeHistoryPage:
+    """
+    One cursor page of a run's trade rows (large runs; no aggregate metadata).
+
+    Args:
+        run_id: The run reference (run id, or `<owner>/<run_id>` where runs share it)
+        cursor / limit: Page position + size
+        symbol / close_reason / start / end: Optional filters (as trade-history)
+
+    Returns:
+        The TradeHistoryPage (404 if the run has no trade-history artifact)
+    """
+    store = ReportStore()
+    not_modified = _conditional(request, response, store, run_id, TRADE_HISTORY_ARTIFACT)
+    if not_modified is not None:
+        return not_modified
+    page = store.page_trade_history(
+        run_id,
+        cursor=_parse_cursor(cursor),
+        limit=_check_limit(limit),
+        symbol=symbol,
+        close_reason=close_reason,
+        start=_parse_iso(start, 'start'),
+        end=_parse_iso(end, 'end'),
+    )
+    if page is None:
+        raise ApiException(
+            404, 'run_not_found',
+            f"No trade-history artifact for run '{run_id}'")
+    return page
+
+
+@router.get('/reports/runs/{run_id:path}/trade-history/stream')
+def stream_trade_history(
+    run_id: str,
+    request: Request,
+    response: Response,
+    symbol: Optional[str] = Query(None, description='Filter by symbol'),
+    close_reason: Optional[str] = Query(
+        None, description="Filter by close reason ('sl_triggered', 'tp_triggered', ...)"),
+    start: Optional[str] = Query(None, description='ISO-8601 UTC; entry_time lower bound'),
+    end: Optional[str] = Query(None, description='ISO-8601 UTC; entry_time upper bound'),
+) -> StreamingResponse:
+    """
+    A run's trade rows as NDJSON (one TradeHistoryRow object per line), streamed.
+
+    Args:
+        run_id: The run reference (run id, or `<owner>/<run_id>` where runs share it)
+        symbol / close_reason / start / end: Optional filters (as trade-history)
+
+    Returns:
+        application/x-ndjson stream (404 if the run has no trade-history artifact)
+    """
+    store = ReportStore()
+    not_modified = _conditional(request, response, store, run_id, TRADE_HISTORY_ARTIFACT)
+    if not_modified is not None:
+        return not_modified
+    rows = store.iter_trade_history(
+        run_id,
+        symbol=symbol,
+        close_reason=close_reason,
+        start=_parse_iso(start, 'start'),
+        end=_parse_iso(end, 'end'),
+    )
+    if rows is None:
+        raise ApiException(
+            404, 'run_not_found',
+            f"No trade-history artifact for run '{run_id}'")
+    return StreamingResponse(_ndjson(rows), media_type=NDJSON_MEDIA_TYPE, headers=dict(response.headers))
+
+
+@router.get('/reports/runs/{run_id:path}/order-history/page', response_model=OrderHistoryPage)
+def get_order_history_page(
+    run_id: str,
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = Query(None, description='next_cursor of the previous page'),
+    limit: int = Query(PAGE_DEFAULT_LIMIT, description=f'Rows per page (1..{PAGE_MAX_LIMIT})'),
+    symbol: Optional[str] = Query(None, description='Filter by symbol'),
+    status: Optional[str] = Query(
+        None, description="Filter by order status ('executed', 'rejected', ...)"),
+) -> OrderHistoryPage:
+    """
+    One cursor page of a run's order rows (large runs; no aggregate metadata).
+
+    Args:
+        run_id: The run reference (run id, or `<owner>/<run_id>` where runs share it)
+        cursor / limit: Page position + size
+        symbol / status: Optional filters (as order-history)
+
+    Returns:
+        The OrderHistoryPage (404 if the run has no order-history artifact)
+    """
+    store = ReportStore()
+    not_modified = _conditional(request, response, store, run_id, ORDER_HISTORY_ARTIFACT)
+    if not_modified is not None:
+        return not_modified
+    page = store.page_order_history(
+        run_id, cursor=_parse_cursor(cursor), limit=_check_limit(limit),
+        symbol=symbol, status=status)
+    if page is None:
+        raise ApiException(
+            404, 'run_not_found',
+            f"No order-history artifact for run '{run_id}'")
+    return page
+
+
+@router.get('/reports/runs/{run_id:path}/order-history/stream')
+def stream_order_history(
+    run_id: str,
+    request: Request,
+    response: Response,
+    symbol: Optional[str] = Query(None, description='Filter by symbol'),
+    status: Optional[str] = Query(
+        None, description="Filter by order status ('executed', 'rejected', ...)"),
+) -> StreamingResponse:
+    """
+    A run's order rows as NDJSON (one OrderHistoryRow object per line), streamed.
+
+    Args:
+        run_id: The run reference (run id, or `<owner>/<run_id>` where runs share it)
+        symbol / status: Optional filters (as order-history)
+
+    Returns:
+        application/x-ndjson stream (404 if the run has no order-history artifact)
+    """
+    store = ReportStore()
+    not_modified = _conditional(request, response, store, run_id, ORDER_HISTORY_ARTIFACT)
+    if not_modified is not None:
+        return not_modified
+    rows = store.iter_order_history(run_id, symbol=symbol, status=status)
+    if rows is None:
+        raise ApiException(
+            404, 'run_not_found',
+            f"No order-history artifact for run '{run_id}'")
+    return StreamingResponse(_ndjson(rows), media_type=NDJSON_MEDIA_TYPE, headers=dict(response.headers))
+
+
+@router.get('/reports/runs/{run_id:path}/portfolio', response_model=PortfolioReport)
+def get_portfolio(run_id: str, request: Request, response: Response) -> PortfolioReport:
     """
     Portfolio headline report for a run (per-unit rows + per-currency aggregates).
 
     Args:
-        run_id: The run-timestamp directory name
+        run_id: The run reference (run id, or `<owner>/<run_id>` where runs share it)
 
     Returns:
         The PortfolioReport (404 if the run has no portfolio artifact)
     """
-    report = ReportStore().get_portfolio(run_id)
+    store = ReportStore()
+    not_modified = _conditional(request, response, store, run_id, PORTFOLIO_ARTIFACT)
+    if not_modified is not None:
+        return not_modified
+    report = store.get_portfolio(run_id)
     if report is None:
         raise ApiException(
             404, 'run_not_found',
@@ -99,18 +317,22 @@ def get_portfolio(run_id: str) -> PortfolioReport:
     return report
 
 
-@router.get('/reports/runs/{run_id}/execution-stats', response_model=ExecutionStatsReport)
-def get_execution_stats(run_id: str) -> ExecutionStatsReport:
+@router.get('/reports/runs/{run_id:path}/execution-stats', response_model=ExecutionStatsReport)
+def get_execution_stats(run_id: str, request: Request, response: Response) -> ExecutionStatsReport:
     """
     Execution-stats report for a run (per-unit order counts + summed totals).
 
     Args:
-        run_id: The run-timestamp directory name
+        run_id: The run reference (run id, or `<owner>/<run_id>` where runs share it)
 
     Returns:
         The ExecutionStatsReport (404 if the run has no execution-stats artifact)
     """
-    report = ReportStore().get_execution_stats(run_id)
+    store = ReportStore()
+    not_modified = _conditional(request, response, store, run_id, EXECUTION_STATS_ARTIFACT)
+    if not_modified is not None:
+        return not_modified
+    report = store.get_execution_stats(run_id)
     if report is None:
         raise ApiException(
             404, 'run_not_found',
@@ -118,18 +340,22 @@ def get_execution_stats(run_id: str) -> ExecutionStatsReport:
     return report
 
 
-@router.get('/reports/runs/{run_id}/pending-orders', response_model=PendingOrdersReport)
-def get_pending_orders(run_id: str) -> PendingOrdersReport:
+@router.get('/reports/runs/{run_id:path}/pending-orders', response_model=PendingOrdersReport)
+def get_pending_orders(run_id: str, request: Request, response: Response) -> PendingOrdersReport:
     """
     Pending-orders report for a run (per-unit lifecycle + latency + active orders).
 
     Args:
-        run_id: The run-timestamp directory name
+        run_id: The run reference (run id, or `<owner>/<run_id>` where runs share it)
 
     Returns:
         The PendingOrdersReport (404 if the run has no pending-orders artifact)
     """
-    report = ReportStore().get_pending_orders(run_id)
+    store = ReportStore()
+    not_modified = _conditional(request, response, store, run_id, PENDING_ORDERS_ARTIFACT)
+    if not_modified is not None:
+        return not_modified
+    report = store.get_pending_orders(run_id)
     if report is None:
         raise ApiException(
             404, 'run_not_found',
@@ -137,18 +363,22 @@ def get_pending_orders(run_id: str) -> PendingOrdersReport:
     return report
 
 
-@router.get('/reports/runs/{run_id}/scenario-details', response_model=ScenarioDetailsReport)
-def get_scenario_details(run_id: str) -> ScenarioDetailsReport:
+@router.get('/reports/runs/{run_id:path}/scenario-details', response_model=ScenarioDetailsReport)
+def get_scenario_details(run_id: str, request: Request, response: Response) -> ScenarioDetailsReport:
     """
     Scenario-details report for a run (per-scenario execution + signal metadata, sim-only).
 
     Args:
-        run_id: The run-timestamp directory name
+        run_id: The run reference (run id, or `<owner>/<run_id>` where runs share it)
 
     Returns:
         The ScenarioDetailsReport (404 if the run has no scenario-details artifact)
     """
-    report = ReportStore().get_scenario_details(run_id)
+    store = ReportStore()
+    not_modified = _conditional(request, response, store, run_id, SCENARIO_DETAILS_ARTIFACT)
+    if not_modified is not None:
+        return not_modified
+    report = store.get_scenario_details(run_id)
     if report is None:
         raise ApiException(
             404, 'run_not_found',
@@ -156,18 +386,22 @@ def get_scenario_details(run_id: str) -> ScenarioDetailsReport:
     return report
 
 
-@router.get('/reports/runs/{run_id}/run-summary', response_model=RunSummary)
-def get_run_summary(run_id: str) -> RunSummary:
+@router.get('/reports/runs/{run_id:path}/run-summary', response_model=RunSummary)
+def get_run_summary(run_id: str, request: Request, response: Response) -> RunSummary:
     """
     Cross-section KPI summary for a run (per-currency KPIs + global order counts).
 
     Args:
-        run_id: The run-timestamp directory name
+        run_id: The run reference (run id, or `<owner>/<run_id>` where runs share it)
 
     Returns:
         The RunSummary (404 if the run has no run-summary artifact)
     """
-    report = ReportStore().get_run_summary(run_id)
+    store = ReportStore()
+    not_modified = _conditional(request, response, store, run_id, RUN_SUMMARY_ARTIFACT)
+    if not_modified is not None:
+        return not_modified
+    report = store.get_run_summary(run_id)
     if report is None:
         raise ApiException(
             404, 'run_not_found',
@@ -175,18 +409,22 @@ def get_run_summary(run_id: str) -> RunSummary:
     return report
 
 
-@router.get('/reports/runs/{run_id}/worker-decision', response_model=WorkerDecisionReport)
-def get_worker_decision(run_id: str) -> WorkerDecisionReport:
+@router.get('/reports/runs/{run_id:path}/worker-decision', response_model=WorkerDecisionReport)
+def get_worker_decision(run_id: str, request: Request, response: Response) -> WorkerDecisionReport:
     """
     Worker/decision report for a run (per-unit worker + decision performance, unified).
 
     Args:
-        run_id: The run-timestamp directory name
+        run_id: The run reference (run id, or `<owner>/<run_id>` where runs share it)
 
     Returns:
         The WorkerDecisionReport (404 if the run has no worker-decision artifact)
     """
-    report = ReportStore().get_worker_decision(run_id)
+    store = ReportStore()
+    not_modified = _conditional(request, response, store, run_id, WORKER_DECISION_ARTIFACT)
+    if not_modified is not None:
+        return not_modified
+    report = store.get_worker_decision(run_id)
     if report is None:
         raise ApiException(
             404, 'run_not_found',
@@ -194,18 +432,22 @@ def get_worker_decision(run_id: str) -> WorkerDecisionReport:
     return report
 
 
-@router.get('/reports/runs/{run_id}/profiling', response_model=ProfilingReport)
-def get_profiling(run_id: str) -> ProfilingReport:
+@router.get('/reports/runs/{run_id:path}/profiling', response_model=ProfilingReport)
+def get_profiling(run_id: str, request: Request, response: Response) -> ProfilingReport:
     """
     Profiling report for a run (per-scenario operation timing + inter-tick + clipping + warmup, sim-only).
 
     Args:
-        run_id: The run-timestamp directory name
+        run_id: The run reference (run id, or `<owner>/<run_id>` where runs share it)
 
     Returns:
         The ProfilingReport (404 if the run has no profiling artifact)
     """
-    report = ReportStore().get_profiling(run_id)
+    store = ReportStore()
+    not_modified = _conditional(request, response, store, run_id, PROFILING_ARTIFACT)
+    if not_modified is not None:
+        return not_modified
+    report = store.get_profiling(run_id)
     if report is None:
         raise ApiException(
             404, 'run_not_found',
@@ -213,18 +455,22 @@ def get_profiling(run_id: str) -> ProfilingReport:
     return report
 
 
-@router.get('/reports/runs/{run_id}/aggregated-portfolio', response_model=AggregatedPortfolioReport)
-def get_aggregated_portfolio(run_id: str) -> AggregatedPortfolioReport:
+@router.get('/reports/runs/{run_id:path}/aggregated-portfolio', response_model=AggregatedPortfolioReport)
+def get_aggregated_portfolio(run_id: str, request: Request, response: Response) -> AggregatedPortfolioReport:
     """
     Aggregated per-currency portfolio report for a run (the rich detail view, sim).
 
     Args:
-        run_id: The run-timestamp directory name
+        run_id: The run reference (run id, or `<owner>/<run_id>` where runs share it)
 
     Returns:
         The AggregatedPortfolioReport (404 if the run has no aggregated-portfolio artifact)
     """
-    report = ReportStore().get_aggregated_portfolio(run_id)
+    store = ReportStore()
+    not_modified = _conditional(request, response, store, run_id, AGGREGATED_PORTFOLIO_ARTIFACT)
+    if not_modified is not None:
+        return not_modified
+    report = store.get_aggregated_portfolio(run_id)
     if report is None:
         raise ApiException(
             404, 'run_not_found',
@@ -232,18 +478,22 @@ def get_aggregated_portfolio(run_id: str) -> AggregatedPortfolioReport:
     return report
 
 
-@router.get('/reports/runs/{run_id}/warnings-errors', response_model=WarningsErrorsReport)
-def get_warnings_errors(run_id: str) -> WarningsErrorsReport:
+@router.get('/reports/runs/{run_id:path}/warnings-errors', response_model=WarningsErrorsReport)
+def get_warnings_errors(run_id: str, request: Request, response: Response) -> WarningsErrorsReport:
     """
     Warnings & errors report for a run (tiered warnings + per-unit errors + outcome, both pipelines).
 
     Args:
-        run_id: The run-timestamp directory name
+        run_id: The run reference (run id, or `<owner>/<run_id>` where runs share it)
 
     Returns:
         The WarningsErrorsReport (404 if the run has no warnings-errors artifact)
     """
-    report = ReportStore().get_warnings_errors(run_id)
+    store = ReportStore()
+    not_modified = _conditional(request, response, store, run_id, WARNINGS_ERRORS_ARTIFACT)
+    if not_modified is not None:
+        return not_modified
+    report = store.get_warnings_errors(run_id)
     if report is None:
         raise ApiException(
             404, 'run_not_found',
@@ -251,18 +501,22 @@ def get_warnings_errors(run_id: str) -> WarningsErrorsReport:
     return report
 
 
-@router.get('/reports/runs/{run_id}/broker', response_model=BrokerReport)
-def get_broker(run_id: str) -> BrokerReport:
+@router.get('/reports/runs/{run_id:path}/broker', response_model=BrokerReport)
+def get_broker(run_id: str, request: Request, response: Response) -> BrokerReport:
     """
     Broker-configuration report for a run (per-broker spec + scenarios + symbols, sim-only).
 
     Args:
-        run_id: The run-timestamp directory name
+        run_id: The run reference (run id, or `<owner>/<run_id>` where runs share it)
 
     Returns:
         The BrokerReport (404 if the run has no broker artifact)
     """
-    report = ReportStore().get_broker(run_id)
+    store = ReportStore()
+    not_modified = _conditional(request, response, store, run_id, BROKER_ARTIFACT)
+    if not_modified is not None:
+        return not_modified
+    report = store.get_broker(run_id)
     if report is None:
         raise ApiException(
             404, 'run_not_found',
@@ -270,19 +524,23 @@ def get_broker(run_id: str) -> BrokerReport:
     return report
 
 
-@router.get('/reports/runs/{run_id}/signal', response_model=SignalReport)
-def get_signal(run_id: str) -> SignalReport:
+@router.get('/reports/runs/{run_id:path}/signal', response_model=SignalReport)
+def get_signal(run_id: str, request: Request, response: Response) -> SignalReport:
     """
     Signal-configuration report for a run (#433): per-source provenance + the run's
     decision basis (fresh / stale / blind ticks per scenario).
 
     Args:
-        run_id: The run-timestamp directory name
+        run_id: The run reference (run id, or `<owner>/<run_id>` where runs share it)
 
     Returns:
         The SignalReport (404 if the run has no signal artifact)
     """
-    report = ReportStore().get_signal(run_id)
+    store = ReportStore()
+    not_modified = _conditional(request, response, store, run_id, SIGNAL_ARTIFACT)
+    if not_modified is not None:
+        return not_modified
+    report = store.get_signal(run_id)
     if report is None:
         raise ApiException(
             404, 'run_not_found',
@@ -290,19 +548,23 @@ def get_signal(run_id: str) -> SignalReport:
     return report
 
 
-@router.get('/reports/runs/{run_id}/feed-stability', response_model=FeedStabilityReport)
-def get_feed_stability(run_id: str) -> FeedStabilityReport:
+@router.get('/reports/runs/{run_id:path}/feed-stability', response_model=FeedStabilityReport)
+def get_feed_stability(run_id: str, request: Request, response: Response) -> FeedStabilityReport:
     """
     Feed-stability report for a run (#451): the observed disturbance episodes per source
     across both staleness domains (tick stream + signal sources).
 
     Args:
-        run_id: The run-timestamp directory name
+        run_id: The run reference (run id, or `<owner>/<run_id>` where runs share it)
 
     Returns:
         The FeedStabilityReport (404 if the run has no feed-stability artifact)
     """
-    report = ReportStore().get_feed_stability(run_id)
+    store = ReportStore()
+    not_modified = _conditional(request, response, store, run_id, FEED_STABILITY_ARTIFACT)
+    if not_modified is not None:
+        return not_modified
+    report = store.get_feed_stability(run_id)
     if report is None:
         raise ApiException(
             404, 'run_not_found',
@@ -310,6 +572,36 @@ def get_feed_stability(run_id: str) -> FeedStabilityReport:
     return report
 
 
+def _conditional(
+    request: Request, response: Response, store: ReportStore, run_id: str, artifact: str
+) -> Optional[Response]:
+    """
+    Conditional-request check for a per-run endpoint.
+
+    Sets the artifact's ETag on the response; returns a 304 response if the client's
+    If-None-Match already names it. None (no ETag) if the run has no such artifact —
+    the endpoint then answers its own 404.
+    """
+    etag = store.artifact_etag(run_id, artifact, variant=request.url.query)
+    if etag is None:
+        return None
+    if _etag_matches(request.headers.get('if-none-match'), etag):
+        return Response(status_code=304, headers={'ETag': etag})
+    response.headers['ETag'] = etag
+    return None
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match comparison (weak, per RFC 9110: a W/ prefix is ignored; '*' matches)."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate == '*' or candidate.removeprefix('W/') == etag:
+            return True
+    return False
+
+
 def _parse_iso(value: Optional[str], field: str) -> Optional[datetime]:
     """Parse an ISO-8601 query param, or raise a 400 ApiException."""
     if value is None:
@@ -319,3 +611,32 @@ def _parse_iso(value: Optional[str], field: str) -> Optional[datetime]:
     except ValueError:
         raise ApiException(
             400, 'invalid_timestamp', f"'{field}' must be ISO-8601, got '{value}'")
+
+
+def _parse_cursor(value: Optional[str]) -> int:
+    """Parse a page cursor (a row position), or raise a 400 ApiException."""
+    if value is None:
+        return 0
+    if not value.isdigit():
+        raise ApiException(400, 'invalid_cursor', f"Invalid cursor '{value}'")
+    return int(value)
+
+
+def _check_limit(limit: int) -> int:
+    """Validate a page size, or raise a 400 ApiException."""
+    if not 1 <= limit <= PAGE_MAX_LIMIT:
+        raise ApiException(
+            400, 'invalid_limit', f"'limit' must be between 1 and {PAGE_MAX_LIMIT}, got {limit}")
+    return limit
+
+
+def _ndjson(rows: Iterator[Dict]) -> Iterator[bytes]:
+    """Encode rows as NDJSON lines, one chunk per NDJSON_FLUSH_ROWS rows."""
+    buffer = []
+    for row in rows:
+        buffer.append(json.dumps(row))
+        if len(buffer) == NDJSON_FLUSH_ROWS:
+            yield ('\n'.join(buffer) + '\n').encode()
+            buffer = []
+    if buffer:
+        yield ('\n'.join(buffer) + '\n').encode()
@@ -42,14 +42,17 @@ class DataIndexCli:
         self.index_manager = TickIndexManager()
         self.bar_index_manager = BarsIndexManager()
 
-    def cmd_import(self, override: bool = False):
+    def cmd_import(self, override: bool = False, full_bar_render: bool = False):
         """
         Import tick data from JSON to Parquet with UTC conversion.
         Offsets are applied automatically per broker_type from import_config.json.
 
         Args:
             override: If True, overwrite existing Parquet files
+            full_bar_render: If True, re-render all bars instead of splicing the imported ranges
         """
+        incremental_bars = (self._import_config.get_incremental_bar_rendering()
+                            and not full_bar_render)
         print("\n" + "="*80)
         print("📥 Tick Data Import")
         print("="*80)
@@ -57,7 +60,8 @@ class DataIndexCli:
         print(
             f"Move Files:     {'YES' if self._import_config.get_move_processed_files() else 'NO'}")
         print(
-            f"Auto Bars:      {'YES' if self._import_config.get_auto_render_bars() else 'NO'}")
+            f"Auto Bars:      {'YES' if self._import_config.get_auto_render_bars() else 'NO'}"
+            f"{' (incremental)' if incremental_bars else ' (full)'}")
 
         # Display offset registry
         registry = self._import_config.get_offset_registry()
@@ -90,6 +94,10 @@ class DataIndexCli:
             move_processed_files=self._import_config.get_move_processed_files(),
             finished_dir=self._import_config.get_data_finished_path(),
             auto_render_bars=self._import_config.get_auto_render_bars(),
+            incremental_bar_rendering=incremental_bars,
+            streaming_threshold_mb=self._import_config.get_streaming_import_threshold_mb(),
+            streaming_chunk_ticks=self._import_config.get_streaming_import_chunk_ticks(),
+            import_workers=self._import_config.get_import_workers(),
         )
 
         importer.process_all_exports()
@@ -156,6 +164,9 @@ def main():
     import_parser.add_argument(
         '--override', action='store_true', default=False,
         help='Overwrite existing Parquet files')
+    import_parser.add_argument(
+        '--full-bar-render', action='store_true', default=False,
+        help='Re-render all bars after import (default: splice imported ranges only)')
 
     # ─────────────────────────────────────────────────────────────────────────
     # TICK-DATA-REPORT command
@@ -192,7 +203,8 @@ def main():
 
     try:
         if args.command == 'import':
-            cli.cmd_import(override=args.override)
+            cli.cmd_import(override=args.override,
+                           full_bar_render=args.full_bar_render)
 
         elif args.command == 'tick-data-report':
             cli.cmd_tick_data_report(broker_type=args.broker_type)
@@ -8,15 +8,19 @@ Usage:
     python python/cli/optimization_cli.py run cautious_macd_grid.json
     python python/cli/optimization_cli.py report sweep_20260621_223000
     python python/cli/optimization_cli.py report sweep_20260621_223000 --objective net_pnl --top 5
+    python python/cli/optimization_cli.py compact
 """
 
 import argparse
 import sys
 import traceback
+from pathlib import Path
 from typing import Optional
 
+from python.configuration.app_config_manager import AppConfigManager
 from python.framework.optimization.optimization_report import render_sweep_list, render_sweep_report
 from python.framework.optimization.optimization_runner import OptimizationRunner
+from python.framework.reporting.store.run_results_ledger import RunResultsLedger
 
 
 class OptimizationCli:
@@ -63,6 +67,17 @@ class OptimizationCli:
         """List every recorded sweep as a one-liner (start, duration, algo, runs, objective)."""
         render_sweep_list()
 
+    def cmd_compact(self):
+        """Merge the ledger's loose per-run fragments into its sweep / scenario-set partitions."""
+        ledger_dir = Path(AppConfigManager().get_run_results_path())
+        written = RunResultsLedger(ledger_dir).compact()
+        if not written:
+            print(f"Nothing to compact in {ledger_dir}")
+            return
+        for partition, rows in sorted(written.items()):
+            print(f"  {partition:<60} {rows:>7} rows")
+        print(f"\nCompacted into {len(written)} partition(s) under {ledger_dir}")
+
 
 def main():
     """Main entry point."""
@@ -83,6 +98,12 @@ def main():
     # ─────────────────────────────────────────────────────────────────────────
     subparsers.add_parser('list', help='List every recorded sweep (one-liner each)')
 
+    # ─────────────────────────────────────────────────────────────────────────
+    # COMPACT command
+    # ─────────────────────────────────────────────────────────────────────────
+    subparsers.add_parser(
+        'compact', help='Merge the run-results ledger fragments into partition files')
+
     # ─────────────────────────────────────────────────────────────────────────
     # REPORT command
     # ─────────────────────────────────────────────────────────────────────────
@@ -113,6 +134,8 @@ def main():
             cli.cmd_run(args.spec)
         elif args.command == 'list':
             cli.cmd_list()
+        elif args.command == 'compact':
+            cli.cmd_compact()
         elif args.command == 'report':
             cli.cmd_report(
                 args.sweep_id, args.objective, args.minimize, args.currency, args.top)
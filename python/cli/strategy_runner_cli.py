@@ -6,6 +6,8 @@ Usage:
     python python/cli/strategy_runner_cli.py run eurusd_3_windows.json
     python python/cli/strategy_runner_cli.py list
     python python/cli/strategy_runner_cli.py list --full-details
+    python python/cli/strategy_runner_cli.py worker-cache status
+    python python/cli/strategy_runner_cli.py worker-cache clear
 """
 
 import argparse
@@ -14,6 +16,8 @@ import traceback
 from pathlib import Path
 from typing import List
 
+from python.configuration.app_config_manager import AppConfigManager
+from python.framework.persistence.worker_output_cache import WorkerOutputCache
 from python.scenario.scenario_set_finder import ScenarioSetFinder
 from python.framework.utils.time_utils import format_duration
 
@@ -187,6 +191,38 @@ class StrategyRunnerCli:
             print()
 
 
+    def cmd_worker_cache(self, action: str):
+        """
+        Inspect or clear the on-disk worker output cache.
+
+        Args:
+            action: 'status' (list the stored series) or 'clear' (remove them all)
+        """
+        app_config = AppConfigManager()
+        cache_dir = app_config.get_worker_output_cache_path()
+        cache = WorkerOutputCache(
+            vLog, cache_dir, app_config.get_worker_output_cache_max_entries())
+
+        if action == 'clear':
+            print(f"✅ Removed {cache.clear()} worker output series from {cache_dir}")
+            return
+
+        entries = cache.list_entries()
+        state = 'enabled' if app_config.get_worker_output_cache_enabled() else 'disabled'
+        print(f"\n🗄️  Worker output cache ({state}): {cache_dir}")
+        if not entries:
+            print("   (empty)\n")
+            return
+        total_kb = sum(entry.get('size_kb', 0.0) for entry in entries)
+        print(f"   {len(entries)} series, {total_kb / 1024:.1f} MB "
+              f"(max {app_config.get_worker_output_cache_max_entries()})\n")
+        for entry in entries:
+            print(f"   {entry['key'][:12]}  {entry.get('worker', '?'):<20} "
+                  f"{entry.get('worker_class', ''):<22} {entry.get('entries', 0):>7} bars  "
+                  f"{entry.get('created_at', '')[:19]}")
+        print()
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -220,6 +256,14 @@ def main():
         '--full-details', action='store_true', default=False,
         help='Load and validate all configs (slow)')
 
+    # ─────────────────────────────────────────────────────────────────────────
+    # WORKER-CACHE command
+    # ─────────────────────────────────────────────────────────────────────────
+    cache_parser = subparsers.add_parser(
+        'worker-cache', help='Inspect or clear the on-disk worker output cache')
+    cache_parser.add_argument(
+        'action', choices=['status', 'clear'], help='status: list stored series; clear: remove all')
+
     # ─────────────────────────────────────────────────────────────────────────
     # Parse and execute
     # ─────────────────────────────────────────────────────────────────────────
@@ -238,6 +282,9 @@ def main():
         elif args.command == 'list':
             cli.cmd_list(full_details=args.full_details)
 
+        elif args.command == 'worker-cache':
+            cli.cmd_worker_cache(args.action)
+
     except KeyboardInterrupt:
         print("\n\n👋 Interrupted by user")
         sys.exit(0)
@@ -16,6 +16,7 @@ from datetime import datetime
 
 import pandas as pd
 
+from python.data_management.index.tick_fingerprint_table import TickFingerprintTable
 from python.data_management.index.tick_index_manager import TickIndexManager
 from python.framework.logging.bootstrap_logger import get_global_logger
 
@@ -34,9 +35,10 @@ class TickIndexCli:
         self.index_manager = TickIndexManager()
 
     def cmd_rebuild(self):
-        """Rebuild tick index from scratch."""
+        """Rebuild tick index (and the duplicate-detection fingerprints) from scratch."""
         print("\n🔄 Rebuilding Parquet tick index...")
         self.index_manager.build_index(force_rebuild=True)
+        TickFingerprintTable(str(self.index_manager.data_dir)).rebuild()
         self.index_manager.print_summary()
 
     def cmd_status(self):
@@ -3,6 +3,7 @@ FiniexTestingIDE - Application Configuration Loader
 Centralized app config management
 """
 
+from pathlib import Path
 from typing import Dict, Any, List
 from python.framework.types.config_types.console_logging_config_types import ConsoleLoggingConfig
 from python.framework.types.config_types.file_logging_config_types import FileLoggingConfig
@@ -177,6 +178,51 @@ class AppConfigManager:
         """
         return self._app_config.backtesting.parameter_optimization.villain_abort_enabled
 
+    def get_mount_cache_enabled(self) -> bool:
+        """
+        Whether prepared data mounts are persisted to disk and reused across runs (#420).
+
+        Returns:
+            True if the on-disk mount cache is enabled (default: False)
+        """
+        return self._app_config.backtesting.mount_cache.enabled
+
+    def get_mount_cache_max_entries(self) -> int:
+        """
+        Maximum number of persisted mounts kept on disk (#420).
+
+        Returns:
+            Entry limit (least recently used entries are evicted)
+        """
+        return self._app_config.backtesting.mount_cache.max_entries
+
+    def get_worker_output_cache_enabled(self) -> bool:
+        """
+        Whether BAR_CLOSE worker outputs are cached on disk and replayed across runs.
+
+        Returns:
+            True if the worker output cache is enabled (default: False)
+        """
+        return self._app_config.backtesting.worker_output_cache.enabled
+
+    def get_worker_output_cache_max_entries(self) -> int:
+        """
+        Maximum number of worker output series kept on disk.
+
+        Returns:
+            Entry limit (least recently used entries are evicted)
+        """
+        return self._app_config.backtesting.worker_output_cache.max_entries
+
+    def get_worker_output_cache_path(self) -> str:
+        """
+        Directory of the worker output cache.
+
+        Returns:
+            <data_processed>/.worker_output_cache
+        """
+        return str(Path(self.get_data_processed_path()) / '.worker_output_cache')
+
     def get_default_parallel_workers(self) -> bool:
         """
         Get default parallel workers setting.
@@ -284,6 +330,40 @@ class AppConfigManager:
         """Get max trade history entries (0=unlimited)."""
         return self._app_config.history.trade_history_max
 
+    # ============================================
+    # Reporting Config
+    # ============================================
+
+    def get_reporting_write_row_json(self) -> bool:
+        """
+        Whether trade / order history are also persisted as JSON documents (next to the
+        always-written Parquet row tables).
+
+        Returns:
+            True if the JSON artifacts are written (default)
+        """
+        return self._app_config.reporting.write_row_json
+
+    def get_reporting_write_event_csv(self) -> bool:
+        """
+        Whether the event stream is also persisted as CSV (next to the always-written
+        Parquet event table).
+
+        Returns:
+            True if the event-stream CSV is written (default)
+        """
+        return self._app_config.reporting.write_event_csv
+
+    def get_reporting_parallel_workers(self) -> int:
+        """
+        Thread pool size for a batch run's report generation (independent report steps run
+        concurrently).
+
+        Returns:
+            Worker threads (<= 1 = sequential)
+        """
+        return self._app_config.reporting.parallel_workers
+
     def get_data_validation_config(self) -> Dict[str, Any]:
         """
         Get data validation configuration.
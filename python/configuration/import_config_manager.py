@@ -284,3 +284,44 @@ class ImportConfigManager:
         """
         processing = self.get_processing_config()
         return processing.get("bar_render_workers", 2)
+
+    def get_import_workers(self) -> int:
+        """
+        Get number of parallel worker processes for tick import.
+
+        Returns:
+            Number of worker processes (default: 2, 1 = sequential)
+        """
+        processing = self.get_processing_config()
+        return processing.get("import_workers", 2)
+
+    def get_incremental_bar_rendering(self) -> bool:
+        """
+        Get incremental bar rendering setting.
+
+        Returns:
+            True if bars are spliced for the imported time ranges only
+            (False = full clean re-render after every import)
+        """
+        processing = self.get_processing_config()
+        return processing.get("incremental_bar_rendering", True)
+
+    def get_streaming_import_threshold_mb(self) -> float:
+        """
+        Get JSON size from which tick exports are imported as a chunked stream.
+
+        Returns:
+            Threshold in MB (default: 256)
+        """
+        processing = self.get_processing_config()
+        return processing.get("streaming_import_threshold_mb", 256)
+
+    def get_streaming_import_chunk_ticks(self) -> int:
+        """
+        Get ticks per chunk (= Parquet row group) for streaming imports.
+
+        Returns:
+            Ticks per chunk (default: 250000)
+        """
+        processing = self.get_processing_config()
+        return processing.get("streaming_import_chunk_ticks", 250_000)
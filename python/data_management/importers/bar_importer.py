@@ -8,17 +8,24 @@ Called automatically after tick import or manually for re-rendering.
 Supports parallel rendering via ProcessPoolExecutor (symbol-level granularity).
 All broker_types and symbols are rendered in one pool.
 
-Workflow:
+Workflow (full render):
 1. Load ALL tick files for a symbol
 2. Call VectorizedBarRenderer for all timeframes
 3. Write bar parquet files (one per timeframe)
 4. Update bar index (caller responsibility)
 
+Incremental render (after tick import):
+1. Widen each touched time range to whole buckets of the largest timeframe
+   (every smaller bucket nests inside, so the boundary bars are complete)
+2. Load only the tick files overlapping those windows, render all timeframes
+3. Splice: keep existing bars outside the windows, replace bars inside them
+   Symbols without existing bar files fall back to the full render.
+
 """
 
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 import time
 import traceback
 
@@ -37,8 +44,15 @@ from python.data_management.index.bars_index_manager import BarsIndexManager
 from python.framework.logging.bootstrap_logger import get_global_logger
 from python.framework.discoveries.discovery_cache_manager import DiscoveryCacheManager
 from python.framework.types.import_result_types import BarRenderResult
+from python.framework.utils.timeframe_config_utils import TimeframeConfig
 vLog = get_global_logger()
 
+# (broker_type, symbol, touched_ranges) — touched_ranges None = full render
+RenderTask = Tuple[str, str, Optional[List[Tuple[pd.Timestamp, pd.Timestamp]]]]
+
+# Rows per Parquet row group of a bar file (~45 days of M1)
+BAR_ROW_GROUP_ROWS = 65_536
+
 
 # =============================================================================
 # TOP-LEVEL WORKER FUNCTION (required for multiprocessing pickle)
@@ -147,6 +161,147 @@ def _render_symbol_worker(
         )
 
 
+def _render_symbol_range_worker(
+    symbol: str,
+    broker_type: str,
+    data_dir: str,
+    importer_version: str,
+    touched_ranges: List[Tuple[pd.Timestamp, pd.Timestamp]]
+) -> BarRenderResult:
+    """
+    Standalone worker for incremental bar rendering (splice into existing bar files).
+
+    Re-renders only the bars inside the touched ranges (widened to whole buckets of the
+    largest timeframe) and splices them into the existing bar parquet files. Falls back to
+    the full render when a timeframe file does not exist yet.
+
+    Args:
+        symbol: Trading symbol to render
+        broker_type: Broker type identifier
+        data_dir: Path to data directory (string for pickle)
+        importer_version: BarImporter.VERSION string
+        touched_ranges: (start, end) tick time ranges changed by the import
+
+    Returns:
+        BarRenderResult with spliced bar count, log buffer, and status
+    """
+    data_path = Path(data_dir)
+    missing = [
+        timeframe for timeframe in TimeframeConfig.sorted()
+        if not _bar_file_path(data_path, symbol, timeframe, broker_type).exists()
+    ]
+    if missing:
+        result = _render_symbol_worker(
+            symbol, broker_type, data_dir, importer_version)
+        result.log_buffer.insert(
+            0, f"  ├─ No bar files for {', '.join(missing)} — full render")
+        return result
+
+    log_buffer: list[str] = []
+
+    try:
+        start_time = time.time()
+        windows = _aligned_render_windows(touched_ranges)
+        for window_start, window_end in windows:
+            log_buffer.append(
+                f"  ├─ Render window: {window_start.isoformat()} → {window_end.isoformat()}")
+
+        # === 1. LOAD TICKS OF THE WINDOWS ONLY ===
+        tick_index = TickIndexManager(data_dir=data_dir)
+        tick_index.build_index()
+        ticks_df = _load_ticks_for_windows(
+            tick_index, symbol, broker_type, windows, log_buffer)
+        log_buffer.append(f"  ├─ Loaded {len(ticks_df):,} ticks in window(s)")
+
+        tick_files = [
+            Path(entry['path'])
+            for entry in tick_index.get_symbol_entries(broker_type, symbol)
+        ]
+        source_version_min, source_version_max = _extract_source_versions(
+            tick_files, log_buffer)
+
+        # === 2. RENDER WINDOW BARS ===
+        window_bars: Dict[str, pd.DataFrame] = {}
+        if not ticks_df.empty:
+            renderer = VectorizedBarRenderer(
+                symbol, broker_type, log_buffer=log_buffer)
+            window_bars = renderer.render_all_timeframes(ticks_df)
+
+        # === 3. SPLICE INTO EXISTING BAR FILES ===
+        bars_written = 0
+        for timeframe in TimeframeConfig.sorted():
+            bar_file = _bar_file_path(data_path, symbol, timeframe, broker_type)
+            existing = pd.read_parquet(bar_file)
+            spliced = _splice_bars(
+                existing, window_bars.get(timeframe), windows)
+
+            if spliced.empty:
+                bar_file.unlink()
+                log_buffer.append(f"    ├─ Removed: {bar_file.name} (no bars left)")
+                continue
+
+            _write_bar_file(
+                data_path, symbol, timeframe, spliced,
+                broker_type, importer_version,
+                source_version_min, source_version_max,
+                log_buffer
+            )
+            bars_written += len(spliced)
+
+        elapsed = time.time() - start_time
+        log_buffer.append(
+            f"  └─ ✅ {broker_type}/{symbol}: spliced {len(windows)} window(s), "
+            f"{bars_written:,} bars in files, {elapsed:.2f}s"
+        )
+
+        return BarRenderResult(
+            symbol=symbol,
+            broker_type=broker_type,
+            bars_rendered=bars_written,
+            success=True,
+            log_buffer=log_buffer
+        )
+
+    except Exception as e:
+        log_buffer.append(f"  └─ ❌ ERROR: {str(e)}")
+        log_buffer.append(traceback.format_exc())
+        return BarRenderResult(
+            symbol=symbol,
+            broker_type=broker_type,
+            bars_rendered=0,
+            success=False,
+            error_message=f"ERROR in {broker_type}/{symbol}: {str(e)}",
+            log_buffer=log_buffer
+        )
+
+
+def _run_render_task(
+    symbol: str,
+    broker_type: str,
+    data_dir: str,
+    importer_version: str,
+    touched_ranges: Optional[List[Tuple[pd.Timestamp, pd.Timestamp]]]
+) -> BarRenderResult:
+    """
+    Dispatch one render task: full render (touched_ranges None) or incremental splice.
+
+    Args:
+        symbol: Trading symbol to render
+        broker_type: Broker type identifier
+        data_dir: Path to data directory (string for pickle)
+        importer_version: BarImporter.VERSION string
+        touched_ranges: Tick time ranges changed by an import, or None for a full render
+
+    Returns:
+        BarRenderResult from the selected worker
+    """
+    if touched_ranges is None:
+        return _render_symbol_worker(
+            symbol, broker_type, data_dir, importer_version)
+    return _render_symbol_range_worker(
+        symbol, broker_type, data_dir, importer_version, touched_ranges)
+
+
 # =============================================================================
 # WORKER HELPER FUNCTIONS (top-level for pickle)
 # =============================================================================
@@ -193,11 +348,169 @@ def _load_all_ticks_for_symbol(
         return pd.DataFrame()
 
     combined = pd.concat(dfs, ignore_index=True)
-    combined = combined.sort_values('timestamp').reset_index(drop=True)
+    # Stable: equal timestamps keep file/arrival order (open/close must not depend on
+    # the sort algorithm — incremental splices are compared against full renders)
+    combined = combined.sort_values(
+        'timestamp', kind='stable').reset_index(drop=True)
 
     return combined
 
 
+def _to_utc(value) -> pd.Timestamp:
+    """
+    Normalize a timestamp (naive = UTC, as stored in tick parquets) to tz-aware UTC.
+
+    Args:
+        value: Timestamp, datetime or ISO string
+
+    Returns:
+        tz-aware UTC Timestamp
+    """
+    ts = pd.Timestamp(value)
+    return ts.tz_localize('UTC') if ts.tz is None else ts.tz_convert('UTC')
+
+
+def _aligned_render_windows(
+    touched_ranges: List[Tuple[pd.Timestamp, pd.Timestamp]]
+) -> List[Tuple[pd.Timestamp, pd.Timestamp]]:
+    """
+    Widen touched tick ranges to whole buckets of the largest timeframe and merge overlaps.
+
+    All timeframe buckets are epoch-aligned divisors of the largest one (D1), so a window on
+    D1 boundaries contains every boundary bar of every timeframe completely.
+
+    Args:
+        touched_ranges: (start, end) tick time ranges, inclusive
+
+    Returns:
+        Sorted, non-overlapping [start, end) windows (tz-aware UTC)
+    """
+    bucket = pd.Timedelta(minutes=max(
+        TimeframeConfig.get_minutes(tf) for tf in TimeframeConfig.sorted()))
+
+    windows = sorted(
+        (_to_utc(start).floor(bucket), _to_utc(end).floor(bucket) + bucket)
+        for start, end in touched_ranges
+    )
+    merged: List[Tuple[pd.Timestamp, pd.Timestamp]] = []
+    for window_start, window_end in windows:
+        if merged and window_start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], window_end))
+        else:
+            merged.append((window_start, window_end))
+    return merged
+
+
+def _in_windows(
+    timestamps: pd.Series,
+    windows: List[Tuple[pd.Timestamp, pd.Timestamp]]
+) -> pd.Series:
+    """
+    Boolean mask: timestamp falls inside any [start, end) window.
+
+    Args:
+        timestamps: Timestamp column (naive = UTC, or tz-aware)
+        windows: Render windows (tz-aware UTC)
+
+    Returns:
+        Boolean Series aligned with timestamps
+    """
+    values = pd.to_datetime(timestamps)
+    if values.dt.tz is None:
+        values = values.dt.tz_localize('UTC')
+    mask = pd.Series(False, index=timestamps.index)
+    for window_start, window_end in windows:
+        mask |= (values >= window_start) & (values < window_end)
+    return mask
+
+
+def _load_ticks_for_windows(
+    tick_index: TickIndexManager,
+    symbol: str,
+    broker_type: str,
+    windows: List[Tuple[pd.Timestamp, pd.Timestamp]],
+    log_buffer: list[str]
+) -> pd.DataFrame:
+    """
+    Load the ticks inside the render windows — only tick files overlapping a window are read.
+
+    Args:
+        tick_index: TickIndexManager instance (worker-local)
+        symbol: Trading symbol
+        broker_type: Broker type identifier
+        windows: Render windows (tz-aware UTC)
+        log_buffer: Buffer for log messages
+
+    Returns:
+        DataFrame with the window ticks, sorted by timestamp (stable)
+    """
+    entries = tick_index.get_symbol_entries(broker_type, symbol)
+    overlapping = [
+        Path(entry['path']) for entry in entries
+        if any(_to_utc(entry['start_time']) < window_end
+               and _to_utc(entry['end_time']) >= window_start
+               for window_start, window_end in windows)
+    ]
+    log_buffer.append(
+        f"  ├─ Reading {len(overlapping)}/{len(entries)} tick files")
+
+    dfs = []
+    for tick_file in overlapping:
+        df = read_tick_parquet(tick_file)
+        dfs.append(df[_in_windows(df['timestamp'], windows)])
+
+    if not dfs:
+        return pd.DataFrame()
+
+    combined = pd.concat(dfs, ignore_index=True)
+    return combined.sort_values('timestamp', kind='stable').reset_index(drop=True)
+
+
+def _splice_bars(
+    existing: pd.DataFrame,
+    window_bars: Optional[pd.DataFrame],
+    windows: List[Tuple[pd.Timestamp, pd.Timestamp]]
+) -> pd.DataFrame:
+    """
+    Replace the bars inside the render windows with freshly rendered ones.
+
+    Args:
+        existing: Current bar file content
+        window_bars: Bars rendered from the window ticks (None/empty = no ticks left)
+        windows: Render windows (tz-aware UTC)
+
+    Returns:
+        Spliced bar DataFrame, sorted by timestamp
+    """
+    kept = existing[~_in_windows(existing['timestamp'], windows)]
+    frames = [kept]
+    if window_bars is not None and len(window_bars) > 0:
+        frames.append(window_bars)
+    spliced = pd.concat(frames, ignore_index=True) if len(frames) > 1 else kept
+    return spliced.sort_values('timestamp', kind='stable').reset_index(drop=True)
+
+
+def _bar_file_path(
+    data_dir: Path,
+    symbol: str,
+    timeframe: str,
+    broker_type: str
+) -> Path:
+    """
+    Bar parquet path for broker_type/symbol/timeframe.
+
+    Args:
+        data_dir: Base data directory
+        symbol: Trading symbol
+        timeframe: Timeframe string
+        broker_type: Broker type identifier
+
+    Returns:
+        Path of the timeframe's bar file
+    """
+    return data_dir / broker_type / "bars" / symbol / f"{symbol}_{timeframe}_BARS.parquet"
+
+
 def _write_bar_file(
     data_dir: Path,
     symbol: str,
@@ -223,11 +536,9 @@ def _write_bar_file(
         source_version_max: Maximum source data version
         log_buffer: Buffer for log messages
     """
-    bars_dir = data_dir / broker_type / "bars" / symbol
-    bars_dir.mkdir(parents=True, exist_ok=True)
-
-    filename = f"{symbol}_{timeframe}_BARS.parquet"
-    filepath = bars_dir / filename
+    filepath = _bar_file_path(data_dir, symbol, timeframe, broker_type)
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    filename = filepath.name
 
     market_config = MarketConfigManager()
     market_type = market_config.get_market_type(broker_type)
@@ -248,7 +559,9 @@ def _write_bar_file(
 
     table = pa.Table.from_pandas(bars_df)
     table = table.replace_schema_metadata(metadata)
-    pq.write_table(table, filepath, compression="snappy")
+    # Bounded row groups: range readers (HTTP API) prune by row-group statistics
+    pq.write_table(table, filepath, compression="snappy",
+                   row_group_size=BAR_ROW_GROUP_ROWS)
 
     file_size_mb = filepath.stat().st_size / (1024 * 1024)
     if log_buffer is not None:
@@ -374,7 +687,7 @@ class BarImporter:
                 self._clean_bars(bt)
 
         # === COLLECT ALL (broker_type, symbol) PAIRS ===
-        all_tasks: List[Tuple[str, str]] = []
+        all_tasks: List[RenderTask] = []
         for bt in broker_types:
             symbols = self.tick_index.list_symbols(bt)
             if not symbols:
@@ -382,7 +695,7 @@ class BarImporter:
                     f"No symbols found in tick data for broker_type '{bt}'!")
                 continue
             for symbol in symbols:
-                all_tasks.append((bt, symbol))
+                all_tasks.append((bt, symbol, None))
 
         if not all_tasks:
             vLog.warning('No symbols found across any broker_type!')
@@ -395,29 +708,76 @@ class BarImporter:
         vLog.info("=" * 80 + "\n")
 
         # === PARALLEL RENDERING ===
-        effective_workers = min(max_workers, len(all_tasks))
-
-        if effective_workers <= 1:
-            self._render_sequential(all_tasks)
-        else:
-            self._render_parallel(all_tasks, effective_workers)
+        self._render_tasks(all_tasks, max_workers)
 
         # Print summary
         self._print_summary()
 
-    def _render_sequential(self, tasks: List[Tuple[str, str]]) -> None:
+    def render_bars_for_ranges(
+        self,
+        touched_ranges: Dict[Tuple[str, str], List[Tuple[pd.Timestamp, pd.Timestamp]]]
+    ):
+        """
+        Incrementally re-render the bars of the time ranges touched by a tick import.
+
+        Only the touched (broker_type, symbol) pairs are rendered; per symbol only the ticks
+        inside the touched ranges (widened to whole D1 buckets) are loaded and the resulting
+        bars are spliced into the existing bar files. Symbols without bar files yet get a full
+        render. Index/cache rebuild is NOT performed — caller is responsible.
+
+        Args:
+            touched_ranges: (broker_type, symbol) → list of (start, end) tick time ranges
+        """
+        max_workers = self._import_config.get_bar_render_workers()
+
+        vLog.info("\n" + "=" * 80)
+        vLog.info("Bar Pre-Rendering - Incremental Mode")
+        vLog.info(f"Workers: {max_workers}")
+        vLog.info("=" * 80)
+
+        tasks: List[RenderTask] = [
+            (broker_type, symbol, ranges)
+            for (broker_type, symbol), ranges in sorted(touched_ranges.items())
+            if ranges
+        ]
+        if not tasks:
+            vLog.warning('No touched symbols — nothing to render')
+            return
+
+        vLog.info(f"Found {len(tasks)} touched symbols to splice")
+        vLog.info("=" * 80 + "\n")
+
+        self._render_tasks(tasks, max_workers)
+        self._print_summary()
+
+    def _render_tasks(self, tasks: List[RenderTask], max_workers: int) -> None:
+        """
+        Render tasks sequentially or in the process pool.
+
+        Args:
+            tasks: List of (broker_type, symbol, touched_ranges) tuples
+            max_workers: Configured worker process count
+        """
+        effective_workers = min(max_workers, len(tasks))
+
+        if effective_workers <= 1:
+            self._render_sequential(tasks)
+        else:
+            self._render_parallel(tasks, effective_workers)
+
+    def _render_sequential(self, tasks: List[RenderTask]) -> None:
         """
         Render symbols sequentially (single-process fallback).
 
         Args:
-            tasks: List of (broker_type, symbol) tuples
+            tasks: List of (broker_type, symbol, touched_ranges) tuples
         """
-        for i, (broker_type, symbol) in enumerate(tasks, 1):
+        for i, (broker_type, symbol, touched_ranges) in enumerate(tasks, 1):
             vLog.info(
                 f"\n[{i}/{len(tasks)}] Processing {broker_type}/{symbol}...")
 
-            result = _render_symbol_worker(
-                symbol, broker_type, str(self.data_dir), self.VERSION
+            result = _run_render_task(
+                symbol, broker_type, str(self.data_dir), self.VERSION, touched_ranges
             )
 
             # Flush log buffer
@@ -433,14 +793,14 @@ class BarImporter:
 
     def _render_parallel(
         self,
-        tasks: List[Tuple[str, str]],
+        tasks: List[RenderTask],
         max_workers: int
     ) -> None:
         """
         Render symbols in parallel using ProcessPoolExecutor.
 
         Args:
-            tasks: List of (broker_type, symbol) tuples
+            tasks: List of (broker_type, symbol, touched_ranges) tuples
             max_workers: Number of worker processes
         """
         vLog.info(
@@ -453,10 +813,10 @@ class BarImporter:
         with ProcessPoolExecutor(max_workers=max_workers) as executor:
             future_to_task = {
                 executor.submit(
-                    _render_symbol_worker,
-                    symbol, broker_type, str(self.data_dir), self.VERSION
+                    _run_render_task,
+                    symbol, broker_type, str(self.data_dir), self.VERSION, touched_ranges
                 ): (broker_type, symbol)
-                for broker_type, symbol in tasks
+                for broker_type, symbol, touched_ranges in tasks
             }
 
             for future in as_completed(future_to_task):
@@ -551,11 +911,12 @@ class BarImporter:
 
         Creates/updates .parquet_bars_index.parquet and rebuilds discovery caches.
         Called by the caller after rendering is complete — not automatically.
+        Incremental: only bar files rewritten by this run are rescanned.
         """
         vLog.info("\n📄 Updating bar index...")
         try:
-            bar_index = BarsIndexManager()
-            bar_index.build_index(force_rebuild=True)
+            bar_index = BarsIndexManager(data_dir=str(self.data_dir))
+            bar_index.build_index()
 
             # Count symbols across all broker_types
             total_symbols = len(bar_index.list_symbols())
@@ -0,0 +1,239 @@
+"""
+FiniexTestingIDE - Streaming JSON Tick Reader
+=============================================
+
+Incremental reader for MQL5 / Kraken tick exports:
+
+    {"metadata": {...}, "ticks": [{...}, {...}, ...], "summary": {...}}
+
+The top-level values before the `ticks` array (header) and after it (trailer)
+are small and decoded whole. The `ticks` array is decoded one object at a time
+from a bounded text buffer and handed out in chunks — peak memory is bounded by
+the chunk size, not by the export size.
+
+Stdlib only: json.JSONDecoder.raw_decode (C scanner) on a sliding buffer.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+# Text read per refill. Large enough that raw_decode rarely straddles a refill.
+READ_BLOCK_CHARS = 4 * 1024 * 1024
+
+_WHITESPACE = ' \t\n\r'
+
+
+class JsonTickStreamReader:
+    """
+    Streams the `ticks` array of a tick export in chunks.
+
+    Usage:
+        reader = JsonTickStreamReader(path, chunk_size=100_000)
+        header = reader.read_header()          # keys before "ticks"
+        for chunk in reader.iter_tick_chunks():
+            ...
+        trailer = reader.read_trailer()        # keys after "ticks"
+
+    A file without a top-level `ticks` key reads as an empty tick stream
+    (header holds everything) — the caller decides how to report it.
+    """
+
+    def __init__(self, path: Path, chunk_size: int = 100_000):
+        """
+        Args:
+            path: JSON export file
+            chunk_size: Ticks per yielded chunk
+        """
+        self._path = Path(path)
+        self._chunk_size = max(1, int(chunk_size))
+        self._decoder = json.JSONDecoder()
+        self._file = None
+        self._buf = ''
+        self._pos = 0
+        self._eof = False
+        self._has_ticks = False
+        self._ticks_done = False
+
+    # =========================================================================
+    # PUBLIC API
+    # =========================================================================
+
+    def read_header(self) -> Dict[str, Any]:
+        """
+        Open the file and decode all top-level entries up to the `ticks` array.
+
+        Returns:
+            Dict of the top-level entries preceding `ticks`
+
+        Raises:
+            ValueError: If the document is not a JSON object
+        """
+        self._file = open(self._path, 'r', encoding='utf-8')
+        self._skip_ws()
+        if not self._expect('{'):
+            self.close()
+            raise ValueError(
+                f"Invalid JSON structure in {self._path.name} - expected a top-level object")
+
+        header: Dict[str, Any] = {}
+        for key in self._iter_keys():
+            if key == 'ticks':
+                self._skip_ws()
+                if not self._expect('['):
+                    self.close()
+                    raise ValueError(
+                        f"Invalid JSON structure in {self._path.name} - 'ticks' is not an array")
+                self._has_ticks = True
+                return header
+            header[key] = self._decode_value()
+
+        self._ticks_done = True
+        return header
+
+    @property
+    def has_ticks(self) -> bool:
+        """Whether the document carries a top-level `ticks` array."""
+        return self._has_ticks
+
+    def iter_tick_chunks(self) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield the `ticks` array in lists of up to chunk_size objects.
+
+        Yields:
+            List of tick dicts (file order)
+        """
+        if not self._has_ticks or self._ticks_done:
+            return
+
+        chunk: List[Dict[str, Any]] = []
+        first = True
+        while True:
+            self._skip_ws()
+            if self._expect(']'):
+                break
+            if not first and not self._expect(','):
+                raise ValueError(
+                    f"Invalid JSON in {self._path.name} - expected ',' in ticks array")
+            first = False
+            chunk.append(self._decode_value())
+            if len(chunk) >= self._chunk_size:
+                yield chunk
+                chunk = []
+
+        self._ticks_done = True
+        if chunk:
+            yield chunk
+
+    def read_trailer(self) -> Dict[str, Any]:
+        """
+        Decode the top-level entries after the `ticks` array and close the file.
+
+        Returns:
+            Dict of the top-level entries following `ticks`
+        """
+        trailer: Dict[str, Any] = {}
+        if self._has_ticks:
+            # Drain unread chunks so the parser sits behind the array
+            for _ in self.iter_tick_chunks():
+                pass
+            for key in self._iter_keys(after_value=True):
+                trailer[key] = self._decode_value()
+        self.close()
+        return trailer
+
+    def close(self) -> None:
+        """Close the underlying file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    # =========================================================================
+    # PARSER INTERNALS
+    # =========================================================================
+
+    def _iter_keys(self, after_value: bool = False) -> Iterator[str]:
+        """
+        Iterate top-level object keys; the caller decodes each value.
+
+        Args:
+            after_value: Positioned behind a value (expects ',' or '}' first)
+
+        Yields:
+            Key strings (positioned before the value)
+        """
+        expect_comma = after_value
+        while True:
+            self._skip_ws()
+            if self._expect('}'):
+                return
+            if expect_comma and not self._expect(','):
+                raise ValueError(
+                    f"Invalid JSON in {self._path.name} - expected ',' between top-level entries")
+            expect_comma = True
+            self._skip_ws()
+            key = self._decode_value()
+            self._skip_ws()
+            if not self._expect(':'):
+                raise ValueError(
+                    f"Invalid JSON in {self._path.name} - expected ':' after key {key!r}")
+            yield key
+
+    def _decode_value(self) -> Any:
+        """
+        Decode one JSON value at the cursor, refilling the buffer as needed.
+
+        A value ending exactly at the buffer end is re-decoded after a refill —
+        a number cut by the block boundary would otherwise decode truncated.
+
+        Returns:
+            The decoded value
+        """
+        self._skip_ws()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+                if end < len(self._buf) or self._eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            self._fill()
+
+    def _skip_ws(self) -> None:
+        """Advance past whitespace, refilling at the buffer end."""
+        while True:
+            buf, pos, size = self._buf, self._pos, len(self._buf)
+            while pos < size and buf[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < size or self._eof:
+                return
+            self._fill()
+
+    def _expect(self, char: str) -> bool:
+        """
+        Consume char if it is next in the stream (whitespace already skipped).
+
+        Args:
+            char: Single structural character
+
+        Returns:
+            True if consumed
+        """
+        if self._pos >= len(self._buf) and not self._eof:
+            self._fill()
+        if self._pos < len(self._buf) and self._buf[self._pos] == char:
+            self._pos += 1
+            return True
+        return False
+
+    def _fill(self) -> None:
+        """Drop consumed text and append the next block."""
+        block = self._file.read(READ_BLOCK_CHARS)
+        if not block:
+            self._eof = True
+            return
+        self._buf = self._buf[self._pos:] + block
+        self._pos = 0
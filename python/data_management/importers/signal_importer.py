@@ -72,6 +72,8 @@ class SignalDataImporter:
         self.total_rows = 0
         self.moved_files = 0
         self.pruned_dirs = 0
+        # Parquet files written by this run — only their index entries are updated
+        self.written_files: List[Path] = []
         self.errors: List[str] = []
         self.warnings: List[str] = []
 
@@ -102,6 +104,7 @@ class SignalDataImporter:
                 written = self.convert_jsonl_to_parquet(jsonl_file)
                 self.processed_files += 1
                 if written is not None:
+                    self.written_files.append(written)
                     self._move_to_finished(root, jsonl_file)
             except Exception as e:
                 error_msg = f"ERROR in {jsonl_file.name}: {str(e)}"
@@ -360,13 +363,21 @@ class SignalDataImporter:
         return row
 
     def _rebuild_index(self) -> None:
-        """Rebuild the signal index over the target directory."""
+        """
+        Update the signal index over the target directory.
+
+        Only entries of files written by this run are rescanned; without such
+        files the index is refreshed against the tree (stat only).
+        """
         try:
             index_manager = SignalIndexManager(data_dir=str(self.target_dir))
-            index_manager.build_index(force_rebuild=True)
-            vLog.info("✅ Signal index rebuilt")
+            if self.written_files:
+                index_manager.update_entries(self.written_files)
+            else:
+                index_manager.build_index()
+            vLog.info("✅ Signal index updated")
         except Exception as e:
-            vLog.error(f"Signal index rebuild failed: {e}")
+            vLog.error(f"Signal index update failed: {e}")
 
     def _print_summary(self) -> None:
         """Print the import summary."""
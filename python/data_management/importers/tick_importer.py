@@ -9,12 +9,14 @@ Author: FiniexTestingIDE Team
 Version: 1.6 (Import Config Isolation + Source Metadata)
 """
 
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import itertools
 import json
 import os
 from datetime import datetime, timezone
 from pathlib import Path
 import re
-from typing import Dict, List, Optional, Set
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
 import numpy as np
 import pandas as pd
@@ -24,19 +26,97 @@ import pyarrow.parquet as pq
 from python.configuration.import_config_manager import ImportConfigManager
 from python.configuration.market_config_manager import MarketConfigManager
 from python.data_management.importers.bar_importer import BarImporter
+from python.data_management.importers.json_tick_stream_reader import JsonTickStreamReader
+from python.data_management.index.tick_fingerprint_table import TickFingerprintTable
 from python.data_management.index.tick_index_manager import TickIndexManager
 
 # Import duplicate detection
 from python.framework.exceptions.data_quality_errors import ArtificialDuplicateException
 from python.framework.exceptions.data_quality_errors import TickFileValidationException
 from python.framework.reporting.duplicate_report import DuplicateReport
+from python.framework.types.import_result_types import StagedTickFile, TickImportResult
 
 from python.framework.logging.bootstrap_logger import get_global_logger
 from python.framework.utils.market_session_utils import get_session_from_utc_hour
-from python.framework.validators.tick_import_validator import TickImportValidator
+from python.framework.validators.tick_import_validator import (
+    TickFileValidationStream,
+    TickImportValidator,
+)
 vLog = get_global_logger()
 
 
+# =============================================================================
+# TOP-LEVEL WORKER FUNCTION (required for multiprocessing pickle)
+# =============================================================================
+
+def _emit_log(level: str, message: str) -> None:
+    """
+    Write one message to the global logger at its level (direct or replayed from a worker buffer).
+
+    Args:
+        level: Log level ('info', 'debug', 'warning', 'error')
+        message: Log message
+    """
+    if level == 'debug':
+        vLog.debug(message)
+    elif level == 'warning':
+        vLog.warning(message)
+    elif level == 'error':
+        vLog.error(message)
+    else:
+        vLog.info(message)
+
+
+def _convert_file_worker(
+    json_file: str,
+    source_dir: str,
+    target_dir: str,
+    offset_registry: Dict[str, int],
+    streaming_threshold_mb: Optional[float],
+    streaming_chunk_ticks: int
+) -> TickImportResult:
+    """
+    Standalone worker function for parallel tick import.
+
+    Runs in a subprocess — must be top-level for pickle compatibility.
+    Runs only the conversion phase: the file ends up validated at a hidden
+    staging path; duplicate check and commit stay with the main process.
+    All log output is buffered as (level, message) pairs and returned in the result.
+
+    Args:
+        json_file: Source JSON path (string for pickle)
+        source_dir: Import source directory
+        target_dir: Parquet target directory
+        offset_registry: Per-broker offset mapping {broker_type: offset_hours}
+        streaming_threshold_mb: Streaming import threshold (None = always whole)
+        streaming_chunk_ticks: Ticks per chunk when streaming
+
+    Returns:
+        TickImportResult with staged file, log buffer, and status
+    """
+    file_name = Path(json_file).name
+    log_buffer: list[tuple[str, str]] = []
+    importer = TickDataImporter(
+        source_dir=source_dir,
+        target_dir=target_dir,
+        offset_registry=offset_registry,
+        auto_render_bars=False,
+        streaming_threshold_mb=streaming_threshold_mb,
+        streaming_chunk_ticks=streaming_chunk_ticks,
+        log_buffer=log_buffer,
+    )
+
+    result = TickImportResult(file_name=file_name, log_buffer=log_buffer,
+                              warnings=importer.warnings)
+    try:
+        result.staged = importer._stage_json_file(Path(json_file))
+    except TickFileValidationException as e:
+        result.validation_error = str(e)
+    except Exception as e:
+        result.error_message = f"ERROR in {file_name}: {str(e)}"
+    return result
+
+
 class TickDataImporter:
     """
     Converts MQL5 JSON exports to Parquet format with UTC conversion.
@@ -61,12 +141,26 @@ class TickDataImporter:
 
     VERSION = "1.6"
 
+    # Columns written to parquet (ImportTickSchema) — others (e.g. legacy server_time) are dropped
+    _PARQUET_COLUMNS = [
+        'timestamp', 'time_msc', 'collected_msc',
+        'bid', 'ask', 'last',
+        'tick_volume', 'real_volume', 'chart_tick_volume',
+        'spread_points', 'spread_pct',
+        'tick_flags', 'session',
+    ]
+
     def __init__(self, source_dir: str, target_dir: str,
                  override: bool = False,
                  offset_registry: Optional[Dict[str, int]] = None,
                  move_processed_files: bool = True,
                  finished_dir: Optional[str] = None,
-                 auto_render_bars: bool = True):
+                 auto_render_bars: bool = True,
+                 incremental_bar_rendering: bool = True,
+                 streaming_threshold_mb: Optional[float] = 256.0,
+                 streaming_chunk_ticks: int = 250_000,
+                 import_workers: int = 1,
+                 log_buffer: Optional[List[Tuple[str, str]]] = None):
         """
         Initialize importer with source and target paths.
 
@@ -78,6 +172,13 @@ class TickDataImporter:
             move_processed_files: Move JSON to finished_dir after import
             finished_dir: Directory for processed JSON files
             auto_render_bars: Automatically render bars after tick import
+            incremental_bar_rendering: Splice only the touched time ranges into the
+                existing bar files (False = full clean re-render of all symbols)
+            streaming_threshold_mb: JSON files from this size on are parsed in chunks
+                (bounded memory); None = always load whole
+            streaming_chunk_ticks: Ticks per chunk / Parquet row group when streaming
+            import_workers: Worker processes converting files concurrently (1 = sequential)
+            log_buffer: Optional buffer for per-file (level, message) pairs (parallel import)
         """
         self.source_dir = Path(source_dir)
         self.target_dir = Path(target_dir)
@@ -88,6 +189,12 @@ class TickDataImporter:
         self._move_processed_files = move_processed_files
         self._finished_dir = Path(finished_dir) if finished_dir else None
         self._auto_render_bars = auto_render_bars
+        self._incremental_bar_rendering = incremental_bar_rendering
+        self._streaming_threshold_mb = streaming_threshold_mb
+        self._streaming_chunk_ticks = streaming_chunk_ticks
+        self._import_workers = max(1, import_workers)
+
+        self._log_buffer = log_buffer
 
         # Batch processing statistics
         self.processed_files = 0
@@ -98,6 +205,16 @@ class TickDataImporter:
         # Track processed broker_types for bar rendering
         self._processed_broker_types: Set[str] = set()
 
+        # Tick time ranges written or deleted per (broker_type, symbol) — incremental bars
+        self._touched_ranges: Dict[Tuple[str, str],
+                                   List[Tuple[pd.Timestamp, pd.Timestamp]]] = {}
+
+        # Parquet files written or deleted — only their index entries are updated
+        self._index_updates: Set[Path] = set()
+
+        # Source/content fingerprints of the archive — loaded on first commit
+        self._fingerprints: Optional[TickFingerprintTable] = None
+
         self._validator = TickImportValidator()
 
     def _normalize_broker_type(self, broker_type: str) -> str:
@@ -117,8 +234,9 @@ class TickDataImporter:
 
     def process_all_exports(self):
         """
-        Finds all TickCollector exports and converts them sequentially.
-        Errors do not stop processing of remaining files.
+        Finds all TickCollector exports and converts them — sequentially, or in
+        a process pool when import_workers > 1. Errors do not stop processing
+        of remaining files. The index is rebuilt once at the end.
         """
         json_files = list(self.source_dir.glob("*_ticks.json"))
 
@@ -144,50 +262,161 @@ class TickDataImporter:
             vLog.info(f"Offset Registry: EMPTY (no offsets configured)")
         vLog.info("=" * 80 + "\n")
 
-        # Sequential processing with error recovery
+        if self._import_workers > 1 and len(json_files) > 1:
+            self._process_parallel(
+                json_files, min(self._import_workers, len(json_files)))
+        else:
+            self._process_sequential(json_files)
+
+        # Index rebuilt once for the whole batch (+ cross-file ordering checks)
+        self.rebuild_parquet_index()
+
+        # === AUTO-TRIGGER BAR RENDERING ===
+        # After all ticks imported, render bars automatically
+        if self.processed_files > 0 and self._auto_render_bars:
+            self._trigger_bar_rendering()
+
+        self._print_summary()
+
+    def _process_sequential(self, json_files: List[Path]) -> None:
+        """
+        Convert and commit files one at a time, with error recovery.
+
+        Args:
+            json_files: Source JSON exports
+        """
         for json_file in json_files:
             vLog.info(f"\n📄 Processing: {json_file.name}")
             try:
                 self.convert_json_to_parquet(json_file)
                 self.processed_files += 1
             except ArtificialDuplicateException as e:
-                # Special handling for duplicate detection
-                warning_msg = f"DUPLICATE DETECTED in {json_file.name}"
-                vLog.warning(warning_msg)
-                vLog.warning(str(e))
-                self.warnings.append(warning_msg)
-                vLog.info("→ Skipping import (duplicate already exists)")
+                self._record_duplicate(json_file.name, e)
             except TickFileValidationException as e:
-                # Structural defect in the source file — refuse it, keep the batch running
-                error_msg = f"VALIDATION FAILED in {json_file.name}"
-                vLog.error(error_msg)
-                vLog.error(str(e))
-                self.errors.append(error_msg)
-                vLog.info("→ Skipping import (file not written)")
+                self._record_validation_failure(json_file.name, str(e))
             except Exception as e:
-                error_msg = f"ERROR in {json_file.name}: {str(e)}"
-                vLog.error(error_msg)
-                self.errors.append(error_msg)
+                self._record_file_error(f"ERROR in {json_file.name}: {str(e)}")
 
-        self.rebuild_parquet_index()
+    def _process_parallel(self, json_files: List[Path], max_workers: int) -> None:
+        """
+        Convert files concurrently in a ProcessPoolExecutor, then commit serially.
 
-        # === AUTO-TRIGGER BAR RENDERING ===
-        # After all ticks imported, render bars automatically
-        if self.processed_files > 0 and self._auto_render_bars:
-            self._trigger_bar_rendering()
+        Workers run the conversion phase only (to hidden staging paths). The
+        commit phase — duplicate check, override deletion, rename into place —
+        runs here in file order, so checks per (broker_type, symbol) never race.
+        Log buffers are flushed per file in the same order.
 
-        self._print_summary()
+        Args:
+            json_files: Source JSON exports
+            max_workers: Number of worker processes
+        """
+        vLog.info(
+            f"🚀 Launching {max_workers} worker processes for "
+            f"{len(json_files)} files...\n"
+        )
+
+        results: Dict[str, TickImportResult] = {}
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            future_to_file = {
+                executor.submit(
+                    _convert_file_worker,
+                    str(json_file), str(self.source_dir), str(self.target_dir),
+                    self._offset_registry,
+                    self._streaming_threshold_mb, self._streaming_chunk_ticks
+                ): json_file
+                for json_file in json_files
+            }
+
+            for future in as_completed(future_to_file):
+                json_file = future_to_file[future]
+                try:
+                    results[json_file.name] = future.result()
+                except Exception as e:
+                    results[json_file.name] = TickImportResult(
+                        file_name=json_file.name,
+                        error_message=f"ERROR in {json_file.name}: {str(e)}",
+                        log_buffer=[('error', f"  └─ ❌ Worker crashed: {str(e)}")]
+                    )
+
+        # Flush log buffers and commit in file order
+        for i, json_file in enumerate(json_files, 1):
+            result = results[json_file.name]
+            vLog.info(
+                f"\n📄 Processing: {json_file.name} [{i}/{len(json_files)}]")
+            for level, line in result.log_buffer:
+                _emit_log(level, line)
+            self.warnings.extend(result.warnings)
+
+            if result.validation_error is not None:
+                self._record_validation_failure(
+                    json_file.name, result.validation_error)
+                continue
+            if result.error_message is not None:
+                self._record_file_error(result.error_message)
+                continue
+
+            try:
+                if result.staged is not None:
+                    self._commit_staged_file(result.staged)
+                self.processed_files += 1
+            except ArtificialDuplicateException as e:
+                self._record_duplicate(json_file.name, e)
+            except Exception as e:
+                self._record_file_error(f"ERROR in {json_file.name}: {str(e)}")
+
+    def _record_duplicate(self, file_name: str, error: ArtificialDuplicateException) -> None:
+        """Special handling for duplicate detection — skip the file, keep the batch running."""
+        warning_msg = f"DUPLICATE DETECTED in {file_name}"
+        vLog.warning(warning_msg)
+        vLog.warning(str(error))
+        self.warnings.append(warning_msg)
+        vLog.info("→ Skipping import (duplicate already exists)")
+
+    def _record_validation_failure(self, file_name: str, report: str) -> None:
+        """Structural defect in the source file — refuse it, keep the batch running."""
+        error_msg = f"VALIDATION FAILED in {file_name}"
+        vLog.error(error_msg)
+        vLog.error(report)
+        self.errors.append(error_msg)
+        vLog.info("→ Skipping import (file not written)")
+
+    def _record_file_error(self, error_msg: str) -> None:
+        """Any other failure — log it, keep the batch running."""
+        vLog.error(error_msg)
+        self.errors.append(error_msg)
+
+    def _log(self, level: str, message: str) -> None:
+        """
+        Route log output to buffer (worker process) or global logger.
+
+        Args:
+            level: Log level ('info', 'debug', 'warning', 'error')
+            message: Log message
+        """
+        if self._log_buffer is not None:
+            self._log_buffer.append((level, message))
+        else:
+            _emit_log(level, message)
 
     def rebuild_parquet_index(self):
-        """Rebuild index after successful imports"""
-        vLog.info("\n🔄 Rebuilding Parquet index...")
+        """
+        Update the index after imports.
+
+        Only entries of files written or deleted by this run are rescanned;
+        without such files the index is refreshed against the tree (stat only).
+        """
+        vLog.info("\n🔄 Updating Parquet index...")
         try:
 
             index_manager = TickIndexManager(data_dir=str(self.target_dir))
-            index_manager.build_index(force_rebuild=True)
+            if self._index_updates:
+                index_manager.update_entries(self._index_updates)
+            else:
+                index_manager.build_index()
 
             symbols = index_manager.list_symbols()
-            vLog.info(f"✅ Index rebuilt: {len(symbols)} symbols indexed")
+            vLog.info(f"✅ Index updated: {len(symbols)} symbols indexed")
 
             self._validate_archive_ordering(index_manager)
 
@@ -231,84 +460,65 @@ class TickDataImporter:
         """
         Converts single JSON file to optimized Parquet with UTC conversion.
 
+        Files from streaming_threshold_mb on are parsed incrementally: the ticks
+        array is read in chunks of streaming_chunk_ticks, so peak memory is
+        bounded by the chunk size. Smaller files are loaded whole (one chunk).
+
         Pipeline:
-        1. Load JSON and validate structure
-        2. Create DataFrame and optimize datatypes
-        3. Apply time offset (if set)
-        4. Recalculate sessions (if offset applied)
-        5. Validate structural invariants (refuses the file on violation)
-        6. Check for existing duplicates (with override support)
-        7. Save as Parquet with metadata
+        1. Load JSON (whole or streamed) and validate structure
+        2. Per chunk: create DataFrame, optimize datatypes, apply time offset,
+           recalculate sessions, feed the validator, append a Parquet row group
+           to a temporary file
+        3. Validate structural invariants (refuses the file on violation)
+        4. Finalize Parquet with metadata at a hidden staging path
+        5. Check for existing duplicates (with override support), move into place
+
+        Steps 1-4 are the conversion phase (_stage_json_file, parallelizable),
+        step 5 the commit phase (_commit_staged_file, always in the main process).
         """
+        staged = self._stage_json_file(json_file)
+        if staged is not None:
+            self._commit_staged_file(staged)
 
-        # ===========================================
-        # 1. LOAD AND VALIDATE JSON
-        # ===========================================
+    def _stage_json_file(self, json_file: Path) -> Optional[StagedTickFile]:
+        """
+        Conversion phase: JSON → validated Parquet at a dot-prefixed staging path.
 
-        with open(json_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        Touches nothing visible — no final file, no statistics beyond warnings —
+        so it can run in a worker process concurrently with other files.
 
-        if "ticks" not in data or "metadata" not in data:
-            raise ValueError(
-                "Invalid JSON structure - missing 'ticks' or 'metadata'")
+        Args:
+            json_file: Source JSON export
 
-        ticks = data["ticks"]
-        metadata = data["metadata"]
+        Returns:
+            StagedTickFile, None if the file holds no ticks
 
-        if not ticks:
-            vLog.warning(f"No ticks in {json_file.name}")
-            return
+        Raises:
+            TickFileValidationException: If the file violates structural invariants
+            ValueError: On invalid JSON structure or unknown broker_type
+        """
 
         # ===========================================
-        # 2. DISPLAY BROKER METADATA (FIXED)
+        # 1. LOAD AND VALIDATE JSON
         # ===========================================
 
-        vLog.info(f"📊 Broker Metadata:")
-
-        # Get data version to show in "not available" messages
-        data_version = metadata.get('data_format_version', 'unknown')
-
-        # Detected Offset (available since v1.0.5)
-        detected_offset = metadata.get('broker_utc_offset_hours', None)
-        if detected_offset is not None:
-            sign = '+' if detected_offset >= 0 else ''
-            vLog.info(f"   Detected Offset: GMT{sign}{detected_offset}")
-        else:
-            vLog.info(
-                f"   Detected Offset: Not available (pre v1.0.5 data, version: {data_version})")
-
-        # Local Device Time (planned for v1.0.5+, but not yet implemented in MQL5)
-        local_device = metadata.get('local_device_time', None)
-        if local_device:
-            vLog.info(f"   Local Device:    {local_device}")
-        else:
-            vLog.info(f"   Local Device:    Not available (pre v1.0.5 data)")
+        document, tick_chunks, read_trailer = self._open_tick_source(json_file)
+        metadata = document["metadata"]
 
-        # Broker Time (planned for v1.0.5+, but not yet implemented in MQL5)
-        broker_time = metadata.get('broker_server_time', None)
-        if broker_time:
-            vLog.info(f"   Broker Time:     {broker_time}")
-        else:
-            vLog.info(f"   Broker Time:     Not available (pre v1.0.5 data)")
+        first_chunk = next(tick_chunks, None)
+        if not first_chunk:
+            read_trailer()
+            self._log('warning', f"No ticks in {json_file.name}")
+            return None
 
         # ===========================================
-        # 3. CREATE AND OPTIMIZE DATAFRAME
+        # 2. DISPLAY BROKER METADATA
         # ===========================================
 
-        df = pd.DataFrame(ticks)
-
-        # Ensure collected_msc column exists (missing in pre-V1.3.0 data)
-        if 'collected_msc' not in df.columns:
-            df['collected_msc'] = 0
-
-        df = self._optimize_datatypes(df)
-
-        # Parse timestamps as timezone-naive
-        if "timestamp" in df.columns:
-            df["timestamp"] = pd.to_datetime(df["timestamp"])
+        self._log_broker_metadata(metadata)
 
         # ===========================================
-        # 4. APPLY TIME OFFSET (from registry)
+        # 3. RESOLVE BROKER TYPE + TIME OFFSET (from registry)
         # ===========================================
         broker_type_normalized = self._validate_broker_type(
             metadata)
@@ -317,47 +527,60 @@ class TickDataImporter:
         file_offset = self._offset_registry.get(broker_type_normalized, 0)
         should_apply_offset = file_offset != 0
 
-        if should_apply_offset:
-            df = self._apply_time_offset(df, file_offset)
-            df = self._recalculate_sessions(df)
-            vLog.info(
-                f"   ✅ Time offset {file_offset:+d}h applied (broker_type={broker_type_normalized})")
-            vLog.info(f"   ✅ Sessions recalculated based on UTC time")
-        else:
-            vLog.info(
-                f"   ℹ️  No offset for broker_type={broker_type_normalized} (0h in registry)")
+        symbol = metadata.get("symbol", "UNKNOWN")
+        start_time = pd.to_datetime(metadata.get(
+            "start_time", datetime.now(timezone.utc)))
+
+        target_path = self.target_dir / broker_type_normalized / "ticks" / symbol
+        target_path.mkdir(parents=True, exist_ok=True)
+
+        parquet_name = f"{symbol}_{start_time.strftime('%Y%m%d_%H%M%S')}.parquet"
+        parquet_path = target_path / parquet_name
+        # Dot-prefixed: invisible to the tick index and duplicate globs until committed.
+        # The source name keeps concurrent conversions with equal start_time apart.
+        partial_path = target_path / f".{parquet_name}.{json_file.stem}.partial"
+        staged_path = target_path / f".{parquet_name}.{json_file.stem}.staged"
 
         # ===========================================
-        # 6. VALIDATION
+        # 4. CONVERT CHUNKS (optimize, offset, validate, write row groups)
         # ===========================================
 
-        self._processed_broker_types.add(broker_type_normalized)
-        # Preserve JSON array order (= authentic arrival order)
-        # No sort — collected_msc monotonicity depends on this
-        df = df.reset_index(drop=True)
-
-        validation = self._validator.validate_file(
-            df=df,
-            file_name=json_file.name,
-            declared_tick_count=data.get('summary', {}).get('total_ticks'),
+        validation_stream = self._validator.open_stream(
+            json_file.name,
             collected_msc_is_utc=metadata.get(
                 'collected_msc_timebase') == 'utc'
         )
+        stats = self._write_tick_chunks(
+            itertools.chain([first_chunk], tick_chunks),
+            file_offset, validation_stream, partial_path)
+        document = {**document, **read_trailer()}
+
+        if should_apply_offset:
+            self._log_time_offset(
+                file_offset, stats['first_timestamp'], stats['last_timestamp'])
+            self._log('info', f"   ✅ Time offset {file_offset:+d}h applied (broker_type={broker_type_normalized})")
+            self._log('info', f"   ✅ Sessions recalculated based on UTC time")
+        else:
+            self._log('info', f"   ℹ️  No offset for broker_type={broker_type_normalized} (0h in registry)")
+
+        # ===========================================
+        # 5. VALIDATION
+        # ===========================================
+
+        validation = validation_stream.finish(
+            declared_tick_count=document.get('summary', {}).get('total_ticks'))
         for warning in validation.warnings:
-            vLog.warning(f"   ⚠️  {warning}")
+            self._log('warning', f"   ⚠️  {warning}")
             self.warnings.append(f"{json_file.name}: {warning}")
         if not validation.is_valid:
+            partial_path.unlink(missing_ok=True)
             raise TickFileValidationException(validation)
-        vLog.info("   ✅ Validation passed")
+        self._log('info', "   ✅ Validation passed")
 
         # ===========================================
-        # 7. PREPARE PARQUET OUTPUT
+        # 6. PREPARE PARQUET METADATA
         # ===========================================
 
-        symbol = metadata.get("symbol", "UNKNOWN")
-        start_time = pd.to_datetime(metadata.get(
-            "start_time", datetime.now(timezone.utc)))
-
         # Extract data_format_version (for metadata only)
         data_format_version = metadata.get("data_format_version", "1.0.0")
 
@@ -366,12 +589,6 @@ class TickDataImporter:
         market_type = market_config.get_market_type(
             broker_type_normalized).value
 
-        target_path = self.target_dir / broker_type_normalized / "ticks" / symbol
-        target_path.mkdir(parents=True, exist_ok=True)
-
-        parquet_name = f"{symbol}_{start_time.strftime('%Y%m%d_%H%M%S')}.parquet"
-        parquet_path = target_path / parquet_name
-
         # Metadata for Parquet header
         parquet_metadata = {
             "source_file": json_file.name,
@@ -381,7 +598,7 @@ class TickDataImporter:
             "broker_type": broker_type_normalized,
             "market_type": market_type,
             "processed_at": datetime.now(timezone.utc).isoformat(),
-            "tick_count": str(len(df)),
+            "tick_count": str(stats['rows']),
             "importer_version": self.VERSION,
             "user_time_offset_hours": str(file_offset),
             "utc_conversion_applied": "true" if should_apply_offset else "false",
@@ -397,6 +614,54 @@ class TickDataImporter:
             elif meta_key not in ("symbol", "broker", "ticks"):
                 parquet_metadata[f"source_meta_{meta_key}"] = str(meta_value)
 
+        # ===========================================
+        # 7. FINALIZE PARQUET (staging path)
+        # ===========================================
+
+        try:
+            self._finalize_parquet(partial_path, staged_path, parquet_metadata)
+        except Exception as e:
+            partial_path.unlink(missing_ok=True)
+            staged_path.unlink(missing_ok=True)
+            self._log('error', f"ERROR writing {parquet_path}")
+            self._log('error', f"Original Error: {str(e)}")
+            self._log('error', f"Error Type: {type(e)}")
+            raise
+
+        return StagedTickFile(
+            json_file=str(json_file),
+            broker_type=broker_type_normalized,
+            symbol=symbol,
+            staged_path=str(staged_path),
+            parquet_path=str(parquet_path),
+            tick_count=stats['rows'],
+            content_hash=TickFingerprintTable.content_hash(
+                stats['first_time_msc'], stats['last_time_msc'], stats['rows']),
+            chunks=stats['chunks'],
+            min_timestamp=stats['min_timestamp'],
+            max_timestamp=stats['max_timestamp'],
+            utc_converted=should_apply_offset,
+            market_type=market_type,
+            data_format_version=data_format_version,
+        )
+
+    def _commit_staged_file(self, staged: StagedTickFile) -> None:
+        """
+        Commit phase: duplicate check, then move the staged file into place.
+
+        Always runs in the main process, one file at a time — duplicate checks
+        and override deletions per (broker_type, symbol) never race.
+
+        Args:
+            staged: Output of the conversion phase
+
+        Raises:
+            ArtificialDuplicateException: If the source was imported before (no override)
+        """
+        json_file = Path(staged.json_file)
+        staged_path = Path(staged.staged_path)
+        parquet_path = Path(staged.parquet_path)
+
         # ===========================================
         # 8. CHECK FOR EXISTING DUPLICATES
         # ===========================================
@@ -404,10 +669,9 @@ class TickDataImporter:
         vLog.debug(f"Checking for existing duplicates...")
         duplicate_report = self._check_for_existing_duplicate(
             json_file.name,
-            broker_type_normalized,
-            symbol,
-            df,
-            parquet_path
+            staged.broker_type,
+            staged.symbol,
+            staged.content_hash
         )
 
         if duplicate_report:
@@ -415,30 +679,30 @@ class TickDataImporter:
                 vLog.warning(f"⚠️  Override enabled - deleting existing file")
                 for dup_file in duplicate_report.duplicate_files:
                     dup_file.unlink()
+                    self._index_updates.add(dup_file)
+                    self._fingerprint_table().remove(dup_file)
                     vLog.info(f"   🗑️  Deleted: {dup_file.name}")
+                # Bars of the replaced file's range must be re-rendered too
+                for range_start, range_end in duplicate_report.time_ranges:
+                    self._record_touched_range(
+                        staged.broker_type, staged.symbol, range_start, range_end)
             else:
+                staged_path.unlink(missing_ok=True)
                 raise ArtificialDuplicateException(duplicate_report)
 
         # ===========================================
-        # 9. WRITE PARQUET
+        # 9. MOVE INTO PLACE
         # ===========================================
 
-        # Drop columns not in ImportTickSchema (e.g. legacy server_time)
-        _PARQUET_COLUMNS = [
-            'timestamp', 'time_msc', 'collected_msc',
-            'bid', 'ask', 'last',
-            'tick_volume', 'real_volume', 'chart_tick_volume',
-            'spread_points', 'spread_pct',
-            'tick_flags', 'session',
-        ]
-        extra_cols = [c for c in df.columns if c not in _PARQUET_COLUMNS]
-        if extra_cols:
-            df = df.drop(columns=extra_cols)
-
         try:
-            table = pa.Table.from_pandas(df)
-            table = table.replace_schema_metadata(parquet_metadata)
-            pq.write_table(table, parquet_path, compression="snappy")
+            os.replace(staged_path, parquet_path)
+            self._index_updates.add(parquet_path)
+            fingerprints = self._fingerprint_table()
+            fingerprints.add(
+                parquet_path, staged.broker_type, staged.symbol, json_file.name,
+                staged.content_hash, staged.tick_count,
+                staged.min_timestamp, staged.max_timestamp)
+            fingerprints.save()
 
             json_size = json_file.stat().st_size
             parquet_size = parquet_path.stat().st_size
@@ -450,24 +714,257 @@ class TickDataImporter:
                 json_file.rename(finished_file)
                 vLog.info(f"→ Moved {json_file.name} to finished/")
 
-            self.total_ticks += len(df)
+            self.total_ticks += staged.tick_count
+            self._processed_broker_types.add(staged.broker_type)
+            self._record_touched_range(
+                staged.broker_type, staged.symbol,
+                staged.min_timestamp, staged.max_timestamp)
 
-            time_suffix = " (UTC)" if should_apply_offset else ""
+            time_suffix = " (UTC)" if staged.utc_converted else ""
+            streamed_suffix = f", streamed in {staged.chunks} chunks" if staged.chunks > 1 else ""
             vLog.info(
-                f"✅ {broker_type_normalized}/ticks/{symbol}/{parquet_name}: {len(df):,} Ticks{time_suffix}, "
+                f"✅ {staged.broker_type}/ticks/{staged.symbol}/{parquet_path.name}: "
+                f"{staged.tick_count:,} Ticks{time_suffix}, "
                 f"Compression {compression_ratio:.1f}:1 "
-                f"({json_size/1024/1024:.1f}MB → {parquet_size/1024/1024:.1f}MB)"
+                f"({json_size/1024/1024:.1f}MB → {parquet_size/1024/1024:.1f}MB){streamed_suffix}"
             )
 
             vLog.debug(
-                f"   market_type={market_type}, version={data_format_version}")
+                f"   market_type={staged.market_type}, version={staged.data_format_version}")
 
         except Exception as e:
+            staged_path.unlink(missing_ok=True)
             vLog.error(f"ERROR writing {parquet_path}")
             vLog.error(f"Original Error: {str(e)}")
             vLog.error(f"Error Type: {type(e)}")
             raise
 
+    def _open_tick_source(
+        self,
+        json_file: Path
+    ) -> Tuple[Dict[str, Any], Iterator[List[Dict[str, Any]]], Callable[[], Dict[str, Any]]]:
+        """
+        Open a JSON export whole or as a chunked stream, by file size.
+
+        Args:
+            json_file: MQL5 / Kraken JSON export
+
+        Returns:
+            (top-level entries before the ticks array, tick chunk iterator,
+             callable returning the entries after the ticks array)
+
+        Raises:
+            ValueError: If 'ticks' or 'metadata' is missing
+        """
+        file_mb = json_file.stat().st_size / (1024 * 1024)
+        if self._streaming_threshold_mb is not None and file_mb >= self._streaming_threshold_mb:
+            reader = JsonTickStreamReader(json_file, self._streaming_chunk_ticks)
+            header = reader.read_header()
+            if reader.has_ticks and "metadata" in header:
+                self._log('info', f"   📥 Streaming import ({file_mb:.1f} MB, "
+                          f"{self._streaming_chunk_ticks:,} ticks per chunk)")
+                return header, reader.iter_tick_chunks(), reader.read_trailer
+            reader.close()
+            if reader.has_ticks:
+                # Metadata follows the ticks array — offsets are unknown while streaming
+                self._log('warning', f"   ⚠️  'metadata' follows 'ticks' in {json_file.name} — loading whole file")
+
+        with open(json_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        if "ticks" not in data or "metadata" not in data:
+            raise ValueError(
+                "Invalid JSON structure - missing 'ticks' or 'metadata'")
+
+        return data, iter([data.pop("ticks")]), dict
+
+    def _write_tick_chunks(
+        self,
+        tick_chunks: Iterator[List[Dict[str, Any]]],
+        file_offset: int,
+        validation_stream: TickFileValidationStream,
+        partial_path: Path
+    ) -> Dict[str, Any]:
+        """
+        Convert tick chunks and append each as a row group to a temporary Parquet file.
+
+        Args:
+            tick_chunks: Raw tick dicts, chunked, in file order
+            file_offset: UTC offset hours for this broker_type
+            validation_stream: Validator fed with every converted chunk
+            partial_path: Temporary output file
+
+        Returns:
+            Dict with rows, chunks, first/last and min/max timestamp (UTC),
+            first/last time_msc
+        """
+        stats: Dict[str, Any] = {
+            'rows': 0, 'chunks': 0,
+            'first_timestamp': None, 'last_timestamp': None,
+            'min_timestamp': None, 'max_timestamp': None,
+            'first_time_msc': None, 'last_time_msc': None,
+        }
+        writer = None
+        try:
+            for ticks in tick_chunks:
+                df = self._prepare_tick_chunk(ticks, file_offset)
+                validation_stream.add_chunk(df)
+
+                stats['rows'] += len(df)
+                stats['chunks'] += 1
+                if 'timestamp' in df.columns and not df.empty:
+                    if stats['first_timestamp'] is None:
+                        stats['first_timestamp'] = df['timestamp'].iloc[0]
+                    stats['last_timestamp'] = df['timestamp'].iloc[-1]
+                    chunk_min, chunk_max = df['timestamp'].min(), df['timestamp'].max()
+                    stats['min_timestamp'] = chunk_min if stats['min_timestamp'] is None \
+                        else min(stats['min_timestamp'], chunk_min)
+                    stats['max_timestamp'] = chunk_max if stats['max_timestamp'] is None \
+                        else max(stats['max_timestamp'], chunk_max)
+                if 'time_msc' in df.columns and not df.empty:
+                    if stats['first_time_msc'] is None:
+                        stats['first_time_msc'] = int(df['time_msc'].iloc[0])
+                    stats['last_time_msc'] = int(df['time_msc'].iloc[-1])
+
+                # Drop columns not in ImportTickSchema (e.g. legacy server_time)
+                extra_cols = [
+                    c for c in df.columns if c not in self._PARQUET_COLUMNS]
+                if extra_cols:
+                    df = df.drop(columns=extra_cols)
+
+                if writer is None:
+                    table = pa.Table.from_pandas(df, preserve_index=False)
+                    writer = pq.ParquetWriter(
+                        partial_path, table.schema, compression="snappy")
+                else:
+                    table = pa.Table.from_pandas(
+                        df, schema=writer.schema, preserve_index=False)
+                writer.write_table(table)
+                del df, table
+        except Exception:
+            if writer is not None:
+                writer.close()
+                writer = None
+            partial_path.unlink(missing_ok=True)
+            raise
+        finally:
+            if writer is not None:
+                writer.close()
+
+        return stats
+
+    def _prepare_tick_chunk(self, ticks: List[Dict[str, Any]], file_offset: int) -> pd.DataFrame:
+        """
+        Build the optimized, UTC-converted DataFrame for one chunk of raw ticks.
+
+        Args:
+            ticks: Raw tick dicts from the JSON
+            file_offset: UTC offset hours (0 = no conversion)
+
+        Returns:
+            DataFrame in file order (no sort — collected_msc monotonicity depends on it)
+        """
+        df = pd.DataFrame(ticks)
+
+        # Ensure collected_msc column exists (missing in pre-V1.3.0 data)
+        if 'collected_msc' not in df.columns:
+            df['collected_msc'] = 0
+
+        df = self._optimize_datatypes(df)
+
+        # Parse timestamps as timezone-naive
+        if "timestamp" in df.columns:
+            df["timestamp"] = pd.to_datetime(df["timestamp"])
+
+        if file_offset != 0:
+            df = self._apply_time_offset(df, file_offset)
+            df = self._recalculate_sessions(df)
+
+        # Preserve JSON array order (= authentic arrival order)
+        return df.reset_index(drop=True)
+
+    def _finalize_parquet(
+        self,
+        partial_path: Path,
+        parquet_path: Path,
+        parquet_metadata: Dict[str, str]
+    ) -> None:
+        """
+        Copy the temporary row groups into the final file with the complete header metadata.
+
+        The header (tick_count etc.) is only known once the stream is through, and Parquet
+        schema metadata is fixed when a writer opens — so the final file is written after the
+        fact, one row group at a time (bounded memory).
+
+        Args:
+            partial_path: Temporary Parquet written chunk by chunk
+            parquet_path: Final output path
+            parquet_metadata: Complete header metadata
+        """
+        source = pq.ParquetFile(partial_path)
+        try:
+            schema = source.schema_arrow.with_metadata(parquet_metadata)
+            with pq.ParquetWriter(parquet_path, schema, compression="snappy") as writer:
+                for row_group in range(source.num_row_groups):
+                    writer.write_table(
+                        source.read_row_group(row_group).replace_schema_metadata(parquet_metadata))
+        finally:
+            source.close()
+        partial_path.unlink()
+
+    def _log_broker_metadata(self, metadata: Dict[str, Any]) -> None:
+        """
+        Display the broker metadata of an export.
+
+        Args:
+            metadata: JSON metadata section
+        """
+        self._log('info', f"📊 Broker Metadata:")
+
+        # Get data version to show in "not available" messages
+        data_version = metadata.get('data_format_version', 'unknown')
+
+        # Detected Offset (available since v1.0.5)
+        detected_offset = metadata.get('broker_utc_offset_hours', None)
+        if detected_offset is not None:
+            sign = '+' if detected_offset >= 0 else ''
+            self._log('info', f"   Detected Offset: GMT{sign}{detected_offset}")
+        else:
+            self._log('info', f"   Detected Offset: Not available (pre v1.0.5 data, version: {data_version})")
+
+        # Local Device Time (planned for v1.0.5+, but not yet implemented in MQL5)
+        local_device = metadata.get('local_device_time', None)
+        if local_device:
+            self._log('info', f"   Local Device:    {local_device}")
+        else:
+            self._log('info', f"   Local Device:    Not available (pre v1.0.5 data)")
+
+        # Broker Time (planned for v1.0.5+, but not yet implemented in MQL5)
+        broker_time = metadata.get('broker_server_time', None)
+        if broker_time:
+            self._log('info', f"   Broker Time:     {broker_time}")
+        else:
+            self._log('info', f"   Broker Time:     Not available (pre v1.0.5 data)")
+
+    def _record_touched_range(
+        self,
+        broker_type: str,
+        symbol: str,
+        range_start: pd.Timestamp,
+        range_end: pd.Timestamp
+    ) -> None:
+        """
+        Remember a tick time range changed by this import (input for incremental bars).
+
+        Args:
+            broker_type: Normalized broker type
+            symbol: Trading symbol
+            range_start: First tick timestamp (UTC)
+            range_end: Last tick timestamp (UTC)
+        """
+        self._touched_ranges.setdefault((broker_type, symbol), []).append(
+            (pd.Timestamp(range_start), pd.Timestamp(range_end)))
+
     def _apply_time_offset(self, df: pd.DataFrame, offset_hours: int) -> pd.DataFrame:
         """
         Applies time offset to timestamps for UTC conversion.
@@ -485,10 +982,6 @@ class TickDataImporter:
         if "timestamp" not in df.columns:
             return df
 
-        # Store original for logging
-        original_first = df["timestamp"].iloc[0]
-        original_last = df["timestamp"].iloc[-1]
-
         # Apply offset (e.g. offset=-3 → subtract 3h from timestamp)
         offset_timedelta = pd.Timedelta(hours=offset_hours)
         df["timestamp"] = df["timestamp"] + offset_timedelta
@@ -498,14 +991,28 @@ class TickDataImporter:
             offset_ms = offset_hours * 3_600_000
             df["time_msc"] = df["time_msc"] + offset_ms
 
-        utc_first = df["timestamp"].iloc[0]
-        utc_last = df["timestamp"].iloc[-1]
+        return df
 
-        vLog.info(f"   🕐 Time Offset Applied: {offset_hours:+d} hours")
-        vLog.info(f"      Original: {original_first} → {original_last}")
-        vLog.info(f"      UTC:      {utc_first} → {utc_last}")
+    def _log_time_offset(
+        self,
+        offset_hours: int,
+        utc_first: Optional[pd.Timestamp],
+        utc_last: Optional[pd.Timestamp]
+    ) -> None:
+        """
+        Log the applied offset with the file's first/last tick before and after conversion.
 
-        return df
+        Args:
+            offset_hours: Applied offset
+            utc_first: First tick timestamp after conversion
+            utc_last: Last tick timestamp after conversion
+        """
+        self._log('info', f"   🕐 Time Offset Applied: {offset_hours:+d} hours")
+        if utc_first is None:
+            return
+        offset_timedelta = pd.Timedelta(hours=offset_hours)
+        self._log('info', f"      Original: {utc_first - offset_timedelta} → {utc_last - offset_timedelta}")
+        self._log('info', f"      UTC:      {utc_first} → {utc_last}")
 
     def _recalculate_sessions(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -523,85 +1030,78 @@ class TickDataImporter:
             )
         return df
 
+    def _fingerprint_table(self) -> TickFingerprintTable:
+        """Source/content fingerprints of the target archive (loaded once per importer)."""
+        if self._fingerprints is None:
+            self._fingerprints = TickFingerprintTable(str(self.target_dir))
+            self._fingerprints.load()
+        return self._fingerprints
+
     def _check_for_existing_duplicate(
         self,
         source_json_name: str,
         broker_type: str,
         symbol: str,
-        new_df: pd.DataFrame,
-        target_path: Path
+        content_hash: Optional[str] = None
     ) -> Optional[DuplicateReport]:
         """
         Check if Parquet file already exists with same source.
 
+        One lookup in the fingerprint table: same source JSON name, or same
+        content (first/last time_msc + tick count) under another name. Matches
+        span all broker types of the symbol (cross-collector).
+
         Args:
             source_json_name: Name of source JSON file
             broker_type: Broker type identifier
             symbol: Trading symbol
-            new_df: DataFrame being imported
-            target_path: Target parquet path
+            content_hash: Content hash of the new file (None = name only)
 
         Returns:
             DuplicateReport if duplicate found, None otherwise
         """
-
-        # OPTION 2: Cross-Collector Search (wie in Doku)
-        search_pattern = f"*/ticks/{symbol}/{symbol}_*.parquet"
-        existing_files = list(self.target_dir.glob(search_pattern))
-
-        if not existing_files:
+        fingerprints = self._fingerprint_table()
+        matches = fingerprints.find(symbol, source_json_name, content_hash)
+        if not matches:
             return None
 
-        for existing_file in existing_files:
-            try:
-                parquet_file = pq.ParquetFile(existing_file)
-                metadata_raw = parquet_file.metadata.metadata
-
-                existing_metadata = {
-                    key.decode('utf-8') if isinstance(key, bytes) else key:
-                    value.decode('utf-8') if isinstance(value,
-                                                        bytes) else value
-                    for key, value in metadata_raw.items()
-                }
-
-                existing_source = existing_metadata.get('source_file', '')
-                # legacy compability : data_collector
-                existing_broker = existing_metadata.get(
-                    'broker_type') or existing_metadata.get('data_collector', 'unknown')
-
-                if existing_source == source_json_name:
-                    relative_path = existing_file.relative_to(self.target_dir)
-                    collector_path = relative_path.parts[0] if len(
-                        relative_path.parts) > 0 else "unknown"
-
-                    vLog.warning(
-                        f"⚠️  Found existing Parquet: {collector_path}/{symbol}/{existing_file.name}"
-                    )
-                    vLog.warning(
-                        f"    Existing: broker_type='{existing_broker}' | "
-                        f"Importing: broker_type='{broker_type}'"
-                    )
-
-                    existing_df = pd.read_parquet(existing_file)
-
-                    return DuplicateReport(
-                        source_file=source_json_name,
-                        duplicate_files=[existing_file],
-                        tick_counts=[len(existing_df)],
-                        time_ranges=[
-                            (existing_df['timestamp'].min(),
-                             existing_df['timestamp'].max())
-                        ],
-                        file_sizes_mb=[
-                            existing_file.stat().st_size / (1024 * 1024)],
-                        metadata=[existing_metadata]
-                    )
-
-            except Exception as e:
-                vLog.warning(
-                    f"Could not read metadata from {existing_file.name}: {e}")
+        duplicate_files = []
+        metadata = []
+        for row in matches:
+            existing_file = fingerprints.resolve(row)
+            vLog.warning(
+                f"⚠️  Found existing Parquet: {row['broker_type']}/{symbol}/{existing_file.name}"
+            )
+            vLog.warning(
+                f"    Existing: broker_type='{row['broker_type']}' "
+                f"(source '{row['source_file']}') | "
+                f"Importing: broker_type='{broker_type}'"
+            )
+            duplicate_files.append(existing_file)
+            metadata.append(self._read_parquet_header(existing_file))
+
+        return DuplicateReport(
+            source_file=source_json_name,
+            duplicate_files=duplicate_files,
+            tick_counts=[row['tick_count'] for row in matches],
+            time_ranges=[(row['start_time'], row['end_time']) for row in matches],
+            file_sizes_mb=[f.stat().st_size / (1024 * 1024) for f in duplicate_files],
+            metadata=metadata
+        )
 
-        return None
+    @staticmethod
+    def _read_parquet_header(parquet_file: Path) -> Dict[str, str]:
+        """Header metadata of one Parquet file (for the duplicate report)."""
+        try:
+            metadata_raw = pq.ParquetFile(parquet_file).metadata.metadata or {}
+        except Exception as e:
+            vLog.warning(f"Could not read metadata from {parquet_file.name}: {e}")
+            return {}
+        return {
+            key.decode('utf-8') if isinstance(key, bytes) else key:
+            value.decode('utf-8') if isinstance(value, bytes) else value
+            for key, value in metadata_raw.items()
+        }
 
     def _optimize_datatypes(self, df: pd.DataFrame) -> pd.DataFrame:
         """Optimizes DataFrame datatypes for performance."""
@@ -656,7 +1156,9 @@ class TickDataImporter:
     def _trigger_bar_rendering(self):
         """
         Trigger automatic bar rendering after tick import.
-        Renders bars for all broker_types that were processed.
+
+        Incremental (default): splices only the time ranges touched by this import into the
+        existing bar files. Full: clean re-render of every symbol of the processed broker_types.
         """
         vLog.info("\n" + "=" * 80)
         vLog.info("🔄 AUTO-TRIGGERING BAR RENDERING")
@@ -665,10 +1167,13 @@ class TickDataImporter:
         try:
             bar_importer = BarImporter(data_dir=str(self.target_dir))
 
-            bar_importer.render_bars_for_all_symbols(
-                broker_types=list(self._processed_broker_types),
-                clean_mode=True
-            )
+            if self._incremental_bar_rendering and self._touched_ranges:
+                bar_importer.render_bars_for_ranges(self._touched_ranges)
+            else:
+                bar_importer.render_bars_for_all_symbols(
+                    broker_types=list(self._processed_broker_types),
+                    clean_mode=True
+                )
             bar_importer.update_bar_index()
 
             vLog.info("✅ Bar rendering completed!")
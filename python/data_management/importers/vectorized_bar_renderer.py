@@ -148,7 +148,8 @@ class VectorizedBarRenderer:
         df = df.set_index('timestamp')
 
         # === 4. SORT ===
-        df = df.sort_index()
+        # Stable: ticks sharing a timestamp keep arrival order (deterministic open/close)
+        df = df.sort_index(kind='stable')
 
         return df
 
@@ -0,0 +1,278 @@
+"""
+AbstractFileIndexManager - Incremental maintenance shared by the file index managers.
+
+TickIndexManager, BarsIndexManager and SignalIndexManager all index one entry set per
+data file. Every entry records the (path, size, mtime) of the file it was scanned from,
+so the index can be brought up to date without a full rescan:
+
+- refresh_index(): stat the tree, rescan only new or changed files, drop deleted ones
+- update_entries(paths): re-index exactly the files an importer wrote or deleted
+
+Entries without a fingerprint (index written before the fields existed) count as
+changed — the first refresh rescans them once.
+
+Time-range lookups go through a FileIntervalIndex per entry list, built on first use
+and rebuilt only after the list changed.
+"""
+
+import os
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from python.data_management.index.file_interval_index import FileIntervalIndex
+from python.framework.logging.abstract_logger import AbstractLogger
+
+
+class AbstractFileIndexManager(ABC):
+    """
+    Base for file index managers with (path, size, mtime) fingerprinted entries.
+
+    Subclasses provide the data file listing, the per-file scan and the storage
+    layout of their nested index dict.
+    """
+
+    # Human-readable index name for log lines (e.g. "Tick index")
+    INDEX_LABEL = "Index"
+
+    logger: AbstractLogger
+    index_file: Path
+
+    def __init__(self):
+        # (key, symbol) → sorted start/end arrays of that entry list
+        self._interval_indexes: Dict[Tuple[str, str], FileIntervalIndex] = {}
+
+    # =========================================================================
+    # SUBCLASS HOOKS
+    # =========================================================================
+
+    @abstractmethod
+    def build_index(self, force_rebuild: bool = False, check_stale: bool = True) -> None:
+        """Build, load or refresh the index."""
+
+    @abstractmethod
+    def _data_files(self) -> List[Path]:
+        """All data files this index covers."""
+
+    @abstractmethod
+    def _iter_entries(self) -> Iterator[Dict]:
+        """Every entry of the in-memory index."""
+
+    @abstractmethod
+    def _add_file(self, path: Path) -> None:
+        """Scan one data file and insert its entries."""
+
+    @abstractmethod
+    def _remove_paths(self, paths: Set[str]) -> None:
+        """Drop all entries of the given absolute paths (and emptied keys)."""
+
+    @abstractmethod
+    def _load_index(self) -> None:
+        """Load the persisted index into memory."""
+
+    @abstractmethod
+    def _save_index(self) -> None:
+        """Persist the in-memory index (flat table, fingerprint columns included)."""
+
+    def _sort_entries(self) -> None:
+        """Restore entry order after changes (default: unordered storage)."""
+
+    # =========================================================================
+    # TIME-RANGE LOOKUP
+    # =========================================================================
+
+    def _interval_index(self, key: str, symbol: str, entries: List[Dict]) -> FileIntervalIndex:
+        """
+        Interval index over one entry list — built once, reused until the list changes.
+
+        Args:
+            key: First index level (broker_type / data_sentiment_type)
+            symbol: Trading symbol
+            entries: Current entry list of (key, symbol)
+
+        Returns:
+            FileIntervalIndex valid for entries
+        """
+        cached = self._interval_indexes.get((key, symbol))
+        if cached is None or not cached.is_current(entries):
+            cached = FileIntervalIndex(entries)
+            self._interval_indexes[(key, symbol)] = cached
+        return cached
+
+    # =========================================================================
+    # INCREMENTAL MAINTENANCE
+    # =========================================================================
+
+    @staticmethod
+    def _file_state(path: Path) -> Dict[str, int]:
+        """
+        Fingerprint fields recorded in every entry.
+
+        Args:
+            path: Data file
+
+        Returns:
+            Dict with file_size_bytes and file_mtime_ns
+        """
+        stat = path.stat()
+        return {'file_size_bytes': stat.st_size, 'file_mtime_ns': stat.st_mtime_ns}
+
+    @staticmethod
+    def _row_file_state(row: pd.Series) -> Dict[str, Optional[int]]:
+        """
+        Fingerprint fields of a persisted index row.
+
+        Tolerant: rows written before the fields existed read as None and are
+        rescanned on the next refresh.
+
+        Args:
+            row: Row of the flat index table
+
+        Returns:
+            Dict with file_size_bytes and file_mtime_ns (None if missing)
+        """
+        state: Dict[str, Optional[int]] = {}
+        for field in ('file_size_bytes', 'file_mtime_ns'):
+            value = row.get(field)
+            state[field] = int(value) if value is not None and pd.notna(value) else None
+        return state
+
+    @staticmethod
+    def _with_file_state_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Store fingerprint columns as nullable int64.
+
+        A single missing value would otherwise turn the column into float64,
+        which cannot hold nanosecond mtimes exactly.
+
+        Args:
+            df: Flat index table before conversion to Arrow
+
+        Returns:
+            DataFrame with file_size_bytes / file_mtime_ns as Int64
+        """
+        for field in ('file_size_bytes', 'file_mtime_ns'):
+            if field in df.columns:
+                df[field] = df[field].astype('Int64')
+        return df
+
+    def refresh_index(self) -> bool:
+        """
+        Bring the loaded index up to date with the file tree.
+
+        Stats every data file; only new or changed files are scanned, entries of
+        deleted files are dropped. Saves only when something changed.
+
+        Returns:
+            True if the index changed
+        """
+        changed, removed = self._diff_file_tree()
+        if not changed and not removed:
+            return False
+
+        self._apply_file_changes(changed, removed)
+        self._save_index()
+        self.logger.info(
+            f"🔄 {self.INDEX_LABEL} refreshed: {len(changed)} files rescanned, "
+            f"{len(removed)} removed")
+        return True
+
+    def update_entries(self, paths: Iterable[Path]) -> None:
+        """
+        Re-index exactly the given files — for importers that know what they touched.
+
+        Existing files are (re)scanned, missing files are dropped from the index.
+        Without a persisted index, falls back to a full build.
+
+        Args:
+            paths: Data files written or deleted by the caller
+        """
+        if not self.index_file.exists():
+            self.build_index(force_rebuild=True)
+            return
+
+        self._load_index()
+        paths = [Path(p) for p in paths]
+        existing = [p for p in paths if p.exists()]
+        removed = {str(p.absolute()) for p in paths if not p.exists()}
+        self._apply_file_changes(existing, removed)
+        self._save_index()
+        self.logger.info(
+            f"🔄 {self.INDEX_LABEL} updated: {len(existing)} files rescanned, "
+            f"{len(removed)} removed")
+
+    def needs_rebuild(self) -> bool:
+        """
+        Check whether the in-memory index differs from the file tree (stat only).
+
+        Returns:
+            True if files were added, changed or deleted since the last scan
+        """
+        if not self.index_file.exists():
+            return True
+
+        changed, removed = self._diff_file_tree()
+        if changed or removed:
+            self.logger.info(
+                f"📋 {self.INDEX_LABEL} outdated - {len(changed)} new/changed, "
+                f"{len(removed)} deleted files")
+            return True
+        return False
+
+    def _diff_file_tree(self) -> Tuple[List[Path], Set[str]]:
+        """
+        Compare the recorded fingerprints against the file tree.
+
+        Returns:
+            (new or changed files, absolute paths of deleted files)
+        """
+        indexed: Dict[str, Tuple[Optional[int], Optional[int]]] = {
+            entry['path']: (entry.get('file_size_bytes'), entry.get('file_mtime_ns'))
+            for entry in self._iter_entries()
+        }
+
+        changed: List[Path] = []
+        seen: Set[str] = set()
+        for data_file in self._data_files():
+            key = str(data_file.absolute())
+            seen.add(key)
+            stat = data_file.stat()
+            if indexed.get(key) != (stat.st_size, stat.st_mtime_ns):
+                changed.append(data_file)
+
+        return changed, set(indexed) - seen
+
+    def _apply_file_changes(self, changed: List[Path], removed: Set[str]) -> None:
+        """
+        Drop stale entries, scan changed files, restore order.
+
+        Args:
+            changed: Files to (re)scan
+            removed: Absolute paths whose entries are dropped
+        """
+        self._remove_paths(removed | {str(p.absolute()) for p in changed})
+        for data_file in changed:
+            try:
+                self._add_file(data_file)
+            except Exception as e:
+                self.logger.warning(f"Failed to index {data_file.name}: {e}")
+        self._sort_entries()
+
+    def _write_index_table(self, table: pa.Table) -> None:
+        """
+        Write the index table atomically (temp file + rename).
+
+        Parallel workers may refresh the same index — readers never see a
+        half-written file.
+
+        Args:
+            table: Flat index table with schema metadata
+        """
+        tmp_file = self.index_file.with_name(
+            f"{self.index_file.name}.{os.getpid()}.tmp")
+        pq.write_table(table, tmp_file)
+        os.replace(tmp_file, self.index_file)
@@ -12,36 +12,46 @@ import json
 import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Set
 
 import pandas as pd
 import pyarrow as pa
 import pyarrow.parquet as pq
 
 from python.configuration.app_config_manager import AppConfigManager
+from python.data_management.index.abstract_file_index_manager import AbstractFileIndexManager
 from python.framework.logging.abstract_logger import AbstractLogger
 from python.framework.logging.bootstrap_logger import get_global_logger
 vLog = get_global_logger()
 
 
-class BarsIndexManager:
+class BarsIndexManager(AbstractFileIndexManager):
     """
     Manages index for pre-rendered bar parquet files.
 
     Storage: Parquet (flat table)
     Memory: Nested dict {broker_type: {symbol: {timeframe: entry}}}
 
+    Entries carry (path, size, mtime) — loading refreshes incrementally.
     Migration: Auto-converts legacy JSON index on first load.
     """
 
+    INDEX_LABEL = "Bar index"
+
     # Index file names
     INDEX_FILE_PARQUET = ".parquet_bars_index.parquet"
     INDEX_FILE_JSON_LEGACY = ".parquet_bars_index.json"
 
-    def __init__(self, logger: AbstractLogger = vLog):
-        """Initialize bar index manager."""
+    def __init__(self, logger: AbstractLogger = vLog, data_dir: Optional[str] = None):
+        """
+        Args:
+            logger: Logger instance
+            data_dir: Override data directory (default: from AppConfigManager)
+        """
+        super().__init__()
         self._app_config = AppConfigManager()
-        self.data_dir = Path(self._app_config.get_data_processed_path())
+        self.data_dir = Path(data_dir) if data_dir else Path(
+            self._app_config.get_data_processed_path())
 
         # Parquet index file
         self.index_file = self.data_dir / self.INDEX_FILE_PARQUET
@@ -56,28 +66,24 @@ class BarsIndexManager:
     # INDEX BUILDING
     # =========================================================================
 
-    def build_index(self, force_rebuild: bool = False, check_stale: bool = False) -> None:
+    def build_index(self, force_rebuild: bool = False, check_stale: bool = True) -> None:
         """
-        Build or load index from bar parquet files.
+        Build, load or refresh index from bar parquet files.
 
         Args:
             force_rebuild: Force complete rebuild, ignore existing index
-            check_stale: Check if index is outdated (expensive filesystem scan)
-                        Default False - assumes index is current
+            check_stale: Refresh the loaded index against the file tree — stats
+                        every file, rescans only new or changed ones (cheap).
+                        False loads the saved index as-is.
         """
-        # Fast path: Load existing index without checking staleness
+        # Fast path: Load existing index, refresh incrementally
         if not force_rebuild and self.index_file.exists():
-            if not check_stale:
-                self._load_index()
-                self.logger.info(
-                    f"📚 Loaded existing bar index ({self._count_symbols()} symbols)")
-                return
-
-            if not self.needs_rebuild():
-                self._load_index()
-                self.logger.info(
-                    f"📚 Loaded existing bar index ({self._count_symbols()} symbols)")
-                return
+            self._load_index()
+            if check_stale:
+                self.refresh_index()
+            self.logger.info(
+                f"📚 Loaded existing bar index ({self._count_symbols()} symbols)")
+            return
 
         # Check for legacy JSON and migrate
         if not force_rebuild and self._legacy_json_file.exists() and not self.index_file.exists():
@@ -89,33 +95,15 @@ class BarsIndexManager:
         self.logger.info("🔍 Scanning bar files for index...")
         start_time = time.time()
 
-        # Scan pattern: */bars/**/*.parquet
-        bar_files = list(self.data_dir.glob("*/bars/**/*_BARS.parquet"))
+        bar_files = self._data_files()
 
         if not bar_files:
             self.logger.warning(f"No bar files found in {self.data_dir}")
             self.index = {}
             return
 
-        # Process each file
-        for bar_file in bar_files:
-            try:
-                entry = self._scan_bar_file(bar_file)
-                broker_type = entry['broker_type']
-                symbol = entry['symbol']
-                timeframe = entry['timeframe']
-
-                if broker_type not in self.index:
-                    self.index[broker_type] = {}
-
-                if symbol not in self.index[broker_type]:
-                    self.index[broker_type][symbol] = {}
-
-                self.index[broker_type][symbol][timeframe] = entry
-
-            except Exception as e:
-                self.logger.warning(
-                    f"Failed to index bar file {bar_file.name}: {e}")
+        self.index = {}
+        self._apply_file_changes(bar_files, set())
 
         self._save_index()
 
@@ -130,6 +118,37 @@ class BarsIndexManager:
             f"{self._count_symbols()} symbols in {elapsed:.2f}s"
         )
 
+    def _data_files(self) -> List[Path]:
+        """Bar parquet files (pattern: */bars/**/*_BARS.parquet)."""
+        return list(self.data_dir.glob("*/bars/**/*_BARS.parquet"))
+
+    def _iter_entries(self) -> Iterator[Dict]:
+        """All entries across broker types, symbols and timeframes."""
+        for symbols in self.index.values():
+            for timeframes in symbols.values():
+                yield from timeframes.values()
+
+    def _add_file(self, path: Path) -> None:
+        """Scan one bar file and set its timeframe entry."""
+        entry = self._scan_bar_file(path)
+        self.index.setdefault(entry['broker_type'], {}).setdefault(
+            entry['symbol'], {})[entry['timeframe']] = entry
+
+    def _remove_paths(self, paths: Set[str]) -> None:
+        """Drop entries of the given paths, and symbols / broker types left empty."""
+        if not paths:
+            return
+        for broker_type in list(self.index):
+            symbols = self.index[broker_type]
+            for symbol in list(symbols):
+                timeframes = symbols[symbol]
+                for timeframe in [tf for tf, e in timeframes.items() if e['path'] in paths]:
+                    del timeframes[timeframe]
+                if not timeframes:
+                    del symbols[symbol]
+            if not symbols:
+                del self.index[broker_type]
+
     def _count_symbols(self) -> int:
         """Count total unique symbols across all broker types."""
         symbols = set()
@@ -214,26 +233,9 @@ class BarsIndexManager:
             'broker_type': metadata.get('broker_type') or metadata.get('data_collector', 'mt5'),
             'total_trade_volume': round(total_trade_volume, 6) if total_trade_volume is not None else None,
             'avg_volume_per_bar': round(avg_volume_per_bar, 6) if avg_volume_per_bar is not None else None,
+            **self._file_state(bar_file),
         }
 
-    def needs_rebuild(self) -> bool:
-        """Check if index needs rebuilding."""
-        if not self.index_file.exists():
-            return True
-
-        index_mtime = self.index_file.stat().st_mtime
-
-        bar_files = list(self.data_dir.glob("*/bars/**/*_BARS.parquet"))
-        if bar_files:
-            newest_bar = max(f.stat().st_mtime for f in bar_files)
-
-            if newest_bar > index_mtime:
-                self.logger.info(
-                    "📋 Bar index outdated - newer bar files found")
-                return True
-
-        return False
-
     # =========================================================================
     # FILE SELECTION
     # =========================================================================
@@ -308,6 +310,8 @@ class BarsIndexManager:
                         'source_version_max': entry.get('source_version_max', ''),
                         'total_trade_volume': entry.get('total_trade_volume'),
                         'avg_volume_per_bar': entry.get('avg_volume_per_bar'),
+                        'file_size_bytes': entry.get('file_size_bytes'),
+                        'file_mtime_ns': entry.get('file_mtime_ns'),
                     }
                     rows.append(row)
 
@@ -318,7 +322,8 @@ class BarsIndexManager:
                 'num_row_groups', 'rendered_at', 'total_tick_count',
                 'avg_ticks_per_bar', 'min_ticks_per_bar', 'max_ticks_per_bar',
                 'real_bar_count', 'source_version_min',
-                'source_version_max', 'total_trade_volume', 'avg_volume_per_bar'
+                'source_version_max', 'total_trade_volume', 'avg_volume_per_bar',
+                'file_size_bytes', 'file_mtime_ns'
             ])
         else:
             df = pd.DataFrame(rows)
@@ -327,14 +332,16 @@ class BarsIndexManager:
         metadata = {
             b'created_at': datetime.now(timezone.utc).isoformat().encode(),
             b'data_dir': str(self.data_dir).encode(),
-            b'index_version': b'2.0'
+            b'index_version': b'2.1'
         }
 
+        df = self._with_file_state_dtypes(df)
+
         table = pa.Table.from_pandas(df)
         table = table.replace_schema_metadata(
             {**table.schema.metadata, **metadata})
 
-        pq.write_table(table, self.index_file)
+        self._write_index_table(table)
         self.logger.debug(f"💾 Bar index saved to {self.index_file}")
 
     def _load_index(self) -> None:
@@ -382,6 +389,7 @@ class BarsIndexManager:
                 'broker_type': broker_type,
                 'total_trade_volume': float(row['total_trade_volume']) if pd.notna(row.get('total_trade_volume')) else None,
                 'avg_volume_per_bar': float(row['avg_volume_per_bar']) if pd.notna(row.get('avg_volume_per_bar')) else None,
+                **self._row_file_state(row),
             }
 
             result[broker_type][symbol][timeframe] = entry
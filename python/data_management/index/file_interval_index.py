@@ -0,0 +1,131 @@
+"""
+FileIntervalIndex - Binary-search overlap queries over the time ranges of indexed files.
+
+Built once per (key, symbol) entry list of a file index manager: the entries' start/end
+times are parsed a single time into sorted int64 (ns, UTC) arrays. An overlap query is two
+searchsorted calls plus a mask over the candidate slice — no per-entry timestamp parsing,
+no walk over files outside the range.
+"""
+
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class FileIntervalIndex:
+    """
+    Sorted start/end arrays over one list of index entries.
+
+    Entries may overlap (e.g. re-imports of a partial day): the prefix maximum of the
+    end times bounds the candidate range from below, a mask removes the remainder.
+    """
+
+    def __init__(self, entries: List[Dict]):
+        """
+        Args:
+            entries: Index entries carrying ISO 'start_time' / 'end_time'
+        """
+        self._source = entries
+        self._source_len = len(entries)
+
+        starts = self._to_ns([e.get('start_time') for e in entries])
+        ends = self._to_ns([e.get('end_time') for e in entries])
+
+        # Stable: ties keep the entry order of the manager
+        order = np.argsort(starts, kind='stable')
+        self._entries: List[Dict] = [entries[i] for i in order]
+        self._starts = starts[order]
+        self._ends = ends[order]
+        self._max_ends = np.maximum.accumulate(self._ends) if len(
+            self._ends) else self._ends
+
+    def is_current(self, entries: List[Dict]) -> bool:
+        """
+        Check whether this index was built from the given (unmodified) list.
+
+        The managers replace or resize an entry list on every change.
+
+        Args:
+            entries: Current entry list of the manager
+
+        Returns:
+            True if the cached arrays are still valid
+        """
+        return entries is self._source and len(entries) == self._source_len
+
+    def overlapping(self, start_date: datetime, end_date: datetime) -> List[Dict]:
+        """
+        Entries whose [start, end] overlaps [start_date, end_date], chronologically.
+
+        Args:
+            start_date: Range start (UTC; naive is read as UTC)
+            end_date: Range end (UTC; naive is read as UTC)
+
+        Returns:
+            Overlapping entries sorted by start time
+        """
+        lo, _, mask = self._candidates(start_date, end_date)
+        return [self._entries[lo + i] for i in np.flatnonzero(mask)]
+
+    def overlapping_with_predecessor(
+        self,
+        start_date: datetime,
+        end_date: datetime
+    ) -> List[Dict]:
+        """
+        Overlapping entries, preceded by the last entry ending before start_date
+        when no overlapping entry already begins at or before start_date.
+
+        For as-of lookups: the state at start_date lives in the predecessor
+        unless a file covering start_date exists.
+
+        Args:
+            start_date: Range start (UTC; naive is read as UTC)
+            end_date: Range end (UTC; naive is read as UTC)
+
+        Returns:
+            Entries sorted by start time
+        """
+        lo, _, mask = self._candidates(start_date, end_date)
+        hits = lo + np.flatnonzero(mask)
+        overlapping = [self._entries[i] for i in hits]
+
+        if len(hits) and self._starts[hits[0]] <= self._moment_ns(start_date):
+            return overlapping
+
+        # Everything before lo ends before start_date; inside [lo, hi) the
+        # non-overlapping entries do as well.
+        misses = np.flatnonzero(~mask)
+        preceding_idx = lo + int(misses[-1]) if len(misses) else lo - 1
+        if preceding_idx < 0:
+            return overlapping
+        return [self._entries[preceding_idx]] + overlapping
+
+    def _candidates(self, start_date: datetime, end_date: datetime) -> Tuple[int, int, np.ndarray]:
+        """Slice [lo, hi) that may overlap, and the overlap mask over it."""
+        start_ns = self._moment_ns(start_date)
+        end_ns = self._moment_ns(end_date)
+
+        hi = int(np.searchsorted(self._starts, end_ns, side='right'))
+        lo = int(np.searchsorted(self._max_ends[:hi], start_ns, side='left'))
+        mask = self._ends[lo:hi] >= start_ns
+        return lo, hi, mask
+
+    @staticmethod
+    def _to_ns(values: List) -> np.ndarray:
+        """Parse ISO strings into UTC int64 ns (missing → int64 min, never overlapping)."""
+        if not values:
+            return np.empty(0, dtype=np.int64)
+        parsed = pd.to_datetime(pd.Series(values, dtype=object), utc=True, format='ISO8601')
+        # NaT reads as int64 min
+        return np.asarray(parsed.dt.as_unit('ns').array.asi8, dtype=np.int64)
+
+    @staticmethod
+    def _moment_ns(moment: datetime) -> int:
+        """A query bound as UTC int64 ns."""
+        ts = pd.Timestamp(moment)
+        if ts.tzinfo is None:
+            ts = ts.tz_localize('UTC')
+        return int(ts.value)
@@ -12,13 +12,14 @@ Storage: Parquet (flat table). Memory: {data_sentiment_type: {symbol: [entries]}
 import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Set
 
 import pandas as pd
 import pyarrow as pa
 import pyarrow.parquet as pq
 
 from python.configuration.app_config_manager import AppConfigManager
+from python.data_management.index.abstract_file_index_manager import AbstractFileIndexManager
 from python.framework.logging.abstract_logger import AbstractLogger
 from python.framework.logging.bootstrap_logger import get_global_logger
 from python.framework.types.signal_data_types import (
@@ -27,14 +28,17 @@ from python.framework.types.signal_data_types import (
 vLog = get_global_logger()
 
 
-class SignalIndexManager:
+class SignalIndexManager(AbstractFileIndexManager):
     """
     Manages the signal parquet index for fast time-based file selection.
 
     Storage: Parquet (flat table)
     Memory: Nested dict {data_sentiment_type: {symbol: [entries]}}
+    Entries carry (path, size, mtime) — loading refreshes incrementally.
     """
 
+    INDEX_LABEL = "Signal index"
+
     INDEX_FILE_PARQUET = ".signal_index.parquet"
 
     def __init__(self, logger: AbstractLogger = vLog, data_dir: Optional[str] = None):
@@ -43,6 +47,7 @@ class SignalIndexManager:
             logger: Logger instance
             data_dir: Signal parquet root (default: <data_processed>/signals)
         """
+        super().__init__()
         self.logger = logger
         self._app_config = AppConfigManager()
         self.data_dir = Path(data_dir) if data_dir else (
@@ -58,25 +63,22 @@ class SignalIndexManager:
     # INDEX BUILDING
     # =========================================================================
 
-    def build_index(self, force_rebuild: bool = False, check_stale: bool = False) -> None:
+    def build_index(self, force_rebuild: bool = False, check_stale: bool = True) -> None:
         """
-        Build or load the index from the signal parquet files.
+        Build, load or refresh the index from the signal parquet files.
 
         Args:
             force_rebuild: Force complete rebuild, ignore an existing index
-            check_stale: Rebuild only if newer parquet files exist (filesystem scan)
+            check_stale: Refresh the loaded index against the file tree (stat only,
+                        rescans new or changed files). False loads it as-is.
         """
         if not force_rebuild and self.index_file.exists():
-            if not check_stale:
-                self._load_index()
-                self.logger.info(
-                    f"📡 Loaded existing signal index ({len(self.index)} sources)")
-                return
-            if not self.needs_rebuild():
-                self._load_index()
-                self.logger.info(
-                    f"📡 Loaded existing signal index ({len(self.index)} sources)")
-                return
+            self._load_index()
+            if check_stale:
+                self.refresh_index()
+            self.logger.info(
+                f"📡 Loaded existing signal index ({len(self.index)} sources)")
+            return
 
         self.logger.info("🔍 Scanning signal parquet files...")
         start_time = time.time()
@@ -87,24 +89,8 @@ class SignalIndexManager:
             self.index = {}
             return
 
-        for parquet_file in parquet_files:
-            try:
-                base = self._scan_file(parquet_file)
-                sentiment_type = base['data_sentiment_type']
-                symbols = base.pop('symbols')
-
-                for symbol in symbols:
-                    entry = {**base, 'symbol': symbol}
-                    self.index.setdefault(sentiment_type, {}).setdefault(
-                        symbol, []).append(entry)
-            except Exception as e:
-                self.logger.warning(
-                    f"Failed to index {parquet_file.name}: {e}")
-
-        for sentiment_type in self.index:
-            for symbol in self.index[sentiment_type]:
-                self.index[sentiment_type][symbol].sort(
-                    key=lambda x: x['start_time'])
+        self.index = {}
+        self._apply_file_changes(parquet_files, set())
 
         self._save_index()
 
@@ -119,6 +105,48 @@ class SignalIndexManager:
             f"{len(self.index)} sources in {elapsed:.2f}s"
         )
 
+    def _data_files(self) -> List[Path]:
+        """Signal parquet files."""
+        return self._parquet_files()
+
+    def _iter_entries(self) -> Iterator[Dict]:
+        """All entries (a multi-symbol file appears once per symbol)."""
+        for symbols in self.index.values():
+            for entries in symbols.values():
+                yield from entries
+
+    def _add_file(self, path: Path) -> None:
+        """Scan one signal parquet and register it under each real symbol it carries."""
+        base = self._scan_file(path)
+        sentiment_type = base['data_sentiment_type']
+        symbols = base.pop('symbols')
+
+        for symbol in symbols:
+            entry = {**base, 'symbol': symbol}
+            self.index.setdefault(sentiment_type, {}).setdefault(
+                symbol, []).append(entry)
+
+    def _remove_paths(self, paths: Set[str]) -> None:
+        """Drop entries of the given paths, and symbols / sources left empty."""
+        if not paths:
+            return
+        for sentiment_type in list(self.index):
+            symbols = self.index[sentiment_type]
+            for symbol in list(symbols):
+                symbols[symbol] = [
+                    e for e in symbols[symbol] if e['path'] not in paths]
+                if not symbols[symbol]:
+                    del symbols[symbol]
+            if not symbols:
+                del self.index[sentiment_type]
+
+    def _sort_entries(self) -> None:
+        """Sort files chronologically per source/symbol."""
+        for sentiment_type in self.index:
+            for symbol in self.index[sentiment_type]:
+                self.index[sentiment_type][symbol].sort(
+                    key=lambda x: x['start_time'] or '')
+
     def _parquet_files(self) -> List[Path]:
         """Signal parquet files (<pipeline_id>/*.parquet — excludes the index file at root)."""
         return sorted(self.data_dir.glob("*/*.parquet"))
@@ -158,23 +186,9 @@ class SignalIndexManager:
             'end_time': end_time.isoformat(),
             'row_count': int(len(df)),
             'file_size_mb': file_size_mb,
+            **self._file_state(parquet_file),
         }
 
-    def needs_rebuild(self) -> bool:
-        """True if any signal parquet is newer than the index."""
-        if not self.index_file.exists():
-            return True
-
-        index_mtime = self.index_file.stat().st_mtime
-        parquet_files = self._parquet_files()
-        if parquet_files:
-            newest_parquet = max(f.stat().st_mtime for f in parquet_files)
-            if newest_parquet > index_mtime:
-                self.logger.info(
-                    "📋 Signal index outdated - newer parquet files found")
-                return True
-        return False
-
     # =========================================================================
     # FILE SELECTION
     # =========================================================================
@@ -223,27 +237,11 @@ class SignalIndexManager:
                 f"source '{data_sentiment_type}'")
             return []
 
-        relevant = []
-        covers_start = False
-        preceding: Optional[Dict] = None
-
-        for entry in self.index[data_sentiment_type][symbol]:
-            file_start = pd.to_datetime(entry['start_time'], utc=True)
-            file_end = pd.to_datetime(entry['end_time'], utc=True)
-
-            if file_start <= end_date and file_end >= start_date:
-                relevant.append(Path(entry['path']))
-                if file_start <= start_date:
-                    covers_start = True
-            elif file_end < start_date:
-                # Entries are sorted by start_time — the last one to land here is
-                # the immediate predecessor.
-                preceding = entry
-
-        if not covers_start and preceding is not None:
-            relevant.insert(0, Path(preceding['path']))
-
-        return relevant
+        entries = self.index[data_sentiment_type][symbol]
+        selected = self._interval_index(
+            data_sentiment_type, symbol, entries).overlapping_with_predecessor(
+                start_date, end_date)
+        return [Path(entry['path']) for entry in selected]
 
     # =========================================================================
     # INDEX PERSISTENCE - PARQUET FORMAT
@@ -264,22 +262,26 @@ class SignalIndexManager:
                         'end_time': pd.to_datetime(entry['end_time']),
                         'row_count': entry['row_count'],
                         'file_size_mb': entry['file_size_mb'],
+                        'file_size_bytes': entry.get('file_size_bytes'),
+                        'file_mtime_ns': entry.get('file_mtime_ns'),
                     })
 
         columns = [
             'data_sentiment_type', 'symbol', 'file', 'path',
             'start_time', 'end_time', 'row_count', 'file_size_mb',
+            'file_size_bytes', 'file_mtime_ns',
         ]
         df = pd.DataFrame(rows, columns=columns) if rows else pd.DataFrame(columns=columns)
+        df = self._with_file_state_dtypes(df)
 
         metadata = {
             b'created_at': datetime.now(timezone.utc).isoformat().encode(),
             b'data_dir': str(self.data_dir).encode(),
-            b'index_version': b'1.0',
+            b'index_version': b'1.1',
         }
         table = pa.Table.from_pandas(df)
         table = table.replace_schema_metadata({**table.schema.metadata, **metadata})
-        pq.write_table(table, self.index_file)
+        self._write_index_table(table)
         self.logger.debug(f"💾 Signal index saved to {self.index_file}")
 
     def _load_index(self) -> None:
@@ -306,6 +308,7 @@ class SignalIndexManager:
                 'end_time': row['end_time'].isoformat() if pd.notna(row['end_time']) else None,
                 'row_count': int(row['row_count']),
                 'file_size_mb': float(row['file_size_mb']),
+                **self._row_file_state(row),
             }
             result.setdefault(sentiment_type, {}).setdefault(symbol, []).append(entry)
 
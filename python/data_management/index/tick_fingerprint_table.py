@@ -0,0 +1,299 @@
+"""
+TickFingerprintTable - Persistent source fingerprints for tick import duplicate detection.
+
+Lives next to the tick index (.parquet_tick_fingerprints.parquet). One row per imported
+tick Parquet: the source JSON name and a content hash (first/last time_msc + tick count)
+mapped to the target file. Duplicate detection is a dict lookup instead of opening the
+Parquet footer of every existing file of the symbol.
+
+Maintenance:
+- Missing table: bootstrapped once from the archive (footer + first/last time_msc per file)
+- Importer: add() after a commit, remove() after an override deletion, save() per commit
+- Deleted files: dropped lazily when a lookup hits them
+- Files placed outside the importer: delete the table (or rebuild()) to resync
+"""
+
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from python.framework.logging.abstract_logger import AbstractLogger
+from python.framework.logging.bootstrap_logger import get_global_logger
+vLog = get_global_logger()
+
+
+class TickFingerprintTable:
+    """
+    Source name / content hash → tick Parquet file, per symbol.
+
+    Storage: Parquet (flat table)
+    Memory: {relative path: row} plus lookup dicts keyed by (symbol, source_file)
+    and (symbol, content_hash)
+    """
+
+    TABLE_FILE_PARQUET = ".parquet_tick_fingerprints.parquet"
+
+    COLUMNS = [
+        'path', 'broker_type', 'symbol', 'source_file', 'content_hash',
+        'tick_count', 'start_time', 'end_time',
+    ]
+
+    def __init__(self, data_dir: str, logger: AbstractLogger = vLog):
+        """
+        Args:
+            data_dir: Tick archive root (same directory as the tick index)
+            logger: Logger instance
+        """
+        self.data_dir = Path(data_dir)
+        self.table_file = self.data_dir / self.TABLE_FILE_PARQUET
+        self.logger = logger
+
+        # relative path → row
+        self._rows: Dict[str, Dict] = {}
+        self._by_source: Dict[Tuple[str, str], List[str]] = {}
+        self._by_hash: Dict[Tuple[str, str], List[str]] = {}
+
+    # =========================================================================
+    # FINGERPRINT
+    # =========================================================================
+
+    @staticmethod
+    def content_hash(first_time_msc: Optional[int], last_time_msc: Optional[int], tick_count: int) -> Optional[str]:
+        """
+        Content hash of a tick file.
+
+        Without time_msc (legacy exports) the tick count alone would match unrelated
+        files of the symbol — such files get no hash and match by source name only.
+
+        Args:
+            first_time_msc: time_msc of the first tick (file order)
+            last_time_msc: time_msc of the last tick (file order)
+            tick_count: Number of ticks
+
+        Returns:
+            Hash string "first:last:count", or None if a time_msc is missing
+        """
+        if first_time_msc is None or last_time_msc is None:
+            return None
+        return f"{first_time_msc}:{last_time_msc}:{tick_count}"
+
+    # =========================================================================
+    # LOAD / SAVE
+    # =========================================================================
+
+    def load(self) -> None:
+        """Load the table; bootstrap it from the archive if it does not exist yet."""
+        if not self.table_file.exists():
+            self.rebuild()
+            return
+
+        try:
+            df = pd.read_parquet(self.table_file)
+        except Exception as e:
+            self.logger.warning(f"Failed to load tick fingerprints: {e} - rebuilding")
+            self.rebuild()
+            return
+
+        self._rows = {}
+        for record in df.to_dict('records'):
+            record['tick_count'] = int(record['tick_count'])
+            if pd.isna(record['content_hash']):
+                record['content_hash'] = None
+            self._rows[record['path']] = record
+        self._reindex()
+
+    def rebuild(self) -> None:
+        """Scan every tick Parquet of the archive and write a fresh table."""
+        start = time.time()
+        self._rows = {}
+        for parquet_file in self.data_dir.glob("*/ticks/**/*.parquet"):
+            try:
+                row = self._scan_file(parquet_file)
+            except Exception as e:
+                self.logger.warning(
+                    f"Could not fingerprint {parquet_file.name}: {e}")
+                continue
+            self._rows[row['path']] = row
+        self._reindex()
+        self.save()
+        self.logger.info(
+            f"🔑 Tick fingerprints built: {len(self._rows)} files in "
+            f"{time.time() - start:.2f}s")
+
+    def save(self) -> None:
+        """Write the table atomically (temp file + rename)."""
+        df = pd.DataFrame(list(self._rows.values()), columns=self.COLUMNS)
+        df['tick_count'] = df['tick_count'].astype('int64')
+        table = pa.Table.from_pandas(df, preserve_index=False)
+
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.table_file.with_name(
+            f"{self.table_file.name}.{os.getpid()}.tmp")
+        pq.write_table(table, tmp_file)
+        os.replace(tmp_file, self.table_file)
+
+    # =========================================================================
+    # LOOKUP / UPDATE
+    # =========================================================================
+
+    def find(self, symbol: str, source_file: str, content_hash: Optional[str] = None) -> List[Dict]:
+        """
+        Existing files of a symbol imported from the same source name or content.
+
+        Rows whose file no longer exists are dropped on the way.
+
+        Args:
+            symbol: Trading symbol (lookup spans all broker types)
+            source_file: Source JSON file name
+            content_hash: Content hash of the new file (None = name only)
+
+        Returns:
+            Matching rows (with 'path' relative to data_dir)
+        """
+        paths = list(self._by_source.get((symbol, source_file), []))
+        if content_hash is not None:
+            paths += [p for p in self._by_hash.get((symbol, content_hash), [])
+                      if p not in paths]
+
+        matches = []
+        stale = []
+        for rel_path in paths:
+            if (self.data_dir / rel_path).exists():
+                matches.append(self._rows[rel_path])
+            else:
+                stale.append(rel_path)
+
+        if stale:
+            for rel_path in stale:
+                self._rows.pop(rel_path, None)
+            self._reindex()
+            self.save()
+        return matches
+
+    def add(
+        self,
+        parquet_path: Path,
+        broker_type: str,
+        symbol: str,
+        source_file: str,
+        content_hash: Optional[str],
+        tick_count: int,
+        start_time: pd.Timestamp,
+        end_time: pd.Timestamp
+    ) -> None:
+        """
+        Register a committed tick file (replaces a row of the same path).
+
+        Args:
+            parquet_path: Committed Parquet file
+            broker_type: Broker type identifier
+            symbol: Trading symbol
+            source_file: Source JSON file name
+            content_hash: Content hash (see content_hash(); None = name only)
+            tick_count: Number of ticks
+            start_time: Earliest tick timestamp (UTC)
+            end_time: Latest tick timestamp (UTC)
+        """
+        rel_path = self._relative(parquet_path)
+        replaced = rel_path in self._rows
+        self._rows[rel_path] = {
+            'path': rel_path,
+            'broker_type': broker_type,
+            'symbol': symbol,
+            'source_file': source_file,
+            'content_hash': content_hash,
+            'tick_count': int(tick_count),
+            'start_time': pd.Timestamp(start_time),
+            'end_time': pd.Timestamp(end_time),
+        }
+        if replaced:
+            self._reindex()
+        else:
+            self._by_source.setdefault((symbol, source_file), []).append(rel_path)
+            if content_hash is not None:
+                self._by_hash.setdefault((symbol, content_hash), []).append(rel_path)
+
+    def remove(self, parquet_path: Path) -> None:
+        """
+        Drop the row of a deleted tick file.
+
+        Args:
+            parquet_path: Deleted Parquet file
+        """
+        if self._rows.pop(self._relative(parquet_path), None) is not None:
+            self._reindex()
+
+    def resolve(self, row: Dict) -> Path:
+        """
+        Absolute path of a row's file.
+
+        Args:
+            row: Row returned by find()
+
+        Returns:
+            Path below data_dir
+        """
+        return self.data_dir / row['path']
+
+    # =========================================================================
+    # INTERNALS
+    # =========================================================================
+
+    def _relative(self, parquet_path: Path) -> str:
+        """Path key relative to data_dir (POSIX) — the archive stays relocatable."""
+        return Path(parquet_path).absolute().relative_to(
+            self.data_dir.absolute()).as_posix()
+
+    def _reindex(self) -> None:
+        """Rebuild the lookup dicts from the rows."""
+        self._by_source = {}
+        self._by_hash = {}
+        for rel_path, row in self._rows.items():
+            self._by_source.setdefault(
+                (row['symbol'], row['source_file']), []).append(rel_path)
+            if row['content_hash'] is not None:
+                self._by_hash.setdefault(
+                    (row['symbol'], row['content_hash']), []).append(rel_path)
+
+    def _scan_file(self, parquet_file: Path) -> Dict:
+        """
+        Fingerprint one existing tick Parquet (bootstrap only).
+
+        Reads the header metadata and the first / last row group's time columns.
+        """
+        pq_file = pq.ParquetFile(parquet_file)
+        metadata = {
+            key.decode('utf-8') if isinstance(key, bytes) else key:
+            value.decode('utf-8') if isinstance(value, bytes) else value
+            for key, value in (pq_file.metadata.metadata or {}).items()
+        }
+        last_group = pq_file.num_row_groups - 1
+        columns = [c for c in ('timestamp', 'time_msc')
+                   if c in pq_file.schema_arrow.names]
+        first = pq_file.read_row_group(0, columns=columns).to_pandas()
+        last = first if last_group == 0 else pq_file.read_row_group(
+            last_group, columns=columns).to_pandas()
+
+        first_msc = int(first['time_msc'].iloc[0]) if 'time_msc' in first else None
+        last_msc = int(last['time_msc'].iloc[-1]) if 'time_msc' in last else None
+        tick_count = pq_file.metadata.num_rows
+
+        # Time range over the whole file (ticks may be unordered within a file)
+        timestamps = pq_file.read(columns=['timestamp']).column(0).to_pandas()
+
+        return {
+            'path': self._relative(parquet_file),
+            'broker_type': metadata.get('broker_type') or metadata.get(
+                'data_collector', parquet_file.relative_to(self.data_dir).parts[0]),
+            'symbol': metadata.get('symbol', parquet_file.parent.name),
+            'source_file': metadata.get('source_file', ''),
+            'content_hash': self.content_hash(first_msc, last_msc, tick_count),
+            'tick_count': tick_count,
+            'start_time': timestamps.min(),
+            'end_time': timestamps.max(),
+        }
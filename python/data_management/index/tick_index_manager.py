@@ -8,29 +8,33 @@ import json
 import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Set
 
 import pandas as pd
 import pyarrow as pa
 import pyarrow.parquet as pq
 
 from python.configuration.app_config_manager import AppConfigManager
+from python.data_management.index.abstract_file_index_manager import AbstractFileIndexManager
 from python.framework.logging.abstract_logger import AbstractLogger
 from python.framework.logging.bootstrap_logger import get_global_logger
 from python.framework.types.trading_env_types.broker_types import BrokerType
 vLog = get_global_logger()
 
 
-class TickIndexManager:
+class TickIndexManager(AbstractFileIndexManager):
     """
     Manages Parquet file index for fast time-based file selection.
 
     Storage: Parquet (flat table)
     Memory: Nested dict {broker_type: {symbol: [entries]}}
 
+    Entries carry (path, size, mtime) — loading refreshes incrementally.
     Migration: Auto-converts legacy JSON index on first load.
     """
 
+    INDEX_LABEL = "Tick index"
+
     # Index file names
     INDEX_FILE_PARQUET = ".parquet_tick_index.parquet"
     INDEX_FILE_JSON_LEGACY = ".parquet_tick_index.json"
@@ -41,6 +45,7 @@ class TickIndexManager:
             logger: Logger instance
             data_dir: Override data directory (default: from AppConfigManager)
         """
+        super().__init__()
         self.logger = logger
         self._app_config = AppConfigManager()
         self.data_dir = Path(data_dir) if data_dir else Path(
@@ -59,28 +64,24 @@ class TickIndexManager:
     # INDEX BUILDING
     # =========================================================================
 
-    def build_index(self, force_rebuild: bool = False, check_stale: bool = False) -> None:
+    def build_index(self, force_rebuild: bool = False, check_stale: bool = True) -> None:
         """
-        Build or load index from Parquet files.
+        Build, load or refresh index from Parquet files.
 
         Args:
             force_rebuild: Force complete rebuild, ignore existing index
-            check_stale: Check if index is outdated (expensive filesystem scan)
-                        Default False - assumes index is current
+            check_stale: Refresh the loaded index against the file tree — stats
+                        every file, rescans only new or changed ones (cheap).
+                        False loads the saved index as-is.
         """
-        # Fast path: Load existing index without checking staleness
+        # Fast path: Load existing index, refresh incrementally
         if not force_rebuild and self.index_file.exists():
-            if not check_stale:
-                self._load_index()
-                self.logger.info(
-                    f"📚 Loaded existing tick index ({len(self.index)} broker types)")
-                return
-
-            if not self.needs_rebuild():
-                self._load_index()
-                self.logger.info(
-                    f"📚 Loaded existing tick index ({len(self.index)} broker types)")
-                return
+            self._load_index()
+            if check_stale:
+                self.refresh_index()
+            self.logger.info(
+                f"📚 Loaded existing tick index ({len(self.index)} broker types)")
+            return
 
         # Check for legacy JSON and migrate
         if not force_rebuild and self._legacy_json_file.exists() and not self.index_file.exists():
@@ -92,37 +93,15 @@ class TickIndexManager:
         self.logger.info("🔍 Scanning Parquet files for tick index...")
         start_time = time.time()
 
-        # Pattern: mt5/ticks/EURUSD/*.parquet
-        parquet_files = list(self.data_dir.glob("*/ticks/**/*.parquet"))
+        parquet_files = self._data_files()
 
         if not parquet_files:
             self.logger.warning(f"No Parquet files found in {self.data_dir}")
             self.index = {}
             return
 
-        for parquet_file in parquet_files:
-            try:
-                entry = self._scan_file(parquet_file)
-                broker_type = entry['broker_type']
-                symbol = entry['symbol']
-
-                if broker_type not in self.index:
-                    self.index[broker_type] = {}
-
-                if symbol not in self.index[broker_type]:
-                    self.index[broker_type][symbol] = []
-
-                self.index[broker_type][symbol].append(entry)
-
-            except Exception as e:
-                self.logger.warning(
-                    f"Failed to index {parquet_file.name}: {e}")
-
-        # Sort files chronologically per broker_type/symbol
-        for broker_type in self.index:
-            for symbol in self.index[broker_type]:
-                self.index[broker_type][symbol].sort(
-                    key=lambda x: x['start_time'])
+        self.index = {}
+        self._apply_file_changes(parquet_files, set())
 
         self._save_index()
 
@@ -137,6 +116,43 @@ class TickIndexManager:
             f"in {elapsed:.2f}s"
         )
 
+    def _data_files(self) -> List[Path]:
+        """Tick Parquet files (pattern: mt5/ticks/EURUSD/*.parquet)."""
+        return list(self.data_dir.glob("*/ticks/**/*.parquet"))
+
+    def _iter_entries(self) -> Iterator[Dict]:
+        """All entries across broker types and symbols."""
+        for symbols in self.index.values():
+            for entries in symbols.values():
+                yield from entries
+
+    def _add_file(self, path: Path) -> None:
+        """Scan one tick file and append its entry."""
+        entry = self._scan_file(path)
+        self.index.setdefault(entry['broker_type'], {}).setdefault(
+            entry['symbol'], []).append(entry)
+
+    def _remove_paths(self, paths: Set[str]) -> None:
+        """Drop entries of the given paths, and symbols / broker types left empty."""
+        if not paths:
+            return
+        for broker_type in list(self.index):
+            symbols = self.index[broker_type]
+            for symbol in list(symbols):
+                symbols[symbol] = [
+                    e for e in symbols[symbol] if e['path'] not in paths]
+                if not symbols[symbol]:
+                    del symbols[symbol]
+            if not symbols:
+                del self.index[broker_type]
+
+    def _sort_entries(self) -> None:
+        """Sort files chronologically per broker_type/symbol."""
+        for broker_type in self.index:
+            for symbol in self.index[broker_type]:
+                self.index[broker_type][symbol].sort(
+                    key=lambda x: x['start_time'] or '')
+
     def _scan_file(self, parquet_file: Path) -> Dict:
         """
         Scan single Parquet file and extract metadata with statistics.
@@ -232,27 +248,10 @@ class TickIndexManager:
 
             'broker_type': broker_type,
             'data_format_version': custom_metadata.get(
-                b'data_format_version', b'unknown').decode('utf-8')
+                b'data_format_version', b'unknown').decode('utf-8'),
+            **self._file_state(parquet_file),
         }
 
-    def needs_rebuild(self) -> bool:
-        """Check if index needs rebuilding."""
-        if not self.index_file.exists():
-            return True
-
-        index_mtime = self.index_file.stat().st_mtime
-
-        parquet_files = list(self.data_dir.glob("*/ticks/**/*.parquet"))
-        if parquet_files:
-            newest_parquet = max(f.stat().st_mtime for f in parquet_files)
-
-            if newest_parquet > index_mtime:
-                self.logger.info(
-                    "📋 Tick index outdated - newer Parquet files found")
-                return True
-
-        return False
-
     # =========================================================================
     # FILE SELECTION
     # =========================================================================
@@ -266,6 +265,8 @@ class TickIndexManager:
     ) -> List[Path]:
         """
         Find ONLY files covering requested time range for specific broker_type.
+
+        Binary search over the symbol's sorted start/end arrays (see FileIntervalIndex).
         """
         if broker_type not in self.index:
             self.logger.warning(
@@ -277,16 +278,35 @@ class TickIndexManager:
                 f"Symbol '{symbol}' not found in index for broker_type '{broker_type}'")
             return []
 
-        relevant = []
+        return [
+            Path(entry['path'])
+            for entry in self.get_overlapping_entries(broker_type, symbol, start_date, end_date)
+        ]
 
-        for entry in self.index[broker_type][symbol]:
-            file_start = pd.to_datetime(entry['start_time'], utc=True)
-            file_end = pd.to_datetime(entry['end_time'], utc=True)
+    def get_overlapping_entries(
+        self,
+        broker_type: str,
+        symbol: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> List[Dict]:
+        """
+        Index entries whose time range overlaps [start_date, end_date].
 
-            if file_start <= end_date and file_end >= start_date:
-                relevant.append(Path(entry['path']))
+        Args:
+            broker_type: Broker type identifier
+            symbol: Trading symbol
+            start_date: Range start (UTC)
+            end_date: Range end (UTC)
 
-        return relevant
+        Returns:
+            Overlapping entries in chronological order (empty if unknown)
+        """
+        entries = self.index.get(broker_type, {}).get(symbol)
+        if not entries:
+            return []
+        return self._interval_index(broker_type, symbol, entries).overlapping(
+            start_date, end_date)
 
     # =========================================================================
     # INDEX PERSISTENCE - PARQUET FORMAT
@@ -317,6 +337,8 @@ class TickIndexManager:
                         'sessions': json.dumps(entry.get('sessions', {})),
                         'data_format_version': entry.get(
                             'data_format_version', 'unknown'),
+                        'file_size_bytes': entry.get('file_size_bytes'),
+                        'file_mtime_ns': entry.get('file_mtime_ns'),
                     }
                     rows.append(row)
 
@@ -326,23 +348,25 @@ class TickIndexManager:
             'broker_type', 'symbol', 'file', 'path', 'start_time', 'end_time',
             'tick_count', 'file_size_mb', 'source_file', 'num_row_groups',
             'collected_start', 'collected_end',
-            'statistics', 'sessions', 'data_format_version'
+            'statistics', 'sessions', 'data_format_version',
+            'file_size_bytes', 'file_mtime_ns'
         ]
         df = pd.DataFrame(rows, columns=columns) if rows else pd.DataFrame(
             columns=columns)
+        df = self._with_file_state_dtypes(df)
 
         # Add metadata
         metadata = {
             b'created_at': datetime.now(timezone.utc).isoformat().encode(),
             b'data_dir': str(self.data_dir).encode(),
-            b'index_version': b'2.1'  # Parquet format version
+            b'index_version': b'2.2'  # Parquet format version
         }
 
         table = pa.Table.from_pandas(df)
         table = table.replace_schema_metadata(
             {**table.schema.metadata, **metadata})
 
-        pq.write_table(table, self.index_file)
+        self._write_index_table(table)
         self.logger.debug(f"💾 Tick index saved to {self.index_file}")
 
     def _load_index(self) -> None:
@@ -387,7 +411,8 @@ class TickIndexManager:
                 'broker_type': broker_type,
                 # Tolerant: index files written before the field was persisted
                 # have no such column - they read as 'unknown' until rebuilt.
-                'data_format_version': row.get('data_format_version', 'unknown')
+                'data_format_version': row.get('data_format_version', 'unknown'),
+                **self._row_file_state(row),
             }
 
             result[broker_type][symbol].append(entry)
@@ -36,6 +36,7 @@ from python.framework.reporting.builders.warnings_errors_report_builder import b
 from python.framework.reporting.io.warnings_errors_report_io import write_warnings_errors_report
 from python.framework.reporting.shared_report_coordinator import SharedReportCoordinator
 from python.framework.reporting.store.run_provenance_builder import build_run_provenance_from_session
+from python.framework.reporting.store.run_catalog import record_run_in_catalog
 from python.framework.reporting.store.run_results_ledger import append_run_to_ledger
 from python.framework.utils.console_renderer import ConsoleRenderer
 from python.framework.trading_env.broker_config import BrokerConfig
@@ -49,7 +50,7 @@ class AutotraderReportCoordinator:
     Coordinates live-session report generation + artifact persistence.
 
     Responsibilities:
-    - Event-stream CSV (events.csv)
+    - Event stream (events.parquet + events.csv)
     - Unified report artifacts (#391): trade / order / portfolio
     - Algo diagnostics CSV (#376)
     - Post-session console summary
@@ -102,15 +103,20 @@ class AutotraderReportCoordinator:
     def generate_and_log(self) -> None:
         """Write all session artifacts + print the post-session summary."""
         result = self._result
+        app_config = AppConfigManager()
 
         # Long-format event-stream CSV (#330) — replaces the previous
         # autotrader_orders.csv + autotrader_trades.csv pair with a single
-        # chronological events.csv (FIX ExecutionReport style).
-        EventStreamWriter.from_autotrader_result(
+        # chronological events.csv (FIX ExecutionReport style). The typed
+        # events.parquet is always written; the CSV per reporting.write_event_csv.
+        writer = EventStreamWriter.from_autotrader_result(
             trade_history=result.trade_history or [],
             order_history=result.order_history or [],
             run_dir=self._run_dir,
-        ).flush('events.csv')
+        )
+        writer.flush_parquet('events.parquet')
+        if app_config.get_reporting_write_event_csv():
+            writer.flush('events.csv')
 
         # Unified report artifacts (#391) — the canonical models the console/CSV
         # render and the API serves; same shape as sim, one set per session run.
@@ -136,7 +142,8 @@ class AutotraderReportCoordinator:
         # portfolio (single session = its own currency aggregate) / pending (empty for live) /
         # execution-stats / run-summary / worker-decision. The models feed the unified console.
         unified = SharedReportCoordinator.derive_and_persist(
-            units, io_dir, self._signal_scenario_map)
+            units, io_dir, self._signal_scenario_map,
+            write_row_json=app_config.get_reporting_write_row_json())
 
         # Warnings & errors — tiered model (#395). Persisted for API parity with the sim runs;
         # the closing block keeps reading the session buffers directly (same structured source,
@@ -162,6 +169,9 @@ class AutotraderReportCoordinator:
             self._config, self._run_dir, self._run_timestamp, warnings_errors_report)
         append_run_to_ledger(unified.run_summary, provenance)
 
+        # Run catalog — the session's io/ artifacts are complete (see batch_report_coordinator).
+        record_run_in_catalog(self._run_dir, unified.run_summary, provenance, pipeline='autotrader')
+
         # Diagnostics CSV (#376) — algo-declared sinks, next to events.csv.
         if self._decision_logic:
             flush_decision_diagnostics(self._decision_logic, self._run_dir)
@@ -171,7 +181,7 @@ class AutotraderReportCoordinator:
         # summary as the closing block. Live is one unit → the per-currency aggregates are
         # skipped (redundant); the same ordered renderer the sim coordinator uses. ===
         renderer = ConsoleRenderer()
-        threshold = AppConfigManager().get_console_logging_config_object().scenario_detail_threshold
+        threshold = app_config.get_console_logging_config_object().scenario_detail_threshold
 
         console = RunConsoleRenderer(
             unit_count=unified.run_summary.unit_count,
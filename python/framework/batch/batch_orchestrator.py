@@ -131,9 +131,14 @@ from python.framework.batch.live_stats_coordinator import LiveStatsCoordinator
 from python.framework.batch.execution_coordinator import ExecutionCoordinator
 from python.framework.batch.requirements_collector import RequirementsCollector
 from python.framework.batch.mount_preparer import MountPreparer
+from python.framework.batch.mount_store import MountStore
+from python.framework.batch.scenario_chunk_planner import ScenarioChunkPlanner
+from python.framework.batch.window_span_planner import WindowSpanPlanner
+from python.framework.persistence.worker_output_cache import WorkerOutputCache
 from python.framework.utils.runtime_env_utils import is_debug_execution
 from python.framework.data_preparation.broker_data_preparator import BrokerDataPreparator
 from python.framework.types.mount_package_types import DataIdentityKey, MountPackage
+from python.framework.types.process_data_types import RequirementsMap
 from python.framework.types.trading_env_types.broker_types import BrokerType
 from python.framework.exceptions.mount_errors import MountIdentityMismatchError
 
@@ -215,6 +220,12 @@ class BatchOrchestrator:
             run_group=self._scenario_set.run_group
         )
 
+        self._window_span_planner = WindowSpanPlanner(logger=self._logger)
+        self._scenario_chunk_planner = ScenarioChunkPlanner(
+            logger=self._logger,
+            requirements_collector=self._requirements_collector
+        )
+
         self._live_stats_coordinator = LiveStatsCoordinator(
             scenarios=self._scenarios,
             live_queue=self._live_queue,
@@ -301,12 +312,15 @@ class BatchOrchestrator:
         if mount is not None:
             # Warm path (#419): prep the scenarios (cheap), then reuse the shared mount's data
             # if this combination's data identity matches it; otherwise reload for this combo.
-            self.prepare_scenarios()
+            prepared = self.prepare_scenarios()
             if not self.matches_mount(mount):
                 self._logger.warning(
                     "⚠️ Combination data identity differs from the mount "
                     "(warmup-affecting parameter) — reloading data for this combination")
-                mount = self.prepare_mount()
+                mount = self.prepare_mount(prepared=prepared)
+        elif self._app_config_manager.get_mount_cache_enabled():
+            # Cross-invocation reuse (#420): a mount persisted by an earlier CLI run
+            mount = self._prepare_or_load_persisted_mount()
         else:
             mount = self.prepare_mount()
 
@@ -341,7 +355,11 @@ class BatchOrchestrator:
         return self._mount_preparer.prepare_scenarios(
             self._scenario_set.get_all_scenarios())
 
-    def prepare_mount(self) -> MountPackage:
+    def prepare_mount(
+        self,
+        prepared: Optional[Tuple[Dict[BrokerType, Dict[str, Any]], BrokerDataPreparator, WarmupPhaseEntry]] = None,
+        requirements_map: Optional[RequirementsMap] = None,
+    ) -> MountPackage:
         """
         Prepare the reusable data mount (Phase 0 validation + Phases 1–5 load), delegated to the
         shared MountPreparer (#438) on this set's scenarios.
@@ -351,11 +369,62 @@ class BatchOrchestrator:
         execute(mount, scenarios) (#419) without reloading. Parameter validation is intentionally
         NOT here — it is the per-run check owned by the caller (run() / the sweep runner).
 
+        Args:
+            prepared: Phase 0 result of a prepare_scenarios() call already made this run (not re-run)
+            requirements_map: Requirements already collected this run (pre-flights not re-run)
+
         Returns:
             MountPackage with the loaded per-scenario data and the data identity that keys it
         """
         return self._mount_preparer.prepare_mount(
-            self._scenario_set.get_all_scenarios())
+            self._scenario_set.get_all_scenarios(),
+            prepared=prepared,
+            requirements_map=requirements_map,
+        )
+
+    def _prepare_or_load_persisted_mount(self) -> MountPackage:
+        """
+        Cold path with the on-disk mount cache (#420): load a persisted mount whose data identity
+        matches this set, otherwise prepare one and persist it for the next invocation.
+
+        Phase 0 runs first (cheap, sets broker_type + validity), then the key is computed from the
+        valid scenarios' data identity + source file fingerprints. A loaded mount is still checked
+        with matches_mount() — the same guard the #419 warm path uses. On a miss the Phase 0 and
+        requirements results are handed to prepare_mount(), so no validator runs twice; the store
+        persists only the validation results Phases 1–5 add.
+
+        Returns:
+            The loaded or freshly prepared MountPackage
+        """
+        store = MountStore(self._logger, self._app_config_manager)
+        prepared = self.prepare_scenarios()
+        broker_configs = prepared[0]
+        requirements = self._requirements_collector.collect_and_validate(
+            self._scenario_set.get_valid_scenarios())
+        # Re-read after collection: a failed pre-flight excludes a scenario before the key
+        valid_scenarios = self._scenario_set.get_valid_scenarios()
+        key = store.compute_key(valid_scenarios, requirements, broker_configs)
+
+        loaded = store.load(key)
+        if loaded is not None:
+            mount, scenario_state = loaded
+            if self.matches_mount(mount):
+                MountStore.restore_scenario_state(valid_scenarios, scenario_state)
+                self._logger.info(
+                    "♻️ Reusing persisted data mount — Phases 1–5 skipped")
+                return mount
+            self._logger.warning(
+                "⚠️ Persisted mount does not match this set's data identity — reloading")
+
+        # Results recorded so far (Phase 0 + pre-flights) are re-recorded by every run — only what
+        # the load phases append is persisted
+        validation_offsets = {
+            scenario.scenario_index: len(scenario.validation_result)
+            for scenario in valid_scenarios
+        }
+        mount = self.prepare_mount(prepared=prepared, requirements_map=requirements)
+        store.save(key, mount, self._scenario_set.get_valid_scenarios(), validation_offsets)
+        return mount
 
     def execute(
         self,
@@ -379,9 +448,25 @@ class BatchOrchestrator:
             BatchExecutionSummary with aggregated results from all scenarios
         """
         self._assert_mount_identity(mount, scenarios)
+        if self._app_config_manager.get_worker_output_cache_enabled():
+            self._assign_worker_output_series_keys(mount, scenarios)
+
+        # Single-pass robustness: adjacent windows run as one span per lead process
+        scenario_packages = mount.scenario_packages
+        robustness = self._scenario_set.get_robustness_config()
+        single_pass = robustness.enabled and robustness.single_pass
+        if single_pass and self._window_span_planner.plan(scenarios, scenario_packages):
+            scenario_packages = self._window_span_planner.span_packages(
+                scenarios, scenario_packages)
+
+        # Chunked execution: a long scenario runs as time chunks in parallel processes
+        chunk_packages = {}
+        if self._scenario_chunk_planner.plan(scenarios, scenario_packages):
+            chunk_packages = self._scenario_chunk_planner.chunk_packages(
+                scenarios, scenario_packages)
 
         scenario_count = len(scenarios)
-        if scenario_count == 1:
+        if scenario_count == 1 and not chunk_packages:
             self._logger.info(
                 "⚠️ Sequential execution forced - only one scenario in set."
             )
@@ -394,20 +479,25 @@ class BatchOrchestrator:
         batch_tickrun_start = time.time()
 
         # Execute scenarios
-        if self._parallel_scenarios and scenario_count > 1:
+        if self._parallel_scenarios and (scenario_count > 1 or chunk_packages):
             results, batch_pickle_time, batch_pickle_sample_mb = self._execution_coordinator.execute_parallel(
                 scenarios=scenarios,
-                scenario_packages=mount.scenario_packages,  # Dict of packages
-                live_queue=self._live_queue
+                scenario_packages=scenario_packages,  # Dict of packages
+                live_queue=self._live_queue,
+                chunk_packages=chunk_packages
             )
 
         else:
             results, batch_pickle_time, batch_pickle_sample_mb = self._execution_coordinator.execute_sequential(
                 scenarios=scenarios,
-                scenario_packages=mount.scenario_packages,  # Dict of packages
-                live_queue=self._live_queue
+                scenario_packages=scenario_packages,  # Dict of packages
+                live_queue=self._live_queue,
+                chunk_packages=chunk_packages
             )
 
+        if single_pass:
+            results = self._window_span_planner.expand_results(results, scenarios)
+
         # calc execution time
         batch_tickrun_time = time.time() - batch_tickrun_start
         batch_execution_time = mount.batch_warmup_time + batch_tickrun_time
@@ -463,6 +553,46 @@ class BatchOrchestrator:
 
         return summary
 
+    def _assign_worker_output_series_keys(
+        self,
+        mount: MountPackage,
+        scenarios: List[SingleScenario]
+    ) -> None:
+        """
+        Tag each scenario with the bar-series key its workers' cached outputs are stored under.
+
+        Keyed by the scenario's data identity + the fingerprints of its own broker / symbol
+        archive (not the whole set's), so another set running the same window hits the same
+        series. Computed once per mount and memoized on it — every combination of a sweep
+        reuses the keys without re-reading the data indexes.
+
+        Args:
+            mount: The prepared data mount
+            scenarios: The scenarios about to execute against it
+        """
+        if not mount.worker_output_series_keys:
+            store = MountStore(self._logger, self._app_config_manager)
+            bar_max_history = self._app_config_manager.get_bar_max_history()
+            requirements = mount.requirements_map
+            fingerprints: Dict[Tuple[str, str], List[Tuple[str, int, int]]] = {}
+            for index, identity in mount.data_identity.items():
+                pair = (identity.data_broker_type, identity.symbol)
+                if pair not in fingerprints:
+                    fingerprints[pair] = store.file_fingerprints(RequirementsMap(
+                        tick_requirements=[
+                            req for req in requirements.tick_requirements
+                            if (req.broker_type, req.symbol) == pair],
+                        bar_requirements=[
+                            req for req in requirements.bar_requirements
+                            if (req.broker_type, req.symbol) == pair],
+                    ))
+                mount.worker_output_series_keys[index] = WorkerOutputCache.series_key(
+                    identity, fingerprints[pair], bar_max_history)
+
+        for scenario in scenarios:
+            scenario.worker_output_series_key = mount.worker_output_series_keys.get(
+                scenario.scenario_index)
+
     def _assert_mount_identity(
         self,
         mount: MountPackage,
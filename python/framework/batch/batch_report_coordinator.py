@@ -42,11 +42,17 @@ from python.framework.reporting.builders.scenario_details_report_builder import
 from python.framework.reporting.io.scenario_details_report_io import write_scenario_details_report
 from python.framework.reporting.builders.warnings_errors_report_builder import build_warnings_errors_report_from_batch
 from python.framework.reporting.io.warnings_errors_report_io import write_warnings_errors_report
-from python.framework.reporting.shared_report_coordinator import SharedReportCoordinator
+from python.framework.reporting.report_task_graph import run_report_tasks
+from python.framework.reporting.shared_report_coordinator import SharedReportCoordinator, section_tasks
 from python.framework.reporting.store.run_provenance_builder import build_run_provenance
+from python.framework.reporting.store.run_catalog import record_run_in_catalog
 from python.framework.reporting.store.run_results_ledger import append_run_to_ledger
+from python.framework.types.process_data_types import ProcessResult
+from python.framework.types.report_task_types import ReportTask, ReportTaskResults
 from python.framework.types.run_results_types import SweepContext
 from python.configuration.app_config_manager import AppConfigManager
+from pathlib import Path
+from typing import List
 import sys
 import io
 import re
@@ -92,21 +98,28 @@ class BatchReportCoordinator:
         Generate report, print to console, and log to file.
 
         Workflow:
-        1. DERIVE the report models + build the section sub-presenters
+        1. DERIVE + PERSIST the report models and event streams (one report task graph,
+           independent steps concurrently) + build the section sub-presenters
         2. Capture full output (all per-scenario details) for file logging
         3. Capture console output (respects summary_detail config)
         4. Print colored version to console
         5. Strip colors and log full version to scenario file
+        6. Append the run to the run-results ledger + the run catalog
         """
         run_dir = self._scenario_set.logger.get_log_dir()
 
-        # === DERIVE + PERSIST the shared units-derived sections (#403) ===
-        # The 7 sections both pipelines share are built + written once by the shared
-        # coordinator (into the run's io/ subfolder); the names below stay for the console.
+        # === DERIVE + PERSIST as one report task graph — independent build / write steps run
+        # concurrently (reporting.parallel_workers); the console renders afterwards. ===
         io_dir = run_dir / IO_SUBDIR
-        units = run_units_from_batch(self._batch_execution_summary)
-        unified = SharedReportCoordinator.derive_and_persist(
-            units, io_dir, self._batch_execution_summary.signal_scenario_map)
+        outcome = run_report_tasks(
+            self._report_tasks(run_dir, io_dir),
+            self._app_config.get_reporting_parallel_workers())
+        self._log_report_timings(outcome)
+        reports = outcome.results
+
+        # The shared units-derived sections (#403) — built + written into the run's io/
+        # subfolder by the shared coordinator's tasks; the names below stay for the console.
+        unified = SharedReportCoordinator.collect(reports)
         trade_report = unified.trade_history
         order_report = unified.order_history
         portfolio_report = unified.portfolio
@@ -117,28 +130,15 @@ class BatchReportCoordinator:
         signal_report = unified.signal
         feed_stability_report = unified.feed_stability
 
-        # === DERIVE the sim-only / pipeline-specific sections ===
-        # Scenario details — per-scenario execution/signal metadata incl. failed (sim-only).
-        scenario_details_report = build_scenario_details_report_from_batch(
-            self._batch_execution_summary)
-        # Run meta — run-level timing split + scenario identity (the orchestrator's primary
-        # measurements), projected once so PRESENT reads the model instead of the raw type.
-        run_meta_report = build_run_meta_report_from_batch(self._batch_execution_summary)
-        # Profiling — per-scenario operation timing + inter-tick + clipping + warmup (sim-only, #399).
-        profiling_report = build_profiling_report_from_batch(self._batch_execution_summary)
-        # Broker configuration — per-broker spec + scenarios + symbols (sim-only).
-        broker_report = build_broker_report_from_batch(self._batch_execution_summary)
-        # Warnings & errors — tiered, from the validation channels + log pots (#395).
-        warnings_errors_report = build_warnings_errors_report_from_batch(
-            self._batch_execution_summary)
-        # Aggregated per-currency portfolio — the rich detail view from the per-unit rows (#397).
-        aggregated_portfolio_report = build_aggregated_portfolio_report(
-            portfolio_report, execution_stats_report, pending_report)
-        # Block-splitting disposition — Profile Runs only (empty otherwise; sim-only).
-        block_splitting_report = build_block_splitting_report_from_batch(
-            self._batch_execution_summary, self._scenario_set.get_generator_profiles() or [])
-        # Robustness validation — multi-window + IS/OOS (empty unless robustness enabled; sim-only, #367).
-        robustness_report = build_robustness_report_from_batch(self._batch_execution_summary)
+        # The sim-only / pipeline-specific sections (see _report_tasks)
+        scenario_details_report = reports['scenario_details']
+        run_meta_report = reports['run_meta']
+        profiling_report = reports['profiling']
+        broker_report = reports['broker']
+        warnings_errors_report = reports['warnings_errors']
+        aggregated_portfolio_report = reports['aggregated_portfolio']
+        block_splitting_report = reports['block_splitting']
+        robustness_report = reports['robustness']
 
         # === PRESENT — build the section sub-presenters from the models and render them
         # through the shared ordered renderer (#403 Phase 2; the section order lives in one
@@ -199,37 +199,6 @@ class BatchReportCoordinator:
         summary_clean = re.sub(r'\033\[[0-9;]+m', '', full_output)
         self._scenario_set.printed_summary_logger.info(summary_clean)
 
-        # Long-format event-stream CSV per scenario (#330 / #233).
-        # Writes one events_<scenario>.csv per scenario into an events/
-        # subfolder of the scenario set's log dir — keeps the run dir tidy
-        # when many scenarios produce many CSVs.
-        events_dir = run_dir / 'events'
-        events_dir.mkdir(exist_ok=True)
-        for process_result in self._batch_execution_summary.process_result_list:
-            tlr = process_result.tick_loop_results
-            if tlr is None:
-                continue
-            EventStreamWriter.from_sim_result(
-                trade_history=tlr.trade_history or [],
-                order_history=tlr.order_history or [],
-                run_dir=events_dir,
-            ).flush(f'events_{process_result.scenario_name}.csv')
-
-        # === PERSIST the pipeline-specific sections (the shared 7 were written by the
-        # shared coordinator above); same io/ subfolder (#396 housekeeping) ===
-        write_scenario_details_report(scenario_details_report, io_dir)
-        write_run_meta_report(run_meta_report, io_dir)
-        write_profiling_report(profiling_report, io_dir)
-        write_broker_report(broker_report, io_dir)
-        write_warnings_errors_report(warnings_errors_report, io_dir)
-        write_aggregated_portfolio_report(aggregated_portfolio_report, io_dir)
-        # Block-splitting artifact only when there is something to report (Profile Runs).
-        if block_splitting_report.symbols:
-            write_block_splitting_report(block_splitting_report, io_dir)
-        # Robustness artifact only when robustness mode is enabled (#367).
-        if robustness_report.enabled:
-            write_robustness_report(robustness_report, io_dir)
-
         # === Run-results ledger (#390) — append the run to the persistent cross-run store the
         # Parameter Optimization system ranks over. The run's status/error (a total failure, e.g.
         # an out-of-range parameter combination) comes from the canonical warnings/errors outcome
@@ -238,3 +207,106 @@ class BatchReportCoordinator:
             self._batch_execution_summary, self._scenario_set, run_dir,
             self._sweep_context, warnings_errors_report)
         append_run_to_ledger(run_summary, provenance)
+
+        # Run catalog — the run is complete (all io/ artifacts written); the API lists +
+        # resolves runs from the catalog instead of globbing the logs tree.
+        record_run_in_catalog(run_dir, run_summary, provenance, pipeline='simulation')
+
+    def _report_tasks(self, run_dir: Path, io_dir: Path) -> List[ReportTask]:
+        """
+        Every report step of the run: the shared sections (SharedReportCoordinator), the
+        sim-only sections, and the per-scenario event streams.
+
+        Args:
+            run_dir: The run's log directory
+            io_dir: The run's io/ subfolder
+
+        Returns:
+            The report tasks, for run_report_tasks
+        """
+        batch = self._batch_execution_summary
+        units = run_units_from_batch(batch)
+        tasks = SharedReportCoordinator.report_tasks(
+            units, io_dir, batch.signal_scenario_map,
+            write_row_json=self._app_config.get_reporting_write_row_json())
+
+        # === The sim-only / pipeline-specific sections (same io/ subfolder, #396 housekeeping) ===
+        tasks += [
+            # Scenario details — per-scenario execution/signal metadata incl. failed (sim-only).
+            *section_tasks('scenario_details',
+                           lambda r: build_scenario_details_report_from_batch(batch),
+                           lambda report: write_scenario_details_report(report, io_dir)),
+            # Run meta — run-level timing split + scenario identity (the orchestrator's primary
+            # measurements), projected once so PRESENT reads the model instead of the raw type.
+            *section_tasks('run_meta', lambda r: build_run_meta_report_from_batch(batch),
+                           lambda report: write_run_meta_report(report, io_dir)),
+            # Profiling — per-scenario operation timing + inter-tick + clipping + warmup (sim-only, #399).
+            *section_tasks('profiling', lambda r: build_profiling_report_from_batch(batch),
+                           lambda report: write_profiling_report(report, io_dir)),
+            # Broker configuration — per-broker spec + scenarios + symbols (sim-only).
+            *section_tasks('broker', lambda r: build_broker_report_from_batch(batch),
+                           lambda report: write_broker_report(report, io_dir)),
+            # Warnings & errors — tiered, from the validation channels + log pots (#395).
+            *section_tasks('warnings_errors',
+                           lambda r: build_warnings_errors_report_from_batch(batch),
+                           lambda report: write_warnings_errors_report(report, io_dir)),
+            # Aggregated per-currency portfolio — the rich detail view from the per-unit rows (#397).
+            *section_tasks(
+                'aggregated_portfolio',
+                lambda r: build_aggregated_portfolio_report(
+                    r['portfolio'], r['execution_stats'], r['pending_orders']),
+                lambda report: write_aggregated_portfolio_report(report, io_dir),
+                after=('portfolio', 'execution_stats', 'pending_orders')),
+            # Block-splitting disposition — Profile Runs only; the artifact only when there is
+            # something to report (sim-only).
+            *section_tasks(
+                'block_splitting',
+                lambda r: build_block_splitting_report_from_batch(
+                    batch, self._scenario_set.get_generator_profiles() or []),
+                lambda report: (write_block_splitting_report(report, io_dir)
+                                if report.symbols else None)),
+            # Robustness validation — multi-window + IS/OOS; the artifact only when robustness
+            # mode is enabled (sim-only, #367).
+            *section_tasks(
+                'robustness', lambda r: build_robustness_report_from_batch(batch),
+                lambda report: (write_robustness_report(report, io_dir)
+                                if report.enabled else None)),
+        ]
+
+        # Long-format event-stream per scenario (#330 / #233).
+        # Writes one events_<scenario>.parquet (+ .csv unless reporting.write_event_csv
+        # is off) per scenario into an events/ subfolder of the scenario set's log
+        # dir — keeps the run dir tidy when many scenarios produce many files.
+        events_dir = run_dir / 'events'
+        events_dir.mkdir(exist_ok=True)
+        write_event_csv = self._app_config.get_reporting_write_event_csv()
+        for process_result in batch.process_result_list:
+            if process_result.tick_loop_results is None:
+                continue
+            tasks.append(ReportTask(
+                name=f'events.{process_result.scenario_name}',
+                run=lambda r, result=process_result: _write_event_stream(
+                    result, events_dir, write_event_csv)))
+        return tasks
+
+    def _log_report_timings(self, outcome: ReportTaskResults) -> None:
+        """Record every report step's wall time in the run log (slowest first)."""
+        timings = ' · '.join(
+            f"{name} {seconds:.2f}s"
+            for name, seconds in outcome.slowest(len(outcome.seconds)).items())
+        self._scenario_set.logger.debug(
+            f"📝 Report steps ({len(outcome.seconds)}, "
+            f"{sum(outcome.seconds.values()):.2f}s summed): {timings}")
+
+
+def _write_event_stream(process_result: ProcessResult, events_dir: Path, write_csv: bool) -> None:
+    """Write one scenario's event stream (parquet + optional CSV)."""
+    tlr = process_result.tick_loop_results
+    writer = EventStreamWriter.from_sim_result(
+        trade_history=tlr.trade_history or [],
+        order_history=tlr.order_history or [],
+        run_dir=events_dir,
+    )
+    writer.flush_parquet(f'events_{process_result.scenario_name}.parquet')
+    if write_csv:
+        writer.flush(f'events_{process_result.scenario_name}.csv')
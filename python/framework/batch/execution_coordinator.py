@@ -5,6 +5,7 @@ Phase 2: Coordinates sequential and parallel scenario execution
 Extracted from BatchOrchestrator to separate execution logic.
 """
 import pickle
+from python.framework.batch.scenario_chunk_stitcher import stitch_chunk_results
 from python.framework.process.process_executor import ProcessExecutor
 from python.framework.process.process_live_queue_helper import broadcast_status_update
 from python.framework.process.process_main import process_main
@@ -65,7 +66,8 @@ class ExecutionCoordinator:
         self,
         scenarios: List[SingleScenario],
         scenario_packages: Dict[int, ProcessDataPackage],
-        live_queue: Optional[Queue]
+        live_queue: Optional[Queue],
+        chunk_packages: Optional[Dict[int, List[ProcessDataPackage]]] = None
     ) -> tuple[List[ProcessResult], float, float]:
         """
         Execute scenarios sequentially.
@@ -74,16 +76,22 @@ class ExecutionCoordinator:
             scenarios: List of scenarios to execute
             scenario_packages: Dict mapping scenario_index → ProcessDataPackage
             live_queue: Optional queue for live updates
+            chunk_packages: Chunk packages per chunked scenario_index (chunked execution)
 
         Returns:
             Tuple of (List of ProcessResult objects, pickle_time_s, pickle_sample_mb)
-            Both floats are 0.0 for sequential (no subprocess pickling)
+            Both floats are 0.0 for sequential (no subprocess pickling). Later windows of a
+            single-pass span stay None — their span lead's result carries them.
         """
         results = [None] * len(scenarios)
 
         for idx, scenario in enumerate(scenarios):
             readable_index = idx + 1
 
+            # === SINGLE-PASS ROBUSTNESS: runs inside its span lead's process ===
+            if scenario.window_span_lead is not None:
+                continue
+
             # === CHECK VALIDATION STATUS ===
             if not scenario.is_valid():
                 # Create failed result immediately
@@ -115,9 +123,16 @@ class ExecutionCoordinator:
                     scenario, idx, live_queue,  f"❌ No data package for scenario {idx}: {scenario.name} - data packages: {len(scenario_packages)}")
                 continue
 
-            # Execute with scenario-specific data
-            # Changed: scenario_data
-            results[idx] = executor.run(scenario_data, live_queue)
+            # === CHUNKED EXECUTION: one run per chunk, stitched into the scenario ===
+            if scenario.chunks:
+                chunk_results = [
+                    process_main(executor.config.for_chunk(chunk), chunk_data, live_queue)
+                    for chunk, chunk_data in zip(scenario.chunks, chunk_packages[idx])]
+                results[idx] = stitch_chunk_results(chunk_results, scenario.name, idx)
+            else:
+                # Execute with scenario-specific data
+                # Changed: scenario_data
+                results[idx] = executor.run(scenario_data, live_queue)
 
             if results[idx].success:
                 self._logger.debug(
@@ -135,23 +150,28 @@ class ExecutionCoordinator:
         self,
         scenarios: List[SingleScenario],
         scenario_packages: Dict[int, ProcessDataPackage],
-        live_queue: Optional[Queue]
+        live_queue: Optional[Queue],
+        chunk_packages: Optional[Dict[int, List[ProcessDataPackage]]] = None
     ) -> tuple[List[ProcessResult], float, float]:
         """
         Execute scenarios in parallel with auto-detection.
 
         OPTIMIZATION: Each scenario receives only its required data (3-5 MB)
         instead of global package (61 MB). Reduces pickle time by 5x.
+        A chunked scenario submits one future per chunk; its chunk results are
+        stitched into the scenario's result once all are collected.
 
         Args:
             scenarios: List of scenarios to execute
             scenario_packages: Dict mapping scenario_index → ProcessDataPackage
             live_queue: Optional queue for live updates
+            chunk_packages: Chunk packages per chunked scenario_index (chunked execution)
 
         Returns:
             Tuple of (List of ProcessResult objects, pickle_time_s, pickle_sample_mb)
             pickle_time_s: duration of submit loop (main-process serialization)
             pickle_sample_mb: serialized size of scenario 0 package (single sample)
+            Later windows of a single-pass span stay None (carried by the span lead).
         """
         # Auto-switch based on environment
         if is_debug_execution():
@@ -173,6 +193,7 @@ class ExecutionCoordinator:
         )
 
         results = [None] * len(scenarios)
+        chunk_results: Dict[int, List[Optional[ProcessResult]]] = {}
         pickle_time_s = 0.0
         pickle_sample_mb = 0.0
 
@@ -182,6 +203,10 @@ class ExecutionCoordinator:
             _t_submit = time.time()
             for idx, scenario in enumerate(scenarios):
 
+                # === SINGLE-PASS ROBUSTNESS: runs inside its span lead's process ===
+                if scenario.window_span_lead is not None:
+                    continue
+
                 # === CHECK VALIDATION STATUS ===
                 if not scenario.is_valid():
                     # Create failed result immediately
@@ -210,6 +235,19 @@ class ExecutionCoordinator:
                 if idx == 0:
                     pickle_sample_mb = len(pickle.dumps((executor_obj.config, scenario_data))) / 1024 / 1024
 
+                # === CHUNKED EXECUTION: one future per chunk ===
+                if scenario.chunks:
+                    chunk_results[idx] = [None] * len(scenario.chunks)
+                    for chunk, chunk_data in zip(scenario.chunks, chunk_packages[idx]):
+                        future = executor.submit(
+                            process_main,
+                            executor_obj.config.for_chunk(chunk),
+                            chunk_data,
+                            live_queue
+                        )
+                        futures[future] = (idx, chunk.position)
+                    continue
+
                 # Submit to executor with scenario-specific data
                 future = executor.submit(
                     process_main,
@@ -218,18 +256,21 @@ class ExecutionCoordinator:
                     scenario_data,
                     live_queue
                 )
-                futures[future] = idx
+                futures[future] = (idx, None)
 
             pickle_time_s = time.time() - _t_submit
 
             # Collect results (unchanged)
             for future in as_completed(futures):
-                idx = futures[future]
+                idx, chunk_position = futures[future]
                 readable_index = idx + 1
 
                 try:
                     result = future.result()
-                    results[idx] = result
+                    if chunk_position is None:
+                        results[idx] = result
+                    else:
+                        chunk_results[idx][chunk_position] = result
 
                     if result.success:
                         self._logger.debug(
@@ -248,7 +289,7 @@ class ExecutionCoordinator:
                         f"❌ Scenario {readable_index} crashed: "
                         f"\n{traceback.format_exc()}"
                     )
-                    results[idx] = ProcessResult(
+                    crashed = ProcessResult(
                         success=False,
                         scenario_name=scenarios[idx].name,
                         scenario_index=idx,
@@ -256,6 +297,13 @@ class ExecutionCoordinator:
                         error_message=str(e),
                         traceback=traceback.format_exc()
                     )
+                    if chunk_position is None:
+                        results[idx] = crashed
+                    else:
+                        chunk_results[idx][chunk_position] = crashed
+
+            for idx, chunk_list in chunk_results.items():
+                results[idx] = stitch_chunk_results(chunk_list, scenarios[idx].name, idx)
 
             self._logger.info(
                 "🕐 All futures collected, exiting context manager..."
@@ -23,6 +23,7 @@ from python.framework.logging.abstract_logger import AbstractLogger
 from python.framework.types.batch_execution_types import WarmupPhaseEntry
 from python.framework.types.live_types.live_stats_config_types import ScenarioStatus
 from python.framework.types.mount_package_types import DataIdentityKey, MountPackage
+from python.framework.types.process_data_types import RequirementsMap
 from python.framework.types.scenario_types.scenario_set_types import SingleScenario
 from python.framework.types.trading_env_types.broker_types import BrokerType
 from python.framework.validators.scenario_validator import ScenarioValidator
@@ -69,6 +70,22 @@ class MountPreparer:
         """Scenarios that failed validation."""
         return [scenario for scenario in scenarios if not scenario.is_valid()]
 
+    def _still_valid_requirements(
+        self,
+        requirements_map: RequirementsMap,
+        scenarios: List[SingleScenario],
+    ) -> RequirementsMap:
+        """Copy of a pre-collected requirements map without the scenarios excluded since."""
+        valid_names = {scenario.name for scenario in self._valid(scenarios)}
+        return RequirementsMap(
+            tick_requirements=[r for r in requirements_map.tick_requirements
+                               if r.scenario_name in valid_names],
+            bar_requirements=[r for r in requirements_map.bar_requirements
+                              if r.scenario_name in valid_names],
+            signal_requirements=[r for r in requirements_map.signal_requirements
+                                 if r.scenario_name in valid_names],
+        )
+
     def _broadcast(self, status: ScenarioStatus) -> None:
         """Broadcast a batch status if a broadcaster is wired (no-op for the AutoTrader)."""
         if self._live_stats is not None:
@@ -149,6 +166,8 @@ class MountPreparer:
         self,
         scenarios: List[SingleScenario],
         include_warmup_bars: bool = True,
+        prepared: Optional[Tuple[Dict[BrokerType, Dict[str, Any]], BrokerDataPreparator, WarmupPhaseEntry]] = None,
+        requirements_map: Optional[RequirementsMap] = None,
     ) -> MountPackage:
         """
         Prepare the reusable data mount: data-identity validation + data load + packaging.
@@ -164,6 +183,10 @@ class MountPreparer:
             include_warmup_bars: Prepare + validate warmup bars (sim default). The AutoTrader-mock
                 (#438) passes False: its adapter loads warmup bars itself (mock from the bar index,
                 live from the API), so the shared prepare skips bar preparation — ticks + signals only
+            prepared: Phase 0 result from prepare_scenarios() already run on these scenarios — reused
+                instead of validating again (the validators append to validation_result)
+            requirements_map: Requirements already collected for these scenarios — reused instead
+                of re-running the pre-flights; pruned to the scenarios still valid after Phase 2
 
         Returns:
             MountPackage with the loaded per-scenario data and the data identity that keys it
@@ -173,7 +196,9 @@ class MountPreparer:
 
         # Phase 0 — data-identity validation (broker prep + validators), extracted so the sweep
         # runner can prep a combination's scenarios without reloading (#419).
-        _broker_configs, _broker_preparator, _config_validation_phase = self.prepare_scenarios(scenarios)
+        if prepared is None:
+            prepared = self.prepare_scenarios(scenarios)
+        _broker_configs, _broker_preparator, _config_validation_phase = prepared
         warmup_phases.append(_config_validation_phase)
 
         # ========================================================================
@@ -230,8 +255,11 @@ class MountPreparer:
         _phase_t = time.time()
 
         # Collect requirements from valid scenarios only
-        requirements_map = self._requirements_collector.collect_and_validate(
-            self._valid(scenarios))
+        if requirements_map is None:
+            requirements_map = self._requirements_collector.collect_and_validate(
+                self._valid(scenarios))
+        else:
+            requirements_map = self._still_valid_requirements(requirements_map, scenarios)
 
         # AutoTrader-mock path (#438): the adapter loads warmup bars itself (mock from the bar
         # index, live from the API), so the shared prepare skips bar preparation entirely — no bar
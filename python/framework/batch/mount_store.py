@@ -0,0 +1,393 @@
+"""
+FiniexTestingIDE - Mount Store (#420)
+
+On-disk persistence for the reusable data mount (#417), so Phase 1–5 survive across CLI
+invocations. #419 reuses a MountPackage inside one OptimizationRunner.run; iterating on
+decision logic with repeated `strategy_runner_cli run` calls reloaded + re-packaged the same
+data every time. The store keeps a built mount on disk, keyed by its data identity, and
+BatchOrchestrator.run loads a matching one instead of preparing data.
+
+Cache key (SHA256) — everything that determines WHAT data a mount holds:
+- scenario windows: the per-scenario DataIdentityKey (broker / symbol / window / warmup /
+  tick budget) plus the signal requirements and the stale_data_stress config
+- file fingerprints: (path, size, mtime_ns) of every tick / bar / signal file of the
+  referenced archives — any import, re-render or deletion invalidates the entry
+- budget config: the tick processing budget (part of DataIdentityKey) and the serialized
+  broker configs the packages carry into the subprocesses
+
+Storage:
+    <data_processed>/.mount_cache/<key>/
+        mount.pkl        pickled payload (mount + per-scenario data-load state)
+        manifest.json    key inputs summary, created_at, size (human inspection)
+
+Loading memory-maps mount.pkl and unpickles straight from the mapping — no intermediate
+read buffer of the whole file. Entries beyond max_entries are evicted oldest-first.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import pickle
+import shutil
+import time
+from dataclasses import asdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from python.configuration.app_config_manager import AppConfigManager
+from python.data_management.index.bars_index_manager import BarsIndexManager
+from python.data_management.index.signal_index_manager import SignalIndexManager
+from python.data_management.index.tick_index_manager import TickIndexManager
+from python.framework.logging.abstract_logger import AbstractLogger
+from python.framework.types.mount_package_types import DataIdentityKey, MountPackage
+from python.framework.types.process_data_types import RequirementsMap
+from python.framework.types.scenario_types.scenario_set_types import SingleScenario
+
+
+class MountStore:
+    """
+    Persists MountPackages to disk, keyed by data identity (scenario windows, source file
+    fingerprints, tick budget + broker configs).
+
+    Only complete mounts are stored (every scenario of the set loaded) — a mount with an
+    excluded scenario could never match a fresh run of the same set.
+    """
+
+    CACHE_PARENT_DIR = ".mount_cache"
+    MOUNT_FILE = "mount.pkl"
+    MANIFEST_FILE = "manifest.json"
+
+    # Bump when the MountPackage / ProcessDataPackage layout changes — old entries become misses.
+    # 2: the scenario state keeps only the validation results of the load phases
+    STORE_FORMAT_VERSION = 2
+
+    def __init__(self, logger: AbstractLogger, app_config: AppConfigManager,
+                 cache_dir: Optional[Path] = None):
+        """
+        Initialize mount store.
+
+        Args:
+            logger: Logger for hit/miss/eviction messages
+            app_config: Application configuration (cache location + max entries)
+            cache_dir: Override cache directory (default: <data_processed>/.mount_cache)
+        """
+        self._logger = logger
+        self._app_config = app_config
+        self._cache_dir = Path(cache_dir) if cache_dir else (
+            Path(app_config.get_data_processed_path()) / self.CACHE_PARENT_DIR)
+        self._max_entries = app_config.get_mount_cache_max_entries()
+
+    # =========================================================================
+    # KEY
+    # =========================================================================
+
+    def compute_key(
+        self,
+        scenarios: List[SingleScenario],
+        requirements_map: RequirementsMap,
+        broker_configs: Dict[Any, Any],
+    ) -> str:
+        """
+        Compute the data-identity cache key for a prepped scenario list.
+
+        Args:
+            scenarios: Valid (Phase-0 prepped) scenarios
+            requirements_map: Their collected data requirements
+            broker_configs: Serialized broker configs from Phase 0
+
+        Returns:
+            SHA256 hex digest
+        """
+        identity = {
+            'format': self.STORE_FORMAT_VERSION,
+            'scenarios': [
+                self._scenario_identity(scenario, requirements_map)
+                for scenario in sorted(scenarios, key=lambda s: s.scenario_index)
+            ],
+            'files': self.file_fingerprints(requirements_map),
+            # BrokerType enum keys → their value (JSON object keys must be strings)
+            'broker_configs': {
+                str(getattr(broker_type, 'value', broker_type)): config
+                for broker_type, config in broker_configs.items()
+            },
+        }
+        normalized = json.dumps(
+            identity, sort_keys=True, separators=(',', ':'), default=str)
+        return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _scenario_identity(
+        scenario: SingleScenario,
+        requirements_map: RequirementsMap,
+    ) -> Dict[str, Any]:
+        """
+        Per-scenario identity: DataIdentityKey + signal requirements + stale-data stress.
+
+        Args:
+            scenario: The scenario to fingerprint
+            requirements_map: Collected requirements (warmup + signal)
+
+        Returns:
+            JSON-serializable identity dict
+        """
+        key = DataIdentityKey.from_scenario(
+            scenario, requirements_map.bar_requirements)
+        signal_reqs = sorted(
+            (req.signal_kind, req.data_sentiment_type, req.data_path,
+             str(req.start_time), str(req.end_time))
+            for req in requirements_map.signal_requirements
+            if req.scenario_name == scenario.name
+        )
+        return {
+            'index': scenario.scenario_index,
+            'name': scenario.name,
+            'data_identity': asdict(key),
+            'signals': signal_reqs,
+            'stress_test_config': scenario.stress_test_config or {},
+        }
+
+    def file_fingerprints(self, requirements_map: RequirementsMap) -> List[Tuple[str, int, int]]:
+        """
+        (path, size, mtime_ns) of every source file of the referenced archives.
+
+        Fingerprints the whole per-symbol archive, not only the files a window overlaps — a
+        newly imported file next to the window changes the key too (conservative, never stale).
+
+        Args:
+            requirements_map: Collected requirements
+
+        Returns:
+            Sorted list of (path, size, mtime_ns); missing files fingerprint as (path, -1, -1)
+        """
+        paths = set()
+
+        tick_pairs = {(req.broker_type, req.symbol)
+                      for req in requirements_map.tick_requirements}
+        if tick_pairs:
+            tick_index = TickIndexManager(self._logger)
+            tick_index.build_index()
+            for broker_type, symbol in tick_pairs:
+                for entry in tick_index.get_symbol_entries(broker_type, symbol):
+                    paths.add(entry['path'])
+
+        bar_keys = {(req.broker_type, req.symbol, req.timeframe)
+                    for req in requirements_map.bar_requirements}
+        if bar_keys:
+            bar_index = BarsIndexManager(self._logger)
+            bar_index.build_index()
+            for broker_type, symbol, timeframe in bar_keys:
+                entry = bar_index.index.get(broker_type, {}).get(symbol, {}).get(timeframe)
+                if entry is not None:
+                    paths.add(entry['path'])
+
+        signal_pairs = {(req.data_sentiment_type, req.symbol)
+                        for req in requirements_map.signal_requirements
+                        if req.data_sentiment_type}
+        if signal_pairs:
+            signal_index = SignalIndexManager(self._logger)
+            signal_index.build_index()
+            for sentiment_type, symbol in signal_pairs:
+                for entry in signal_index.index.get(sentiment_type, {}).get(symbol, []):
+                    paths.add(entry['path'])
+        for req in requirements_map.signal_requirements:
+            if req.data_path:
+                paths.add(str(Path(req.data_path).absolute()))
+
+        fingerprints = []
+        for path in sorted(paths):
+            try:
+                stat = os.stat(path)
+                fingerprints.append((path, stat.st_size, stat.st_mtime_ns))
+            except OSError:
+                fingerprints.append((path, -1, -1))
+        return fingerprints
+
+    # =========================================================================
+    # LOAD / SAVE
+    # =========================================================================
+
+    def load(self, key: str) -> Optional[Tuple[MountPackage, Dict[int, Dict[str, Any]]]]:
+        """
+        Load a persisted mount by key (memory-mapped unpickle).
+
+        Args:
+            key: Cache key from compute_key()
+
+        Returns:
+            (mount, scenario_state) or None on miss / unreadable entry
+        """
+        mount_file = self._cache_dir / key / self.MOUNT_FILE
+        if not mount_file.exists():
+            return None
+
+        start = time.time()
+        try:
+            with open(mount_file, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    payload = pickle.loads(mapped)
+        except Exception as e:
+            self._logger.warning(
+                f"⚠️ Persisted mount {key[:12]} unreadable ({e}) — discarding")
+            shutil.rmtree(mount_file.parent, ignore_errors=True)
+            return None
+
+        if payload.get('format') != self.STORE_FORMAT_VERSION:
+            return None
+
+        # Touch for LRU eviction order
+        os.utime(mount_file.parent)
+        self._logger.info(
+            f"♻️ Loaded persisted mount {key[:12]} "
+            f"({len(payload['mount'].scenario_packages)} package(s), "
+            f"{time.time() - start:.2f}s)")
+        return payload['mount'], payload['scenario_state']
+
+    def save(
+        self,
+        key: str,
+        mount: MountPackage,
+        scenarios: List[SingleScenario],
+        validation_offsets: Optional[Dict[int, int]] = None,
+    ) -> Optional[Path]:
+        """
+        Persist a freshly prepared mount.
+
+        Skipped when the mount is incomplete (a scenario was excluded during the load) — such a
+        mount can never satisfy matches_mount for the same set.
+
+        Args:
+            key: Cache key from compute_key()
+            mount: The prepared mount
+            scenarios: The scenarios it was prepared for (carry the data-load state)
+            validation_offsets: scenario_index → validation results recorded before Phases 1–5
+                (Phase 0 + pre-flights, re-recorded by every run — not persisted); None = all
+
+        Returns:
+            The entry directory, or None if nothing was written
+        """
+        if not mount.scenario_packages or any(
+                scenario.scenario_index not in mount.scenario_packages
+                for scenario in scenarios):
+            self._logger.debug(
+                "Mount not persisted — incomplete (scenario(s) excluded during load)")
+            return None
+
+        payload = {
+            'format': self.STORE_FORMAT_VERSION,
+            'mount': mount,
+            'scenario_state': self._capture_scenario_state(scenarios, validation_offsets or {}),
+        }
+
+        entry_dir = self._cache_dir / key
+        tmp_dir = self._cache_dir / f".{key}.tmp"
+        try:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            tmp_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_dir / self.MOUNT_FILE, 'wb') as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            manifest = {
+                'key': key,
+                'created_at': datetime.now(timezone.utc).isoformat(),
+                'scenarios': [s.name for s in scenarios],
+                'size_mb': round(
+                    (tmp_dir / self.MOUNT_FILE).stat().st_size / (1024 * 1024), 2),
+            }
+            with open(tmp_dir / self.MANIFEST_FILE, 'w') as f:
+                json.dump(manifest, f, indent=2)
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            tmp_dir.rename(entry_dir)
+        except Exception as e:
+            # Persistence is an accelerator — a failed write never fails the run
+            self._logger.warning(f"⚠️ Could not persist mount: {e}")
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            return None
+
+        self._logger.info(
+            f"💾 Mount persisted ({manifest['size_mb']} MB, key {key[:12]})")
+        self._evict()
+        return entry_dir
+
+    @staticmethod
+    def _capture_scenario_state(
+        scenarios: List[SingleScenario],
+        validation_offsets: Dict[int, int],
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Per-scenario state the data load writes onto the scenario objects.
+
+        A loaded mount skips Phases 1–5, so the fresh scenarios would miss what those phases
+        record — the loaded Parquet format versions and the advisory (valid) validation results.
+
+        Args:
+            scenarios: Scenarios after prepare_mount()
+            validation_offsets: scenario_index → validation results recorded before Phases 1–5
+
+        Returns:
+            scenario_index → {'data_format_versions', 'load_validation_result'}
+        """
+        return {
+            scenario.scenario_index: {
+                'data_format_versions': list(scenario.data_format_versions),
+                'load_validation_result': list(scenario.validation_result[
+                    validation_offsets.get(scenario.scenario_index, 0):]),
+            }
+            for scenario in scenarios
+        }
+
+    @staticmethod
+    def restore_scenario_state(
+        scenarios: List[SingleScenario],
+        scenario_state: Dict[int, Dict[str, Any]],
+    ) -> None:
+        """
+        Re-apply the captured data-load state onto freshly prepped scenarios.
+
+        The validation results the skipped phases produced are appended after the ones this run's
+        Phase 0 + pre-flights recorded.
+
+        Args:
+            scenarios: The scenarios about to execute against the loaded mount
+            scenario_state: From the persisted payload
+        """
+        for scenario in scenarios:
+            state = scenario_state.get(scenario.scenario_index)
+            if state is None:
+                continue
+            scenario.data_format_versions = list(state['data_format_versions'])
+            scenario.validation_result.extend(state['load_validation_result'])
+
+    # =========================================================================
+    # MAINTENANCE
+    # =========================================================================
+
+    def _evict(self) -> None:
+        """Drop the least recently used entries beyond max_entries."""
+        if self._max_entries <= 0 or not self._cache_dir.exists():
+            return
+        entries = sorted(
+            (d for d in self._cache_dir.iterdir()
+             if d.is_dir() and not d.name.startswith('.')),
+            key=lambda d: d.stat().st_mtime,
+            reverse=True,
+        )
+        for stale in entries[self._max_entries:]:
+            shutil.rmtree(stale, ignore_errors=True)
+            self._logger.debug(f"🗑️ Evicted persisted mount {stale.name[:12]}")
+
+    def clear(self) -> int:
+        """
+        Remove every persisted mount.
+
+        Returns:
+            Number of entries removed
+        """
+        if not self._cache_dir.exists():
+            return 0
+        removed = 0
+        for entry in self._cache_dir.iterdir():
+            if entry.is_dir():
+                shutil.rmtree(entry, ignore_errors=True)
+                removed += 1
+        return removed
@@ -23,7 +23,7 @@ from python.framework.logging.abstract_logger import AbstractLogger
 from python.framework.types.process_data_types import RequirementsMap
 from python.framework.types.scenario_types.scenario_set_types import SingleScenario
 from python.framework.types.validation_types import ValidationResult
-from python.framework.types.worker_types import SUBSCRIBE_ALL
+from python.framework.types.worker_types import SUBSCRIBE_ALL, WorkerType
 from python.framework.validators.algo_clock_validator import collect_algo_clock_violations
 from python.framework.validators.algo_state_preflight import validate_state_snapshot_serializable
 from python.framework.validators.scenario_data_validator import ScenarioDataValidator
@@ -202,6 +202,34 @@ class RequirementsCollector:
 
         return requirements_map
 
+    def calculate_warmup_requirements(self, scenario: SingleScenario) -> Dict[str, int]:
+        """
+        Warm-up bars per timeframe a scenario's workers need (max per timeframe).
+
+        The same calculate_requirements() classmethods Phase 3 aggregates — without
+        registering a data requirement. Used to size the warm-up overlap of a chunked
+        scenario's later chunks. SIGNAL workers need no bars and are skipped.
+
+        Args:
+            scenario: The scenario whose workers to size
+
+        Returns:
+            {timeframe: warmup_count}
+        """
+        warmup_by_timeframe: Dict[str, int] = {}
+        worker_instances = scenario.strategy_config.get('worker_instances', {})
+        workers_config = scenario.strategy_config.get('workers', {})
+        for instance_name, worker_type in worker_instances.items():
+            worker_class, _ = self._worker_factory.resolve_worker_class(worker_type)
+            if worker_class.get_worker_type() == WorkerType.SIGNAL:
+                continue
+            requirements = worker_class.calculate_requirements(
+                workers_config.get(instance_name, {}))
+            for timeframe, bars in requirements.items():
+                warmup_by_timeframe[timeframe] = max(
+                    warmup_by_timeframe.get(timeframe, 0), bars)
+        return warmup_by_timeframe
+
     def _algo_clock_preflight(self, scenario: SingleScenario) -> Optional[str]:
         """
         Pre-flight the scenario's algo sources for wall-clock reads (#359).
@@ -0,0 +1,234 @@
+"""
+FiniexTestingIDE - Scenario Chunk Planner
+Chunked execution: one long scenario runs as K time chunks in parallel processes.
+
+A single long tick scenario runs on one core however many the box has. With
+`execution_config.scenario_chunks: K` the planner cuts the scenario's loaded ticks into
+K chunks of equal tick count. Each chunk process trades its own range on a fresh
+portfolio; a later chunk's ticks start early by the strategy's warm-up bars
+(calculate_requirements) and those overlap ticks only render bars, so every chunk
+starts trading on a warmed-up pipeline. The overlap is sized by bar count over the
+loaded ticks — a weekend or market gap before a chunk start widens it in time.
+
+The chunk results are stitched back into one ProcessResult (scenario_chunk_stitcher) —
+the reports see one scenario. Positions still open at a chunk end are force-closed there;
+those boundary closes are the deviation from the sequential run and are reported through
+the block-boundary report.
+"""
+import bisect
+from dataclasses import replace
+from datetime import datetime, timezone
+from typing import Dict, List
+
+from python.framework.batch.requirements_collector import RequirementsCollector
+from python.framework.logging.abstract_logger import AbstractLogger
+from python.framework.types.process_data_types import ProcessDataPackage
+from python.framework.types.scenario_types.scenario_chunk_types import ScenarioChunk
+from python.framework.types.scenario_types.scenario_set_types import SingleScenario
+from python.framework.utils.process_serialization_utils import tick_time_msc
+from python.framework.utils.timeframe_config_utils import TimeframeConfig
+
+
+class ScenarioChunkPlanner:
+    """
+    Plans and packages chunked scenario execution.
+
+    Responsibilities:
+    - Cut opted-in scenarios into time chunks (tags the scenarios)
+    - Size each later chunk's warm-up overlap from the workers' requirements (in bars)
+    - Build one data package per chunk (overlap + trading range)
+    """
+
+    # A chunk must carry enough ticks to amortize its process startup
+    _MIN_CHUNK_TICKS = 1000
+
+    def __init__(self, logger: AbstractLogger, requirements_collector: RequirementsCollector):
+        """
+        Args:
+            logger: Batch logger
+            requirements_collector: Resolves the workers' warm-up requirements
+        """
+        self._logger = logger
+        self._requirements_collector = requirements_collector
+
+    def plan(
+        self,
+        scenarios: List[SingleScenario],
+        scenario_packages: Dict[int, ProcessDataPackage],
+    ) -> Dict[int, List[ScenarioChunk]]:
+        """
+        Cut every opted-in scenario into chunks and tag it accordingly.
+
+        Tags are reset first, so repeated execute() calls over one scenario list (sweeps)
+        plan afresh.
+
+        Args:
+            scenarios: The scenarios about to execute (index-synced with the packages)
+            scenario_packages: Loaded data per scenario_index
+
+        Returns:
+            Chunks per chunked scenario_index
+        """
+        for scenario in scenarios:
+            scenario.chunks = []
+
+        planned: Dict[int, List[ScenarioChunk]] = {}
+        for scenario in scenarios:
+            chunk_count = self._requested_chunks(scenario)
+            if chunk_count < 2 or not self._is_candidate(scenario, scenario_packages):
+                continue
+            ticks = scenario_packages[scenario.scenario_index].ticks.get(scenario.symbol, ())
+            chunk_count = min(chunk_count, len(ticks) // self._MIN_CHUNK_TICKS)
+            if chunk_count < 2:
+                self._logger.warning(
+                    f"⚠️ {scenario.name}: too few ticks to chunk ({len(ticks):,}) — runs whole")
+                continue
+
+            warmup_bars = self._requirements_collector.calculate_warmup_requirements(scenario)
+            chunks = self._cut(scenario, ticks, chunk_count, warmup_bars)
+            if len(chunks) < 2:
+                continue
+            scenario.chunks = chunks
+            planned[scenario.scenario_index] = chunks
+            overlap = ', '.join(f"{tf} x {bars}" for tf, bars in warmup_bars.items()) or 'none'
+            self._logger.info(
+                f"🧩 {scenario.name}: {len(chunks)} chunks in parallel "
+                f"(warm-up overlap {overlap} bars)")
+        return planned
+
+    def chunk_packages(
+        self,
+        scenarios: List[SingleScenario],
+        scenario_packages: Dict[int, ProcessDataPackage],
+    ) -> Dict[int, List[ProcessDataPackage]]:
+        """
+        One data package per chunk: its warm-up overlap + its trading range.
+
+        A chunk whose overlap reaches back to the scenario start keeps the loaded warm-up
+        bars and all earlier ticks; any later chunk carries no bars — its warm-up is
+        rendered from the overlap ticks.
+
+        Args:
+            scenarios: The planned scenarios
+            scenario_packages: Loaded data per scenario_index (not modified)
+
+        Returns:
+            Chunk packages (in chunk order) per chunked scenario_index
+        """
+        packages: Dict[int, List[ProcessDataPackage]] = {}
+        for scenario in scenarios:
+            if not scenario.chunks:
+                continue
+            symbol = scenario.symbol
+            package = scenario_packages[scenario.scenario_index]
+            ticks = package.ticks[symbol]
+            tick_msc = [tick_time_msc(tick) for tick in ticks]
+
+            chunk_list = []
+            for chunk in scenario.chunks:
+                first = (0 if chunk.warmup_start is None
+                         else bisect.bisect_left(tick_msc, _to_msc(chunk.warmup_start)))
+                until = (len(ticks) if chunk.end_time is None
+                         else bisect.bisect_left(tick_msc, _to_msc(chunk.end_time)))
+                chunk_ticks = tuple(ticks[first:until])
+                loaded_bars = chunk.warmup_start is None
+                chunk_list.append(replace(
+                    package,
+                    ticks={symbol: chunk_ticks},
+                    tick_counts={symbol: len(chunk_ticks)},
+                    tick_ranges={symbol: (
+                        _from_msc(tick_msc[first]), _from_msc(tick_msc[until - 1]))},
+                    bars=package.bars if loaded_bars else {},
+                    bar_counts=package.bar_counts if loaded_bars else {},
+                ))
+            packages[scenario.scenario_index] = chunk_list
+        return packages
+
+    def _cut(
+        self,
+        scenario: SingleScenario,
+        ticks,
+        chunk_count: int,
+        warmup_bars: Dict[str, int],
+    ) -> List[ScenarioChunk]:
+        """Chunk boundaries at equal tick counts (a boundary tick opens the later chunk)."""
+        tick_msc = [tick_time_msc(tick) for tick in ticks]
+        starts = [scenario.start_date]
+        for position in range(1, chunk_count):
+            start = _from_msc(tick_msc[len(ticks) * position // chunk_count])
+            if start > starts[-1]:
+                starts.append(start)
+
+        chunks = []
+        for position, start in enumerate(starts):
+            first = (_warmup_first_index(tick_msc, _to_msc(start), warmup_bars)
+                     if position > 0 else 0)
+            chunks.append(ScenarioChunk(
+                position=position,
+                chunk_count=len(starts),
+                start_time=start,
+                end_time=starts[position + 1] if position + 1 < len(starts) else None,
+                # An overlap reaching the scenario start reuses the loaded warm-up bars
+                warmup_start=_from_msc(tick_msc[first]) if first > 0 else None,
+            ))
+        return chunks
+
+    @staticmethod
+    def _requested_chunks(scenario: SingleScenario) -> int:
+        """The scenario's execution_config.scenario_chunks (1 = runs whole)."""
+        return int((scenario.execution_config or {}).get('scenario_chunks', 1) or 1)
+
+    @staticmethod
+    def _is_candidate(
+        scenario: SingleScenario,
+        scenario_packages: Dict[int, ProcessDataPackage],
+    ) -> bool:
+        """Whether a scenario can run chunked at all (one plain stack over one range)."""
+        return (
+            scenario.is_valid()
+            and scenario.scenario_index in scenario_packages
+            # Single-pass spans, extra stacks and pruning are whole-run concerns;
+            # a Profile Run block reports its own block-end disposition
+            and not scenario.window_span
+            and scenario.window_span_lead is None
+            and not scenario.decision_variants
+            and scenario.prune_rule is None
+            and not scenario.is_profile_run
+        )
+
+
+def _warmup_first_index(tick_msc: List[int], start_msc: int, warmup_bars: Dict[str, int]) -> int:
+    """
+    First tick of a chunk's warm-up overlap: enough ticks for the required bars per timeframe.
+
+    Walks back bar by bar over the bars that hold ticks — a gap without ticks renders no
+    bar, so it is skipped instead of counted. The overlap covers the chunk start's own bar
+    from its first tick plus the required complete bars before it.
+
+    Args:
+        tick_msc: The scenario's tick times (ascending)
+        start_msc: The chunk start
+        warmup_bars: {timeframe: warm-up bars}
+
+    Returns:
+        Index of the first overlap tick (0 = the overlap reaches the scenario start)
+    """
+    first = bisect.bisect_left(tick_msc, start_msc)
+    for timeframe, bars in warmup_bars.items():
+        bar_msc = TimeframeConfig.get_minutes(timeframe) * 60_000
+        index = bisect.bisect_left(tick_msc, start_msc // bar_msc * bar_msc)
+        for _ in range(bars):
+            if index == 0:
+                break
+            # The bar of the previous tick, from its first tick
+            index = bisect.bisect_left(tick_msc, tick_msc[index - 1] // bar_msc * bar_msc)
+        first = min(first, index)
+    return first
+
+
+def _to_msc(moment: datetime) -> int:
+    return int(moment.timestamp() * 1000)
+
+
+def _from_msc(msc: int) -> datetime:
+    return datetime.fromtimestamp(msc / 1000, tz=timezone.utc)
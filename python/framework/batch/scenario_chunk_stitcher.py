@@ -0,0 +1,380 @@
+"""
+FiniexTestingIDE - Scenario Chunk Stitcher
+Chunked execution: the K chunk results of one scenario, stitched into one ProcessResult.
+
+Stitching rules (chunks in time order):
+- Each chunk traded its range on a fresh portfolio; a position still open at a chunk end
+  was force-closed at the chunk's last tick (CloseReason.SCENARIO_END), a pending order
+  discarded. The sequential run would have carried both on — these are the deviation.
+- Trade and order histories are concatenated. Position ids restart per chunk process, so
+  later chunks' trades get a chunk suffix (`pos_btcusd_3_c2`).
+- Portfolio figures chain: P&L, counts and costs add up; each chunk's equity curve is
+  shifted by the realized P&L of the chunks before it (max equity, drawdown and balances).
+  A drawdown is joined across a boundary from the carried-in peak and each chunk's lowest
+  equity (a chunk's own drawdown only measures from its fresh start).
+- The block-boundary report carries the deviation only: the earlier chunks' force-closes
+  and discarded orders. The last chunk's scenario-end closes happen in the sequential
+  run too and count as natural.
+"""
+from dataclasses import replace
+from typing import Dict, List, Optional
+
+from python.framework.process.process_block_boundary import build_block_boundary_report
+from python.framework.types.disturbance_episode_types import MarketDataTickStats
+from python.framework.types.performance_types.performance_stats_types import (
+    DecisionLogicStats, WorkerCoordinatorPerformanceStats, WorkerPerformanceStats)
+from python.framework.types.portfolio_types.portfolio_aggregation_types import PortfolioStats
+from python.framework.types.process_data_types import (
+    BlockBoundaryReport, ProcessProfileData, ProcessResult, ProcessTickLoopResult, TickRangeStats)
+from python.framework.types.signal_data_types import SignalResolutionStats
+from python.framework.types.trading_env_types.pending_order_stats_types import PendingOrderStats
+from python.framework.types.trading_env_types.trading_env_stats_types import CostBreakdown, ExecutionStats
+
+
+def stitch_chunk_results(
+    chunk_results: List[ProcessResult],
+    scenario_name: str,
+    scenario_index: int,
+) -> ProcessResult:
+    """
+    Stitch the chunk process results of one scenario into the scenario's result.
+
+    Args:
+        chunk_results: One result per chunk, in chunk order
+        scenario_name: The chunked scenario's name
+        scenario_index: The chunked scenario's index
+
+    Returns:
+        One ProcessResult reporting as the scenario. A failed chunk fails the scenario
+        with its error; the tick loop results are stitched whenever every chunk has one.
+    """
+    failed = next((result for result in chunk_results if not result.success), None)
+    tick_loops = [result.tick_loop_results for result in chunk_results]
+    if all(tick_loops):
+        tick_loop_results = stitch_tick_loop_results(tick_loops)
+    else:
+        tick_loop_results = failed.tick_loop_results if failed else None
+
+    logger_buffer = []
+    for result in chunk_results:
+        logger_buffer.extend(result.scenario_logger_buffer or [])
+
+    return ProcessResult(
+        success=failed is None,
+        scenario_name=scenario_name,
+        scenario_index=scenario_index,
+        execution_time_ms=sum(result.execution_time_ms for result in chunk_results),
+        error_type=failed.error_type if failed else None,
+        error_message=failed.error_message if failed else None,
+        traceback=failed.traceback if failed else None,
+        tick_loop_results=tick_loop_results,
+        scenario_logger_buffer=logger_buffer,
+    )
+
+
+def stitch_tick_loop_results(tick_loops: List[ProcessTickLoopResult]) -> ProcessTickLoopResult:
+    """
+    Stitch the tick loop results of consecutive chunks (see module rules).
+
+    Args:
+        tick_loops: One tick loop result per chunk, in chunk order
+
+    Returns:
+        The scenario's tick loop result
+    """
+    first, last = tick_loops[0], tick_loops[-1]
+
+    trade_history = []
+    order_history = []
+    for position, loop in enumerate(tick_loops):
+        for record in loop.trade_history or []:
+            trade_history.append(record if position == 0 else replace(
+                record, position_id=f"{record.position_id}_c{position + 1}"))
+        order_history.extend(loop.order_history or [])
+
+    ticks_before = 0
+    worker_offsets = []
+    for loop in tick_loops:
+        worker_offsets.append(ticks_before)
+        ticks_before += loop.coordination_statistics.ticks_processed
+
+    return ProcessTickLoopResult(
+        decision_statistics=_stitch_decision_stats([l.decision_statistics for l in tick_loops]),
+        worker_statistics=_stitch_worker_stats(
+            [l.worker_statistics or [] for l in tick_loops], worker_offsets),
+        signal_statistics=_stitch_signal_stats([l.signal_statistics or [] for l in tick_loops]),
+        disturbance_episodes=[
+            episode for loop in tick_loops for episode in loop.disturbance_episodes or []],
+        market_data_tick_stats=_stitch_market_data_tick_stats(
+            [l.market_data_tick_stats for l in tick_loops]),
+        coordination_statistics=WorkerCoordinatorPerformanceStats(
+            parallel_workers=first.coordination_statistics.parallel_workers,
+            ticks_processed=ticks_before,
+            parallel_time_saved_ms=sum(
+                l.coordination_statistics.parallel_time_saved_ms for l in tick_loops),
+        ),
+        portfolio_stats=_stitch_portfolio_stats([l.portfolio_stats for l in tick_loops]),
+        execution_stats=ExecutionStats(
+            orders_sent=sum(l.execution_stats.orders_sent for l in tick_loops),
+            orders_executed=sum(l.execution_stats.orders_executed for l in tick_loops),
+            orders_rejected=sum(l.execution_stats.orders_rejected for l in tick_loops),
+            sl_tp_triggered=sum(l.execution_stats.sl_tp_triggered for l in tick_loops),
+        ),
+        cost_breakdown=_stitch_cost_breakdown([l.cost_breakdown for l in tick_loops]),
+        trade_history=trade_history,
+        order_history=order_history,
+        pending_stats=_stitch_pending_stats([l.pending_stats for l in tick_loops]),
+        profiling_data=_stitch_profiling([l.profiling_data for l in tick_loops]),
+        tick_range_stats=_stitch_tick_ranges(first.tick_range_stats, last.tick_range_stats,
+                                             [l.tick_range_stats for l in tick_loops]),
+        block_boundary_report=stitch_block_boundary_report(tick_loops),
+        tick_loop_error=next(
+            (l.tick_loop_error for l in tick_loops if l.tick_loop_error is not None), None),
+    )
+
+
+def stitch_block_boundary_report(tick_loops: List[ProcessTickLoopResult]) -> BlockBoundaryReport:
+    """
+    The deviation of a chunked run from the sequential run, as a block-boundary report.
+
+    Args:
+        tick_loops: One tick loop result per chunk, in chunk order
+
+    Returns:
+        Force-closed = closed at an inner chunk boundary; natural = everything else
+    """
+    boundaries = [
+        build_block_boundary_report(loop.trade_history or [], loop.pending_stats)
+        for loop in tick_loops[:-1]]
+    final_trades = tick_loops[-1].trade_history or []
+    return BlockBoundaryReport(
+        force_closed_trades=sum(b.force_closed_trades for b in boundaries),
+        force_closed_pnl=sum(b.force_closed_pnl for b in boundaries),
+        natural_closed_trades=(
+            sum(b.natural_closed_trades for b in boundaries) + len(final_trades)),
+        natural_closed_pnl=(
+            sum(b.natural_closed_pnl for b in boundaries)
+            + sum(trade.net_pnl for trade in final_trades)),
+        discarded_pending_orders=sum(b.discarded_pending_orders for b in boundaries),
+    )
+
+
+# ============================================
+# Per-type stitching
+# ============================================
+
+def _stitch_portfolio_stats(stats: List[PortfolioStats]) -> PortfolioStats:
+    """Chain the chunks' portfolios: each equity curve shifted by the P&L before it."""
+    first, last = stats[0], stats[-1]
+    shift = 0.0
+    running_peak = first.initial_balance
+    max_equity = first.initial_balance
+    min_equity = first.initial_balance
+    max_drawdown = 0.0
+    for chunk in stats:
+        # The chunk starts flat — at the sequential equity of its boundary. Sequentially,
+        # every drop is measured from max(carried-in peak, the chunk's own peak so far):
+        # the chunk's own drawdown covers the second, its lowest equity the first.
+        lowest = (chunk.min_equity if chunk.min_equity is not None
+                  else chunk.initial_balance) + shift
+        max_drawdown = max(max_drawdown, chunk.max_drawdown, running_peak - lowest)
+        max_equity = max(max_equity, chunk.max_equity + shift)
+        min_equity = min(min_equity, lowest)
+        running_peak = max(running_peak, chunk.max_equity + shift)
+        shift += chunk.current_balance - chunk.initial_balance
+
+    total_trades = sum(s.total_trades for s in stats)
+    winning_trades = sum(s.winning_trades for s in stats)
+    total_profit = sum(s.total_profit for s in stats)
+    total_loss = sum(s.total_loss for s in stats)
+    if total_loss > 0:
+        profit_factor = total_profit / total_loss
+    else:
+        profit_factor = 0.0 if total_profit == 0 else float('inf')
+
+    balances = dict(first.initial_balances)
+    for chunk in stats:
+        for currency, balance in chunk.balances.items():
+            balances[currency] = (
+                balances.get(currency, 0.0) + balance - chunk.initial_balances.get(currency, 0.0))
+
+    return replace(
+        last,
+        total_trades=total_trades,
+        total_long_trades=sum(s.total_long_trades for s in stats),
+        total_short_trades=sum(s.total_short_trades for s in stats),
+        winning_trades=winning_trades,
+        losing_trades=sum(s.losing_trades for s in stats),
+        total_profit=total_profit,
+        total_loss=total_loss,
+        max_drawdown=max_drawdown,
+        max_equity=max_equity,
+        min_equity=min_equity,
+        win_rate=winning_trades / total_trades if total_trades > 0 else 0.0,
+        profit_factor=profit_factor,
+        total_spread_cost=sum(s.total_spread_cost for s in stats),
+        total_commission=sum(s.total_commission for s in stats),
+        total_swap=sum(s.total_swap for s in stats),
+        maker_fee=sum(s.maker_fee for s in stats),
+        taker_fee=sum(s.taker_fee for s in stats),
+        total_fees=sum(s.total_fees for s in stats),
+        current_balance=first.initial_balance + shift,
+        initial_balance=first.initial_balance,
+        balances=balances if first.initial_balances else last.balances,
+        initial_balances=dict(first.initial_balances),
+    )
+
+
+def _stitch_cost_breakdown(costs: List[CostBreakdown]) -> CostBreakdown:
+    return CostBreakdown(
+        total_spread_cost=sum(c.total_spread_cost for c in costs),
+        total_commission=sum(c.total_commission for c in costs),
+        total_swap=sum(c.total_swap for c in costs),
+        maker_fee=sum(c.maker_fee for c in costs),
+        taker_fee=sum(c.taker_fee for c in costs),
+        total_fees=sum(c.total_fees for c in costs),
+        currency=costs[-1].currency,
+    )
+
+
+def _stitch_pending_stats(stats: List[Optional[PendingOrderStats]]) -> Optional[PendingOrderStats]:
+    """Counters add up, the latency average is re-weighted; open snapshots are the last chunk's."""
+    present = [s for s in stats if s is not None]
+    if not present:
+        return None
+    latency_sum = sum(s._latency_ms_sum for s in present)
+    latency_count = sum(s.get_latency_count() for s in present)
+    minimums = [s.min_latency_ms for s in present if s.min_latency_ms is not None]
+    maximums = [s.max_latency_ms for s in present if s.max_latency_ms is not None]
+    last = present[-1]
+    return PendingOrderStats(
+        total_resolved=sum(s.total_resolved for s in present),
+        total_filled=sum(s.total_filled for s in present),
+        total_rejected=sum(s.total_rejected for s in present),
+        total_timed_out=sum(s.total_timed_out for s in present),
+        total_force_closed=sum(s.total_force_closed for s in present),
+        avg_latency_ms=latency_sum / latency_count if latency_count else 0.0,
+        min_latency_ms=min(minimums) if minimums else None,
+        max_latency_ms=max(maximums) if maximums else None,
+        anomaly_orders=[order for s in present for order in s.anomaly_orders],
+        active_limit_orders=list(last.active_limit_orders),
+        active_stop_orders=list(last.active_stop_orders),
+        latency_queue_count=last.latency_queue_count,
+        _latency_ms_sum=latency_sum,
+        _latency_count=latency_count,
+    )
+
+
+def _stitch_decision_stats(stats: List[DecisionLogicStats]) -> DecisionLogicStats:
+    active = [s for s in stats if s.decision_count > 0]
+    decision_count = sum(s.decision_count for s in stats)
+    total_time_ms = sum(s.decision_total_time_ms for s in stats)
+    return replace(
+        stats[-1],
+        decision_logic_type=stats[0].decision_logic_type,
+        decision_logic_name=stats[0].decision_logic_name,
+        decision_count=decision_count,
+        buy_signals=sum(s.buy_signals for s in stats),
+        sell_signals=sum(s.sell_signals for s in stats),
+        flat_signals=sum(s.flat_signals for s in stats),
+        trades_requested=sum(s.trades_requested for s in stats),
+        decision_total_time_ms=total_time_ms,
+        decision_avg_time_ms=total_time_ms / decision_count if decision_count else 0.0,
+        decision_min_time_ms=min((s.decision_min_time_ms for s in active), default=0.0),
+        decision_max_time_ms=max((s.decision_max_time_ms for s in active), default=0.0),
+    )
+
+
+def _stitch_worker_stats(
+    per_chunk: List[List[WorkerPerformanceStats]],
+    tick_offsets: List[int],
+) -> List[WorkerPerformanceStats]:
+    """Same workers in every chunk (same order) — calls add up, last compute tick is global."""
+    stitched = []
+    for position, worker in enumerate(per_chunk[0]):
+        chunks = [stats[position] for stats in per_chunk]
+        active = [w for w in chunks if w.worker_call_count > 0]
+        call_count = sum(w.worker_call_count for w in chunks)
+        total_time_ms = sum(w.worker_total_time_ms for w in chunks)
+        last_compute_tick = -1
+        for offset, w in zip(tick_offsets, chunks):
+            if w.worker_last_compute_tick >= 0:
+                last_compute_tick = offset + w.worker_last_compute_tick
+        stitched.append(replace(
+            worker,
+            worker_call_count=call_count,
+            worker_total_time_ms=total_time_ms,
+            worker_avg_time_ms=total_time_ms / call_count if call_count else 0.0,
+            worker_min_time_ms=min((w.worker_min_time_ms for w in active), default=0.0),
+            worker_max_time_ms=max((w.worker_max_time_ms for w in active), default=0.0),
+            worker_last_compute_tick=last_compute_tick,
+            worker_cache_hits=sum(w.worker_cache_hits for w in chunks),
+            worker_cache_misses=sum(w.worker_cache_misses for w in chunks),
+        ))
+    return stitched
+
+
+def _stitch_signal_stats(per_chunk: List[List[SignalResolutionStats]]) -> List[SignalResolutionStats]:
+    return [
+        replace(
+            signal,
+            fresh_ticks=sum(stats[position].fresh_ticks for stats in per_chunk),
+            stale_ticks=sum(stats[position].stale_ticks for stats in per_chunk),
+            blind_ticks=sum(stats[position].blind_ticks for stats in per_chunk),
+            off_tick_arrivals=sum(stats[position].off_tick_arrivals for stats in per_chunk),
+        )
+        for position, signal in enumerate(per_chunk[0])
+    ]
+
+
+def _stitch_market_data_tick_stats(
+    stats: List[Optional[MarketDataTickStats]],
+) -> Optional[MarketDataTickStats]:
+    present = [s for s in stats if s is not None]
+    if not present:
+        return None
+    return MarketDataTickStats(
+        source=present[0].source,
+        fresh_ticks=sum(s.fresh_ticks for s in present),
+        stale_ticks=sum(s.stale_ticks for s in present),
+    )
+
+
+def _stitch_profiling(profiles: List[Optional[ProcessProfileData]]) -> Optional[ProcessProfileData]:
+    present = [p for p in profiles if p is not None]
+    if not present:
+        return None
+    times: Dict = {}
+    counts: Dict = {}
+    intervals: List[float] = []
+    for profile in present:
+        for key, value in (profile.profile_times or {}).items():
+            times[key] = times.get(key, 0.0) + value
+        for key, value in (profile.profile_counts or {}).items():
+            counts[key] = counts.get(key, 0) + value
+        intervals.extend(profile.inter_tick_intervals_ms or [])
+    return ProcessProfileData(
+        profile_times=times,
+        profile_counts=counts,
+        inter_tick_intervals_ms=intervals,
+        gap_threshold_s=present[0].gap_threshold_s,
+        ticks_total=sum(p.ticks_total for p in present),
+    )
+
+
+def _stitch_tick_ranges(
+    first: Optional[TickRangeStats],
+    last: Optional[TickRangeStats],
+    ranges: List[Optional[TickRangeStats]],
+) -> Optional[TickRangeStats]:
+    if first is None or last is None:
+        return last
+    timespan = None
+    if first.first_tick_time and last.last_tick_time:
+        timespan = (last.last_tick_time - first.first_tick_time).total_seconds()
+    return TickRangeStats(
+        tick_count=sum(r.tick_count for r in ranges if r is not None),
+        first_tick_time=first.first_tick_time,
+        last_tick_time=last.last_tick_time,
+        tick_timespan_seconds=timespan,
+    )
@@ -0,0 +1,223 @@
+"""
+FiniexTestingIDE - Window Span Planner
+Single-pass robustness execution: folds adjacent windows into one process per span.
+
+A robustness set (blocks_split / continuous generator) often tiles one contiguous
+period into adjacent IS/OOS windows. With `robustness.single_pass` the planner chains
+windows that touch (end == next start) and share everything but their time range into
+a span: the lead window's process runs the span's ticks once — warm-up is paid once —
+and resets the portfolio + trade simulator at every window boundary. The span's result
+is cut back into one ProcessResult per window afterwards, so every report (incl. the
+robustness report) sees exactly the per-window results a separate run produces.
+
+The mount itself is untouched: it stays keyed per window (sweeps / the persisted mount
+cache reuse it); only the lead's data package is widened to the span's ticks.
+"""
+from dataclasses import replace
+from typing import Dict, List, Optional, Tuple
+
+from python.framework.logging.abstract_logger import AbstractLogger
+from python.framework.types.process_data_types import ProcessDataPackage, ProcessResult
+from python.framework.types.scenario_types.scenario_set_types import SingleScenario
+from python.framework.types.scenario_types.window_span_types import WindowBoundary
+from python.framework.utils.process_serialization_utils import tick_time_msc
+
+
+class WindowSpanPlanner:
+    """
+    Plans, packages and splits single-pass robustness spans.
+
+    Responsibilities:
+    - Chain adjacent, parameter-identical windows into spans (tags the scenarios)
+    - Build the lead window's span-wide data package
+    - Cut the lead's process result back into per-window results
+    """
+
+    # Everything a window run depends on besides its time range — must match across a span
+    _SPAN_INVARIANT_FIELDS = (
+        'symbol', 'data_broker_type', 'broker_type', 'strategy_config', 'execution_config',
+        'trade_simulator_config', 'stress_test_config', 'order_guard_config',
+    )
+
+    def __init__(self, logger: AbstractLogger):
+        """
+        Args:
+            logger: Batch logger
+        """
+        self._logger = logger
+
+    def plan(
+        self,
+        scenarios: List[SingleScenario],
+        scenario_packages: Dict[int, ProcessDataPackage],
+    ) -> Dict[int, List[int]]:
+        """
+        Chain adjacent windows into spans and tag the scenarios accordingly.
+
+        Tags are reset first, so repeated execute() calls over one scenario list (sweeps)
+        plan afresh.
+
+        Args:
+            scenarios: The scenarios about to execute (index-synced with the packages)
+            scenario_packages: Loaded data per scenario_index
+
+        Returns:
+            Span per lead scenario_index → the later windows' scenario indices (spans of 2+)
+        """
+        for scenario in scenarios:
+            scenario.window_span = []
+            scenario.window_span_lead = None
+
+        candidates = sorted(
+            (s for s in scenarios if self._is_candidate(s, scenario_packages)),
+            key=lambda s: (s.data_broker_type, s.symbol, s.start_date))
+
+        spans: Dict[int, List[int]] = {}
+        chain: List[SingleScenario] = []
+        for scenario in candidates:
+            if chain and self._continues(chain[-1], scenario, scenario_packages):
+                chain.append(scenario)
+                continue
+            self._close_chain(chain, spans)
+            chain = [scenario]
+        self._close_chain(chain, spans)
+
+        if spans:
+            folded = sum(len(followers) + 1 for followers in spans.values())
+            self._logger.info(
+                f"🪟 Single-pass robustness: {folded} windows run as {len(spans)} span(s)")
+        return spans
+
+    def span_packages(
+        self,
+        scenarios: List[SingleScenario],
+        scenario_packages: Dict[int, ProcessDataPackage],
+    ) -> Dict[int, ProcessDataPackage]:
+        """
+        The packages to execute with: each span lead's package widened to the span's ticks.
+
+        Each window contributes its ticks from its own start up to the next window's start —
+        a tick on a shared boundary belongs to the later window.
+
+        Args:
+            scenarios: The planned scenarios
+            scenario_packages: Loaded data per scenario_index (not modified)
+
+        Returns:
+            A new package dict (non-lead packages shared as-is)
+        """
+        packages = dict(scenario_packages)
+        for lead in scenarios:
+            if not lead.window_span:
+                continue
+            symbol = lead.symbol
+            starts = [lead.start_date] + [b.start_time for b in lead.window_span]
+            windows = [lead.scenario_index] + [b.scenario_index for b in lead.window_span]
+            ticks: List = []
+            for position, index in enumerate(windows):
+                until = starts[position + 1] if position + 1 < len(starts) else None
+                ticks.extend(self._clip_ticks(
+                    scenario_packages[index].ticks[symbol], starts[position], until))
+
+            lead_package = scenario_packages[lead.scenario_index]
+            first_range = lead_package.tick_ranges.get(symbol)
+            last_range = scenario_packages[windows[-1]].tick_ranges.get(symbol)
+            packages[lead.scenario_index] = replace(
+                lead_package,
+                ticks={symbol: tuple(ticks)},
+                tick_counts={symbol: len(ticks)},
+                tick_ranges=(
+                    {symbol: (first_range[0], last_range[1])}
+                    if first_range and last_range else lead_package.tick_ranges),
+            )
+        return packages
+
+    def expand_results(
+        self,
+        results: List[Optional[ProcessResult]],
+        scenarios: List[SingleScenario],
+    ) -> List[ProcessResult]:
+        """
+        Cut each span lead's process result into one result per window.
+
+        Args:
+            results: Execution results (later windows of a span still None)
+            scenarios: The planned scenarios (index-synced with results)
+
+        Returns:
+            The results list, every window filled
+        """
+        for idx, scenario in enumerate(scenarios):
+            if not scenario.window_span or results[idx] is None:
+                continue
+            lead_result = results[idx]
+            for position, boundary in enumerate(scenario.window_span, 1):
+                results[boundary.scenario_index] = lead_result.for_span_window(position, boundary)
+            results[idx] = lead_result.for_span_window(0)
+        return results
+
+    def _is_candidate(
+        self,
+        scenario: SingleScenario,
+        scenario_packages: Dict[int, ProcessDataPackage],
+    ) -> bool:
+        """Whether a window can be part of a span at all (time-bounded, one plain stack)."""
+        package = scenario_packages.get(scenario.scenario_index)
+        return (
+            scenario.is_valid()
+            and package is not None
+            and scenario.end_date is not None
+            and scenario.max_ticks is None
+            # Extra stacks / pruning / SIGNAL data are per-run concerns a span cannot share
+            and not scenario.decision_variants
+            and scenario.prune_rule is None
+            and not scenario.data_sentiment_type
+            and not package.signal_series
+        )
+
+    def _continues(
+        self,
+        previous: SingleScenario,
+        scenario: SingleScenario,
+        scenario_packages: Dict[int, ProcessDataPackage],
+    ) -> bool:
+        """Whether a window directly continues the previous one (touching, same run config)."""
+        if previous.end_date != scenario.start_date:
+            return False
+        if any(getattr(previous, name) != getattr(scenario, name)
+               for name in self._SPAN_INVARIANT_FIELDS):
+            return False
+        # A window without a tick of its own after the boundary would report empty
+        ticks = scenario_packages[scenario.scenario_index].ticks.get(scenario.symbol, ())
+        return bool(self._clip_ticks(ticks, scenario.start_date, None))
+
+    def _close_chain(
+        self,
+        chain: List[SingleScenario],
+        spans: Dict[int, List[int]],
+    ) -> None:
+        """Tag a finished chain as a span (a single window keeps running on its own)."""
+        if len(chain) < 2:
+            return
+        lead = chain[0]
+        lead.window_span = [
+            WindowBoundary(name=s.name, scenario_index=s.scenario_index, start_time=s.start_date)
+            for s in chain[1:]]
+        for follower in chain[1:]:
+            follower.window_span_lead = lead.scenario_index
+        spans[lead.scenario_index] = [s.scenario_index for s in chain[1:]]
+
+    @staticmethod
+    def _clip_ticks(ticks: Tuple, start, until) -> List:
+        """Ticks with start <= t < until (until None = open end), in either transport form."""
+        start_msc = int(start.timestamp() * 1000)
+        until_msc = int(until.timestamp() * 1000) if until is not None else None
+        clipped = []
+        for tick in ticks:
+            msc = tick_time_msc(tick)
+            if msc < start_msc:
+                continue
+            if until_msc is not None and msc >= until_msc:
+                break
+            clipped.append(tick)
+        return clipped
@@ -14,6 +14,7 @@ from pathlib import Path
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 import time
+import numpy as np
 import pandas as pd
 
 from python.framework.logging.scenario_logger import ScenarioLogger
@@ -38,6 +39,7 @@ from python.data_management.index.bars_index_manager import BarsIndexManager
 from python.framework.types.scenario_types.scenario_set_types import SingleScenario
 from python.framework.types.validation_types import ValidationResult
 from python.framework.utils.process_serialization_utils import serialize_ticks_for_transport, time_range_from_transport_ticks
+from python.framework.utils.tick_budget_utils import compute_clipping_flags
 from python.framework.utils.time_utils import ensure_utc_aware
 from python.framework.types.signal_data_types import SignalSeries
 
@@ -69,12 +71,6 @@ class SharedDataPreparator:
         """
         self._logger = logger
 
-        # Cache for pre-converted file timestamps: (broker_type, symbol) →
-        # List[Tuple[Timestamp, Timestamp, str]] (start, end, version)
-        # Avoids repeated pd.to_datetime calls in _collect_parquet_versions (O(n_scenarios×n_files) → O(n_files))
-        self._file_ts_cache: Dict[Tuple[str, str],
-                                  List[Tuple[Any, Any, str]]] = {}
-
         # Use existing index managers
         self._logger.debug("📚 Initializing index managers...")
 
@@ -388,32 +384,16 @@ class SharedDataPreparator:
         if symbol not in self.tick_index_manager.index[broker_type]:
             return []
 
-        files = self.tick_index_manager.index[broker_type][symbol]
-
         if tick_range is None:
+            files = self.tick_index_manager.index[broker_type][symbol]
             return [f.get('data_format_version', 'unknown') for f in files]
 
-        # Pre-convert file timestamps once per (broker_type, symbol).
-        # pd.to_datetime on a single string is ~150-200µs — calling it N_scenarios × N_files
-        # times blows up to 10-20s for large symbol sets. Cache eliminates all repeated calls.
-        cache_key = (broker_type, symbol)
-        if cache_key not in self._file_ts_cache:
-            self._file_ts_cache[cache_key] = [
-                (
-                    pd.to_datetime(f['start_time'], utc=True),
-                    pd.to_datetime(f['end_time'], utc=True),
-                    f.get('data_format_version', 'unknown')
-                )
-                for f in files
-            ]
-        file_ranges = self._file_ts_cache[cache_key]
-
-        # File overlaps if it starts before range ends AND ends after range starts
+        # Interval lookup on the index (timestamps parsed once per symbol)
         range_start, range_end = tick_range
         return [
-            version
-            for file_start, file_end, version in file_ranges
-            if file_start <= range_end and file_end >= range_start
+            f.get('data_format_version', 'unknown')
+            for f in self.tick_index_manager.get_overlapping_entries(
+                broker_type, symbol, range_start, range_end)
         ]
 
     def _filter_ticks_for_scenario(
@@ -506,21 +486,18 @@ class SharedDataPreparator:
                 budget_ms=budget_ms
             )
 
-        # Virtual clock flagging — all ticks kept, clipped ones flagged
-        virtual_clock = 0.0
-        flagged_ticks = []
-        ticks_kept = 0
-
-        for tick in ticks_tuple:
-            tick_copy = dict(tick)
-            collected_msc = tick_copy['collected_msc']
-            if collected_msc >= virtual_clock:
-                tick_copy['is_clipped'] = False
-                virtual_clock = collected_msc + budget_ms
-                ticks_kept += 1
-            else:
-                tick_copy['is_clipped'] = True
-            flagged_ticks.append(tick_copy)
+        # Virtual clock flagging — all ticks kept, clipped ones flagged.
+        # The boolean column is computed on a NumPy array; dicts are only
+        # copied once to attach the flag (originals stay untouched).
+        collected = np.fromiter(
+            (tick['collected_msc'] for tick in ticks_tuple),
+            dtype=np.float64, count=ticks_total)
+        clipped_flags = compute_clipping_flags(collected, budget_ms)
+        flagged_ticks = [
+            {**tick, 'is_clipped': is_clipped}
+            for tick, is_clipped in zip(ticks_tuple, clipped_flags.tolist())
+        ]
+        ticks_kept = ticks_total - int(clipped_flags.sum())
 
         ticks_clipped = ticks_total - ticks_kept
         clipping_rate = (ticks_clipped / ticks_total *
@@ -12,6 +12,8 @@ from collections import deque
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
 
+import numpy as np
+
 from python.configuration.app_config_manager import AppConfigManager
 from python.framework.logging.scenario_logger import ScenarioLogger
 from python.framework.reporting.diagnostics_csv_sink import DiagnosticsCsvSink
@@ -30,6 +32,7 @@ from python.framework.types.decision_event_types import (
 from python.framework.types.market_types.market_data_types import TickData
 from python.framework.types.market_types.market_types import TradingContext
 from python.framework.types.persistence_types import RestoreContext
+from python.framework.types.screening_types import BarSeries, ScreeningSignals
 from python.framework.types.trading_env_types.market_data_status_types import MarketDataStatus
 from python.framework.types.trading_env_types.order_types import OrderResult, OrderType
 from python.framework.types.parameter_types import InputParamDef, OutputParamDef, ValidatedParameters
@@ -342,6 +345,29 @@ class AbstractDecisionLogic(ABC):
         """
         return None
 
+    def compute_signals(
+        self,
+        worker_series: Dict[str, Dict[str, np.ndarray]],
+        bars: BarSeries,
+    ) -> Optional[ScreeningSignals]:
+        """
+        Array form of the decision for the vectorized screening sweep (optional hook).
+
+        Evaluates the decision once per bar close over the whole screened range: each
+        worker's batch outputs are aligned to `bars` (index i = the value known when bar
+        i closes, NaN while the worker has no value yet). Must mirror compute_tick() on
+        the bar-close grid, position handling included. The default None marks the
+        logic as not screenable — the sweep rejects it before any tick run.
+
+        Args:
+            worker_series: Dict[instance_name, Dict[output, array aligned to bars]]
+            bars: The screened base-timeframe bars
+
+        Returns:
+            Entry/exit arrays aligned to bars, or None (no array form)
+        """
+        return None
+
     # ============================================
     # AwarenessChannel — ephemeral narration
     # ============================================
@@ -44,6 +44,8 @@ can use the same workers but with completely different strategies.
 import traceback
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+
 from python.framework.logging.scenario_logger import ScenarioLogger
 from python.framework.decision_logic.abstract_decision_logic import \
     AbstractDecisionLogic
@@ -52,6 +54,7 @@ from python.framework.types.decision_logic_types import AwarenessLevel, Decision
 from python.framework.types.market_types.market_types import TradingContext
 from python.framework.types.parameter_types import InputParamDef, OutputParamDef
 from python.framework.types.component_metadata_types import ComponentMetadata
+from python.framework.types.screening_types import BarSeries, ScreeningSignals
 from python.framework.types.worker_types import WorkerRequirement, WorkerResult
 from python.framework.types.trading_env_types.market_data_status_types import MarketDataStatus
 from python.framework.types.trading_env_types.order_types import (
@@ -491,6 +494,48 @@ class AggressiveTrend(AbstractDecisionLogic):
             },
         )
 
+    def compute_signals(
+        self,
+        worker_series: Dict[str, Dict[str, np.ndarray]],
+        bars: BarSeries,
+    ) -> ScreeningSignals:
+        """
+        Array form of compute_tick() for the vectorized screening sweep.
+
+        Same OR rules per bar close; the SELL check runs where no BUY fired. A bar whose
+        RSI / Bollinger value is missing is FLAT.
+
+        Args:
+            worker_series: Batch outputs of rsi_fast and bollinger_main
+            bars: The screened base-timeframe bars
+
+        Returns:
+            BUY / SELL reversal signals at the fixed lot size
+        """
+        rsi_value = worker_series['rsi_fast']['rsi_value']
+        position = worker_series['bollinger_main']['position']
+        valid = ~np.isnan(rsi_value) & ~np.isnan(position)
+        sell_threshold = 1.0 - self.bollinger_extremes
+
+        with np.errstate(invalid='ignore'):
+            buy_rsi = valid & (rsi_value < self.rsi_buy)
+            buy_bollinger = valid & (position < self.bollinger_extremes)
+            buy_confidence = np.minimum(1.0, 0.4
+                + np.where(buy_rsi, (self.rsi_buy - rsi_value) / self.rsi_buy * 0.3, 0.0)
+                + np.where(buy_bollinger, (self.bollinger_extremes - position)
+                           / self.bollinger_extremes * 0.3, 0.0))
+            buy = (buy_rsi | buy_bollinger) & (buy_confidence >= self.min_confidence)
+
+            sell_rsi = valid & (rsi_value > self.rsi_sell)
+            sell_bollinger = valid & (position > sell_threshold)
+            sell_confidence = np.minimum(1.0, 0.4
+                + np.where(sell_rsi, (rsi_value - self.rsi_sell) / (100 - self.rsi_sell) * 0.3, 0.0)
+                + np.where(sell_bollinger, (position - sell_threshold)
+                           / self.bollinger_extremes * 0.3, 0.0))
+            sell = ~buy & (sell_rsi | sell_bollinger) & (sell_confidence >= self.min_confidence)
+
+        return ScreeningSignals.from_actions(buy, sell, self.lot_size)
+
     def _record_signal_diagnostic(
         self,
         action: str,
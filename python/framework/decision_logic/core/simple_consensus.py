@@ -40,6 +40,8 @@ This logic requires three workers:
 import traceback
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+
 from python.framework.logging.scenario_logger import ScenarioLogger
 from python.framework.decision_logic.abstract_decision_logic import \
     AbstractDecisionLogic
@@ -56,6 +58,7 @@ from python.framework.types.trading_env_types.order_types import (
 )
 from python.framework.types.parameter_types import InputParamDef, OutputParamDef
 from python.framework.types.component_metadata_types import ComponentMetadata
+from python.framework.types.screening_types import BarSeries, ScreeningSignals
 from python.framework.types.trading_env_types.market_data_status_types import MarketDataStatus
 from python.framework.types.worker_types import WorkerRequirement, WorkerResult
 
@@ -581,6 +584,57 @@ class SimpleConsensus(AbstractDecisionLogic):
             },
         )
 
+    def compute_signals(
+        self,
+        worker_series: Dict[str, Dict[str, np.ndarray]],
+        bars: BarSeries,
+    ) -> ScreeningSignals:
+        """
+        Array form of compute_tick() for the vectorized screening sweep.
+
+        Same consensus rules per bar close: the OBV block returns FLAT before the SELL
+        check, a BUY below min_confidence falls through to it. A bar whose RSI / Bollinger
+        value is missing is FLAT (compute_tick's missing-results branch).
+
+        Args:
+            worker_series: Batch outputs of rsi_fast, bollinger_main, obv_volume
+            bars: The screened base-timeframe bars
+
+        Returns:
+            BUY / SELL reversal signals at the fixed lot size
+        """
+        rsi_value = worker_series['rsi_fast']['rsi_value']
+        position = worker_series['bollinger_main']['position']
+        obv_trend = worker_series['obv_volume']['trend']
+        bullish = obv_trend == 'bullish'
+        bearish = obv_trend == 'bearish'
+        obv_filter = self.obv_filter_enabled
+        obv_block = self.obv_filter_enabled and self.obv_block_opposite_trend
+
+        with np.errstate(invalid='ignore'):
+            buy_zone = (rsi_value <= self.rsi_oversold) & (position <= self.bollinger_lower)
+            buy_strength = (np.maximum(0, (self.rsi_oversold - rsi_value) / 30.0)
+                            + np.maximum(0, (self.bollinger_lower - position) / 0.3)) / 2.0
+            sell_zone = (rsi_value >= self.rsi_overbought) & (position >= self.bollinger_upper)
+            sell_strength = (np.maximum(0, (rsi_value - self.rsi_overbought) / 30.0)
+                             + np.maximum(0, (position - self.bollinger_upper) / 0.3)) / 2.0
+
+        buy_confidence = np.clip(0.5 + buy_strength * 0.5, 0.5, 1.0)
+        if obv_filter:
+            buy_confidence = np.where(
+                bullish, np.minimum(1.0, buy_confidence + self.obv_confidence_boost), buy_confidence)
+        sell_confidence = np.clip(0.5 + sell_strength * 0.5, 0.5, 1.0)
+        if obv_filter:
+            sell_confidence = np.where(
+                bearish, np.minimum(1.0, sell_confidence + self.obv_confidence_boost), sell_confidence)
+
+        buy_blocked = buy_zone & bearish if obv_block else np.zeros(len(bars), dtype=bool)
+        buy = buy_zone & ~buy_blocked & (buy_confidence >= self.min_confidence)
+        sell = (sell_zone & ~buy & ~buy_blocked & (sell_confidence >= self.min_confidence))
+        if obv_block:
+            sell &= ~bullish
+        return ScreeningSignals.from_actions(buy, sell, self.lot_size)
+
     def _calculate_buy_confidence(
         self, rsi_value: float, bollinger_position: float
     ) -> float:
@@ -0,0 +1,24 @@
+"""
+FiniexTestingIDE - Run Catalog Errors
+Exception types for run lookups in the logs tree's run catalog.
+"""
+
+from typing import List
+
+from python.framework.exceptions.finiex_error import FiniexError
+
+
+class AmbiguousRunIdError(FiniexError):
+    """
+    A bare run id names more than one run directory.
+
+    Run ids have second resolution, so runs of different scenario sets (or profiles)
+    can share one. Such a run is addressed by its qualified reference
+    (`<owner>/<run_id>`, or `<group>/<owner>/<run_id>`).
+    """
+
+    def __init__(self, run_id: str, candidates: List[str]):
+        self.run_id = run_id
+        self.candidates = candidates
+        super().__init__(
+            f"Run id '{run_id}' matches {len(candidates)} runs: {', '.join(candidates)}")
@@ -6,12 +6,21 @@ reporting "no decisions in reports" rule). `rank` orders combinations by the obj
 `sensitivity` is the one-factor marginal-effect view (which parameter moves the objective
 most). The sensitivity is OFAT — it ignores interactions and makes no significance claim;
 #31 later swaps the spread for a variance / ANOVA importance over the same rows.
+
+Each function has a `*_frame` twin over the ledger's analysis frame
+(`RunResultsLedger.read_frame`) with the same result — group-bys instead of per-row
+objects, for ledgers with tens of thousands of rows (the report + sweep list use it).
 """
 
+import json
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
 
+from python.framework.reporting.store.run_results_ledger import SWEEP_PARAM_COLUMN_PREFIX
 from python.framework.types.api.report_types import RunResultRow
 
 
@@ -32,6 +41,7 @@ class SweepSummary:
     run_count: int                  # distinct combinations (run_ids)
     ok_count: int
     error_count: int
+    pruned_count: int               # stopped early by the sweep prune rule (partial KPIs, never ranked)
     decision_logic_type: str
     decision_version: str
     base_config: str                # the swept scenario set (sweep tag stripped)
@@ -60,14 +70,16 @@ def summarize_sweeps(rows: List[RunResultRow]) -> List[SweepSummary]:
         stamps = sorted(datetime.fromisoformat(r.run_timestamp) for r in group if r.run_timestamp)
         run_ids = {r.run_id for r in group}
         error_ids = {r.run_id for r in group if r.status == 'error'}
+        pruned_ids = {r.run_id for r in group if r.status == 'pruned'}
         head = group[0]
         summaries.append(SweepSummary(
             sweep_id=sweep_id,
             started=stamps[0] if stamps else None,
             duration_s=(stamps[-1] - stamps[0]).total_seconds() if len(stamps) > 1 else 0.0,
             run_count=len(run_ids),
-            ok_count=len(run_ids) - len(error_ids),
+            ok_count=len(run_ids) - len(error_ids) - len(pruned_ids),
             error_count=len(error_ids),
+            pruned_count=len(pruned_ids),
             decision_logic_type=head.decision_logic_type,
             decision_version=head.decision_version,
             base_config=head.scenario_set_name.split('__', 1)[0],
@@ -146,14 +158,57 @@ def sensitivity(
     return result
 
 
+def evaluations_to_near_best(
+    rows: List[RunResultRow],
+    objective: str,
+    maximize: bool = True,
+    objective_currency: Optional[str] = None,
+    tolerance: float = 0.05,
+) -> Optional[Tuple[int, int]]:
+    """
+    How many evaluations a sweep needed until one came near its best objective.
+
+    Evaluations are counted in run order (run_timestamp, then run_id) and include errored
+    runs — they spent budget too. "Near" = within `tolerance` of the objective spread
+    (best - worst) from the best.
+
+    Args:
+        rows: One sweep's ledger rows
+        objective: The RunResultRow KPI field
+        maximize: Objective direction
+        objective_currency: Restrict to this currency
+        tolerance: Share of the objective spread that still counts as near-best
+
+    Returns:
+        (evaluations until near-best, total evaluations), None if no row is evaluable
+    """
+    scoped = _scope(rows, objective, objective_currency)
+    if not scoped:
+        return None
+    values = [float(getattr(r, objective)) for r in scoped]
+    best, worst = (max(values), min(values)) if maximize else (min(values), max(values))
+    margin = tolerance * abs(best - worst)
+    near = {id(r) for r, v in zip(scoped, values) if abs(best - v) <= margin}
+
+    ordered = sorted(rows, key=lambda r: (r.run_timestamp, r.run_id))
+    run_ids: List[str] = []
+    reached = None
+    for row in ordered:
+        if row.run_id not in run_ids:
+            run_ids.append(row.run_id)
+        if reached is None and id(row) in near:
+            reached = len(run_ids)
+    return reached, len(run_ids)
+
+
 def _scope(
     rows: List[RunResultRow], objective: str, objective_currency: Optional[str]
 ) -> List[RunResultRow]:
     """
     Validate the objective + restrict to the evaluable rows.
 
-    Error-flagged rows (status != 'ok') are excluded from the evaluation everywhere — they are
-    recorded in the ledger but never rank or contribute to sensitivity (#1).
+    Error-flagged and pruned rows (status != 'ok') are excluded from the evaluation everywhere —
+    they are recorded in the ledger but never rank or contribute to sensitivity (#1).
     """
     if objective not in RunResultRow.model_fields:
         raise ValueError(
@@ -162,3 +217,179 @@ def _scope(
     if objective_currency is not None:
         scoped = [r for r in scoped if r.currency == objective_currency]
     return scoped
+
+
+# ============================================
+# DataFrame path (RunResultsLedger.read_frame)
+# ============================================
+
+def summarize_sweeps_frame(frame: pd.DataFrame) -> List[SweepSummary]:
+    """
+    summarize_sweeps() over an analysis frame.
+
+    Args:
+        frame: The ledger's analysis frame (non-sweep rows are ignored)
+
+    Returns:
+        One SweepSummary per sweep, ordered by sweep_id
+    """
+    swept = frame[frame['sweep_id'].notna() & (frame['sweep_id'] != '')]
+    if swept.empty:
+        return []
+    # Each distinct timestamp is parsed once
+    stamps = swept['run_timestamp'].map(
+        {t: datetime.fromisoformat(t) for t in swept['run_timestamp'].unique() if t})
+
+    summaries: List[SweepSummary] = []
+    for sweep_id, group in swept.groupby('sweep_id', sort=True):
+        group_stamps = stamps[group.index].dropna()
+        started = group_stamps.min() if len(group_stamps) else None
+        run_count = group['run_id'].nunique()
+        error_count = group.loc[group['status'] == 'error', 'run_id'].nunique()
+        pruned_count = group.loc[group['status'] == 'pruned', 'run_id'].nunique()
+        head = group.iloc[0]
+        summaries.append(SweepSummary(
+            sweep_id=sweep_id,
+            started=started,
+            duration_s=((group_stamps.max() - started).total_seconds()
+                        if len(group_stamps) > 1 else 0.0),
+            run_count=run_count,
+            ok_count=run_count - error_count - pruned_count,
+            error_count=error_count,
+            pruned_count=pruned_count,
+            decision_logic_type=head['decision_logic_type'],
+            decision_version=head['decision_version'],
+            base_config=head['scenario_set_name'].split('__', 1)[0],
+            symbols=json.loads(head['symbols']) if head['symbols'] else [],
+            objective=head['sweep_objective'] if pd.notna(head['sweep_objective']) else '',
+            maximize=bool(head['sweep_maximize']) if pd.notna(head['sweep_maximize']) else True,
+        ))
+    return summaries
+
+
+def rank_frame(
+    frame: pd.DataFrame,
+    objective: str,
+    maximize: bool = True,
+    objective_currency: Optional[str] = None,
+    top_n: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    rank() over an analysis frame.
+
+    With `top_n` only the best rows are sorted: argpartition finds the top_n-th best
+    objective in linear time and every row at least as good (ties included) is kept, so
+    the result equals the head of the full ranking.
+
+    Args:
+        frame: The ledger's analysis frame
+        objective: The RunResultRow KPI column to rank by
+        maximize: True → best first is highest; False → lowest
+        objective_currency: Restrict to this currency
+        top_n: Return only the best top_n rows (None = all)
+
+    Returns:
+        The rows sorted by the objective (tie-break by run_id), best first
+    """
+    scoped = _scope_frame(frame, objective, objective_currency)
+    # Sort key ascending = best first
+    key = scoped[objective].to_numpy(dtype=np.float64)
+    key = -key if maximize else key
+    if top_n is not None and top_n < len(scoped):
+        if top_n <= 0:
+            return scoped.iloc[:0]
+        kth = key[np.argpartition(key, top_n - 1)[top_n - 1]]
+        candidates = key <= kth
+        scoped, key = scoped[candidates], key[candidates]
+    ordered = scoped.assign(_rank_key=key).sort_values(
+        ['_rank_key', 'run_id'], kind='stable').drop(columns='_rank_key')
+    return ordered.head(top_n) if top_n is not None else ordered
+
+
+def sensitivity_frame(
+    frame: pd.DataFrame,
+    objective: str,
+    objective_currency: Optional[str] = None,
+) -> List[ParamSensitivity]:
+    """
+    sensitivity() over an analysis frame — one group-by over (parameter, level).
+
+    Args:
+        frame: The ledger's analysis frame
+        objective: The RunResultRow KPI column to measure
+        objective_currency: Restrict to this currency
+
+    Returns:
+        Per-parameter sensitivity, ranked by influence (descending)
+    """
+    scoped = _scope_frame(frame, objective, objective_currency)
+    columns = [c for c in scoped.columns if c.startswith(SWEEP_PARAM_COLUMN_PREFIX)]
+    if scoped.empty or not columns:
+        return []
+
+    levels = scoped.melt(
+        id_vars=[objective], value_vars=columns, var_name='param', value_name='level',
+    ).dropna(subset=['level'])
+    means = levels.groupby(['param', 'level'], sort=False)[objective].mean()
+
+    result: List[ParamSensitivity] = []
+    for column, param_means in means.groupby(level='param', sort=False):
+        if len(param_means) < 2:     # only one level seen → not actually swept
+            continue
+        level_means = {level: float(mean) for (_, level), mean in param_means.items()}
+        result.append(ParamSensitivity(
+            param=column[len(SWEEP_PARAM_COLUMN_PREFIX):],
+            influence=max(level_means.values()) - min(level_means.values()),
+            level_means=level_means,
+        ))
+
+    result.sort(key=lambda s: s.influence, reverse=True)
+    return result
+
+
+def evaluations_to_near_best_frame(
+    frame: pd.DataFrame,
+    objective: str,
+    maximize: bool = True,
+    objective_currency: Optional[str] = None,
+    tolerance: float = 0.05,
+) -> Optional[Tuple[int, int]]:
+    """
+    evaluations_to_near_best() over an analysis frame.
+
+    Args:
+        frame: One sweep's analysis frame
+        objective: The RunResultRow KPI column
+        maximize: Objective direction
+        objective_currency: Restrict to this currency
+        tolerance: Share of the objective spread that still counts as near-best
+
+    Returns:
+        (evaluations until near-best, total evaluations), None if no row is evaluable
+    """
+    scoped = _scope_frame(frame, objective, objective_currency)
+    if scoped.empty:
+        return None
+    values = scoped[objective].astype(float)
+    best, worst = (values.max(), values.min()) if maximize else (values.min(), values.max())
+    near = scoped.index[(best - values).abs() <= tolerance * abs(best - worst)]
+
+    ordered = frame.sort_values(['run_timestamp', 'run_id'], kind='stable')
+    first_seen = ~ordered['run_id'].duplicated()
+    evaluation = first_seen.cumsum()       # distinct runs up to and including each row
+    hits = evaluation[ordered.index.isin(near)]
+    reached = int(hits.iloc[0]) if len(hits) else None
+    return reached, int(first_seen.sum())
+
+
+def _scope_frame(
+    frame: pd.DataFrame, objective: str, objective_currency: Optional[str]
+) -> pd.DataFrame:
+    """_scope() over an analysis frame (index kept)."""
+    if objective not in RunResultRow.model_fields:
+        raise ValueError(
+            f"Unknown objective '{objective}'. Available: {sorted(RunResultRow.model_fields)}")
+    mask = frame['status'] == 'ok'
+    if objective_currency is not None:
+        mask &= frame['currency'] == objective_currency
+    return frame[mask]
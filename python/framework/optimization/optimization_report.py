@@ -1,20 +1,23 @@
 """
 Optimization report (#390) — present a sweep's ranking + sensitivity.
 
-Thin presenter over the run-results ledger: reads a sweep's typed rows, ranks them by the
+Thin presenter over the run-results ledger: reads a sweep's analysis frame, ranks it by the
 objective, and prints the best combinations + the one-factor sensitivity (which parameter
 moves the objective most). Also writes the ranked table as CSV. Pure presentation — the
-ranking/sensitivity calculation lives in optimization_analysis.
+ranking/sensitivity calculation lives in optimization_analysis. Typed rows are built only
+for what is printed (header, top combinations, errors).
 """
 
-import csv
-import json
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, List, Optional
+
+import pandas as pd
 
 from python.configuration.app_config_manager import AppConfigManager
-from python.framework.optimization.optimization_analysis import rank, sensitivity, summarize_sweeps
+from python.framework.optimization.optimization_analysis import (
+    evaluations_to_near_best_frame, rank_frame, sensitivity_frame, summarize_sweeps_frame)
+from python.framework.optimization.successive_halving import final_rung_frame
 from python.framework.reporting.store.run_results_ledger import RunResultsLedger
 from python.framework.types.api.report_types import RunResultRow
 
@@ -25,7 +28,7 @@ SWEEP_REPORT_DIR = Path('logs/sweeps')
 def render_sweep_list() -> None:
     """Print every recorded sweep as an informative one-liner (most recent last)."""
     ledger = RunResultsLedger(Path(AppConfigManager().get_run_results_path()))
-    summaries = summarize_sweeps(ledger.read_rows())
+    summaries = summarize_sweeps_frame(ledger.read_frame())
 
     print('\n' + '=' * 80)
     print(f"🎛 PARAMETER OPTIMIZATION — Sweeps ({len(summaries)})")
@@ -39,6 +42,7 @@ def render_sweep_list() -> None:
         started = f"{s.started:%Y-%m-%d %H:%M}" if s.started else '—'
         duration = '~' + _fmt_duration(s.duration_s)
         runs = f"{s.run_count} runs ({s.ok_count} ok" \
+               + (f", {s.pruned_count} pruned" if s.pruned_count else '') \
                + (f", {s.error_count} err" if s.error_count else '') + ')'
         objective = f"{s.objective}{'↑' if s.maximize else '↓'}" if s.objective else '—'
         symbols = ','.join(s.symbols) if s.symbols else '—'
@@ -66,13 +70,13 @@ def render_sweep_report(
         top_n: How many top combinations to print
     """
     ledger = RunResultsLedger(Path(AppConfigManager().get_run_results_path()))
-    rows = ledger.read_rows(sweep_id=sweep_id)
+    frame = ledger.read_frame(sweep_id=sweep_id)
 
     print('\n' + '=' * 80)
     print(f"🎛 PARAMETER OPTIMIZATION — Sweep {sweep_id}")
     print('=' * 80)
 
-    if not rows:
+    if frame.empty:
         print(f"⚠️  No ledger rows for sweep '{sweep_id}'.")
         print('=' * 80 + '\n')
         return
@@ -80,21 +84,34 @@ def render_sweep_report(
     # Default objective + direction to what the sweep's spec declared (recorded in the ledger),
     # so `report <sweep_id>` ranks by the spec, not a hardcoded fallback. Explicit args override.
     if objective is None:
-        objective = next((r.sweep_objective for r in rows if r.sweep_objective), None) or 'expectancy'
+        objective = _first_set(frame['sweep_objective']) or 'expectancy'
     if maximize is None:
-        spec_maximize = next((r.sweep_maximize for r in rows if r.sweep_maximize is not None), None)
-        maximize = spec_maximize if spec_maximize is not None else True
+        spec_maximize = _first_set(frame['sweep_maximize'])
+        maximize = bool(spec_maximize) if spec_maximize is not None else True
+
+    # Successive halving: the earlier rungs ran on reduced data — rank only the final rung.
+    all_frame = frame
+    frame = final_rung_frame(frame)
 
-    error_rows = [r for r in rows if r.status == 'error']
+    error_rows = ledger.to_rows(frame[frame['status'] == 'error'])
+    pruned_count = int((frame['status'] == 'pruned').sum())
     direction = 'maximize' if maximize else 'minimize'
     print(f"Objective: {objective} ({direction})"
           + (f" | currency: {objective_currency}" if objective_currency else ''))
-    print(f"Combinations: {len(rows)} ({len(rows) - len(error_rows)} ok, {len(error_rows)} errored)")
-    _print_header_meta(rows)
-
-    ranked = rank(rows, objective, maximize, objective_currency)
-    _print_ranking(ranked, objective, top_n)
-    _print_sensitivity(rows, objective, objective_currency)
+    print(f"Combinations: {len(frame)} ({len(frame) - len(error_rows) - pruned_count} ok, "
+          + (f"{pruned_count} pruned, " if pruned_count else '')
+          + f"{len(error_rows)} errored)")
+    if frame is not all_frame:
+        _print_rungs(all_frame)
+    _print_header_meta(ledger.to_rows(all_frame.head(1))[0], all_frame)
+    near_best = evaluations_to_near_best_frame(frame, objective, maximize, objective_currency)
+    if near_best is not None and near_best[1] > 1:
+        print(f"Near-best:    after {near_best[0]} of {near_best[1]} evaluations "
+              f"(within 5% of the {objective} spread from the best)")
+
+    ranked = rank_frame(frame, objective, maximize, objective_currency)
+    _print_ranking(ledger.to_rows(ranked.head(top_n)), objective)
+    _print_sensitivity(frame, objective, objective_currency)
     _print_errors(error_rows)
 
     csv_path = _write_csv(ranked, sweep_id)
@@ -102,9 +119,8 @@ def render_sweep_report(
     print('=' * 80 + '\n')
 
 
-def _print_header_meta(rows: List[RunResultRow]) -> None:
+def _print_header_meta(r: RunResultRow, frame: pd.DataFrame) -> None:
     """Print sweep-level provenance from the ledger header columns (config, versions, span)."""
-    r = rows[0]
     base = r.scenario_set_name.split('__', 1)[0]   # strip the per-combo sweep tag
     symbols = ', '.join(r.symbols) if r.symbols else '—'
     workers = ', '.join(f"{n} v{v}" for n, v in sorted(r.worker_versions.items())) or '—'
@@ -116,13 +132,20 @@ def _print_header_meta(rows: List[RunResultRow]) -> None:
 
     # Sweep span from the per-run start timestamps (the ledger has no per-run end), so the
     # duration is first-start → last-start — the total minus the final run's own runtime.
-    stamps = sorted(datetime.fromisoformat(x.run_timestamp) for x in rows if x.run_timestamp)
+    stamps = sorted(datetime.fromisoformat(t) for t in frame['run_timestamp'].unique() if t)
     if stamps:
         span = (stamps[-1] - stamps[0]).total_seconds()
-        print(f"Sweep:        {len(rows)} runs  ·  {stamps[0]:%Y-%m-%d %H:%M:%S} → "
+        print(f"Sweep:        {len(frame)} runs  ·  {stamps[0]:%Y-%m-%d %H:%M:%S} → "
               f"{stamps[-1]:%H:%M:%S} UTC  ·  ~{_fmt_duration(span)} (across run starts)")
 
 
+def _print_rungs(frame: pd.DataFrame) -> None:
+    """Print the successive-halving funnel (combinations evaluated per rung)."""
+    per_rung = frame['sweep_rung'].dropna().value_counts().sort_index()
+    funnel = ' → '.join(f"r{rung}: {count}" for rung, count in per_rung.items())
+    print(f"Rungs:        {funnel}  (ranking reads the final rung)")
+
+
 def _fmt_duration(seconds: float) -> str:
     """Compact h/m/s duration string (e.g. '3m 24s')."""
     total = int(round(seconds))
@@ -135,15 +158,15 @@ def _fmt_duration(seconds: float) -> str:
     return f"{s}s"
 
 
-def _print_ranking(ranked: List[RunResultRow], objective: str, top_n: int) -> None:
+def _print_ranking(top: List[RunResultRow], objective: str) -> None:
     """Print the best combinations with their objective + key KPIs + grid point."""
     print('\n' + '-' * 80)
-    print(f"🏆 BEST COMBINATIONS (top {min(top_n, len(ranked))})")
+    print(f"🏆 BEST COMBINATIONS (top {len(top)})")
     print('-' * 80)
     print(f"{'#':>2} | {objective:>12} | {'net_pnl':>10} | {'win_rate':>8} | "
           f"{'trades':>6} | {'param_hash':>10} | parameters")
     print('-' * 80)
-    for i, row in enumerate(ranked[:top_n], start=1):
+    for i, row in enumerate(top, start=1):
         params = row.sweep_params or {}
         params_str = ', '.join(f"{_short_path(k)}={v}" for k, v in sorted(params.items()))
         print(f"{i:>2} | {getattr(row, objective):>12.4f} | {row.net_pnl:>10.2f} | "
@@ -152,9 +175,9 @@ def _print_ranking(ranked: List[RunResultRow], objective: str, top_n: int) -> No
 
 
 def _print_sensitivity(
-    rows: List[RunResultRow], objective: str, objective_currency: Optional[str]) -> None:
+    frame: pd.DataFrame, objective: str, objective_currency: Optional[str]) -> None:
     """Print the one-factor marginal effect per swept parameter (ranked by influence)."""
-    sens = sensitivity(rows, objective, objective_currency)
+    sens = sensitivity_frame(frame, objective, objective_currency)
     if not sens:
         return
     print('\n' + '-' * 80)
@@ -186,22 +209,18 @@ def _short_path(dotted_path: str) -> str:
     return dotted_path.split('.', 1)[-1]
 
 
-def _write_csv(ranked: List[RunResultRow], sweep_id: str) -> Path:
-    """Write the ranked typed rows to logs/sweeps/<sweep_id>_ranked.csv."""
+def _write_csv(ranked: pd.DataFrame, sweep_id: str) -> Path:
+    """Write the ranked rows to logs/sweeps/<sweep_id>_ranked.csv (the RunResultRow columns)."""
     SWEEP_REPORT_DIR.mkdir(parents=True, exist_ok=True)
     path = SWEEP_REPORT_DIR / f'{sweep_id}_ranked.csv'
-    flat = [_flat(row) for row in ranked]
-    with open(path, 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=list(RunResultRow.model_fields))
-        writer.writeheader()
-        writer.writerows(flat)
+    # The structured columns are still their ledger JSON strings — written as stored
+    table = ranked.reindex(columns=list(RunResultRow.model_fields))
+    table.to_csv(path, index=False, lineterminator='\r\n')
     return path
 
 
-def _flat(row: RunResultRow) -> Dict[str, Any]:
-    """Flatten a row for CSV — the structured columns are JSON-encoded back to strings."""
-    data = row.model_dump()
-    data['worker_versions'] = json.dumps(data['worker_versions'])
-    data['symbols'] = json.dumps(data['symbols'])
-    data['sweep_params'] = json.dumps(data['sweep_params']) if data['sweep_params'] is not None else ''
-    return data
+def _first_set(column: pd.Series) -> Any:
+    """The first non-null, non-empty value of a column (None if there is none)."""
+    values = column.dropna()
+    values = values[values != '']
+    return values.iloc[0] if len(values) else None
@@ -7,29 +7,59 @@ pipeline. Parameter existence / range are validated per combination inside the r
 (Phase 0), so a bad value fails only its own combination. Every combination self-records
 its KPIs in the run-results ledger (tagged with the sweep id), so ranking happens
 afterwards by reading the ledger — the runner itself collects nothing in memory.
+
+`search='successive_halving'` runs the combinations in rungs over a growing share of the
+data; between rungs the runner reads the finished rung back from the ledger and promotes
+the best 1/eta (see successive_halving). `search.method='bayes'` runs a fixed budget of
+combinations in batches, each batch proposed by a TPE surrogate (tpe_sampler) refitted to
+the sweep's ledger rows so far. `search.method='screening'` scores every combination with the
+vectorized bar-resolution engine (screening_engine) and runs only the best `top_n` as batches.
+
+An optional `prune` block attaches a prune rule to every combination (see sweep_pruning);
+the objective bound is re-resolved from the ledger before each combination starts.
+
+`execution: "multi_decision"` (decision-only grids) runs up to `max_stacks` combinations
+as ONE batch: each scenario process computes bars + workers once and drives one decision
+stack per combination; the summary is split and every combination still records its own
+run (see scenario_strategy_runner.initialize_multi_decision_batch_and_run).
 """
 
+import copy
 from datetime import datetime, timezone
-from typing import Optional
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 from python.configuration.app_config_manager import AppConfigManager
 from python.configuration.optimization_config_loader import OptimizationConfigLoader
 from python.framework.batch.batch_orchestrator import BatchOrchestrator
+from python.framework.factory.decision_logic_factory import DecisionLogicFactory
 from python.framework.logging.bootstrap_logger import get_global_logger
 from python.framework.optimization.grid_expander import expand_grid
-from python.framework.optimization.parameter_override import apply_overrides
+from python.framework.optimization.optimization_analysis import evaluations_to_near_best, rank
+from python.framework.optimization.parameter_override import apply_overrides, set_by_path
+from python.framework.optimization.screening_engine import (
+    ScreeningEngine, rank_screening, resolve_screening_objective)
+from python.framework.optimization.successive_halving import (
+    reduce_base, rung_fractions, select_survivors, survivor_count)
+from python.framework.optimization.sweep_pruning import build_prune_rule, validate_prune_spec
+from python.framework.optimization.tpe_sampler import TpeSampler, equivalent_grid_size
+from python.framework.reporting.store.run_results_ledger import RunResultsLedger
 from python.framework.types.batch_execution_types import BatchExecutionSummary
+from python.framework.types.config_types.optimization_config_types import SweepSpec
+from python.framework.types.mount_package_types import MountPackage
+from python.framework.types.scenario_types.scenario_set_types import LoadedScenarioConfig
 from python.framework.types.run_results_types import SweepContext
 from python.framework.types.scenario_types.scenario_set_types import ScenarioSet
 from python.framework.validators.sweep_grid_validator import validate_sweep_grid
 from python.scenario.scenario_config_loader import ScenarioConfigLoader
-from python.scenario.scenario_strategy_runner import initialize_batch_and_run
+from python.scenario.scenario_strategy_runner import (
+    initialize_batch_and_run, initialize_multi_decision_batch_and_run)
 
 vLog = get_global_logger()
 
 
 class OptimizationRunner:
-    """Runs a grid sweep: expand → run each combination → ledger records the results."""
+    """Runs a sweep: choose combinations → run each as a batch → ledger records the results."""
 
     def __init__(self):
         """Initialize the runner with the spec, scenario, and app config loaders."""
@@ -53,61 +83,400 @@ class OptimizationRunner:
             raise ValueError(
                 f"Base scenario set '{spec.base_scenario_set}' has no enabled scenarios")
 
-        # Fail-fast: validate the grid STRUCTURE (path shape + non-empty lists).
+        # Fail-fast: validate the grid STRUCTURE (path shape + non-empty lists / ranges).
         # Param existence / range is validated per combination inside the run (Phase 0).
-        validate_sweep_grid(spec.grid, vLog)
+        method = spec.search.method
+        validate_sweep_grid(spec.grid, vLog, allow_ranges=method == 'bayes')
+        if method == 'bayes' and (spec.search.budget is None or spec.search.budget < 1):
+            raise ValueError("A bayes search needs a positive search.budget")
+        if method == 'screening':
+            if spec.screening.top_n < 1:
+                raise ValueError(f"screening.top_n must be >= 1, got {spec.screening.top_n}")
+            resolve_screening_objective(spec)
+        validate_prune_spec(spec)
+        if spec.execution.max_stacks < 1:
+            raise ValueError(f"execution.max_stacks must be >= 1, got {spec.execution.max_stacks}")
 
-        combos = expand_grid(spec.grid)
         sweep_id = f"sweep_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}"
+        combos = expand_grid(spec.grid) if method != 'bayes' else []
+        size = (f"budget {spec.search.budget}" if method == 'bayes'
+                else f"{len(combos)} combination(s)")
         vLog.info(
-            f"🎛 Sweep {sweep_id}: {len(combos)} combination(s) over "
-            f"'{spec.base_scenario_set}' (objective: {spec.objective})")
+            f"🎛 Sweep {sweep_id}: {size} over "
+            f"'{spec.base_scenario_set}' (objective: {spec.objective}, search: {method})")
 
         # All of this sweep's runs (the base mount build + every combination) nest under one
         # grouping dir so the log root stays tidy (#419).
         run_group = f"sweeps/{sweep_id}"
 
-        # Mount reuse (#419): load the data ONCE from the base and reuse it across every
-        # combination (the grid varies only strategy_config → constant data identity).
-        mount = None
-        if self._app_config.get_optimization_mount_reuse_enabled():
-            base_set = ScenarioSet(base, self._app_config, run_group=run_group)
-            mount = BatchOrchestrator(base_set, self._app_config).build_mount()
-            if not mount.scenario_packages:
-                # Data-level failure (invalid window / missing data) — invariant across every
-                # combination → abort the whole sweep, nothing ran (§35).
+        if method == 'successive_halving':
+            runs = self._run_halving(spec, base, combos, sweep_id, run_group)
+        elif method == 'bayes':
+            runs = self._run_bayes(spec, base, sweep_id, run_group)
+        elif method == 'screening':
+            runs = self._run_screening(spec, base, combos, sweep_id, run_group)
+        else:
+            runs = self._run_rung(spec, base, combos, sweep_id, run_group)
+        if runs is not None:
+            vLog.info(f"✅ Sweep {sweep_id} complete — {runs} run(s) recorded in the ledger")
+        return sweep_id
+
+    def _run_bayes(
+        self,
+        spec: SweepSpec,
+        base: LoadedScenarioConfig,
+        sweep_id: str,
+        run_group: str,
+    ) -> Optional[int]:
+        """
+        Model-based search: propose a batch from the sweep's ledger rows so far, run it, refit.
+
+        Returns:
+            Total runs recorded (None if the sweep aborted)
+        """
+        search = spec.search
+        loaded, mount = self._load_mount(base, sweep_id, run_group)
+        if not loaded:
+            return None
+        sampler = TpeSampler(
+            spec.grid, maximize=spec.maximize, seed=search.seed, startup=search.startup)
+        ledger = RunResultsLedger(Path(self._app_config.get_run_results_path()))
+
+        proposed: List[Dict[str, Any]] = []
+        while len(proposed) < search.budget:
+            scored = rank(ledger.read_rows(sweep_id=sweep_id),
+                          spec.objective, spec.maximize, spec.objective_currency)
+            history = [(row.sweep_params or {}, float(getattr(row, spec.objective)))
+                       for row in scored]
+            batch = sampler.propose(
+                history, proposed, min(search.batch_size, search.budget - len(proposed)))
+            if not batch:
+                grid_size = equivalent_grid_size(spec.grid)
+                if grid_size is not None and len(proposed) >= grid_size:
+                    vLog.info(f"🔮 Search space exhausted after {len(proposed)} combination(s)")
+                else:
+                    vLog.warning(
+                        f"⚠️ Sampler found no untried combination — stopping after "
+                        f"{len(proposed)} combination(s), the space is not exhausted")
+                break
+            vLog.info(
+                f"🔮 Batch {len(proposed) // search.batch_size + 1}: {len(batch)} proposal(s) "
+                f"({len(history)} scored so far, "
+                f"{'model' if len(history) >= search.startup else 'random'})")
+            runs = self._run_combos(
+                spec, base, batch, mount, sweep_id, run_group, first_index=len(proposed))
+            if runs is None:
+                return None
+            proposed.extend(batch)
+
+        near_best = evaluations_to_near_best(
+            ledger.read_rows(sweep_id=sweep_id),
+            spec.objective, spec.maximize, spec.objective_currency)
+        if near_best is not None:
+            grid_size = equivalent_grid_size(spec.grid)
+            vLog.info(
+                f"🎯 Near-best {spec.objective} after {near_best[0]} of {near_best[1]} "
+                f"evaluation(s) — the equivalent grid has "
+                f"{grid_size if grid_size is not None else 'unbounded (continuous range)'} "
+                f"combination(s)")
+        return len(proposed)
+
+    def _run_screening(
+        self,
+        spec: SweepSpec,
+        base: LoadedScenarioConfig,
+        combos: List[Dict[str, Any]],
+        sweep_id: str,
+        run_group: str,
+    ) -> Optional[int]:
+        """
+        Vectorized screening: score every combination at bar resolution, run the best on ticks.
+
+        Only the top_n screened combinations reach the ledger — as a normal grid over them.
+
+        Returns:
+            Runs recorded (None if the sweep aborted)
+        """
+        objective, maximize, fell_back = resolve_screening_objective(spec)
+        if fell_back:
+            vLog.info(
+                f"🔬 Objective '{spec.objective}' is not a screening KPI — the screen ranks by "
+                f"net_pnl, the tick runs by {spec.objective}")
+        vLog.info(f"🔬 Screening {len(combos)} combination(s) at bar resolution ({objective})")
+        engine = ScreeningEngine(vLog, spread_points=spec.screening.spread_points)
+        results = engine.screen(base.scenarios, combos)
+        ranked = rank_screening(results, objective, maximize, spec.objective_currency)
+
+        failed = [r for r in results if r.error is not None]
+        if failed:
+            vLog.warning(f"🔬 {len(failed)} combination(s) failed the screen, e.g. {failed[0].error}")
+        if not ranked:
+            vLog.error(
+                f"🛑 Sweep {sweep_id} stopped after the screen: no combination produced a "
+                f"screening result — nothing to run on ticks.")
+            return None
+
+        top = ranked[:spec.screening.top_n]
+        currency = spec.objective_currency or next(iter(top[0].kpis))
+        for position, result in enumerate(top, start=1):
+            kpis = result.kpis[currency]
+            vLog.info(
+                f"  🔬 #{position} {objective}={getattr(kpis, objective):.4f} {currency} "
+                f"trades={kpis.total_trades} {result.combo}")
+        vLog.info(f"🔬 Re-running the top {len(top)} of {len(ranked)} through the tick pipeline")
+        return self._run_rung(spec, base, [r.combo for r in top], sweep_id, run_group)
+
+    def _run_halving(
+        self,
+        spec: SweepSpec,
+        base: LoadedScenarioConfig,
+        combos: List[Dict[str, Any]],
+        sweep_id: str,
+        run_group: str,
+    ) -> Optional[int]:
+        """
+        Successive halving: every rung runs the surviving combinations on a larger data share.
+
+        Returns:
+            Total runs recorded (None if the sweep aborted)
+        """
+        fractions = rung_fractions(spec.halving)
+        # Fail-fast: reduce every rung's base up front (an unbounded 'span' scenario raises here)
+        rung_bases = [reduce_base(base, f, spec.halving.resource) for f in fractions]
+        ledger = RunResultsLedger(Path(self._app_config.get_run_results_path()))
+
+        runs = 0
+        survivors = combos
+        for rung, (fraction, rung_base) in enumerate(zip(fractions, rung_bases)):
+            vLog.info(
+                f"🪜 Rung {rung}/{len(fractions) - 1}: {len(survivors)} combination(s) on "
+                f"{fraction:.0%} of the data ({spec.halving.resource})")
+            rung_runs = self._run_rung(
+                spec, rung_base, survivors, sweep_id, run_group, rung=rung)
+            if rung_runs is None:
+                return None
+            runs += rung_runs
+            if rung == len(fractions) - 1:
+                break
+
+            rows = [r for r in ledger.read_rows(sweep_id=sweep_id) if r.sweep_rung == rung]
+            survivors = select_survivors(
+                rows, survivors, survivor_count(len(survivors), spec.halving.eta),
+                spec.objective, spec.maximize, spec.objective_currency)
+            if not survivors:
                 vLog.error(
-                    f"🛑 Sweep {sweep_id} aborted: the base data could not be loaded for any "
-                    f"scenario (invalid window / missing data). Every combination shares this "
-                    f"data — nothing was run.")
-                return sweep_id
+                    f"🛑 Sweep {sweep_id} stopped after rung {rung}: no combination produced a "
+                    f"rankable result — nothing to promote.")
+                break
+        return runs
+
+    def _run_rung(
+        self,
+        spec: SweepSpec,
+        base: LoadedScenarioConfig,
+        combos: List[Dict[str, Any]],
+        sweep_id: str,
+        run_group: str,
+        rung: Optional[int] = None,
+    ) -> Optional[int]:
+        """
+        Run combinations over one base (the whole sweep for a grid search, one rung otherwise).
+
+        Args:
+            spec: The sweep spec
+            base: The (possibly reduced) base scenario set
+            combos: The combinations to run
+            sweep_id: The sweep id
+            run_group: Log grouping dir of the sweep
+            rung: Successive-halving rung (None = grid search)
+
+        Returns:
+            Runs recorded (None if the sweep aborted)
+        """
+        loaded, mount = self._load_mount(base, sweep_id, run_group)
+        if not loaded:
+            return None
+        return self._run_combos(spec, base, combos, mount, sweep_id, run_group, rung=rung)
+
+    def _load_mount(
+        self,
+        base: LoadedScenarioConfig,
+        sweep_id: str,
+        run_group: str,
+    ) -> Tuple[bool, Optional[MountPackage]]:
+        """
+        Mount reuse (#419): load the data ONCE from the base and reuse it across every
+        combination (the grid varies only strategy_config → constant data identity).
+
+        Returns:
+            (False, None) if the base data could not be loaded (sweep aborted), else
+            (True, mount) — mount None when mount reuse is switched off
+        """
+        if not self._app_config.get_optimization_mount_reuse_enabled():
+            return True, None
+        mount = self._build_mount(base, run_group)
+        if not mount.scenario_packages:
+            # Data-level failure (invalid window / missing data) — invariant across every
+            # combination → abort the whole sweep, nothing ran (§35).
+            vLog.error(
+                f"🛑 Sweep {sweep_id} aborted: the base data could not be loaded for any "
+                f"scenario (invalid window / missing data). Every combination shares this "
+                f"data — nothing was run.")
+            return False, None
+        return True, mount
+
+    def _run_combos(
+        self,
+        spec: SweepSpec,
+        base: LoadedScenarioConfig,
+        combos: List[Dict[str, Any]],
+        mount: Optional[MountPackage],
+        sweep_id: str,
+        run_group: str,
+        rung: Optional[int] = None,
+        first_index: int = 0,
+    ) -> Optional[int]:
+        """
+        Run each combination as one batch against the (shared) mount.
 
+        Args:
+            spec: The sweep spec
+            base: The base scenario set the combinations override
+            combos: The combinations to run
+            mount: Prepared data mount (None → each batch loads its own data)
+            sweep_id: The sweep id
+            run_group: Log grouping dir of the sweep
+            rung: Successive-halving rung (None = grid / bayes search)
+            first_index: Sweep-wide index of the first combination (unique run labels)
+
+        Returns:
+            Runs recorded (None if the sweep aborted)
+        """
         villain_abort = self._app_config.get_optimization_villain_abort_enabled()
+        ledger = RunResultsLedger(Path(self._app_config.get_run_results_path()))
+        rung_tag = f"_r{rung}" if rung is not None else ''
+        fan_out = self._fans_out(spec)
         runs = 0
-        for index, combo in enumerate(combos):
-            label = f"__{sweep_id}_c{index:03d}"
-            cfg = apply_overrides(base, combo, label)
-            sweep_context = SweepContext(
-                sweep_id=sweep_id, sweep_params=combo,
-                objective=spec.objective, maximize=spec.maximize)
-            vLog.info(f"  [{index + 1}/{len(combos)}] {combo}")
-            summary = initialize_batch_and_run(
-                cfg, self._app_config, sweep_context=sweep_context, mount=mount,
-                run_group=run_group)
-            runs += 1
+        for group in self._group_combos(spec, base, combos, fan_out):
+            # One prune rule per group: the group's combinations run side by side
+            rule = None
+            if spec.prune is not None:
+                # The objective bound compares only rows on the same data (same rung)
+                rule = build_prune_rule(spec, [
+                    r for r in ledger.read_rows(sweep_id=sweep_id) if r.sweep_rung == rung])
+
+            cfgs, contexts = [], []
+            for offset in group:
+                combo = combos[offset]
+                label = f"__{sweep_id}{rung_tag}_c{first_index + offset:03d}"
+                cfg = apply_overrides(base, combo, label)
+                for scenario in cfg.scenarios:
+                    scenario.prune_rule = rule
+                cfgs.append(cfg)
+                contexts.append(SweepContext(
+                    sweep_id=sweep_id, sweep_params=combo,
+                    objective=spec.objective, maximize=spec.maximize, rung=rung))
+                vLog.info(f"  [{offset + 1}/{len(combos)}] {combo}")
+
+            if len(group) == 1:
+                summary = initialize_batch_and_run(
+                    cfgs[0], self._app_config, sweep_context=contexts[0], mount=mount,
+                    run_group=run_group)
+            else:
+                vLog.info(f"  🧬 {len(group)} combinations share one worker pipeline")
+                summary = initialize_multi_decision_batch_and_run(
+                    cfgs, self._app_config, contexts, mount=mount, run_group=run_group)[0]
+            runs += len(group)
 
             # Fail-fast OOM-villain abort: if the FIRST executed combination crashed data-level
             # (a worker subprocess was OOM-killed), every combination would crash identically.
-            if villain_abort and index == 0 and self._has_subprocess_oom(summary):
+            if (villain_abort and first_index + group[0] == 0 and not rung
+                    and self._has_subprocess_oom(summary)):
                 vLog.error(
                     f"🛑 Sweep {sweep_id} aborted after the first combination: a worker "
                     f"subprocess was terminated (out-of-memory). Every combination shares this "
-                    f"data + parallelism → the remaining {len(combos) - 1} would fail "
+                    f"data + parallelism → the remaining {len(combos) - runs} would fail "
                     f"identically. Lower max_parallel_scenarios or use smaller windows.")
-                break
+                return None
+        return runs
 
-        vLog.info(f"✅ Sweep {sweep_id} complete — {runs} run(s) recorded in the ledger")
-        return sweep_id
+    def _fans_out(self, spec: SweepSpec) -> bool:
+        """
+        Whether the sweep runs its combinations as multi-decision groups.
+
+        Only a decision-only grid qualifies: a worker parameter changes the worker
+        results, so the combinations could not share one worker pipeline.
+        """
+        if spec.execution.mode != 'multi_decision' or spec.execution.max_stacks < 2:
+            return False
+        worker_paths = [p for p in spec.grid if not p.startswith('decision_logic_config.')]
+        if worker_paths:
+            vLog.info(
+                f"🧬 execution 'multi_decision' needs a decision-only grid — "
+                f"{', '.join(sorted(worker_paths))} vary the workers → per-combination runs")
+            return False
+        return True
+
+    def _group_combos(
+        self,
+        spec: SweepSpec,
+        base: LoadedScenarioConfig,
+        combos: List[Dict[str, Any]],
+        fan_out: bool,
+    ) -> List[List[int]]:
+        """
+        Partition the combinations (by offset, in order) into the batches to run.
+
+        Without fan-out every combination is its own batch. With fan-out, valid combinations
+        are chunked by max_stacks; a combination whose decision parameters fail validation
+        runs alone, so it is recorded as an error without failing its group.
+
+        Returns:
+            Groups of combination offsets
+        """
+        if not fan_out:
+            return [[offset] for offset in range(len(combos))]
+
+        groups: List[List[int]] = []
+        chunk: List[int] = []
+        for offset, combo in enumerate(combos):
+            if not all(self._decision_params_valid(scenario.strategy_config or {}, combo)
+                       for scenario in base.scenarios):
+                groups.append([offset])
+                continue
+            chunk.append(offset)
+            if len(chunk) == spec.execution.max_stacks:
+                groups.append(chunk)
+                chunk = []
+        if chunk:
+            groups.append(chunk)
+        return groups
+
+    def _decision_params_valid(self, strategy: Dict[str, Any], combo: Dict[str, Any]) -> bool:
+        """
+        Whether a combination's decision_logic_config passes the decision logic's schema.
+
+        A class-resolution failure counts as valid — the run reports it with full context.
+        """
+        strategy = copy.deepcopy(strategy)
+        for dotted_path, value in combo.items():
+            set_by_path(strategy, dotted_path, value)
+        try:
+            logic_class, _ = DecisionLogicFactory(vLog).resolve_logic_class(
+                strategy.get('decision_logic_type', ''))
+        except Exception:
+            return True
+        try:
+            logic_class.validate_parameter_schema(
+                strategy.get('decision_logic_config', {}), strict=True)
+        except ValueError:
+            return False
+        return True
+
+    def _build_mount(self, base: LoadedScenarioConfig, run_group: str) -> MountPackage:
+        """Load the data of a base scenario set once, for reuse across its combinations."""
+        base_set = ScenarioSet(base, self._app_config, run_group=run_group)
+        return BatchOrchestrator(base_set, self._app_config).build_mount()
 
     @staticmethod
     def _has_subprocess_oom(summary: Optional[BatchExecutionSummary]) -> bool:
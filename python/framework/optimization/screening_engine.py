@@ -0,0 +1,509 @@
+"""
+Screening engine — vectorized bar-resolution scoring of sweep combinations.
+
+A `screening` sweep scores every combination here first and re-runs only the best
+`top_n` through the real tick pipeline. Instead of replaying ticks, the engine reads the
+pre-rendered bar parquet files and evaluates each worker ONCE per scenario as a whole
+NumPy series (compute_batch), the decision logic as entry / exit arrays
+(compute_signals), and the fills at bar resolution: a signal on bar i's close fills at bar
+i+1's open, half the spread against the position each way, plus the entry fee of the
+broker's fee model (spread fee or taker fee — as the trade simulator charges it).
+
+Approximations (why the winners are re-run on ticks): decisions happen only on the
+bar-close grid of the smallest worker timeframe, the spread is the tick index's average
+(or the spec's override), margin / balance checks are skipped, and P&L is in the symbol's
+quote currency. Workers without a batch form and decision logics without the hook are
+not screenable — the engine raises before scoring anything.
+"""
+
+import copy
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from python.configuration.market_config_manager import MarketConfigManager
+from python.data_management.index.bars_index_manager import BarsIndexManager
+from python.data_management.index.tick_index_manager import TickIndexManager
+from python.framework.data_preparation.broker_data_preparator import BrokerDataPreparator
+from python.framework.factory.broker_config_factory import BrokerConfigFactory
+from python.framework.factory.decision_logic_factory import DecisionLogicFactory
+from python.framework.factory.worker_factory import WorkerFactory
+from python.framework.logging.abstract_logger import AbstractLogger
+from python.framework.optimization.parameter_override import set_by_path
+from python.framework.types.config_types.optimization_config_types import SweepSpec
+from python.framework.types.config_types.market_config_types import TradingModel
+from python.framework.types.market_types.market_types import TradingContext
+from python.framework.types.scenario_types.scenario_set_types import SingleScenario
+from python.framework.types.screening_types import (
+    BarSeries, ScreeningCostModel, ScreeningKpis, ScreeningMarket, ScreeningResult,
+    ScreeningSignals)
+from python.framework.types.trading_env_types.broker_types import FeeType
+from python.framework.utils.timeframe_config_utils import TimeframeConfig
+from python.framework.utils.trading_math.pnl_math import gross_pnl_from_price_diff
+from python.framework.workers.abstract_indicator_worker import AbstractIndicatorWorker
+
+_MINUTE_MS = 60_000
+
+# Screening KPIs a sweep can rank by → natural direction (True = higher is better).
+# Expectancy needs an initial risk (stop loss) the bar screen does not model.
+SCREENING_OBJECTIVES: Dict[str, bool] = {
+    'net_pnl': True,
+    'profit_factor': True,
+    'win_rate': True,
+    'total_trades': True,
+    'max_drawdown': False,
+    'total_fees': False,
+}
+
+
+class ScreeningEngine:
+    """Scores combinations at bar resolution — batch workers, signal arrays, bar fills."""
+
+    def __init__(self, logger: AbstractLogger, spread_points: Optional[float] = None):
+        """
+        Args:
+            logger: Logger for progress + the worker / decision factories
+            spread_points: Fixed spread (points) for every scenario; None = tick index average
+        """
+        self._logger = logger
+        self._spread_points = spread_points
+        self._worker_factory = WorkerFactory(logger=logger)
+        self._logic_factory = DecisionLogicFactory(logger=logger)
+        self._bar_index: Optional[BarsIndexManager] = None
+        self._tick_index: Optional[TickIndexManager] = None
+        # (data_broker_type, symbol, timeframe) → bars of the whole parquet file
+        self._bars: Dict[Tuple[str, str, str], BarSeries] = {}
+        # scenario index → static market context
+        self._markets: Dict[int, ScreeningMarket] = {}
+        # (scenario index, base timeframe, instance, worker type, worker config)
+        #   → outputs aligned to the screened base-bar closes
+        self._series: Dict[Tuple[int, str, str, str, str], Dict[str, np.ndarray]] = {}
+
+    def screen(
+        self,
+        scenarios: List[SingleScenario],
+        combos: List[Dict[str, Any]],
+    ) -> List[ScreeningResult]:
+        """
+        Score every combination over every scenario.
+
+        A worker series depends only on its own config, so it is computed once per
+        scenario and reused by every combination that shares it (a decision-only grid
+        computes the workers exactly once).
+
+        Args:
+            scenarios: The base scenario set's scenarios (never mutated)
+            combos: The grid combinations (dotted path → value)
+
+        Returns:
+            One ScreeningResult per combination, in order
+
+        Raises:
+            ValueError: If a worker or the decision logic has no array form
+        """
+        self._prepare_markets(scenarios)
+        results = []
+        for combo in combos:
+            result = ScreeningResult(combo=combo)
+            try:
+                for scenario in scenarios:
+                    currency, kpis = self._screen_scenario(scenario, combo)
+                    result.kpis.setdefault(currency, ScreeningKpis()).merge(kpis)
+            except _NotScreenable:
+                raise
+            except (ValueError, KeyError) as e:
+                # A bad value fails only its own combination (like Phase 0 in the tick run)
+                result.kpis = {}
+                result.error = str(e)
+            results.append(result)
+        return results
+
+    # ============================================
+    # Per scenario
+    # ============================================
+
+    def _screen_scenario(
+        self,
+        scenario: SingleScenario,
+        combo: Dict[str, Any],
+    ) -> Tuple[str, ScreeningKpis]:
+        """Score one combination on one scenario → (P&L currency, KPIs)."""
+        market = self._markets[scenario.scenario_index]
+        strategy = copy.deepcopy(scenario.strategy_config)
+        for dotted_path, value in combo.items():
+            set_by_path(strategy, dotted_path, value)
+
+        workers = self._worker_factory.create_workers_from_config(
+            strategy_config=strategy, trading_context=market.trading_context)
+        for name, worker in workers.items():
+            if not isinstance(worker, AbstractIndicatorWorker):
+                raise _NotScreenable(
+                    f"Worker '{name}' is not a bar-based INDICATOR worker — not screenable")
+
+        base_tf = min((self._timeframe(w) for w in workers.values()),
+                       key=TimeframeConfig.get_minutes)
+        base_bars = self._bars_for(scenario, base_tf)
+        first, last = self._trading_range(scenario, base_bars)
+        screened = base_bars.slice(first, last)
+        if len(screened) < 2:
+            return market.currency, ScreeningKpis()
+        close_msc = screened.times_msc + TimeframeConfig.get_minutes(base_tf) * _MINUTE_MS
+
+        worker_series = {}
+        for name, worker in workers.items():
+            worker_type = strategy['worker_instances'][name]
+            config = strategy.get('workers', {}).get(name, {})
+            key = (scenario.scenario_index, base_tf, name, worker_type,
+                   json.dumps(config, sort_keys=True, default=str))
+            if key not in self._series:
+                self._series[key] = self._aligned_series(scenario, worker, close_msc)
+            worker_series[name] = self._series[key]
+
+        logic = self._logic_factory.create_logic(
+            logic_type=strategy.get('decision_logic_type', ''),
+            logger=self._logger,
+            logic_config=strategy.get('decision_logic_config', {}),
+            trading_context=market.trading_context,
+        )
+        signals = logic.compute_signals(worker_series, screened)
+        if signals is None:
+            raise _NotScreenable(
+                f"Decision logic '{strategy.get('decision_logic_type')}' does not implement "
+                f"compute_signals() — not screenable")
+        return market.currency, simulate_bar_fills(
+            signals, screened, market.costs, allow_short=market.allow_short)
+
+    def _aligned_series(
+        self,
+        scenario: SingleScenario,
+        worker: AbstractIndicatorWorker,
+        close_msc: np.ndarray,
+    ) -> Dict[str, np.ndarray]:
+        """
+        A worker's batch outputs, read at every screened base-bar close.
+
+        The worker runs on its own timeframe, from its warm-up window before the scenario
+        start up to the last screened close; each base close then reads the worker's last
+        bar that had closed by then (a higher timeframe updates only on its own closes).
+        """
+        timeframe = self._timeframe(worker)
+        bars = self._bars_for(scenario, timeframe)
+        tf_ms = TimeframeConfig.get_minutes(timeframe) * _MINUTE_MS
+        warmup = max(worker.get_warmup_requirements().values())
+        start = max(0, int(np.searchsorted(bars.times_msc, close_msc[0] - tf_ms)) - warmup - 1)
+        stop = int(np.searchsorted(bars.times_msc + tf_ms, close_msc[-1], side='right'))
+        window = bars.slice(start, stop)
+
+        outputs = worker.compute_batch(window)
+        if outputs is None:
+            raise _NotScreenable(
+                f"Worker '{worker.name}' ({worker.__class__.__name__}) has no compute_batch() "
+                f"— not screenable")
+
+        index = np.searchsorted(window.times_msc + tf_ms, close_msc, side='right') - 1
+        known = index >= 0
+        index = np.maximum(index, 0)
+        aligned = {}
+        for key, values in outputs.items():
+            picked = values[index]
+            if picked.dtype == object:
+                picked[~known] = None
+            elif picked.dtype == bool:
+                picked = picked & known
+            else:
+                picked = np.where(known, picked.astype(np.float64), np.nan)
+            aligned[key] = picked
+        return aligned
+
+    def _trading_range(self, scenario: SingleScenario, bars: BarSeries) -> Tuple[int, int]:
+        """Base-bar index range [first, last) the scenario trades on (start → end_date / max_ticks)."""
+        first = int(np.searchsorted(bars.times_msc, _to_msc(scenario.start_date)))
+        last = len(bars)
+        if scenario.end_date is not None:
+            last = int(np.searchsorted(bars.times_msc, _to_msc(scenario.end_date)))
+        if scenario.max_ticks is not None:
+            # Whichever boundary comes first, like the tick run
+            ticks = np.cumsum(bars.tick_count[first:last])
+            last = first + int(np.searchsorted(ticks, scenario.max_ticks, side='right'))
+        return first, max(first, last)
+
+    # ============================================
+    # Data + market context (once per sweep)
+    # ============================================
+
+    def _prepare_markets(self, scenarios: List[SingleScenario]) -> None:
+        """Build every scenario's trading context + cost model from its BrokerConfig."""
+        pending = [copy.deepcopy(s) for s in scenarios if s.scenario_index not in self._markets]
+        if not pending:
+            return
+        # Sets broker_type on the (copied) scenarios, as in Phase 0
+        serialized = BrokerDataPreparator(pending, self._logger).prepare()
+        market_config = MarketConfigManager()
+        for scenario in pending:
+            broker_type = scenario.broker_type
+            if broker_type not in serialized:
+                raise _NotScreenable(
+                    f"No broker config for scenario '{scenario.name}' "
+                    f"({scenario.data_broker_type}/{scenario.symbol})")
+            broker = BrokerConfigFactory.from_serialized_dict(broker_type, serialized[broker_type])
+            adapter = broker.adapter
+            spec = adapter.get_symbol_specification(scenario.symbol)
+            trading_model = market_config.get_trading_model(broker_type.value)
+
+            fee_model = FeeType(
+                adapter.broker_config.get('fee_structure', {}).get('model', 'spread'))
+            spread_points = (self._spread_points if self._spread_points is not None
+                             else self._average_spread_points(scenario))
+            self._markets[scenario.scenario_index] = ScreeningMarket(
+                trading_context=TradingContext(
+                    broker_type=broker_type,
+                    market_type=market_config.get_market_type(broker_type.value),
+                    symbol=scenario.symbol,
+                    volume_min=spec.volume_min,
+                    trading_model=trading_model,
+                    pip_size=adapter.get_pip_size(scenario.symbol),
+                ),
+                costs=ScreeningCostModel(
+                    fee_model=fee_model,
+                    spread=spread_points / (10 ** spec.digits),
+                    digits=spec.digits,
+                    tick_value=spec.tick_size * spec.contract_size,
+                    contract_size=spec.contract_size,
+                    taker_rate=(adapter.get_taker_fee()
+                                if fee_model == FeeType.MAKER_TAKER else 0.0),
+                ),
+                currency=spec.quote_currency,
+                allow_short=trading_model != TradingModel.SPOT,
+            )
+
+    def _average_spread_points(self, scenario: SingleScenario) -> float:
+        """Tick-count weighted average spread (points) of the tick files the scenario overlaps."""
+        if self._tick_index is None:
+            self._tick_index = TickIndexManager(logger=self._logger)
+            self._tick_index.build_index()
+        start = pd.Timestamp(scenario.start_date)
+        end = pd.Timestamp(scenario.end_date) if scenario.end_date is not None else None
+        weighted, ticks = 0.0, 0
+        for entry in self._tick_index.get_symbol_entries(scenario.data_broker_type, scenario.symbol):
+            spread = (entry.get('statistics') or {}).get('avg_spread_points')
+            if not spread or pd.Timestamp(entry['end_time']) < start:
+                continue
+            if end is not None and pd.Timestamp(entry['start_time']) > end:
+                continue
+            weighted += spread * entry['tick_count']
+            ticks += entry['tick_count']
+        if ticks == 0:
+            self._logger.warning(
+                f"🔬 No spread statistics for {scenario.data_broker_type}/{scenario.symbol} "
+                f"— screening '{scenario.name}' with zero spread")
+            return 0.0
+        return weighted / ticks
+
+    def _bars_for(self, scenario: SingleScenario, timeframe: str) -> BarSeries:
+        """The whole pre-rendered bar file of a scenario's symbol + timeframe (cached)."""
+        key = (scenario.data_broker_type, scenario.symbol, timeframe)
+        if key not in self._bars:
+            if self._bar_index is None:
+                self._bar_index = BarsIndexManager(logger=self._logger)
+                self._bar_index.build_index()
+            bar_file = self._bar_index.get_bar_file(*key)
+            if not bar_file:
+                raise _NotScreenable(
+                    f"No pre-rendered bars for {key[0]}/{key[1]} {timeframe} — run the bar "
+                    f"importer first")
+            self._bars[key] = load_bar_series(bar_file, timeframe)
+        return self._bars[key]
+
+    @staticmethod
+    def _timeframe(worker: AbstractIndicatorWorker) -> str:
+        """The timeframe a worker computes on (the first of its 'periods', like compute())."""
+        return list(worker.periods.keys())[0]
+
+
+def resolve_screening_objective(spec: SweepSpec) -> Tuple[str, bool, bool]:
+    """
+    The screening KPI + direction a sweep ranks its screen by.
+
+    An explicit `screening.objective` wins; otherwise the sweep objective when the screen
+    has it (with the sweep's direction), else net_pnl.
+
+    Args:
+        spec: The sweep spec
+
+    Returns:
+        (objective, maximize, fell_back) — fell_back True when net_pnl replaced the sweep objective
+
+    Raises:
+        ValueError: On an explicit objective the screen does not compute
+    """
+    explicit = spec.screening.objective
+    if explicit is not None:
+        if explicit not in SCREENING_OBJECTIVES:
+            raise ValueError(
+                f"screening.objective '{explicit}' is not a screening KPI. "
+                f"Allowed: {sorted(SCREENING_OBJECTIVES)}")
+        return explicit, SCREENING_OBJECTIVES[explicit], False
+    if spec.objective in SCREENING_OBJECTIVES:
+        return spec.objective, spec.maximize, False
+    return 'net_pnl', True, True
+
+
+def rank_screening(
+    results: List[ScreeningResult],
+    objective: str,
+    maximize: bool = True,
+    objective_currency: Optional[str] = None,
+) -> List[ScreeningResult]:
+    """
+    Rank screened combinations by a screening KPI (failed combinations drop out).
+
+    Args:
+        results: The screen's results
+        objective: ScreeningKpis field to rank by
+        maximize: True → best first is highest
+        objective_currency: Restrict to this currency (required when > 1 currency present)
+
+    Returns:
+        The scored results, best first (ties keep grid order)
+
+    Raises:
+        ValueError: If the results span > 1 currency and no objective_currency is given
+    """
+    scored = [r for r in results if r.error is None and r.kpis]
+    currency = objective_currency
+    if currency is None:
+        currencies = {c for r in scored for c in r.kpis}
+        if len(currencies) > 1:
+            raise ValueError(
+                f"Screening results span {len(currencies)} currencies "
+                f"({', '.join(sorted(currencies))}) — set objective_currency")
+        currency = next(iter(currencies), None)
+    scored = [r for r in scored if currency in r.kpis]
+    return sorted(scored, key=lambda r: getattr(r.kpis[currency], objective), reverse=maximize)
+
+
+class _NotScreenable(ValueError):
+    """A sweep-wide screening failure (no array form / no bars) — every combination would fail."""
+
+
+def load_bar_series(bar_file: Path, timeframe: str) -> BarSeries:
+    """
+    Read a pre-rendered bar parquet file into NumPy columns (UTC, oldest first).
+
+    Args:
+        bar_file: The bar parquet file
+        timeframe: Its timeframe
+
+    Returns:
+        The file's bars as a BarSeries
+    """
+    df = pd.read_parquet(bar_file)
+    timestamps = pd.to_datetime(df['timestamp'])
+    if timestamps.dt.tz is None:
+        timestamps = timestamps.dt.tz_localize('UTC')
+    else:
+        timestamps = timestamps.dt.tz_convert('UTC')
+    df = df.assign(timestamp=timestamps).sort_values('timestamp').reset_index(drop=True)
+    times_msc = (df['timestamp'] - pd.Timestamp(0, tz='UTC')) // pd.Timedelta(milliseconds=1)
+    return BarSeries(
+        timeframe=timeframe,
+        times_msc=times_msc.to_numpy(dtype=np.int64),
+        open=df['open'].to_numpy(dtype=np.float64),
+        high=df['high'].to_numpy(dtype=np.float64),
+        low=df['low'].to_numpy(dtype=np.float64),
+        close=df['close'].to_numpy(dtype=np.float64),
+        volume=df['volume'].to_numpy(dtype=np.float64),
+        tick_count=(df['tick_count'].to_numpy(dtype=np.int64) if 'tick_count' in df
+                    else np.ones(len(df), dtype=np.int64)),
+    )
+
+
+def simulate_bar_fills(
+    signals: ScreeningSignals,
+    bars: BarSeries,
+    costs: ScreeningCostModel,
+    allow_short: bool = True,
+) -> ScreeningKpis:
+    """
+    One-position fill simulation at bar resolution.
+
+    A signal on bar i acts at bar i+1's open: an open position closes on its exit signal,
+    a flat book opens on an entry signal (long first) — one action per bar, so a reversal
+    closes on one bar and reopens on the next signal. Buys pay mid + spread/2, sells
+    receive mid - spread/2; every entry pays the fee model's entry fee. A position still
+    open after the last bar closes at its close.
+
+    Args:
+        signals: Entry / exit arrays aligned to bars
+        bars: The screened bars
+        costs: The scenario's cost model
+        allow_short: False → short entries are ignored (SPOT)
+
+    Returns:
+        The closed-trade KPIs
+    """
+    kpis = ScreeningKpis()
+    half_spread = costs.spread / 2.0
+    lots = signals.lots
+    short_entries = signals.short_entries if allow_short else np.zeros(len(bars), dtype=bool)
+    # Only bars with any signal can act; the last bar's signal has no next open
+    active = (signals.long_entries | signals.long_exits | short_entries | signals.short_exits)
+    active[-1:] = False
+
+    direction, entry_price, fee = 0, 0.0, 0.0
+    equity, peak = 0.0, 0.0
+
+    def close(exit_mid: float) -> None:
+        nonlocal direction, equity, peak
+        exit_price = exit_mid - half_spread * direction
+        gross = gross_pnl_from_price_diff(
+            (exit_price - entry_price) * direction, costs.digits, costs.tick_value, lots)
+        net = gross - fee
+        kpis.total_trades += 1
+        kpis.total_fees += fee
+        if net > 0:
+            kpis.winning_trades += 1
+            kpis.total_profit += net
+        else:
+            kpis.losing_trades += 1
+            kpis.total_loss += -net
+        equity += net
+        peak = max(peak, equity)
+        kpis.max_drawdown = max(kpis.max_drawdown, peak - equity)
+        direction = 0
+
+    for i in np.flatnonzero(active):
+        fill_mid = float(bars.open[i + 1])
+        if direction == 1:
+            if signals.long_exits[i]:
+                close(fill_mid)
+        elif direction == -1:
+            if signals.short_exits[i]:
+                close(fill_mid)
+        elif signals.long_entries[i] or short_entries[i]:
+            direction = 1 if signals.long_entries[i] else -1
+            entry_price = fill_mid + half_spread * direction
+            fee = _entry_fee(costs, lots, entry_price)
+
+    if direction != 0:
+        close(float(bars.close[-1]))
+    kpis.net_pnl = kpis.total_profit - kpis.total_loss
+    return kpis
+
+
+def _entry_fee(costs: ScreeningCostModel, lots: float, entry_price: float) -> float:
+    """The trade simulator's entry fee: taker % of the order value, or the spread fee."""
+    if costs.fee_model == FeeType.MAKER_TAKER:
+        return lots * costs.contract_size * entry_price * costs.taker_rate / 100
+    return costs.spread * (10 ** costs.digits) * costs.tick_value * lots
+
+
+def _to_msc(moment) -> int:
+    """A scenario datetime (naive = UTC) as epoch milliseconds."""
+    timestamp = pd.Timestamp(moment)
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.tz_localize('UTC')
+    return int(timestamp.value // 1_000_000)
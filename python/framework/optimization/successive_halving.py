@@ -0,0 +1,163 @@
+"""
+Successive halving — the rung schedule + data reduction of a `successive_halving` sweep.
+
+Every combination first runs on a small share of the base set's data (rung 0). After each
+rung the ledger rows of that rung are ranked by the sweep objective and only the best
+1/eta combinations are promoted to the next rung, which runs on eta times more data. The
+last rung always runs on the full base set, so its rows are directly comparable to a grid
+sweep's and the rank / sensitivity analysis reads only that rung.
+
+Pure helpers — the runner owns the batch execution and reads the rungs back from the ledger.
+"""
+
+import copy
+import json
+import math
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from python.framework.optimization.optimization_analysis import rank
+from python.framework.types.api.report_types import RunResultRow
+from python.framework.types.config_types.optimization_config_types import HalvingSpec
+from python.framework.types.scenario_types.scenario_set_types import LoadedScenarioConfig
+
+
+def rung_fractions(halving: HalvingSpec) -> List[float]:
+    """
+    The data share each rung runs on: min_resource, ×eta per rung, capped at (and ending on) 1.
+
+    Args:
+        halving: The spec's halving settings
+
+    Returns:
+        Ascending data shares, last one = 1.0
+
+    Raises:
+        ValueError: On eta < 2 or min_resource outside (0, 1]
+    """
+    if halving.eta < 2:
+        raise ValueError(f"halving.eta must be >= 2, got {halving.eta}")
+    if not 0 < halving.min_resource <= 1:
+        raise ValueError(f"halving.min_resource must be in (0, 1], got {halving.min_resource}")
+    fractions = [halving.min_resource]
+    while fractions[-1] < 1.0:
+        fractions.append(min(1.0, fractions[-1] * halving.eta))
+    return fractions
+
+
+def survivor_count(evaluated: int, eta: int) -> int:
+    """How many of a rung's combinations are promoted (the best 1/eta, at least one)."""
+    return max(1, evaluated // eta)
+
+
+def reduce_base(
+    base: LoadedScenarioConfig,
+    fraction: float,
+    resource: str,
+) -> LoadedScenarioConfig:
+    """
+    A copy of the base scenario set reduced to a share of its data.
+
+    Args:
+        base: The loaded base scenario set (never mutated)
+        fraction: Data share (1.0 → the base itself)
+        resource: 'span' (shorten every scenario) | 'scenarios' (keep the first share of them)
+
+    Returns:
+        The reduced LoadedScenarioConfig
+
+    Raises:
+        ValueError: On a 'span' reduction of a scenario with neither end_date nor max_ticks
+    """
+    if fraction >= 1.0:
+        return base
+    cfg = copy.deepcopy(base)
+    if resource == 'scenarios':
+        cfg.scenarios = cfg.scenarios[:max(1, math.ceil(len(cfg.scenarios) * fraction))]
+        return cfg
+
+    for scenario in cfg.scenarios:
+        if scenario.end_date is None and scenario.max_ticks is None:
+            raise ValueError(
+                f"Scenario '{scenario.name}' has neither end_date nor max_ticks — "
+                f"successive halving over 'span' needs a bounded scenario")
+        if scenario.end_date is not None:
+            scenario.end_date = scenario.start_date + (
+                scenario.end_date - scenario.start_date) * fraction
+        if scenario.max_ticks is not None:
+            scenario.max_ticks = max(1, math.ceil(scenario.max_ticks * fraction))
+    return cfg
+
+
+def select_survivors(
+    rows: List[RunResultRow],
+    combos: List[Dict[str, Any]],
+    keep: int,
+    objective: str,
+    maximize: bool,
+    objective_currency: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    The best `keep` combinations of one rung, by the sweep objective.
+
+    Errored combinations (status='error') never rank and so are never promoted.
+
+    Args:
+        rows: The rung's ledger rows
+        combos: The combinations that ran in the rung
+        keep: How many to promote
+        objective: RunResultRow KPI to rank by
+        maximize: Rank direction
+        objective_currency: Restrict to this currency (needed when > 1 currency)
+
+    Returns:
+        The promoted combinations, best first
+    """
+    by_key = {_combo_key(combo): combo for combo in combos}
+    survivors: List[Dict[str, Any]] = []
+    for row in rank(rows, objective, maximize, objective_currency):
+        combo = by_key.pop(_combo_key(row.sweep_params or {}), None)
+        if combo is not None:
+            survivors.append(combo)
+            if len(survivors) == keep:
+                break
+    return survivors
+
+
+def final_rung_rows(rows: List[RunResultRow]) -> List[RunResultRow]:
+    """
+    A sweep's rows restricted to its last rung (all rows for a grid sweep).
+
+    Args:
+        rows: One sweep's ledger rows
+
+    Returns:
+        The rows the ranking + sensitivity read
+    """
+    rungs = [r.sweep_rung for r in rows if r.sweep_rung is not None]
+    if not rungs:
+        return rows
+    last = max(rungs)
+    return [r for r in rows if r.sweep_rung == last]
+
+
+def final_rung_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    final_rung_rows() over the ledger's analysis frame.
+
+    Args:
+        frame: One sweep's analysis frame
+
+    Returns:
+        The frame rows the ranking + sensitivity read
+    """
+    rungs = frame['sweep_rung'].dropna()
+    if rungs.empty:
+        return frame
+    return frame[frame['sweep_rung'] == rungs.max()]
+
+
+def _combo_key(combo: Dict[str, Any]) -> str:
+    """Identity of a grid point (the ledger stores sweep_params as sorted JSON)."""
+    return json.dumps(combo, sort_keys=True)
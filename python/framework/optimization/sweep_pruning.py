@@ -0,0 +1,79 @@
+"""
+Sweep pruning — resolves a sweep spec's `prune` block into each combination's concrete rule.
+
+The scenario processes check the rule through a periodic portfolio snapshot in the tick
+loop and end a hopeless combination early through the regular session-end path; the run is
+recorded in the ledger as `status='pruned'` with its partial KPIs (never ranked).
+
+The objective bound is only sound for an objective whose running value can only get worse
+during a run — a snapshot past the bound then proves the finished run would be past it too.
+Of the ledger KPIs only a minimized max_drawdown qualifies (P&L, expectancy and win rate can
+recover; total_fees can shrink with a swap credit).
+
+Pure helpers — the runner reads the ledger and attaches the rule to the scenarios.
+"""
+
+from typing import List
+
+from python.framework.optimization.optimization_analysis import rank
+from python.framework.types.api.report_types import RunResultRow
+from python.framework.types.config_types.optimization_config_types import SweepSpec
+from python.framework.types.run_results_types import PruneRule
+
+# Objectives whose running value is monotone (only ever gets worse) during a run
+PROVABLE_BOUND_OBJECTIVES = ('max_drawdown',)
+
+
+def validate_prune_spec(spec: SweepSpec) -> None:
+    """
+    Fail-fast check of a sweep spec's `prune` block.
+
+    Args:
+        spec: The sweep spec (no-op when it has no `prune` block)
+
+    Raises:
+        ValueError: On a non-positive threshold / cadence, or an objective bound on an
+            objective that is not provably monotone
+    """
+    prune = spec.prune
+    if prune is None:
+        return
+    if prune.check_every_ticks < 1:
+        raise ValueError(f"prune.check_every_ticks must be >= 1, got {prune.check_every_ticks}")
+    if prune.max_drawdown is not None and prune.max_drawdown <= 0:
+        raise ValueError(f"prune.max_drawdown must be > 0, got {prune.max_drawdown}")
+    if prune.objective_bound_k is not None:
+        if prune.objective_bound_k < 1:
+            raise ValueError(
+                f"prune.objective_bound_k must be >= 1, got {prune.objective_bound_k}")
+        if spec.objective not in PROVABLE_BOUND_OBJECTIVES or spec.maximize:
+            raise ValueError(
+                f"prune.objective_bound_k needs an objective that can only get worse during a "
+                f"run (minimized {', '.join(PROVABLE_BOUND_OBJECTIVES)}) — "
+                f"'{spec.objective}' ({'maximize' if spec.maximize else 'minimize'}) can recover, "
+                f"so a mid-run bound would not be provable")
+
+
+def build_prune_rule(spec: SweepSpec, rows: List[RunResultRow]) -> PruneRule:
+    """
+    The concrete prune rule of the next combination.
+
+    Args:
+        spec: The sweep spec (must carry a validated `prune` block)
+        rows: The finished, comparable ledger rows so far (same sweep + rung)
+
+    Returns:
+        The PruneRule — objective_bound None until k combinations finished ok
+    """
+    prune = spec.prune
+    bound = None
+    if prune.objective_bound_k is not None:
+        ranked = rank(rows, spec.objective, spec.maximize, spec.objective_currency)
+        if len(ranked) >= prune.objective_bound_k:
+            bound = float(getattr(ranked[prune.objective_bound_k - 1], spec.objective))
+    return PruneRule(
+        max_drawdown=prune.max_drawdown,
+        objective_bound=bound,
+        objective_currency=spec.objective_currency,
+        check_every_ticks=prune.check_every_ticks,
+    )
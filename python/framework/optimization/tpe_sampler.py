@@ -0,0 +1,274 @@
+"""
+TPE sampler — the model-based combination generator of a `bayes` sweep.
+
+A tree-structured Parzen estimator in NumPy. The scored combinations of the sweep so far
+are split at the gamma-quantile of the objective into a "good" and a "bad" set, and each
+parameter gets one Parzen density per set: Gaussian kernels around the observed values
+(plus a uniform prior) for a numeric range, Laplace-smoothed frequencies for a categorical
+list. Candidates are drawn from the good densities; the ones with the highest l(x)/g(x)
+are proposed. Parameters are modelled independently (the classic TPE factorization).
+
+Until `startup` combinations carry an objective the proposals are uniform random. When the
+draws keep hitting combinations already proposed, the proposal falls back to a uniform pick
+among the untried ones (enumerated for a finite space), so a finite space ends only when it is
+really exhausted. One seeded RNG drives everything, so the same seed over the same ledger rows proposes the
+same combinations (determinism, pairs with #368).
+"""
+
+import itertools
+import json
+import math
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+import numpy as np
+
+from python.framework.types.config_types.optimization_config_types import ParamRange
+
+SearchSpace = Dict[str, Union[List[Any], ParamRange]]
+
+# (combination, objective value) of one scored evaluation
+Observation = Tuple[Dict[str, Any], float]
+
+# Draws per proposal before falling back to a uniform pick among the untried combinations
+_MAX_DRAWS = 64
+
+# Largest finite space the fallback enumerates; beyond it the fallback draws uniformly instead
+_MAX_ENUMERATED = 100_000
+
+
+class TpeSampler:
+    """Proposes batches of combinations from a search space of value lists + numeric ranges."""
+
+    def __init__(
+        self,
+        space: SearchSpace,
+        maximize: bool = True,
+        seed: Optional[int] = None,
+        startup: int = 8,
+        gamma: float = 0.25,
+        candidates: int = 24,
+    ):
+        """
+        Args:
+            space: Dotted path → candidate value list (categorical) or ParamRange (numeric)
+            maximize: Objective direction (True → higher is better)
+            seed: RNG seed (None → non-deterministic)
+            startup: Scored combinations needed before the model replaces random proposals
+            gamma: Share of the scored combinations forming the "good" set
+            candidates: Candidates drawn from the good densities per proposal
+        """
+        self._paths = sorted(space)
+        self._space = space
+        self._maximize = maximize
+        self._rng = np.random.default_rng(seed)
+        self._startup = startup
+        self._gamma = gamma
+        self._candidates = candidates
+
+    def propose(
+        self,
+        history: Sequence[Observation],
+        proposed: Sequence[Dict[str, Any]],
+        count: int,
+    ) -> List[Dict[str, Any]]:
+        """
+        Propose up to `count` new combinations (none of them proposed before).
+
+        Args:
+            history: Scored evaluations so far (errored combinations carry no score)
+            proposed: Every combination proposed so far (scored or not) — never repeated
+            count: How many to propose (one batch, run before the model is refitted)
+
+        Returns:
+            The proposals (fewer than `count` once a finite space is exhausted — or, for a
+            continuous / very large space, when no untried combination was drawn)
+        """
+        seen: Set[str] = {_key(combo) for combo in proposed}
+        size = equivalent_grid_size(self._space)
+        model = self._fit(history) if len(history) >= self._startup else None
+
+        batch: List[Dict[str, Any]] = []
+        while len(batch) < count and (size is None or len(seen) < size):
+            combo = self._draw(model, seen)
+            if combo is None:
+                combo = self._draw_untried(seen, size)
+            if combo is None:
+                break
+            seen.add(_key(combo))
+            batch.append(combo)
+        return batch
+
+    # =========================================================================
+    # MODEL
+    # =========================================================================
+
+    def _fit(self, history: Sequence[Observation]) -> Dict[str, Tuple[Any, Any]]:
+        """Per parameter: (good density, bad density) fitted to the split history."""
+        ordered = sorted(history, key=lambda obs: obs[1], reverse=self._maximize)
+        n_good = max(1, math.ceil(self._gamma * len(ordered)))
+        good, bad = ordered[:n_good], ordered[n_good:]
+        return {path: (self._density(path, good), self._density(path, bad))
+                for path in self._paths}
+
+    def _density(self, path: str, observations: Sequence[Observation]) -> Any:
+        """The Parzen density of one parameter over one set of observations."""
+        domain = self._space[path]
+        if isinstance(domain, ParamRange):
+            low, high = _bounds(domain)
+            points = np.array([_to_internal(domain, combo[path]) for combo, _ in observations
+                               if isinstance(combo.get(path), (int, float))], dtype=float)
+            # Bandwidth shrinks with the sample size (Scott-like), floored to stay exploratory
+            width = high - low
+            sigma = max(width * 0.5 * max(len(points), 1) ** -0.2, width * 0.02)
+            return _NumericDensity(points, sigma, low, high)
+
+        keys = [_key(value) for value in domain]
+        counts = np.ones(len(domain))                  # Laplace prior: every choice stays possible
+        for combo, _ in observations:
+            if path in combo and _key(combo[path]) in keys:
+                counts[keys.index(_key(combo[path]))] += 1
+        return counts / counts.sum()
+
+    def _draw(self, model: Optional[Dict[str, Tuple[Any, Any]]], seen: Set[str]
+              ) -> Optional[Dict[str, Any]]:
+        """One proposal not in `seen`: random (no model yet) or the best l/g of a candidate set."""
+        for _ in range(_MAX_DRAWS):
+            if model is None:
+                combo = {path: self._sample(path, None) for path in self._paths}
+                if _key(combo) not in seen:
+                    return combo
+                continue
+            scored = []
+            for _ in range(self._candidates):
+                combo = {path: self._sample(path, model[path][0]) for path in self._paths}
+                if _key(combo) not in seen:
+                    scored.append((self._log_ratio(combo, model), combo))
+            if scored:
+                return max(scored, key=lambda item: item[0])[1]
+        return None
+
+    def _draw_untried(self, seen: Set[str], size: Optional[int]) -> Optional[Dict[str, Any]]:
+        """Fallback proposal: a uniform pick among the combinations not in `seen` (None: none left)."""
+        if size is None or size > _MAX_ENUMERATED:
+            for _ in range(_MAX_DRAWS):
+                combo = {path: self._sample(path, None) for path in self._paths}
+                if _key(combo) not in seen:
+                    return combo
+            return None
+        levels = [_levels(self._space[path]) for path in self._paths]
+        untried = [combo for combo in (dict(zip(self._paths, values))
+                                       for values in itertools.product(*levels))
+                   if _key(combo) not in seen]
+        if not untried:
+            return None
+        return untried[int(self._rng.integers(len(untried)))]
+
+    def _sample(self, path: str, density: Any) -> Any:
+        """A value of one parameter: uniform (no density) or drawn from the density."""
+        domain = self._space[path]
+        if isinstance(domain, ParamRange):
+            low, high = _bounds(domain)
+            if density is None or not len(density.points) or self._rng.random() < density.prior_weight:
+                internal = self._rng.uniform(low, high)
+            else:
+                center = density.points[self._rng.integers(len(density.points))]
+                internal = float(np.clip(self._rng.normal(center, density.sigma), low, high))
+            return _to_value(domain, internal)
+        return domain[int(self._rng.choice(len(domain), p=density))]
+
+    def _log_ratio(self, combo: Dict[str, Any], model: Dict[str, Tuple[Any, Any]]) -> float:
+        """log l(x) - log g(x) summed over the (independent) parameters."""
+        total = 0.0
+        for path in self._paths:
+            good, bad = model[path]
+            domain = self._space[path]
+            if isinstance(domain, ParamRange):
+                internal = _to_internal(domain, combo[path])
+                total += math.log(good.pdf(internal)) - math.log(bad.pdf(internal))
+            else:
+                index = [_key(v) for v in domain].index(_key(combo[path]))
+                total += math.log(good[index]) - math.log(bad[index])
+        return total
+
+
+class _NumericDensity:
+    """Gaussian kernels around the observed points + a uniform prior over [low, high]."""
+
+    def __init__(self, points: np.ndarray, sigma: float, low: float, high: float):
+        self.points = points
+        self.sigma = sigma
+        self.low = low
+        self.high = high
+        self.prior_weight = 1.0 / (len(points) + 1)
+
+    def pdf(self, x: float) -> float:
+        """Mixture density at x (never 0 — the prior covers the whole range)."""
+        prior = 1.0 / (self.high - self.low)
+        if not len(self.points):
+            return prior
+        kernels = np.exp(-0.5 * ((x - self.points) / self.sigma) ** 2) / (
+            self.sigma * math.sqrt(2 * math.pi))
+        return float((kernels.sum() + prior) / (len(self.points) + 1))
+
+
+def equivalent_grid_size(space: SearchSpace) -> Optional[int]:
+    """
+    How many combinations the equivalent exhaustive grid has.
+
+    Args:
+        space: Dotted path → value list or ParamRange
+
+    Returns:
+        The product of the per-parameter level counts (None if a range is continuous)
+    """
+    size = 1
+    for domain in space.values():
+        if isinstance(domain, ParamRange):
+            if domain.step is None:
+                return None
+            size *= int(math.floor((domain.high - domain.low) / domain.step + 1e-9)) + 1
+        else:
+            size *= len(domain)
+    return size
+
+
+def _levels(domain: Union[List[Any], ParamRange]) -> List[Any]:
+    """Every value of a finite parameter domain (a value list or a stepped range)."""
+    if not isinstance(domain, ParamRange):
+        return list(domain)
+    count = int(math.floor((domain.high - domain.low) / domain.step + 1e-9)) + 1
+    return [_quantize(domain, domain.low + i * domain.step) for i in range(count)]
+
+
+def _bounds(domain: ParamRange) -> Tuple[float, float]:
+    """The range in the sampler's internal coordinates (log scale if requested)."""
+    if domain.log:
+        return math.log(domain.low), math.log(domain.high)
+    return domain.low, domain.high
+
+
+def _to_internal(domain: ParamRange, value: float) -> float:
+    """A parameter value → internal coordinate."""
+    return math.log(value) if domain.log else float(value)
+
+
+def _to_value(domain: ParamRange, internal: float) -> Union[int, float]:
+    """An internal coordinate → parameter value (quantized to the step, integer if all-integer)."""
+    value = math.exp(internal) if domain.log else internal
+    if domain.step is not None:
+        value = domain.low + round((value - domain.low) / domain.step) * domain.step
+    return _quantize(domain, value)
+
+
+def _quantize(domain: ParamRange, value: float) -> Union[int, float]:
+    """A value on the range's grid → its canonical form (clamped, integer if all-integer)."""
+    if domain.step is not None:
+        value = min(max(value, domain.low), domain.high)
+        if all(float(x).is_integer() for x in (domain.low, domain.high, domain.step)):
+            return int(round(value))
+    return round(value, 10)
+
+
+def _key(value: Any) -> str:
+    """Identity of a combination / categorical value (the ledger stores sweep_params as sorted JSON)."""
+    return json.dumps(value, sort_keys=True)
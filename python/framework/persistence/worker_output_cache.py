@@ -0,0 +1,314 @@
+"""
+FiniexTestingIDE - Worker Output Cache
+
+On-disk cache of per-bar worker output series, shared across scenarios, sets and sweep
+combinations. Robustness sets and sweeps run the same worker configs over the same data
+again and again; an indicator's output is a pure function of the bar series it computes on,
+the worker code, its parameters and its compute basis. A run whose worker hits the cache
+replays the stored results instead of calling compute().
+
+Scope — BAR_CLOSE indicator workers only: they compute once per closed bar of their
+timeframes (cold start included), so their outputs ARE a per-bar series, keyed by the last
+completed bar of each required timeframe. LIVE workers recompute intra-bar on every tick
+(a per-tick series — not worth storing) and SIGNAL workers read external data; both always
+compute.
+
+Cache key (SHA256):
+- series key: the scenario's DataIdentityKey (broker / symbol / window / warmup / tick
+  budget), the source file fingerprints of the set and bar_max_history — computed once per
+  mount in the main process (BatchOrchestrator.execute)
+- worker identity: class, declared metadata version and a hash of the worker's source file
+  (an edited worker never replays stale outputs), its parameters, compute basis and the
+  gated output set (#425)
+
+Storage:
+    <data_processed>/.worker_output_cache/<key>/
+        series.pkl       pickled {bar key → WorkerResult}
+        manifest.json    worker + entry count, created_at, size (human inspection)
+
+A series is written at the end of a run when it gained entries (a partial, e.g. pruned,
+run stores its prefix; a later run extends it). Entries beyond max_entries are evicted
+oldest-first. Maintenance: `strategy_runner_cli.py worker-cache status | clear`.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import shutil
+from dataclasses import asdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from python.framework.logging.abstract_logger import AbstractLogger
+from python.framework.types.mount_package_types import DataIdentityKey
+from python.framework.types.worker_types import ComputeBasis, WorkerOutputSeries
+from python.framework.workers.abstract_indicator_worker import AbstractIndicatorWorker
+from python.framework.workers.abstract_worker import AbstractWorker
+
+
+class WorkerOutputCache:
+    """
+    Persists per-bar worker output series to disk, keyed by data identity + worker identity.
+
+    An accelerator only — an unreadable entry is a miss and a failed write never fails the run.
+    """
+
+    CACHE_PARENT_DIR = ".worker_output_cache"
+    SERIES_FILE = "series.pkl"
+    MANIFEST_FILE = "manifest.json"
+
+    # Bump when the stored series layout (or WorkerResult) changes — old entries become misses.
+    STORE_FORMAT_VERSION = 1
+
+    def __init__(self, logger: AbstractLogger, cache_dir: Path, max_entries: int = 0):
+        """
+        Initialize worker output cache.
+
+        Args:
+            logger: Logger for load / persist / eviction messages
+            cache_dir: Cache directory (<data_processed>/.worker_output_cache)
+            max_entries: Series kept on disk (0 = unbounded)
+        """
+        self._logger = logger
+        self._cache_dir = Path(cache_dir)
+        self._max_entries = max_entries
+
+    # =========================================================================
+    # KEY
+    # =========================================================================
+
+    @classmethod
+    def series_key(
+        cls,
+        data_identity: DataIdentityKey,
+        file_fingerprints: List[Tuple[str, int, int]],
+        bar_max_history: int,
+    ) -> str:
+        """
+        Data-level key of one scenario's bar series (shared by every worker of the scenario).
+
+        Args:
+            data_identity: The scenario's DataIdentityKey
+            file_fingerprints: (path, size, mtime_ns) of the set's source files
+            bar_max_history: Bar history window the workers compute on
+
+        Returns:
+            SHA256 hex digest
+        """
+        identity = {
+            'format': cls.STORE_FORMAT_VERSION,
+            'data_identity': asdict(data_identity),
+            'files': file_fingerprints,
+            'bar_max_history': bar_max_history,
+        }
+        return cls._digest(identity)
+
+    @classmethod
+    def worker_key(cls, series_key: str, worker: AbstractIndicatorWorker) -> str:
+        """
+        Cache key of one worker instance's output series on a bar series.
+
+        Args:
+            series_key: The scenario's series key (series_key())
+            worker: The worker instance
+
+        Returns:
+            SHA256 hex digest
+        """
+        worker_cls = type(worker)
+        requested = worker.get_requested_outputs()
+        identity = {
+            'series': series_key,
+            'worker_class': f"{worker_cls.__module__}.{worker_cls.__qualname__}",
+            'worker_version': worker_cls.get_metadata().version,
+            'worker_source': cls._source_hash(worker_cls),
+            'parameters': worker.parameters,
+            'compute_basis': worker.get_compute_basis().value,
+            'requested_outputs': sorted(requested) if requested is not None else None,
+        }
+        return cls._digest(identity)
+
+    @staticmethod
+    def is_cacheable(worker: AbstractWorker) -> bool:
+        """
+        Whether a worker's outputs form a per-bar series (BAR_CLOSE indicator worker).
+
+        Args:
+            worker: The worker instance
+
+        Returns:
+            True if the worker's outputs can be replayed from the cache
+        """
+        return (isinstance(worker, AbstractIndicatorWorker)
+                and worker.get_compute_basis() == ComputeBasis.BAR_CLOSE)
+
+    @staticmethod
+    def bar_key(worker: AbstractIndicatorWorker, bar_history: Dict[str, list]) -> Tuple[str, ...]:
+        """
+        Position of a compute in the bar series: the last completed bar per required timeframe.
+
+        Args:
+            worker: The worker instance
+            bar_history: The (worker-filtered) completed bars per timeframe
+
+        Returns:
+            Tuple of bar timestamps, one per required timeframe ('' = no bar yet)
+        """
+        return tuple(
+            bars[-1].timestamp if bars else ''
+            for bars in (bar_history.get(tf, []) for tf in worker.get_required_timeframes())
+        )
+
+    @staticmethod
+    def _digest(identity: Dict[str, Any]) -> str:
+        normalized = json.dumps(identity, sort_keys=True, separators=(',', ':'), default=str)
+        return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _source_hash(worker_cls: type) -> str:
+        """SHA256 of the worker's source file ('' when it has none, e.g. a dynamic class)."""
+        try:
+            source_file = inspect.getsourcefile(worker_cls)
+            with open(source_file, 'rb') as f:
+                return hashlib.sha256(f.read()).hexdigest()
+        except (TypeError, OSError):
+            return ''
+
+    # =========================================================================
+    # LOAD / SAVE
+    # =========================================================================
+
+    def load(self, key: str) -> WorkerOutputSeries:
+        """
+        Load a worker's stored output series (an empty series on a miss / unreadable entry).
+
+        Args:
+            key: Cache key from worker_key()
+
+        Returns:
+            WorkerOutputSeries — entries empty when nothing is stored yet
+        """
+        series_file = self._cache_dir / key / self.SERIES_FILE
+        if not series_file.exists():
+            return WorkerOutputSeries(key=key)
+
+        try:
+            with open(series_file, 'rb') as f:
+                payload = pickle.load(f)
+        except Exception as e:
+            self._logger.warning(
+                f"⚠️ Worker output series {key[:12]} unreadable ({e}) — discarding")
+            shutil.rmtree(series_file.parent, ignore_errors=True)
+            return WorkerOutputSeries(key=key)
+
+        if payload.get('format') != self.STORE_FORMAT_VERSION:
+            return WorkerOutputSeries(key=key)
+
+        # Touch for LRU eviction order
+        os.utime(series_file.parent)
+        return WorkerOutputSeries(key=key, entries=payload['entries'])
+
+    def save(self, series: WorkerOutputSeries, worker: AbstractWorker) -> Optional[Path]:
+        """
+        Persist a worker's output series (written only when the run added entries).
+
+        Args:
+            series: The series (stored entries + the ones this run computed)
+            worker: The worker it belongs to (manifest only)
+
+        Returns:
+            The entry directory, or None if nothing was written
+        """
+        if not series.dirty or not series.entries:
+            return None
+
+        payload = {'format': self.STORE_FORMAT_VERSION, 'entries': series.entries}
+        entry_dir = self._cache_dir / series.key
+        # Process-unique tmp dir: parallel scenarios may persist the same series at once
+        tmp_dir = self._cache_dir / f".{series.key}.{os.getpid()}.tmp"
+        try:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            tmp_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_dir / self.SERIES_FILE, 'wb') as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            manifest = {
+                'key': series.key,
+                'worker': worker.name,
+                'worker_class': type(worker).__name__,
+                'entries': len(series.entries),
+                'created_at': datetime.now(timezone.utc).isoformat(),
+                'size_kb': round((tmp_dir / self.SERIES_FILE).stat().st_size / 1024, 1),
+            }
+            with open(tmp_dir / self.MANIFEST_FILE, 'w') as f:
+                json.dump(manifest, f, indent=2)
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            tmp_dir.rename(entry_dir)
+        except Exception as e:
+            self._logger.warning(f"⚠️ Could not persist worker output series: {e}")
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            return None
+
+        series.dirty = False
+        self._logger.debug(
+            f"💾 Worker output series persisted ({worker.name}, "
+            f"{manifest['entries']} bars, key {series.key[:12]})")
+        self._evict()
+        return entry_dir
+
+    # =========================================================================
+    # MAINTENANCE
+    # =========================================================================
+
+    def _entries(self) -> List[Path]:
+        """Stored series directories, most recently used first."""
+        if not self._cache_dir.exists():
+            return []
+        return sorted(
+            (d for d in self._cache_dir.iterdir()
+             if d.is_dir() and not d.name.startswith('.')),
+            key=lambda d: d.stat().st_mtime,
+            reverse=True,
+        )
+
+    def _evict(self) -> None:
+        """Drop the least recently used entries beyond max_entries."""
+        if self._max_entries <= 0:
+            return
+        for stale in self._entries()[self._max_entries:]:
+            shutil.rmtree(stale, ignore_errors=True)
+            self._logger.debug(f"🗑️ Evicted worker output series {stale.name[:12]}")
+
+    def list_entries(self) -> List[Dict[str, Any]]:
+        """
+        Manifests of every stored series, most recently used first.
+
+        Returns:
+            List of manifest dicts (an entry without a readable manifest reports its key only)
+        """
+        manifests = []
+        for entry in self._entries():
+            try:
+                with open(entry / self.MANIFEST_FILE) as f:
+                    manifests.append(json.load(f))
+            except (OSError, ValueError):
+                manifests.append({'key': entry.name})
+        return manifests
+
+    def clear(self) -> int:
+        """
+        Remove every stored series.
+
+        Returns:
+            Number of entries removed
+        """
+        if not self._cache_dir.exists():
+            return 0
+        removed = 0
+        for entry in self._cache_dir.iterdir():
+            if entry.is_dir():
+                shutil.rmtree(entry, ignore_errors=True)
+                removed += 1
+        return removed
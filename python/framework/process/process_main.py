@@ -5,7 +5,10 @@ import time
 import traceback
 from typing import Optional
 from python.framework.logging.scenario_logger import ScenarioLogger
+from python.framework.process.process_multi_decision_tick_loop import (
+    DecisionStack, execute_multi_decision_tick_loop)
 from python.framework.process.process_tick_loop import execute_tick_loop
+from python.framework.process.process_window_span_tick_loop import execute_window_span_tick_loop
 from python.framework.trading_env.decision_event_dispatcher import DecisionEventDispatcher
 from python.framework.process.process_live_queue_helper import send_status_update_process
 from python.framework.process.process_startup_preparation import process_startup_preparation
@@ -59,7 +62,9 @@ def process_main(
          bar_rendering_controller,
          decision_logic,
          scenario_logger,
-         ticks) = process_startup_preparation(
+         ticks,
+         variant_stacks,
+         window_stacks) = process_startup_preparation(
             config, shared_data, scenario_logger)
         scenario_logger.debug(
             f"🔄 Process preparation finished")
@@ -80,14 +85,51 @@ def process_main(
         send_status_update_process(live_queue, config, ScenarioStatus.RUNNING)
 
         # === TICK LOOP EXECUTION ===
-        tick_loop_results = execute_tick_loop(
-            config, worker_coordinator, trade_simulator,
-            bar_rendering_controller, decision_logic,
-            scenario_logger, ticks, live_queue,
-            decision_event_dispatcher)
+        variant_tick_loop_results = None
+        window_tick_loop_results = None
+        if window_stacks:
+            # Single-pass robustness span: one pipeline, a fresh stack per window
+            for stack in window_stacks:
+                stack.decision_event_dispatcher = DecisionEventDispatcher.create_if_subscribed(
+                    decision_logic=stack.decision_logic,
+                    executor=stack.trade_simulator,
+                    logger=scenario_logger,
+                )
+            windows = [DecisionStack(decision_logic, trade_simulator,
+                                     decision_event_dispatcher)] + window_stacks
+            window_results = execute_window_span_tick_loop(
+                config, worker_coordinator, windows, bar_rendering_controller,
+                scenario_logger, ticks, live_queue)
+            tick_loop_results = window_results[0]
+            window_tick_loop_results = window_results[1:]
+        elif variant_stacks:
+            # Multi-decision sweep: one worker pipeline, one stack per combination
+            for stack in variant_stacks:
+                stack.decision_event_dispatcher = DecisionEventDispatcher.create_if_subscribed(
+                    decision_logic=stack.decision_logic,
+                    executor=stack.trade_simulator,
+                    logger=scenario_logger,
+                )
+            stacks = [DecisionStack(decision_logic, trade_simulator,
+                                    decision_event_dispatcher)] + variant_stacks
+            stack_results = execute_multi_decision_tick_loop(
+                config, worker_coordinator, stacks, bar_rendering_controller,
+                scenario_logger, ticks, live_queue)
+            tick_loop_results = stack_results[0]
+            variant_tick_loop_results = stack_results[1:]
+        else:
+            tick_loop_results = execute_tick_loop(
+                config, worker_coordinator, trade_simulator,
+                bar_rendering_controller, decision_logic,
+                scenario_logger, ticks, live_queue,
+                decision_event_dispatcher)
         scenario_logger.debug(
             f"🔄 Execute tick loop finished")
 
+        # === WORKER OUTPUT CACHE ===
+        # Persist the cached series this run extended (no-op when the cache is off)
+        worker_coordinator.flush_output_cache()
+
         # === DIAGNOSTICS CSV (#376) ===
         # Flush algo-declared diagnostics sinks next to events_<scenario>.csv.
         # Suffix matches process_result.scenario_name (config.name) for alignment.
@@ -141,6 +183,8 @@ def process_main(
             scenario_index=config.scenario_index,
             execution_time_ms=time.time() - start_time,
             tick_loop_results=tick_loop_results,
+            variant_tick_loop_results=variant_tick_loop_results,
+            window_tick_loop_results=window_tick_loop_results,
             scenario_logger_buffer=log_buffer,
             error_type=error_type,
             error_message=error_message,
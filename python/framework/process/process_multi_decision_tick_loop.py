@@ -0,0 +1,441 @@
+"""
+FiniexTestingIDE - Multi-Decision Tick Loop
+One tick loop, one worker pipeline, N independent decision stacks.
+
+A multi-decision sweep groups combinations that differ only in the
+decision_logic_config into ONE scenario process. Bars render and the workers
+compute once per tick; each stack (decision logic + own trade simulator +
+portfolio) then computes and executes its own decision on the shared worker
+results. Every stack produces its own ProcessTickLoopResult — bit-identical to
+the run it replaces, because workers are deterministic per tick and do not
+depend on the decision.
+
+Stack semantics follow the single-stack loop (process_tick_loop): a session
+end or prune ends only that stack (it is closed out at the tick it ended on),
+an exception fails only that stack. An exception in the shared part (bars,
+workers) fails all stacks.
+"""
+
+import time
+import traceback
+from collections import defaultdict
+from dataclasses import dataclass
+from multiprocessing import Queue
+from typing import List, Optional, Tuple
+
+from python.framework.bars.bar_rendering_controller import BarRenderingController
+from python.framework.decision_logic.abstract_decision_logic import AbstractDecisionLogic
+from python.framework.logging.scenario_logger import ScenarioLogger
+from python.framework.process.market_data_episode_tracker import MarketDataEpisodeTracker
+from python.framework.process.process_block_boundary import build_block_boundary_report
+from python.framework.process.process_live_export import process_live_export, process_live_setup
+from python.framework.process.process_tick_loop import (
+    _check_prune_rule, _print_tick_loop_finishing_log, _run_sim_heartbeats)
+from python.framework.process.tick_pipeline_core import execute_worker_path, render_bars_for_tick
+from python.framework.stress_test.stale_data_stress_driver import (
+    StaleDataStressDriver, warn_events_outside_range)
+from python.framework.trading_env.abstract_trade_executor import AbstractTradeExecutor
+from python.framework.trading_env.decision_event_dispatcher import DecisionEventDispatcher
+from python.framework.types.decision_logic_types import Decision
+from python.framework.types.decision_event_types import SessionEndEvent, SessionEndSeverity
+from python.framework.types.market_types.market_data_types import TickData
+from python.framework.types.process_data_types import (
+    ProcessProfileData,
+    ProcessScenarioConfig,
+    ProcessTickLoopResult,
+)
+from python.framework.types.run_results_types import PruneRule
+from python.framework.utils.process_debug_info_utils import get_tick_range_stats
+from python.framework.workers.worker_orchestrator import WorkerOrchestrator
+
+
+@dataclass
+class DecisionStack:
+    """
+    One decision stack of a multi-decision tick loop and its run state.
+
+    Stack 0 is the scenario's own decision logic; stacks 1..N come from
+    ProcessScenarioConfig.decision_variants.
+    """
+    decision_logic: AbstractDecisionLogic
+    trade_simulator: AbstractTradeExecutor
+    decision_event_dispatcher: Optional[DecisionEventDispatcher] = None
+
+    # Run state (set by the loop)
+    stale_stress_driver: Optional[StaleDataStressDriver] = None
+    market_data_tracker: Optional[MarketDataEpisodeTracker] = None
+    end_tick: Optional[TickData] = None          # tick the stack ended on (session end / prune)
+    pruned_reason: Optional[str] = None
+    tick_loop_error: Optional[Exception] = None
+
+    @property
+    def active(self) -> bool:
+        """Whether the stack still receives ticks."""
+        return self.end_tick is None and self.tick_loop_error is None
+
+
+def execute_multi_decision_tick_loop(
+    config: ProcessScenarioConfig,
+    worker_coordinator: WorkerOrchestrator,
+    stacks: List[DecisionStack],
+    bar_rendering_controller: BarRenderingController,
+    scenario_logger: ScenarioLogger,
+    ticks: Tuple[TickData, ...],
+    live_queue: Optional[Queue] = None,
+) -> List[ProcessTickLoopResult]:
+    """
+    Execute the tick loop once for several decision stacks.
+
+    Args:
+        config: Scenario configuration (shared by all stacks)
+        worker_coordinator: Orchestrator — workers run once per tick
+        stacks: Decision stacks, the scenario's own first
+        bar_rendering_controller: Bar rendering controller
+        scenario_logger: Logger for this scenario
+        ticks: Deserialized tick data
+        live_queue: Queue for live updates (optional — reports the first stack)
+
+    Returns:
+        One ProcessTickLoopResult per stack, in stack order
+    """
+    for stack in stacks:
+        stack.market_data_tracker = MarketDataEpisodeTracker(
+            source=config.broker_type.value if config.broker_type else '',
+            logger=scenario_logger)
+    primary = stacks[0]
+    shared_error: Optional[Exception] = None
+
+    # Profiling covers the whole fan-out — every stack's result carries the same data
+    profiling_enabled = config.tick_loop_profiling
+    profile_times = defaultdict(float) if profiling_enabled else {}
+    profile_counts = defaultdict(int) if profiling_enabled else {}
+    inter_tick_intervals: List[float] = []
+    prev_interval_msc: int = 0
+
+    live_update_count = 0
+    tick_range_stats = None
+    current_bars = {}
+    current_tick = None
+    current_index = 0
+
+    try:
+        tick_range_stats = get_tick_range_stats(scenario_logger, primary.trade_simulator, ticks)
+        live_setup = process_live_setup(scenario_logger, config, ticks, live_queue)
+        prune_rule = config.prune_rule
+
+        # #436: one stale-stress driver per stack — each drives its own simulator's
+        # status and its own decision's stale edge.
+        stale_cfg = (
+            config.stress_test_config.stale_data_stress
+            if config.stress_test_config else None
+        )
+        if stale_cfg is not None and stale_cfg.enabled and ticks:
+            warn_events_outside_range(
+                stale_cfg.events, ticks[0].timestamp, ticks[-1].timestamp,
+                scenario_logger)
+            tick_source_events = stale_cfg.get_events_for_source(config.broker_type.value)
+            if tick_source_events:
+                for stack in stacks:
+                    stack.stale_stress_driver = StaleDataStressDriver(
+                        tick_source_events, stack.trade_simulator, stack.decision_logic,
+                        scenario_logger)
+
+        scenario_logger.info(
+            f"🔄 Starting tick loop ({live_setup.tick_count:,} ticks, "
+            f"{len(stacks)} decision stacks)")
+        scenario_logger.set_tick_loop_started(True)
+
+        for tick_idx, tick in enumerate(ticks):
+            active = [stack for stack in stacks if stack.active]
+            if not active:
+                break
+            scenario_logger.set_current_tick(tick_idx + 1, tick)
+            if profiling_enabled: tick_start = time.perf_counter()
+            current_tick = tick
+            current_index = tick_idx
+
+            current_msc = tick.collected_msc if tick.collected_msc > 0 else tick.time_msc
+            if profiling_enabled and prev_interval_msc > 0 and current_msc > 0:
+                delta = current_msc - prev_interval_msc
+                if tick.collected_msc > 0 or delta >= 0:
+                    inter_tick_intervals.append(float(delta))
+
+            # #360: ghost-passes per opt-in stack across the gap to the previous tick
+            if config.heartbeat_interval_ms > 0 and prev_interval_msc > 0 and current_msc > 0:
+                for stack in active:
+                    if not stack.decision_logic.wants_heartbeat():
+                        continue
+                    try:
+                        if _run_sim_heartbeats(
+                                prev_interval_msc, current_msc, config, stack.trade_simulator,
+                                worker_coordinator, stack.decision_logic,
+                                stack.decision_event_dispatcher):
+                            _end_stack(stack, tick, scenario_logger)
+                    except Exception as e:
+                        _fail_stack(stack, stacks, e, scenario_logger)
+                active = [stack for stack in active if stack.active]
+
+            prev_interval_msc = current_msc
+
+            # === 1. Trade Executors (BROKER PATH — all ticks, every stack) ===
+            if profiling_enabled: t1 = time.perf_counter()
+            for stack in active:
+                try:
+                    stack.trade_simulator.on_tick(tick)
+                except Exception as e:
+                    _fail_stack(stack, stacks, e, scenario_logger)
+            if profiling_enabled:
+                profile_times['trade_simulator'] += (time.perf_counter() - t1) * 1000
+                profile_counts['trade_simulator'] += 1
+
+            # === 2. Bar Rendering (all ticks — shared core, #303) ===
+            if profiling_enabled: t3 = time.perf_counter()
+            current_bars = render_bars_for_tick(tick, bar_rendering_controller)
+            if profiling_enabled:
+                profile_times['bar_rendering'] += (time.perf_counter() - t3) * 1000
+                profile_counts['bar_rendering'] += 1
+
+            # === CLIPPING GATE ===
+            if tick.is_clipped:
+                continue
+
+            active = [stack for stack in active if stack.active]
+            for stack in active:
+                if stack.stale_stress_driver is not None:
+                    stack.stale_stress_driver.on_tick(tick.timestamp)
+                stack.market_data_tracker.on_tick(
+                    tick.timestamp,
+                    stack.trade_simulator.get_market_data_status(),
+                    stack.stale_stress_driver.get_active_label()
+                    if stack.stale_stress_driver else '',
+                )
+
+            # === 3+4. Bar History + Worker Processing (ONCE) + Decisions (per stack) ===
+            if profiling_enabled: t7 = time.perf_counter()
+            execute_worker_path(
+                tick=tick,
+                current_bars=current_bars,
+                bar_controller=bar_rendering_controller,
+                worker_orchestrator=worker_coordinator,
+                symbol=config.symbol,
+            )
+            decisions = []
+            for stack in active:
+                try:
+                    decisions.append((stack, worker_coordinator.compute_decision(
+                        stack.decision_logic, tick, log_tick=stack is primary)))
+                except Exception as e:
+                    _fail_stack(stack, stacks, e, scenario_logger)
+            if profiling_enabled:
+                profile_times['worker_decision'] += (time.perf_counter() - t7) * 1000
+                profile_counts['worker_decision'] += 1
+
+            # === 5. Order Execution + 5b. Event Drain + 5c. Pruning (per stack) ===
+            if profiling_enabled: t9 = time.perf_counter()
+            for stack, decision in decisions:
+                try:
+                    _execute_stack_decision(
+                        stack, decision, tick, tick_idx, config, prune_rule, scenario_logger)
+                except Exception as e:
+                    _fail_stack(stack, stacks, e, scenario_logger)
+            if profiling_enabled:
+                profile_times['order_execution'] += (time.perf_counter() - t9) * 1000
+                profile_counts['order_execution'] += 1
+
+            # === 6. LIVE UPDATES (first stack) ===
+            if profiling_enabled: t11 = time.perf_counter()
+            if process_live_export(
+                    live_setup, config, tick_idx, tick, primary.trade_simulator.portfolio,
+                    worker_coordinator, current_bars):
+                live_update_count += 1
+            if profiling_enabled:
+                profile_times['live_update'] += (time.perf_counter() - t11) * 1000
+                profile_counts['live_update'] += 1
+                profile_times['total_per_tick'] += (time.perf_counter() - tick_start) * 1000
+
+        # === Close-out per stack — at the tick the stack ended on ===
+        for stack in stacks:
+            if stack.tick_loop_error is not None:
+                continue
+            try:
+                _close_out_stack(stack, stack.end_tick or current_tick)
+            except Exception as e:
+                _fail_stack(stack, stacks, e, scenario_logger)
+
+        scenario_logger.set_tick_loop_started(False)
+        scenario_logger.info(
+            f"✅ Tick loop completed: {live_setup.tick_count:,} ticks, "
+            f"{len(stacks)} decision stacks")
+        process_live_export(
+            live_setup, config, current_index, current_tick, primary.trade_simulator.portfolio,
+            worker_coordinator, current_bars)
+
+    except Exception as e:
+        scenario_logger.error(
+            f"Error in Tick Loop - Runtime - try to collect statistics now.: {e}")
+        shared_error = e
+
+    try:
+        worker_coordinator.cleanup()
+        scenario_logger.debug("✅ Coordinator cleanup completed")
+
+        worker_statistics = worker_coordinator.get_worker_statistics()
+        signal_statistics = worker_coordinator.get_signal_statistics()
+        coordination_statistics = worker_coordinator.get_coordination_statistics()
+        profiling_data = ProcessProfileData(
+            profile_times=profile_times,
+            profile_counts=profile_counts,
+            inter_tick_intervals_ms=inter_tick_intervals,
+            gap_threshold_s=config.inter_tick_gap_threshold_s,
+            ticks_total=len(ticks)
+        )
+
+        results = []
+        for stack in stacks:
+            last_tick = stack.end_tick or current_tick
+            run_end = last_tick.timestamp if last_tick else None
+            trade_simulator = stack.trade_simulator
+
+            portfolio_stats = trade_simulator.portfolio.get_portfolio_statistics()
+            portfolio_stats.symbol = config.symbol
+            if last_tick:
+                portfolio_stats.last_price = (last_tick.bid + last_tick.ask) / 2
+            trade_history = trade_simulator.get_trade_history()
+            pending_stats = trade_simulator.get_pending_stats()
+            block_boundary_report = None
+            if config.is_profile_run:
+                block_boundary_report = build_block_boundary_report(
+                    trade_history, pending_stats)
+
+            _print_tick_loop_finishing_log(live_update_count, scenario_logger, portfolio_stats)
+
+            results.append(ProcessTickLoopResult(
+                decision_statistics=stack.decision_logic.get_statistics(),
+                worker_statistics=worker_statistics,
+                signal_statistics=signal_statistics,
+                disturbance_episodes=(
+                    stack.market_data_tracker.get_episodes(run_end)
+                    + worker_coordinator.get_signal_episodes(run_end)),
+                market_data_tick_stats=stack.market_data_tracker.get_tick_stats(),
+                coordination_statistics=coordination_statistics,
+                portfolio_stats=portfolio_stats,
+                execution_stats=trade_simulator.get_execution_stats(),
+                cost_breakdown=trade_simulator.portfolio.get_cost_breakdown(),
+                trade_history=trade_history,
+                order_history=trade_simulator.get_order_history(),
+                pending_stats=pending_stats,
+                block_boundary_report=block_boundary_report,
+                profiling_data=profiling_data,
+                tick_range_stats=tick_range_stats,
+                pruned_reason=stack.pruned_reason,
+                tick_loop_error=stack.tick_loop_error or shared_error,
+            ))
+        return results
+    except Exception as e:
+        scenario_logger.error(f"Error in Tick Loop - Statistics & Return: {e}")
+        raise e
+
+
+def _execute_stack_decision(
+    stack: DecisionStack,
+    decision: Decision,
+    tick: TickData,
+    tick_idx: int,
+    config: ProcessScenarioConfig,
+    prune_rule: Optional[PruneRule],
+    scenario_logger: ScenarioLogger,
+) -> None:
+    """
+    Steps 5–5c of one stack: execute its decision, drain its events, check its prune rule.
+
+    Args:
+        stack: The stack
+        decision: The stack's decision for this tick
+        tick: Current tick
+        tick_idx: Index of the tick (prune cadence)
+        config: Scenario configuration
+        prune_rule: The combination's prune rule (None → no pruning)
+        scenario_logger: Logger for this scenario
+    """
+    try:
+        stack.decision_logic.execute_decision(decision, tick)
+    except Exception as e:
+        raise RuntimeError(
+            f"Order execution failed: {e} \n{traceback.format_exc()}")
+
+    if stack.decision_event_dispatcher is not None:
+        stack.decision_event_dispatcher.drain()
+        if stack.trade_simulator.is_session_end_requested():
+            _end_stack(stack, tick, scenario_logger)
+            return
+
+    if prune_rule is not None and tick_idx % prune_rule.check_every_ticks == 0:
+        stack.pruned_reason = _check_prune_rule(
+            prune_rule, stack.trade_simulator.portfolio.get_portfolio_statistics(),
+            config.account_currency)
+        if stack.pruned_reason is not None:
+            stack.trade_simulator.request_session_end(f"pruned: {stack.pruned_reason}")
+            _end_stack(stack, tick, scenario_logger, icon='✂️')
+
+
+def _end_stack(
+    stack: DecisionStack,
+    tick: TickData,
+    scenario_logger: ScenarioLogger,
+    icon: str = '🛑',
+) -> None:
+    """
+    Stop feeding a stack whose session end was requested (the others run on).
+
+    A stale-stress window still active closes here, at the stack's own last tick.
+    """
+    stack.end_tick = tick
+    if stack.stale_stress_driver is not None:
+        stack.stale_stress_driver.finish()
+    scenario_logger.info(
+        f"{icon} Session end requested ({stack.decision_logic.name}): "
+        f"{stack.trade_simulator.get_session_end_reason()}")
+
+
+def _fail_stack(
+    stack: DecisionStack,
+    stacks: List[DecisionStack],
+    error: Exception,
+    scenario_logger: ScenarioLogger,
+) -> None:
+    """
+    Fail one stack and keep the others running.
+
+    Logged as a warning: an ERROR in the shared scenario log would fail every stack's
+    run (LoggedErrors) — the stack's own run carries the error via tick_loop_error.
+    """
+    stack.tick_loop_error = error
+    scenario_logger.warning(
+        f"Decision stack {stacks.index(stack)} ({stack.decision_logic.name}) failed: {error}")
+
+
+def _close_out_stack(stack: DecisionStack, last_tick: Optional[TickData]) -> None:
+    """Session end event (#348) + close of open trades, as the single-stack loop does."""
+    trade_simulator = stack.trade_simulator
+    # A stack that ended early already finished its driver at its end tick (_end_stack)
+    if stack.stale_stress_driver is not None:
+        stack.stale_stress_driver.finish()
+
+    if stack.decision_event_dispatcher is not None:
+        if trade_simulator.is_session_end_requested():
+            end_reason = trade_simulator.get_session_end_reason()
+            end_severity = trade_simulator.get_session_end_severity()
+        else:
+            end_reason = 'tick source exhausted'
+            end_severity = SessionEndSeverity.NORMAL
+        stack.decision_event_dispatcher.submit(SessionEndEvent(
+            reason=end_reason,
+            severity=end_severity,
+            tick_time=trade_simulator.get_current_time(),
+        ))
+        stack.decision_event_dispatcher.drain()
+
+    last_msc = (last_tick.collected_msc if last_tick and last_tick.collected_msc > 0
+                else last_tick.time_msc if last_tick else 0)
+    trade_simulator.close_all_remaining_orders(current_msc=last_msc)
+    trade_simulator.check_clean_shutdown()
@@ -1,7 +1,8 @@
 
 
+import bisect
 from datetime import timezone
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple
 
 from python.framework.bars.bar_rendering_controller import BarRenderingController
 from python.framework.decision_logic.abstract_decision_logic import AbstractDecisionLogic
@@ -9,6 +10,7 @@ from python.framework.factory.decision_logic_factory import DecisionLogicFactory
 from python.framework.factory.trade_simulator_factory import prepare_trade_executor_for_scenario
 from python.framework.factory.worker_factory import WorkerFactory
 from python.framework.logging.scenario_logger import ScenarioLogger
+from python.framework.process.process_multi_decision_tick_loop import DecisionStack
 from python.framework.trading_env.abstract_trade_executor import AbstractTradeExecutor
 from python.framework.trading_env.decision_trading_api import DecisionTradingApi
 from python.framework.types.market_types.market_data_types import TickData
@@ -17,6 +19,7 @@ from python.framework.types.process_data_types import ProcessDataPackage, Proces
 from python.framework.utils.process_debug_info_utils import debug_warmup_bars_check, log_trade_simulator_config
 from python.framework.utils.process_serialization_utils import process_deserialize_ticks_batch
 from python.framework.workers.worker_orchestrator import WorkerOrchestrator
+from python.framework.persistence.worker_output_cache import WorkerOutputCache
 from python.framework.workers.abstract_signal_worker import AbstractSignalWorker
 from python.framework.signal_data.signal_data_provider import SignalDataProvider
 
@@ -25,7 +28,7 @@ def process_startup_preparation(
     config: ProcessScenarioConfig,
     shared_data: ProcessDataPackage,
     scenario_logger: ScenarioLogger
-) -> Tuple[WorkerOrchestrator, AbstractTradeExecutor, BarRenderingController, AbstractDecisionLogic, ScenarioLogger, Tuple[TickData, ...]]:
+) -> Tuple[WorkerOrchestrator, AbstractTradeExecutor, BarRenderingController, AbstractDecisionLogic, ScenarioLogger, Tuple[TickData, ...], List[DecisionStack], List[DecisionStack]]:
     """
     Create all objects needed in subprocess.
 
@@ -38,13 +41,17 @@ def process_startup_preparation(
     - Worker coordinator
     - Trade simulator
     - Bar rendering controller
+    - Variant decision stacks (multi-decision sweep only)
+    - Window decision stacks (single-pass robustness span only)
 
     Args:
         config: Scenario configuration
         shared_data: Shared data package
 
     Returns:
-        (worker_coordinator, trade_simulator, bar_rendering_controller, decision_logic, scenario_logger, ticks)
+        (worker_coordinator, trade_simulator, bar_rendering_controller, decision_logic, scenario_logger, ticks,
+         variant_stacks, window_stacks) — variant_stacks is empty unless config.decision_variants is
+         set, window_stacks (the span's later windows) unless config.window_span is set
     """
 
     scenario_logger.info(f"🚀 Starting scenario: {config.name}")
@@ -113,6 +120,21 @@ def process_startup_preparation(
     scenario_logger.debug(
         f"✅ Created decision logic: {config.decision_logic_type}")
 
+    # === PHASE 5.5: Variant Decision Stacks (multi-decision sweep) ===
+    # Built before the orchestrator: its output gating covers every decision logic.
+    variant_stacks = _prepare_variant_stacks(
+        config, shared_data, scenario_logger, decision_logic_factory, trading_context)
+
+    # === PHASE 5.5b: Window Decision Stacks (single-pass robustness span) ===
+    # One fresh stack per later window — swapped in at its boundary, never fed in parallel.
+    window_stacks = [
+        _build_decision_stack(
+            config, config.decision_logic_config, shared_data, scenario_logger,
+            decision_logic_factory, trading_context)
+        for _ in config.window_span]
+    if window_stacks:
+        scenario_logger.debug(f"✅ Created {len(window_stacks)} window decision stacks")
+
     # === CREATE WORKER COORDINATOR ===
     worker_coordinator = WorkerOrchestrator(
         decision_logic=decision_logic,
@@ -120,7 +142,8 @@ def process_startup_preparation(
         workers=workers,
         parallel_workers=config.parallel_workers,
         parallel_threshold_ms=config.parallel_threshold,
-        worker_decision_tracking=config.worker_decision_tracking
+        worker_decision_tracking=config.worker_decision_tracking,
+        variant_decision_logics=[stack.decision_logic for stack in variant_stacks],
     )
     worker_coordinator.initialize()
 
@@ -128,6 +151,15 @@ def process_startup_preparation(
         f"✅ Orchestrator initialized: {len(workers)} workers + {decision_logic.name}"
     )
 
+    # === PHASE 5.6: Worker output cache (BAR_CLOSE outputs replayed across runs) ===
+    if config.worker_output_series_key:
+        worker_coordinator.attach_output_cache(
+            WorkerOutputCache(
+                scenario_logger, config.worker_output_cache_dir,
+                config.worker_output_cache_max_entries),
+            config.worker_output_series_key,
+        )
+
     # === PHASE 6: Inject DecisionTradingApi (validated against required_order_types) ===
     trading_api = DecisionTradingApi(
         executor=trade_simulator,
@@ -150,7 +182,10 @@ def process_startup_preparation(
     bar_rendering_controller.register_workers(workers)
 
     # === MATCH AND VALIDATE WARMUP BARS ===
-    warmup_bars = _match_and_validate_warmup_bars(
+    # A later chunk of a chunked scenario carries no loaded bars — its warm-up is
+    # rendered from the overlap ticks ahead of its start (below)
+    chunk_warmup_from_ticks = config.scenario_chunk is not None and not shared_data.bars
+    warmup_bars = {} if chunk_warmup_from_ticks else _match_and_validate_warmup_bars(
         config=config,
         shared_data=shared_data,
         bar_rendering_controller=bar_rendering_controller,
@@ -179,7 +214,92 @@ def process_startup_preparation(
     scenario_logger.debug(
         f"🔄 De-Serialization of {len(ticks):,} ticks finished")
 
-    return worker_coordinator, trade_simulator, bar_rendering_controller, decision_logic, scenario_logger, ticks
+    # === CHUNK WARM-UP (ticks ahead of the chunk start render bars only) ===
+    if config.scenario_chunk is not None:
+        ticks = _render_chunk_warmup(
+            config, ticks, bar_rendering_controller, scenario_logger)
+
+    return (worker_coordinator, trade_simulator, bar_rendering_controller, decision_logic, scenario_logger, ticks,
+            variant_stacks, window_stacks)
+
+
+def _prepare_variant_stacks(
+    config: ProcessScenarioConfig,
+    shared_data: ProcessDataPackage,
+    scenario_logger: ScenarioLogger,
+    decision_logic_factory: DecisionLogicFactory,
+    trading_context: TradingContext,
+) -> List[DecisionStack]:
+    """
+    Build one decision stack per config.decision_variants entry.
+
+    Each stack gets its own decision logic (the variant's decision_logic_config),
+    its own trade simulator + portfolio and its own DecisionTradingApi — exactly
+    what a standalone scenario process of that combination would build.
+
+    Args:
+        config: Scenario configuration
+        shared_data: Shared data package
+        scenario_logger: Logger for this scenario
+        decision_logic_factory: Factory (already resolved the logic type)
+        trading_context: Trading context shared with the primary decision logic
+
+    Returns:
+        The variant stacks (empty without decision_variants)
+    """
+    stacks = [
+        _build_decision_stack(
+            config, logic_config, shared_data, scenario_logger,
+            decision_logic_factory, trading_context)
+        for logic_config in config.decision_variants]
+
+    if stacks:
+        scenario_logger.debug(f"✅ Created {len(stacks)} variant decision stacks")
+    return stacks
+
+
+def _build_decision_stack(
+    config: ProcessScenarioConfig,
+    logic_config: Dict,
+    shared_data: ProcessDataPackage,
+    scenario_logger: ScenarioLogger,
+    decision_logic_factory: DecisionLogicFactory,
+    trading_context: TradingContext,
+) -> DecisionStack:
+    """
+    Build one extra decision stack: decision logic + own trade simulator + DecisionTradingApi.
+
+    Args:
+        config: Scenario configuration
+        logic_config: The stack's decision_logic_config
+        shared_data: Shared data package
+        scenario_logger: Logger for this scenario
+        decision_logic_factory: Factory (already resolved the logic type)
+        trading_context: Trading context shared with the primary decision logic
+
+    Returns:
+        The decision stack
+    """
+    logic_class, _ = decision_logic_factory.resolve_logic_class(config.decision_logic_type)
+    required_order_types = logic_class.get_required_order_types(logic_config)
+    trade_simulator = prepare_trade_executor_for_scenario(
+        config=config,
+        logger=scenario_logger,
+        required_order_types=required_order_types,
+        shared_data=shared_data
+    )
+    decision_logic = decision_logic_factory.create_logic(
+        logic_type=config.decision_logic_type,
+        logic_config=logic_config,
+        logger=scenario_logger,
+        trading_context=trading_context
+    )
+    decision_logic.set_trading_api(DecisionTradingApi(
+        executor=trade_simulator,
+        required_order_types=required_order_types,
+        order_guard_config=config.order_guard_config,
+    ))
+    return DecisionStack(decision_logic=decision_logic, trade_simulator=trade_simulator)
 
 
 def inject_signal_providers(
@@ -221,6 +341,40 @@ def inject_signal_providers(
             )
 
 
+def _render_chunk_warmup(
+    config: ProcessScenarioConfig,
+    ticks: Tuple[TickData, ...],
+    bar_rendering_controller: BarRenderingController,
+    scenario_logger: ScenarioLogger
+) -> Tuple[TickData, ...]:
+    """
+    Render the warm-up overlap of a chunk: ticks before the chunk start feed the bars only.
+
+    No worker, decision or trade sees these ticks — the chunk starts trading on the bar
+    history a sequential run would hold at this point. Pending bar-close transitions are
+    dropped, so the first traded tick starts from a settled pipeline like a fresh run.
+
+    Args:
+        config: Chunk configuration (config.scenario_chunk set)
+        ticks: The chunk's deserialized ticks (overlap + trading range)
+        bar_rendering_controller: Controller to render the overlap into
+        scenario_logger: Logger for this chunk
+
+    Returns:
+        The ticks to trade (start_time onwards)
+    """
+    start = config.scenario_chunk.start_time
+    first_traded = bisect.bisect_left([tick.timestamp for tick in ticks], start)
+    for tick in ticks[:first_traded]:
+        bar_rendering_controller.process_tick(tick)
+    bar_rendering_controller.consume_bar_render_state()
+
+    scenario_logger.info(
+        f"🧩 Chunk {config.scenario_chunk.position + 1}/{config.scenario_chunk.chunk_count}: "
+        f"{first_traded:,} warm-up ticks rendered, trading from {start}")
+    return ticks[first_traded:]
+
+
 def _match_and_validate_warmup_bars(
     config: ProcessScenarioConfig,
     shared_data: ProcessDataPackage,
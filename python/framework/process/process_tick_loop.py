@@ -46,6 +46,7 @@ from python.framework.types.process_data_types import (
     ProcessTickLoopResult,
     ProcessScenarioConfig,
 )
+from python.framework.types.run_results_types import PruneRule
 from python.framework.utils.process_debug_info_utils import get_tick_range_stats
 from python.framework.workers.worker_orchestrator import WorkerOrchestrator
 
@@ -97,7 +98,7 @@ def _run_sim_heartbeats(
         trade_simulator.heartbeat()
         if decision_event_dispatcher is not None:
             decision_event_dispatcher.drain()
-        decision = run_ghost_pass(worker_coordinator)
+        decision = run_ghost_pass(worker_coordinator, decision_logic)
         if decision is not None:
             decision_logic.execute_decision(decision, tick=None)
         if decision_event_dispatcher is not None:
@@ -117,7 +118,8 @@ def execute_tick_loop(
     scenario_logger: ScenarioLogger,
     ticks: Tuple[TickData, ...],
     live_queue: Optional[Queue] = None,
-    decision_event_dispatcher: Optional[DecisionEventDispatcher] = None
+    decision_event_dispatcher: Optional[DecisionEventDispatcher] = None,
+    release_pipeline: bool = True
 ) -> ProcessTickLoopResult:
     """
     Execute tick processing loop with live update support.
@@ -134,6 +136,9 @@ def execute_tick_loop(
         scenario_logger: Logger for this scenario
         ticks: Deserialized tick data
         live_queue: Queue for live updates (optional)
+        decision_event_dispatcher: #348 channel (None when the decision does not subscribe)
+        release_pipeline: Clean up the worker coordinator after the loop — False keeps the
+            worker state for the next window of a single-pass span (the span loop releases it)
 
     Returns:
         ProcessTickLoopResult with loop results
@@ -144,6 +149,7 @@ def execute_tick_loop(
     market_data_tracker = MarketDataEpisodeTracker(
         source=config.broker_type.value if config.broker_type else '',
         logger=scenario_logger)
+    pruned_reason: Optional[str] = None
 
     try:
         portfolio = trade_simulator.portfolio
@@ -165,6 +171,7 @@ def execute_tick_loop(
         live_update_count = 0
 
         tick_loop_error: Exception = None
+        prune_rule = config.prune_rule
         current_bars = {}
         current_tick = None
         current_index = 0
@@ -317,6 +324,18 @@ def execute_tick_loop(
                         f"🛑 Session end requested: {trade_simulator.get_session_end_reason()}")
                     break
 
+            # === 5c. Sweep Early Pruning ===
+            # Periodic portfolio snapshot against the combination's prune rule — a
+            # hopeless combination ends through the regular session-end path.
+            if prune_rule is not None and tick_idx % prune_rule.check_every_ticks == 0:
+                pruned_reason = _check_prune_rule(
+                    prune_rule, portfolio.get_portfolio_statistics(), config.account_currency)
+                if pruned_reason is not None:
+                    trade_simulator.request_session_end(f"pruned: {pruned_reason}")
+                    scenario_logger.info(
+                        f"✂️ Session end requested: {trade_simulator.get_session_end_reason()}")
+                    break
+
             # === 6. LIVE UPDATES (Time-based) ===
             if profiling_enabled: t11 = time.perf_counter()
             live_updated = process_live_export(
@@ -380,8 +399,9 @@ def execute_tick_loop(
 
     try:
         # === CLEANUP COORDINATOR ===
-        worker_coordinator.cleanup()
-        scenario_logger.debug("✅ Coordinator cleanup completed")
+        if release_pipeline:
+            worker_coordinator.cleanup()
+            scenario_logger.debug("✅ Coordinator cleanup completed")
 
         # === GET RESULTS ===
         # Collect statistics from Algorithm section
@@ -442,6 +462,7 @@ def execute_tick_loop(
                 ticks_total=len(ticks)
             ),
             tick_range_stats=tick_range_stats,
+            pruned_reason=pruned_reason,
             tick_loop_error=tick_loop_error
         )
     except Exception as e:
@@ -450,6 +471,35 @@ def execute_tick_loop(
         raise e
 
 
+def _check_prune_rule(
+        rule: PruneRule,
+        stats: PortfolioStats,
+        account_currency: str) -> Optional[str]:
+    """
+    Check a portfolio snapshot against a sweep combination's prune rule.
+
+    Both thresholds compare the max drawdown — it can only grow during a run, so a
+    snapshot above a threshold proves the finished run would be above it too.
+
+    Args:
+        rule: The combination's prune rule
+        stats: Current portfolio statistics snapshot
+        account_currency: The scenario's account currency (scopes the objective bound)
+
+    Returns:
+        The prune reason, or None to keep running
+    """
+    if rule.max_drawdown is not None and stats.max_drawdown > rule.max_drawdown:
+        return (f"max drawdown {stats.max_drawdown:.2f} exceeds the limit "
+                f"{rule.max_drawdown:.2f}")
+    if (rule.objective_bound is not None
+            and rule.objective_currency in (None, account_currency)
+            and stats.max_drawdown > rule.objective_bound):
+        return (f"max drawdown {stats.max_drawdown:.2f} is already worse than the k-th best "
+                f"{rule.objective_bound:.2f}")
+    return None
+
+
 def _print_tick_loop_finishing_log(
         live_update_count: int,
         scenario_logger: ScenarioLogger,
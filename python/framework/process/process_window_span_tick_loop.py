@@ -0,0 +1,126 @@
+"""
+FiniexTestingIDE - Window Span Tick Loop
+Single-pass robustness execution: one contiguous pass over adjacent windows.
+
+A robustness set often tiles one contiguous period into adjacent IS/OOS windows.
+Run separately, every window re-warms its workers from freshly loaded bar history.
+In single-pass mode the span's lead window runs ONE process over the whole span:
+bars render and workers compute continuously, while each window gets its own
+decision stack (decision logic + trade simulator + portfolio) — reset at the
+window boundary, exactly as a standalone run of the window starts flat.
+
+Each window runs the regular single-stack tick loop (process_tick_loop) on its
+slice of the span's ticks, so the trading semantics (close-out at window end,
+session end, pruning) are the standalone ones. Worker figures describe the
+shared pipeline: the span's worker statistics are reported on the lead window,
+the coordination counters per window.
+"""
+
+import bisect
+import copy
+from datetime import datetime
+from multiprocessing import Queue
+from typing import List, Optional, Tuple
+
+from python.framework.bars.bar_rendering_controller import BarRenderingController
+from python.framework.logging.scenario_logger import ScenarioLogger
+from python.framework.process.process_multi_decision_tick_loop import DecisionStack
+from python.framework.process.process_tick_loop import execute_tick_loop
+from python.framework.types.market_types.market_data_types import TickData
+from python.framework.types.performance_types.performance_stats_types import WorkerCoordinatorPerformanceStats
+from python.framework.types.process_data_types import ProcessScenarioConfig, ProcessTickLoopResult
+from python.framework.workers.worker_orchestrator import WorkerOrchestrator
+
+
+def execute_window_span_tick_loop(
+    config: ProcessScenarioConfig,
+    worker_coordinator: WorkerOrchestrator,
+    windows: List[DecisionStack],
+    bar_rendering_controller: BarRenderingController,
+    scenario_logger: ScenarioLogger,
+    ticks: Tuple[TickData, ...],
+    live_queue: Optional[Queue] = None,
+) -> List[ProcessTickLoopResult]:
+    """
+    Execute the tick loop once over a span of adjacent windows.
+
+    Args:
+        config: Lead window configuration (config.window_span = the later windows)
+        worker_coordinator: Orchestrator — worker state carries over the boundaries
+        windows: One decision stack per window, the lead window's first
+        bar_rendering_controller: Bar rendering controller (bars carry over too)
+        scenario_logger: Logger for the span (the lead window's log)
+        ticks: Deserialized tick data of the whole span
+        live_queue: Queue for live updates (optional)
+
+    Returns:
+        One ProcessTickLoopResult per window, in window order
+    """
+    window_ticks = split_span_ticks(
+        ticks, [boundary.start_time for boundary in config.window_span])
+    names = [config.name] + [boundary.name for boundary in config.window_span]
+    results: List[ProcessTickLoopResult] = []
+
+    try:
+        for position, (stack, slice_ticks) in enumerate(zip(windows, window_ticks)):
+            scenario_logger.info(
+                f"🪟 Window {position + 1}/{len(windows)}: {names[position]} "
+                f"({len(slice_ticks):,} ticks)")
+
+            # The window's own decision logic computes on the carried-over worker results
+            worker_coordinator.decision_logic = stack.decision_logic
+            coordination_before = copy.copy(worker_coordinator.get_coordination_statistics())
+
+            result = execute_tick_loop(
+                config, worker_coordinator, stack.trade_simulator,
+                bar_rendering_controller, stack.decision_logic,
+                scenario_logger, slice_ticks, live_queue,
+                stack.decision_event_dispatcher,
+                release_pipeline=False)
+
+            result.coordination_statistics = _coordination_delta(
+                coordination_before, worker_coordinator.get_coordination_statistics())
+            if position > 0:
+                # The workers ran once for the whole span — reported on the lead window
+                result.worker_statistics = []
+                result.signal_statistics = []
+            results.append(result)
+    finally:
+        worker_coordinator.decision_logic = windows[0].decision_logic
+        worker_coordinator.cleanup()
+        scenario_logger.debug("✅ Coordinator cleanup completed")
+
+    results[0].worker_statistics = worker_coordinator.get_worker_statistics()
+    results[0].signal_statistics = worker_coordinator.get_signal_statistics()
+    return results
+
+
+def split_span_ticks(
+    ticks: Tuple[TickData, ...],
+    boundaries: List[datetime],
+) -> List[Tuple[TickData, ...]]:
+    """
+    Cut a span's ticks at the window boundaries.
+
+    Args:
+        ticks: The span's ticks (time-ordered)
+        boundaries: Start time of each later window (ascending)
+
+    Returns:
+        len(boundaries) + 1 tick slices — window k holds start_k <= t < start_k+1
+    """
+    timestamps = [tick.timestamp for tick in ticks]
+    cuts = [0] + [bisect.bisect_left(timestamps, start) for start in boundaries] + [len(ticks)]
+    return [ticks[cuts[i]:cuts[i + 1]] for i in range(len(cuts) - 1)]
+
+
+def _coordination_delta(
+    before: WorkerCoordinatorPerformanceStats,
+    after: WorkerCoordinatorPerformanceStats,
+) -> WorkerCoordinatorPerformanceStats:
+    """The coordination counters of one window (the orchestrator's run totals, differenced)."""
+    return WorkerCoordinatorPerformanceStats(
+        parallel_workers=after.parallel_workers,
+        ticks_processed=after.ticks_processed - before.ticks_processed,
+        parallel_time_saved_ms=after.parallel_time_saved_ms - before.parallel_time_saved_ms,
+    )
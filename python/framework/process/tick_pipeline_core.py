@@ -16,6 +16,7 @@ Runner-specific concerns stay in the runners by design:
 
 from typing import Dict, Optional
 
+from python.framework.decision_logic.abstract_decision_logic import AbstractDecisionLogic
 from python.framework.bars.bar_rendering_controller import BarRenderingController
 from python.framework.types.decision_logic_types import Decision
 from python.framework.types.market_types.market_data_types import TickData
@@ -76,7 +77,40 @@ def execute_algo_path(
     )
 
 
-def run_ghost_pass(worker_orchestrator: WorkerOrchestrator) -> Optional[Decision]:
+def execute_worker_path(
+    tick: TickData,
+    current_bars: Dict,
+    bar_controller: BarRenderingController,
+    worker_orchestrator: WorkerOrchestrator,
+    symbol: str,
+) -> None:
+    """
+    Steps 3–4 without the decision — the worker half of execute_algo_path.
+
+    The multi-decision sim loop runs this once per tick, then computes each
+    decision stack's decision on the shared worker results.
+
+    Args:
+        tick: Current tick (non-clipped)
+        current_bars: Bars from render_bars_for_tick (same tick)
+        bar_controller: Bar rendering controller (history source)
+        worker_orchestrator: Orchestrator (workers)
+        symbol: Trading symbol for bar history retrieval
+    """
+    bar_history = bar_controller.get_all_bar_history(symbol=symbol)
+    bar_render_state = bar_controller.consume_bar_render_state()
+    worker_orchestrator.process_workers(
+        tick=tick,
+        current_bars=current_bars,
+        bar_history=bar_history,
+        bar_render_state=bar_render_state,
+    )
+
+
+def run_ghost_pass(
+    worker_orchestrator: WorkerOrchestrator,
+    decision_logic: Optional[AbstractDecisionLogic] = None,
+) -> Optional[Decision]:
     """
     Heartbeat ghost-pass core (#360) — decision compute between ticks.
 
@@ -89,9 +123,10 @@ def run_ghost_pass(worker_orchestrator: WorkerOrchestrator) -> Optional[Decision
 
     Args:
         worker_orchestrator: Orchestrator (cached worker results + decision)
+        decision_logic: Decision logic to run (None → the orchestrator's primary)
 
     Returns:
         Decision to execute with tick=None, or None when the decision
         logic does not participate in heartbeats
     """
-    return worker_orchestrator.process_heartbeat()
+    return worker_orchestrator.process_heartbeat(decision_logic)
@@ -308,8 +308,10 @@ def aggregate_worker_totals(rows: List[WorkerDecisionUnitRow]) -> List[WorkerSta
         for w in row.workers:
             a = acc.setdefault(w.worker_name, {
                 'worker_type': w.worker_type, 'call_count': 0, 'total_time_ms': 0.0,
-                'min_time_ms': None, 'max_time_ms': None})
+                'min_time_ms': None, 'max_time_ms': None, 'cache_hits': 0, 'cache_misses': 0})
             a['call_count'] += w.call_count
+            a['cache_hits'] += w.cache_hits
+            a['cache_misses'] += w.cache_misses
             a['total_time_ms'] += w.total_time_ms
             a['min_time_ms'] = w.min_time_ms if a['min_time_ms'] is None else min(a['min_time_ms'], w.min_time_ms)
             a['max_time_ms'] = w.max_time_ms if a['max_time_ms'] is None else max(a['max_time_ms'], w.max_time_ms)
@@ -319,7 +321,8 @@ def aggregate_worker_totals(rows: List[WorkerDecisionUnitRow]) -> List[WorkerSta
             worker_type=a['worker_type'], worker_name=name, call_count=a['call_count'],
             total_time_ms=a['total_time_ms'],
             avg_time_ms=(a['total_time_ms'] / a['call_count']) if a['call_count'] else 0.0,
-            min_time_ms=a['min_time_ms'] or 0.0, max_time_ms=a['max_time_ms'] or 0.0)
+            min_time_ms=a['min_time_ms'] or 0.0, max_time_ms=a['max_time_ms'] or 0.0,
+            cache_hits=a['cache_hits'], cache_misses=a['cache_misses'])
         for name, a in acc.items()
     ]
     totals.sort(key=lambda w: w.total_time_ms, reverse=True)
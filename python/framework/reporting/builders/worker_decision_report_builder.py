@@ -40,7 +40,8 @@ def _to_unit_row(unit: RunUnit) -> WorkerDecisionUnitRow:
             call_count=w.worker_call_count, total_time_ms=w.worker_total_time_ms,
             avg_time_ms=w.worker_avg_time_ms, min_time_ms=w.worker_min_time_ms,
             max_time_ms=w.worker_max_time_ms,
-            compute_basis=w.worker_compute_basis, last_compute_tick=w.worker_last_compute_tick)
+            compute_basis=w.worker_compute_basis, last_compute_tick=w.worker_last_compute_tick,
+            cache_hits=w.worker_cache_hits, cache_misses=w.worker_cache_misses)
         for w in unit.worker_statistics
     ]
     return WorkerDecisionUnitRow(
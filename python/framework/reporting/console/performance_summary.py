@@ -18,7 +18,7 @@ from typing import Dict, List, Tuple
 
 from python.framework.reporting.console.abstract_batch_summary_section import AbstractBatchSummarySection
 from python.framework.utils.console_renderer import ConsoleRenderer
-from python.framework.types.api.report_types import WorkerDecisionReport, WorkerDecisionUnitRow
+from python.framework.types.api.report_types import WorkerDecisionReport, WorkerDecisionUnitRow, WorkerStatRow
 from python.framework.types.performance_types.performance_summary_aggregation_types import AggregatedPerformanceStats, DecisionLogicBottleneckData, ParallelBottleneckData, PerformanceBottlenecks, ScenarioBottleneckData, WorkerAggregateData, WorkerBottleneckData
 
 
@@ -158,7 +158,8 @@ class PerformanceSummary(AbstractBatchSummarySection):
                       f"{cadence}  |  "
                       f"Avg: {w.avg_time_ms:>6.3f}ms  |  "
                       f"Range: {w.min_time_ms:>6.3f}-{w.max_time_ms:>6.3f}ms  |  "
-                      f"Total: {w.total_time_ms:>8.2f}ms")
+                      f"Total: {w.total_time_ms:>8.2f}ms"
+                      f"{self._format_cache_rate(w)}")
 
         # Parallel efficiency
         if parallel_workers and ticks_processed > 0:
@@ -447,3 +448,19 @@ class PerformanceSummary(AbstractBatchSummarySection):
             return "⚠️ Slower"
         else:
             return "≈ Equal"
+
+    @staticmethod
+    def _format_cache_rate(worker: WorkerStatRow) -> str:
+        """
+        Worker output cache hit rate suffix for a worker row.
+
+        Args:
+            worker: The per-worker row
+
+        Returns:
+            '  |  Cache: hits/due (pct%)', or '' when the worker was not served through the cache
+        """
+        due = worker.cache_hits + worker.cache_misses
+        if due == 0:
+            return ""
+        return f"  |  Cache: {worker.cache_hits}/{due} hits ({worker.cache_hits / due * 100:.0f}%)"
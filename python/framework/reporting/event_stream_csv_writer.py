@@ -14,14 +14,21 @@ groupby('event_type'). See docs/architecture/trade_execution_visibility.md
 This writer takes the post-loop trade_history + order_history as input and
 walks them chronologically to emit synthetic events. No inline tick-loop
 instrumentation needed — keeps the hot path untouched.
+
+The same events are also written as a typed Parquet table (same columns, EVENT_SCHEMA)
+— the columnar form analysis tools load selected columns from, or scan across runs.
 """
 
 import csv
+import os
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from python.framework.types.portfolio_types.portfolio_trade_record_types import TradeRecord
 from python.framework.types.trading_env_types.broker_trade_types import BrokerTrade
@@ -50,6 +57,29 @@ EVENT_FIELDS = (
     'notes',
 )
 
+# Typed columns of the Parquet form (EVENT_FIELDS order; empty CSV cells are nulls)
+EVENT_SCHEMA = pa.schema([
+    ('ts', pa.timestamp('us', tz='UTC')),
+    ('event_type', pa.string()),
+    ('order_id', pa.string()),
+    ('position_id', pa.string()),
+    ('trade_id', pa.string()),
+    ('broker_ref', pa.string()),
+    ('direction', pa.string()),
+    ('side', pa.string()),
+    ('lots', pa.float64()),
+    ('price', pa.float64()),
+    ('fee', pa.float64()),
+    ('fee_currency', pa.string()),
+    ('status', pa.string()),
+    ('close_type', pa.string()),
+    ('close_reason', pa.string()),
+    ('is_maker', pa.bool_()),
+    ('submission_tick_mid_price', pa.float64()),
+    ('submission_tick_time_msc', pa.int64()),
+    ('notes', pa.string()),
+])
+
 
 @dataclass
 class TradeEvent:
@@ -90,7 +120,8 @@ class EventStreamWriter:
 
     Constructed with a run_dir + a list of events. Events are produced
     post-loop by from_autotrader_result() or from_sim_result(). flush()
-    sorts by timestamp and writes one CSV row per event.
+    sorts by timestamp and writes one CSV row per event; flush_parquet()
+    writes the same rows as the typed Parquet table.
 
     Args:
         run_dir: Directory to write the CSV into. If None, flush is a no-op
@@ -166,23 +197,12 @@ class EventStreamWriter:
         if self._run_dir is None or not self._events:
             return None
 
-        # Sort defensively: promote any naive timestamp to UTC so mixed
-        # tz-aware / tz-naive datetimes don't break comparison. Project
-        # convention is tz-aware everywhere (CLAUDE.md §9), but the sort
-        # cannot afford to crash if a legacy path slips a naive one through.
-        def _sort_key(event: TradeEvent) -> datetime:
-            ts = event.ts
-            if ts.tzinfo is None:
-                ts = ts.replace(tzinfo=timezone.utc)
-            return ts
-
-        sorted_events = sorted(self._events, key=_sort_key)
         out_path = self._run_dir / filename
         try:
             with open(out_path, 'w', newline='') as f:
                 writer = csv.writer(f)
                 writer.writerow(EVENT_FIELDS)
-                for event in sorted_events:
+                for event in self._sorted_events():
                     writer.writerow(_event_to_row(event))
         except Exception as e:
             print(f"Warning: Failed to write event-stream CSV {out_path}: {e}")
@@ -190,6 +210,41 @@ class EventStreamWriter:
 
         return out_path
 
+    def flush_parquet(self, filename: str = 'events.parquet') -> Optional[Path]:
+        """
+        Sort events by timestamp and write the typed Parquet table (EVENT_SCHEMA).
+
+        Args:
+            filename: Output filename inside run_dir ('events.parquet' /
+                'events_<scenario>.parquet', as flush()).
+
+        Returns:
+            Path to the written table, or None if run_dir is None or no events.
+        """
+        if self._run_dir is None or not self._events:
+            return None
+
+        out_path = self._run_dir / filename
+        tmp_path = out_path.with_name(f'{out_path.name}.{os.getpid()}.tmp')
+        try:
+            records = [_event_to_record(event) for event in self._sorted_events()]
+            pq.write_table(pa.Table.from_pylist(records, schema=EVENT_SCHEMA), tmp_path)
+            os.replace(tmp_path, out_path)
+        except Exception as e:
+            print(f"Warning: Failed to write event-stream Parquet {out_path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return None
+
+        return out_path
+
+    def _sorted_events(self) -> List[TradeEvent]:
+        """Events in timestamp order."""
+        # Sort defensively: promote any naive timestamp to UTC so mixed
+        # tz-aware / tz-naive datetimes don't break comparison. Project
+        # convention is tz-aware everywhere (CLAUDE.md §9), but the sort
+        # cannot afford to crash if a legacy path slips a naive one through.
+        return sorted(self._events, key=_utc_ts)
+
 
 # ============================================
 # Event reconstruction
@@ -371,6 +426,39 @@ def _sum_volume(trades: List[BrokerTrade]) -> float:
     return sum(t.volume for t in trades) if trades else 0.0
 
 
+def _utc_ts(event: TradeEvent) -> datetime:
+    """The event timestamp, naive promoted to UTC."""
+    ts = event.ts
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ts
+
+
+def _event_to_record(event: TradeEvent) -> Dict[str, Any]:
+    """Typed record of one TradeEvent for the Parquet table (EVENT_SCHEMA columns)."""
+    return {
+        'ts': _utc_ts(event) if event.ts else None,
+        'event_type': event.event_type.value,
+        'order_id': event.order_id,
+        'position_id': event.position_id,
+        'trade_id': event.trade_id,
+        'broker_ref': event.broker_ref,
+        'direction': event.direction.value if event.direction else None,
+        'side': event.side.value if event.side else None,
+        'lots': event.lots,
+        'price': event.price,
+        'fee': event.fee,
+        'fee_currency': event.fee_currency,
+        'status': event.status,
+        'close_type': event.close_type,
+        'close_reason': event.close_reason,
+        'is_maker': event.is_maker,
+        'submission_tick_mid_price': event.submission_tick_mid_price,
+        'submission_tick_time_msc': event.submission_tick_time_msc,
+        'notes': event.notes,
+    }
+
+
 def _event_to_row(event: TradeEvent) -> List[str]:
     """Serialize one TradeEvent to a CSV row matching EVENT_FIELDS order."""
     return [
@@ -2,19 +2,26 @@
 Order-history report IO + extraction (#391) — twin of the trade-history IO.
 
 Extract the shared `List[OrderResult]` from either pipeline's run result, persist
-the built report as JSON + CSV in the run directory, read it back, and apply the
-shared filter path. One model, one filter, identical data across console/file/API.
+the built report as JSON / Parquet row table + CSV in the run directory, read it
+back, and apply the shared filter path. One model, one filter, identical data
+across console/file/API.
 """
 
 import csv
 from pathlib import Path
 from typing import Optional
 
+from python.framework.reporting.io.report_rows_io import (
+    ROW_COPY_SUFFIX, RowArtifactSpec, RowQuery, iter_rows, write_row_table)
 from python.framework.types.api.report_types import OrderHistoryReport, OrderHistoryRow
 
 # Canonical artifact names inside a run directory
 ORDER_HISTORY_ARTIFACT = 'order_history.json'
 ORDER_HISTORY_CSV = 'order_history.csv'
+ORDER_HISTORY_ROWS_ARTIFACT = 'order_history' + ROW_COPY_SUFFIX   # the Parquet row table
+
+# Row mapping of the artifact (paginated / streamed reads, see report_rows_io)
+ORDER_HISTORY_ROWS = RowArtifactSpec(rows_key='orders', row_model=OrderHistoryRow)
 
 
 def write_order_history_report(report: OrderHistoryReport, run_dir: Path) -> Path:
@@ -38,6 +45,28 @@ def read_order_history_report(path: Path) -> OrderHistoryReport:
     return OrderHistoryReport.model_validate_json(Path(path).read_text())
 
 
+def write_order_history_rows(report: OrderHistoryReport, run_dir: Path) -> Path:
+    """
+    Persist the report's rows as the Parquet row table (see report_rows_io).
+
+    Args:
+        report: The built order-history report
+        run_dir: The run's directory
+
+    Returns:
+        Path of the written row table
+    """
+    return write_row_table(
+        [row.model_dump() for row in report.orders], ORDER_HISTORY_ROWS,
+        Path(run_dir) / ORDER_HISTORY_ROWS_ARTIFACT)
+
+
+def read_order_history_rows(path: Path) -> OrderHistoryReport:
+    """Read a order-history report from its row table (metadata recomputed from the rows)."""
+    rows = [OrderHistoryRow.model_validate(row) for row in iter_rows(path, ORDER_HISTORY_ROWS, RowQuery(equals={}))]
+    return filter_order_history_report(OrderHistoryReport(orders=rows, count=len(rows), symbols=[]))
+
+
 def write_order_history_csv(report: OrderHistoryReport, run_dir: Path) -> Path:
     """
     Persist the report as a CSV table — same columns as the JSON / API model.
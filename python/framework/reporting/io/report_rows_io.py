@@ -0,0 +1,337 @@
+"""
+Row-table IO for the row-shaped report artifacts (trade / order history).
+
+The JSON artifact is one document — reading a single row means parsing all of them.
+The row table (`<artifact>.rows.parquet`) is the columnar form of the same rows: both
+pipelines write it next to the JSON at persist time (the JSON is optional, see
+`reporting.write_row_json`), and for runs persisted as JSON only it is derived the
+first time it is needed (and again whenever the JSON is newer). It holds one column
+per row-model field, in row groups of `ROW_GROUP_ROWS`; list-valued fields (per-fill
+executions) are stored as JSON text.
+
+Reads walk the table one row group at a time: the filter columns are read first,
+the full columns only for the matching rows. Memory and time-to-first-row stay
+bounded by the row-group size, not by the size of the run. Analysis reads load only
+the columns they need (`read_row_columns`), and `scan_row_tables` reads one column
+set across many runs as a single dataset scan.
+"""
+
+import json
+import os
+import threading
+import types
+import typing
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Type
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from pydantic import BaseModel
+
+# Suffix of the columnar copy next to the JSON artifact
+ROW_COPY_SUFFIX = '.rows.parquet'
+
+# Rows per row group — the unit of every incremental read
+ROW_GROUP_ROWS = 5_000
+
+# Directory levels of a run's row table below the logs root, exposed as columns by
+# scan_row_tables (<logs_root>/<group>/<owner>/<run_id>/io/<artifact>)
+RUN_PARTITION_COLUMNS = ('group', 'owner', 'run_id')
+
+
+@dataclass(frozen=True)
+class RowArtifactSpec:
+    """
+    How a row-shaped report artifact maps onto a row table.
+
+    Args:
+        rows_key: Key of the row list in the JSON report ('trades' / 'orders')
+        row_model: Pydantic model of one row
+    """
+    rows_key: str
+    row_model: Type[BaseModel]
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self.row_model.model_fields)
+
+    @property
+    def nested(self) -> List[str]:
+        """List-valued fields (stored as JSON text)."""
+        return [name for name, field in self.row_model.model_fields.items()
+                if typing.get_origin(field.annotation) is list]
+
+    def schema(self) -> pa.Schema:
+        return pa.schema([
+            pa.field(name, _arrow_type(field.annotation))
+            for name, field in self.row_model.model_fields.items()
+        ])
+
+
+@dataclass
+class RowQuery:
+    """
+    Row filter of a paginated / streamed read.
+
+    Args:
+        equals: Column → required value (None values are ignored)
+        time_column: ISO-8601 column the start / end bounds apply to
+        start: Keep rows with time_column >= start (naive is read as UTC)
+        end: Keep rows with time_column <= end (naive is read as UTC)
+    """
+    equals: Dict[str, Optional[str]]
+    time_column: Optional[str] = None
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+
+    @property
+    def columns(self) -> List[str]:
+        columns = [c for c, v in self.equals.items() if v is not None]
+        if self.time_column and (self.start is not None or self.end is not None):
+            columns.append(self.time_column)
+        return columns
+
+
+# =============================================================================
+# COLUMNAR COPY
+# =============================================================================
+
+def row_copy_path(artifact: Path) -> Path:
+    """Path of the columnar copy of a JSON artifact (trade_history.json → trade_history.rows.parquet)."""
+    artifact = Path(artifact)
+    return artifact.with_name(artifact.stem + ROW_COPY_SUFFIX)
+
+
+def ensure_row_copy(artifact: Path, spec: RowArtifactSpec) -> Path:
+    """
+    The columnar copy of an artifact — (re)built if missing or older than the JSON.
+
+    Args:
+        artifact: The JSON report artifact
+        spec: Row mapping of the artifact
+
+    Returns:
+        Path of the up-to-date copy
+    """
+    artifact = Path(artifact)
+    copy = row_copy_path(artifact)
+    if copy.exists() and copy.stat().st_mtime_ns >= artifact.stat().st_mtime_ns:
+        return copy
+
+    rows = json.loads(artifact.read_bytes()).get(spec.rows_key, [])
+    write_row_table(rows, spec, copy)
+    return copy
+
+
+def write_row_table(rows: List[Dict], spec: RowArtifactSpec, path: Path) -> Path:
+    """
+    Write row dicts as a row table (atomic: temp file + rename).
+
+    Args:
+        rows: Row dicts (model_dump() shape; missing fields take the model default)
+        spec: Row mapping
+        path: Target Parquet path
+
+    Returns:
+        The written path
+    """
+    path = Path(path)
+    schema = spec.schema()
+    defaults = {name: field.get_default(call_default_factory=True)
+                for name, field in spec.row_model.model_fields.items()}
+    nested = set(spec.nested)
+
+    tmp_file = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with pq.ParquetWriter(tmp_file, schema) as writer:
+        for offset in range(0, max(len(rows), 1), ROW_GROUP_ROWS):
+            chunk = rows[offset:offset + ROW_GROUP_ROWS]
+            columns = {}
+            for name in spec.columns:
+                values = [row.get(name, defaults[name]) for row in chunk]
+                if name in nested:
+                    values = [json.dumps(v) for v in values]
+                columns[name] = values
+            writer.write_table(pa.table(columns, schema=schema))
+    os.replace(tmp_file, path)
+    return path
+
+
+# =============================================================================
+# COLUMN READS + CROSS-RUN SCANS
+# =============================================================================
+
+def read_row_columns(path: Path, columns: List[str], query: Optional[RowQuery] = None) -> pa.Table:
+    """
+    Selected columns of one row table (nothing else is read).
+
+    Args:
+        path: Row table
+        columns: Columns to load
+        query: Optional filter (equals pushed down to the read; time bounds applied after)
+
+    Returns:
+        Arrow table of the matching rows, in artifact order
+    """
+    extra = [c for c in (query.columns if query else []) if c not in columns]
+    table = pq.read_table(path, columns=list(columns) + extra, filters=_equals_expression(query))
+    if query is not None and query.time_column and (query.start is not None or query.end is not None):
+        table = table.filter(pa.array(_match_mask(table, RowQuery(
+            equals={}, time_column=query.time_column, start=query.start, end=query.end))))
+    return table.select(list(columns))
+
+
+def scan_row_tables(
+    logs_root: Path,
+    paths: List[Path],
+    columns: List[str],
+    query: Optional[RowQuery] = None,
+) -> pa.Table:
+    """
+    Selected columns of many runs' row tables as one dataset scan.
+
+    Args:
+        logs_root: Root the paths are laid out under (<group>/<owner>/<run_id>/io/...)
+        paths: Row tables to scan (one per run)
+        columns: Columns to load; may include the RUN_PARTITION_COLUMNS
+        query: Optional equals filter (pushed down; time bounds are not applied)
+
+    Returns:
+        Arrow table of the matching rows of all runs
+    """
+    if not paths:
+        return pa.table({c: pa.array([], type=pa.string()) for c in columns})
+    dataset = ds.dataset(
+        [str(p) for p in paths], format='parquet',
+        partitioning=ds.partitioning(pa.schema([(c, pa.string()) for c in RUN_PARTITION_COLUMNS])),
+        partition_base_dir=str(logs_root))
+    return dataset.to_table(columns=list(columns), filter=_equals_expression(query))
+
+
+def _equals_expression(query: Optional[RowQuery]) -> Optional[ds.Expression]:
+    """The query's equals filters as an Arrow expression (None = no filter)."""
+    expression = None
+    for column, value in (query.equals.items() if query else []):
+        if value is None:
+            continue
+        term = ds.field(column) == value
+        expression = term if expression is None else expression & term
+    return expression
+
+
+# =============================================================================
+# INCREMENTAL READS
+# =============================================================================
+
+def read_row_page(
+    path: Path,
+    spec: RowArtifactSpec,
+    query: RowQuery,
+    cursor: int = 0,
+    limit: int = 500,
+) -> Tuple[List[Dict], Optional[int]]:
+    """
+    One page of matching rows, starting at a cursor.
+
+    Args:
+        path: Row table (see ensure_row_copy)
+        spec: Row mapping
+        query: Row filter
+        cursor: Row position to continue from (0 = start)
+        limit: Maximum rows in the page
+
+    Returns:
+        (rows, next cursor) — next cursor is None when no rows remain
+    """
+    rows: List[Dict] = []
+    for position, row in _iter_matches(path, spec, query, cursor):
+        if len(rows) == limit:
+            return rows, position
+        rows.append(row)
+    return rows, None
+
+
+def iter_rows(path: Path, spec: RowArtifactSpec, query: RowQuery) -> Iterator[Dict]:
+    """
+    All matching rows, one row group at a time.
+
+    Args:
+        path: Row table (see ensure_row_copy)
+        spec: Row mapping
+        query: Row filter
+
+    Yields:
+        Row dicts in artifact order
+    """
+    for _, row in _iter_matches(path, spec, query, 0):
+        yield row
+
+
+def _iter_matches(path: Path, spec: RowArtifactSpec, query: RowQuery, cursor: int) -> Iterator[Tuple[int, Dict]]:
+    """(row position, row) of every matching row at or after cursor."""
+    parquet = pq.ParquetFile(path)
+    group_rows = [parquet.metadata.row_group(i).num_rows for i in range(parquet.num_row_groups)]
+    group_starts = np.concatenate(([0], np.cumsum(group_rows)))
+    nested = spec.nested
+    filter_columns = query.columns
+
+    first_group = int(np.searchsorted(group_starts, cursor, side='right')) - 1
+    for group in range(max(first_group, 0), parquet.num_row_groups):
+        group_start = int(group_starts[group])
+        if filter_columns:
+            mask = _match_mask(parquet.read_row_group(group, columns=filter_columns), query)
+        else:
+            mask = np.ones(group_rows[group], dtype=bool)
+        mask[:max(cursor - group_start, 0)] = False
+        selected = np.flatnonzero(mask)
+        if not len(selected):
+            continue
+
+        table = parquet.read_row_group(group, columns=spec.columns).take(selected)
+        for offset, row in zip(selected.tolist(), table.to_pylist()):
+            for name in nested:
+                row[name] = json.loads(row[name])
+            yield group_start + offset, row
+
+
+def _match_mask(table: pa.Table, query: RowQuery) -> np.ndarray:
+    """Boolean mask of the rows of one row group matching the query."""
+    mask = np.ones(table.num_rows, dtype=bool)
+    for column, value in query.equals.items():
+        if value is not None:
+            mask &= np.asarray(table.column(column).to_pandas() == value, dtype=bool)
+
+    if query.time_column and (query.start is not None or query.end is not None):
+        times = pd.to_datetime(
+            table.column(query.time_column).to_pandas(),
+            utc=True, format='ISO8601', errors='coerce')
+        if query.start is not None:
+            mask &= np.asarray(times >= _utc(query.start), dtype=bool)
+        if query.end is not None:
+            mask &= np.asarray(times <= _utc(query.end), dtype=bool)
+    return mask
+
+
+def _utc(moment: datetime) -> pd.Timestamp:
+    """A filter bound as an aware UTC timestamp (naive is read as UTC)."""
+    ts = pd.Timestamp(moment)
+    return ts.tz_localize(timezone.utc) if ts.tzinfo is None else ts.tz_convert(timezone.utc)
+
+
+def _arrow_type(annotation) -> pa.DataType:
+    """Arrow type of a row-model field (list fields → JSON text)."""
+    if typing.get_origin(annotation) in (typing.Union, types.UnionType):
+        args = [a for a in typing.get_args(annotation) if a is not type(None)]
+        annotation = args[0]
+    if typing.get_origin(annotation) is list:
+        return pa.string()
+    return {
+        str: pa.string(),
+        float: pa.float64(),
+        int: pa.int64(),
+        bool: pa.bool_(),
+    }[annotation]
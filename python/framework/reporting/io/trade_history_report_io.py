@@ -3,8 +3,9 @@ Trade-history report IO + extraction (#391).
 
 The bridge between the postprocessor and the consumers: extract the shared
 `List[TradeRecord]` from either pipeline's run result, persist the built report as
-JSON in the run directory, read it back, and apply the shared filter path. Console,
-file, and API all go through this — one model, one filter, identical data.
+JSON and / or as its Parquet row table in the run directory, read it back, and apply
+the shared filter path. Console, file, and API all go through this — one model, one
+filter, identical data.
 """
 
 import csv
@@ -14,11 +15,17 @@ from typing import Optional
 
 from python.framework.reporting.builders.report_aggregators import (
     aggregate_trade_analytics, aggregate_trade_scenario_totals)
+from python.framework.reporting.io.report_rows_io import (
+    ROW_COPY_SUFFIX, RowArtifactSpec, RowQuery, iter_rows, write_row_table)
 from python.framework.types.api.report_types import TradeHistoryReport, TradeHistoryRow
 
 # Canonical artifact names inside a run directory
 TRADE_HISTORY_ARTIFACT = 'trade_history.json'
 TRADE_HISTORY_CSV = 'trade_history.csv'
+TRADE_HISTORY_ROWS_ARTIFACT = 'trade_history' + ROW_COPY_SUFFIX   # the Parquet row table
+
+# Row mapping of the artifact (paginated / streamed reads, see report_rows_io)
+TRADE_HISTORY_ROWS = RowArtifactSpec(rows_key='trades', row_model=TradeHistoryRow)
 
 
 def write_trade_history_report(report: TradeHistoryReport, run_dir: Path) -> Path:
@@ -42,6 +49,28 @@ def read_trade_history_report(path: Path) -> TradeHistoryReport:
     return TradeHistoryReport.model_validate_json(Path(path).read_text())
 
 
+def write_trade_history_rows(report: TradeHistoryReport, run_dir: Path) -> Path:
+    """
+    Persist the report's rows as the Parquet row table (see report_rows_io).
+
+    Args:
+        report: The built trade-history report
+        run_dir: The run's directory
+
+    Returns:
+        Path of the written row table
+    """
+    return write_row_table(
+        [row.model_dump() for row in report.trades], TRADE_HISTORY_ROWS,
+        Path(run_dir) / TRADE_HISTORY_ROWS_ARTIFACT)
+
+
+def read_trade_history_rows(path: Path) -> TradeHistoryReport:
+    """Read a trade-history report from its row table (metadata recomputed from the rows)."""
+    rows = [TradeHistoryRow.model_validate(row) for row in iter_rows(path, TRADE_HISTORY_ROWS, RowQuery(equals={}))]
+    return filter_trade_history_report(TradeHistoryReport(trades=rows, count=len(rows), symbols=[], analytics=[]))
+
+
 def write_trade_history_csv(report: TradeHistoryReport, run_dir: Path) -> Path:
     """
     Persist the report as a CSV table — the same columns as the JSON / API model,
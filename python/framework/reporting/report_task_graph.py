@@ -0,0 +1,105 @@
+"""
+Report task graph — run a run's report steps in dependency order, independent ones concurrently.
+
+The builders read the run's in-memory results and the writers mostly wait on serialization +
+file I/O, so the steps run on a thread pool (a process pool would pickle the whole run for
+every builder). A step starts as soon as every step in its `after` has finished; each step's
+own wall time is recorded so a slow builder or writer shows up in the run log.
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Set
+
+from python.framework.types.report_task_types import ReportTask, ReportTaskResults
+
+
+def run_report_tasks(tasks: List[ReportTask], max_workers: int = 1) -> ReportTaskResults:
+    """
+    Run report tasks in dependency order.
+
+    With max_workers <= 1 the tasks run one after another in the calling thread (declared
+    order, moved only where `after` requires it).
+
+    Args:
+        tasks: The steps (unique names; `after` may only name tasks of this list)
+        max_workers: Thread pool size (<= 1 = sequential in the calling thread)
+
+    Returns:
+        Every task's result + its own wall time
+
+    Raises:
+        ValueError: Duplicate names, an unknown dependency, or a dependency cycle
+        Exception: The first failing task's exception (the running tasks finish first;
+            tasks not started yet are skipped)
+    """
+    ordered = _topological(tasks)
+    outcome = ReportTaskResults()
+
+    if max_workers <= 1:
+        for task in ordered:
+            _run(task, outcome)
+        return outcome
+
+    by_name = {task.name: task for task in ordered}
+    pending: Dict[str, Set[str]] = {task.name: set(task.after) for task in ordered}
+    running: Dict[Future, str] = {}
+    error: Optional[BaseException] = None
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='report') as pool:
+        while pending or running:
+            if error is None:
+                # Start every task whose dependencies are done (declared order among the ready)
+                for name in [n for n, deps in pending.items() if not deps]:
+                    del pending[name]
+                    running[pool.submit(_run, by_name[name], outcome)] = name
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                if future.exception() is not None:
+                    error = error or future.exception()
+                    continue
+                for deps in pending.values():
+                    deps.discard(name)
+
+    if error is not None:
+        raise error
+    return outcome
+
+
+def _run(task: ReportTask, outcome: ReportTaskResults) -> None:
+    """Run one task against the results so far; record its result + wall time."""
+    start = time.perf_counter()
+    result = task.run(outcome.results)
+    outcome.seconds[task.name] = time.perf_counter() - start
+    outcome.results[task.name] = result
+
+
+def _topological(tasks: List[ReportTask]) -> List[ReportTask]:
+    """The tasks in a dependency-respecting order (stable: declared order where possible)."""
+    by_name: Dict[str, ReportTask] = {}
+    for task in tasks:
+        if task.name in by_name:
+            raise ValueError(f"Duplicate report task '{task.name}'")
+        by_name[task.name] = task
+    for task in tasks:
+        unknown = [dep for dep in task.after if dep not in by_name]
+        if unknown:
+            raise ValueError(f"Report task '{task.name}' depends on unknown task(s) {unknown}")
+
+    ordered: List[ReportTask] = []
+    placed: Set[str] = set()
+    remaining = list(tasks)
+    while remaining:
+        # The first declared task whose dependencies are placed
+        task = next((t for t in remaining if all(dep in placed for dep in t.after)), None)
+        if task is None:
+            raise ValueError(
+                f"Report task dependency cycle among {[t.name for t in remaining]}")
+        ordered.append(task)
+        placed.add(task.name)
+        remaining.remove(task)
+    return ordered
+
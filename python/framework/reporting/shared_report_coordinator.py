@@ -6,10 +6,14 @@ build+write sequence for the units-derived report sections (trade / order / port
 pending / execution-stats / run-summary / worker-decision / signal / feed-stability). This unit owns that sequence once;
 each pipeline delegates to it and keeps only its pipeline-specific sections + console + ledger.
 Stateless by design (composition, not a base class) — see the pipeline coordinators for the flow.
+
+The sequence is declared as report tasks (`report_tasks`: one build + one write task per
+section, with the run summary after the sections it composes), so a pipeline can run them
+through `run_report_tasks` together with its own sections — concurrently where independent.
 """
 
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from python.framework.reporting.builders.execution_stats_report_builder import build_execution_stats_report
 from python.framework.reporting.builders.feed_stability_report_builder import build_feed_stability_report
@@ -26,14 +30,16 @@ from python.framework.reporting.io.execution_stats_report_io import (
     write_execution_stats_csv, write_execution_stats_report)
 from python.framework.reporting.io.feed_stability_report_io import write_feed_stability_report
 from python.framework.reporting.io.order_history_report_io import (
-    write_order_history_csv, write_order_history_report)
+    write_order_history_csv, write_order_history_report, write_order_history_rows)
 from python.framework.reporting.io.pending_orders_report_io import write_pending_orders_report
 from python.framework.reporting.io.portfolio_report_io import write_portfolio_report
 from python.framework.reporting.io.run_summary_io import write_run_summary
 from python.framework.reporting.io.signal_report_io import write_signal_report
 from python.framework.reporting.io.trade_history_report_io import (
-    write_trade_history_csv, write_trade_history_report)
+    write_trade_history_csv, write_trade_history_report, write_trade_history_rows)
 from python.framework.reporting.io.worker_decision_report_io import write_worker_decision_report
+from python.framework.reporting.report_task_graph import run_report_tasks
+from python.framework.types.report_task_types import ReportTask
 from python.framework.types.scenario_types.scenario_set_types import SignalScenarioInfo
 
 
@@ -45,6 +51,8 @@ class SharedReportCoordinator:
         units: List[RunUnit],
         io_dir: Path,
         signal_scenario_map: Optional[Dict[Tuple[str, str], SignalScenarioInfo]] = None,
+        write_row_json: bool = True,
+        max_workers: int = 1,
     ) -> UnifiedReports:
         """
         Build + persist the units-derived report sections shared by both pipelines.
@@ -54,60 +62,137 @@ class SharedReportCoordinator:
             io_dir: The run's io/ subfolder (created if missing)
             signal_scenario_map: The prepared signal sources (#433); both pipelines get it
                 from the same MountPreparer run. Empty / None = no SIGNAL source bound
+            write_row_json: Also write trade / order history as JSON documents (the Parquet
+                row tables are always written; reporting.write_row_json)
+            max_workers: Report threads (<= 1 = sequential)
 
         Returns:
             The built models, for the caller's console + ledger reuse
         """
-        io_dir.mkdir(parents=True, exist_ok=True)
-
-        trade_history = build_trade_history_report(units)
-        write_trade_history_report(trade_history, io_dir)
-        write_trade_history_csv(trade_history, io_dir)
+        tasks = SharedReportCoordinator.report_tasks(
+            units, io_dir, signal_scenario_map, write_row_json)
+        return SharedReportCoordinator.collect(run_report_tasks(tasks, max_workers).results)
 
-        order_history = build_order_history_report(units)
-        write_order_history_report(order_history, io_dir)
-        write_order_history_csv(order_history, io_dir)
-
-        # Portfolio full projection — per-unit rows + per-currency roll-up.
-        portfolio = build_portfolio_report(units)
-        write_portfolio_report(portfolio, io_dir)
-
-        # Pending-orders — per-unit lifecycle + latency + active orders.
-        pending_orders = build_pending_orders_report(units)
-        write_pending_orders_report(pending_orders, io_dir)
+    @staticmethod
+    def report_tasks(
+        units: List[RunUnit],
+        io_dir: Path,
+        signal_scenario_map: Optional[Dict[Tuple[str, str], SignalScenarioInfo]] = None,
+        write_row_json: bool = True,
+    ) -> List[ReportTask]:
+        """
+        The shared sections as report tasks — a build task named after the section (its
+        result is the model) + a `<section>.write` task per section.
 
-        # Execution-stats headline — per-unit order counts + summed total.
-        execution_stats = build_execution_stats_report(units)
-        write_execution_stats_report(execution_stats, io_dir)
-        write_execution_stats_csv(execution_stats, io_dir)
+        Args:
+            units: The run's units (sim: N scenarios; live: 1 session)
+            io_dir: The run's io/ subfolder (created here if missing)
+            signal_scenario_map: The prepared signal sources (#433)
+            write_row_json: Also write trade / order history as JSON documents
 
-        # Signal configuration — archive provenance + what the strategy decided on (#433).
-        # Built BEFORE the run summary: it supplies the run's weakest fresh ratio.
-        signal = build_signal_report(signal_scenario_map or {}, units)
-        write_signal_report(signal, io_dir)
+        Returns:
+            The tasks, for run_report_tasks (alone or with the pipeline's own tasks)
+        """
+        io_dir.mkdir(parents=True, exist_ok=True)
 
-        # Feed stability — the observed outage episodes of both staleness domains (#451).
-        # Also before the run summary: it supplies the run's disturbance totals.
-        feed_stability = build_feed_stability_report(units)
-        write_feed_stability_report(feed_stability, io_dir)
+        def write_trade_history(report) -> None:
+            # Row-shaped sections: the Parquet row table is the columnar artifact (paged API
+            # reads, cross-run scans); written after the JSON so it is never older than it.
+            if write_row_json:
+                write_trade_history_report(report, io_dir)
+            write_trade_history_rows(report, io_dir)
+            write_trade_history_csv(report, io_dir)
+
+        def write_order_history(report) -> None:
+            if write_row_json:
+                write_order_history_report(report, io_dir)
+            write_order_history_rows(report, io_dir)
+            write_order_history_csv(report, io_dir)
+
+        def write_execution_stats(report) -> None:
+            write_execution_stats_report(report, io_dir)
+            write_execution_stats_csv(report, io_dir)
+
+        return [
+            *section_tasks('trade_history', lambda r: build_trade_history_report(units),
+                           write_trade_history),
+            *section_tasks('order_history', lambda r: build_order_history_report(units),
+                           write_order_history),
+            # Portfolio full projection — per-unit rows + per-currency roll-up.
+            *section_tasks('portfolio', lambda r: build_portfolio_report(units),
+                           lambda report: write_portfolio_report(report, io_dir)),
+            # Pending-orders — per-unit lifecycle + latency + active orders.
+            *section_tasks('pending_orders', lambda r: build_pending_orders_report(units),
+                           lambda report: write_pending_orders_report(report, io_dir)),
+            # Execution-stats headline — per-unit order counts + summed total.
+            *section_tasks('execution_stats', lambda r: build_execution_stats_report(units),
+                           write_execution_stats),
+            # Signal configuration — archive provenance + what the strategy decided on (#433).
+            # The run summary reads it: it supplies the run's weakest fresh ratio.
+            *section_tasks('signal',
+                           lambda r: build_signal_report(signal_scenario_map or {}, units),
+                           lambda report: write_signal_report(report, io_dir)),
+            # Feed stability — the observed outage episodes of both staleness domains (#451).
+            # The run summary reads it too: it supplies the run's disturbance totals.
+            *section_tasks('feed_stability', lambda r: build_feed_stability_report(units),
+                           lambda report: write_feed_stability_report(report, io_dir)),
+            # Run summary — cross-section KPIs composed from the section aggregates (#390 prework).
+            *section_tasks(
+                'run_summary',
+                lambda r: build_run_summary(
+                    r['portfolio'], r['trade_history'], r['execution_stats'], r['signal'],
+                    r['feed_stability']),
+                lambda report: write_run_summary(report, io_dir),
+                after=('portfolio', 'trade_history', 'execution_stats', 'signal',
+                       'feed_stability')),
+            # Worker/decision — per-unit worker + decision performance (#398).
+            *section_tasks('worker_decision', lambda r: build_worker_decision_report(units),
+                           lambda report: write_worker_decision_report(report, io_dir)),
+        ]
 
-        # Run summary — cross-section KPIs composed from the section aggregates (#390 prework).
-        run_summary = build_run_summary(
-            portfolio, trade_history, execution_stats, signal, feed_stability)
-        write_run_summary(run_summary, io_dir)
+    @staticmethod
+    def collect(results: Dict[str, Any]) -> UnifiedReports:
+        """
+        The shared models from a finished task graph.
 
-        # Worker/decision — per-unit worker + decision performance (#398).
-        worker_decision = build_worker_decision_report(units)
-        write_worker_decision_report(worker_decision, io_dir)
+        Args:
+            results: run_report_tasks results (task name → result)
 
+        Returns:
+            The built models, for the caller's console + ledger reuse
+        """
         return UnifiedReports(
-            trade_history=trade_history,
-            order_history=order_history,
-            portfolio=portfolio,
-            pending_orders=pending_orders,
-            execution_stats=execution_stats,
-            run_summary=run_summary,
-            worker_decision=worker_decision,
-            signal=signal,
-            feed_stability=feed_stability,
+            trade_history=results['trade_history'],
+            order_history=results['order_history'],
+            portfolio=results['portfolio'],
+            pending_orders=results['pending_orders'],
+            execution_stats=results['execution_stats'],
+            run_summary=results['run_summary'],
+            worker_decision=results['worker_decision'],
+            signal=results['signal'],
+            feed_stability=results['feed_stability'],
         )
+
+
+def section_tasks(
+    name: str,
+    build: Callable[[Dict[str, Any]], Any],
+    write: Callable[[Any], None],
+    after: Tuple[str, ...] = (),
+) -> List[ReportTask]:
+    """
+    The build + write task pair of one report section.
+
+    Args:
+        name: Section name — the build task's name (its result is the model)
+        build: Builds the model from the finished tasks' results
+        write: Persists the model (task `<name>.write`, after the build)
+        after: Tasks the build reads
+
+    Returns:
+        [build task, write task]
+    """
+    return [
+        ReportTask(name=name, run=build, after=after),
+        ReportTask(name=f'{name}.write', run=lambda results: write(results[name]), after=(name,)),
+    ]
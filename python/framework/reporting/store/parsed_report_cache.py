@@ -0,0 +1,100 @@
+"""
+Parsed report cache — in-process LRU of report models read from run artifacts.
+
+A finished run's artifacts do not change, yet every API call re-read and re-validated
+the JSON into the Pydantic model. The cache keeps the parsed model per artifact path
+together with the file state it was read from (mtime_ns, size); a changed file is read
+again, an unchanged one is served from memory. Bounded by the summed artifact file
+size, so a few large trade histories cannot pin unbounded memory — artifacts larger
+than a quarter of the budget are never cached (their paged / streamed endpoints are
+the efficient read path anyway).
+
+Cached models are shared between callers and must be treated as read-only.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+# Summed artifact file size the cache may hold (the parsed models are a multiple)
+REPORT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+
+class ParsedReportCache:
+    """
+    LRU of parsed report models keyed by artifact path, validated by (mtime_ns, size).
+
+    Thread-safe: sync endpoints run concurrently in the server's thread pool.
+    """
+
+    _shared: Optional['ParsedReportCache'] = None
+    _shared_lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> 'ParsedReportCache':
+        """
+        The process-wide cache (every ReportStore of the process reads through it).
+
+        Returns:
+            The shared ParsedReportCache
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def __init__(self, max_bytes: int = REPORT_CACHE_MAX_BYTES):
+        """
+        Args:
+            max_bytes: Summed artifact file size to keep cached
+        """
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[Path, Tuple[Tuple[int, int], object]]' = OrderedDict()
+        self._bytes = 0
+
+    def read(self, path: Path, reader: Callable[[Path], T]) -> T:
+        """
+        The parsed artifact — from the cache if the file is unchanged, else read + cached.
+
+        Args:
+            path: Artifact file
+            reader: Parses the artifact into its report model (the *_report_io reader)
+
+        Returns:
+            The report model (shared — do not mutate)
+        """
+        stat = os.stat(path)
+        state = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._entries.get(path)
+            if cached is not None and cached[0] == state:
+                self._entries.move_to_end(path)
+                return cached[1]
+
+        report = reader(path)
+        if stat.st_size > self._max_bytes // 4:
+            return report
+        with self._lock:
+            previous = self._entries.pop(path, None)
+            if previous is not None:
+                self._bytes -= previous[0][1]
+            self._entries[path] = (state, report)
+            self._bytes += stat.st_size
+            while self._bytes > self._max_bytes:
+                _, (evicted_state, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_state[1]
+        return report
+
+    def clear(self) -> None:
+        """Drop all cached models."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
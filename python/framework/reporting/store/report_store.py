@@ -4,12 +4,25 @@ Report store (#391) — resolves persisted run-report artifacts under the logs t
 The API's read-only source: given a run id, find the run's trade-history artifact
 (written by either pipeline into its run directory), read it, and apply the shared
 filter. Run directories follow `<logs_root>/<group>/<set-or-profile>/<run_id>/`, and the
-report artifacts live in the run's `io/` subfolder (`IO_SUBDIR`).
+report artifacts live in the run's `io/` subfolder (`IO_SUBDIR`). Runs are listed and
+resolved through the persistent run catalog of the logs root (`RunCatalog`), not by
+globbing the tree. A run id shared by runs of several owners is ambiguous: such a run is
+addressed as `<owner>/<run_id>` (`AmbiguousRunIdError` otherwise). Parsed reports are served from the process-wide `ParsedReportCache`
+(re-read only when the artifact file changed), and `artifact_etag` gives the API a
+validator for conditional requests without reading the artifact.
+
+Trade / order history exist as a JSON document and / or a Parquet row table; the
+JSON is optional (`reporting.write_row_json`), so a run with the row table only is
+served from it. Row tables also back the cross-run scans (`scan_trade_rows`).
 """
 
+import hashlib
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Dict, Iterator, List, Optional, TypeVar
+
+import pyarrow as pa
 
 from python.framework.reporting.io.aggregated_portfolio_report_io import (
     AGGREGATED_PORTFOLIO_ARTIFACT, read_aggregated_portfolio_report)
@@ -22,7 +35,8 @@ from python.framework.reporting.io.execution_stats_report_io import (
 from python.framework.reporting.io.feed_stability_report_io import (
     FEED_STABILITY_ARTIFACT, read_feed_stability_report)
 from python.framework.reporting.io.order_history_report_io import (
-    ORDER_HISTORY_ARTIFACT, filter_order_history_report, read_order_history_report)
+    ORDER_HISTORY_ARTIFACT, ORDER_HISTORY_ROWS, ORDER_HISTORY_ROWS_ARTIFACT,
+    filter_order_history_report, read_order_history_report, read_order_history_rows)
 from python.framework.reporting.io.pending_orders_report_io import (
     PENDING_ORDERS_ARTIFACT, read_pending_orders_report)
 from python.framework.reporting.io.portfolio_report_io import (
@@ -34,37 +48,84 @@ from python.framework.reporting.io.scenario_details_report_io import (
 from python.framework.reporting.io.profiling_report_io import (
     PROFILING_ARTIFACT, read_profiling_report)
 from python.framework.reporting.io.trade_history_report_io import (
-    TRADE_HISTORY_ARTIFACT, filter_trade_history_report, read_trade_history_report)
+    TRADE_HISTORY_ARTIFACT, TRADE_HISTORY_ROWS, TRADE_HISTORY_ROWS_ARTIFACT,
+    filter_trade_history_report, read_trade_history_report, read_trade_history_rows)
+from python.framework.reporting.io.report_rows_io import (
+    ROW_COPY_SUFFIX, RowArtifactSpec, RowQuery, ensure_row_copy, iter_rows, read_row_page,
+    scan_row_tables)
+from python.framework.reporting.store.parsed_report_cache import ParsedReportCache
+from python.framework.reporting.store.run_catalog import IO_SUBDIR, RunCatalog
 from python.framework.reporting.io.warnings_errors_report_io import (
     WARNINGS_ERRORS_ARTIFACT, read_warnings_errors_report)
 from python.framework.reporting.io.worker_decision_report_io import (
     WORKER_DECISION_ARTIFACT, read_worker_decision_report)
 from python.framework.types.api.report_types import (
     AggregatedPortfolioReport, BrokerReport, ExecutionStatsReport, FeedStabilityReport,
-    OrderHistoryReport, PendingOrdersReport, PortfolioReport, ProfilingReport, RunSummary,
-    ScenarioDetailsReport, SignalReport, TradeHistoryReport, WarningsErrorsReport,
-    WorkerDecisionReport)
+    OrderHistoryPage, OrderHistoryReport, PendingOrdersReport, PortfolioReport,
+    ProfilingReport, RunSummary, ScenarioDetailsReport, SignalReport, TradeHistoryPage,
+    TradeHistoryReport, WarningsErrorsReport, WorkerDecisionReport)
+from python.framework.types.run_catalog_types import RunCatalogEntry
+
+T = TypeVar('T')
 
-# Report artifacts (JSON + CSV) live in this subfolder of a run directory.
-IO_SUBDIR = 'io'
+# Row-shaped artifacts: JSON document → its Parquet row table (served when the JSON is absent)
+_ROW_TABLES = {
+    TRADE_HISTORY_ARTIFACT: TRADE_HISTORY_ROWS_ARTIFACT,
+    ORDER_HISTORY_ARTIFACT: ORDER_HISTORY_ROWS_ARTIFACT,
+}
 
 
 class ReportStore:
     """Locates + serves persisted run-report artifacts (sim + autotrader runs)."""
 
-    # run dirs live at: <logs_root>/<group>/<set-or-profile>/<run_id>/<artifact>
-    _GROUPS = ('scenario_sets', 'autotrader')
-
-    def __init__(self, logs_root: Path = Path('logs')):
+    def __init__(self, logs_root: Path = Path('logs'), report_cache: Optional[ParsedReportCache] = None):
+        """
+        Args:
+            logs_root: Root of the logs tree
+            report_cache: Parsed-report cache (default: the process-wide one)
+        """
         self._logs_root = Path(logs_root)
+        self._catalog = RunCatalog.shared(self._logs_root)
+        self._report_cache = report_cache if report_cache is not None else ParsedReportCache.shared()
 
     def list_runs(self) -> List[str]:
-        """Run ids (run-timestamp dirs) carrying a trade-history artifact, newest first."""
-        run_ids = set()
-        for group in self._GROUPS:
-            for artifact in (self._logs_root / group).glob(f'*/*/{IO_SUBDIR}/{TRADE_HISTORY_ARTIFACT}'):
-                run_ids.add(artifact.parent.parent.name)
-        return sorted(run_ids, reverse=True)
+        """
+        Runs carrying a trade-history artifact, newest first — as their references (the
+        run id, qualified as `<owner>/<run_id>` where several runs share it).
+        """
+        return [self._catalog.reference(entry) for entry in self._catalog.entries()
+                if TRADE_HISTORY_ARTIFACT in entry.artifacts
+                or TRADE_HISTORY_ROWS_ARTIFACT in entry.artifacts]
+
+    def run_reference(self, entry: RunCatalogEntry) -> str:
+        """The reference the per-run lookups accept for a listed run (see RunCatalog.reference)."""
+        return self._catalog.reference(entry)
+
+    def list_run_entries(self) -> List[RunCatalogEntry]:
+        """All catalogued runs (path, artifacts, headline metadata), newest first."""
+        return self._catalog.entries()
+
+    def artifact_etag(self, run_id: str, artifact: str, variant: str = '') -> Optional[str]:
+        """
+        Strong ETag of a run artifact's current version — from its file state, no read.
+
+        Args:
+            run_id: The run reference (run id, or `<owner>/<run_id>` where runs share it)
+            artifact: Artifact file name
+            variant: Distinguishes responses derived from the same artifact (e.g. the query)
+
+        Returns:
+            The quoted ETag, or None if the run has no such artifact
+        """
+        path = self._resolve(run_id, artifact)
+        if path is None:
+            return None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        key = f'{path}|{stat.st_mtime_ns}|{stat.st_size}|{variant}'
+        return '"' + hashlib.sha1(key.encode()).hexdigest() + '"'
 
     def get_trade_history(
         self,
@@ -78,7 +139,7 @@ class ReportStore:
         Read + filter a run's trade-history report.
 
         Args:
-            run_id: The run-timestamp directory name
+            run_id: The run reference (run id, or `<owner>/<run_id>` where runs share it)
             symbol / close_reason / start / end: Filters (see filter_trade_history_report)
 
         Returns:
@@ -87,7 +148,7 @@ class ReportStore:
         path = self._resolve(run_id, TRADE_HISTORY_ARTIFACT)
         if path is None:
             return None
-        report = read_trade_history_report(path)
+        report = self._read(path, self._reader(path, read_trade_history_report, read_trade_history_rows))
         return filter_trade_history_report(report, symbol, close_reason, start, end)
 
     def get_order_history(
@@ -100,7 +161,7 @@ class ReportStore:
         Read + filter a run's order-history report.
 
         Args:
-            run_id: The run-timestamp directory name
+            run_id: The run reference (run id, or `<owner>/<run_id>` where runs share it)
             symbol / status: Filters (see filter_order_history_report)
 
         Returns:
@@ -109,15 +170,174 @@ class ReportStore:
         path = self._resolve(run_id, ORDER_HISTORY_ARTIFACT)
         if path is None:
             return None
-        report = read_order_history_report(path)
+        report = self._read(path, self._reader(path, read_order_history_report, read_order_history_rows))
         return filter_order_history_report(report, symbol, status)
 
+    def page_trade_history(
+        self,
+        run_id: str,
+        cursor: int = 0,
+        limit: int = 500,
+        symbol: Optional[str] = None,
+        close_reason: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Optional[TradeHistoryPage]:
+        """
+        One cursor page of a run's filtered trade rows, read from the columnar copy.
+
+        Args:
+            run_id: The run reference (run id, or `<owner>/<run_id>` where runs share it)
+            cursor: Row position to continue from (next_cursor of the previous page)
+            limit: Maximum rows in the page
+            symbol / close_reason / start / end: Filters (as get_trade_history)
+
+        Returns:
+            The page, or None if the run has no trade-history artifact
+        """
+        path = self._resolve(run_id, TRADE_HISTORY_ARTIFACT)
+        if path is None:
+            return None
+        rows, next_cursor = read_row_page(
+            self._row_table(path, TRADE_HISTORY_ROWS), TRADE_HISTORY_ROWS,
+            self._trade_query(symbol, close_reason, start, end), cursor, limit)
+        return TradeHistoryPage(
+            trades=rows, count=len(rows),
+            next_cursor=None if next_cursor is None else str(next_cursor))
+
+    def iter_trade_history(
+        self,
+        run_id: str,
+        symbol: Optional[str] = None,
+        close_reason: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Optional[Iterator[Dict]]:
+        """
+        A run's filtered trade rows as an iterator (one row group in memory at a time).
+
+        Args:
+            run_id: The run reference (run id, or `<owner>/<run_id>` where runs share it)
+            symbol / close_reason / start / end: Filters (as get_trade_history)
+
+        Returns:
+            Row dicts (TradeHistoryRow shape), or None if the run has no trade-history artifact
+        """
+        path = self._resolve(run_id, TRADE_HISTORY_ARTIFACT)
+        if path is None:
+            return None
+        return iter_rows(
+            self._row_table(path, TRADE_HISTORY_ROWS), TRADE_HISTORY_ROWS,
+            self._trade_query(symbol, close_reason, start, end))
+
+    def page_order_history(
+        self,
+        run_id: str,
+        cursor: int = 0,
+        limit: int = 500,
+        symbol: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> Optional[OrderHistoryPage]:
+        """
+        One cursor page of a run's filtered order rows, read from the columnar copy.
+
+        Args:
+            run_id: The run reference (run id, or `<owner>/<run_id>` where runs share it)
+            cursor: Row position to continue from (next_cursor of the previous page)
+            limit: Maximum rows in the page
+            symbol / status: Filters (as get_order_history)
+
+        Returns:
+            The page, or None if the run has no order-history artifact
+        """
+        path = self._resolve(run_id, ORDER_HISTORY_ARTIFACT)
+        if path is None:
+            return None
+        rows, next_cursor = read_row_page(
+            self._row_table(path, ORDER_HISTORY_ROWS), ORDER_HISTORY_ROWS,
+            RowQuery(equals={'symbol': symbol, 'status': status}), cursor, limit)
+        return OrderHistoryPage(
+            orders=rows, count=len(rows),
+            next_cursor=None if next_cursor is None else str(next_cursor))
+
+    def iter_order_history(
+        self,
+        run_id: str,
+        symbol: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> Optional[Iterator[Dict]]:
+        """
+        A run's filtered order rows as an iterator (one row group in memory at a time).
+
+        Args:
+            run_id: The run reference (run id, or `<owner>/<run_id>` where runs share it)
+            symbol / status: Filters (as get_order_history)
+
+        Returns:
+            Row dicts (OrderHistoryRow shape), or None if the run has no order-history artifact
+        """
+        path = self._resolve(run_id, ORDER_HISTORY_ARTIFACT)
+        if path is None:
+            return None
+        return iter_rows(
+            self._row_table(path, ORDER_HISTORY_ROWS), ORDER_HISTORY_ROWS,
+            RowQuery(equals={'symbol': symbol, 'status': status}))
+
+    def scan_trade_rows(
+        self,
+        columns: List[str],
+        sweep_id: Optional[str] = None,
+        run_ids: Optional[List[str]] = None,
+        symbol: Optional[str] = None,
+        close_reason: Optional[str] = None,
+    ) -> pa.Table:
+        """
+        Selected trade-row columns across runs, as one dataset scan (e.g. the MAE / MFE
+        distribution of a sweep: columns=['run_id', 'mae_pnl', 'mfe_pnl'], sweep_id=...).
+
+        Args:
+            columns: Row-model columns to load; 'run_id' / 'owner' / 'group' name the run
+            sweep_id: Only runs of this parameter sweep (catalog metadata)
+            run_ids: Only these runs
+            symbol / close_reason: Row filters
+
+        Returns:
+            Arrow table of the matching rows of all selected runs
+        """
+        return self._scan_rows(
+            TRADE_HISTORY_ARTIFACT, TRADE_HISTORY_ROWS, columns, sweep_id, run_ids,
+            RowQuery(equals={'symbol': symbol, 'close_reason': close_reason}))
+
+    def scan_order_rows(
+        self,
+        columns: List[str],
+        sweep_id: Optional[str] = None,
+        run_ids: Optional[List[str]] = None,
+        symbol: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> pa.Table:
+        """
+        Selected order-row columns across runs, as one dataset scan.
+
+        Args:
+            columns: Row-model columns to load; 'run_id' / 'owner' / 'group' name the run
+            sweep_id: Only runs of this parameter sweep (catalog metadata)
+            run_ids: Only these runs
+            symbol / status: Row filters
+
+        Returns:
+            Arrow table of the matching rows of all selected runs
+        """
+        return self._scan_rows(
+            ORDER_HISTORY_ARTIFACT, ORDER_HISTORY_ROWS, columns, sweep_id, run_ids,
+            RowQuery(equals={'symbol': symbol, 'status': status}))
+
     def get_portfolio(self, run_id: str) -> Optional[PortfolioReport]:
         """
         Read a run's portfolio report.
 
         Args:
-            run_id: The run-timestamp directory name
+            run_id: The run reference (run id, or `<owner>/<run_id>` where runs share it)
 
         Returns:
             The portfolio report, or None if the run has no portfolio artifact
@@ -125,14 +345,14 @@ class ReportStore:
         path = self._resolve(run_id, PORTFOLIO_ARTIFACT)
         if path is None:
             return None
-        return read_portfolio_report(path)
+        return self._read(path, read_portfolio_report)
 
     def get_execution_stats(self, run_id: str) -> Optional[ExecutionStatsReport]:
         """
         Read a run's execution-stats report.
 
         Args:
-            run_id: The run-timestamp directory name
+            run_id: The run reference (run id, or `<owner>/<run_id>` where runs share it)
 
         Returns:
             The execution-stats report, or None if the run has no execution-stats artifact
@@ -140,14 +360,14 @@ class ReportStore:
         path = self._resolve(run_id, EXECUTION_STATS_ARTIFACT)
         if path is None:
             return None
-        return read_execution_stats_report(path)
+        return self._read(path, read_execution_stats_report)
 
     def get_pending_orders(self, run_id: str) -> Optional[PendingOrdersReport]:
         """
         Read a run's pending-orders report.
 
         Args:
-            run_id: The run-timestamp directory name
+            run_id: The run reference (run id, or `<owner>/<run_id>` where runs share it)
 
         Returns:
             The pending-orders report, or None if the run has no pending-orders artifact
@@ -155,14 +375,14 @@ class ReportStore:
         path = self._resolve(run_id, PENDING_ORDERS_ARTIFACT)
         if path is None:
             return None
-        return read_pending_orders_report(path)
+        return self._read(path, read_pending_orders_report)
 
     def get_scenario_details(self, run_id: str) -> Optional[ScenarioDetailsReport]:
         """
         Read a run's scenario-details report (sim-only).
 
         Args:
-            run_id: The run-timestamp directory name
+            run_id: The run reference (run id, or `<owner>/<run_id>` where runs share it)
 
         Returns:
             The scenario-details report, or None if the run has no scenario-details artifact
@@ -170,14 +390,14 @@ class ReportStore:
         path = self._resolve(run_id, SCENARIO_DETAILS_ARTIFACT)
         if path is None:
             return None
-        return read_scenario_details_report(path)
+        return self._read(path, read_scenario_details_report)
 
     def get_run_summary(self, run_id: str) -> Optional[RunSummary]:
         """
         Read a run's cross-section KPI summary.
 
         Args:
-            run_id: The run-timestamp directory name
+            run_id: The run reference (run id, or `<owner>/<run_id>` where runs share it)
 
         Returns:
             The run-summary report, or None if the run has no run-summary artifact
@@ -185,14 +405,14 @@ class ReportStore:
         path = self._resolve(run_id, RUN_SUMMARY_ARTIFACT)
         if path is None:
             return None
-        return read_run_summary(path)
+        return self._read(path, read_run_summary)
 
     def get_worker_decision(self, run_id: str) -> Optional[WorkerDecisionReport]:
         """
         Read a run's worker/decision report.
 
         Args:
-            run_id: The run-timestamp directory name
+            run_id: The run reference (run id, or `<owner>/<run_id>` where runs share it)
 
         Returns:
             The worker/decision report, or None if the run has no worker-decision artifact
@@ -200,14 +420,14 @@ class ReportStore:
         path = self._resolve(run_id, WORKER_DECISION_ARTIFACT)
         if path is None:
             return None
-        return read_worker_decision_report(path)
+        return self._read(path, read_worker_decision_report)
 
     def get_profiling(self, run_id: str) -> Optional[ProfilingReport]:
         """
         Read a run's profiling report (sim-only).
 
         Args:
-            run_id: The run-timestamp directory name
+            run_id: The run reference (run id, or `<owner>/<run_id>` where runs share it)
 
         Returns:
             The profiling report, or None if the run has no profiling artifact
@@ -215,14 +435,14 @@ class ReportStore:
         path = self._resolve(run_id, PROFILING_ARTIFACT)
         if path is None:
             return None
-        return read_profiling_report(path)
+        return self._read(path, read_profiling_report)
 
     def get_aggregated_portfolio(self, run_id: str) -> Optional[AggregatedPortfolioReport]:
         """
         Read a run's aggregated per-currency portfolio report (sim).
 
         Args:
-            run_id: The run-timestamp directory name
+            run_id: The run reference (run id, or `<owner>/<run_id>` where runs share it)
 
         Returns:
             The aggregated-portfolio report, or None if the run has no artifact
@@ -230,14 +450,14 @@ class ReportStore:
         path = self._resolve(run_id, AGGREGATED_PORTFOLIO_ARTIFACT)
         if path is None:
             return None
-        return read_aggregated_portfolio_report(path)
+        return self._read(path, read_aggregated_portfolio_report)
 
     def get_warnings_errors(self, run_id: str) -> Optional[WarningsErrorsReport]:
         """
         Read a run's warnings & errors report.
 
         Args:
-            run_id: The run-timestamp directory name
+            run_id: The run reference (run id, or `<owner>/<run_id>` where runs share it)
 
         Returns:
             The warnings/errors report, or None if the run has no artifact
@@ -245,14 +465,14 @@ class ReportStore:
         path = self._resolve(run_id, WARNINGS_ERRORS_ARTIFACT)
         if path is None:
             return None
-        return read_warnings_errors_report(path)
+        return self._read(path, read_warnings_errors_report)
 
     def get_broker(self, run_id: str) -> Optional[BrokerReport]:
         """
         Read a run's broker-configuration report (sim-only).
 
         Args:
-            run_id: The run-timestamp directory name
+            run_id: The run reference (run id, or `<owner>/<run_id>` where runs share it)
 
         Returns:
             The broker report, or None if the run has no broker artifact
@@ -260,14 +480,14 @@ class ReportStore:
         path = self._resolve(run_id, BROKER_ARTIFACT)
         if path is None:
             return None
-        return read_broker_report(path)
+        return self._read(path, read_broker_report)
 
     def get_signal(self, run_id: str) -> Optional[SignalReport]:
         """
         Read a run's signal-configuration report (#433).
 
         Args:
-            run_id: The run-timestamp directory name
+            run_id: The run reference (run id, or `<owner>/<run_id>` where runs share it)
 
         Returns:
             The signal report, or None if the run has no signal artifact
@@ -275,14 +495,14 @@ class ReportStore:
         path = self._resolve(run_id, SIGNAL_ARTIFACT)
         if path is None:
             return None
-        return read_signal_report(path)
+        return self._read(path, read_signal_report)
 
     def get_feed_stability(self, run_id: str) -> Optional[FeedStabilityReport]:
         """
         Read a run's feed-stability report (#451).
 
         Args:
-            run_id: The run-timestamp directory name
+            run_id: The run reference (run id, or `<owner>/<run_id>` where runs share it)
 
         Returns:
             The feed-stability report, or None if the run has no artifact
@@ -290,11 +510,63 @@ class ReportStore:
         path = self._resolve(run_id, FEED_STABILITY_ARTIFACT)
         if path is None:
             return None
-        return read_feed_stability_report(path)
+        return self._read(path, read_feed_stability_report)
+
+    @staticmethod
+    def _trade_query(
+        symbol: Optional[str],
+        close_reason: Optional[str],
+        start: Optional[datetime],
+        end: Optional[datetime],
+    ) -> RowQuery:
+        """The trade-history filter (see filter_trade_history_report) as a row query."""
+        return RowQuery(
+            equals={'symbol': symbol, 'close_reason': close_reason},
+            time_column='entry_time', start=start, end=end)
+
+    def _scan_rows(
+        self,
+        artifact: str,
+        spec: RowArtifactSpec,
+        columns: List[str],
+        sweep_id: Optional[str],
+        run_ids: Optional[List[str]],
+        query: RowQuery,
+    ) -> pa.Table:
+        """Row tables of the selected catalogued runs, scanned as one dataset."""
+        wanted = set(run_ids) if run_ids is not None else None
+        paths = []
+        for entry in self._catalog.entries():
+            if wanted is not None and entry.run_id not in wanted:
+                continue
+            if sweep_id is not None and entry.metadata.get('sweep_id') != sweep_id:
+                continue
+            path = self._resolve(entry.path, artifact)
+            if path is not None:
+                paths.append(self._row_table(path, spec))
+        return scan_row_tables(self._logs_root.absolute(), paths, columns, query)
+
+    @staticmethod
+    def _reader(path: Path, json_reader: Callable[[Path], T], rows_reader: Callable[[Path], T]) -> Callable[[Path], T]:
+        """The reader of a row-shaped artifact's resolved form (JSON document / row table)."""
+        return rows_reader if path.name.endswith(ROW_COPY_SUFFIX) else json_reader
+
+    @staticmethod
+    def _row_table(path: Path, spec: RowArtifactSpec) -> Path:
+        """The row table of a resolved row-shaped artifact (derived from a JSON-only run)."""
+        return path if path.name.endswith(ROW_COPY_SUFFIX) else ensure_row_copy(path, spec)
+
+    def _read(self, path: Path, reader: Callable[[Path], T]) -> T:
+        """Parse an artifact through the report cache (re-read only if the file changed)."""
+        return self._report_cache.read(path, reader)
 
     def _resolve(self, run_id: str, artifact: str) -> Optional[Path]:
-        """Find a named report artifact (in the run's io/ subfolder) across the log groups."""
-        for group in self._GROUPS:
-            for found in (self._logs_root / group).glob(f'*/{run_id}/{IO_SUBDIR}/{artifact}'):
-                return found
-        return None
+        """
+        Find a named report artifact (in the run's io/ subfolder) via the run catalog;
+        a row-shaped artifact without its JSON document resolves to its row table.
+        Raises AmbiguousRunIdError for a bare run id shared by several runs.
+        """
+        path = self._catalog.resolve(run_id, artifact)
+        if path is None and artifact in _ROW_TABLES:
+            path = self._catalog.resolve(run_id, _ROW_TABLES[artifact])
+        return path
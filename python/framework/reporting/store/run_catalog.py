@@ -0,0 +1,465 @@
+"""
+Run catalog — persistent index of the run directories under the logs tree.
+
+Lives at `<logs_root>/.run_catalog.jsonl`: an append-only log of JSON records, folded
+in order on load.
+
+    {"kind": "run", "run_id": …, "group": …, "owner": …, "artifacts": […], "finished_at": …, "metadata": {…}}
+    {"kind": "removed", "path": "<group>/<owner>/<run_id>", "run_id": …}
+    {"kind": "owner", "owner": "<group>/<owner>", "mtime_ns": …}
+
+Entries are keyed by their path below the logs root: run ids have second resolution, so
+runs of different owners can share one. A run reference is the bare run id, or — when
+that names several runs — its qualified form `<owner>/<run_id>` (`<group>/<owner>/<run_id>`).
+
+Maintenance:
+- Run finished: both report coordinators append a "run" record (record_run_in_catalog)
+- Missing catalog: rebuilt once from the logs tree
+- Runs written without a record (crash, copied-in logs): picked up incrementally — only
+  owner directories whose mtime changed since their last scan are listed again, and
+  scanned runs without artifacts yet have their io/ folder listed again only once its
+  mtime changed
+- Other processes' appends are read from the last applied byte offset
+
+The `ReportStore` lists and resolves runs from it instead of globbing the tree per call.
+"""
+
+import json
+import os
+import threading
+import time
+from dataclasses import asdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from python.framework.exceptions.run_catalog_errors import AmbiguousRunIdError
+from python.framework.logging.bootstrap_logger import get_global_logger
+from python.framework.types.api.report_types import RunSummary
+from python.framework.types.run_catalog_types import RunCatalogEntry
+from python.framework.types.run_results_types import RunProvenance
+vLog = get_global_logger()
+
+# Report artifacts (JSON + CSV) live in this subfolder of a run directory.
+IO_SUBDIR = 'io'
+
+# run dirs live at: <logs_root>/<group>/<set-or-profile>/<run_id>/
+RUN_GROUPS = ('scenario_sets', 'autotrader')
+
+CATALOG_FILE = '.run_catalog.jsonl'
+
+# Directory mtimes this close to "now" may still change within the same timestamp tick —
+# such owners (and unfinished runs) are not marked as scanned and are listed again on
+# the next refresh.
+_RACY_MTIME_NS = 2_000_000_000
+
+
+class RunCatalog:
+    """
+    Run directory → artifacts and headline metadata for one logs root.
+
+    Use RunCatalog.shared(logs_root): one instance per logs root and process, so
+    request-scoped ReportStores share the folded state.
+    """
+
+    _shared: Dict[Path, 'RunCatalog'] = {}
+    _shared_lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, logs_root: Path) -> 'RunCatalog':
+        """
+        The process-wide catalog of a logs root.
+
+        Args:
+            logs_root: Logs tree root
+
+        Returns:
+            The shared RunCatalog
+        """
+        key = Path(logs_root).absolute()
+        with cls._shared_lock:
+            catalog = cls._shared.get(key)
+            if catalog is None:
+                catalog = cls._shared[key] = cls(key)
+            return catalog
+
+    def __init__(self, logs_root: Path):
+        """
+        Args:
+            logs_root: Logs tree root
+        """
+        self._logs_root = Path(logs_root).absolute()
+        self._file = self._logs_root / CATALOG_FILE
+        self._lock = threading.RLock()
+
+        # '<group>/<owner>/<run_id>' → entry
+        self._entries: Dict[str, RunCatalogEntry] = {}
+        # '<group>/<owner>' → owner dir mtime_ns at its last complete scan
+        self._owner_mtimes: Dict[str, int] = {}
+        # '<group>/<owner>/<run_id>' → io/ (or run dir) mtime_ns at the last listing of an
+        # unfinished run; in-memory only
+        self._unfinished_mtimes: Dict[str, int] = {}
+        # Catalog file identity + bytes already applied
+        self._file_id: Optional[int] = None
+        self._offset = 0
+
+    # =========================================================================
+    # QUERIES
+    # =========================================================================
+
+    def entries(self) -> List[RunCatalogEntry]:
+        """
+        All catalogued runs, newest run id first.
+
+        Returns:
+            Catalog entries
+        """
+        with self._lock:
+            self.refresh()
+            return sorted(self._entries.values(),
+                          key=lambda e: (e.run_id, e.path), reverse=True)
+
+    def find(self, run_ref: str) -> List[RunCatalogEntry]:
+        """
+        Every run a reference matches.
+
+        Args:
+            run_ref: Run id, `<owner>/<run_id>` or `<group>/<owner>/<run_id>`
+
+        Returns:
+            The matching entries (more than one = an ambiguous bare run id)
+        """
+        with self._lock:
+            self.refresh()
+            return [entry for path, entry in sorted(self._entries.items())
+                    if path == run_ref or path.endswith(f'/{run_ref}')]
+
+    def get(self, run_ref: str) -> Optional[RunCatalogEntry]:
+        """
+        The entry of a run.
+
+        Args:
+            run_ref: Run id, `<owner>/<run_id>` or `<group>/<owner>/<run_id>`
+
+        Returns:
+            The entry, or None if the run is unknown
+
+        Raises:
+            AmbiguousRunIdError: The reference names more than one run
+        """
+        matches = self.find(run_ref)
+        if len(matches) > 1:
+            raise AmbiguousRunIdError(run_ref, [entry.path for entry in matches])
+        return matches[0] if matches else None
+
+    def reference(self, entry: RunCatalogEntry) -> str:
+        """
+        The shortest reference that names only this run (the run id unless it is shared).
+
+        Args:
+            entry: A catalogued run
+
+        Returns:
+            `<run_id>`, `<owner>/<run_id>` or `<group>/<owner>/<run_id>`
+        """
+        with self._lock:
+            for candidate in (entry.run_id, f'{entry.owner}/{entry.run_id}'):
+                if sum(1 for path in self._entries
+                       if path == candidate or path.endswith(f'/{candidate}')) == 1:
+                    return candidate
+            return entry.path
+
+    def resolve(self, run_ref: str, artifact: str) -> Optional[Path]:
+        """
+        Path of a named report artifact of a run (in its io/ subfolder).
+
+        Args:
+            run_ref: Run id, `<owner>/<run_id>` or `<group>/<owner>/<run_id>`
+            artifact: Artifact file name
+
+        Returns:
+            The existing artifact path, or None
+
+        Raises:
+            AmbiguousRunIdError: The reference names more than one run
+        """
+        entry = self.get(run_ref)
+        if entry is None:
+            return None
+        path = self._logs_root / entry.path / IO_SUBDIR / artifact
+        return path if path.is_file() else None
+
+    # =========================================================================
+    # UPDATES
+    # =========================================================================
+
+    def record_run(self, run_dir: Path, metadata: Optional[Dict[str, Any]] = None) -> Optional[RunCatalogEntry]:
+        """
+        Append a finished run (artifacts as currently present in its io/ folder).
+
+        Args:
+            run_dir: The run directory (<logs_root>/<group>/<owner>/<run_id>)
+            metadata: Headline fields stored with the entry
+
+        Returns:
+            The recorded entry, or None if run_dir is not a run directory of this root
+        """
+        entry = self._entry_for(Path(run_dir))
+        if entry is None:
+            return None
+        entry.finished_at = datetime.now(timezone.utc).isoformat()
+        entry.metadata = dict(metadata or {})
+
+        with self._lock:
+            if not self._file.exists():
+                self.rebuild()
+            # The offset is not advanced: the record is re-read (idempotently) together
+            # with any record another process appended in the meantime.
+            self._append([self._run_record(entry)])
+            self._entries[entry.path] = entry
+        return entry
+
+    def refresh(self) -> None:
+        """Apply records appended since the last read and scan owner dirs that changed."""
+        with self._lock:
+            if not self._logs_root.is_dir():
+                self._entries = {}
+                return
+            if not self._file.exists():
+                self.rebuild()
+                return
+            self._read_appended()
+
+            records = []
+            owners = set()
+            for group_dir, owner_dir in self._owner_dirs():
+                key = f'{group_dir.name}/{owner_dir.name}'
+                owners.add(key)
+                mtime = owner_dir.stat().st_mtime_ns
+                if self._owner_mtimes.get(key) != mtime:
+                    records += self._scan_owner(group_dir.name, owner_dir, mtime)
+            records += self._drop_vanished_owners(owners)
+            records += self._relist_unfinished()
+            if records:
+                self._append(records)
+
+    def rebuild(self) -> None:
+        """Scan the whole logs tree and write a fresh catalog (finished runs keep no timestamp)."""
+        start = time.time()
+        with self._lock:
+            self._entries = {}
+            self._owner_mtimes = {}
+            records = []
+            for group_dir, owner_dir in self._owner_dirs():
+                records += self._scan_owner(
+                    group_dir.name, owner_dir, owner_dir.stat().st_mtime_ns)
+
+            tmp_file = self._file.with_name(
+                f'{self._file.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+            tmp_file.write_text(''.join(json.dumps(r) + '\n' for r in records))
+            os.replace(tmp_file, self._file)
+            stat = self._file.stat()
+            self._file_id = stat.st_ino
+            self._offset = stat.st_size
+        vLog.debug(
+            f"Run catalog built: {len(self._entries)} runs in {time.time() - start:.2f}s")
+
+    # =========================================================================
+    # INTERNALS
+    # =========================================================================
+
+    def _read_appended(self) -> None:
+        """Fold the complete records appended since the last read (reset if the file was replaced)."""
+        stat = self._file.stat()
+        if stat.st_ino != self._file_id or stat.st_size < self._offset:
+            self._entries = {}
+            self._owner_mtimes = {}
+            self._file_id = stat.st_ino
+            self._offset = 0
+        if stat.st_size == self._offset:
+            return
+
+        with self._file.open('rb') as handle:
+            handle.seek(self._offset)
+            data = handle.read(stat.st_size - self._offset)
+        # A concurrent writer may be mid-line: apply complete lines only
+        complete = data[:data.rfind(b'\n') + 1]
+        self._offset += len(complete)
+        for line in complete.splitlines():
+            if line.strip():
+                self._apply(json.loads(line))
+
+    def _apply(self, record: Dict) -> None:
+        kind = record.get('kind')
+        if kind == 'run':
+            fields = {k: v for k, v in record.items() if k != 'kind'}
+            entry = RunCatalogEntry(**fields)
+            self._entries[entry.path] = entry
+        elif kind == 'removed':
+            if 'path' in record:
+                self._entries.pop(record['path'], None)
+            else:
+                # Records of catalogs keyed by run id alone
+                for path in [p for p, e in self._entries.items() if e.run_id == record['run_id']]:
+                    del self._entries[path]
+        elif kind == 'owner':
+            self._owner_mtimes[record['owner']] = record['mtime_ns']
+
+    def _append(self, records: List[Dict]) -> None:
+        """Append records in one write (O_APPEND keeps concurrent writers' lines whole)."""
+        with self._file.open('a') as handle:
+            handle.write(''.join(json.dumps(r) + '\n' for r in records))
+
+    def _owner_dirs(self):
+        for group in RUN_GROUPS:
+            group_dir = self._logs_root / group
+            if not group_dir.is_dir():
+                continue
+            for owner_dir in sorted(group_dir.iterdir()):
+                if owner_dir.is_dir():
+                    yield group_dir, owner_dir
+
+    def _scan_owner(self, group: str, owner_dir: Path, mtime: int) -> List[Dict]:
+        """List one owner dir: add unknown runs, drop vanished ones. Returns the records."""
+        key = f'{group}/{owner_dir.name}'
+        records = []
+        present = set()
+        for run_dir in sorted(owner_dir.iterdir()):
+            if not run_dir.is_dir():
+                continue
+            path = f'{key}/{run_dir.name}'
+            present.add(path)
+            if path in self._entries:
+                continue
+            entry = self._entry_for(run_dir)
+            self._entries[path] = entry
+            records.append(self._run_record(entry))
+
+        for entry in [e for e in self._entries.values()
+                      if f'{e.group}/{e.owner}' == key and e.path not in present]:
+            del self._entries[entry.path]
+            records.append(self._removed_record(entry))
+
+        if time.time_ns() - mtime > _RACY_MTIME_NS:
+            self._owner_mtimes[key] = mtime
+            records.append({'kind': 'owner', 'owner': key, 'mtime_ns': mtime})
+        return records
+
+    def _drop_vanished_owners(self, owners: set) -> List[Dict]:
+        """Remove runs of owner dirs that no longer exist."""
+        records = []
+        for entry in list(self._entries.values()):
+            if f'{entry.group}/{entry.owner}' not in owners:
+                del self._entries[entry.path]
+                records.append(self._removed_record(entry))
+        return records
+
+    def _relist_unfinished(self) -> List[Dict]:
+        """
+        Update the artifacts of scanned runs that had none yet (still running, or crashed).
+
+        The coordinators write a run's artifacts at its end, so a scanned run that already
+        carries artifacts is complete. A run is listed again only when its io/ folder (its
+        run dir while io/ does not exist) changed since the last listing — an idle refresh
+        costs one stat per unfinished run.
+        """
+        records = []
+        listed = {}
+        for entry in list(self._entries.values()):
+            if entry.finished_at is not None or entry.artifacts:
+                continue
+            run_dir = self._logs_root / entry.path
+            mtime = _unfinished_mtime(run_dir)
+            if mtime is not None and self._unfinished_mtimes.get(entry.path) == mtime:
+                listed[entry.path] = mtime
+                continue
+            if mtime is not None and time.time_ns() - mtime > _RACY_MTIME_NS:
+                listed[entry.path] = mtime
+            artifacts = _list_artifacts(run_dir)
+            if artifacts != entry.artifacts:
+                entry.artifacts = artifacts
+                records.append(self._run_record(entry))
+        # Finished or removed runs drop out
+        self._unfinished_mtimes = listed
+        return records
+
+    def _entry_for(self, run_dir: Path) -> Optional[RunCatalogEntry]:
+        """A fresh (unfinished) entry for a run dir of this root, or None."""
+        try:
+            parts = run_dir.absolute().relative_to(self._logs_root).parts
+        except ValueError:
+            return None
+        if len(parts) != 3 or parts[0] not in RUN_GROUPS:
+            return None
+        return RunCatalogEntry(
+            run_id=parts[2], group=parts[0], owner=parts[1],
+            artifacts=_list_artifacts(run_dir))
+
+    @staticmethod
+    def _run_record(entry: RunCatalogEntry) -> Dict:
+        return {'kind': 'run', **asdict(entry)}
+
+    @staticmethod
+    def _removed_record(entry: RunCatalogEntry) -> Dict:
+        return {'kind': 'removed', 'path': entry.path, 'run_id': entry.run_id}
+
+
+def record_run_in_catalog(
+    run_dir: Path,
+    run_summary: Optional[RunSummary] = None,
+    provenance: Optional[RunProvenance] = None,
+    pipeline: str = '',
+) -> None:
+    """
+    Record a finished run in the catalog of its logs root.
+
+    The shared tail both report coordinators call after writing their artifacts. A run
+    directory outside the `<logs_root>/<group>/<owner>/<run_id>` layout is skipped; a
+    failing write only warns (the catalog is rebuildable from the tree).
+
+    Args:
+        run_dir: The run directory
+        run_summary: The run's KPI summary (unit count)
+        provenance: The run's provenance (status, scenario set, sweep tag)
+        pipeline: 'simulation' | 'autotrader'
+    """
+    run_dir = Path(run_dir)
+    if len(run_dir.parts) < 4 or run_dir.parent.parent.name not in RUN_GROUPS:
+        return
+
+    metadata: Dict[str, Any] = {'pipeline': pipeline}
+    if run_summary is not None:
+        metadata['unit_count'] = run_summary.unit_count
+    if provenance is not None:
+        metadata.update({
+            'status': provenance.status,
+            'scenario_set_name': provenance.scenario_set_name,
+            'decision_logic_type': provenance.decision_logic_type,
+            'symbols': list(provenance.symbols),
+            'sweep_id': provenance.sweep_id,
+        })
+    try:
+        RunCatalog.shared(run_dir.parents[2]).record_run(run_dir, metadata)
+    except OSError as e:
+        vLog.warning(f"Run catalog not updated for {run_dir.name}: {e}")
+
+
+def _unfinished_mtime(run_dir: Path) -> Optional[int]:
+    """mtime_ns of a run's io/ folder, of the run dir while io/ does not exist, or None."""
+    for directory in (Path(run_dir) / IO_SUBDIR, Path(run_dir)):
+        try:
+            return directory.stat().st_mtime_ns
+        except OSError:
+            continue
+    return None
+
+
+def _list_artifacts(run_dir: Path) -> List[str]:
+    """Sorted file names of a run's io/ subfolder (no temp files)."""
+    io_dir = Path(run_dir) / IO_SUBDIR
+    try:
+        return sorted(
+            entry.name for entry in os.scandir(io_dir)
+            if entry.is_file() and not entry.name.endswith('.tmp'))
+    except OSError:
+        return []
@@ -44,7 +44,8 @@ def build_run_provenance(
         run_dir: The run's directory (its name is the run_id)
         sweep_context: Optional sweep tagging when run as a sweep combination
         warnings_errors_report: The run's warnings/errors report — its canonical outcome decides
-            the ledger status/error (a total failure → 'error'); None → 'ok'
+            the ledger status/error (a total failure → 'error'); None → 'ok'. A run whose tick
+            loop was stopped by the sweep prune rule is 'pruned' (its partial KPIs are kept)
 
     Returns:
         The provenance bundle, or None if the batch has no scenarios
@@ -65,6 +66,8 @@ def build_run_provenance(
     decision_version, worker_versions = _resolve_versions(strategy_config)
     git = get_git_info()
     status, error = _run_status(warnings_errors_report)
+    if status == 'ok':
+        status, error = _prune_status(batch_execution_summary)
 
     return RunProvenance(
         param_hash=param_hash,
@@ -86,6 +89,7 @@ def build_run_provenance(
         sweep_params=sweep_context.sweep_params if sweep_context else None,
         sweep_objective=sweep_context.objective if sweep_context else None,
         sweep_maximize=sweep_context.maximize if sweep_context else None,
+        sweep_rung=sweep_context.rung if sweep_context else None,
     )
 
 
@@ -162,6 +166,19 @@ def _run_status(report: Optional[WarningsErrorsReport]) -> Tuple[str, Optional[s
         outcome.first_failure_error or 'run produced no usable data')
 
 
+def _prune_status(summary: BatchExecutionSummary) -> Tuple[str, Optional[str]]:
+    """
+    ('pruned', reason) if the sweep prune rule stopped any scenario's tick loop, else ('ok', None).
+
+    A pruned run still produced usable (partial) KPIs — recorded, but never ranked.
+    """
+    reasons = [f"{result.scenario_name}: {result.tick_loop_results.pruned_reason}"
+               for result in summary.process_result_list or []
+               if result.tick_loop_results is not None
+               and result.tick_loop_results.pruned_reason]
+    return ('pruned', '; '.join(reasons)) if reasons else ('ok', None)
+
+
 def _resolve_versions(strategy_config: Dict) -> Tuple[str, Dict[str, str]]:
     """Resolve decision + worker ComponentMetadata versions from the type strings (best-effort)."""
     logger = get_global_logger()
@@ -8,25 +8,42 @@ directory back as a single logical table. All identity (param_hash, sweep_id,
 scenario_set_name, …) is COLUMNS, never folder structure — the free-text config name
 never becomes load-bearing layout.
 
+`compact()` merges the loose fragments into one file per partition
+(`sweep_id=<id>/part.parquet` for sweep rows, `scenario_set=<name>/part.parquet` for
+the rest). The partition directories are a physical read optimization only — the
+values stay in their columns, and a filtered read skips the partitions that cannot
+match. A value that is not one plain path segment (a '/' in a scenario set name, an
+over-long name) becomes a readable slug plus a hash of the value in the directory
+name. Reads go through the process-level RunResultsView, which only opens files
+that are new since the previous read.
+
+`read_frame()` is the analysis read: typed columns with the `sweep_params` JSON parsed
+into one column per swept parameter, cached per ledger snapshot — ranking a large ledger
+needs no RunResultRow per row.
+
 Row grain: one per (run × account currency) = a RunSummary currency row + the run's
 provenance. The logical leading key for ranking is `param_hash`; filter by any column.
 """
 
+import hashlib
 import json
 import math
+import os
+import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import pandas as pd
 
 from python.configuration.app_config_manager import AppConfigManager
+from python.framework.reporting.store.run_results_view import RunResultsView
 from python.framework.types.api.report_types import RunResultRow, RunSummary
 from python.framework.types.run_results_types import RunProvenance
 
 # Fixed column order — kept stable so fragments stay schema-compatible across runs.
 LEDGER_COLUMNS: List[str] = [
     'param_hash', 'status', 'error', 'run_id', 'run_timestamp', 'sweep_id', 'sweep_params',
-    'sweep_objective', 'sweep_maximize',
+    'sweep_objective', 'sweep_maximize', 'sweep_rung',
     'scenario_set_name', 'git_commit', 'git_branch', 'git_dirty',
     'decision_logic_type', 'decision_version', 'worker_versions',
     'config_snapshot', 'symbols', 'data_broker_type', 'currency',
@@ -37,16 +54,38 @@ LEDGER_COLUMNS: List[str] = [
     'signal_fresh_ratio',
 ]
 
+# Compacted partition directories: '<prefix><value>/' holding one PARTITION_FILE
+SWEEP_PARTITION_PREFIX = 'sweep_id='
+SCENARIO_SET_PARTITION_PREFIX = 'scenario_set='
+PARTITION_FILE = 'part.parquet'
+
+# Longest partition value used verbatim as a directory name (longer → slug + hash)
+_PARTITION_VALUE_MAX = 100
+
+# One run's rows are identified by these columns (a fragment = one run)
+_RUN_KEY = ['scenario_set_name', 'run_id', 'currency']
+
+# read_frame(): one column per swept parameter — '<prefix><dotted path>' → the level as string
+SWEEP_PARAM_COLUMN_PREFIX = 'sweep_params.'
+
+# RunResultRow field type → analysis-frame column dtype (nullable fields keep their gaps)
+_COLUMN_DTYPES = {
+    str: object, float: 'float64', int: 'int64', bool: bool,
+    float | None: 'float64', int | None: 'Int64', bool | None: 'boolean',
+}
+
 
 class RunResultsLedger:
     """Append-per-run + read-all over the persistent run-results parquet dataset."""
 
-    def __init__(self, ledger_dir: Path):
+    def __init__(self, ledger_dir: Path, view: Optional[RunResultsView] = None):
         """
         Args:
             ledger_dir: Directory holding the per-run parquet fragments
+            view: Cached view to read through (None = the process-wide view of ledger_dir)
         """
         self._dir = Path(ledger_dir)
+        self._view = view if view is not None else RunResultsView.shared(self._dir)
 
     def append(self, run_summary: RunSummary, provenance: RunProvenance) -> Path:
         """
@@ -56,7 +95,9 @@ class RunResultsLedger:
         (`provenance.status == 'error'`, or no usable currencies) writes ONE `status='error'`
         row instead — it is recorded (provenance + sweep tag intact) but carries no KPIs, so the
         operator sees which combination failed and the analysis can exclude it. Never silently
-        absent. The status/error are decided upstream from the canonical run outcome
+        absent. A run stopped by the sweep prune rule (`provenance.status == 'pruned'`) writes
+        its partial KPIs as usual, tagged `status='pruned'` with the prune reason. The
+        status/error are decided upstream from the canonical run outcome
         (`build_run_provenance`), not here.
 
         Args:
@@ -74,7 +115,8 @@ class RunResultsLedger:
         self._dir.mkdir(parents=True, exist_ok=True)
         # Fragment name unique per run: scenario_set_name is sweep-tagged per combination,
         # so combos that finish in the same wall-clock second never overwrite each other.
-        path = self._dir / f'{provenance.scenario_set_name}_{provenance.run_id}.parquet'
+        stem = _partition_value(f'{provenance.scenario_set_name}_{provenance.run_id}')
+        path = self._dir / f'{stem}.parquet'
         pd.DataFrame(rows, columns=LEDGER_COLUMNS).to_parquet(path, index=False)
         return path
 
@@ -86,6 +128,9 @@ class RunResultsLedger:
         """
         Read the whole ledger as one table, optionally filtered.
 
+        A filter also prunes the compacted partitions that cannot match; loose fragments are
+        always read. Only files new since the previous read of this process are opened.
+
         Args:
             sweep_id: Keep only rows of this sweep
             scenario_set_name: Keep only rows of this scenario set
@@ -93,20 +138,33 @@ class RunResultsLedger:
         Returns:
             DataFrame of ledger rows (empty if the ledger does not exist yet)
         """
-        files = sorted(self._dir.glob('*.parquet')) if self._dir.exists() else []
-        if not files:
-            return pd.DataFrame(columns=LEDGER_COLUMNS)
-        # Read each fragment with its OWN schema, then union — fragments written before a column
-        # was added (schema evolution) simply lack it. Reading the directory in one shot would
-        # collapse to a common schema and silently drop the newer columns. reindex pins the
-        # canonical column set (missing → NaN, handled by _to_row; extra/renamed → dropped).
-        df = pd.concat([pd.read_parquet(f) for f in files], ignore_index=True)
-        df = df.reindex(columns=LEDGER_COLUMNS)
-        if sweep_id is not None:
-            df = df[df['sweep_id'] == sweep_id]
-        if scenario_set_name is not None:
-            df = df[df['scenario_set_name'] == scenario_set_name]
-        return df.reset_index(drop=True)
+        return _combine(self._view.read(self._partitions_for(sweep_id, scenario_set_name)),
+                        sweep_id, scenario_set_name)
+
+    def read_frame(
+        self,
+        sweep_id: Optional[str] = None,
+        scenario_set_name: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        Read the ledger as an analysis frame — the DataFrame form of read_rows().
+
+        Missing cells carry the RunResultRow defaults (typed KPI columns), and every swept
+        parameter gets its own `SWEEP_PARAM_COLUMN_PREFIX + <dotted path>` column holding the
+        level as string (None where the row did not sweep it). Cached per ledger snapshot: a
+        repeated read with no new or changed file returns the same frame.
+
+        Args:
+            sweep_id: Keep only rows of this sweep
+            scenario_set_name: Keep only rows of this scenario set
+
+        Returns:
+            The analysis frame (shared — treat as read-only)
+        """
+        return self._view.read_derived(
+            self._partitions_for(sweep_id, scenario_set_name),
+            ('analysis_frame', sweep_id, scenario_set_name),
+            lambda frames: _analysis_frame(_combine(frames, sweep_id, scenario_set_name)))
 
     def read_rows(
         self,
@@ -123,8 +181,95 @@ class RunResultsLedger:
         Returns:
             Typed ledger rows — what the optimization analysis + the API consume
         """
+        return self.to_rows(self.read(sweep_id, scenario_set_name))
+
+    def to_rows(self, frame: pd.DataFrame) -> List[RunResultRow]:
+        """
+        Typed rows for (a slice of) a read() / read_frame() table.
+
+        Args:
+            frame: Ledger rows (extra columns, e.g. the parsed parameter columns, are ignored)
+
+        Returns:
+            One RunResultRow per frame row, in frame order
+        """
         return [self._to_row(record)
-                for record in self.read(sweep_id, scenario_set_name).to_dict('records')]
+                for record in frame.reindex(columns=LEDGER_COLUMNS).to_dict('records')]
+
+    def compact(self) -> Dict[str, int]:
+        """
+        Merge the loose per-run fragments into their partition files.
+
+        Sweep rows go to `sweep_id=<id>/part.parquet`, all others to
+        `scenario_set=<name>/part.parquet`. An existing partition file is merged with the new
+        fragments and replaced atomically; the merged fragments are deleted afterwards.
+        Fragments appended while compacting stay loose for the next compaction. A run that is
+        both in a partition file and still loose (interrupted compaction) is deduplicated by
+        the next compaction.
+
+        Returns:
+            Partition directory name → rows written to it (empty if nothing was loose)
+        """
+        fragments = sorted(self._dir.glob('*.parquet')) if self._dir.exists() else []
+        if not fragments:
+            return {}
+
+        by_partition: Dict[str, List[pd.DataFrame]] = {}
+        for path in fragments:
+            df = pd.read_parquet(path)
+            keys = df.reindex(columns=['sweep_id', 'scenario_set_name']).itertuples(index=False)
+            partitions = pd.Series([_partition_name(k) for k in keys], index=df.index)
+            for partition, rows in df.groupby(partitions, sort=False):
+                by_partition.setdefault(partition, []).append(rows)
+
+        written: Dict[str, int] = {}
+        for partition, frames in by_partition.items():
+            target = self._dir / partition / PARTITION_FILE
+            target.parent.mkdir(parents=True, exist_ok=True)
+            if target.exists():
+                frames = [pd.read_parquet(target)] + frames
+            # Union of all schemas, canonical columns first; a re-merged run keeps its latest rows
+            merged = pd.concat(frames, ignore_index=True)
+            merged = merged.reindex(columns=LEDGER_COLUMNS + [
+                c for c in merged.columns if c not in LEDGER_COLUMNS])
+            merged = merged.drop_duplicates(subset=_RUN_KEY, keep='last')
+            tmp = target.with_name(f'.{PARTITION_FILE}.{os.getpid()}.tmp')
+            merged.to_parquet(tmp, index=False)
+            os.replace(tmp, target)
+            written[partition] = len(merged)
+
+        for path in fragments:
+            path.unlink(missing_ok=True)
+        return written
+
+    def _partitions_for(
+        self,
+        sweep_id: Optional[str],
+        scenario_set_name: Optional[str],
+    ) -> List[Path]:
+        """
+        The directories a filtered read has to open: the compacted partitions that can hold
+        matching rows plus the loose fragments (always — they are not partitioned yet). Loose
+        fragments come last: they are the newer copy of a run that is in both.
+        """
+        if not self._dir.exists():
+            return []
+        if sweep_id is not None:
+            return [self._dir / _partition_name((sweep_id, None)), self._dir]
+        dirs = []
+        with os.scandir(self._dir) as it:
+            for entry in sorted(it, key=lambda e: e.name):
+                if not entry.is_dir():
+                    continue
+                if entry.name.startswith(SWEEP_PARTITION_PREFIX):
+                    # Sweep partitions hold the sweep-tagged scenario sets — not prunable by set name
+                    dirs.append(Path(entry.path))
+                elif entry.name.startswith(SCENARIO_SET_PARTITION_PREFIX):
+                    if (scenario_set_name is None
+                            or entry.name == _partition_name((None, scenario_set_name))):
+                        dirs.append(Path(entry.path))
+        dirs.append(self._dir)
+        return dirs
 
     def _to_row(self, record: Dict[str, Any]) -> RunResultRow:
         """Build a typed RunResultRow from a raw parquet record (parse the JSON columns)."""
@@ -150,6 +295,7 @@ class RunResultsLedger:
             'sweep_params': json.dumps(p.sweep_params, sort_keys=True) if p.sweep_params else None,
             'sweep_objective': p.sweep_objective,
             'sweep_maximize': p.sweep_maximize,
+            'sweep_rung': p.sweep_rung,
             'scenario_set_name': p.scenario_set_name,
             'git_commit': p.git_commit,
             'git_branch': p.git_branch,
@@ -163,11 +309,11 @@ class RunResultsLedger:
         }
 
     def _row(self, p: RunProvenance, currency, run_summary: RunSummary) -> Dict[str, Any]:
-        """An ok row: provenance + one currency's KPIs (+ run-global order counts)."""
+        """An ok / pruned row: provenance + one currency's KPIs (+ run-global order counts)."""
         return {
             **self._provenance_fields(p),
-            'status': 'ok',
-            'error': None,
+            'status': p.status,
+            'error': p.error,
             'currency': currency.currency,
             'net_pnl': currency.net_pnl,
             'expectancy': currency.expectancy,
@@ -223,9 +369,78 @@ def append_run_to_ledger(
     ledger.append(run_summary, provenance)
 
 
+def _combine(
+    frames: List[pd.DataFrame],
+    sweep_id: Optional[str],
+    scenario_set_name: Optional[str],
+) -> pd.DataFrame:
+    """The view's partition frames as one canonical, filtered ledger table."""
+    if not frames:
+        return pd.DataFrame(columns=LEDGER_COLUMNS)
+    # Every fragment was read with its OWN schema and unioned — fragments written before a
+    # column was added (schema evolution) simply lack it. Reading the directory in one shot
+    # would collapse to a common schema and silently drop the newer columns. reindex pins the
+    # canonical column set (missing → NaN, handled by _to_row; extra/renamed → dropped).
+    df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+    df = df.reindex(columns=LEDGER_COLUMNS)
+    # compact() replaces a partition file before it deletes the merged fragments — a read in
+    # between (or after a compaction interrupted there) sees those runs twice
+    df = df.drop_duplicates(subset=_RUN_KEY, keep='last')
+    if sweep_id is not None:
+        df = df[df['sweep_id'] == sweep_id]
+    if scenario_set_name is not None:
+        df = df[df['scenario_set_name'] == scenario_set_name]
+    return df.reset_index(drop=True)
+
+
+def _analysis_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Type a ledger table for analysis: RunResultRow defaults for missing cells + one column
+    per swept parameter (each distinct sweep_params JSON is parsed once).
+    """
+    df = df.copy()
+    for name, field in RunResultRow.model_fields.items():
+        dtype = _COLUMN_DTYPES.get(field.annotation)
+        if dtype is None:
+            continue
+        column = df[name] if field.default is None else df[name].fillna(field.default)
+        df[name] = column.astype(dtype)
+
+    texts = df['sweep_params']
+    parsed = {text: json.loads(text) for text in texts.dropna().unique() if text != ''}
+    params: Dict[str, None] = {}     # first-seen order
+    for combo in parsed.values():
+        params.update(dict.fromkeys(combo))
+    for param in params:
+        levels = {text: str(combo[param]) for text, combo in parsed.items() if param in combo}
+        df[f'{SWEEP_PARAM_COLUMN_PREFIX}{param}'] = texts.map(levels).astype(object)
+    return df
+
+
+def _partition_name(key: Tuple[Any, Any]) -> str:
+    """Partition directory of a (sweep_id, scenario_set_name) row."""
+    sweep_id, scenario_set_name = (_none_if_missing(v) for v in key)
+    if sweep_id:
+        return f'{SWEEP_PARTITION_PREFIX}{_partition_value(sweep_id)}'
+    return f'{SCENARIO_SET_PARTITION_PREFIX}{_partition_value(scenario_set_name)}'
+
+
+def _partition_value(value: Any) -> str:
+    """
+    Directory-safe form of a partition value: the value itself when it is one plain path
+    segment, otherwise a readable slug + a hash of the value (the value stays in its column).
+    """
+    text = str(value)
+    if (text not in ('', '.', '..') and len(text) <= _PARTITION_VALUE_MAX
+            and not any(char in text for char in '/\\\0')):
+        return text
+    slug = re.sub(r'[^A-Za-z0-9._-]+', '_', text)[:40].strip('._')
+    return f"{slug}~{hashlib.sha1(text.encode('utf-8')).hexdigest()[:12]}"
+
+
 def _none_if_missing(value: Any) -> Any:
-    """Normalize a raw parquet cell: pandas NaN → None, numpy scalar → Python native."""
-    if value is None:
+    """Normalize a raw parquet cell: pandas NaN / NA → None, numpy scalar → Python native."""
+    if value is None or value is pd.NA:
         return None
     if isinstance(value, float) and math.isnan(value):
         return None
@@ -0,0 +1,156 @@
+"""
+Run results view — process-level incremental cache of the run-results ledger's parquet files.
+
+Ranking, the sweep list and the sweep report all read the ledger; re-opening every
+fragment per call made them scale with the number of runs ever recorded. The view keeps
+each ledger partition (the loose fragment directory, or one compacted partition
+directory) read into memory together with the file states it was built from
+(name → (mtime_ns, size)). A later read lists the partition directory and reads only
+the files that are new since the last read; a changed or vanished file (e.g. after a
+compaction) rebuilds that one partition.
+
+Values derived from a set of partitions (the parsed analysis frame) are cached the same way:
+`read_derived` rebuilds them only when one of their partitions changed.
+
+Returned frames are shared between callers and must be treated as read-only.
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+import pandas as pd
+
+# File name → (mtime_ns, size)
+FileStates = Dict[str, Tuple[int, int]]
+
+
+class RunResultsView:
+    """
+    Cached ledger partitions of one ledger directory, refreshed incrementally.
+
+    Use RunResultsView.shared(ledger_dir): one instance per ledger directory and process.
+    """
+
+    _shared: Dict[Path, 'RunResultsView'] = {}
+    _shared_lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, ledger_dir: Path) -> 'RunResultsView':
+        """
+        The process-wide view of a ledger directory.
+
+        Args:
+            ledger_dir: Ledger root directory
+
+        Returns:
+            The shared RunResultsView
+        """
+        key = Path(ledger_dir).absolute()
+        with cls._shared_lock:
+            view = cls._shared.get(key)
+            if view is None:
+                view = cls._shared[key] = cls()
+            return view
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Partition directory → (file states it was built from, concatenated frame)
+        self._partitions: Dict[Path, Tuple[FileStates, Optional[pd.DataFrame]]] = {}
+        # Derived-value key → (the partition frames it was built from, value)
+        self._derived: Dict[Hashable, Tuple[List[pd.DataFrame], Any]] = {}
+
+    def read(self, partition_dirs: List[Path]) -> List[pd.DataFrame]:
+        """
+        The current content of the given partition directories.
+
+        Args:
+            partition_dirs: Directories whose `*.parquet` files (non-recursive) to read
+
+        Returns:
+            One frame per non-empty partition, each with its files' own (union) columns
+        """
+        with self._lock:
+            return self._collect(partition_dirs)
+
+    def read_derived(
+        self,
+        partition_dirs: List[Path],
+        key: Hashable,
+        build: Callable[[List[pd.DataFrame]], Any],
+    ) -> Any:
+        """
+        A value computed from the given partitions, cached per ledger snapshot.
+
+        The cached value is reused while every partition frame is still the one it was built
+        from (an unchanged partition keeps its frame object; new files replace it).
+
+        Args:
+            partition_dirs: Directories the value is computed from
+            key: Cache key (must identify build + partition_dirs)
+            build: Computes the value from the partitions' frames (as returned by read)
+
+        Returns:
+            The (possibly cached) value — shared, treat as read-only
+        """
+        with self._lock:
+            frames = self._collect(partition_dirs)
+            cached = self._derived.get(key)
+            if cached is not None and len(cached[0]) == len(frames) and all(
+                    a is b for a, b in zip(cached[0], frames)):
+                return cached[1]
+            value = build(frames)
+            self._derived[key] = (frames, value)
+            return value
+
+    def clear(self) -> None:
+        """Drop all cached partitions and derived values."""
+        with self._lock:
+            self._partitions.clear()
+            self._derived.clear()
+
+    def _collect(self, partition_dirs: List[Path]) -> List[pd.DataFrame]:
+        """Refresh the given partitions (lock held) → their non-empty frames."""
+        frames = []
+        for directory in partition_dirs:
+            frame = self._refresh(Path(directory))
+            if frame is not None:
+                frames.append(frame)
+        return frames
+
+    def _refresh(self, directory: Path) -> Optional[pd.DataFrame]:
+        """Bring one partition up to date with its directory; read only what is new."""
+        current = _list_parquet(directory)
+        cached_states, frame = self._partitions.get(directory, ({}, None))
+
+        stale = any(current.get(name) != state for name, state in cached_states.items())
+        if stale:
+            cached_states, frame = {}, None
+        added = sorted(name for name in current if name not in cached_states)
+        if added:
+            # Each file with its OWN schema, then union — see RunResultsLedger.read
+            parts = ([frame] if frame is not None else []) + [
+                pd.read_parquet(directory / name) for name in added]
+            frame = pd.concat(parts, ignore_index=True)
+
+        if current:
+            self._partitions[directory] = (current, frame)
+        else:
+            self._partitions.pop(directory, None)
+            frame = None
+        return frame
+
+
+def _list_parquet(directory: Path) -> FileStates:
+    """The `*.parquet` files directly in a directory with their (mtime_ns, size)."""
+    states: FileStates = {}
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.name.endswith('.parquet') and entry.is_file():
+                    stat = entry.stat()
+                    states[entry.name] = (stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
+        pass
+    return states
@@ -133,6 +133,7 @@ class PortfolioManager:
         self._total_loss = 0.0
         self._max_drawdown = 0.0
         self._max_equity = self.balance
+        self._min_equity = self.balance
 
         # Current market state (lazy evaluation)
         self._current_tick: Optional[TickData] = None
@@ -1132,6 +1133,8 @@ class PortfolioManager:
         equity = self._calculate_equity()
         if equity > self._max_equity:
             self._max_equity = equity
+        if equity < self._min_equity:
+            self._min_equity = equity
 
         # Update max drawdown
         drawdown = self._max_equity - equity
@@ -1187,6 +1190,7 @@ class PortfolioManager:
             spot_mode=self._spot_mode,
             balances=self.get_balances(),
             initial_balances=dict(self._initial_balances),
+            min_equity=self._min_equity,
         )
 
     def reset(self) -> None:
@@ -1210,6 +1214,7 @@ class PortfolioManager:
         self._total_loss = 0.0
         self._max_drawdown = 0.0
         self._max_equity = self.balance
+        self._min_equity = self.balance
 
     def _log_trade_record(self, record: TradeRecord) -> None:
         """
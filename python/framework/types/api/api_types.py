@@ -42,6 +42,12 @@ class BarResponse(BaseModel):
     v: float
 
 
+class BarLodResponse(BaseModel):
+    source_timeframe: str   # stored timeframe the buckets were built from
+    bucket_seconds: int     # bucket width (multiple of the source timeframe)
+    bars: list[BarResponse]
+
+
 class TimeframeInfo(BaseModel):
     name: str
     minutes: int
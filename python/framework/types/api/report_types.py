@@ -112,6 +112,30 @@ class TradeHistoryReport(BaseModel):
     scenario_totals: list[TradeScenarioTotals] = []  # per-scenario footer totals (no re-sum)
 
 
+class RunInfo(BaseModel):
+    """One run of the run catalog (the reports run list)."""
+    run_id: str
+    reference: str              # the id the per-run endpoints take (`<owner>/<run_id>` if run_id is shared)
+    group: str                  # 'scenario_sets' | 'autotrader'
+    owner: str                  # scenario set / autotrader profile
+    artifacts: list[str]        # report artifacts present in the run's io/ folder
+    finished_at: str | None = None  # ISO-8601 UTC; None = not recorded at run end
+    metadata: dict[str, Any] = {}   # pipeline, status, unit_count, sweep_id, ...
+
+
+class RunListResponse(BaseModel):
+    """The catalogued runs, newest first."""
+    runs: list[RunInfo]
+    count: int
+
+
+class TradeHistoryPage(BaseModel):
+    """One cursor page of trade-history rows (large runs; no aggregate metadata)."""
+    trades: list[TradeHistoryRow]
+    count: int                      # rows in this page
+    next_cursor: str | None = None  # pass as `cursor` for the next page; None = last page
+
+
 class OrderHistoryRow(BaseModel):
     """One order-lifecycle record (the resting/filled/rejected order list)."""
     order_id: str
@@ -139,6 +163,13 @@ class OrderHistoryReport(BaseModel):
     symbols: list[str]      # distinct symbols present (filter UX)
 
 
+class OrderHistoryPage(BaseModel):
+    """One cursor page of order-history rows (large runs; no aggregate metadata)."""
+    orders: list[OrderHistoryRow]
+    count: int                      # rows in this page
+    next_cursor: str | None = None  # pass as `cursor` for the next page; None = last page
+
+
 class PortfolioUnitRow(BaseModel):
     """Headline P&L of one run unit (sim: a scenario; live: the session)."""
     name: str               # scenario name (sim) / profile/session label (live)
@@ -351,14 +382,15 @@ class RunResultRow(BaseModel):
     """
     # Identity + provenance
     param_hash: str
-    status: str = 'ok'                           # 'ok' | 'error' (error = no usable data, excluded from ranking)
-    error: str | None = None                     # failure reason when status == 'error'
+    status: str = 'ok'                           # 'ok' | 'pruned' | 'error' (only 'ok' rows rank)
+    error: str | None = None                     # failure / prune reason when status != 'ok'
     run_id: str
     run_timestamp: str                          # ISO-8601 UTC (stored verbatim)
     sweep_id: str | None = None
     sweep_params: dict[str, Any] | None = None   # the combination's concrete grid point
     sweep_objective: str | None = None           # the sweep spec's objective (report defaults to it)
     sweep_maximize: bool | None = None           # the sweep spec's rank direction
+    sweep_rung: int | None = None                # successive-halving rung (None = grid sweep / no sweep)
     scenario_set_name: str = ''
     git_commit: str | None = None
     git_branch: str | None = None
@@ -464,6 +496,8 @@ class WorkerStatRow(BaseModel):
     max_time_ms: float = 0.0
     compute_basis: str = 'live'     # #420 cadence basis (live / bar_close)
     last_compute_tick: int = -1     # #420 tick index of the last real compute (idle telemetry)
+    cache_hits: int = 0             # worker output cache: computes replayed from the cache
+    cache_misses: int = 0           # worker output cache: computes added to the cache
 
 
 class WorkerDecisionUnitRow(BaseModel):
@@ -1,5 +1,6 @@
+import copy
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from python.framework.types.trading_env_types.broker_types import BrokerType
 from python.framework.types.config_types.robustness_config_types import RobustnessConfig
@@ -129,3 +130,48 @@ class BatchExecutionSummary:
     def get_scenario_by_process_result(self, process_result: ProcessResult) -> SingleScenario:
         """Return the scenario belonging to a given process result."""
         return self._single_scenario_list[process_result.scenario_index]
+
+    def for_decision_variant(
+        self,
+        variant: int,
+        strategy_configs: List[Dict[str, Any]],
+    ) -> 'BatchExecutionSummary':
+        """
+        The summary of one decision stack of a multi-decision batch.
+
+        The batch timings, data maps and batch-global validation are shared; process
+        results are cut to the stack's tick loop result and the scenarios carry the
+        stack's own strategy_config (copies — validation results stay per summary).
+
+        Args:
+            variant: Stack index (0 = the scenarios' own decision logic)
+            strategy_configs: The stack's strategy_config per scenario (index-synced)
+
+        Returns:
+            A BatchExecutionSummary reporting exactly like a standalone run of the stack
+        """
+        scenarios = []
+        for scenario, strategy_config in zip(self._single_scenario_list, strategy_configs):
+            variant_scenario = copy.copy(scenario)
+            variant_scenario.strategy_config = strategy_config
+            variant_scenario.decision_variants = []
+            variant_scenario.validation_result = list(scenario.validation_result)
+            scenarios.append(variant_scenario)
+
+        return BatchExecutionSummary(
+            batch_execution_time=self._batch_execution_time,
+            batch_warmup_time=self._batch_warmup_time,
+            batch_tickrun_time=self._batch_tickrun_time,
+            process_result_list=[
+                result.for_decision_variant(variant) for result in self._process_result_list],
+            single_scenario_list=scenarios,
+            broker_scenario_map=self._broker_scenario_map,
+            signal_scenario_map=self._signal_scenario_map,
+            clipping_stats_map=self._clipping_stats_map,
+            warmup_phases=self._warmup_phases,
+            batch_pickle_time=self._batch_pickle_time,
+            batch_pickle_sample_mb=self._batch_pickle_sample_mb,
+            debug_execution=self._debug_execution,
+            batch_validation_result=list(self._batch_validation_result),
+            robustness_config=self._robustness_config,
+        )
@@ -26,6 +26,18 @@ class HistoryConfig(BaseModel):
     trade_history_max: int = 5000
 
 
+class ReportingConfig(BaseModel):
+    """Persisted run-report artifacts (shared across both pipelines)."""
+    # The row-shaped artifacts (trade / order history, event stream) are always written as
+    # Parquet row tables; the JSON documents and the event-stream CSV are optional extras
+    # for consumers that still read them.
+    write_row_json: bool = True
+    write_event_csv: bool = True
+    # Threads the sim run's report steps (build / write per section, event streams) run on
+    # after a batch; independent steps run concurrently. <= 1 = one after another.
+    parallel_workers: int = 4
+
+
 class DevelopmentConfig(BaseModel):
     """Development / debug flags."""
     dev_mode: bool = False
@@ -37,7 +49,7 @@ class AppConfig(BaseModel):
 
     Sections:
       - development, console_logging, file_logging: shared
-      - paths, history: shared between both pipelines
+      - paths, history, reporting: shared between both pipelines
       - autotrader: AutoTrader pipeline defaults
       - backtesting: Backtesting pipeline settings
     """
@@ -48,5 +60,6 @@ class AppConfig(BaseModel):
     file_logging: FileLoggingConfig
     paths: SharedPaths
     history: HistoryConfig = HistoryConfig()
+    reporting: ReportingConfig = ReportingConfig()
     autotrader: AutotraderDefaultsConfig = AutotraderDefaultsConfig()
     backtesting: BacktestingConfig = BacktestingConfig()
@@ -18,6 +18,7 @@ class DefaultScenarioExecutionConfig(BaseModel):
     strict_parameter_validation: bool = True
     tick_processing_budget_ms: float = 0.0
     heartbeat_interval_ms: int = 1000  # sim ghost-pass cadence (#360); 0 = disabled
+    scenario_chunks: int = 1  # chunked execution: time chunks in parallel processes; 1 = whole
 
 
 class BacktestingExecutionConfig(BaseModel):
@@ -82,6 +83,22 @@ class ParameterOptimizationConfig(BaseModel):
     villain_abort_enabled: bool = True
 
 
+class MountCacheConfig(BaseModel):
+    """On-disk mount persistence (#420): reuse a prepared data mount across CLI invocations."""
+    # Opt-in — a persisted mount trades disk space for skipping Phases 1–5 on a repeat run.
+    enabled: bool = False
+    # Persisted mounts kept under <data_processed>/.mount_cache (least recently used evicted).
+    max_entries: int = 4
+
+
+class WorkerOutputCacheConfig(BaseModel):
+    """On-disk worker output cache: replay BAR_CLOSE worker outputs across runs on the same data."""
+    # Opt-in — replays outputs of workers whose code, parameters and data are unchanged.
+    enabled: bool = False
+    # Series kept under <data_processed>/.worker_output_cache (least recently used evicted).
+    max_entries: int = 256
+
+
 class BacktestingConfig(BaseModel):
     """
     Top-level model for app_config.json::backtesting.
@@ -93,3 +110,5 @@ class BacktestingConfig(BaseModel):
     data_validation: DataValidationConfig = DataValidationConfig()
     paths: BacktestingPaths = BacktestingPaths()
     parameter_optimization: ParameterOptimizationConfig = ParameterOptimizationConfig()
+    mount_cache: MountCacheConfig = MountCacheConfig()
+    worker_output_cache: WorkerOutputCacheConfig = WorkerOutputCacheConfig()
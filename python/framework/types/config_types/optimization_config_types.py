@@ -5,11 +5,87 @@ Pydantic schema for a sweep spec (`configs/sweeps/<name>.json`): a base scenario
 reference + a parameter grid (dotted-path → list of candidate values) + the ranking
 objective. The grid expands to the Cartesian product of fully-specified deterministic
 batches; each batch records its KPIs in the run-results ledger.
+
+`search` picks how the combinations are evaluated: `grid` runs every combination on the
+full base set; `successive_halving` runs them all on a reduced share of the data first
+and promotes only the best fraction to the next, larger rung (`halving` block); `bayes`
+evaluates a fixed budget of combinations proposed by a surrogate model fitted to the
+sweep's ledger rows so far. A `bayes` grid may give numeric ranges instead of value lists.
+`screening` scores every combination with the vectorized bar-resolution engine first and
+runs only the best `top_n` through the tick pipeline (`screening` block).
+
+An optional `prune` block stops hopeless combinations mid-run (status 'pruned' in the ledger).
+`execution: "multi_decision"` runs combinations that vary only decision_logic_config
+together — one worker pipeline per scenario, one decision stack per combination.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional, Union
+
+from pydantic import BaseModel, ConfigDict, field_validator
+
+
+class ParamRange(BaseModel):
+    """A numeric parameter range (bayes search only) — `{"low": .., "high": .., "step": .., "log": ..}`."""
+    model_config = ConfigDict(extra='forbid')
+
+    low: float
+    high: float
+    step: Optional[float] = None    # quantization (e.g. 1 → integer values); None = continuous
+    log: bool = False               # sample on a log scale (low must be > 0)
+
+
+class SearchSpec(BaseModel):
+    """How the sweep's combinations are chosen (the sweep spec's `search` block)."""
+    model_config = ConfigDict(extra='forbid')
+
+    method: Literal['grid', 'successive_halving', 'bayes', 'screening'] = 'grid'
+    budget: Optional[int] = None    # bayes: combinations to evaluate in total (required)
+    batch_size: int = 4             # bayes: combinations proposed per surrogate fit
+    startup: int = 8                # bayes: random combinations before the surrogate takes over
+    seed: Optional[int] = None      # bayes: proposal RNG seed (same seed + same results → same proposals)
+
+
+class HalvingSpec(BaseModel):
+    """Successive-halving settings (the sweep spec's `halving` block)."""
+    model_config = ConfigDict(extra='forbid')
+
+    eta: int = 3                    # keep the best 1/eta of each rung; the data share grows by eta
+    min_resource: float = 0.25      # share of the data the first rung runs on (0 < x <= 1)
+    # What "share of the data" means: 'span' shortens every scenario (end_date / max_ticks),
+    # 'scenarios' runs only the first share of the base set's scenarios (windows).
+    resource: Literal['span', 'scenarios'] = 'span'
+
+
+class ScreeningSpec(BaseModel):
+    """Vectorized screening settings (the sweep spec's `screening` block)."""
+    model_config = ConfigDict(extra='forbid')
+
+    top_n: int = 5                  # best screened combinations re-run through the tick pipeline
+    # Screening KPI to rank by — None = the sweep objective when the screen has it, else net_pnl
+    objective: Optional[str] = None
+    spread_points: Optional[float] = None   # fixed spread for the bar fills; None = tick index average
+
+
+class PruneSpec(BaseModel):
+    """Early-pruning rules (the sweep spec's `prune` block) — checked periodically in the tick loop."""
+    model_config = ConfigDict(extra='forbid')
+
+    max_drawdown: Optional[float] = None    # stop once a scenario's max drawdown exceeds this (account currency)
+    # Stop once the running objective is provably worse than the k-th best finished combination
+    # so far — only for objectives that can only get worse during a run (minimized max_drawdown)
+    objective_bound_k: Optional[int] = None
+    check_every_ticks: int = 1000           # portfolio snapshot cadence (ticks)
 
-from pydantic import BaseModel, ConfigDict
+
+class ExecutionSpec(BaseModel):
+    """How the combinations are executed (the sweep spec's `execution` block)."""
+    model_config = ConfigDict(extra='forbid')
+
+    # 'multi_decision': combinations differing only in decision_logic_config share one scenario
+    # process — bars + workers compute once, each combination runs its own decision stack.
+    # Grids touching worker parameters fall back to 'per_combination'.
+    mode: Literal['per_combination', 'multi_decision'] = 'per_combination'
+    max_stacks: int = 8             # combinations per shared process (memory: one portfolio each)
 
 
 class SweepSpec(BaseModel):
@@ -17,8 +93,25 @@ class SweepSpec(BaseModel):
     model_config = ConfigDict(extra='forbid')
 
     base_scenario_set: str          # scenario set file the grid varies (resolved like a normal set)
-    grid: Dict[str, List[Any]]      # dotted path (decision_logic_config.<x> | workers.<name>.<x>) → values
+    grid: Dict[str, Union[List[Any], ParamRange]]   # dotted path (decision_logic_config.<x> | workers.<name>.<x>) → values
     objective: str = 'expectancy'   # RunSummary currency field to rank by
     objective_currency: Optional[str] = None  # required only when the run has > 1 currency
     maximize: bool = True           # rank direction (False e.g. for max_drawdown / total_fees)
     sweep_name: str = ''            # defaults to the spec file stem
+    search: SearchSpec = SearchSpec()       # a bare method string is shorthand for {"method": ...}
+    halving: HalvingSpec = HalvingSpec()    # used by search='successive_halving'
+    screening: ScreeningSpec = ScreeningSpec()  # used by search='screening'
+    prune: Optional[PruneSpec] = None       # opt-in early pruning; None = every combination runs to the end
+    execution: ExecutionSpec = ExecutionSpec()  # a bare mode string is shorthand for {"mode": ...}
+
+    @field_validator('search', mode='before')
+    @classmethod
+    def _search_shorthand(cls, value: Any) -> Any:
+        """Accept `"search": "successive_halving"` for `"search": {"method": "successive_halving"}`."""
+        return {'method': value} if isinstance(value, str) else value
+
+    @field_validator('execution', mode='before')
+    @classmethod
+    def _execution_shorthand(cls, value: Any) -> Any:
+        """Accept `"execution": "multi_decision"` for `"execution": {"mode": "multi_decision"}`."""
+        return {'mode': value} if isinstance(value, str) else value
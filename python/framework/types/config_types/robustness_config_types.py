@@ -44,3 +44,6 @@ class RobustnessConfig(BaseModel):
     # Block-splitting disposition above which the per-window numbers are artifacts → the
     # verdict is suppressed (mirrors the block-splitting UNRELIABLE class, > 25%).
     disposition_trust_pct: float = 25.0
+    # Run adjacent, parameter-identical windows as ONE contiguous pass per symbol: the
+    # portfolio + trade simulator reset at each window boundary, bars + workers carry over.
+    single_pass: bool = False
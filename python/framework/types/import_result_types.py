@@ -1,12 +1,14 @@
 """
 Import Pipeline Result Types.
 
-Data structures for parallel bar rendering worker results.
+Data structures for parallel tick import and bar rendering worker results.
 """
 
 from dataclasses import dataclass, field
 from typing import Optional
 
+import pandas as pd
+
 
 @dataclass
 class BarRenderResult:
@@ -27,3 +29,62 @@ class BarRenderResult:
     success: bool = True
     error_message: Optional[str] = None
     log_buffer: list[str] = field(default_factory=list)
+
+
+@dataclass
+class StagedTickFile:
+    """
+    A converted and validated tick file, written to a hidden staging path.
+
+    Produced by the conversion phase (worker process in parallel imports);
+    the commit phase (duplicate check, rename into place) runs in the main process.
+
+    Args:
+        json_file: Source JSON path (string for pickle)
+        broker_type: Normalized broker type identifier
+        symbol: Trading symbol
+        staged_path: Finalized Parquet (with header metadata) at its dot-prefixed staging path
+        parquet_path: Final Parquet path
+        tick_count: Number of ticks written
+        content_hash: Fingerprint of the content (first/last time_msc + tick count; None without time_msc)
+        chunks: Number of chunks / row groups
+        min_timestamp: Earliest tick timestamp (UTC)
+        max_timestamp: Latest tick timestamp (UTC)
+        utc_converted: Whether a time offset was applied
+        market_type: Market type from market_config.json
+        data_format_version: Source data format version
+    """
+    json_file: str
+    broker_type: str
+    symbol: str
+    staged_path: str
+    parquet_path: str
+    tick_count: int
+    content_hash: Optional[str]
+    chunks: int
+    min_timestamp: pd.Timestamp
+    max_timestamp: pd.Timestamp
+    utc_converted: bool
+    market_type: str
+    data_format_version: str
+
+
+@dataclass
+class TickImportResult:
+    """
+    Result returned by a tick conversion worker subprocess.
+
+    Args:
+        file_name: Source JSON file name
+        staged: Staged file, None if the file held no ticks or failed
+        validation_error: Rendered TickFileValidationException if the file was refused
+        error_message: Error details for any other failure
+        warnings: Warnings collected while converting (validation warnings)
+        log_buffer: Collected (level, message) pairs from the worker process
+    """
+    file_name: str
+    staged: Optional[StagedTickFile] = None
+    validation_error: Optional[str] = None
+    error_message: Optional[str] = None
+    warnings: list[str] = field(default_factory=list)
+    log_buffer: list[tuple[str, str]] = field(default_factory=list)
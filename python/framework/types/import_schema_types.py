@@ -254,12 +254,20 @@ class ProcessingConfigSchema(TypedDict):
     Args:
         move_processed_files: Move JSON to finished/ after successful import
         auto_render_bars: Automatically render bars after tick import
+        import_workers: Worker processes converting JSON files concurrently
+        incremental_bar_rendering: Re-render only the imported time ranges
+        streaming_import_threshold_mb: JSON size from which ticks are parsed in chunks
+        streaming_import_chunk_ticks: Ticks per chunk / Parquet row group when streaming
 
     Returns:
         N/A (TypedDict - used for type checking only)
     """
     move_processed_files: bool
     auto_render_bars: bool
+    import_workers: int
+    incremental_bar_rendering: bool
+    streaming_import_threshold_mb: float
+    streaming_import_chunk_ticks: int
 
 
 class ImportConfigSchema(TypedDict):
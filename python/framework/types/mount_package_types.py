@@ -14,7 +14,7 @@ deliberately excluding strategy_config. Two scenarios with an equal key share by
 loaded data → the mount is reusable for both.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -111,6 +111,8 @@ class MountPackage:
     batch_warmup_time: float
     # scenario_index → DataIdentityKey (the mount's data fingerprint)
     data_identity: Dict[int, DataIdentityKey]
+    # scenario_index → bar-series key of the worker output cache (filled on first execute)
+    worker_output_series_keys: Dict[int, str] = field(default_factory=dict)
 
     def data_identity_fingerprint(self) -> Tuple[DataIdentityKey, ...]:
         """
@@ -38,6 +38,10 @@ class WorkerPerformanceStats:
     # gives "N ticks idle" since the worker last did work (BAR_CLOSE serves cache between).
     worker_compute_basis: str = 'live'
     worker_last_compute_tick: int = -1
+    # Worker output cache: due computes served from the cached series (hits) vs computed
+    # and added to it (misses). Both 0 when the cache is off or the worker is not cacheable.
+    worker_cache_hits: int = 0
+    worker_cache_misses: int = 0
 
 
 @dataclass
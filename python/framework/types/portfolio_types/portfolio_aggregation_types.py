@@ -3,7 +3,7 @@ FiniexTestingIDE - Portfolio Aggregation Types
 Types for currency-grouped portfolio aggregation
 """
 
-from typing import Dict
+from typing import Dict, Optional
 from dataclasses import dataclass, field
 
 
@@ -67,3 +67,6 @@ class PortfolioStats(BasePortfolioStats):
     initial_balances: Dict[str, float] = field(default_factory=dict)
     last_price: float = 0.0
     symbol: str = ''
+
+    # Lowest equity seen (sampled with max_equity) — chunk stitching joins drawdowns with it
+    min_equity: Optional[float] = None
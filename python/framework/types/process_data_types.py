@@ -10,9 +10,10 @@ CORRECTIONS:
 - balances: Unified balance dict (replaces initial_balance + account_currency)
 """
 
-from dataclasses import asdict, dataclass, field
+from dataclasses import asdict, dataclass, field, replace
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
+import traceback
 from dateutil import parser
 from python.configuration.market_config_manager import MarketConfigManager
 from python.configuration.app_config_manager import AppConfigManager
@@ -23,8 +24,11 @@ from python.framework.types.config_types.market_config_types import MarketType,
 from python.framework.types.performance_types.performance_stats_types import DecisionLogicStats, WorkerCoordinatorPerformanceStats, WorkerPerformanceStats
 from python.framework.types.portfolio_types.portfolio_aggregation_types import PortfolioStats
 from python.framework.types.portfolio_types.portfolio_trade_record_types import TradeRecord
+from python.framework.types.run_results_types import PruneRule
 from python.framework.types.config_types.autotrader_defaults_config_types import OrderGuardDefaults
 from python.framework.types.scenario_types.scenario_set_types import SingleScenario
+from python.framework.types.scenario_types.scenario_chunk_types import ScenarioChunk
+from python.framework.types.scenario_types.window_span_types import WindowBoundary
 from python.framework.types.signal_data_types import SignalResolutionStats, SignalSeries
 from python.framework.types.trading_env_types.stress_test_types import StressTestConfig
 from python.framework.types.trading_env_types.order_types import OrderResult
@@ -270,6 +274,48 @@ class ProcessScenarioConfig:
     # === PROFILE RUN METADATA ===
     is_profile_run: bool = False
 
+    # === SWEEP EARLY PRUNING (None = run to the end) ===
+    prune_rule: Optional[PruneRule] = None
+
+    # === MULTI-DECISION SWEEP (empty = one decision stack) ===
+    decision_variants: List[Dict[str, Any]] = field(default_factory=list)
+
+    # === WORKER OUTPUT CACHE (None = workers always compute) ===
+    worker_output_series_key: Optional[str] = None
+    worker_output_cache_dir: Optional[str] = None
+    worker_output_cache_max_entries: int = 0
+
+    # === SINGLE-PASS ROBUSTNESS (empty = one window) ===
+    # Later windows of the span this process runs — ticks cover the whole span
+    window_span: List[WindowBoundary] = field(default_factory=list)
+
+    # === CHUNKED EXECUTION (None = the whole scenario) ===
+    # Chunk this process runs — ticks before its start_time only render warm-up bars
+    scenario_chunk: Optional[ScenarioChunk] = None
+
+    def for_chunk(self, chunk: ScenarioChunk) -> 'ProcessScenarioConfig':
+        """
+        The configuration of one chunk process of a chunked scenario.
+
+        Keeps scenario_index (live updates land on the scenario's row); the name gets a
+        chunk suffix so every chunk writes its own scenario log. The worker output cache
+        is off — a chunk's early bars see a shorter history than the cached series.
+
+        Args:
+            chunk: The chunk to run
+
+        Returns:
+            A copy trading chunk.start_time → chunk.end_time
+        """
+        return replace(
+            self,
+            name=f"{self.name}_chunk{chunk.position + 1}of{chunk.chunk_count}",
+            start_time=chunk.start_time,
+            end_time=chunk.end_time if chunk.end_time is not None else self.end_time,
+            worker_output_series_key=None,
+            scenario_chunk=chunk,
+        )
+
     @staticmethod
     def from_scenario(
         scenario: SingleScenario,
@@ -419,6 +465,12 @@ class ProcessScenarioConfig:
             inbound_latency_min_ms=inbound_latency_min_ms,
             inbound_latency_max_ms=inbound_latency_max_ms,
             is_profile_run=scenario.is_profile_run,
+            prune_rule=scenario.prune_rule,
+            decision_variants=list(scenario.decision_variants),
+            worker_output_series_key=scenario.worker_output_series_key,
+            worker_output_cache_dir=app_config_loader.get_worker_output_cache_path(),
+            worker_output_cache_max_entries=app_config_loader.get_worker_output_cache_max_entries(),
+            window_span=list(scenario.window_span),
         )
 
 
@@ -558,6 +610,9 @@ class ProcessTickLoopResult:
     # Block boundary report (Profile Runs only, None for normal runs)
     block_boundary_report: Optional[BlockBoundaryReport] = None
 
+    # Sweep early pruning: the rule that stopped the loop (None = not pruned)
+    pruned_reason: Optional[str] = None
+
     # Error handling
     tick_loop_error: Optional[Exception] = None
 
@@ -593,9 +648,92 @@ class ProcessResult:
     # Data from the tick loop
     tick_loop_results: ProcessTickLoopResult = None
 
+    # Multi-decision sweep: tick loop results of the variant stacks 1..N
+    variant_tick_loop_results: Optional[List[ProcessTickLoopResult]] = None
+
+    # Single-pass robustness: tick loop results of the span's later windows 1..N
+    window_tick_loop_results: Optional[List[ProcessTickLoopResult]] = None
+
     # logger lines to print after scenario run.
     scenario_logger_buffer: list[tuple[str, str]] = None
 
+    def for_decision_variant(self, variant: int) -> 'ProcessResult':
+        """
+        The result of one decision stack of a multi-decision process.
+
+        Args:
+            variant: Stack index (0 = the scenario's own decision logic)
+
+        Returns:
+            A ProcessResult carrying only that stack's tick loop result. A process that
+            failed before its tick loop returns itself — it failed alike for every stack.
+        """
+        if variant == 0:
+            return replace(self, variant_tick_loop_results=None)
+        if not self.variant_tick_loop_results:
+            return self
+
+        tick_loop_results = self.variant_tick_loop_results[variant - 1]
+        error = tick_loop_results.tick_loop_error
+        if error is not None:
+            return replace(
+                self, success=False, tick_loop_results=tick_loop_results,
+                variant_tick_loop_results=None,
+                error_type=type(error).__name__, error_message=str(error),
+                traceback=''.join(traceback.format_exception(
+                    type(error), error, error.__traceback__)))
+        # Logged errors land in the shared scenario log — they apply to every stack
+        logged_errors = self.error_type == 'LoggedErrors'
+        return replace(
+            self, success=not logged_errors, tick_loop_results=tick_loop_results,
+            variant_tick_loop_results=None,
+            error_type=self.error_type if logged_errors else None,
+            error_message=self.error_message if logged_errors else None,
+            traceback=None)
+
+    def for_span_window(
+        self,
+        position: int,
+        boundary: Optional[WindowBoundary] = None,
+    ) -> 'ProcessResult':
+        """
+        The result of one window of a single-pass robustness span.
+
+        Args:
+            position: Window position in the span (0 = the lead window this process ran as)
+            boundary: The later window's boundary (required for position > 0)
+
+        Returns:
+            A ProcessResult reporting as that window's scenario. The scenario log + process
+            time stay with the lead; a process that failed before its tick loop fails every
+            window alike.
+        """
+        if position == 0:
+            return replace(self, window_tick_loop_results=None)
+
+        identity = dict(
+            scenario_name=boundary.name, scenario_index=boundary.scenario_index,
+            execution_time_ms=0.0, scenario_logger_buffer=None, window_tick_loop_results=None)
+        if not self.window_tick_loop_results:
+            return replace(self, **identity)
+
+        tick_loop_results = self.window_tick_loop_results[position - 1]
+        error = tick_loop_results.tick_loop_error
+        if error is not None:
+            return replace(
+                self, success=False, tick_loop_results=tick_loop_results,
+                error_type=type(error).__name__, error_message=str(error),
+                traceback=''.join(traceback.format_exception(
+                    type(error), error, error.__traceback__)),
+                **identity)
+        # Logged errors land in the shared scenario log — they apply to every window
+        logged_errors = self.error_type == 'LoggedErrors'
+        return replace(
+            self, success=not logged_errors, tick_loop_results=tick_loop_results,
+            error_type=self.error_type if logged_errors else None,
+            error_message=self.error_message if logged_errors else None,
+            traceback=None, **identity)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
@@ -0,0 +1,30 @@
+"""
+Report task types — one step of a run's report generation, as a node of a dependency graph.
+
+A run's report artifacts are built and written by independent steps (build the portfolio
+report, write it, write one scenario's event stream, …). Declaring each step with the steps
+it needs lets `run_report_tasks` run the independent ones concurrently.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Tuple
+
+
+@dataclass
+class ReportTask:
+    """One report step: `run` receives the results of the finished tasks (name → result)."""
+    name: str
+    run: Callable[[Dict[str, Any]], Any]
+    after: Tuple[str, ...] = ()     # tasks whose results `run` reads (must finish first)
+
+
+@dataclass
+class ReportTaskResults:
+    """What a report task graph produced."""
+    results: Dict[str, Any] = field(default_factory=dict)      # task name → return value
+    seconds: Dict[str, float] = field(default_factory=dict)    # task name → own wall time
+
+    def slowest(self, count: int = 3) -> Dict[str, float]:
+        """The `count` slowest tasks (name → seconds), slowest first."""
+        ranked = sorted(self.seconds.items(), key=lambda item: item[1], reverse=True)
+        return dict(ranked[:count])
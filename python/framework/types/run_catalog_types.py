@@ -0,0 +1,26 @@
+"""
+Run catalog types.
+
+`RunCatalogEntry` is one run directory in the persistent run catalog of the logs tree
+(see `framework/reporting/store/run_catalog.py`): where the run lives, which report
+artifacts it carries, and a few headline fields for listing without opening the run.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class RunCatalogEntry:
+    """One run directory under `<logs_root>/<group>/<owner>/<run_id>/`."""
+    run_id: str                     # run-timestamp dir name
+    group: str                      # 'scenario_sets' | 'autotrader'
+    owner: str                      # scenario set / autotrader profile dir name
+    artifacts: List[str] = field(default_factory=list)  # file names in the run's io/ subfolder
+    finished_at: Optional[str] = None   # ISO-8601 UTC; None = discovered by a scan (in progress / unrecorded)
+    metadata: Dict[str, Any] = field(default_factory=dict)  # status, unit_count, sweep_id, ...
+
+    @property
+    def path(self) -> str:
+        """Run directory relative to the logs root (POSIX)."""
+        return f'{self.group}/{self.owner}/{self.run_id}'
@@ -4,7 +4,8 @@ Run-results ledger types.
 Runtime domain types for the persistent run-results ledger (the substrate of the
 Parameter Optimization system). `RunProvenance` is the per-run provenance bundle
 written alongside the run's KPIs; `SweepContext` is the optional sweep tagging a
-combination carries into a batch so the ledger row can be grouped by sweep.
+combination carries into a batch so the ledger row can be grouped by sweep; `PruneRule`
+is the concrete early-pruning threshold set a sweep combination carries into its scenarios.
 """
 
 from dataclasses import dataclass
@@ -19,14 +20,29 @@ class SweepContext:
     sweep_params: Dict[str, Any]    # the combination's concrete grid point {path: value}
     objective: str = 'expectancy'   # the spec's ranking objective (recorded so report defaults to it)
     maximize: bool = True           # the spec's ranking direction
+    rung: Optional[int] = None      # successive-halving rung (0 = smallest data share); None = grid
+
+
+@dataclass
+class PruneRule:
+    """
+    Concrete early-pruning thresholds of one sweep combination, checked in the tick loop.
+
+    Resolved by the optimization runner from the spec's `prune` block before the combination
+    starts (the objective bound is the k-th best max_drawdown finished so far).
+    """
+    max_drawdown: Optional[float] = None        # absolute drawdown limit (any account currency)
+    objective_bound: Optional[float] = None     # k-th best max_drawdown so far — exceeding it can never rank in
+    objective_currency: Optional[str] = None    # the bound's currency (None = every currency)
+    check_every_ticks: int = 1000               # portfolio snapshot cadence (ticks)
 
 
 @dataclass
 class RunProvenance:
     """Per-run provenance written to the ledger next to the run's KPIs."""
     param_hash: str                 # fingerprint of the effective strategy_config (leading key)
-    status: str                     # 'ok' | 'error' (from the canonical WarningsErrorsOutcome)
-    error: Optional[str]            # failure reason when status == 'error', else None
+    status: str                     # 'ok' | 'pruned' | 'error' (from the canonical WarningsErrorsOutcome)
+    error: Optional[str]            # failure / prune reason when status != 'ok', else None
     run_id: str                     # run-timestamp dir name (join key → full run io/)
     run_timestamp: datetime         # UTC
     scenario_set_name: str
@@ -43,3 +59,4 @@ class RunProvenance:
     sweep_params: Optional[Dict[str, Any]] = None
     sweep_objective: Optional[str] = None    # the sweep spec's objective (report defaults to it)
     sweep_maximize: Optional[bool] = None    # the sweep spec's rank direction
+    sweep_rung: Optional[int] = None         # successive-halving rung the run evaluated
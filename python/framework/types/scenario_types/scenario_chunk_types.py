@@ -0,0 +1,27 @@
+"""
+FiniexTestingIDE - Scenario Chunk Types
+Chunked execution: one long scenario runs as K time chunks in parallel processes.
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class ScenarioChunk:
+    """
+    One time chunk of a chunked scenario — the range its process trades in.
+
+    The chunk's ticks start early by the strategy's warm-up bars: ticks before
+    start_time only render bars (no worker, decision or trade), so the chunk starts
+    trading on a warmed-up pipeline. Chunk 0 starts at the scenario start and uses
+    the loaded warm-up bars like a regular run.
+    """
+    position: int
+    chunk_count: int
+    start_time: datetime
+    # Start of the next chunk (None = the scenario's own end)
+    end_time: Optional[datetime] = None
+    # First warm-up tick (None = the overlap reaches back to the scenario start:
+    # the loaded warm-up bars are injected and every earlier tick is rendered)
+    warmup_start: Optional[datetime] = None
@@ -18,8 +18,11 @@ from python.framework.logging.scenario_logger import ScenarioLogger
 from python.framework.logging.system_info_writer import write_system_version_parameters
 from python.configuration.app_config_manager import AppConfigManager
 from python.framework.trading_env.broker_config import BrokerConfig, BrokerType
+from python.framework.types.run_results_types import PruneRule
 from python.framework.types.validation_types import ValidationResult
 from python.framework.types.scenario_types.window_set_types import WindowSet
+from python.framework.types.scenario_types.window_span_types import WindowBoundary
+from python.framework.types.scenario_types.scenario_chunk_types import ScenarioChunk
 from python.framework.types.config_types.robustness_config_types import RobustnessConfig, RobustnessRole
 from python.framework.utils.scenario_set_utils import ScenarioSetUtils
 
@@ -96,6 +99,28 @@ class SingleScenario:
     # === PROFILE RUN METADATA (populated from a WindowSet) ===
     is_profile_run: bool = False
 
+    # === SWEEP EARLY PRUNING (set per combination by the optimization runner) ===
+    prune_rule: Optional[PruneRule] = None
+
+    # === MULTI-DECISION SWEEP (set by the optimization runner) ===
+    # decision_logic_config of the further combinations this scenario's process
+    # runs as extra decision stacks on the same worker pipeline (empty = one stack)
+    decision_variants: List[Dict[str, Any]] = field(default_factory=list)
+
+    # === WORKER OUTPUT CACHE (set by BatchOrchestrator.execute when enabled) ===
+    # Key of this scenario's bar series (None = workers always compute)
+    worker_output_series_key: Optional[str] = None
+
+    # === SINGLE-PASS ROBUSTNESS (set by BatchOrchestrator.execute when enabled) ===
+    # Lead window of a span: the later windows its process runs on the same pipeline
+    window_span: List[WindowBoundary] = field(default_factory=list)
+    # Later window of a span: scenario_index of the lead that runs it (None = runs itself)
+    window_span_lead: Optional[int] = None
+
+    # === CHUNKED EXECUTION (set by BatchOrchestrator.execute when scenario_chunks > 1) ===
+    # Time chunks this scenario runs as, one process each (empty = runs whole)
+    chunks: List[ScenarioChunk] = field(default_factory=list)
+
     def __post_init__(self):
         if self.name is None:
             raise ValueError(
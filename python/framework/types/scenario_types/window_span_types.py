@@ -0,0 +1,19 @@
+"""
+FiniexTestingIDE - Window Span Types
+Single-pass robustness execution: adjacent windows run as one contiguous span.
+"""
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class WindowBoundary:
+    """
+    A later window of a single-pass span — where it starts and which scenario it reports as.
+
+    The span's first (lead) window runs the process; each boundary resets the portfolio +
+    trade simulator while bars and worker state carry over.
+    """
+    name: str
+    scenario_index: int
+    start_time: datetime
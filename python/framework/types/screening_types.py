@@ -0,0 +1,141 @@
+"""
+Vectorized screening types.
+
+Runtime types of the bar-resolution screening engine (sweep search `screening`): a
+pre-rendered bar series as NumPy arrays, the entry/exit arrays a decision logic's
+`compute_signals` hook produces, the bar-fill cost model derived from the BrokerConfig,
+and the screening KPIs one combination scores.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from python.framework.types.market_types.market_types import TradingContext
+from python.framework.types.trading_env_types.broker_types import FeeType
+
+
+@dataclass
+class BarSeries:
+    """One timeframe of pre-rendered bars as NumPy columns (oldest first)."""
+    timeframe: str
+    times_msc: np.ndarray           # bar OPEN time, epoch ms (int64)
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    tick_count: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.times_msc)
+
+    def slice(self, start: int, stop: int) -> 'BarSeries':
+        """The bars [start, stop) as views (no copy)."""
+        return BarSeries(
+            timeframe=self.timeframe,
+            times_msc=self.times_msc[start:stop],
+            open=self.open[start:stop],
+            high=self.high[start:stop],
+            low=self.low[start:stop],
+            close=self.close[start:stop],
+            volume=self.volume[start:stop],
+            tick_count=self.tick_count[start:stop],
+        )
+
+
+@dataclass
+class ScreeningSignals:
+    """
+    Bar-close signal arrays of one decision logic run (aligned to the screened bars).
+
+    A True at bar i means "act on bar i's close"; the screen fills it at bar i+1's open.
+    """
+    long_entries: np.ndarray        # bool — open a long while flat
+    long_exits: np.ndarray          # bool — close an open long
+    short_entries: np.ndarray       # bool — open a short while flat
+    short_exits: np.ndarray         # bool — close an open short
+    lots: float                     # fixed position size of every entry
+
+    @classmethod
+    def from_actions(cls, buy: np.ndarray, sell: np.ndarray, lots: float) -> 'ScreeningSignals':
+        """
+        Signals of a one-position reversal logic (BUY / SELL / FLAT per bar).
+
+        BUY opens a long while flat and closes an open short; SELL the mirror image;
+        FLAT holds. Matches the CORE logics' position handling (a reversal closes first,
+        the next signal opens).
+
+        Args:
+            buy: Bars whose decision is BUY
+            sell: Bars whose decision is SELL
+            lots: Fixed lot size
+
+        Returns:
+            The entry/exit arrays
+        """
+        return cls(long_entries=buy, long_exits=sell,
+                   short_entries=sell, short_exits=buy, lots=lots)
+
+
+@dataclass
+class ScreeningCostModel:
+    """Bar-fill costs of one scenario's symbol, derived from its BrokerConfig."""
+    fee_model: FeeType              # SPREAD (spread fee on entry) | MAKER_TAKER (taker fee on entry)
+    spread: float                   # assumed bid/ask spread (price units) — fills pay half each way
+    digits: int
+    tick_value: float               # tick_size * contract_size (P&L in the quote currency)
+    contract_size: float
+    taker_rate: float = 0.0         # MAKER_TAKER: fee percentage of the order value
+
+
+@dataclass
+class ScreeningMarket:
+    """One scenario's static screening context (built once per sweep)."""
+    trading_context: TradingContext
+    costs: ScreeningCostModel
+    currency: str                   # P&L currency — the symbol's quote currency
+    allow_short: bool               # False on a SPOT trading model (no short entries)
+
+
+@dataclass
+class ScreeningKpis:
+    """The bar-resolution KPIs one combination scores (quote currency of its symbols)."""
+    net_pnl: float = 0.0
+    total_trades: int = 0
+    winning_trades: int = 0
+    losing_trades: int = 0
+    total_profit: float = 0.0
+    total_loss: float = 0.0
+    total_fees: float = 0.0
+    max_drawdown: float = 0.0       # peak-to-trough of the closed-trade equity
+
+    @property
+    def win_rate(self) -> float:
+        return self.winning_trades / self.total_trades if self.total_trades > 0 else 0.0
+
+    @property
+    def profit_factor(self) -> float:
+        if self.total_loss > 0:
+            return self.total_profit / self.total_loss
+        return 0.0 if self.total_profit == 0 else float('inf')
+
+    def merge(self, other: 'ScreeningKpis') -> None:
+        """Add another scenario's KPIs (drawdown: the worst scenario's, like the run summary)."""
+        self.net_pnl += other.net_pnl
+        self.total_trades += other.total_trades
+        self.winning_trades += other.winning_trades
+        self.losing_trades += other.losing_trades
+        self.total_profit += other.total_profit
+        self.total_loss += other.total_loss
+        self.total_fees += other.total_fees
+        self.max_drawdown = max(self.max_drawdown, other.max_drawdown)
+
+
+@dataclass
+class ScreeningResult:
+    """One screened combination: its KPIs per currency, or the reason it could not screen."""
+    combo: Dict[str, Any]
+    kpis: Dict[str, ScreeningKpis] = field(default_factory=dict)   # currency → KPIs
+    error: Optional[str] = None
@@ -1,6 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, FrozenSet, TypedDict, Union
+from typing import Dict, FrozenSet, Tuple, TypedDict, Union
 
 from python.framework.types.parameter_types import OutputValue
 
@@ -91,6 +91,21 @@ class WorkerResult:
         return self.outputs[name]
 
 
+@dataclass
+class WorkerOutputSeries:
+    """
+    One worker instance's cached per-bar output series (worker output cache).
+
+    Args:
+        key: Cache key (data identity + worker identity)
+        entries: Bar key (last completed bar per required timeframe) → WorkerResult
+        dirty: True once the run computed an entry the stored series lacked
+    """
+    key: str
+    entries: Dict[Tuple[str, ...], WorkerResult] = field(default_factory=dict)
+    dirty: bool = False
+
+
 class _AllSignalsSentinel:
     """Sentinel: a decision logic reads ALL of a worker's outputs (compute-all)."""
 
@@ -119,6 +119,21 @@ def time_range_from_transport_ticks(
     )
 
 
+def tick_time_msc(tick: Any) -> int:
+    """
+    Epoch milliseconds of a tick in either form (TickData or transport dict).
+
+    Args:
+        tick: TickData or transport tick dict
+
+    Returns:
+        Tick time in ms (UTC)
+    """
+    if isinstance(tick, TickData):
+        return int(tick.timestamp.timestamp() * 1000)
+    return int(tick[TickTransportColumn.TIME_MSC])
+
+
 # ============================================================================
 # BAR DESERIALIZATION (Top-level function)
 # ============================================================================
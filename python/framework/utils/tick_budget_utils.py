@@ -0,0 +1,53 @@
+"""
+Tick Budget Utilities
+
+Array-based virtual clock for the tick processing budget (clipping simulation).
+
+A tick is kept (algo path) when its collected_msc has reached the virtual clock;
+keeping a tick advances the clock to collected_msc + budget_ms. Every tick
+arriving before the clock expires is flagged as clipped.
+"""
+
+import numpy as np
+
+
+def compute_clipping_flags(collected_msc: np.ndarray, budget_ms: float) -> np.ndarray:
+    """
+    Compute the is_clipped column for a tick sequence.
+
+    For a non-decreasing collected_msc sequence the next kept tick is found by
+    binary search (searchsorted(clock + budget)) from the last kept tick, so the
+    cost scales with the number of KEPT ticks, not with all ticks. Non-monotonic
+    device timestamps fall back to a scalar scan over the array — same result,
+    no per-tick dict work.
+
+    Args:
+        collected_msc: Device-side collection timestamps (ms), in stream order
+        budget_ms: Processing budget in milliseconds
+
+    Returns:
+        Boolean array (True = clipped), same length as collected_msc
+    """
+    collected = np.asarray(collected_msc, dtype=np.float64)
+    total = len(collected)
+    clipped = np.ones(total, dtype=bool)
+    if total == 0:
+        return clipped
+
+    if total == 1 or bool(np.all(collected[1:] >= collected[:-1])):
+        # Jump from kept tick to kept tick — virtual clock starts at 0
+        idx = int(np.searchsorted(collected, 0.0, side='left'))
+        while idx < total:
+            clipped[idx] = False
+            # Search only past the kept tick (a zero budget must still advance)
+            idx += 1 + int(np.searchsorted(
+                collected[idx + 1:], collected[idx] + budget_ms, side='left'))
+        return clipped
+
+    # Non-monotonic collected_msc — sequential virtual clock
+    virtual_clock = 0.0
+    for i, value in enumerate(collected.tolist()):
+        if value >= virtual_clock:
+            clipped[i] = False
+            virtual_clock = value + budget_ms
+    return clipped
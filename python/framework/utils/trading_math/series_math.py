@@ -0,0 +1,73 @@
+"""
+Series math — whole-series (batch) forms of the trailing-window indicator math.
+
+A worker's compute() evaluates one trailing window per call; the screening engine needs
+the value after every bar at once. These helpers evaluate a trailing window over a whole
+series with NumPy / pandas. A window function that is LINEAR in its inputs (SMA, the
+windowed EMA of moving_average, the MACD's seeded EMAs) is turned into one convolution
+with weights derived from the scalar function itself — so the batch value equals the
+worker's own scalar math up to float rounding, without re-implementing it.
+
+Every result is aligned to the input series: index i holds the value of the window that
+ends at i, NaN while fewer than `window` values exist.
+"""
+
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+
+def rolling_linear(
+    values: np.ndarray,
+    window: int,
+    window_fn: Callable[[np.ndarray], float],
+) -> np.ndarray:
+    """
+    A linear trailing-window function over a whole series.
+
+    Args:
+        values: The series (oldest first)
+        window: Window length
+        window_fn: Scalar window function, linear in the window's values
+
+    Returns:
+        window_fn of every full trailing window (NaN before the first)
+    """
+    out = np.full(len(values), np.nan)
+    if len(values) < window:
+        return out
+    # fn linear → fn(w) = Σ weight_k · w_k, the weights read off the unit vectors
+    weights = np.array([window_fn(unit) for unit in np.eye(window)])
+    out[window - 1:] = np.convolve(values, weights[::-1], mode='valid')
+    return out
+
+
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing mean (NaN while the window is not full)."""
+    return pd.Series(values, dtype='float64').rolling(window).mean().to_numpy(copy=True)
+
+
+def rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing sum (NaN while the window is not full)."""
+    return pd.Series(values, dtype='float64').rolling(window).sum().to_numpy(copy=True)
+
+
+def rolling_std(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing POPULATION standard deviation — np.std's ddof=0 (NaN while not full)."""
+    return pd.Series(values, dtype='float64').rolling(window).std(ddof=0).to_numpy(copy=True)
+
+
+def shift(values: np.ndarray, periods: int = 1) -> np.ndarray:
+    """The series shifted back by `periods` (index i holds values[i - periods]; NaN before)."""
+    out = np.full(len(values), np.nan)
+    if periods < len(values):
+        out[periods:] = values[:len(values) - periods]
+    return out
+
+
+def safe_ratio(value: np.ndarray, scale: np.ndarray) -> np.ndarray:
+    """Normalizer.normalize over arrays: value / scale, 0.0 where scale <= 0 (NaN stays NaN)."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = np.where(scale > 0, value / scale, 0.0)
+    return np.where(np.isnan(value) | np.isnan(scale), np.nan, ratio)
@@ -13,33 +13,55 @@ Phase 0 (ScenarioValidator.validate_scenario_parameters) validates each combinat
 against the component schemas (type / range / required / unknown). An invalid combination is
 marked invalid there, excluded from execution, and recorded as an error-flagged ledger row
 that is left out of the ranking (#1) — the other combinations keep running (§33).
+
+Numeric ranges (`ParamRange`) are only meaningful for the model-based `bayes` search — a grid
+cannot enumerate them — and must be well-formed (low < high, positive step, log needs low > 0).
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Union
 
 from python.framework.logging.abstract_logger import AbstractLogger
+from python.framework.types.config_types.optimization_config_types import ParamRange
 
 
 def validate_sweep_grid(
-    grid: Dict[str, List[Any]],
+    grid: Dict[str, Union[List[Any], ParamRange]],
     logger: AbstractLogger,
+    allow_ranges: bool = False,
 ) -> None:
     """
-    Validate the grid's structure (path shape + non-empty value lists).
+    Validate the grid's structure (path shape + non-empty value lists / well-formed ranges).
 
     Args:
-        grid: Sweep grid (dotted path → candidate values)
+        grid: Sweep grid (dotted path → candidate values or numeric range)
         logger: Logger (unused here; kept for a uniform validator signature)
+        allow_ranges: Whether numeric ranges are allowed (bayes search)
 
     Raises:
-        ValueError: On an empty value list or a malformed dotted path
+        ValueError: On an empty value list, a malformed dotted path or an invalid / disallowed range
     """
     for path, values in grid.items():
-        if not isinstance(values, list) or not values:
+        if isinstance(values, ParamRange):
+            _check_range(path, values, allow_ranges)
+        elif not isinstance(values, list) or not values:
             raise ValueError(f"Grid path '{path}' must map to a non-empty list of values")
         _check_path_shape(path)
 
 
+def _check_range(path: str, param_range: ParamRange, allow_ranges: bool) -> None:
+    """Raise if a numeric range is not allowed here or is malformed."""
+    if not allow_ranges:
+        raise ValueError(
+            f"Grid path '{path}' is a numeric range — ranges need \"search\": {{\"method\": \"bayes\"}}; "
+            f"a grid needs an explicit list of values")
+    if not param_range.low < param_range.high:
+        raise ValueError(f"Grid range '{path}': low must be < high")
+    if param_range.step is not None and param_range.step <= 0:
+        raise ValueError(f"Grid range '{path}': step must be > 0")
+    if param_range.log and param_range.low <= 0:
+        raise ValueError(f"Grid range '{path}': a log-scale range needs low > 0")
+
+
 def _check_path_shape(path: str) -> None:
     """Raise if a dotted grid path is not a valid decision/worker parameter path shape."""
     parts = path.split('.')
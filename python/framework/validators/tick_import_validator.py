@@ -6,7 +6,7 @@ The importer validates and refuses — it never repairs. Repairing tick data is
 one-time migration (python/experiments/), not a permanent import path.
 
 Two planes:
-  1. Per file  — vectorized over the DataFrame the importer already holds
+  1. Per file  — vectorized per chunk, state carried across chunk boundaries
   2. Cross-file — over the tick index, without opening a single data file
 
 Gap severity is deliberately NOT judged here. Whether a gap is a market closure
@@ -93,6 +93,7 @@ class TickImportValidator:
 
         Expects the DataFrame after UTC offset application, so time_msc is
         already UTC and collected_msc can be compared against it directly.
+        Runs the same checks as the streaming import — the whole file as one chunk.
 
         Args:
             df: Tick DataFrame as written to parquet
@@ -105,214 +106,26 @@ class TickImportValidator:
         Returns:
             TickFileValidationResult carrying errors, warnings and metrics
         """
-        result = TickFileValidationResult(is_valid=True, file_name=file_name)
+        stream = self.open_stream(file_name, collected_msc_is_utc)
+        stream.add_chunk(df)
+        return stream.finish(declared_tick_count)
 
-        if df.empty:
-            result.add_error("File contains no ticks")
-            return result
-
-        self._check_tick_count(df, declared_tick_count, result)
-        self._check_prices(df, result)
-
-        # Timing checks need both time columns. A file without them is not
-        # rejected — pre-V1.3.0 exports legitimately lack collected_msc — but
-        # nothing about its timing can be asserted either.
-        if 'time_msc' not in df.columns:
-            result.add_warning(
-                "No time_msc column — tick timing cannot be validated")
-            return result
-
-        self._check_monotonic(df, result)
-        self._check_timestamp_consistency(df, result)
-        self._check_collected_msc_lag(df, collected_msc_is_utc, result)
-        self._collect_burst_metrics(df, result)
-
-        return result
-
-    def _check_tick_count(
+    def open_stream(
         self,
-        df: pd.DataFrame,
-        declared_tick_count: Optional[int],
-        result: TickFileValidationResult
-    ) -> None:
-        """
-        Compare the delivered row count against what the file declares.
-
-        Args:
-            df: Tick DataFrame
-            declared_tick_count: summary.total_ticks, or None when absent
-            result: Result to record findings on
-        """
-        if declared_tick_count is None:
-            return
-
-        if len(df) != declared_tick_count:
-            result.add_error(
-                f"Tick count mismatch: {len(df)} rows delivered, "
-                f"summary.total_ticks declares {declared_tick_count}"
-            )
-
-    def _check_prices(self, df: pd.DataFrame, result: TickFileValidationResult) -> None:
-        """
-        Reject non-positive or inverted prices.
-
-        Args:
-            df: Tick DataFrame
-            result: Result to record findings on
-        """
-        bid = df['bid'].to_numpy()
-        ask = df['ask'].to_numpy()
-
-        non_positive = int(((bid <= 0) | (ask <= 0)).sum())
-        if non_positive > 0:
-            result.add_error(f"{non_positive} ticks with bid or ask <= 0")
-
-        inverted = int((ask < bid).sum())
-        if inverted > 0:
-            result.add_error(f"{inverted} ticks with ask < bid (inverted spread)")
-
-    def _check_monotonic(self, df: pd.DataFrame, result: TickFileValidationResult) -> None:
-        """
-        Reject backwards steps in either time column.
-
-        Non-decreasing, not strictly increasing: two ticks can genuinely share a
-        millisecond, which is normal on burst-heavy feeds.
-
-        Args:
-            df: Tick DataFrame
-            result: Result to record findings on
-        """
-        for column in ('time_msc', 'collected_msc'):
-            if column not in df.columns:
-                continue
-            values = df[column].to_numpy().astype('int64')
-            if len(values) < 2:
-                continue
-
-            deltas = np.diff(values)
-            backwards = int((deltas < 0).sum())
-            if backwards > 0:
-                result.add_error(
-                    f"{column} steps backwards {backwards}x "
-                    f"(largest step {int(deltas.min())} ms)"
-                )
-
-    def _check_timestamp_consistency(
-        self,
-        df: pd.DataFrame,
-        result: TickFileValidationResult
-    ) -> None:
-        """
-        Verify the timestamp string and time_msc describe the same moment.
-
-        Args:
-            df: Tick DataFrame
-            result: Result to record findings on
-        """
-        if 'timestamp' not in df.columns:
-            return
-
-        # Normalize to milliseconds first — pandas picks the datetime resolution
-        # from the source, so astype('int64') alone is not unit-stable.
-        stamp_ms = df['timestamp'].to_numpy().astype('datetime64[ms]').astype('int64')
-        time_msc = df['time_msc'].to_numpy().astype('int64')
-        deviation = np.abs(stamp_ms - time_msc)
-
-        outside = int((deviation > TIMESTAMP_CONSISTENCY_TOLERANCE_MS).sum())
-        if outside > 0:
-            result.add_error(
-                f"{outside} ticks where timestamp and time_msc disagree by more "
-                f"than {TIMESTAMP_CONSISTENCY_TOLERANCE_MS} ms "
-                f"(worst {int(deviation.max())} ms)"
-            )
-
-    def _check_collected_msc_lag(
-        self,
-        df: pd.DataFrame,
-        collected_msc_is_utc: bool,
-        result: TickFileValidationResult
-    ) -> None:
+        file_name: str,
+        collected_msc_is_utc: bool = False
+    ) -> 'TickFileValidationStream':
         """
-        Verify collected_msc sits plausibly close to the tick's event time.
-
-        Uses the minimum lag per segment — the least-delayed sample is the most
-        honest estimator of the clock offset, the same filter NTP uses.
+        Start validating a file that arrives in chunks (streaming import).
 
         Args:
-            df: Tick DataFrame
+            file_name: Source file name, used in the report
             collected_msc_is_utc: Whether the file declares the UTC timebase
-            result: Result to record findings on
-        """
-        if 'collected_msc' not in df.columns:
-            return
-
-        collected = df['collected_msc'].to_numpy().astype('int64')
-        time_msc = df['time_msc'].to_numpy().astype('int64')
-
-        if not collected.any():
-            result.add_warning(
-                "collected_msc is zero throughout — pre-V1.3.0 data, no arrival "
-                "timing available"
-            )
-            return
-
-        segments = split_anchor_segments(collected)
-        result.metrics['segments'] = float(len(segments))
-
-        worst_lag = 0
-        for start, end in segments:
-            lag = int((collected[start:end] - time_msc[start:end]).min())
-            if abs(lag) > abs(worst_lag):
-                worst_lag = lag
 
-        result.metrics['min_lag_ms'] = float(worst_lag)
-
-        if abs(worst_lag) <= PLAUSIBLE_LAG_WINDOW_MS:
-            return
-
-        detail = (
-            f"collected_msc sits {worst_lag} ms from the tick event time "
-            f"(tolerated: +/-{PLAUSIBLE_LAG_WINDOW_MS} ms)"
-        )
-        if len(segments) > 1:
-            detail += f", across {len(segments)} anchor segments"
-
-        if collected_msc_is_utc:
-            result.add_error(
-                f"{detail}. The file declares collected_msc_timebase 'utc', so "
-                f"this is a collector defect, not a legacy conversion gap."
-            )
-        else:
-            result.add_error(
-                f"{detail}. Legacy timing — run the collected_msc restoration "
-                f"(python/experiments/restore_collected_msc_v3.py) before importing."
-            )
-
-    def _collect_burst_metrics(
-        self,
-        df: pd.DataFrame,
-        result: TickFileValidationResult
-    ) -> None:
+        Returns:
+            TickFileValidationStream — feed chunks in file order, then finish()
         """
-        Measure how many ticks share an arrival millisecond.
-
-        Pure metric, never a verdict: MT5 and Kraken differ structurally here,
-        and equal stamps are legitimate on a burst-heavy feed.
-
-        Args:
-            df: Tick DataFrame
-            result: Result to record findings on
-        """
-        if 'collected_msc' not in df.columns:
-            return
-
-        collected = df['collected_msc'].to_numpy().astype('int64')
-        if len(collected) < 2 or not collected.any():
-            return
-
-        simultaneous = int((np.diff(collected) == 0).sum())
-        result.metrics['simultaneous_arrivals'] = float(simultaneous)
-        result.metrics['simultaneous_share'] = simultaneous / (len(collected) - 1)
+        return TickFileValidationStream(file_name, collected_msc_is_utc)
 
     def validate_archive_ordering(
         self,
@@ -386,3 +199,251 @@ class TickImportValidator:
             )
 
         return findings
+
+
+class TickFileValidationStream:
+    """
+    Per-file validation fed in chunks, in file order.
+
+    Every check carries its state across chunk boundaries (last value of each
+    time column, the open anchor segment, running counters), so chunked and
+    whole-file validation produce the same result. Findings are reported in
+    finish(), in the fixed order: tick count, prices, monotonicity, timestamp
+    consistency, collected_msc lag, burst metrics.
+    """
+
+    def __init__(self, file_name: str, collected_msc_is_utc: bool = False):
+        """
+        Args:
+            file_name: Source file name, used in the report
+            collected_msc_is_utc: Whether the file declares the UTC timebase
+        """
+        self._file_name = file_name
+        self._collected_msc_is_utc = collected_msc_is_utc
+        self._rows = 0
+        self._columns: Optional[set] = None
+
+        # Prices
+        self._non_positive = 0
+        self._inverted = 0
+
+        # Monotonicity: column → [last value, backwards steps, smallest step]
+        self._monotonic: Dict[str, list] = {}
+
+        # Timestamp vs time_msc
+        self._stamp_outside = 0
+        self._stamp_worst = 0
+
+        # collected_msc lag per anchor segment + burst structure
+        self._collected_any = False
+        self._last_collected: Optional[int] = None
+        self._segments = 0
+        self._segment_min_lag: Optional[int] = None
+        self._worst_lag = 0
+        self._simultaneous = 0
+
+    def add_chunk(self, df: pd.DataFrame) -> None:
+        """
+        Feed the next chunk of ticks (after UTC offset application).
+
+        Args:
+            df: Tick chunk, file order
+        """
+        if df.empty:
+            return
+        if self._columns is None:
+            self._columns = set(df.columns)
+        self._rows += len(df)
+
+        bid = df['bid'].to_numpy()
+        ask = df['ask'].to_numpy()
+        self._non_positive += int(((bid <= 0) | (ask <= 0)).sum())
+        self._inverted += int((ask < bid).sum())
+
+        if 'time_msc' not in self._columns:
+            return
+
+        for column in ('time_msc', 'collected_msc'):
+            if column in self._columns:
+                self._update_monotonic(column, df[column].to_numpy().astype('int64'))
+
+        if 'timestamp' in self._columns:
+            # Normalize to milliseconds first — pandas picks the datetime resolution
+            # from the source, so astype('int64') alone is not unit-stable.
+            stamp_ms = df['timestamp'].to_numpy().astype('datetime64[ms]').astype('int64')
+            deviation = np.abs(stamp_ms - df['time_msc'].to_numpy().astype('int64'))
+            self._stamp_outside += int(
+                (deviation > TIMESTAMP_CONSISTENCY_TOLERANCE_MS).sum())
+            self._stamp_worst = max(self._stamp_worst, int(deviation.max()))
+
+        if 'collected_msc' in self._columns:
+            self._update_collected(
+                df['collected_msc'].to_numpy().astype('int64'),
+                df['time_msc'].to_numpy().astype('int64'))
+
+    def _update_monotonic(self, column: str, values: np.ndarray) -> None:
+        """
+        Count backwards steps, including the step across the chunk boundary.
+
+        Non-decreasing, not strictly increasing: two ticks can genuinely share a
+        millisecond, which is normal on burst-heavy feeds.
+
+        Args:
+            column: Time column name
+            values: Chunk values as int64
+        """
+        state = self._monotonic.setdefault(column, [None, 0, None])
+        if state[0] is not None:
+            values_with_prev = np.concatenate(([state[0]], values))
+        else:
+            values_with_prev = values
+        if len(values_with_prev) >= 2:
+            deltas = np.diff(values_with_prev)
+            state[1] += int((deltas < 0).sum())
+            smallest = int(deltas.min())
+            state[2] = smallest if state[2] is None else min(state[2], smallest)
+        state[0] = int(values[-1])
+
+    def _update_collected(self, collected: np.ndarray, time_msc: np.ndarray) -> None:
+        """
+        Advance the anchor-segment lag tracking and the burst counter.
+
+        Uses the minimum lag per segment — the least-delayed sample is the most
+        honest estimator of the clock offset, the same filter NTP uses.
+
+        Args:
+            collected: collected_msc chunk values
+            time_msc: time_msc chunk values
+        """
+        if collected.any():
+            self._collected_any = True
+
+        if self._last_collected is not None:
+            boundary = int(collected[0]) - self._last_collected
+            if boundary == 0:
+                self._simultaneous += 1
+            continues_segment = 0 <= boundary <= SEGMENT_SPLIT_FORWARD_MS
+        else:
+            continues_segment = False
+
+        if len(collected) >= 2:
+            self._simultaneous += int((np.diff(collected) == 0).sum())
+
+        lags = collected - time_msc
+        for index, (start, end) in enumerate(split_anchor_segments(collected)):
+            lag = int(lags[start:end].min())
+            if index == 0 and continues_segment:
+                self._segment_min_lag = min(self._segment_min_lag, lag)
+            else:
+                self._close_segment()
+                self._segments += 1
+                self._segment_min_lag = lag
+
+        self._last_collected = int(collected[-1])
+
+    def _close_segment(self) -> None:
+        """Fold the open segment's minimum lag into the worst lag."""
+        if self._segment_min_lag is None:
+            return
+        if abs(self._segment_min_lag) > abs(self._worst_lag):
+            self._worst_lag = self._segment_min_lag
+        self._segment_min_lag = None
+
+    def finish(self, declared_tick_count: Optional[int] = None) -> TickFileValidationResult:
+        """
+        Close the stream and report.
+
+        Args:
+            declared_tick_count: summary.total_ticks from the JSON, when present
+                (the summary follows the ticks array, so it arrives last)
+
+        Returns:
+            TickFileValidationResult carrying errors, warnings and metrics
+        """
+        result = TickFileValidationResult(is_valid=True, file_name=self._file_name)
+
+        if self._rows == 0:
+            result.add_error("File contains no ticks")
+            return result
+
+        if declared_tick_count is not None and self._rows != declared_tick_count:
+            result.add_error(
+                f"Tick count mismatch: {self._rows} rows delivered, "
+                f"summary.total_ticks declares {declared_tick_count}"
+            )
+
+        if self._non_positive > 0:
+            result.add_error(f"{self._non_positive} ticks with bid or ask <= 0")
+        if self._inverted > 0:
+            result.add_error(f"{self._inverted} ticks with ask < bid (inverted spread)")
+
+        # Timing checks need both time columns. A file without them is not
+        # rejected — pre-V1.3.0 exports legitimately lack collected_msc — but
+        # nothing about its timing can be asserted either.
+        if 'time_msc' not in self._columns:
+            result.add_warning(
+                "No time_msc column — tick timing cannot be validated")
+            return result
+
+        for column in ('time_msc', 'collected_msc'):
+            state = self._monotonic.get(column)
+            if state and state[1] > 0:
+                result.add_error(
+                    f"{column} steps backwards {state[1]}x "
+                    f"(largest step {state[2]} ms)"
+                )
+
+        if self._stamp_outside > 0:
+            result.add_error(
+                f"{self._stamp_outside} ticks where timestamp and time_msc disagree by more "
+                f"than {TIMESTAMP_CONSISTENCY_TOLERANCE_MS} ms "
+                f"(worst {self._stamp_worst} ms)"
+            )
+
+        if 'collected_msc' in self._columns:
+            self._finish_collected(result)
+
+        return result
+
+    def _finish_collected(self, result: TickFileValidationResult) -> None:
+        """
+        Report the collected_msc lag verdict and the burst metrics.
+
+        Args:
+            result: Result to record findings on
+        """
+        if not self._collected_any:
+            result.add_warning(
+                "collected_msc is zero throughout — pre-V1.3.0 data, no arrival "
+                "timing available"
+            )
+            return
+
+        self._close_segment()
+        result.metrics['segments'] = float(self._segments)
+        result.metrics['min_lag_ms'] = float(self._worst_lag)
+
+        if abs(self._worst_lag) > PLAUSIBLE_LAG_WINDOW_MS:
+            detail = (
+                f"collected_msc sits {self._worst_lag} ms from the tick event time "
+                f"(tolerated: +/-{PLAUSIBLE_LAG_WINDOW_MS} ms)"
+            )
+            if self._segments > 1:
+                detail += f", across {self._segments} anchor segments"
+
+            if self._collected_msc_is_utc:
+                result.add_error(
+                    f"{detail}. The file declares collected_msc_timebase 'utc', so "
+                    f"this is a collector defect, not a legacy conversion gap."
+                )
+            else:
+                result.add_error(
+                    f"{detail}. Legacy timing — run the collected_msc restoration "
+                    f"(python/experiments/restore_collected_msc_v3.py) before importing."
+                )
+
+        # Burst structure — pure metric, never a verdict: MT5 and Kraken differ
+        # structurally here, and equal stamps are legitimate on a burst-heavy feed.
+        if self._rows >= 2:
+            result.metrics['simultaneous_arrivals'] = float(self._simultaneous)
+            result.metrics['simultaneous_share'] = self._simultaneous / (self._rows - 1)
@@ -6,7 +6,10 @@ Base class for bar-centric INDICATOR workers (RSI, Bollinger, MACD, ...)
 from abc import abstractmethod
 from typing import Any, Dict, List, Optional, Set
 
+import numpy as np
+
 from python.framework.types.market_types.market_data_types import Bar, TickData
+from python.framework.types.screening_types import BarSeries
 from python.framework.types.worker_types import ComputeBasis, WorkerResult
 from python.framework.utils.timeframe_config_utils import TimeframeConfig
 from python.framework.workers.abstract_worker import AbstractWorker
@@ -112,6 +115,23 @@ class AbstractIndicatorWorker(AbstractWorker):
         """
         pass
 
+    def compute_batch(self, bars: BarSeries) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Batch form of compute() over a whole bar series (vectorized screening).
+
+        Optional. Index i of every output array holds what compute() returns right after
+        bar i closes under ComputeBasis.BAR_CLOSE (completed bars 0..i) — NaN while the
+        window is not full. Evaluated on the first timeframe of 'periods', like compute().
+        The default None marks the worker as not screenable.
+
+        Args:
+            bars: The completed bars of this worker's first timeframe
+
+        Returns:
+            Output name → array aligned to bars, or None (no batch form)
+        """
+        return None
+
     def get_compute_basis(self) -> ComputeBasis:
         """
         Effective compute basis for this worker instance (#420), cached.
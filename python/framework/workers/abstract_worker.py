@@ -97,6 +97,15 @@ class AbstractWorker(ABC):
         """
         self._requested_outputs = set(keys)
 
+    def get_requested_outputs(self) -> Optional[Set[str]]:
+        """
+        The consumer-declared output set (None = no declaration, compute all).
+
+        Returns:
+            Copy of the requested output keys, or None
+        """
+        return set(self._requested_outputs) if self._requested_outputs is not None else None
+
     def wants_output(self, key: str) -> bool:
         """
         Whether an optional output should be computed for this instance.
@@ -11,8 +11,11 @@ from python.framework.logging.scenario_logger import ScenarioLogger
 from python.framework.types.market_types.market_data_types import Bar, TickData
 from python.framework.types.parameter_types import InputParamDef, OutputParamDef
 from python.framework.types.component_metadata_types import ComponentMetadata
+from python.framework.types.screening_types import BarSeries
 from python.framework.types.worker_types import ComputeBasis, WorkerResult, WorkerType
 from python.framework.utils.trading_math.moving_average import moving_average
+from python.framework.utils.trading_math.series_math import (
+    rolling_linear, rolling_std, safe_ratio, shift)
 from python.framework.utils.trading_math.normalizer import Normalizer
 from python.framework.workers.abstract_indicator_worker import \
     AbstractIndicatorWorker
@@ -233,3 +236,45 @@ class BollingerWorker(AbstractIndicatorWorker):
             outputs['slope'] = float(slope)
 
         return WorkerResult(outputs=outputs)
+
+    def compute_batch(self, bars: BarSeries) -> Dict[str, np.ndarray]:
+        """
+        Bollinger bands after every bar close (vectorized screening).
+
+        The band position is taken at the bar close (compute() reads tick.mid — the
+        same price at the closing tick).
+
+        Args:
+            bars: Completed bars of the first 'periods' timeframe
+
+        Returns:
+            Output arrays aligned to bars (NaN until `period` closes exist)
+        """
+        period = list(self.periods.values())[0]
+        closes = bars.close
+        middle = rolling_linear(
+            closes, period, lambda window: moving_average(window, period, self.ma_type))
+        std_dev = rolling_std(closes, period)
+        upper = middle + std_dev * self.deviation
+        lower = middle - std_dev * self.deviation
+        band_width = upper - lower
+
+        # Normalizer.rescale: a degenerate band is the neutral midpoint
+        with np.errstate(divide='ignore', invalid='ignore'):
+            position_raw = np.where(upper > lower, (closes - lower) / band_width, 0.5)
+        position_raw[np.isnan(middle)] = np.nan
+        # The slope needs period + 1 closes — 0.0 before, as in compute()
+        slope = np.nan_to_num(safe_ratio(middle - shift(middle), band_width), nan=0.0)
+        slope[np.isnan(middle)] = np.nan
+
+        return {
+            'upper': upper,
+            'middle': middle,
+            'lower': lower,
+            'position': np.clip(position_raw, 0.0, 1.0),
+            'std_dev': std_dev,
+            'bars_used': np.where(np.isnan(middle), np.nan, float(period)),
+            'position_raw': position_raw,
+            'width_pct': safe_ratio(band_width, middle),
+            'slope': slope,
+        }
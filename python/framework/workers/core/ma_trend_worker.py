@@ -10,9 +10,12 @@ import numpy as np
 from python.framework.types.market_types.market_data_types import Bar, TickData
 from python.framework.types.parameter_types import InputParamDef, OutputParamDef
 from python.framework.types.component_metadata_types import ComponentMetadata
+from python.framework.types.screening_types import BarSeries
 from python.framework.types.worker_types import ComputeBasis, WorkerResult, WorkerType
 from python.framework.utils.trading_math.moving_average import moving_average
 from python.framework.utils.trading_math.normalizer import Normalizer
+from python.framework.utils.trading_math.series_math import (
+    rolling_linear, rolling_std, safe_ratio, shift)
 from python.framework.workers.abstract_indicator_worker import \
     AbstractIndicatorWorker
 
@@ -203,3 +206,34 @@ class MaTrendWorker(AbstractIndicatorWorker):
             'volatility_pct': float(volatility_pct),
             'bars_used': len(close_prices),
         })
+
+    def compute_batch(self, bars: BarSeries) -> Dict[str, np.ndarray]:
+        """
+        MA trend after every bar close (vectorized screening) — same window as compute().
+
+        Args:
+            bars: Completed bars of the first 'periods' timeframe
+
+        Returns:
+            Output arrays aligned to bars (NaN / None until `period` closes exist)
+        """
+        period = list(self.periods.values())[0]
+        closes = bars.close
+        ma_value = rolling_linear(
+            closes, period, lambda window: moving_average(window, period, self.ma_type))
+        std_window = rolling_std(closes, period)
+        # The slope needs period + 1 closes — 0.0 before, as in compute()
+        slope = np.nan_to_num(safe_ratio(ma_value - shift(ma_value), std_window), nan=0.0)
+        slope[np.isnan(ma_value)] = np.nan
+
+        direction = np.where(slope > self.neutral_band, 'up',
+                             np.where(slope < -self.neutral_band, 'down', 'neutral')).astype(object)
+        direction[np.isnan(slope)] = None
+
+        return {
+            'direction': direction,
+            'slope': slope,
+            'ma_value': ma_value,
+            'volatility_pct': safe_ratio(std_window, ma_value),
+            'bars_used': np.where(np.isnan(ma_value), np.nan, float(period)),
+        }
@@ -11,7 +11,9 @@ from python.framework.logging.scenario_logger import ScenarioLogger
 from python.framework.types.component_metadata_types import ComponentMetadata
 from python.framework.types.market_types.market_data_types import Bar, TickData
 from python.framework.types.parameter_types import REQUIRED, InputParamDef, OutputParamDef
+from python.framework.types.screening_types import BarSeries
 from python.framework.types.worker_types import ComputeBasis, WorkerResult, WorkerType
+from python.framework.utils.trading_math.series_math import rolling_linear
 from python.framework.workers.abstract_indicator_worker import AbstractIndicatorWorker
 
 
@@ -232,17 +234,7 @@ class MacdWorker(AbstractIndicatorWorker):
         # For signal line, we need MACD values, not close prices
         # Simplified: use last few MACD values if we have enough bars
         if len(bars) >= self.slow_period + self.signal_period:
-            # Calculate historical MACD values for signal line
-            macd_values = []
-            for i in range(self.signal_period, len(close_prices) + 1):
-                hist_close = close_prices[:i]
-                hist_fast = self._calculate_ema(hist_close, self.fast_period)
-                hist_slow = self._calculate_ema(hist_close, self.slow_period)
-                macd_values.append(hist_fast - hist_slow)
-
-            signal_line = self._calculate_ema(
-                np.array(macd_values), self.signal_period
-            )
+            signal_line = self._signal_line(close_prices)
         else:
             # Not enough data for signal line yet
             signal_line = macd_line
@@ -259,6 +251,58 @@ class MacdWorker(AbstractIndicatorWorker):
             'bars_used': float(len(close_prices)),
         })
 
+    def compute_batch(self, bars: BarSeries) -> Dict[str, np.ndarray]:
+        """
+        MACD after every bar close (vectorized screening) — same window as compute().
+
+        Args:
+            bars: Completed bars of the first 'periods' timeframe
+
+        Returns:
+            Output arrays aligned to bars (NaN until `period` closes exist)
+        """
+        period = list(self.periods.values())[0]
+        closes = bars.close
+        fast_ema = rolling_linear(
+            closes, period, lambda window: self._calculate_ema(window, self.fast_period))
+        slow_ema = rolling_linear(
+            closes, period, lambda window: self._calculate_ema(window, self.slow_period))
+        macd_line = fast_ema - slow_ema
+
+        # The signal line starts once the history holds slow + signal bars (bar i → i + 1)
+        signal_line = rolling_linear(closes, period, self._signal_line)
+        bar_count = np.arange(1, len(closes) + 1)
+        signal_line = np.where(
+            bar_count >= self.slow_period + self.signal_period, signal_line, macd_line)
+
+        return {
+            'macd': macd_line,
+            'signal': signal_line,
+            'histogram': macd_line - signal_line,
+            'fast_ema': fast_ema,
+            'slow_ema': slow_ema,
+            'bars_used': np.where(np.isnan(macd_line), np.nan, float(period)),
+        }
+
+    def _signal_line(self, close_prices: np.ndarray) -> float:
+        """
+        Signal line: EMA of the MACD values over the growing prefixes of the window.
+
+        Args:
+            close_prices: The compute window's close prices
+
+        Returns:
+            Current signal line value
+        """
+        macd_values = []
+        for i in range(self.signal_period, len(close_prices) + 1):
+            hist_close = close_prices[:i]
+            hist_fast = self._calculate_ema(hist_close, self.fast_period)
+            hist_slow = self._calculate_ema(hist_close, self.slow_period)
+            macd_values.append(hist_fast - hist_slow)
+
+        return self._calculate_ema(np.array(macd_values), self.signal_period)
+
     def _calculate_ema(self, prices: np.ndarray, period: int) -> float:
         """
         Calculate Exponential Moving Average.
@@ -23,7 +23,9 @@ from python.framework.types.market_types.market_types import TradingContext
 from python.framework.types.config_types.market_config_types import MarketType
 from python.framework.types.component_metadata_types import ComponentMetadata
 from python.framework.types.parameter_types import OutputParamDef
+from python.framework.types.screening_types import BarSeries
 from python.framework.types.worker_types import ComputeBasis, WorkerResult, WorkerType
+from python.framework.utils.trading_math.series_math import rolling_mean, rolling_sum
 from python.framework.workers.abstract_indicator_worker import AbstractIndicatorWorker
 
 
@@ -194,6 +196,43 @@ class ObvWorker(AbstractIndicatorWorker):
             'market_type': self._market_type.value if self._market_type else None,
         })
 
+    def compute_batch(self, bars: BarSeries) -> Dict[str, np.ndarray]:
+        """
+        OBV after every bar close (vectorized screening) — same window as compute().
+
+        Args:
+            bars: Completed bars of the first 'periods' timeframe
+
+        Returns:
+            Output arrays aligned to bars (NaN / None until period + 1 bars exist)
+        """
+        period = list(self.periods.values())[0]
+        volumes = bars.volume.astype(np.float64)
+        signed_volume = np.sign(np.diff(bars.close, prepend=bars.close[:1])) * volumes
+
+        # A full window is period + 1 bars — `period` signed volumes
+        obv_value = rolling_sum(signed_volume, period)
+        obv_value[:period] = np.nan
+
+        # _calculate_trend: OBV change over the last lookback + 1 moves (capped by the window)
+        lookback = min(5, period)
+        diff = rolling_sum(signed_volume, min(lookback + 1, period))
+        threshold = rolling_mean(volumes, lookback) * 0.5
+        trend = np.where(diff > threshold, 'bullish',
+                         np.where(diff < -threshold, 'bearish', 'neutral')).astype(object)
+        trend[np.isnan(obv_value)] = None
+
+        total_volume = rolling_sum(volumes, period + 1)
+        return {
+            'obv_value': obv_value,
+            'trend': trend,
+            'has_volume': total_volume > 0,
+            'total_volume': total_volume,
+            'bars_used': np.where(np.isnan(obv_value), np.nan, period + 1.0),
+            'market_type': np.full(
+                len(bars), self._market_type.value if self._market_type else None, dtype=object),
+        }
+
     def _calculate_obv(self, closes: np.ndarray, volumes: np.ndarray) -> float:
         """
         Calculate cumulative OBV value.
@@ -6,7 +6,9 @@ from python.framework.logging.scenario_logger import ScenarioLogger
 from python.framework.types.market_types.market_data_types import Bar, TickData
 from python.framework.types.parameter_types import OutputParamDef
 from python.framework.types.component_metadata_types import ComponentMetadata
+from python.framework.types.screening_types import BarSeries
 from python.framework.types.worker_types import ComputeBasis, WorkerResult, WorkerType
+from python.framework.utils.trading_math.series_math import rolling_mean
 from python.framework.workers.abstract_indicator_worker import \
     AbstractIndicatorWorker
 
@@ -137,3 +139,31 @@ class RsiWorker(AbstractIndicatorWorker):
             'avg_loss': float(avg_loss),
             'bars_used': len(close_prices),
         })
+
+    def compute_batch(self, bars: BarSeries) -> Dict[str, np.ndarray]:
+        """
+        RSI after every bar close (vectorized screening) — same window as compute().
+
+        Args:
+            bars: Completed bars of the first 'periods' timeframe
+
+        Returns:
+            Output arrays aligned to bars (NaN until period + 1 closes exist)
+        """
+        period = list(self.periods.values())[0]
+        deltas = np.diff(bars.close, prepend=np.nan)
+        avg_gain = rolling_mean(np.where(deltas > 0, deltas, 0.0), period)
+        avg_loss = rolling_mean(np.where(deltas < 0, -deltas, 0.0), period)
+        # The first delta is undefined — the first full window ends at bar `period`
+        avg_gain[:period] = np.nan
+        avg_loss[:period] = np.nan
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rsi = np.where(avg_loss == 0, 100.0, 100.0 - 100.0 / (1.0 + avg_gain / avg_loss))
+        rsi[np.isnan(avg_loss)] = np.nan
+        return {
+            'rsi_value': rsi,
+            'avg_gain': avg_gain,
+            'avg_loss': avg_loss,
+            'bars_used': np.where(np.isnan(rsi), np.nan, period + 1.0),
+        }
@@ -9,7 +9,7 @@ import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from python.framework.decision_logic.abstract_decision_logic import AbstractDecisionLogic
 from python.framework.logging.coordinator_tick_logger import CoordinatorTickLogger
@@ -23,10 +23,12 @@ from python.framework.types.performance_types.performance_stats_types import Wor
 from python.framework.signal_data.signal_data_provider import SignalDataProvider
 from python.framework.types.signal_data_types import (
     SignalResolution, SignalResolutionStats, SignalSnapshot)
-from python.framework.types.worker_types import ComputeBasis, SUBSCRIBE_ALL, WorkerRequirement, WorkerResult, WorkerState
+from python.framework.types.worker_types import (
+    ComputeBasis, SUBSCRIBE_ALL, WorkerOutputSeries, WorkerRequirement, WorkerResult, WorkerState)
 from python.framework.workers.abstract_worker import AbstractWorker
 from python.framework.workers.abstract_indicator_worker import AbstractIndicatorWorker
 from python.framework.workers.abstract_signal_worker import AbstractSignalWorker
+from python.framework.persistence.worker_output_cache import WorkerOutputCache
 
 
 class WorkerOrchestrator:
@@ -48,7 +50,8 @@ class WorkerOrchestrator:
         strategy_config: Dict[str, Any],
         parallel_workers: bool = None,
         parallel_threshold_ms: float = 1.0,
-        worker_decision_tracking: bool = True
+        worker_decision_tracking: bool = True,
+        variant_decision_logics: Optional[List[AbstractDecisionLogic]] = None,
     ):
         """
         Initialize coordinator with injected workers and decision logic.
@@ -61,6 +64,9 @@ class WorkerOrchestrator:
             worker_decision_tracking: Create per-worker / decision performance trackers (Layer A).
                                       When False, no trackers are created and all .record() sites
                                       become no-ops via existing null-guards.
+            variant_decision_logics: Further decision logics fed from the SAME worker
+                                     results (multi-decision sweep) — each one is
+                                     computed via compute_decision() by its own stack.
         """
         # ============================================
         # Injected dependencies
@@ -69,6 +75,8 @@ class WorkerOrchestrator:
             worker.name: worker for worker in workers
         }
         self.decision_logic = decision_logic
+        self.variant_decision_logics: List[AbstractDecisionLogic] = list(
+            variant_decision_logics or [])
         # Get logger from decision_logic (already has ScenarioLogger)
         self.logger = decision_logic.logger  # Logger-Referenz!
 
@@ -79,14 +87,30 @@ class WorkerOrchestrator:
 
         # Optional-output gating: the decision logic declares which worker
         # signals it reads; workers skip computing the rest. SUBSCRIBE_ALL leaves
-        # the worker computing every output (bit-identical compute-all).
-        for instance_name, requirement in decision_logic.get_required_workers().items():
+        # the worker computing every output (bit-identical compute-all). With
+        # variant decision logics a worker computes the union of what they read.
+        requested_outputs: Dict[str, Optional[Set[str]]] = {}
+        for logic in [decision_logic] + self.variant_decision_logics:
+            for instance_name, requirement in logic.get_required_workers().items():
+                if requirement.signals is SUBSCRIBE_ALL:
+                    requested_outputs[instance_name] = None
+                elif requested_outputs.get(instance_name, set()) is not None:
+                    requested_outputs[instance_name] = (
+                        requested_outputs.get(instance_name, set()) | set(requirement.signals))
+        for instance_name, signals in requested_outputs.items():
             worker = self.workers.get(instance_name)
-            if worker is not None and requirement.signals is not SUBSCRIBE_ALL:
-                worker.set_requested_outputs(set(requirement.signals))
+            if worker is not None and signals is not None:
+                worker.set_requested_outputs(signals)
 
         self.is_initialized = False
         self._worker_results: Dict[str, WorkerResult] = {}
+        # Bars of the last process_workers pass — the tick log of compute_decision(log_tick=True)
+        self._pass_bars: Tuple[Dict[str, Bar], Dict[str, List[Bar]]] = ({}, {})
+
+        # Worker output cache: per-bar output series of the cacheable workers, replayed
+        # instead of computed (attach_output_cache; empty = every worker computes)
+        self._output_cache: Optional[WorkerOutputCache] = None
+        self._output_series: Dict[str, WorkerOutputSeries] = {}
 
         # Signal-outage edge detection (#434): SIGNAL workers + last stale state
         self._signal_workers: Dict[str, AbstractSignalWorker] = {
@@ -158,12 +182,12 @@ class WorkerOrchestrator:
                 )
                 worker.set_performance_logger(perf_tracker)
 
-            decision_logic_type = self._extract_decision_logic_type(decision_logic)
-            decision_perf_tracker = DecisionLogicPerformanceTracker(
-                decision_logic_type=decision_logic_type,
-                decision_logic_name=decision_logic.name
-            )
-            decision_logic.set_performance_logger(decision_perf_tracker)
+            for logic in [decision_logic] + self.variant_decision_logics:
+                decision_perf_tracker = DecisionLogicPerformanceTracker(
+                    decision_logic_type=self._extract_decision_logic_type(logic),
+                    decision_logic_name=logic.name
+                )
+                logic.set_performance_logger(decision_perf_tracker)
 
         # Log configuration
         decision_logic.logger.debug(
@@ -398,6 +422,59 @@ class WorkerOrchestrator:
         Returns:
             Decision object (from DecisionLogic)
         """
+        bar_history = bar_history or {}
+        self.process_workers(tick, current_bars, bar_history, bar_render_state)
+
+        # ============================================
+        # Delegate to DecisionLogic
+        # ============================================
+        # Time decision logic execution
+        decision_start = time.perf_counter()
+
+        decision = self.decision_logic.compute_tick(
+            tick=tick,
+            worker_results=self._worker_results
+        )
+
+        # ============================================
+        # OPTIMIZED LOGGING (with caching)
+        # ============================================
+        self.tick_logger.log_tick_data(
+            tick=tick,
+            worker_results=self._worker_results,
+            current_bars=current_bars,
+            bar_history=bar_history,
+            decision=decision
+        )
+
+        decision_time_ms = (time.perf_counter() - decision_start) * 1000
+
+        # Record decision logic performance
+        if self.decision_logic.performance_logger:
+            self.decision_logic.performance_logger.record(
+                decision_time_ms, decision)
+
+        return decision
+
+    def process_workers(
+        self,
+        tick: TickData,
+        current_bars: Dict[str, Bar],
+        bar_history: Dict[str, List[Bar]] = None,
+        bar_render_state: Optional[BarRenderState] = None,
+    ) -> None:
+        """
+        Process tick through all workers (the worker half of process_tick).
+
+        A multi-decision loop calls this once per tick and then compute_decision()
+        once per decision stack — the workers never run twice for one tick.
+
+        Args:
+            tick: Current tick data
+            current_bars: Current bars per timeframe
+            bar_history: Historical bars per timeframe
+            bar_render_state: Bar-lifecycle transitions for this pass (close set)
+        """
         if not self.is_initialized:
             raise RuntimeError("Coordinator not initialized")
 
@@ -405,6 +482,7 @@ class WorkerOrchestrator:
         self._coordination_stats.ticks_processed += 1
 
         bar_history = bar_history or {}
+        self._pass_bars = (current_bars, bar_history)
         closed_timeframes = (
             bar_render_state.closed_timeframes if bar_render_state else set()
         )
@@ -427,34 +505,45 @@ class WorkerOrchestrator:
         if self._signal_workers:
             self._process_signal_pass(tick.timestamp)
 
-        # ============================================
-        # Delegate to DecisionLogic
-        # ============================================
-        # Time decision logic execution
-        decision_start = time.perf_counter()
+    def compute_decision(
+        self,
+        decision_logic: AbstractDecisionLogic,
+        tick: TickData,
+        log_tick: bool = False,
+    ) -> Decision:
+        """
+        Compute one decision logic's decision on the current worker results.
 
-        decision = self.decision_logic.compute_tick(
-            tick=tick,
-            worker_results=self._worker_results
-        )
+        The decision half of process_tick for a multi-decision loop. The VERBOSE
+        tick log is written for one stack only (log_tick — the primary), with the
+        bars of the process_workers pass.
 
-        # ============================================
-        # OPTIMIZED LOGGING (with caching)
-        # ============================================
-        self.tick_logger.log_tick_data(
+        Args:
+            decision_logic: The primary or one of the variant decision logics
+            tick: Current tick data (process_workers already ran for it)
+            log_tick: Write the tick log for this decision (the primary stack)
+
+        Returns:
+            Decision object (from the given DecisionLogic)
+        """
+        decision_start = time.perf_counter()
+        decision = decision_logic.compute_tick(
             tick=tick,
-            worker_results=self._worker_results,
-            current_bars=current_bars,
-            bar_history=bar_history,
-            decision=decision
+            worker_results=self._worker_results
         )
-
+        if log_tick:
+            current_bars, bar_history = self._pass_bars
+            self.tick_logger.log_tick_data(
+                tick=tick,
+                worker_results=self._worker_results,
+                current_bars=current_bars,
+                bar_history=bar_history,
+                decision=decision
+            )
         decision_time_ms = (time.perf_counter() - decision_start) * 1000
 
-        # Record decision logic performance
-        if self.decision_logic.performance_logger:
-            self.decision_logic.performance_logger.record(
-                decision_time_ms, decision)
+        if decision_logic.performance_logger:
+            decision_logic.performance_logger.record(decision_time_ms, decision)
 
         return decision
 
@@ -511,8 +600,9 @@ class WorkerOrchestrator:
             is_stale = result.is_stale
             if is_stale and not self._signal_stale_state.get(name, False):
                 self._signal_episode_open[name] = tick_time
-                self.decision_logic.on_signal_stale(
-                    worker_name=name, signal_kind=worker.get_consumed_signal_kind())
+                for logic in [self.decision_logic] + self.variant_decision_logics:
+                    logic.on_signal_stale(
+                        worker_name=name, signal_kind=worker.get_consumed_signal_kind())
             elif not is_stale and self._signal_episode_open.get(name) is not None:
                 self._close_signal_episode(name, worker, tick_time)
             self._signal_stale_state[name] = is_stale
@@ -653,7 +743,9 @@ class WorkerOrchestrator:
         self._process_signal_pass(now, count_tick=False)
         return merged
 
-    def process_heartbeat(self) -> Optional[Decision]:
+    def process_heartbeat(
+        self, decision_logic: Optional[AbstractDecisionLogic] = None
+    ) -> Optional[Decision]:
         """
         Run a decision ghost-pass for the idle heartbeat (#360).
 
@@ -669,24 +761,29 @@ class WorkerOrchestrator:
         heartbeat here instead of forwarding the cache. Default today: cache
         forward — tick-driven workers have no fresh input between ticks.
 
+        Args:
+            decision_logic: The decision logic to run (None → the primary one;
+                a multi-decision loop passes each stack's own)
+
         Returns:
             The ghost-pass Decision, or None if the logic does not opt in
         """
         if not self.is_initialized:
             raise RuntimeError("Coordinator not initialized")
-        if not self.decision_logic.wants_heartbeat():
+        decision_logic = decision_logic or self.decision_logic
+        if not decision_logic.wants_heartbeat():
             return None
 
         decision_start = time.perf_counter()
-        decision = self.decision_logic.compute_heartbeat(
+        decision = decision_logic.compute_heartbeat(
             worker_results=self._worker_results
         )
         if decision is None:
             return None
         decision_time_ms = (time.perf_counter() - decision_start) * 1000
 
-        if self.decision_logic.performance_logger:
-            self.decision_logic.performance_logger.record(
+        if decision_logic.performance_logger:
+            decision_logic.performance_logger.record(
                 decision_time_ms, decision)
 
         return decision
@@ -775,6 +872,8 @@ class WorkerOrchestrator:
             if self._worker_needs_recompute(
                 name, worker, tick, bar_updated, closed_timeframes
             ):
+                if self._replay_cached_output(name, worker, bar_history):
+                    continue
                 start_time = time.perf_counter()
 
                 try:
@@ -789,6 +888,7 @@ class WorkerOrchestrator:
 
                     self._worker_results[name] = result
                     worker.set_state(WorkerState.READY)
+                    self._remember_output(name, worker, bar_history, result)
 
                     # Record worker performance (tick index → idle/ratio telemetry, #420)
                     if worker.performance_logger:
@@ -824,7 +924,7 @@ class WorkerOrchestrator:
             for name, worker in self.workers.items()
             if self._worker_needs_recompute(
                 name, worker, tick, bar_updated, closed_timeframes
-            )
+            ) and not self._replay_cached_output(name, worker, bar_history)
         ]
 
         if not workers_to_compute:
@@ -852,6 +952,7 @@ class WorkerOrchestrator:
 
                 self._worker_results[name] = result
                 worker.set_state(WorkerState.READY)
+                self._remember_output(name, worker, bar_history, result)
 
                 # Track sequential time for comparison
                 sequential_time_estimate += computation_time_ms
@@ -877,6 +978,90 @@ class WorkerOrchestrator:
             # Record parallel performance
             self._coordination_stats.parallel_time_saved_ms += time_saved
 
+    # ============================================
+    # Worker output cache
+    # ============================================
+
+    def attach_output_cache(self, cache: WorkerOutputCache, series_key: str) -> int:
+        """
+        Replay the cacheable workers' outputs from the worker output cache.
+
+        Loads the stored per-bar series of every BAR_CLOSE indicator worker for this
+        scenario's bar series. Must run after the output gating (__init__) — the gated
+        output set is part of the worker key.
+
+        Args:
+            cache: The worker output cache
+            series_key: The scenario's bar-series key (WorkerOutputCache.series_key)
+
+        Returns:
+            Number of workers served through the cache
+        """
+        self._output_cache = cache
+        for name, worker in self.workers.items():
+            if WorkerOutputCache.is_cacheable(worker):
+                self._output_series[name] = cache.load(
+                    WorkerOutputCache.worker_key(series_key, worker))
+        stored = sum(1 for series in self._output_series.values() if series.entries)
+        self.logger.debug(
+            f"♻️ Worker output cache: {len(self._output_series)} cacheable worker(s), "
+            f"{stored} with a stored series")
+        return len(self._output_series)
+
+    def _replay_cached_output(
+        self,
+        name: str,
+        worker: AbstractWorker,
+        bar_history: Dict[str, List[Bar]],
+    ) -> bool:
+        """
+        Serve a due compute from the worker's cached series, if it holds this bar.
+
+        Args:
+            name: Worker instance name
+            worker: Worker instance
+            bar_history: Historical bars per timeframe
+
+        Returns:
+            True if the result was replayed (compute skipped)
+        """
+        series = self._output_series.get(name)
+        if series is None:
+            return False
+        result = series.entries.get(WorkerOutputCache.bar_key(worker, bar_history))
+        if result is None:
+            return False
+        self._worker_results[name] = result
+        worker.set_state(WorkerState.READY)
+        # The replay stands in for a compute at this tick — the idle/ratio telemetry (#420)
+        if worker.performance_logger:
+            worker.performance_logger.record_cache_hit(
+                tick_index=self._coordination_stats.ticks_processed)
+        return True
+
+    def _remember_output(
+        self,
+        name: str,
+        worker: AbstractWorker,
+        bar_history: Dict[str, List[Bar]],
+        result: WorkerResult,
+    ) -> None:
+        """Add a computed result of a cacheable worker to its series (a cache miss)."""
+        series = self._output_series.get(name)
+        if series is None:
+            return
+        series.entries[WorkerOutputCache.bar_key(worker, bar_history)] = result
+        series.dirty = True
+        if worker.performance_logger:
+            worker.performance_logger.record_cache_miss()
+
+    def flush_output_cache(self) -> None:
+        """Persist the series that gained entries this run (no-op without a cache)."""
+        if self._output_cache is None:
+            return
+        for name, series in self._output_series.items():
+            self._output_cache.save(series, self.workers[name])
+
     def _filter_bar_history_for_worker(
         self, worker: AbstractWorker, bar_history: Dict[str, List[Bar]]
     ) -> Dict[str, List[Bar]]:
@@ -71,6 +71,21 @@ class WorkerPerformanceTracker:
         self._max_time_ms = max(self._max_time_ms, execution_time_ms)
         self._recent_times.append(execution_time_ms)
 
+    def record_cache_hit(self, tick_index: int = -1) -> None:
+        """
+        Record a due compute served from the worker output cache (no compute ran).
+
+        Args:
+            tick_index: Loop tick index of the replayed compute, for the idle/ratio telemetry (#420)
+        """
+        self._stats.worker_cache_hits += 1
+        if tick_index >= 0:
+            self._stats.worker_last_compute_tick = tick_index
+
+    def record_cache_miss(self) -> None:
+        """Record a compute of a cacheable worker whose bar was not cached yet."""
+        self._stats.worker_cache_misses += 1
+
     def get_stats(self) -> WorkerPerformanceStats:
         """
         Get performance statistics snapshot.
@@ -33,6 +33,7 @@ _KNOWN_EXECUTION_KEYS: frozenset = frozenset({
     'parallel_workers', 'worker_parallel_threshold_ms',
     'adaptive_parallelization', 'performance_tracking',
     'strict_parameter_validation', 'tick_processing_budget_ms',
+    'scenario_chunks',
 })
 _KNOWN_TRADE_SIM_KEYS: frozenset = frozenset({
     'balances', 'seeds', 'inbound_latency_min_ms',
@@ -198,3 +198,77 @@ def initialize_batch_and_run(
         )
 
     return None
+
+
+def initialize_multi_decision_batch_and_run(
+    scenario_configs: List[LoadedScenarioConfig],
+    app_config_loader: AppConfigManager,
+    sweep_contexts: List[SweepContext],
+    mount: Optional[MountPackage] = None,
+    run_group: Optional[str] = None,
+) -> List[Optional[BatchExecutionSummary]]:
+    """
+    Run several combinations that differ only in decision_logic_config as ONE batch.
+
+    The first combination's scenario set runs; each of its scenario processes carries the
+    other combinations' decision_logic_config as extra decision stacks on the same worker
+    pipeline. The summary is then split per combination and reported through each
+    combination's own scenario set + sweep context — exactly as separate runs would be.
+
+    Args:
+        scenario_configs: The combinations' loaded scenario configs (same scenarios, same
+            workers — only decision_logic_config differs)
+        app_config_loader: Application configuration
+        sweep_contexts: Sweep tagging per combination (index-synced)
+        mount: Optional shared data mount (#419)
+        run_group: Optional log-grouping dir (e.g. 'sweeps/<sweep_id>')
+
+    Returns:
+        One BatchExecutionSummary per combination (all None if the batch failed at startup)
+    """
+    try:
+        scenario_sets = [
+            ScenarioSet(scenario_config_data, app_config_loader, run_group=run_group)
+            for scenario_config_data in scenario_configs]
+
+        vLog.info("📊 Writing system & version information...")
+        for scenario_set in scenario_sets:
+            scenario_set.write_scenario_system_info_log()
+            scenario_set.copy_config_snapshot()
+
+        primary_set = scenario_sets[0]
+        for index, scenario in enumerate(primary_set.get_all_scenarios()):
+            scenario.decision_variants = [
+                scenario_set.get_all_scenarios()[index].strategy_config.get('decision_logic_config', {})
+                for scenario_set in scenario_sets[1:]]
+
+        orchestrator = BatchOrchestrator(primary_set, app_config_loader)
+        batch_execution_summary = orchestrator.run(mount=mount)
+
+        summaries: List[Optional[BatchExecutionSummary]] = []
+        for variant, (scenario_set, sweep_context) in enumerate(zip(scenario_sets, sweep_contexts)):
+            variant_summary = batch_execution_summary.for_decision_variant(
+                variant, [scenario.strategy_config for scenario in scenario_set.get_all_scenarios()])
+            report_coordinator = BatchReportCoordinator(
+                batch_execution_summary=variant_summary,
+                scenario_set=scenario_set,
+                app_config=app_config_loader,
+                sweep_context=sweep_context
+            )
+            report_coordinator.generate_and_log()
+            summaries.append(variant_summary)
+        return summaries
+
+    except FileNotFoundError as e:
+        vLog.config_error(
+            f"Config file not found: {e}",
+            file_path=str(e)
+        )
+
+    except Exception as e:
+        vLog.hard_error(
+            f"Unexpected error during strategy test",
+            exception=e
+        )
+
+    return [None] * len(scenario_configs)
@@ -0,0 +1,118 @@
+"""
+File Interval Index Tests
+=========================
+Time-range lookups of the index managers run on per-symbol sorted int64 start/end
+arrays (FileIntervalIndex) instead of parsing every entry's timestamps per call.
+The result must equal the linear scan it replaced.
+
+Covers:
+- Overlap parity with a brute-force scan, including overlapping files
+- Predecessor selection (signal as-of contract) parity
+- Cached arrays are rebuilt after the entry list changes
+"""
+
+import random
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from python.data_management.index.file_interval_index import FileIntervalIndex
+from python.data_management.index.tick_index_manager import TickIndexManager
+
+
+BASE = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _entries(count: int, seed: int = 7):
+    """Random hourly-ish files, some overlapping, sorted by start like the managers."""
+    rng = random.Random(seed)
+    entries = []
+    for i in range(count):
+        start = BASE + timedelta(minutes=rng.randrange(0, 60 * 24 * 30))
+        end = start + timedelta(minutes=rng.randrange(1, 60 * 12))
+        entries.append({
+            'path': f'/data/file_{i}.parquet',
+            'start_time': start.isoformat(),
+            'end_time': end.isoformat(),
+        })
+    entries.sort(key=lambda e: e['start_time'])
+    return entries
+
+
+def _linear_overlap(entries, start, end):
+    return [
+        e for e in entries
+        if datetime.fromisoformat(e['start_time']) <= end
+        and datetime.fromisoformat(e['end_time']) >= start
+    ]
+
+
+def _linear_with_predecessor(entries, start, end):
+    relevant, covers_start, preceding = [], False, None
+    for e in entries:
+        file_start = datetime.fromisoformat(e['start_time'])
+        file_end = datetime.fromisoformat(e['end_time'])
+        if file_start <= end and file_end >= start:
+            relevant.append(e)
+            covers_start = covers_start or file_start <= start
+        elif file_end < start:
+            preceding = e
+    if not covers_start and preceding is not None:
+        relevant.insert(0, preceding)
+    return relevant
+
+
+def _queries(count: int, seed: int = 11):
+    rng = random.Random(seed)
+    for _ in range(count):
+        start = BASE + timedelta(minutes=rng.randrange(-600, 60 * 24 * 31))
+        yield start, start + timedelta(minutes=rng.randrange(0, 60 * 48))
+
+
+class TestOverlapParity:
+    """Binary search == linear scan."""
+
+    def test_overlapping(self):
+        entries = _entries(400)
+        index = FileIntervalIndex(entries)
+        for start, end in _queries(300):
+            assert index.overlapping(start, end) == _linear_overlap(entries, start, end)
+
+    def test_overlapping_with_predecessor(self):
+        entries = _entries(400, seed=3)
+        index = FileIntervalIndex(entries)
+        for start, end in _queries(300, seed=5):
+            assert index.overlapping_with_predecessor(start, end) == \
+                _linear_with_predecessor(entries, start, end)
+
+    def test_naive_bounds_read_as_utc(self):
+        entries = _entries(50)
+        index = FileIntervalIndex(entries)
+        start, end = BASE + timedelta(days=3), BASE + timedelta(days=4)
+        assert index.overlapping(start.replace(tzinfo=None), end.replace(tzinfo=None)) == \
+            index.overlapping(start, end)
+
+    def test_empty(self):
+        index = FileIntervalIndex([])
+        assert index.overlapping(BASE, BASE + timedelta(days=1)) == []
+        assert index.overlapping_with_predecessor(BASE, BASE + timedelta(days=1)) == []
+
+
+class TestManagerLookup:
+    """TickIndexManager keeps one interval index per symbol, rebuilt on change."""
+
+    def test_rebuilt_after_entry_list_changes(self, tmp_path):
+        manager = TickIndexManager(data_dir=str(tmp_path))
+        entries = _entries(20)
+        manager.index = {'kraken_spot': {'BTCUSD': entries}}
+        start, end = BASE, BASE + timedelta(days=40)
+
+        assert len(manager.get_relevant_files('kraken_spot', 'BTCUSD', start, end)) == 20
+        cached = manager._interval_indexes[('kraken_spot', 'BTCUSD')]
+        manager.get_relevant_files('kraken_spot', 'BTCUSD', start, end)
+        assert manager._interval_indexes[('kraken_spot', 'BTCUSD')] is cached
+
+        # Incremental refresh drops a file → new list → new arrays
+        manager._remove_paths({entries[0]['path']})
+        files = manager.get_relevant_files('kraken_spot', 'BTCUSD', start, end)
+        assert Path(entries[0]['path']) not in files
+        assert len(files) == 19
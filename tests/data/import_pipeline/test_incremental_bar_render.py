@@ -0,0 +1,154 @@
+"""
+Incremental Bar Rendering Tests
+================================
+Splicing the bars of newly imported tick ranges into existing bar files
+must produce exactly what a full re-render of the whole archive produces.
+
+Covers:
+- Append: new file after the archive, sharing a boundary day
+- Replace: a file overwritten in the middle of the archive (override import)
+- Render windows: aligned to D1 buckets, overlapping ranges merged
+- Fallback: no bar files yet → full render
+"""
+
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from python.data_management.importers.bar_importer import (
+    BarImporter,
+    _aligned_render_windows,
+)
+from python.data_management.index.tick_index_manager import TickIndexManager
+from python.framework.utils.timeframe_config_utils import TimeframeConfig
+
+
+BROKER_TYPE = 'kraken_spot'
+SYMBOL = 'BTCUSD'
+
+
+def _write_tick_file(data_dir: Path, start: str, end: str, seed: int) -> Path:
+    """Tick parquet with irregular spacing and same-timestamp bursts."""
+    rng = np.random.default_rng(seed)
+    base = pd.date_range(start, end, freq='7min')
+    timestamps = base.repeat(rng.integers(1, 4, len(base)))
+    bid = 40000.0 + np.cumsum(rng.normal(0, 5, len(timestamps)))
+    time_msc = (timestamps.asi8 // 1_000_000).astype('int64')
+    df = pd.DataFrame({
+        'timestamp': timestamps,
+        'time_msc': time_msc,
+        'collected_msc': time_msc,
+        'bid': bid.astype('float32'),
+        'ask': (bid + 1.0).astype('float32'),
+        'real_volume': rng.uniform(0.01, 2.0, len(timestamps)).astype('float32'),
+        'spread_points': np.full(len(timestamps), 10, dtype='int32'),
+        'session': '24h',
+    })
+    target = data_dir / BROKER_TYPE / 'ticks' / SYMBOL
+    target.mkdir(parents=True, exist_ok=True)
+    path = target / f"{SYMBOL}_{pd.Timestamp(start).strftime('%Y%m%d_%H%M%S')}.parquet"
+    table = pa.Table.from_pandas(df).replace_schema_metadata({
+        'broker_type': BROKER_TYPE, 'data_format_version': '1.3.0', 'source_file': path.name,
+    })
+    pq.write_table(table, path)
+    return path
+
+
+def _reindex(data_dir: Path) -> None:
+    TickIndexManager(data_dir=str(data_dir)).build_index(force_rebuild=True)
+
+
+def _full_render(data_dir: Path) -> None:
+    _reindex(data_dir)
+    BarImporter(data_dir=str(data_dir)).render_bars_for_all_symbols(
+        broker_types=[BROKER_TYPE], clean_mode=True)
+
+
+def _read_bars(data_dir: Path) -> List[pd.DataFrame]:
+    bars_dir = data_dir / BROKER_TYPE / 'bars' / SYMBOL
+    return [
+        pd.read_parquet(bars_dir / f"{SYMBOL}_{tf}_BARS.parquet")
+        for tf in TimeframeConfig.sorted()
+    ]
+
+
+def _assert_same_bars(incremental_dir: Path, full_dir: Path) -> None:
+    for spliced, full in zip(_read_bars(incremental_dir), _read_bars(full_dir)):
+        pd.testing.assert_frame_equal(spliced, full)
+
+
+class TestSpliceParity:
+    """Incremental splice == full re-render."""
+
+    def test_append_new_file(self, tmp_path):
+        incremental, full = tmp_path / 'incremental', tmp_path / 'full'
+        for data_dir in (incremental, full):
+            _write_tick_file(data_dir, '2026-01-05 00:03', '2026-01-07 13:00', seed=1)
+
+        _full_render(incremental)
+        _write_tick_file(incremental, '2026-01-07 13:05', '2026-01-09 22:00', seed=2)
+        _reindex(incremental)
+        BarImporter(data_dir=str(incremental)).render_bars_for_ranges({
+            (BROKER_TYPE, SYMBOL): [(pd.Timestamp('2026-01-07 13:05'),
+                                     pd.Timestamp('2026-01-09 22:00'))],
+        })
+
+        _write_tick_file(full, '2026-01-07 13:05', '2026-01-09 22:00', seed=2)
+        _full_render(full)
+
+        _assert_same_bars(incremental, full)
+
+    def test_replace_file_in_the_middle(self, tmp_path):
+        incremental, full = tmp_path / 'incremental', tmp_path / 'full'
+        spans = [('2026-01-05 00:00', '2026-01-06 10:00'),
+                 ('2026-01-06 10:05', '2026-01-07 20:00'),
+                 ('2026-01-07 20:05', '2026-01-09 08:00')]
+        for data_dir in (incremental, full):
+            for seed, (start, end) in enumerate(spans):
+                _write_tick_file(data_dir, start, end, seed=seed)
+
+        _full_render(incremental)
+        # Override import: the middle file is rewritten with different prices
+        for data_dir in (incremental, full):
+            _write_tick_file(data_dir, *spans[1], seed=99)
+        _reindex(incremental)
+        BarImporter(data_dir=str(incremental)).render_bars_for_ranges({
+            (BROKER_TYPE, SYMBOL): [(pd.Timestamp(spans[1][0]), pd.Timestamp(spans[1][1]))],
+        })
+        _full_render(full)
+
+        _assert_same_bars(incremental, full)
+
+    def test_missing_bar_files_fall_back_to_full_render(self, tmp_path):
+        _write_tick_file(tmp_path, '2026-01-05 00:00', '2026-01-06 00:00', seed=3)
+        _reindex(tmp_path)
+        BarImporter(data_dir=str(tmp_path)).render_bars_for_ranges({
+            (BROKER_TYPE, SYMBOL): [(pd.Timestamp('2026-01-05 00:00'),
+                                     pd.Timestamp('2026-01-06 00:00'))],
+        })
+        assert all(len(bars) > 0 for bars in _read_bars(tmp_path))
+
+
+class TestRenderWindows:
+    """Touched ranges → D1-aligned, merged windows."""
+
+    def test_aligned_to_day_boundaries(self):
+        windows = _aligned_render_windows(
+            [(pd.Timestamp('2026-01-05 13:20'), pd.Timestamp('2026-01-06 02:00'))])
+        assert windows == [(pd.Timestamp('2026-01-05', tz='UTC'),
+                            pd.Timestamp('2026-01-07', tz='UTC'))]
+
+    def test_overlapping_ranges_merged(self):
+        windows = _aligned_render_windows([
+            (pd.Timestamp('2026-01-10 05:00'), pd.Timestamp('2026-01-10 06:00')),
+            (pd.Timestamp('2026-01-05 01:00'), pd.Timestamp('2026-01-05 02:00')),
+            (pd.Timestamp('2026-01-10 22:00'), pd.Timestamp('2026-01-11 01:00')),
+        ])
+        assert windows == [
+            (pd.Timestamp('2026-01-05', tz='UTC'), pd.Timestamp('2026-01-06', tz='UTC')),
+            (pd.Timestamp('2026-01-10', tz='UTC'), pd.Timestamp('2026-01-12', tz='UTC')),
+        ]
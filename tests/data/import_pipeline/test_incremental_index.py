@@ -0,0 +1,210 @@
+"""
+Incremental Index Tests
+=======================
+Every index entry records the (path, size, mtime) of its data file. Loading an
+index refreshes it against the tree: only new or changed files are rescanned,
+entries of deleted files are dropped. Importers update only the files they wrote.
+
+Covers:
+- Refresh: unchanged tree rescans nothing, new / changed / deleted files are applied
+- Legacy index without fingerprint columns: rescanned once, then stable
+- update_entries: exactly the given files, deleted paths dropped
+- Importers: tick and signal imports rescan only their own files
+"""
+
+import os
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from python.data_management.importers.tick_importer import TickDataImporter
+from python.data_management.index.signal_index_manager import SignalIndexManager
+from python.data_management.index.tick_index_manager import TickIndexManager
+from python.framework.types.signal_data_types import SignalParquetColumn
+from tests.data.import_pipeline.conftest import (
+    build_minimal_tick_json,
+    find_tick_parquets,
+    write_json_fixture,
+)
+
+
+def _import(root: Path, symbol: str, start_time: str = '2026.01.15 10:00:00') -> TickDataImporter:
+    """Helper: import one synthetic tick JSON into root/target (index included)."""
+    data = build_minimal_tick_json(
+        symbol=symbol, broker_type='kraken_spot', start_time=start_time, tick_count=20)
+    day = start_time[:10].replace('.', '')
+    write_json_fixture(root / 'source', f"{symbol}_{day}_ticks.json", data)
+
+    importer = TickDataImporter(
+        source_dir=str(root / 'source'),
+        target_dir=str(root / 'target'),
+        offset_registry={'kraken_spot': 0},
+        move_processed_files=True,
+        auto_render_bars=False,
+    )
+    importer.process_all_exports()
+    return importer
+
+
+@pytest.fixture
+def scan_counter(monkeypatch):
+    """Count TickIndexManager._scan_file calls."""
+    calls = []
+    original = TickIndexManager._scan_file
+
+    def counting(self, parquet_file):
+        calls.append(Path(parquet_file).name)
+        return original(self, parquet_file)
+
+    monkeypatch.setattr(TickIndexManager, '_scan_file', counting)
+    return calls
+
+
+def _load(target: Path) -> TickIndexManager:
+    manager = TickIndexManager(data_dir=str(target))
+    manager.build_index()
+    return manager
+
+
+class TestRefresh:
+    """build_index() refreshes the loaded index from file fingerprints."""
+
+    def test_unchanged_tree_rescans_nothing(self, tmp_path, scan_counter):
+        _import(tmp_path, 'BTCUSD')
+        _import(tmp_path, 'ETHUSD')
+        scan_counter.clear()
+
+        manager = _load(tmp_path / 'target')
+        assert scan_counter == []
+        assert not manager.needs_rebuild()
+        assert manager.list_symbols('kraken_spot') == ['BTCUSD', 'ETHUSD']
+
+    def test_new_changed_and_deleted_files(self, tmp_path, scan_counter):
+        _import(tmp_path, 'BTCUSD')
+        _import(tmp_path, 'ETHUSD')
+        target = tmp_path / 'target'
+        index_file = target / TickIndexManager.INDEX_FILE_PARQUET
+        btc, eth = sorted(find_tick_parquets(target), key=lambda p: p.name)
+
+        # New file (copied outside an import), changed file, deleted file
+        new_file = btc.with_name('BTCUSD_copy.parquet')
+        new_file.write_bytes(btc.read_bytes())
+        stat = eth.stat()
+        os.utime(eth, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        btc.unlink()
+        index_before = index_file.stat().st_mtime_ns
+        scan_counter.clear()
+
+        manager = _load(target)
+        assert sorted(scan_counter) == sorted([new_file.name, eth.name])
+        paths = {e['path'] for e in manager._iter_entries()}
+        assert paths == {str(new_file.absolute()), str(eth.absolute())}
+        assert index_file.stat().st_mtime_ns != index_before
+
+        # Persisted: the next load is clean again
+        scan_counter.clear()
+        _load(target)
+        assert scan_counter == []
+
+    def test_check_stale_false_loads_as_is(self, tmp_path, scan_counter):
+        _import(tmp_path, 'BTCUSD')
+        target = tmp_path / 'target'
+        find_tick_parquets(target)[0].unlink()
+        scan_counter.clear()
+
+        manager = TickIndexManager(data_dir=str(target))
+        manager.build_index(check_stale=False)
+        assert len(manager.get_symbol_entries('kraken_spot', 'BTCUSD')) == 1
+        assert manager.needs_rebuild()
+
+
+class TestLegacyIndex:
+    """An index written before the fingerprint columns existed."""
+
+    def test_rescanned_once(self, tmp_path, scan_counter):
+        _import(tmp_path, 'BTCUSD')
+        target = tmp_path / 'target'
+        index_file = target / TickIndexManager.INDEX_FILE_PARQUET
+        df = pd.read_parquet(index_file)
+        df.drop(columns=['file_size_bytes', 'file_mtime_ns']).to_parquet(index_file)
+        scan_counter.clear()
+
+        manager = _load(target)
+        assert len(scan_counter) == 1
+        entry = manager.get_symbol_entries('kraken_spot', 'BTCUSD')[0]
+        assert entry['file_mtime_ns'] == find_tick_parquets(target)[0].stat().st_mtime_ns
+
+        scan_counter.clear()
+        _load(target)
+        assert scan_counter == []
+
+
+class TestUpdateEntries:
+    """update_entries() touches exactly the given files."""
+
+    def test_deleted_path_dropped_others_kept(self, tmp_path, scan_counter):
+        _import(tmp_path, 'BTCUSD')
+        _import(tmp_path, 'ETHUSD')
+        target = tmp_path / 'target'
+        btc, eth = sorted(find_tick_parquets(target), key=lambda p: p.name)
+        btc.unlink()
+        scan_counter.clear()
+
+        manager = TickIndexManager(data_dir=str(target))
+        manager.update_entries([btc])
+        assert scan_counter == []
+        assert manager.list_symbols('kraken_spot') == ['ETHUSD']
+
+    def test_without_index_builds_fully(self, tmp_path):
+        _import(tmp_path, 'BTCUSD')
+        target = tmp_path / 'target'
+        (target / TickIndexManager.INDEX_FILE_PARQUET).unlink()
+
+        manager = TickIndexManager(data_dir=str(target))
+        manager.update_entries([])
+        assert manager.list_symbols('kraken_spot') == ['BTCUSD']
+
+
+class TestImporterUpdates:
+    """Importers rescan only the files they wrote."""
+
+    def test_tick_import_scans_only_new_file(self, tmp_path, scan_counter):
+        _import(tmp_path, 'BTCUSD')
+        scan_counter.clear()
+
+        importer = _import(tmp_path, 'ETHUSD')
+        assert [p.name for p in importer._index_updates] == scan_counter
+        assert len(scan_counter) == 1
+        assert _load(tmp_path / 'target').list_symbols('kraken_spot') == ['BTCUSD', 'ETHUSD']
+
+    def test_signal_index_refresh(self, tmp_path, monkeypatch):
+        signals = tmp_path / 'signals'
+        cols = [c.value for c in SignalParquetColumn]
+
+        def write_signal(name: str, symbol: str, start_msc: int) -> Path:
+            df = pd.DataFrame([{c: None for c in cols} for _ in range(2)])
+            df[SignalParquetColumn.COLLECTED_MSC.value] = [start_msc, start_msc + 60_000]
+            df[SignalParquetColumn.SYMBOL.value] = symbol
+            df[SignalParquetColumn.PIPELINE_ID.value] = 'news_sentiment'
+            path = signals / 'news_sentiment' / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(path, index=False)
+            return path
+
+        first = write_signal('a.parquet', 'BTCUSD', 1_768_471_200_000)
+        manager = SignalIndexManager(data_dir=str(signals))
+        manager.build_index()
+
+        calls = []
+        original = SignalIndexManager._scan_file
+        monkeypatch.setattr(
+            SignalIndexManager, '_scan_file',
+            lambda self, f: calls.append(f.name) or original(self, f))
+
+        write_signal('b.parquet', 'ETHUSD', 1_768_557_600_000)
+        first.unlink()
+        manager = SignalIndexManager(data_dir=str(signals))
+        manager.build_index()
+        assert calls == ['b.parquet']
+        assert list(manager.index['news_sentiment']) == ['ETHUSD']
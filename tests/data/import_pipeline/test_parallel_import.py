@@ -0,0 +1,138 @@
+"""
+Parallel Tick Import Tests
+==========================
+With import_workers > 1, files are converted in a process pool and committed
+serially in the main process. The result must equal the sequential import.
+
+Covers:
+- Parity: same Parquet files, tables and statistics as a sequential import
+- Duplicates: detected in the serial commit phase, no staging files left behind
+- Error isolation: a refused file does not stop the other workers
+- Log replay: buffered worker messages keep their level when flushed
+"""
+
+from pathlib import Path
+
+import pandas as pd
+
+from python.data_management.importers import tick_importer
+from python.data_management.importers.tick_importer import TickDataImporter
+from python.data_management.index.tick_index_manager import TickIndexManager
+from tests.data.import_pipeline.conftest import (
+    build_minimal_tick_json,
+    find_tick_parquets,
+    write_json_fixture,
+)
+
+
+FIXTURES = [
+    ('BTCUSD', 'kraken_spot', '2026.01.15 10:00:00'),
+    ('BTCUSD', 'kraken_spot', '2026.01.16 10:00:00'),
+    ('ETHUSD', 'kraken_spot', '2026.01.15 10:00:00'),
+    ('EURUSD', 'mt5', '2026.01.15 10:00:00'),
+]
+
+
+def _write_fixtures(source: Path) -> None:
+    for symbol, broker_type, start_time in FIXTURES:
+        data = build_minimal_tick_json(
+            symbol=symbol, broker_type=broker_type, start_time=start_time, tick_count=20)
+        day = start_time[:10].replace('.', '')
+        write_json_fixture(source, f"{symbol}_{day}_ticks.json", data)
+
+
+def _import(root: Path, workers: int, override: bool = False) -> TickDataImporter:
+    importer = TickDataImporter(
+        source_dir=str(root / 'source'),
+        target_dir=str(root / 'target'),
+        offset_registry={'mt5': -3},
+        move_processed_files=False,
+        auto_render_bars=False,
+        override=override,
+        import_workers=workers,
+    )
+    importer.process_all_exports()
+    return importer
+
+
+class TestParallelParity:
+    """Process-pool import == sequential import."""
+
+    def test_same_files_and_tables(self, tmp_path):
+        for name in ('sequential', 'parallel'):
+            _write_fixtures(tmp_path / name / 'source')
+        sequential = _import(tmp_path / 'sequential', workers=1)
+        parallel = _import(tmp_path / 'parallel', workers=3)
+
+        assert parallel.processed_files == sequential.processed_files == len(FIXTURES)
+        assert parallel.total_ticks == sequential.total_ticks
+        assert parallel.errors == sequential.errors == []
+        assert parallel._touched_ranges == sequential._touched_ranges
+
+        def relative(root: Path):
+            return sorted(p.relative_to(root) for p in find_tick_parquets(root))
+
+        seq_target, par_target = tmp_path / 'sequential' / 'target', tmp_path / 'parallel' / 'target'
+        assert relative(seq_target) == relative(par_target)
+        for rel in relative(seq_target):
+            pd.testing.assert_frame_equal(
+                pd.read_parquet(seq_target / rel), pd.read_parquet(par_target / rel))
+
+        # Index built once, at the end, over all committed files
+        index = TickIndexManager(data_dir=str(par_target))
+        index.build_index()
+        assert len(index.get_symbol_entries('kraken_spot', 'BTCUSD')) == 2
+
+
+class TestParallelDuplicates:
+    """Duplicate checks run in the serial commit phase."""
+
+    def test_reimport_detected_per_file(self, tmp_path):
+        _write_fixtures(tmp_path / 'source')
+        _import(tmp_path, workers=3)
+        second = _import(tmp_path, workers=3)
+
+        assert second.processed_files == 0
+        assert sum('DUPLICATE' in w for w in second.warnings) == len(FIXTURES)
+        # Rejected conversions leave no staging files behind
+        target = tmp_path / 'target'
+        assert not [p for p in target.rglob('.*') if p.suffix in ('.staged', '.partial')]
+        assert len(find_tick_parquets(target)) == len(FIXTURES)
+
+    def test_override_replaces(self, tmp_path):
+        _write_fixtures(tmp_path / 'source')
+        _import(tmp_path, workers=3)
+        third = _import(tmp_path, workers=3, override=True)
+        assert third.processed_files == len(FIXTURES)
+        assert len(find_tick_parquets(tmp_path / 'target')) == len(FIXTURES)
+
+
+class TestParallelErrorIsolation:
+    """A refused file is reported, the others are committed."""
+
+    def test_validation_failure_isolated(self, tmp_path):
+        _write_fixtures(tmp_path / 'source')
+        broken = build_minimal_tick_json(symbol='XRPUSD', tick_count=5)
+        broken['ticks'][2]['bid'] = -1.0
+        write_json_fixture(tmp_path / 'source', 'XRPUSD_20260115_ticks.json', broken)
+
+        importer = _import(tmp_path, workers=3)
+        assert importer.processed_files == len(FIXTURES)
+        assert importer.errors == ['VALIDATION FAILED in XRPUSD_20260115_ticks.json']
+        assert not find_tick_parquets(tmp_path / 'target' / 'kraken_spot' / 'ticks' / 'XRPUSD')
+
+
+class TestParallelLogReplay:
+    """Worker log buffers are replayed at their original level."""
+
+    def test_worker_warning_replayed_as_warning(self, tmp_path, monkeypatch):
+        _write_fixtures(tmp_path / 'source')
+        write_json_fixture(tmp_path / 'source', 'XRPUSD_20260115_ticks.json',
+                           build_minimal_tick_json(symbol='XRPUSD', tick_count=0))
+        warnings, infos = [], []
+        monkeypatch.setattr(tick_importer.vLog, 'warning', warnings.append)
+        monkeypatch.setattr(tick_importer.vLog, 'info', infos.append)
+
+        _import(tmp_path, workers=3)
+        assert 'No ticks in XRPUSD_20260115_ticks.json' in warnings
+        assert 'No ticks in XRPUSD_20260115_ticks.json' not in infos
@@ -0,0 +1,175 @@
+"""
+Streaming JSON Import Tests
+===========================
+Large exports are parsed in chunks and written as Parquet row groups.
+The streamed result must be identical to the in-memory path.
+
+Covers:
+- Parity: same table and header metadata as the whole-file import (with offset)
+- Row groups: one per chunk
+- Validation across chunk boundaries (backwards step between two chunks)
+- Duplicate detection on streamed files, no partial file left behind
+- JsonTickStreamReader: header/trailer around the ticks array, tiny read blocks
+"""
+
+import json
+from pathlib import Path
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from python.data_management.importers import json_tick_stream_reader
+from python.data_management.importers.json_tick_stream_reader import JsonTickStreamReader
+from python.data_management.importers.tick_importer import TickDataImporter
+from python.framework.exceptions.data_quality_errors import TickFileValidationException
+from tests.data.import_pipeline.conftest import (
+    build_minimal_tick_json,
+    find_tick_parquets,
+    write_json_fixture,
+)
+
+
+def _import(tmp_path: Path, name: str, data: dict, streaming: bool,
+            chunk_ticks: int = 7, override: bool = False) -> TickDataImporter:
+    """Import one JSON fixture — streaming forced (threshold 0) or whole-file."""
+    write_json_fixture(tmp_path / name / 'source', 'EURUSD_20260115_ticks.json', data)
+    importer = TickDataImporter(
+        source_dir=str(tmp_path / name / 'source'),
+        target_dir=str(tmp_path / name / 'target'),
+        offset_registry={'mt5': -3},
+        auto_render_bars=False,
+        override=override,
+        streaming_threshold_mb=0 if streaming else None,
+        streaming_chunk_ticks=chunk_ticks,
+    )
+    importer.process_all_exports()
+    return importer
+
+
+def _streaming_importer(tmp_path: Path) -> TickDataImporter:
+    return TickDataImporter(
+        source_dir=str(tmp_path / 'source'),
+        target_dir=str(tmp_path / 'target'),
+        offset_registry={'mt5': -3},
+        auto_render_bars=False,
+        streaming_threshold_mb=0,
+        streaming_chunk_ticks=7,
+    )
+
+
+def _mt5_data(tick_count: int = 30) -> dict:
+    data = build_minimal_tick_json(
+        symbol='EURUSD', broker_type='mt5', tick_count=tick_count)
+    data['summary'] = {'total_ticks': tick_count}
+    return data
+
+
+class TestStreamingParity:
+    """Streamed import == whole-file import."""
+
+    def test_same_table_and_metadata(self, tmp_path):
+        data = _mt5_data()
+        _import(tmp_path, 'whole', data, streaming=False)
+        _import(tmp_path, 'streamed', data, streaming=True)
+
+        whole_file = find_tick_parquets(tmp_path / 'whole' / 'target')[0]
+        streamed_file = find_tick_parquets(tmp_path / 'streamed' / 'target')[0]
+        assert whole_file.name == streamed_file.name
+
+        pd.testing.assert_frame_equal(
+            pd.read_parquet(whole_file), pd.read_parquet(streamed_file))
+
+        whole_meta = pq.ParquetFile(whole_file).schema_arrow.metadata
+        streamed_meta = pq.ParquetFile(streamed_file).schema_arrow.metadata
+        for meta in (whole_meta, streamed_meta):
+            meta.pop(b'processed_at')
+            meta.pop(b'pandas', None)
+        assert whole_meta == streamed_meta
+        assert streamed_meta[b'tick_count'] == b'30'
+        assert streamed_meta[b'utc_conversion_applied'] == b'true'
+
+    def test_one_row_group_per_chunk(self, tmp_path):
+        importer = _import(tmp_path, 'streamed', _mt5_data(30), streaming=True)
+        parquet_file = find_tick_parquets(tmp_path / 'streamed' / 'target')[0]
+        assert pq.ParquetFile(parquet_file).num_row_groups == 5
+        assert importer.total_ticks == 30
+        # Only the finalized file remains — the partial file is gone
+        assert [p.name for p in parquet_file.parent.iterdir()] == [parquet_file.name]
+
+
+class TestStreamingValidation:
+    """Validation state is carried across chunk boundaries."""
+
+    def test_backwards_step_at_chunk_boundary_refused(self, tmp_path):
+        data = _mt5_data(14)
+        # Tick 7 opens the second chunk — step it behind the last tick of chunk 1
+        data['ticks'][7]['time_msc'] = data['ticks'][6]['time_msc'] - 500
+        importer = _streaming_importer(tmp_path)
+        json_file = write_json_fixture(tmp_path / 'source', 'EURUSD_20260115_ticks.json', data)
+
+        with pytest.raises(TickFileValidationException, match='time_msc steps backwards 1x'):
+            importer.convert_json_to_parquet(json_file)
+        assert not [p for p in (tmp_path / 'target').rglob('*') if p.is_file()]
+
+    def test_declared_tick_count_from_trailer(self, tmp_path):
+        data = _mt5_data(14)
+        data['summary'] = {'total_ticks': 15}
+        importer = _streaming_importer(tmp_path)
+        json_file = write_json_fixture(tmp_path / 'source', 'EURUSD_20260115_ticks.json', data)
+
+        with pytest.raises(TickFileValidationException, match='Tick count mismatch'):
+            importer.convert_json_to_parquet(json_file)
+
+
+class TestStreamingDuplicates:
+    """Duplicate detection works on streamed files."""
+
+    def test_reimport_detected_and_override_replaces(self, tmp_path):
+        data = _mt5_data()
+        _import(tmp_path, 'streamed', data, streaming=True)
+        second = _import(tmp_path, 'streamed', data, streaming=True)
+        assert any('DUPLICATE' in warning for warning in second.warnings)
+
+        third = _import(tmp_path, 'streamed', data, streaming=True, override=True)
+        assert third.processed_files == 1
+        parquets = find_tick_parquets(tmp_path / 'streamed' / 'target')
+        assert len(parquets) == 1
+        assert not list(parquets[0].parent.glob('.*.partial'))
+
+
+class TestJsonTickStreamReader:
+    """Incremental decoding of the ticks array."""
+
+    def test_header_chunks_trailer(self, tmp_path, monkeypatch):
+        # Tiny read blocks force values to straddle every refill
+        monkeypatch.setattr(json_tick_stream_reader, 'READ_BLOCK_CHARS', 7)
+        document = {
+            'metadata': {'symbol': 'EURUSD', 'nested': [1, 2.5, None]},
+            'ticks': [{'bid': 1.123456789 + i, 'time_msc': 10 ** 12 + i} for i in range(5)],
+            'summary': {'total_ticks': 5},
+        }
+        path = tmp_path / 'ticks.json'
+        path.write_text(json.dumps(document, indent=2))
+
+        reader = JsonTickStreamReader(path, chunk_size=2)
+        assert reader.read_header() == {'metadata': document['metadata']}
+        chunks = list(reader.iter_tick_chunks())
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        assert sum(chunks, []) == document['ticks']
+        assert reader.read_trailer() == {'summary': document['summary']}
+
+    def test_missing_ticks_key(self, tmp_path):
+        path = tmp_path / 'ticks.json'
+        path.write_text(json.dumps({'metadata': {}}))
+        reader = JsonTickStreamReader(path)
+        assert reader.read_header() == {'metadata': {}}
+        assert not reader.has_ticks
+        assert list(reader.iter_tick_chunks()) == []
+        reader.close()
+
+    def test_ticks_not_an_array(self, tmp_path):
+        path = tmp_path / 'ticks.json'
+        path.write_text(json.dumps({'metadata': {}, 'ticks': {}}))
+        with pytest.raises(ValueError):
+            JsonTickStreamReader(path).read_header()
@@ -0,0 +1,175 @@
+"""
+Tick Fingerprint Table Tests
+============================
+Duplicate detection looks up the source name and a content hash (first/last
+time_msc + tick count) in a persistent table next to the tick index, instead of
+opening the Parquet footer of every existing file of the symbol.
+
+Covers:
+- Persisted rows: committed files are registered, lookups need no file scan
+- Content hash: a renamed copy of an imported export is detected; exports
+  without time_msc get no hash (name-only match)
+- Bootstrap: a missing table is rebuilt from the archive with identical rows
+- Override and manually deleted files keep the table consistent
+"""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from python.data_management.importers.tick_importer import TickDataImporter
+from python.data_management.index.tick_fingerprint_table import TickFingerprintTable
+from python.framework.exceptions.data_quality_errors import ArtificialDuplicateException
+from tests.data.import_pipeline.conftest import (
+    build_minimal_tick_json,
+    find_tick_parquets,
+    write_json_fixture,
+)
+
+
+def _importer(root: Path, override: bool = False) -> TickDataImporter:
+    return TickDataImporter(
+        source_dir=str(root / 'source'),
+        target_dir=str(root / 'target'),
+        offset_registry={'kraken_spot': 0},
+        move_processed_files=False,
+        auto_render_bars=False,
+        override=override,
+    )
+
+
+def _write(
+    root: Path,
+    name: str,
+    symbol: str = 'BTCUSD',
+    start_time: str = '2026.01.15 10:00:00',
+    with_time_msc: bool = True
+) -> Path:
+    data = build_minimal_tick_json(
+        symbol=symbol, broker_type='kraken_spot', start_time=start_time, tick_count=10)
+    if not with_time_msc:
+        # Legacy export: no millisecond timing columns
+        for tick in data['ticks']:
+            del tick['time_msc'], tick['collected_msc']
+    return write_json_fixture(root / 'source', name, data)
+
+
+def _table_rows(target: Path) -> pd.DataFrame:
+    df = pd.read_parquet(target / TickFingerprintTable.TABLE_FILE_PARQUET)
+    return df.sort_values('path').reset_index(drop=True)
+
+
+@pytest.fixture
+def scan_counter(monkeypatch):
+    """Count TickFingerprintTable._scan_file calls (bootstrap scans)."""
+    calls = []
+    original = TickFingerprintTable._scan_file
+
+    def counting(self, parquet_file):
+        calls.append(Path(parquet_file).name)
+        return original(self, parquet_file)
+
+    monkeypatch.setattr(TickFingerprintTable, '_scan_file', counting)
+    return calls
+
+
+class TestFingerprintLookup:
+    """Committed files are registered; later checks are table lookups."""
+
+    def test_rows_registered_without_scans(self, tmp_path, scan_counter):
+        _write(tmp_path, 'BTCUSD_20260115_ticks.json')
+        _importer(tmp_path).process_all_exports()
+
+        (tmp_path / 'source' / 'BTCUSD_20260115_ticks.json').unlink()
+        _write(tmp_path, 'BTCUSD_20260116_ticks.json', start_time='2026.01.16 10:00:00')
+        importer = _importer(tmp_path)
+        importer.process_all_exports()
+
+        assert importer.processed_files == 1
+        assert scan_counter == []
+        rows = _table_rows(tmp_path / 'target')
+        assert sorted(rows['source_file']) == [
+            'BTCUSD_20260115_ticks.json', 'BTCUSD_20260116_ticks.json']
+        assert (rows['tick_count'] == 10).all()
+
+    def test_renamed_copy_detected_by_content(self, tmp_path):
+        _write(tmp_path, 'BTCUSD_20260115_ticks.json')
+        _importer(tmp_path).process_all_exports()
+
+        renamed = _write(tmp_path, 'BTCUSD_20260115_ticks_copy.json')
+        with pytest.raises(ArtificialDuplicateException) as exc_info:
+            _importer(tmp_path).convert_json_to_parquet(renamed)
+
+        report = exc_info.value.report
+        assert report.tick_counts == [10]
+        assert report.metadata[0]['source_file'] == 'BTCUSD_20260115_ticks.json'
+
+    def test_same_content_other_symbol_is_no_duplicate(self, tmp_path):
+        _write(tmp_path, 'BTCUSD_20260115_ticks.json')
+        _write(tmp_path, 'ETHUSD_20260115_ticks.json', symbol='ETHUSD')
+        importer = _importer(tmp_path)
+        importer.process_all_exports()
+        assert importer.processed_files == 2
+
+    def test_no_time_msc_same_count_is_no_duplicate(self, tmp_path):
+        _write(tmp_path, 'BTCUSD_20260115_ticks.json', with_time_msc=False)
+        _write(tmp_path, 'BTCUSD_20260116_ticks.json',
+               start_time='2026.01.16 10:00:00', with_time_msc=False)
+        importer = _importer(tmp_path)
+        importer.process_all_exports()
+
+        assert importer.processed_files == 2
+        rows = _table_rows(tmp_path / 'target')
+        assert rows['content_hash'].isna().all()
+
+        # Same source name still matches (name-only fallback), after a reload
+        (tmp_path / 'source' / 'BTCUSD_20260116_ticks.json').unlink()
+        with pytest.raises(ArtificialDuplicateException):
+            _importer(tmp_path).convert_json_to_parquet(
+                tmp_path / 'source' / 'BTCUSD_20260115_ticks.json')
+
+
+class TestFingerprintMaintenance:
+    """Bootstrap, override and manual deletions keep the table consistent."""
+
+    def test_bootstrap_matches_committed_rows(self, tmp_path, scan_counter):
+        _write(tmp_path, 'BTCUSD_20260115_ticks.json')
+        _write(tmp_path, 'BTCUSD_20260116_ticks.json', start_time='2026.01.16 10:00:00')
+        _importer(tmp_path).process_all_exports()
+        target = tmp_path / 'target'
+        committed = _table_rows(target)
+
+        (target / TickFingerprintTable.TABLE_FILE_PARQUET).unlink()
+        table = TickFingerprintTable(str(target))
+        table.load()
+
+        assert len(scan_counter) == 2
+        pd.testing.assert_frame_equal(_table_rows(target), committed, check_dtype=False)
+
+    def test_override_replaces_row(self, tmp_path):
+        _write(tmp_path, 'BTCUSD_20260115_ticks.json')
+        _importer(tmp_path).process_all_exports()
+
+        importer = _importer(tmp_path, override=True)
+        importer.process_all_exports()
+
+        assert importer.processed_files == 1
+        rows = _table_rows(tmp_path / 'target')
+        assert len(rows) == 1
+        assert len(find_tick_parquets(tmp_path / 'target')) == 1
+        assert (tmp_path / 'target' / rows['path'][0]).exists()
+
+    def test_manually_deleted_file_is_no_duplicate(self, tmp_path):
+        _write(tmp_path, 'BTCUSD_20260115_ticks.json')
+        _importer(tmp_path).process_all_exports()
+        for parquet in find_tick_parquets(tmp_path / 'target'):
+            parquet.unlink()
+
+        importer = _importer(tmp_path)
+        importer.process_all_exports()
+
+        assert importer.processed_files == 1
+        rows = _table_rows(tmp_path / 'target')
+        assert len(rows) == 1
+        assert (tmp_path / 'target' / rows['path'][0]).exists()
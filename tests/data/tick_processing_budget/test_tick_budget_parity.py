@@ -0,0 +1,93 @@
+"""
+Tick Processing Budget — Vectorized Parity Tests
+==================================================
+The array-based virtual clock (compute_clipping_flags) must reproduce the
+per-tick reference loop exactly.
+
+Covers:
+- Parity on realistic epoch-ms streams (bursts, gaps, duplicates)
+- Parity on non-monotonic collected_msc (sequential fallback)
+- Zero / fractional budgets
+- _apply_tick_budget output identical to the reference dict loop
+"""
+
+import random
+from typing import List
+
+import numpy as np
+import pytest
+
+from python.framework.utils.tick_budget_utils import compute_clipping_flags
+from tests.data.tick_processing_budget.conftest import make_tick, make_scenario_ticks
+
+
+SYMBOL = 'BTCUSD'
+
+
+def reference_flags(collected_msc: List[int], budget_ms: float) -> List[bool]:
+    """Per-tick virtual clock — the pre-vectorization algorithm."""
+    virtual_clock = 0.0
+    flags = []
+    for value in collected_msc:
+        if value >= virtual_clock:
+            flags.append(False)
+            virtual_clock = value + budget_ms
+        else:
+            flags.append(True)
+    return flags
+
+
+def make_stream(seed: int, count: int, monotonic: bool = True) -> List[int]:
+    """Bursty epoch-ms stream with duplicates and occasional gaps."""
+    rng = random.Random(seed)
+    value = 1_767_225_600_000
+    stream = []
+    for _ in range(count):
+        step = rng.choice([0, 0, 1, 1, 2, 3, 5, 8, 40, 250])
+        value += step
+        stream.append(value)
+    if not monotonic:
+        for _ in range(count // 10):
+            i = rng.randrange(count)
+            stream[i] -= rng.randint(1, 20)
+    return stream
+
+
+class TestFlagParity:
+    """compute_clipping_flags vs. reference loop."""
+
+    @pytest.mark.parametrize('budget_ms', [0.0, 0.3, 1.0, 2.0, 2.5, 7.0, 100.0])
+    @pytest.mark.parametrize('seed', [1, 2, 3])
+    def test_monotonic_stream(self, seed, budget_ms):
+        stream = make_stream(seed, 2000)
+        flags = compute_clipping_flags(np.array(stream), budget_ms)
+        assert flags.dtype == bool
+        assert flags.tolist() == reference_flags(stream, budget_ms)
+
+    @pytest.mark.parametrize('budget_ms', [0.0, 1.0, 3.0, 15.0])
+    @pytest.mark.parametrize('seed', [4, 5])
+    def test_non_monotonic_stream(self, seed, budget_ms):
+        stream = make_stream(seed, 2000, monotonic=False)
+        flags = compute_clipping_flags(np.array(stream), budget_ms)
+        assert flags.tolist() == reference_flags(stream, budget_ms)
+
+    def test_empty(self):
+        assert len(compute_clipping_flags(np.array([]), 2.0)) == 0
+
+
+class TestApplyTickBudgetParity:
+    """_apply_tick_budget output matches the former dict loop."""
+
+    @pytest.mark.parametrize('budget_ms', [1.0, 2.0, 5.0])
+    def test_flagged_ticks_identical(self, preparator, budget_ms):
+        stream = make_stream(7, 500)
+        ticks = [make_tick(msc) for msc in stream]
+        filtered, stats = preparator._apply_tick_budget(
+            make_scenario_ticks(SYMBOL, ticks), SYMBOL, budget_ms)
+
+        expected = [
+            dict(tick, is_clipped=flag)
+            for tick, flag in zip(ticks, reference_flags(stream, budget_ms))
+        ]
+        assert list(filtered['ticks'][SYMBOL]) == expected
+        assert stats.ticks_kept == sum(1 for t in expected if not t['is_clipped'])
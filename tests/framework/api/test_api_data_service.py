@@ -0,0 +1,200 @@
+"""
+FiniexTestingIDE - API Data Service Tests
+
+The app-level ApiDataService keeps the bar index and opened bar files alive
+across requests instead of loading them per request.
+
+Covers:
+- Range reads touch only the row groups overlapping the range
+- Range results equal a full-file filter
+- Concurrent reads of one shared handle are serialized and stay correct
+- Bar files are reused from the LRU and reopened after a change on disk
+- The bar index is reloaded only when its file changes, into a fresh manager
+- Level-of-detail aggregation keeps first open, extremes, last close, volume sum
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+from python.api.api_data_service import ApiDataService, BarColumns, BarFileHandle, aggregate_bars
+
+
+BASE = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _write_bars(path: Path, count: int, row_group_size: int = 100, price: float = 100.0) -> Path:
+    """M1 bar parquet with `count` bars starting at BASE."""
+    df = pd.DataFrame({
+        'timestamp': pd.date_range(BASE, periods=count, freq='1min'),
+        'open': price + np.arange(count, dtype=float),
+        'high': price + np.arange(count, dtype=float) + 1,
+        'low': price + np.arange(count, dtype=float) - 1,
+        'close': price + np.arange(count, dtype=float),
+        'volume': np.ones(count),
+    })
+    df.to_parquet(path, row_group_size=row_group_size)
+    return path
+
+
+class TestRangeReads:
+    """Row-group pruning and parity with a full-file filter."""
+
+    def test_reads_only_overlapping_row_groups(self, tmp_path, monkeypatch):
+        handle = BarFileHandle(_write_bars(tmp_path / 'bars.parquet', 1000))
+        assert len(handle.rg_min) == 10
+
+        read_groups = []
+        original = pq.ParquetFile.read_row_groups
+
+        def counting(self, row_groups, *args, **kwargs):
+            read_groups.extend(row_groups)
+            return original(self, row_groups, *args, **kwargs)
+
+        monkeypatch.setattr(pq.ParquetFile, 'read_row_groups', counting)
+        bars = handle.read_range(
+            BASE + timedelta(minutes=250), BASE + timedelta(minutes=349), limit=10_000)
+
+        assert read_groups == [2, 3]
+        assert len(bars) == 100
+        assert bars.t[0] == int((BASE + timedelta(minutes=250)).timestamp())
+
+    def test_matches_full_filter(self, tmp_path):
+        path = _write_bars(tmp_path / 'bars.parquet', 1000, row_group_size=64)
+        handle = BarFileHandle(path)
+        df = pd.read_parquet(path)
+
+        for start_min, end_min in [(0, 999), (63, 64), (500, 499), (-50, 10), (990, 2000)]:
+            from_utc = BASE + timedelta(minutes=start_min)
+            to_utc = BASE + timedelta(minutes=end_min)
+            expected = df[(df['timestamp'] >= from_utc) & (df['timestamp'] <= to_utc)]
+            bars = handle.read_range(from_utc, to_utc, limit=10_000)
+            assert bars.o.tolist() == expected['open'].tolist()
+
+    def test_concurrent_reads_serialized(self, tmp_path, monkeypatch):
+        handle = BarFileHandle(_write_bars(tmp_path / 'bars.parquet', 1000))
+        active, peak = [0], [0]
+        counter_lock = threading.Lock()
+        original = pq.ParquetFile.read_row_groups
+
+        def tracking(self, *args, **kwargs):
+            with counter_lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.01)
+            try:
+                return original(self, *args, **kwargs)
+            finally:
+                with counter_lock:
+                    active[0] -= 1
+
+        monkeypatch.setattr(pq.ParquetFile, 'read_row_groups', tracking)
+
+        def read(offset):
+            start = BASE + timedelta(minutes=offset)
+            return handle.read_range(start, start + timedelta(minutes=49), limit=10_000).o[0]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            opens = list(pool.map(read, range(0, 800, 50)))
+
+        assert peak[0] == 1
+        assert opens == [100.0 + offset for offset in range(0, 800, 50)]
+
+    def test_limit(self, tmp_path):
+        handle = BarFileHandle(_write_bars(tmp_path / 'bars.parquet', 500))
+        bars = handle.read_range(BASE, BASE + timedelta(days=1), limit=42)
+        assert len(bars) == 42
+        assert bars.o[0] == 100.0
+
+
+class TestCaching:
+    """Bar files and the index live across requests."""
+
+    def test_file_handle_reused_and_reopened_on_change(self, tmp_path):
+        path = _write_bars(tmp_path / 'bars.parquet', 200)
+        service = ApiDataService(index_factory=MagicMock)
+
+        first = service._file_handle(path)
+        assert service._file_handle(path) is first
+
+        _write_bars(path, 200, price=500.0)
+        os.utime(path, ns=(first.file_state[1] + 10**9, first.file_state[1] + 10**9))
+        reopened = service._file_handle(path)
+        assert reopened is not first
+        assert service.read_bars(path, BASE, BASE, limit=1).o.tolist() == [500.0]
+
+    def test_lru_bounded(self, tmp_path):
+        service = ApiDataService(index_factory=MagicMock, max_open_files=2)
+        paths = [_write_bars(tmp_path / f'bars_{i}.parquet', 10) for i in range(3)]
+        for path in paths:
+            service._file_handle(path)
+        assert list(service._files) == paths[1:]
+
+    def test_index_reloaded_only_on_change(self, tmp_path):
+        index_file = tmp_path / '.parquet_bars_index.json'
+        index_file.write_text('{}')
+        index = MagicMock()
+        index.index_file = index_file
+        service = ApiDataService(index_factory=lambda: index)
+
+        assert service.bar_index() is index
+        service.bar_index()
+        assert index.load_index.call_count == 1
+
+        mtime = index_file.stat().st_mtime_ns + 10**9
+        os.utime(index_file, ns=(mtime, mtime))
+        service.bar_index()
+        assert index.load_index.call_count == 2
+
+    def test_reload_swaps_in_fresh_index(self, tmp_path):
+        index_file = tmp_path / '.parquet_bars_index.json'
+        index_file.write_text('{}')
+
+        def make_index():
+            index = MagicMock()
+            index.index_file = index_file
+            return index
+
+        service = ApiDataService(index_factory=make_index)
+        first = service.bar_index()
+        assert service.bar_index() is first
+
+        mtime = index_file.stat().st_mtime_ns + 10**9
+        os.utime(index_file, ns=(mtime, mtime))
+        second = service.bar_index()
+        assert second is not first
+        assert service.bar_index() is second
+        # The manager a request already holds is never reloaded in place
+        assert first.load_index.call_count == 1
+        assert second.load_index.call_count == 1
+
+
+class TestAggregation:
+    """Level-of-detail buckets keep the extremes of their source bars."""
+
+    def test_buckets_preserve_ohlc_extremes(self):
+        t = np.array([0, 60, 120, 180, 600, 660], dtype=np.int64)
+        bars = BarColumns(
+            t=t,
+            o=np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0]),
+            h=np.array([5.0, 9.0, 4.0, 4.0, 7.0, 8.0]),
+            l=np.array([0.5, 1.0, 0.1, 2.0, 3.0, 4.0]),
+            c=np.array([2.0, 3.0, 4.0, 5.0, 6.0, 7.0]),
+            v=np.ones(6),
+        )
+        # 240 s buckets: [0,240) and [480,720) — the gap bucket is omitted
+        agg = aggregate_bars(bars, 240)
+        assert agg.t.tolist() == [0, 480]
+        assert agg.o.tolist() == [1.0, 5.0]
+        assert agg.h.tolist() == [9.0, 8.0]
+        assert agg.l.tolist() == [0.1, 3.0]
+        assert agg.c.tolist() == [5.0, 7.0]
+        assert agg.v.tolist() == [4.0, 2.0]
@@ -1,9 +1,9 @@
 """
 FiniexTestingIDE - API Endpoint Tests
 
-Tests for all HTTP API endpoints: health, brokers, symbols, coverage, bars.
-Uses FastAPI TestClient with mocked BarsIndexManager and MarketConfigManager
-so no actual parquet data or index files are required.
+Tests for all HTTP API endpoints: health, brokers, symbols, coverage, bars, bars/lod.
+Uses FastAPI TestClient with a mocked BarsIndexManager (injected through the
+app's ApiDataService) and MarketConfigManager, so no index files are required.
 
 Happy path + one error case per endpoint as specified in #298.
 """
@@ -12,11 +12,13 @@ from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pandas as pd
 import pytest
 from fastapi.testclient import TestClient
 
 from python.api.api_app import create_app
+from python.api.api_data_service import ApiDataService
 from python.configuration.app_config_manager import AppConfigManager
 
 
@@ -52,6 +54,11 @@ def _mock_index(broker_types=None, symbols=None, stats=None, bar_file=None):
     return m
 
 
+def _client_with(index) -> TestClient:
+    """TestClient whose data service serves the given (mocked) bar index."""
+    return TestClient(create_app(ApiDataService(index_factory=lambda: index)))
+
+
 def _mock_market_config(market_type_value='crypto'):
     m = MagicMock()
     market_type = MagicMock()
@@ -127,9 +134,8 @@ class TestHealth:
 
 class TestBrokers:
 
-    def test_list_brokers(self, client):
-        with patch('python.api.api_app.BarsIndexManager', return_value=_mock_index()):
-            r = client.get('/api/v1/brokers')
+    def test_list_brokers(self):
+        r = _client_with(_mock_index()).get('/api/v1/brokers')
         assert r.status_code == 200
         assert set(r.json()['brokers']) == {'kraken_spot', 'mt5'}
 
@@ -140,20 +146,16 @@ class TestBrokers:
 
 class TestSymbols:
 
-    def test_list_symbols(self, client):
-        with (
-            patch('python.api.endpoints.broker_router.BarsIndexManager', return_value=_mock_index()),
-            patch('python.api.endpoints.broker_router.MarketConfigManager', return_value=_mock_market_config()),
-        ):
-            r = client.get('/api/v1/brokers/kraken_spot/symbols')
+    def test_list_symbols(self):
+        with patch('python.api.endpoints.broker_router.MarketConfigManager', return_value=_mock_market_config()):
+            r = _client_with(_mock_index()).get('/api/v1/brokers/kraken_spot/symbols')
         assert r.status_code == 200
         data = r.json()
         assert all(s['market_type'] == 'crypto' for s in data['symbols'])
         assert {s['symbol'] for s in data['symbols']} == {'BTCUSD', 'ETHUSD'}
 
-    def test_unknown_broker_returns_404(self, client):
-        with patch('python.api.endpoints.broker_router.BarsIndexManager', return_value=_mock_index()):
-            r = client.get('/api/v1/brokers/nonexistent/symbols')
+    def test_unknown_broker_returns_404(self):
+        r = _client_with(_mock_index()).get('/api/v1/brokers/nonexistent/symbols')
         assert r.status_code == 404
         assert r.json()['error'] == 'not_found'
 
@@ -164,20 +166,18 @@ class TestSymbols:
 
 class TestCoverage:
 
-    def test_coverage_ok(self, client):
-        with patch('python.api.endpoints.bars_router.BarsIndexManager', return_value=_mock_index()):
-            r = client.get('/api/v1/brokers/kraken_spot/symbols/BTCUSD/coverage')
+    def test_coverage_ok(self):
+        r = _client_with(_mock_index()).get('/api/v1/brokers/kraken_spot/symbols/BTCUSD/coverage')
         assert r.status_code == 200
         data = r.json()
         assert 'start' in data
         assert 'end' in data
         assert set(data['timeframes']) == {'M30', 'H1'}
 
-    def test_unknown_symbol_returns_404(self, client):
+    def test_unknown_symbol_returns_404(self):
         index = _mock_index()
         index.list_symbols.return_value = []
-        with patch('python.api.endpoints.bars_router.BarsIndexManager', return_value=index):
-            r = client.get('/api/v1/brokers/kraken_spot/symbols/UNKNOWN/coverage')
+        r = _client_with(index).get('/api/v1/brokers/kraken_spot/symbols/UNKNOWN/coverage')
         assert r.status_code == 404
         assert r.json()['error'] == 'not_found'
 
@@ -188,19 +188,17 @@ class TestCoverage:
 
 class TestBars:
 
-    def test_bars_ok(self, client):
-        with (
-            patch('python.api.endpoints.bars_router.BarsIndexManager', return_value=_mock_index()),
-            patch('python.api.endpoints.bars_router.pd.read_parquet', return_value=_sample_bars_df()),
-        ):
-            r = client.get(
-                '/api/v1/brokers/kraken_spot/symbols/BTCUSD/bars',
-                params={
-                    'timeframe': 'M30',
-                    'from': '2026-01-01T00:00:00Z',
-                    'to': '2026-02-01T00:00:00Z',
-                },
-            )
+    def test_bars_ok(self, tmp_path):
+        bar_file = tmp_path / 'BTCUSD_M30_BARS.parquet'
+        _sample_bars_df().to_parquet(bar_file)
+        r = _client_with(_mock_index(bar_file=bar_file)).get(
+            '/api/v1/brokers/kraken_spot/symbols/BTCUSD/bars',
+            params={
+                'timeframe': 'M30',
+                'from': '2026-01-01T00:00:00Z',
+                'to': '2026-02-01T00:00:00Z',
+            },
+        )
         assert r.status_code == 200
         bars = r.json()
         assert len(bars) == 2
@@ -219,28 +217,101 @@ class TestBars:
         assert r.status_code == 400
         assert r.json()['error'] == 'invalid_timeframe'
 
-    def test_from_after_to_returns_400(self, client):
-        with patch('python.api.endpoints.bars_router.BarsIndexManager', return_value=_mock_index()):
-            r = client.get(
-                '/api/v1/brokers/kraken_spot/symbols/BTCUSD/bars',
-                params={
-                    'timeframe': 'M30',
-                    'from': '2026-02-01T00:00:00Z',
-                    'to': '2026-01-01T00:00:00Z',
-                },
-            )
+    def test_from_after_to_returns_400(self):
+        r = _client_with(_mock_index()).get(
+            '/api/v1/brokers/kraken_spot/symbols/BTCUSD/bars',
+            params={
+                'timeframe': 'M30',
+                'from': '2026-02-01T00:00:00Z',
+                'to': '2026-01-01T00:00:00Z',
+            },
+        )
         assert r.status_code == 400
         assert r.json()['error'] == 'invalid_range'
 
-    def test_unknown_broker_returns_404(self, client):
-        with patch('python.api.endpoints.bars_router.BarsIndexManager', return_value=_mock_index()):
-            r = client.get(
-                '/api/v1/brokers/nonexistent/symbols/BTCUSD/bars',
-                params={
-                    'timeframe': 'M30',
-                    'from': '2026-01-01T00:00:00Z',
-                    'to': '2026-02-01T00:00:00Z',
-                },
-            )
+    def test_unknown_broker_returns_404(self):
+        r = _client_with(_mock_index()).get(
+            '/api/v1/brokers/nonexistent/symbols/BTCUSD/bars',
+            params={
+                'timeframe': 'M30',
+                'from': '2026-01-01T00:00:00Z',
+                'to': '2026-02-01T00:00:00Z',
+            },
+        )
         assert r.status_code == 404
         assert r.json()['error'] == 'not_found'
+
+
+# ---------------------------------------------------------------------------
+# Bars — level of detail
+# ---------------------------------------------------------------------------
+
+def _write_m1_and_h1(tmp_path: Path, days: int = 3) -> dict:
+    """M1 random-walk bars over `days` days plus their H1 resample."""
+    rng = np.random.default_rng(5)
+    ts = pd.date_range('2026-01-05', periods=days * 1440, freq='1min', tz='UTC')
+    close = 40000.0 + rng.normal(0, 10, len(ts)).cumsum()
+    m1 = pd.DataFrame({
+        'timestamp': ts,
+        'open': close - rng.normal(0, 2, len(ts)),
+        'high': close + rng.uniform(0, 20, len(ts)),
+        'low': close - rng.uniform(0, 20, len(ts)),
+        'close': close,
+        'volume': rng.uniform(0, 3, len(ts)),
+    })
+    h1 = m1.set_index('timestamp').resample('1h').agg({
+        'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'sum',
+    }).reset_index()
+    files = {'M1': tmp_path / 'BTCUSD_M1_BARS.parquet', 'H1': tmp_path / 'BTCUSD_H1_BARS.parquet'}
+    m1.to_parquet(files['M1'])
+    h1.to_parquet(files['H1'])
+    return {'files': files, 'm1': m1}
+
+
+def _lod_client(files: dict) -> TestClient:
+    index = _mock_index()
+    index.get_available_timeframes.return_value = sorted(files)
+    index.get_bar_file.side_effect = lambda broker, symbol, tf: files.get(tf)
+    return _client_with(index)
+
+
+def _lod_params(pixels: int) -> dict:
+    return {'from': '2026-01-05T00:00:00Z', 'to': '2026-01-07T23:59:00Z', 'pixels': pixels}
+
+
+class TestBarsLod:
+
+    def test_budget_and_extremes(self, tmp_path):
+        data = _write_m1_and_h1(tmp_path)
+        r = _lod_client(data['files']).get(
+            '/api/v1/brokers/kraken_spot/symbols/BTCUSD/bars/lod', params=_lod_params(300))
+        assert r.status_code == 200
+        body = r.json()
+        bars = body['bars']
+
+        assert body['source_timeframe'] == 'M1'
+        assert body['bucket_seconds'] % 60 == 0
+        assert 0 < len(bars) <= 300
+        assert max(b['h'] for b in bars) == pytest.approx(data['m1']['high'].max())
+        assert min(b['l'] for b in bars) == pytest.approx(data['m1']['low'].min())
+        assert sum(b['v'] for b in bars) == pytest.approx(data['m1']['volume'].sum())
+        assert bars[0]['o'] == pytest.approx(data['m1']['open'].iloc[0])
+        assert bars[-1]['c'] == pytest.approx(data['m1']['close'].iloc[-1])
+
+    def test_coarser_source_when_read_budget_exceeded(self, tmp_path, monkeypatch):
+        monkeypatch.setattr('python.api.endpoints.bars_router.LOD_MAX_SOURCE_BARS', 1000)
+        data = _write_m1_and_h1(tmp_path)
+        r = _lod_client(data['files']).get(
+            '/api/v1/brokers/kraken_spot/symbols/BTCUSD/bars/lod', params=_lod_params(24))
+        body = r.json()
+
+        assert body['source_timeframe'] == 'H1'
+        assert body['bucket_seconds'] % 3600 == 0
+        assert len(body['bars']) <= 24
+        assert max(b['h'] for b in body['bars']) == pytest.approx(data['m1']['high'].max())
+
+    def test_invalid_pixels_returns_400(self):
+        r = _client_with(_mock_index()).get(
+            '/api/v1/brokers/kraken_spot/symbols/BTCUSD/bars/lod', params=_lod_params(1))
+        assert r.status_code == 400
+        assert r.json()['error'] == 'invalid_pixels'
@@ -7,6 +7,8 @@ root). Covers the happy path, parameter filtering, the not-found and invalid-inp
 contracts — no simulation or live run required.
 """
 
+import json
+import os
 from pathlib import Path
 from unittest.mock import patch
 
@@ -390,3 +392,106 @@ def test_aggregated_portfolio_returns(client):
 def test_aggregated_portfolio_run_not_found(client):
     response = client.get('/api/v1/reports/runs/nope/aggregated-portfolio')
     assert response.status_code == 404
+
+
+def test_trade_history_page_cursor(client):
+    first = client.get(f'{_URL}/page', params={'limit': 1})
+    assert first.status_code == 200
+    body = first.json()
+    assert body['count'] == 1
+    assert body['trades'][0]['position_id'] == 'p1'
+
+    second = client.get(f'{_URL}/page', params={'limit': 1, 'cursor': body['next_cursor']})
+    assert second.json()['trades'][0]['position_id'] == 'p2'
+    assert second.json()['next_cursor'] is None
+
+
+def test_trade_history_page_invalid_cursor(client):
+    response = client.get(f'{_URL}/page', params={'cursor': 'abc'})
+    assert response.status_code == 400
+    assert response.json()['error'] == 'invalid_cursor'
+
+
+def test_trade_history_stream_ndjson(client):
+    response = client.get(f'{_URL}/stream', params={'symbol': 'GBPUSD'})
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith('application/x-ndjson')
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [row['position_id'] for row in lines] == ['p2']
+
+
+def test_order_history_page_and_stream(client):
+    page = client.get(f'{_ORDER_URL}/page', params={'status': 'rejected'})
+    assert page.status_code == 200
+    assert [row['order_id'] for row in page.json()['orders']] == ['o2']
+
+    stream = client.get(f'{_ORDER_URL}/stream')
+    assert [json.loads(line)['order_id'] for line in stream.text.splitlines()] == ['o1', 'o2']
+
+
+def test_stream_run_not_found(client):
+    response = client.get('/api/v1/reports/runs/nope/trade-history/stream')
+    assert response.status_code == 404
+
+
+def test_run_listing(client):
+    response = client.get('/api/v1/reports/runs')
+    assert response.status_code == 200
+    body = response.json()
+    assert body['count'] == 1
+    run = body['runs'][0]
+    assert (run['run_id'], run['group'], run['owner']) == (_RUN, 'scenario_sets', 'my_set')
+    assert run['reference'] == _RUN
+    assert 'trade_history.json' in run['artifacts']
+
+    assert client.get('/api/v1/reports/runs?owner=other').json()['count'] == 0
+
+
+def test_shared_run_id_needs_the_owner(client, tmp_path):
+    other = tmp_path / 'scenario_sets' / 'other_set' / _RUN / IO_SUBDIR
+    other.mkdir(parents=True)
+    write_trade_history_report(_report(), other)
+
+    response = client.get(_URL)
+    assert response.status_code == 409
+    assert response.json()['error'] == 'ambiguous_run_id'
+
+    qualified = client.get(f'/api/v1/reports/runs/my_set/{_RUN}/trade-history')
+    assert qualified.status_code == 200
+    assert qualified.json()['count'] == 2
+    references = {run['reference'] for run in client.get('/api/v1/reports/runs').json()['runs']}
+    assert references == {f'my_set/{_RUN}', f'other_set/{_RUN}'}
+
+
+def test_conditional_request_not_modified(client):
+    first = client.get(_URL)
+    etag = first.headers['etag']
+    assert etag.startswith('"')
+
+    again = client.get(_URL, headers={'If-None-Match': etag})
+    assert again.status_code == 304
+    assert again.content == b''
+    assert again.headers['etag'] == etag
+
+    # Another query is another representation; another tag does not match
+    assert client.get(_URL, params={'symbol': 'EURUSD'}).headers['etag'] != etag
+    assert client.get(_URL, headers={'If-None-Match': '"other"'}).status_code == 200
+
+
+def test_conditional_request_artifact_changed(client, tmp_path):
+    etag = client.get(_PORTFOLIO_URL).headers['etag']
+    artifact = tmp_path / 'scenario_sets' / 'my_set' / _RUN / IO_SUBDIR / 'portfolio.json'
+    mtime = artifact.stat().st_mtime_ns + 10**9
+    os.utime(artifact, ns=(mtime, mtime))
+
+    response = client.get(_PORTFOLIO_URL, headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['etag'] != etag
+
+
+def test_conditional_page_and_missing_run(client):
+    page = client.get(f'{_URL}/page', params={'limit': 1})
+    assert client.get(f'{_URL}/page', params={'limit': 1},
+                      headers={'If-None-Match': page.headers['etag']}).status_code == 304
+    missing = client.get('/api/v1/reports/runs/nope/portfolio', headers={'If-None-Match': '*'})
+    assert missing.status_code == 404
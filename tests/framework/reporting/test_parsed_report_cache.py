@@ -0,0 +1,107 @@
+"""
+Parsed Report Cache Tests.
+
+ReportStore reads parsed report models through an in-process LRU keyed by artifact
+path and validated by the file state (mtime_ns, size).
+
+Covers:
+- Unchanged artifact → served from memory (no re-read); changed artifact → re-read
+- Byte-budget eviction (least recently used first) and the oversized-artifact bypass
+- ReportStore getters share the cache; artifact_etag changes with the artifact
+"""
+
+import os
+from pathlib import Path
+
+from python.framework.reporting.io.trade_history_report_io import (
+    read_trade_history_report, write_trade_history_report)
+from python.framework.reporting.store.parsed_report_cache import ParsedReportCache
+from python.framework.reporting.store.report_store import IO_SUBDIR, ReportStore
+from python.framework.types.api.report_types import TradeHistoryReport
+
+_RUN = '20250101_100000'
+
+
+class _CountingReader:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, path: Path) -> str:
+        self.calls += 1
+        return path.read_text()
+
+
+def _touch(path: Path, content: str) -> None:
+    """Rewrite with a guaranteed-different mtime (coarse-mtime filesystems)."""
+    mtime = path.stat().st_mtime_ns if path.exists() else 0
+    path.write_text(content)
+    os.utime(path, ns=(mtime + 10**9, mtime + 10**9))
+
+
+def test_unchanged_file_served_from_cache(tmp_path):
+    cache, reader = ParsedReportCache(), _CountingReader()
+    artifact = tmp_path / 'a.json'
+    artifact.write_text('one')
+
+    assert cache.read(artifact, reader) == 'one'
+    assert cache.read(artifact, reader) == 'one'
+    assert reader.calls == 1
+
+    _touch(artifact, 'two')
+    assert cache.read(artifact, reader) == 'two'
+    assert reader.calls == 2
+    assert len(cache) == 1
+
+
+def test_byte_budget_eviction(tmp_path):
+    cache, reader = ParsedReportCache(max_bytes=40), _CountingReader()
+    files = {}
+    for name in 'abcde':
+        files[name] = tmp_path / name
+        files[name].write_text(name * 10)
+
+    for name in 'abca':                   # a hit → LRU order b, c, a
+        cache.read(files[name], reader)
+    cache.read(files['d'], reader)        # 40 bytes → fits the budget
+    cache.read(files['e'], reader)        # 50 bytes → evicts b
+    assert reader.calls == 5
+
+    cache.read(files['a'], reader)
+    assert reader.calls == 5
+    cache.read(files['b'], reader)
+    assert reader.calls == 6
+
+    big = tmp_path / 'big'
+    big.write_text('x' * 11)              # > max_bytes / 4 → never cached
+    cache.read(big, reader)
+    cache.read(big, reader)
+    assert reader.calls == 8
+
+
+def test_store_reads_through_cache(tmp_path, monkeypatch):
+    io_dir = tmp_path / 'scenario_sets' / 'set_a' / _RUN / IO_SUBDIR
+    io_dir.mkdir(parents=True)
+    artifact = write_trade_history_report(
+        TradeHistoryReport(trades=[], count=0, symbols=[], analytics=[]), io_dir)
+
+    calls = []
+
+    def counting(path):
+        calls.append(path)
+        return read_trade_history_report(path)
+
+    monkeypatch.setattr(
+        'python.framework.reporting.store.report_store.read_trade_history_report', counting)
+    cache = ParsedReportCache()
+    ReportStore(tmp_path, report_cache=cache).get_trade_history(_RUN)
+    ReportStore(tmp_path, report_cache=cache).get_trade_history(_RUN, symbol='EURUSD')
+    assert len(calls) == 1
+
+    store = ReportStore(tmp_path, report_cache=cache)
+    etag = store.artifact_etag(_RUN, 'trade_history.json')
+    assert etag.startswith('"') and etag == store.artifact_etag(_RUN, 'trade_history.json')
+    assert store.artifact_etag(_RUN, 'trade_history.json', variant='symbol=EURUSD') != etag
+    assert store.artifact_etag(_RUN, 'portfolio.json') is None
+
+    _touch(artifact, artifact.read_text())
+    assert store.artifact_etag(_RUN, 'trade_history.json') != etag
@@ -0,0 +1,135 @@
+"""
+Report Row Table Tests.
+
+Paginated and streamed trade / order history reads go through a columnar copy of
+the JSON artifact (`<artifact>.rows.parquet`), one row group at a time. The rows
+must equal the full-document read + shared filter they page through.
+
+Covers:
+- Cursor walk over all pages == filter_trade_history_report rows (nested executions,
+  None fields, time bounds)
+- The first page reads only the first row group
+- The copy is rebuilt when the JSON artifact is newer
+"""
+
+import os
+from datetime import datetime
+from pathlib import Path
+
+import pyarrow.parquet as pq
+
+from python.framework.reporting.io.order_history_report_io import (
+    filter_order_history_report, write_order_history_report)
+from python.framework.reporting.io.report_rows_io import row_copy_path
+from python.framework.reporting.io.trade_history_report_io import (
+    filter_trade_history_report, write_trade_history_report)
+from python.framework.reporting.store.report_store import IO_SUBDIR, ReportStore
+from python.framework.types.api.report_types import (
+    ExecutionRow, OrderHistoryReport, OrderHistoryRow, TradeHistoryReport, TradeHistoryRow)
+
+_RUN = '20251013_080000'
+
+
+def _trade_report(count: int) -> TradeHistoryReport:
+    rows = []
+    for i in range(count):
+        entry = f'2025-10-13T{i // 3600 % 24:02d}:{i // 60 % 60:02d}:{i % 60:02d}+00:00'
+        rows.append(TradeHistoryRow(
+            position_id=f'p{i}', symbol=('EURUSD', 'GBPUSD', 'USDJPY')[i % 3],
+            direction='long', lots=0.1, entry_price=1.1 + i * 1e-5, entry_time=entry,
+            exit_price=1.2, exit_time=entry, duration_s=float(i),
+            close_reason=('tp_triggered', 'sl_triggered', '')[i % 2],
+            gross_pnl=float(i), total_fees=0.1, net_pnl=float(i) - 0.1,
+            r_multiple=None if i % 4 else 1.5,
+            entry_executions=[ExecutionRow(
+                trade_id=f't{i}', side='buy', volume=0.1, price=1.1, fee=0.01,
+                fee_currency='USD', liquidity='taker', timestamp=entry)],
+        ))
+    return TradeHistoryReport(trades=rows, count=len(rows), symbols=[], analytics=[])
+
+
+def _order_report(count: int) -> OrderHistoryReport:
+    rows = [
+        OrderHistoryRow(
+            order_id=f'o{i}', position_id='', symbol=('EURUSD', 'GBPUSD')[i % 2],
+            direction='long', action='open', status=('executed', 'rejected')[i % 3 == 0],
+            requested_lots=0.1, executed_lots=0.1, executed_price=1.1, execution_time='',
+            commission=0.0, swap=0.0, slippage_points=0.0, rejection_reason='',
+            rejection_message='')
+        for i in range(count)
+    ]
+    return OrderHistoryReport(orders=rows, count=len(rows), symbols=[])
+
+
+def _store(tmp_path: Path, trades: int = 12_000, orders: int = 7_000) -> ReportStore:
+    io_dir = tmp_path / 'scenario_sets' / 'my_set' / _RUN / IO_SUBDIR
+    io_dir.mkdir(parents=True)
+    write_trade_history_report(_trade_report(trades), io_dir)
+    write_order_history_report(_order_report(orders), io_dir)
+    return ReportStore(tmp_path)
+
+
+def _walk(page_fn, rows_key: str, limit: int, **filters):
+    rows, cursor = [], 0
+    while True:
+        page = page_fn(_RUN, cursor=cursor, limit=limit, **filters)
+        rows.extend(getattr(page, rows_key))
+        if page.next_cursor is None:
+            return rows
+        cursor = int(page.next_cursor)
+
+
+def test_trade_pages_equal_filtered_report(tmp_path):
+    store = _store(tmp_path)
+    full = _trade_report(12_000)
+    start = full.trades[1000].entry_time
+    end = full.trades[9000].entry_time
+
+    expected = filter_trade_history_report(
+        full, symbol='GBPUSD', start=datetime.fromisoformat(start),
+        end=datetime.fromisoformat(end)).trades
+    paged = _walk(store.page_trade_history, 'trades', 777, symbol='GBPUSD',
+                  start=datetime.fromisoformat(start), end=datetime.fromisoformat(end))
+    assert paged == expected
+
+    streamed = list(store.iter_trade_history(_RUN, close_reason='sl_triggered'))
+    assert [TradeHistoryRow(**row) for row in streamed] == \
+        filter_trade_history_report(full, close_reason='sl_triggered').trades
+
+
+def test_order_pages_equal_filtered_report(tmp_path):
+    store = _store(tmp_path)
+    expected = filter_order_history_report(_order_report(7_000), status='rejected').orders
+    assert _walk(store.page_order_history, 'orders', 1000, status='rejected') == expected
+
+
+def test_first_page_reads_first_row_group_only(tmp_path, monkeypatch):
+    store = _store(tmp_path)
+    store.page_trade_history(_RUN, limit=1)   # builds the copy
+
+    groups = []
+    original = pq.ParquetFile.read_row_group
+
+    def counting(self, i, *args, **kwargs):
+        groups.append(i)
+        return original(self, i, *args, **kwargs)
+
+    monkeypatch.setattr(pq.ParquetFile, 'read_row_group', counting)
+    page = store.page_trade_history(_RUN, limit=100)
+    assert page.count == 100
+    assert page.next_cursor == '100'
+    assert set(groups) == {0}
+
+
+def test_copy_rebuilt_when_artifact_newer(tmp_path):
+    store = _store(tmp_path, trades=10)
+    io_dir = tmp_path / 'scenario_sets' / 'my_set' / _RUN / IO_SUBDIR
+    assert store.page_trade_history(_RUN).count == 10
+
+    artifact = write_trade_history_report(_trade_report(3), io_dir)
+    copy = row_copy_path(artifact)
+    newer = copy.stat().st_mtime_ns + 10**9
+    os.utime(artifact, ns=(newer, newer))
+
+    assert store.page_trade_history(_RUN).count == 3
+    assert pq.ParquetFile(copy).metadata.num_rows == 3
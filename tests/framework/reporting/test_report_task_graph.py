@@ -0,0 +1,88 @@
+"""
+Report Task Graph Tests.
+
+`run_report_tasks` runs a run's report steps in dependency order — independent steps
+concurrently on a thread pool — and records each step's wall time.
+"""
+
+import threading
+
+import pytest
+
+from python.framework.reporting.report_task_graph import run_report_tasks
+from python.framework.types.report_task_types import ReportTask
+
+
+def _graph(log):
+    """a → c, b → c, d independent; each task returns its name, c joins a + b."""
+    def step(name):
+        def run(results):
+            log.append(name)
+            return name
+        return run
+    return [
+        ReportTask(name='c', run=lambda r: log.append('c') or r['a'] + r['b'], after=('a', 'b')),
+        ReportTask(name='a', run=step('a')),
+        ReportTask(name='b', run=step('b')),
+        ReportTask(name='d', run=step('d')),
+    ]
+
+
+class TestOrdering:
+    """Dependencies finish first; results + timings for every task."""
+
+    @pytest.mark.parametrize('max_workers', [1, 4])
+    def test_dependencies_first(self, max_workers):
+        log = []
+        outcome = run_report_tasks(_graph(log), max_workers=max_workers)
+        assert outcome.results == {'a': 'a', 'b': 'b', 'c': 'ab', 'd': 'd'}
+        assert log.index('c') > max(log.index('a'), log.index('b'))
+        assert set(outcome.seconds) == {'a', 'b', 'c', 'd'}
+        assert all(seconds >= 0.0 for seconds in outcome.seconds.values())
+
+    def test_sequential_keeps_declared_order(self):
+        # c moves behind its dependencies only; d stays last
+        log = []
+        run_report_tasks(_graph(log), max_workers=1)
+        assert log == ['a', 'b', 'c', 'd']
+
+    def test_independent_tasks_run_concurrently(self):
+        # Both tasks must be inside run() at the same time to pass the barrier
+        barrier = threading.Barrier(2, timeout=5)
+        tasks = [ReportTask(name=n, run=lambda r: barrier.wait()) for n in ('x', 'y')]
+        outcome = run_report_tasks(tasks, max_workers=2)
+        assert set(outcome.results) == {'x', 'y'}
+
+    def test_slowest(self):
+        outcome = run_report_tasks(_graph([]))
+        outcome.seconds = {'a': 0.1, 'b': 0.3, 'c': 0.2, 'd': 0.0}
+        assert list(outcome.slowest(2)) == ['b', 'c']
+
+
+class TestFailures:
+    """A failing step raises; its dependents never run."""
+
+    @pytest.mark.parametrize('max_workers', [1, 4])
+    def test_error_propagates_and_skips_dependents(self, max_workers):
+        ran = []
+
+        def boom(results):
+            raise RuntimeError('builder failed')
+
+        tasks = [
+            ReportTask(name='a', run=boom),
+            ReportTask(name='a.write', run=lambda r: ran.append('a.write'), after=('a',)),
+        ]
+        with pytest.raises(RuntimeError, match='builder failed'):
+            run_report_tasks(tasks, max_workers=max_workers)
+        assert ran == []
+
+    @pytest.mark.parametrize('tasks, message', [
+        ([ReportTask(name='a', run=dict), ReportTask(name='a', run=dict)], 'Duplicate'),
+        ([ReportTask(name='a', run=dict, after=('missing',))], 'unknown'),
+        ([ReportTask(name='a', run=dict, after=('b',)),
+          ReportTask(name='b', run=dict, after=('a',))], 'cycle'),
+    ])
+    def test_invalid_graph_raises(self, tasks, message):
+        with pytest.raises(ValueError, match=message):
+            run_report_tasks(tasks, max_workers=4)
@@ -0,0 +1,146 @@
+"""
+Columnar Row Artifact Tests.
+
+Trade / order history are persisted as Parquet row tables next to the (optional) JSON
+documents; the event stream as a typed Parquet table next to the (optional) CSV.
+
+Covers:
+- A run persisted without JSON is listed + served (full report, pages, ETag) from its
+  row tables, with the same content as the JSON path
+- Column-pruned reads + filters on one row table
+- One dataset scan across the runs of a sweep (catalog metadata), run_id as a column
+- The typed event table mirrors the CSV rows
+"""
+
+import csv
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pyarrow.parquet as pq
+
+from python.framework.reporting.event_stream_csv_writer import (
+    EVENT_FIELDS, EVENT_SCHEMA, EventStreamWriter, EventType, TradeEvent)
+from python.framework.reporting.io.order_history_report_io import (
+    ORDER_HISTORY_ROWS_ARTIFACT, write_order_history_rows)
+from python.framework.reporting.io.report_rows_io import RowQuery, read_row_columns
+from python.framework.reporting.io.trade_history_report_io import (
+    TRADE_HISTORY_ROWS_ARTIFACT, filter_trade_history_report, write_trade_history_report,
+    write_trade_history_rows)
+from python.framework.reporting.store.parsed_report_cache import ParsedReportCache
+from python.framework.reporting.store.report_store import IO_SUBDIR, ReportStore
+from python.framework.reporting.store.run_catalog import RunCatalog
+from python.framework.types.api.report_types import (
+    ExecutionRow, OrderHistoryReport, OrderHistoryRow, TradeHistoryReport, TradeHistoryRow)
+from python.framework.types.trading_env_types.order_types import OrderDirection, OrderSide
+
+_T0 = datetime(2025, 10, 13, 8, tzinfo=timezone.utc)
+
+
+def _trades(count: int, offset: float = 0.0) -> TradeHistoryReport:
+    rows = [
+        TradeHistoryRow(
+            position_id=f'p{i}', symbol=('EURUSD', 'GBPUSD')[i % 2], direction='long',
+            lots=0.1, entry_price=1.1, entry_time=(_T0 + timedelta(minutes=i)).isoformat(),
+            exit_price=1.2, exit_time=(_T0 + timedelta(minutes=i + 1)).isoformat(),
+            duration_s=60.0, close_reason=('tp_triggered', 'sl_triggered')[i % 2],
+            gross_pnl=float(i), total_fees=0.1, net_pnl=float(i) - 0.1, currency='USD',
+            mae_pnl=-float(i) - offset, mfe_pnl=float(i) + offset,
+            r_multiple=None if i % 2 else 1.0, stop_loss=None if i % 2 else 1.0,
+            entry_executions=[ExecutionRow(
+                trade_id=f't{i}', side='buy', volume=0.1, price=1.1, fee=0.01,
+                fee_currency='USD', liquidity='taker', timestamp=_T0.isoformat())])
+        for i in range(count)
+    ]
+    # The builder's metadata = the shared filter's recomputation over the rows
+    return filter_trade_history_report(
+        TradeHistoryReport(trades=rows, count=len(rows), symbols=[], analytics=[]))
+
+
+def _orders(count: int) -> OrderHistoryReport:
+    rows = [
+        OrderHistoryRow(
+            order_id=f'o{i}', position_id='', symbol='EURUSD', direction='long', action='open',
+            status='executed', requested_lots=0.1, executed_lots=0.1, executed_price=1.1,
+            execution_time='', commission=0.0, swap=0.0, slippage_points=0.0,
+            rejection_reason='', rejection_message='')
+        for i in range(count)
+    ]
+    return OrderHistoryReport(orders=rows, count=len(rows), symbols=['EURUSD'])
+
+
+def _io_dir(logs_root: Path, owner: str, run_id: str) -> Path:
+    io_dir = logs_root / 'scenario_sets' / owner / run_id / IO_SUBDIR
+    io_dir.mkdir(parents=True)
+    return io_dir
+
+
+def test_run_without_json_served_from_row_tables(tmp_path):
+    report = _trades(7)
+    io_dir = _io_dir(tmp_path, 'set_a', '20250101_100000')
+    write_trade_history_rows(report, io_dir)
+    write_order_history_rows(_orders(3), io_dir)
+    assert sorted(p.name for p in io_dir.iterdir()) == [
+        ORDER_HISTORY_ROWS_ARTIFACT, TRADE_HISTORY_ROWS_ARTIFACT]
+
+    store = ReportStore(tmp_path, report_cache=ParsedReportCache())
+    assert store.list_runs() == ['20250101_100000']
+    assert store.get_trade_history('20250101_100000') == report
+    assert store.get_trade_history('20250101_100000', symbol='GBPUSD').count == 3
+    assert store.get_order_history('20250101_100000') == _orders(3)
+    assert store.page_trade_history('20250101_100000', limit=5).next_cursor == '5'
+    assert store.artifact_etag('20250101_100000', 'trade_history.json') is not None
+
+
+def test_column_reads(tmp_path):
+    io_dir = _io_dir(tmp_path, 'set_a', '20250101_100000')
+    path = write_trade_history_rows(_trades(6), io_dir)
+
+    table = read_row_columns(path, ['position_id', 'mae_pnl'])
+    assert table.column_names == ['position_id', 'mae_pnl']
+    assert table.num_rows == 6
+
+    table = read_row_columns(path, ['position_id'], RowQuery(
+        equals={'symbol': 'EURUSD'}, time_column='entry_time',
+        start=_T0 + timedelta(minutes=1), end=_T0 + timedelta(minutes=4)))
+    assert table.column('position_id').to_pylist() == ['p2', 'p4']
+
+
+def test_sweep_scan(tmp_path):
+    catalog = RunCatalog.shared(tmp_path)
+    for run_id, sweep, offset in (('20250101_100000', 'sw1', 0.0),
+                                  ('20250101_110000', 'sw1', 10.0),
+                                  ('20250101_120000', 'sw2', 20.0)):
+        io_dir = _io_dir(tmp_path, f'set__{run_id}', run_id)
+        if run_id.endswith('110000'):
+            write_trade_history_report(_trades(4, offset), io_dir)     # JSON-only run
+        else:
+            write_trade_history_rows(_trades(4, offset), io_dir)
+        catalog.record_run(io_dir.parent, {'sweep_id': sweep})
+
+    table = ReportStore(tmp_path).scan_trade_rows(
+        ['run_id', 'mfe_pnl'], sweep_id='sw1', close_reason='tp_triggered')
+    rows = sorted(zip(table.column('run_id').to_pylist(), table.column('mfe_pnl').to_pylist()))
+    assert rows == [('20250101_100000', 0.0), ('20250101_100000', 2.0),
+                    ('20250101_110000', 10.0), ('20250101_110000', 12.0)]
+
+
+def test_event_table_mirrors_csv(tmp_path):
+    events = [
+        TradeEvent(ts=_T0 + timedelta(seconds=2), event_type=EventType.FILL, order_id='o1',
+                   side=OrderSide.BUY, lots=0.1, price=1.1, fee=0.01, is_maker=False),
+        TradeEvent(ts=_T0, event_type=EventType.ORDER_SUBMIT, order_id='o1',
+                   submission_tick_mid_price=1.1, submission_tick_time_msc=123),
+        TradeEvent(ts=_T0 + timedelta(seconds=3), event_type=EventType.POSITION_OPEN,
+                   order_id='o1', direction=OrderDirection.LONG),
+    ]
+    writer = EventStreamWriter(tmp_path, events)
+    writer.flush('events.csv')
+    table = pq.read_table(writer.flush_parquet('events.parquet'))
+
+    with open(tmp_path / 'events.csv') as f:
+        csv_rows = list(csv.reader(f))[1:]
+    assert table.schema.equals(EVENT_SCHEMA)
+    assert table.column_names == list(EVENT_FIELDS)
+    assert table.column('event_type').to_pylist() == [row[1] for row in csv_rows]
+    assert table.column('submission_tick_time_msc').to_pylist() == [123, None, None]
+    assert table.column('side').to_pylist()[1] == 'buy' == csv_rows[1][7]
@@ -0,0 +1,161 @@
+"""
+Run Catalog Tests.
+
+The ReportStore lists and resolves runs through a persistent catalog of the logs tree
+(`<logs_root>/.run_catalog.jsonl`) instead of globbing it per call.
+
+Covers:
+- Bootstrap from an existing tree; lookups afterwards do not glob
+- Runs added without a record (new owner, new run, artifacts written later) are
+  picked up incrementally; deleted runs disappear
+- An unfinished run is listed again only once its directory changed
+- A finished run's record (metadata) is read by another process's catalog
+- A deleted catalog is rebuilt
+- Runs of different owners sharing a run id stay separate; a bare shared id is
+  ambiguous, the qualified `<owner>/<run_id>` resolves
+"""
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from python.framework.exceptions.run_catalog_errors import AmbiguousRunIdError
+from python.framework.reporting.io.trade_history_report_io import write_trade_history_report
+from python.framework.reporting.store import run_catalog
+from python.framework.reporting.store.report_store import IO_SUBDIR, ReportStore
+from python.framework.reporting.store.run_catalog import (
+    CATALOG_FILE, RunCatalog, record_run_in_catalog)
+from python.framework.types.api.report_types import TradeHistoryReport
+
+
+def _empty_report() -> TradeHistoryReport:
+    return TradeHistoryReport(trades=[], count=0, symbols=[], analytics=[])
+
+
+def _write_run(logs_root: Path, group: str, owner: str, run_id: str) -> Path:
+    run_dir = logs_root / group / owner / run_id
+    (run_dir / IO_SUBDIR).mkdir(parents=True)
+    write_trade_history_report(_empty_report(), run_dir / IO_SUBDIR)
+    return run_dir
+
+
+@pytest.fixture
+def no_glob(monkeypatch):
+    """Fail on any Path.glob — the catalog must not glob the tree."""
+    def fail(self, pattern):
+        raise AssertionError(f'unexpected glob {pattern!r} in {self}')
+    monkeypatch.setattr(Path, 'glob', fail)
+
+
+def test_bootstrap_from_tree(tmp_path, no_glob):
+    _write_run(tmp_path, 'scenario_sets', 'set_a', '20250101_100000')
+    _write_run(tmp_path, 'autotrader', 'profile_x', '20250102_100000')
+
+    store = ReportStore(tmp_path)
+    assert store.list_runs() == ['20250102_100000', '20250101_100000']
+    assert store.get_trade_history('20250101_100000').count == 0
+    assert (tmp_path / CATALOG_FILE).exists()
+
+
+def test_unrecorded_runs_picked_up_incrementally(tmp_path, no_glob):
+    _write_run(tmp_path, 'scenario_sets', 'set_a', '20250101_100000')
+    store = ReportStore(tmp_path)
+    assert store.list_runs() == ['20250101_100000']
+
+    # New owner + new run in a known owner, no catalog record
+    _write_run(tmp_path, 'scenario_sets', 'set_b', '20250103_100000')
+    _write_run(tmp_path, 'scenario_sets', 'set_a', '20250104_100000')
+    # Run in progress: scanned before its artifacts exist
+    running = tmp_path / 'autotrader' / 'profile_x' / '20250105_100000'
+    running.mkdir(parents=True)
+    assert store.list_runs() == ['20250104_100000', '20250103_100000', '20250101_100000']
+
+    (running / IO_SUBDIR).mkdir()
+    write_trade_history_report(_empty_report(), running / IO_SUBDIR)
+    assert store.list_runs()[0] == '20250105_100000'
+
+    shutil.rmtree(tmp_path / 'scenario_sets' / 'set_a' / '20250101_100000')
+    assert '20250101_100000' not in store.list_runs()
+    assert store.get_trade_history('20250101_100000') is None
+
+
+def test_unfinished_run_relisted_only_when_changed(tmp_path, monkeypatch):
+    running = tmp_path / 'autotrader' / 'profile_x' / '20250105_100000'
+    running.mkdir(parents=True)
+    # Settled mtimes (outside the racy window)
+    for directory in (running, running.parent, running.parent.parent):
+        os.utime(directory, ns=(1_000_000_000, 1_000_000_000))
+    catalog = RunCatalog(tmp_path)
+    catalog.refresh()
+
+    listings = []
+    list_artifacts = run_catalog._list_artifacts
+    monkeypatch.setattr(
+        run_catalog, '_list_artifacts', lambda d: listings.append(d) or list_artifacts(d))
+    catalog.refresh()
+    catalog.refresh()
+    catalog.refresh()
+    assert len(listings) == 1
+
+    (running / IO_SUBDIR).mkdir()
+    write_trade_history_report(_empty_report(), running / IO_SUBDIR)
+    catalog.refresh()
+    assert len(listings) == 2
+    assert catalog.entries()[0].artifacts
+
+
+def test_finished_run_record_seen_by_other_process(tmp_path):
+    run_dir = _write_run(tmp_path, 'scenario_sets', 'set_a', '20250101_100000')
+    reader = RunCatalog(tmp_path)           # a second process's view
+    assert reader.get('20250101_100000').finished_at is None
+
+    record_run_in_catalog(run_dir, pipeline='simulation')
+
+    entry = reader.get('20250101_100000')
+    assert entry.finished_at is not None
+    assert entry.metadata == {'pipeline': 'simulation'}
+    assert entry.artifacts == ['trade_history.json']
+
+
+def test_run_outside_logs_layout_is_skipped(tmp_path):
+    record_run_in_catalog(tmp_path / 'somewhere' / 'run', pipeline='simulation')
+    assert not (tmp_path / CATALOG_FILE).exists()
+
+
+def test_deleted_catalog_is_rebuilt(tmp_path):
+    run_dir = _write_run(tmp_path, 'scenario_sets', 'set_a', '20250101_100000')
+    record_run_in_catalog(run_dir, pipeline='simulation')
+    store = ReportStore(tmp_path)
+    assert store.list_runs() == ['20250101_100000']
+
+    (tmp_path / CATALOG_FILE).unlink()
+    _write_run(tmp_path, 'scenario_sets', 'set_a', '20250102_100000')
+    assert store.list_runs() == ['20250102_100000', '20250101_100000']
+    assert (tmp_path / CATALOG_FILE).exists()
+
+
+def test_shared_run_id_across_owners(tmp_path, no_glob):
+    # Multi-decision batches create several sets' runs within one second
+    run_a = _write_run(tmp_path, 'scenario_sets', 'set_a', '20250101_100000')
+    _write_run(tmp_path, 'scenario_sets', 'set_b', '20250101_100000')
+    record_run_in_catalog(run_a, pipeline='simulation')
+
+    store = ReportStore(tmp_path)
+    assert store.list_runs() == ['set_b/20250101_100000', 'set_a/20250101_100000']
+    with pytest.raises(AmbiguousRunIdError) as exc_info:
+        store.get_trade_history('20250101_100000')
+    assert exc_info.value.candidates == [
+        'scenario_sets/set_a/20250101_100000', 'scenario_sets/set_b/20250101_100000']
+    assert store.get_trade_history('set_a/20250101_100000').count == 0
+
+    # Another process's view folds the same two entries
+    reader = RunCatalog(tmp_path)
+    assert reader.get('set_a/20250101_100000').metadata == {'pipeline': 'simulation'}
+    assert reader.get('set_b/20250101_100000').finished_at is None
+
+    # Removing one owner's run keeps the other; its bare id is unique again
+    shutil.rmtree(run_a)
+    assert store.list_runs() == ['20250101_100000']
+    assert RunCatalog(tmp_path).get('20250101_100000').owner == 'set_b'
@@ -23,10 +23,11 @@ from python.framework.types.trading_env_types.trading_env_stats_types import Exe
 
 _DT = datetime(2025, 10, 13, tzinfo=timezone.utc)
 
-# Every section writes these artifacts into the io/ dir (json for all 9, csv for three).
+# Every section writes these artifacts into the io/ dir (json for all 9, csv for three,
+# Parquet row tables for trade / order history).
 _EXPECTED_FILES = [
-    'trade_history.json', 'trade_history.csv',
-    'order_history.json', 'order_history.csv',
+    'trade_history.json', 'trade_history.csv', 'trade_history.rows.parquet',
+    'order_history.json', 'order_history.csv', 'order_history.rows.parquet',
     'portfolio.json',
     'pending_orders.json',
     'execution_stats.json', 'execution_stats.csv',
@@ -87,6 +88,16 @@ class TestDeriveAndPersist:
         assert unified.execution_stats.totals.orders_sent == 8
         assert unified.execution_stats.totals.orders_executed == 7
 
+    def test_row_tables_written_json_optional(self, tmp_path):
+        io_dir = tmp_path / 'io'
+        SharedReportCoordinator.derive_and_persist(
+            run_units_from_batch(_batch()), io_dir, write_row_json=False)
+        assert (io_dir / 'trade_history.rows.parquet').exists()
+        assert (io_dir / 'order_history.rows.parquet').exists()
+        assert not (io_dir / 'trade_history.json').exists()
+        assert not (io_dir / 'order_history.json').exists()
+        assert (io_dir / 'trade_history.csv').exists()
+
     def test_session_single_unit(self, tmp_path):
         io_dir = tmp_path / 'io'
         result = AutoTraderResult(execution_stats=_stats(7, 6, 1, 4))
@@ -97,3 +108,15 @@ class TestDeriveAndPersist:
         assert len(unified.execution_stats.units) == 1
         assert unified.execution_stats.units[0].symbol == 'BTCUSD'
         assert unified.execution_stats.totals.orders_executed == 6
+
+    def test_parallel_equals_sequential(self, tmp_path):
+        # The task graph on 4 threads builds the same models + writes the same artifacts.
+        units = run_units_from_batch(_batch())
+        sequential = SharedReportCoordinator.derive_and_persist(units, tmp_path / 'seq')
+        parallel = SharedReportCoordinator.derive_and_persist(
+            units, tmp_path / 'par', max_workers=4)
+        assert parallel == sequential
+        for name in _EXPECTED_FILES:
+            assert (tmp_path / 'par' / name).exists(), f'missing artifact: {name}'
+        assert (tmp_path / 'par' / 'run_summary.json').read_text() \
+            == (tmp_path / 'seq' / 'run_summary.json').read_text()
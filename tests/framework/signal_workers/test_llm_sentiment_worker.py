@@ -120,6 +120,7 @@ def _orchestrator(worker) -> WorkerOrchestrator:
     orch._worker_results = {}
     orch._signal_workers = {worker.name: worker}
     orch._signal_stale_state = {}
+    orch._output_series = {}
     orch._signal_episodes = []
     orch._signal_episode_open = {}
     orch._last_signal_pass_time = None
@@ -156,6 +156,7 @@ def _orchestrator(worker: BollingerWorker) -> WorkerOrchestrator:
     orch._worker_results = {}
     orch._signal_workers = {}
     orch._signal_stale_state = {}
+    orch._output_series = {}
     orch.logger = MagicMock()
     orch.parallel_workers = False
     orch._coordination_stats = SimpleNamespace(ticks_processed=0)
@@ -0,0 +1,113 @@
+"""
+FiniexTestingIDE - Worker Batch Computation Tests
+
+Tests the compute_batch() forms of the CORE indicator workers (vectorized screening).
+
+Contract: index i of every batch output equals what compute() returns right after bar i
+closes under compute_basis BAR_CLOSE (completed bars 0..i) — NaN while the window is not
+full. Each test replays compute() bar by bar and compares against the batch arrays.
+"""
+
+import numpy as np
+import pytest
+
+from python.framework.types.screening_types import BarSeries
+from python.framework.workers.core.bollinger_worker import BollingerWorker
+from python.framework.workers.core.ma_trend_worker import MaTrendWorker
+from python.framework.workers.core.macd_worker import MacdWorker
+from python.framework.workers.core.obv_worker import ObvWorker
+from python.framework.workers.core.rsi_worker import RsiWorker
+
+from conftest import make_bars_with_volume, make_tick
+
+# Deterministic zig-zag with drift — ups, downs and flat moves
+CLOSES = [100.0 + 0.4 * i + (1.5 if i % 3 == 0 else -0.8 if i % 3 == 1 else 0.0)
+          for i in range(45)]
+CLOSES[20] = CLOSES[19]
+VOLUMES = [float(100 + (i * 37) % 250) for i in range(45)]
+
+
+def _series(bars) -> BarSeries:
+    return BarSeries(
+        timeframe='M5',
+        times_msc=np.arange(len(bars), dtype=np.int64) * 300_000,
+        open=np.array([b.open for b in bars]),
+        high=np.array([b.high for b in bars]),
+        low=np.array([b.low for b in bars]),
+        close=np.array([b.close for b in bars]),
+        volume=np.array([b.volume for b in bars]),
+        tick_count=np.array([b.tick_count for b in bars]),
+    )
+
+
+def _assert_batch_matches_compute(worker, first_valid: int):
+    """Replay compute() after every bar close and compare with compute_batch()."""
+    bars = make_bars_with_volume(closes=CLOSES, volumes=VOLUMES)
+    batch = worker.compute_batch(_series(bars))
+
+    for key, values in batch.items():
+        assert len(values) == len(bars), key
+        # Window not full yet — no value
+        head = values[:first_valid]
+        if values.dtype == bool:
+            assert not head.any(), key
+        elif values.dtype == object:
+            assert all(v is None for v in head) or key == 'market_type', key
+        else:
+            assert np.isnan(head).all(), key
+
+    for i in range(first_valid, len(bars)):
+        close = bars[i].close
+        outputs = worker.compute(
+            tick=make_tick(bid=close, ask=close),
+            bar_history={'M5': bars[:i + 1]}, current_bars={}).outputs
+        for key, expected in outputs.items():
+            value = batch[key][i]
+            if isinstance(expected, (str, bool)) or expected is None:
+                assert value == expected, (key, i)
+            else:
+                assert value == pytest.approx(expected, rel=1e-9, abs=1e-9), (key, i)
+
+
+def _bar_close(parameters):
+    return {**parameters, 'compute_basis': 'bar_close'}
+
+
+class TestBatchMatchesCompute:
+    """compute_batch() equals the bar-by-bar compute() under BAR_CLOSE."""
+
+    def test_rsi(self, mock_logger):
+        worker = RsiWorker(name='rsi', parameters=_bar_close(
+            {'periods': {'M5': 14}}), logger=mock_logger)
+        _assert_batch_matches_compute(worker, first_valid=14)
+
+    @pytest.mark.parametrize('ma_type', ['sma', 'ema'])
+    def test_bollinger(self, mock_logger, ma_type):
+        worker = BollingerWorker(name='bb', parameters=_bar_close(
+            {'periods': {'M5': 20}, 'deviation': 2.0, 'ma_type': ma_type}), logger=mock_logger)
+        _assert_batch_matches_compute(worker, first_valid=19)
+
+    @pytest.mark.parametrize('ma_type', ['sma', 'ema'])
+    def test_ma_trend(self, mock_logger, ma_type):
+        worker = MaTrendWorker(name='trend', parameters=_bar_close(
+            {'periods': {'M5': 10}, 'ma_type': ma_type, 'neutral_band': 0.1}), logger=mock_logger)
+        _assert_batch_matches_compute(worker, first_valid=9)
+
+    def test_macd(self, mock_logger):
+        worker = MacdWorker(name='macd', parameters=_bar_close({
+            'periods': {'M5': 30}, 'fast_period': 5, 'slow_period': 12, 'signal_period': 4,
+        }), logger=mock_logger)
+        _assert_batch_matches_compute(worker, first_valid=29)
+
+    def test_obv(self, mock_logger):
+        worker = ObvWorker(name='obv', parameters=_bar_close(
+            {'periods': {'M5': 12}}), logger=mock_logger)
+        _assert_batch_matches_compute(worker, first_valid=12)
+
+
+def test_short_series_is_all_nan(mock_logger):
+    """Fewer bars than the window — no value at any index."""
+    worker = RsiWorker(name='rsi', parameters={'periods': {'M5': 14}}, logger=mock_logger)
+    bars = make_bars_with_volume(closes=CLOSES[:10], volumes=VOLUMES[:10])
+    batch = worker.compute_batch(_series(bars))
+    assert np.isnan(batch['rsi_value']).all()
@@ -150,3 +150,36 @@ class TestSubscriptionValidation:
             self._build(mock_logger, {
                 'absent': WorkerRequirement.all('CORE/rsi'),
             })
+
+
+class TestVariantDecisionGating:
+    """Variant decision logics (multi-decision sweep) share the workers — gating is the union."""
+
+    def _gated(self, mock_logger, *declarations):
+        worker = _bollinger(mock_logger)
+        logics = [_StubLogic(mock_logger, {'bollinger_main': decl}) for decl in declarations]
+        WorkerOrchestrator(
+            workers=[worker],
+            decision_logic=logics[0],
+            strategy_config={'worker_instances': {'bollinger_main': 'CORE/bollinger'}},
+            worker_decision_tracking=False,
+            variant_decision_logics=logics[1:],
+        )
+        return worker
+
+    def test_union_of_declared_signals(self, mock_logger):
+        worker = self._gated(
+            mock_logger,
+            WorkerRequirement.of('CORE/bollinger', 'position'),
+            WorkerRequirement.of('CORE/bollinger', 'slope'),
+        )
+        assert worker.wants_output('position') and worker.wants_output('slope')
+        assert not worker.wants_output('width_pct')
+
+    def test_any_subscribe_all_keeps_compute_all(self, mock_logger):
+        worker = self._gated(
+            mock_logger,
+            WorkerRequirement.of('CORE/bollinger', 'position'),
+            WorkerRequirement.all('CORE/bollinger'),
+        )
+        assert worker.wants_output('width_pct')
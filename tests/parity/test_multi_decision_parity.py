@@ -0,0 +1,250 @@
+"""
+Multi-Decision Tick Loop Parity
+
+A multi-decision sweep runs N decision stacks on ONE worker pipeline
+(execute_multi_decision_tick_loop). Each stack must produce exactly the run a
+standalone execute_tick_loop of its combination produces — same trades, same
+portfolio. Deterministic: synthetic ticks, real workers / orchestrator /
+TradeSimulator (MockBrokerAdapter), BacktestingDeterministic as the decision
+(a heartbeat opt-in subclass for the ghost-pass case).
+"""
+
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+from unittest.mock import MagicMock
+
+from python.framework.bars.bar_rendering_controller import BarRenderingController
+from python.framework.decision_logic.core.backtesting.backtesting_deterministic import BacktestingDeterministic
+from python.framework.logging.coordinator_tick_logger import CoordinatorTickLogger
+from python.framework.logging.scenario_logger import ScenarioLogger
+from python.framework.process.process_multi_decision_tick_loop import (
+    DecisionStack, _end_stack, execute_multi_decision_tick_loop)
+from python.framework.process.process_tick_loop import execute_tick_loop
+from python.framework.testing.mock_broker_adapter import MockBrokerAdapter, MockExecutionMode
+from python.framework.trading_env.broker_config import BrokerConfig
+from python.framework.trading_env.decision_trading_api import DecisionTradingApi
+from python.framework.trading_env.simulation.trade_simulator import TradeSimulator
+from python.framework.types.live_types.live_stats_config_types import LiveStatsExportConfig
+from python.framework.types.decision_logic_types import Decision
+from python.framework.types.process_data_types import ProcessScenarioConfig, ProcessTickLoopResult
+from python.framework.types.trading_env_types.broker_types import BrokerType
+from python.framework.types.worker_types import WorkerResult
+from python.framework.workers.core.backtesting.backtesting_sample_worker import BacktestingSampleWorker
+from python.framework.workers.worker_orchestrator import WorkerOrchestrator
+
+from tests.shared.parity_comparators import assert_portfolio_equal, assert_trades_equal
+from tests.shared.parity_fixtures import make_synthetic_btcusd_ticks
+
+SYMBOL = 'BTCUSD'
+
+# Three combinations of one decision-only grid: different entry ticks / directions / holds
+_COMBINATIONS = [
+    [{'tick_number': 200, 'direction': 'LONG', 'hold_ticks': 500, 'lot_size': 0.01}],
+    [{'tick_number': 100, 'direction': 'LONG', 'hold_ticks': 300, 'lot_size': 0.01},
+     {'tick_number': 600, 'direction': 'LONG', 'hold_ticks': 200, 'lot_size': 0.02}],
+    [{'tick_number': 50, 'direction': 'LONG', 'hold_ticks': 5000, 'lot_size': 0.01}],  # closed at end
+]
+
+
+class _HeartbeatDeterministic(BacktestingDeterministic):
+    """Opts into ghost-passes and records which logic ran each one."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.ghost_passes = 0
+
+    def wants_heartbeat(self) -> bool:
+        return True
+
+    def compute_heartbeat(self, worker_results: Dict[str, WorkerResult]) -> Optional[Decision]:
+        self.ghost_passes += 1
+        return None
+
+
+def _logic_config(trade_sequence: List[Dict]) -> Dict:
+    return {
+        'trade_sequence': trade_sequence,
+        'lot_size': 0.01,
+        'modify_sequence': [],
+        'modify_limit_sequence': [],
+        'modify_stop_sequence': [],
+        'cancel_limit_sequence': [],
+        'cancel_stop_sequence': [],
+    }
+
+
+def _logger(name: str) -> ScenarioLogger:
+    return ScenarioLogger(
+        scenario_set_name='parity', scenario_name=name,
+        run_timestamp=datetime.now(tz=timezone.utc))
+
+
+def _config(ticks, heartbeat_interval_ms: int = 1000) -> ProcessScenarioConfig:
+    return ProcessScenarioConfig(
+        name='multi_decision_parity', symbol=SYMBOL, scenario_index=0,
+        start_time=ticks[0].timestamp,
+        heartbeat_interval_ms=heartbeat_interval_ms,
+        live_stats_config=LiveStatsExportConfig(enabled=False),
+    )
+
+
+def _simulator(logger) -> TradeSimulator:
+    return TradeSimulator(
+        broker_config=BrokerConfig(
+            BrokerType.KRAKEN_SPOT, MockBrokerAdapter(mode=MockExecutionMode.INSTANT_FILL)),
+        initial_balance=10000.0, account_currency='USD', logger=logger,
+        seeds={'inbound_latency_seed': 42},
+        inbound_latency_min_ms=0, inbound_latency_max_ms=0,
+        spot_mode=True, initial_balances={'USD': 10000.0, 'BTC': 0.0},
+    )
+
+
+def _stack(trade_sequence, logger, logic_class=BacktestingDeterministic) -> DecisionStack:
+    """A decision logic wired to its own TradeSimulator."""
+    config = _logic_config(trade_sequence)
+    simulator = _simulator(logger)
+    logic = logic_class(
+        name='multi_decision_parity_logic', logger=logger, config=config, trading_context=None)
+    logic.set_trading_api(DecisionTradingApi(
+        executor=simulator,
+        required_order_types=logic.get_required_order_types(config),
+        order_guard_config=None,
+    ))
+    return DecisionStack(decision_logic=logic, trade_simulator=simulator)
+
+
+def _pipeline(logger, decision_logic, variant_decision_logics=None):
+    """Real worker + orchestrator + bar controller."""
+    worker = BacktestingSampleWorker(
+        name='backtesting_worker',
+        parameters={'periods': {'M1': 2}, 'bar_snapshot_checks': []}, logger=logger)
+    orchestrator = WorkerOrchestrator(
+        workers=[worker],
+        decision_logic=decision_logic,
+        strategy_config={'worker_instances': {
+            'backtesting_worker': 'CORE/backtesting/backtesting_sample_worker'}},
+        worker_decision_tracking=False,
+        variant_decision_logics=variant_decision_logics,
+    )
+    orchestrator.initialize()
+    controller = BarRenderingController(logger=logger)
+    controller.register_workers([worker])
+    return orchestrator, controller
+
+
+def _run_standalone(ticks, trade_sequence, logic_class=BacktestingDeterministic,
+                    heartbeat_interval_ms: int = 1000):
+    """One combination through execute_tick_loop → (result, decision logic)."""
+    logger = _logger('multi_decision_parity_single')
+    stack = _stack(trade_sequence, logger, logic_class)
+    orchestrator, controller = _pipeline(logger, stack.decision_logic)
+    result = execute_tick_loop(
+        config=_config(ticks, heartbeat_interval_ms), worker_coordinator=orchestrator,
+        trade_simulator=stack.trade_simulator, bar_rendering_controller=controller,
+        decision_logic=stack.decision_logic, scenario_logger=logger, ticks=tuple(ticks))
+    return result, stack.decision_logic
+
+
+def _run_multi(ticks, combinations, logic_class=BacktestingDeterministic,
+               heartbeat_interval_ms: int = 1000):
+    """All combinations as stacks on one pipeline → (results, decision logics)."""
+    logger = _logger('multi_decision_parity_multi')
+    stacks = [_stack(trade_sequence, logger, logic_class) for trade_sequence in combinations]
+    orchestrator, controller = _pipeline(
+        logger, stacks[0].decision_logic, [s.decision_logic for s in stacks[1:]])
+    results = execute_multi_decision_tick_loop(
+        config=_config(ticks, heartbeat_interval_ms), worker_coordinator=orchestrator,
+        stacks=stacks, bar_rendering_controller=controller, scenario_logger=logger,
+        ticks=tuple(ticks))
+    return results, [stack.decision_logic for stack in stacks]
+
+
+def test_each_stack_equals_its_standalone_run():
+    ticks = make_synthetic_btcusd_ticks(1000)
+    multi, _ = _run_multi(ticks, _COMBINATIONS)
+
+    assert len(multi) == len(_COMBINATIONS)
+    for trade_sequence, stack_result in zip(_COMBINATIONS, multi):
+        single, _ = _run_standalone(ticks, trade_sequence)
+        assert stack_result.tick_loop_error is None
+        assert stack_result.trade_history, 'every combination should have traded'
+        assert_trades_equal(stack_result.trade_history, single.trade_history)
+        assert_portfolio_equal(stack_result.portfolio_stats, single.portfolio_stats)
+        assert (stack_result.decision_statistics.buy_signals
+                == single.decision_statistics.buy_signals)
+
+
+def test_each_stack_runs_its_own_ghost_passes():
+    # 1 s tick spacing, 250 ms heartbeat → 3 ghost moments per gap
+    ticks = make_synthetic_btcusd_ticks(1000)
+    multi, logics = _run_multi(
+        ticks, _COMBINATIONS, _HeartbeatDeterministic, heartbeat_interval_ms=250)
+
+    for trade_sequence, stack_result, logic in zip(_COMBINATIONS, multi, logics):
+        single, single_logic = _run_standalone(
+            ticks, trade_sequence, _HeartbeatDeterministic, heartbeat_interval_ms=250)
+        assert stack_result.tick_loop_error is None
+        assert single_logic.ghost_passes > 0
+        # Each stack's own logic runs its ghost-passes — once per ghost moment
+        assert logic.ghost_passes == single_logic.ghost_passes
+        assert_trades_equal(stack_result.trade_history, single.trade_history)
+        assert_portfolio_equal(stack_result.portfolio_stats, single.portfolio_stats)
+
+
+def test_workers_compute_once_per_tick():
+    ticks = make_synthetic_btcusd_ticks(300)
+    multi, _ = _run_multi(ticks, _COMBINATIONS)
+    single, _ = _run_standalone(ticks, _COMBINATIONS[0])
+
+    # The shared pipeline processes each tick once, however many stacks it feeds
+    assert (multi[0].coordination_statistics.ticks_processed
+            == single.coordination_statistics.ticks_processed)
+
+
+def test_failing_stack_does_not_stop_the_others(monkeypatch):
+    ticks = make_synthetic_btcusd_ticks(1000)
+    logger = _logger('multi_decision_parity_fail')
+    stacks = [_stack(trade_sequence, logger) for trade_sequence in _COMBINATIONS[:2]]
+
+    def _boom(decision, tick):
+        raise ValueError('variant exploded')
+
+    monkeypatch.setattr(stacks[1].decision_logic, '_execute_decision_impl', _boom)
+    orchestrator, controller = _pipeline(
+        logger, stacks[0].decision_logic, [stacks[1].decision_logic])
+    results = execute_multi_decision_tick_loop(
+        config=_config(ticks), worker_coordinator=orchestrator, stacks=stacks,
+        bar_rendering_controller=controller, scenario_logger=logger, ticks=tuple(ticks))
+
+    assert 'variant exploded' in str(results[1].tick_loop_error)
+    assert results[0].tick_loop_error is None
+    assert_trades_equal(results[0].trade_history,
+                        _run_standalone(ticks, _COMBINATIONS[0])[0].trade_history)
+
+
+def test_primary_stack_writes_the_tick_log(monkeypatch):
+    """The VERBOSE tick log is written once per tick, as in the standalone run — not once per stack."""
+    ticks = make_synthetic_btcusd_ticks(300)
+    logged = []
+    monkeypatch.setattr(CoordinatorTickLogger, 'log_tick_data',
+                        lambda self, **kwargs: logged.append(kwargs['decision']))
+
+    _run_standalone(ticks, _COMBINATIONS[0])
+    single_count = len(logged)
+    logged.clear()
+    _run_multi(ticks, _COMBINATIONS)
+
+    assert single_count > 0
+    assert len(logged) == single_count
+
+
+def test_ended_stack_finishes_its_stale_stress_at_its_end_tick():
+    ticks = make_synthetic_btcusd_ticks(10)
+    driver = MagicMock()
+    stack = DecisionStack(decision_logic=MagicMock(), trade_simulator=MagicMock(),
+                          stale_stress_driver=driver)
+
+    _end_stack(stack, ticks[4], MagicMock())
+
+    assert stack.end_tick is ticks[4]
+    driver.finish.assert_called_once_with()
@@ -0,0 +1,254 @@
+"""
+Scenario Chunk Parity
+
+Chunked execution runs one long scenario as K time chunks in parallel processes: a later
+chunk's ticks start early by the warm-up bars (render-only), its trading range starts on a
+fresh portfolio, and the chunk results are stitched into one scenario result. Trades that
+close inside their chunk must equal the sequential run's; a position open across a chunk
+boundary is force-closed there and reported as the block-boundary deviation.
+Deterministic: synthetic ticks, real workers / orchestrator / TradeSimulator
+(MockBrokerAdapter), BacktestingDeterministic as the decision (tick-counted entries — the
+sequence is replayed per chunk, shifted by the chunk offset in the sequential run).
+"""
+
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
+from unittest.mock import MagicMock
+
+import pytest
+
+from python.framework.bars.bar_rendering_controller import BarRenderingController
+from python.framework.batch.requirements_collector import RequirementsCollector
+from python.framework.batch.scenario_chunk_planner import ScenarioChunkPlanner
+from python.framework.batch.scenario_chunk_stitcher import _stitch_portfolio_stats, stitch_chunk_results
+from python.framework.decision_logic.core.backtesting.backtesting_deterministic import BacktestingDeterministic
+from python.framework.logging.bootstrap_logger import get_global_logger
+from python.framework.logging.scenario_logger import ScenarioLogger
+from python.framework.process.process_startup_preparation import _render_chunk_warmup
+from python.framework.process.process_tick_loop import execute_tick_loop
+from python.framework.testing.mock_broker_adapter import MockBrokerAdapter, MockExecutionMode
+from python.framework.trading_env.broker_config import BrokerConfig
+from python.framework.trading_env.decision_trading_api import DecisionTradingApi
+from python.framework.trading_env.simulation.trade_simulator import TradeSimulator
+from python.framework.types.live_types.live_stats_config_types import LiveStatsExportConfig
+from python.framework.types.portfolio_types.portfolio_aggregation_types import PortfolioStats
+from python.framework.types.portfolio_types.portfolio_trade_record_types import CloseReason
+from python.framework.types.process_data_types import ProcessDataPackage, ProcessResult, ProcessScenarioConfig
+from python.framework.types.scenario_types.scenario_set_types import SingleScenario
+from python.framework.types.trading_env_types.broker_types import BrokerType
+from python.framework.workers.core.backtesting.backtesting_sample_worker import BacktestingSampleWorker
+from python.framework.workers.worker_orchestrator import WorkerOrchestrator
+
+from tests.shared.parity_comparators import assert_portfolio_equal, assert_trades_equal
+from tests.shared.parity_fixtures import make_synthetic_btcusd_ticks
+
+SYMBOL = 'BTCUSD'
+TICKS = 3000
+CHUNKS = 3
+CHUNK_TICKS = TICKS // CHUNKS
+
+# Per chunk: a trade closed inside the chunk, or one still open at the chunk end
+_INSIDE = {'tick_number': 20, 'direction': 'LONG', 'hold_ticks': 100, 'lot_size': 0.01}
+_ACROSS = {'tick_number': 900, 'direction': 'LONG', 'hold_ticks': 300, 'lot_size': 0.02}
+
+
+def _logic_config(trade_sequence: List[Dict]) -> Dict:
+    return {
+        'trade_sequence': trade_sequence,
+        'lot_size': 0.01,
+        'modify_sequence': [],
+        'modify_limit_sequence': [],
+        'modify_stop_sequence': [],
+        'cancel_limit_sequence': [],
+        'cancel_stop_sequence': [],
+    }
+
+
+def _sequential_sequence(per_chunk: List[Dict]) -> List[Dict]:
+    """The chunk sequence replayed at every chunk offset of the whole run."""
+    return [{**spec, 'tick_number': spec['tick_number'] + chunk * CHUNK_TICKS}
+            for chunk in range(CHUNKS) for spec in per_chunk]
+
+
+def _logger(name: str) -> ScenarioLogger:
+    return ScenarioLogger(
+        scenario_set_name='parity', scenario_name=name,
+        run_timestamp=datetime.now(tz=timezone.utc))
+
+
+def _config(ticks) -> ProcessScenarioConfig:
+    return ProcessScenarioConfig(
+        name='scenario_chunk_parity', symbol=SYMBOL, scenario_index=0,
+        start_time=ticks[0].timestamp,
+        live_stats_config=LiveStatsExportConfig(enabled=False),
+    )
+
+
+def _strategy_config() -> Dict:
+    return {
+        'worker_instances': {'backtesting_worker': 'CORE/backtesting/backtesting_sample_worker'},
+        'workers': {'backtesting_worker': {'periods': {'M1': 2}, 'bar_snapshot_checks': []}},
+    }
+
+
+def _run(config, ticks, trade_sequence, warmup: bool = False) -> ProcessResult:
+    """One process worth of pipeline: real worker, orchestrator, simulator, decision."""
+    logger = _logger(config.name)
+    logic_config = _logic_config(trade_sequence)
+    simulator = TradeSimulator(
+        broker_config=BrokerConfig(
+            BrokerType.KRAKEN_SPOT, MockBrokerAdapter(mode=MockExecutionMode.INSTANT_FILL)),
+        initial_balance=10000.0, account_currency='USD', logger=logger,
+        seeds={'inbound_latency_seed': 42},
+        inbound_latency_min_ms=0, inbound_latency_max_ms=0,
+        spot_mode=True, initial_balances={'USD': 10000.0, 'BTC': 0.0},
+    )
+    logic = BacktestingDeterministic(
+        name='scenario_chunk_parity_logic', logger=logger, config=logic_config,
+        trading_context=None)
+    logic.set_trading_api(DecisionTradingApi(
+        executor=simulator,
+        required_order_types=logic.get_required_order_types(logic_config),
+        order_guard_config=None,
+    ))
+    worker = BacktestingSampleWorker(
+        name='backtesting_worker',
+        parameters={'periods': {'M1': 2}, 'bar_snapshot_checks': []}, logger=logger)
+    orchestrator = WorkerOrchestrator(
+        workers=[worker], decision_logic=logic,
+        strategy_config=_strategy_config(), worker_decision_tracking=True)
+    orchestrator.initialize()
+    controller = BarRenderingController(logger=logger)
+    controller.register_workers([worker])
+
+    if warmup:
+        ticks = _render_chunk_warmup(config, ticks, controller, logger)
+    result = execute_tick_loop(
+        config=config, worker_coordinator=orchestrator, trade_simulator=simulator,
+        bar_rendering_controller=controller, decision_logic=logic,
+        scenario_logger=logger, ticks=tuple(ticks))
+    return ProcessResult(success=True, scenario_name=config.name, scenario_index=0,
+                         tick_loop_results=result)
+
+
+def _scenario(ticks) -> SingleScenario:
+    return SingleScenario(
+        name='scenario_chunk_parity', scenario_index=0, symbol=SYMBOL,
+        data_broker_type='kraken_spot', start_date=ticks[0].timestamp,
+        end_date=ticks[-1].timestamp, strategy_config=_strategy_config(),
+        execution_config={'scenario_chunks': CHUNKS})
+
+
+def _plan(ticks):
+    scenario = _scenario(ticks)
+    package = ProcessDataPackage(ticks={SYMBOL: tuple(ticks)}, bars={}, broker_configs=())
+    planner = ScenarioChunkPlanner(
+        logger=MagicMock(), requirements_collector=RequirementsCollector(get_global_logger()))
+    planner.plan([scenario], {0: package})
+    return scenario, planner.chunk_packages([scenario], {0: package})[0]
+
+
+def _run_chunked(ticks, per_chunk: List[Dict]) -> ProcessResult:
+    scenario, packages = _plan(ticks)
+    base = _config(ticks)
+    chunk_results = [
+        _run(base.for_chunk(chunk), package.ticks[SYMBOL], per_chunk, warmup=True)
+        for chunk, package in zip(scenario.chunks, packages)]
+    return stitch_chunk_results(chunk_results, scenario.name, 0)
+
+
+def test_planner_cuts_equal_chunks_with_warmup_overlap():
+    ticks = make_synthetic_btcusd_ticks(TICKS)
+    scenario, packages = _plan(ticks)
+
+    assert [c.start_time for c in scenario.chunks] == [
+        ticks[0].timestamp, ticks[CHUNK_TICKS].timestamp, ticks[2 * CHUNK_TICKS].timestamp]
+    assert scenario.chunks[0].warmup_start is None
+    # M1 x 2 bars: the chunk start's bar from its first tick + 2 complete minutes before it
+    # (chunk 1 starts at 10:16:40 → from 10:14:00, chunk 2 at 10:33:20 → from 10:31:00)
+    assert [len(p.ticks[SYMBOL]) for p in packages] == [CHUNK_TICKS, CHUNK_TICKS + 160,
+                                                         CHUNK_TICKS + 140]
+    assert packages[1].ticks[SYMBOL][160] is ticks[CHUNK_TICKS]
+
+
+def test_warmup_overlap_counts_bars_across_a_market_gap():
+    # A weekend gap right before chunk 1: a time-sized overlap would hold no ticks at all
+    ticks = make_synthetic_btcusd_ticks(TICKS)
+    gap = timedelta(days=2)
+    ticks = ticks[:CHUNK_TICKS] + [
+        replace(tick, timestamp=tick.timestamp + gap) for tick in ticks[CHUNK_TICKS:]]
+    scenario, packages = _plan(ticks)
+
+    start = scenario.chunks[1].start_time
+    overlap = [tick for tick in packages[1].ticks[SYMBOL] if tick.timestamp < start]
+    # Before the gap: the start's own bar is empty, 2 complete M1 bars carry the warm-up
+    assert {tick.timestamp.replace(second=0) for tick in overlap} == {
+        ticks[CHUNK_TICKS - 1].timestamp.replace(second=0) - timedelta(minutes=1),
+        ticks[CHUNK_TICKS - 1].timestamp.replace(second=0)}
+    assert overlap[0].timestamp.second == 0
+
+
+def test_stitched_chunks_equal_the_sequential_run():
+    ticks = make_synthetic_btcusd_ticks(TICKS)
+    chunked = _run_chunked(ticks, [_INSIDE])
+    sequential = _run(_config(ticks), ticks, _sequential_sequence([_INSIDE]))
+
+    stitched = chunked.tick_loop_results
+    assert chunked.success and stitched.tick_loop_error is None
+    assert len(stitched.trade_history) == CHUNKS
+    assert_trades_equal(stitched.trade_history, sequential.tick_loop_results.trade_history)
+    assert_portfolio_equal(stitched.portfolio_stats, sequential.tick_loop_results.portfolio_stats)
+    assert stitched.portfolio_stats.max_drawdown == pytest.approx(
+        sequential.tick_loop_results.portfolio_stats.max_drawdown)
+    assert stitched.coordination_statistics.ticks_processed == TICKS
+    assert stitched.block_boundary_report.force_closed_trades == 0
+
+
+def test_boundary_crossing_position_is_reported_as_deviation():
+    ticks = make_synthetic_btcusd_ticks(TICKS)
+    chunked = _run_chunked(ticks, [_ACROSS])
+    sequential = _run(_config(ticks), ticks, _sequential_sequence([_ACROSS]))
+
+    stitched = chunked.tick_loop_results.trade_history
+    sequential_trades = sequential.tick_loop_results.trade_history
+    assert len(stitched) == len(sequential_trades) == CHUNKS
+    # Same entries; the chunk end cuts the holding period short (the sequential run holds on)
+    assert [t.entry_time for t in stitched] == [t.entry_time for t in sequential_trades]
+    assert stitched[0].exit_time < sequential_trades[0].exit_time
+    boundary_closes = [t for t in stitched[:-1] if t.close_reason == CloseReason.SCENARIO_END]
+    assert len(boundary_closes) == CHUNKS - 1
+    assert len({t.position_id for t in stitched}) == len(stitched)
+
+    report = chunked.tick_loop_results.block_boundary_report
+    assert report.force_closed_trades == CHUNKS - 1
+    assert report.force_closed_pnl == sum(t.net_pnl for t in boundary_closes)
+    assert report.force_closed_trades + report.natural_closed_trades == len(stitched)
+
+
+def _portfolio(initial: float, final: float, peak: float, trough: float, drawdown: float):
+    """A chunk's portfolio: fresh start at `initial`, equity range [trough, peak]."""
+    return PortfolioStats(
+        broker_type=BrokerType.KRAKEN_SPOT, total_trades=1, total_long_trades=1,
+        total_short_trades=0, winning_trades=int(final > initial),
+        losing_trades=int(final <= initial), total_profit=max(final - initial, 0.0),
+        total_loss=max(initial - final, 0.0), max_drawdown=drawdown, max_equity=peak,
+        win_rate=0.0, profit_factor=0.0, total_spread_cost=0.0, total_commission=0.0,
+        total_swap=0.0, maker_fee=0.0, taker_fee=0.0, total_fees=0.0, currency='USD',
+        broker_name='mock', current_conversion_rate=1.0,
+        current_balance=final, initial_balance=initial, min_equity=trough)
+
+
+def test_stitched_drawdown_spans_a_boundary():
+    # Sequential equity: 1000 → peak 1100 → 1050 (chunk 1 ends) → 1000 → 1020.
+    # Chunk 2 measures its own drawdown from its fresh start: 1000 → 950 = 50.
+    stats = _stitch_portfolio_stats([
+        _portfolio(1000.0, 1050.0, peak=1100.0, trough=1000.0, drawdown=50.0),
+        _portfolio(1000.0, 970.0, peak=1000.0, trough=950.0, drawdown=50.0),
+    ])
+
+    # The sequential run measures the drop from the chunk-1 peak: 1100 → 1000
+    assert stats.max_drawdown == 100.0
+    assert stats.max_equity == 1100.0
+    assert stats.min_equity == 1000.0
+    assert stats.current_balance == 1020.0
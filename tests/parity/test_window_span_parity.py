@@ -0,0 +1,176 @@
+"""
+Window Span Tick Loop Parity
+
+Single-pass robustness runs adjacent windows as ONE span on one worker pipeline
+(execute_window_span_tick_loop): bars + workers carry over, each window gets a
+fresh decision stack. Every window must trade exactly like a standalone
+execute_tick_loop over its own tick slice — same trades, same portfolio.
+Deterministic: synthetic ticks, real workers / orchestrator / TradeSimulator
+(MockBrokerAdapter), BacktestingDeterministic as the decision (tick-counted
+entries — independent of the warm-up a standalone window lacks).
+"""
+
+from datetime import datetime, timezone
+from typing import Dict, List
+
+from python.framework.bars.bar_rendering_controller import BarRenderingController
+from python.framework.decision_logic.core.backtesting.backtesting_deterministic import BacktestingDeterministic
+from python.framework.logging.scenario_logger import ScenarioLogger
+from python.framework.process.process_multi_decision_tick_loop import DecisionStack
+from python.framework.process.process_tick_loop import execute_tick_loop
+from python.framework.process.process_window_span_tick_loop import (
+    execute_window_span_tick_loop, split_span_ticks)
+from python.framework.testing.mock_broker_adapter import MockBrokerAdapter, MockExecutionMode
+from python.framework.trading_env.broker_config import BrokerConfig
+from python.framework.trading_env.decision_trading_api import DecisionTradingApi
+from python.framework.trading_env.simulation.trade_simulator import TradeSimulator
+from python.framework.types.live_types.live_stats_config_types import LiveStatsExportConfig
+from python.framework.types.process_data_types import ProcessScenarioConfig, ProcessTickLoopResult
+from python.framework.types.scenario_types.window_span_types import WindowBoundary
+from python.framework.types.trading_env_types.broker_types import BrokerType
+from python.framework.workers.core.backtesting.backtesting_sample_worker import BacktestingSampleWorker
+from python.framework.workers.worker_orchestrator import WorkerOrchestrator
+
+from tests.shared.parity_comparators import assert_portfolio_equal, assert_trades_equal
+from tests.shared.parity_fixtures import make_synthetic_btcusd_ticks
+
+SYMBOL = 'BTCUSD'
+
+# One trade sequence, replayed per window: a closed trade + one still open at the window end
+_TRADE_SEQUENCE = [
+    {'tick_number': 20, 'direction': 'LONG', 'hold_ticks': 100, 'lot_size': 0.01},
+    {'tick_number': 150, 'direction': 'LONG', 'hold_ticks': 5000, 'lot_size': 0.02},
+]
+_WINDOW_STARTS = (300, 600)   # tick positions of the later windows' starts (900 ticks)
+
+
+def _logic_config() -> Dict:
+    return {
+        'trade_sequence': _TRADE_SEQUENCE,
+        'lot_size': 0.01,
+        'modify_sequence': [],
+        'modify_limit_sequence': [],
+        'modify_stop_sequence': [],
+        'cancel_limit_sequence': [],
+        'cancel_stop_sequence': [],
+    }
+
+
+def _logger(name: str) -> ScenarioLogger:
+    return ScenarioLogger(
+        scenario_set_name='parity', scenario_name=name,
+        run_timestamp=datetime.now(tz=timezone.utc))
+
+
+def _config(ticks, window_span=None) -> ProcessScenarioConfig:
+    return ProcessScenarioConfig(
+        name='window_span_parity_w1', symbol=SYMBOL, scenario_index=0,
+        start_time=ticks[0].timestamp,
+        live_stats_config=LiveStatsExportConfig(enabled=False),
+        window_span=window_span or [],
+    )
+
+
+def _stack(logger) -> DecisionStack:
+    """A fresh decision logic wired to its own TradeSimulator."""
+    config = _logic_config()
+    simulator = TradeSimulator(
+        broker_config=BrokerConfig(
+            BrokerType.KRAKEN_SPOT, MockBrokerAdapter(mode=MockExecutionMode.INSTANT_FILL)),
+        initial_balance=10000.0, account_currency='USD', logger=logger,
+        seeds={'inbound_latency_seed': 42},
+        inbound_latency_min_ms=0, inbound_latency_max_ms=0,
+        spot_mode=True, initial_balances={'USD': 10000.0, 'BTC': 0.0},
+    )
+    logic = BacktestingDeterministic(
+        name='window_span_parity_logic', logger=logger, config=config, trading_context=None)
+    logic.set_trading_api(DecisionTradingApi(
+        executor=simulator,
+        required_order_types=logic.get_required_order_types(config),
+        order_guard_config=None,
+    ))
+    return DecisionStack(decision_logic=logic, trade_simulator=simulator)
+
+
+def _pipeline(logger, decision_logic):
+    """Real worker + orchestrator + bar controller."""
+    worker = BacktestingSampleWorker(
+        name='backtesting_worker',
+        parameters={'periods': {'M1': 2}, 'bar_snapshot_checks': []}, logger=logger)
+    orchestrator = WorkerOrchestrator(
+        workers=[worker],
+        decision_logic=decision_logic,
+        strategy_config={'worker_instances': {
+            'backtesting_worker': 'CORE/backtesting/backtesting_sample_worker'}},
+        worker_decision_tracking=True,
+    )
+    orchestrator.initialize()
+    controller = BarRenderingController(logger=logger)
+    controller.register_workers([worker])
+    return orchestrator, controller
+
+
+def _boundaries(ticks) -> List[WindowBoundary]:
+    return [WindowBoundary(name=f'window_span_parity_w{i + 2}', scenario_index=i + 1,
+                           start_time=ticks[position].timestamp)
+            for i, position in enumerate(_WINDOW_STARTS)]
+
+
+def _run_span(ticks):
+    logger = _logger('window_span_parity_span')
+    windows = [_stack(logger) for _ in range(len(_WINDOW_STARTS) + 1)]
+    orchestrator, controller = _pipeline(logger, windows[0].decision_logic)
+    results = execute_window_span_tick_loop(
+        config=_config(ticks, _boundaries(ticks)), worker_coordinator=orchestrator,
+        windows=windows, bar_rendering_controller=controller, scenario_logger=logger,
+        ticks=tuple(ticks))
+    return results, controller
+
+
+def _run_standalone(window_ticks):
+    logger = _logger('window_span_parity_single')
+    stack = _stack(logger)
+    orchestrator, controller = _pipeline(logger, stack.decision_logic)
+    result: ProcessTickLoopResult = execute_tick_loop(
+        config=_config(window_ticks), worker_coordinator=orchestrator,
+        trade_simulator=stack.trade_simulator, bar_rendering_controller=controller,
+        decision_logic=stack.decision_logic, scenario_logger=logger, ticks=tuple(window_ticks))
+    return result, controller
+
+
+def test_split_cuts_at_window_starts():
+    ticks = tuple(make_synthetic_btcusd_ticks(900))
+    slices = split_span_ticks(ticks, [b.start_time for b in _boundaries(ticks)])
+    assert [len(s) for s in slices] == [300, 300, 300]
+    assert slices[1][0] is ticks[300]
+
+
+def test_each_window_equals_its_standalone_run():
+    ticks = make_synthetic_btcusd_ticks(900)
+    span_results, _ = _run_span(ticks)
+    slices = split_span_ticks(tuple(ticks), [b.start_time for b in _boundaries(ticks)])
+
+    assert len(span_results) == len(slices)
+    for window_result, window_ticks in zip(span_results, slices):
+        single, _ = _run_standalone(window_ticks)
+        assert window_result.tick_loop_error is None
+        assert len(window_result.trade_history) == 2, 'both trades close inside each window'
+        assert_trades_equal(window_result.trade_history, single.trade_history)
+        assert_portfolio_equal(window_result.portfolio_stats, single.portfolio_stats)
+
+
+def test_pipeline_carries_over_the_boundaries():
+    ticks = make_synthetic_btcusd_ticks(900)
+    span_results, span_controller = _run_span(ticks)
+    last_slice = split_span_ticks(tuple(ticks), [b.start_time for b in _boundaries(ticks)])[-1]
+    _, single_controller = _run_standalone(last_slice)
+
+    # Bars rendered before the last boundary are still in the history (no re-warm)
+    span_bars = span_controller.get_all_bar_history(SYMBOL)['M1']
+    single_bars = single_controller.get_all_bar_history(SYMBOL)['M1']
+    assert len(span_bars) > len(single_bars)
+
+    # Coordination counters per window, the span's worker figures on the lead only
+    assert [r.coordination_statistics.ticks_processed for r in span_results] == [300, 300, 300]
+    assert span_results[0].worker_statistics[0].worker_call_count > 0
+    assert all(r.worker_statistics == [] for r in span_results[1:])
@@ -11,9 +11,11 @@ import tempfile
 from pathlib import Path
 from typing import List
 
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 
-from python.framework.reporting.event_stream_csv_writer import EVENT_FIELDS, EventStreamWriter
+from python.framework.reporting.event_stream_csv_writer import EVENT_FIELDS, EVENT_SCHEMA, EventStreamWriter
 from python.framework.types.portfolio_types.portfolio_trade_record_types import TradeRecord
 from python.framework.types.trading_env_types.order_types import OrderResult
 
@@ -36,6 +38,21 @@ def events_csv_rows(
             return list(csv.reader(f))
 
 
+@pytest.fixture(scope='session')
+def events_table(
+    trade_history: List[TradeRecord],
+    order_history: List[OrderResult]
+) -> pa.Table:
+    """Flush baseline trades/orders to the Parquet event table and read it back."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = EventStreamWriter.from_sim_result(
+            trade_history=trade_history,
+            order_history=order_history,
+            run_dir=Path(tmp),
+        ).flush_parquet('events.parquet')
+        return pq.read_table(path)
+
+
 class TestEventStreamMinimal:
     """Smoke-level guarantees for the everyday sim path."""
 
@@ -53,3 +70,9 @@ class TestEventStreamMinimal:
         """No row truncation — every event row matches EVENT_FIELDS arity."""
         for row in events_csv_rows[1:]:
             assert len(row) == len(EVENT_FIELDS)
+
+    def test_parquet_mirrors_csv(self, events_csv_rows, events_table):
+        """The typed Parquet table carries the CSV rows, same order, EVENT_SCHEMA columns."""
+        assert events_table.schema.equals(EVENT_SCHEMA)
+        assert events_table.num_rows == len(events_csv_rows) - 1
+        assert events_table.column('event_type').to_pylist() == [r[1] for r in events_csv_rows[1:]]
@@ -0,0 +1,136 @@
+"""
+On-disk mount store tests (#420) — cross-invocation persistence of the prepared data mount.
+
+Verifies the store in isolation (tmp cache dir, synthetic mount — no market data needed):
+- save → load round-trips the mount + the per-scenario data-load state
+- only the load phases' validation results are persisted and restored (no Phase 0 replay)
+- the key follows the data identity (window / budget / stress config), not strategy_config
+- incomplete mounts are never persisted, LRU eviction honors max_entries
+- a corrupt entry is a miss, not a crash
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from python.configuration.app_config_manager import AppConfigManager
+from python.framework.batch.mount_store import MountStore
+from python.framework.logging.bootstrap_logger import get_global_logger
+from python.framework.types.mount_package_types import DataIdentityKey, MountPackage
+from python.framework.types.process_data_types import RequirementsMap
+from python.framework.types.scenario_types.scenario_set_types import SingleScenario
+from python.framework.types.validation_types import ValidationResult
+
+START = datetime(2026, 1, 5, 10, 0, tzinfo=timezone.utc)
+END = datetime(2026, 1, 5, 12, 0, tzinfo=timezone.utc)
+
+
+def _scenario(index: int = 0, **overrides) -> SingleScenario:
+    """Minimal scenario carrying only the data-identity fields."""
+    fields = dict(
+        name=f'scenario_{index}', scenario_index=index, symbol='BTCUSD',
+        data_broker_type='kraken_spot', start_date=START, end_date=END,
+        execution_config={'tick_processing_budget_ms': 0.0},
+    )
+    fields.update(overrides)
+    return SingleScenario(**fields)
+
+
+def _mount(scenarios) -> MountPackage:
+    """Synthetic mount with one (picklable) package per scenario."""
+    requirements = RequirementsMap()
+    return MountPackage(
+        scenario_packages={s.scenario_index: {'ticks': (1, 2, 3)} for s in scenarios},
+        clipping_stats_map={}, broker_configs={}, broker_scenario_map={},
+        signal_scenario_map={}, requirements_map=requirements,
+        warmup_phases=[], batch_warmup_time=1.5,
+        data_identity={
+            s.scenario_index: DataIdentityKey.from_scenario(s, requirements.bar_requirements)
+            for s in scenarios
+        },
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    return MountStore(get_global_logger(), AppConfigManager(), cache_dir=tmp_path)
+
+
+def _key(store, scenarios):
+    return store.compute_key(scenarios, RequirementsMap(), {})
+
+
+def test_round_trip(store):
+    scenarios = [_scenario(0), _scenario(1)]
+    scenarios[0].data_format_versions = ['1.3']
+    scenarios[1].validation_result.append(ValidationResult(
+        is_valid=True, scenario_name='scenario_1', errors=[], warnings=['gap']))
+    key = _key(store, scenarios)
+
+    assert store.load(key) is None
+    assert store.save(key, _mount(scenarios), scenarios) is not None
+
+    mount, state = store.load(key)
+    assert mount.data_identity == _mount(scenarios).data_identity
+    assert mount.scenario_packages[1] == {'ticks': (1, 2, 3)}
+    assert mount.batch_warmup_time == 1.5
+
+    fresh = [_scenario(0), _scenario(1)]
+    MountStore.restore_scenario_state(fresh, state)
+    assert fresh[0].data_format_versions == ['1.3']
+    assert fresh[1].validation_result[0].warnings == ['gap']
+
+
+def test_restore_appends_only_load_phase_results(store):
+    def phase0(scenario):
+        scenario.validation_result.append(ValidationResult(
+            is_valid=True, scenario_name=scenario.name, errors=[], warnings=['phase0']))
+
+    scenarios = [_scenario(0)]
+    phase0(scenarios[0])
+    offsets = {0: len(scenarios[0].validation_result)}
+    scenarios[0].validation_result.append(ValidationResult(
+        is_valid=True, scenario_name='scenario_0', errors=[], warnings=['gap']))
+    key = _key(store, scenarios)
+    store.save(key, _mount(scenarios), scenarios, offsets)
+
+    # The next run records its own Phase 0 result before the loaded state is restored
+    fresh = [_scenario(0)]
+    phase0(fresh[0])
+    _, state = store.load(key)
+    MountStore.restore_scenario_state(fresh, state)
+    assert [r.warnings for r in fresh[0].validation_result] == [['phase0'], ['gap']]
+
+
+def test_key_follows_data_identity(store):
+    base = _key(store, [_scenario()])
+    assert base == _key(store, [_scenario(strategy_config={'period': 20})])
+    assert base != _key(store, [_scenario(end_date=START)])
+    assert base != _key(store, [_scenario(
+        execution_config={'tick_processing_budget_ms': 2.0})])
+    assert base != _key(store, [_scenario(stress_test_config={'stale_data': {'enabled': True}})])
+
+
+def test_incomplete_mount_not_persisted(store):
+    scenarios = [_scenario(0), _scenario(1)]
+    key = _key(store, scenarios)
+    assert store.save(key, _mount(scenarios[:1]), scenarios) is None
+    assert store.load(key) is None
+
+
+def test_eviction_keeps_max_entries(tmp_path, monkeypatch):
+    monkeypatch.setattr(AppConfigManager, 'get_mount_cache_max_entries', lambda self: 2)
+    store = MountStore(get_global_logger(), AppConfigManager(), cache_dir=tmp_path)
+    for index in range(3):
+        scenarios = [_scenario(index)]
+        store.save(_key(store, scenarios), _mount(scenarios), scenarios)
+    assert len([d for d in tmp_path.iterdir() if d.is_dir()]) == 2
+
+
+def test_corrupt_entry_is_a_miss(store, tmp_path):
+    scenarios = [_scenario()]
+    key = _key(store, scenarios)
+    store.save(key, _mount(scenarios), scenarios)
+    (tmp_path / key / MountStore.MOUNT_FILE).write_bytes(b'not a pickle')
+    assert store.load(key) is None
+    assert not (tmp_path / key).exists()
@@ -109,3 +109,20 @@ def test_identity_guard_rejects_mismatched_scenarios():
 
     with pytest.raises(MountIdentityMismatchError):
         orch.execute(mount, [foreign])
+
+
+def test_prepare_mount_reuses_phase0_and_requirements():
+    """Handing Phase 0 + requirements to prepare_mount() runs no validator a second time (#420)."""
+    orch_plain, plain_set = _build()
+    orch_plain.prepare_mount()
+
+    orch_reuse, reuse_set = _build()
+    prepared = orch_reuse.prepare_scenarios()
+    requirements = orch_reuse._requirements_collector.collect_and_validate(
+        reuse_set.get_valid_scenarios())
+    orch_reuse.prepare_mount(prepared=prepared, requirements_map=requirements)
+
+    def recorded(scenario_set):
+        return [len(s.validation_result) for s in scenario_set.get_all_scenarios()]
+
+    assert recorded(reuse_set) == recorded(plain_set)
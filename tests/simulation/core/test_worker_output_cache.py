@@ -0,0 +1,165 @@
+"""
+Worker output cache tests — per-bar BAR_CLOSE worker outputs replayed across runs.
+
+Verifies the cache in isolation (tmp cache dir, synthetic ticks — no market data needed):
+- the series key follows the data identity, the worker key the worker config (params,
+  compute basis, gated outputs) — only BAR_CLOSE indicator workers are cacheable
+- save → load round-trips a series; an unchanged series is not rewritten; a corrupt entry
+  is a miss; LRU eviction honors max_entries
+- a second run on the same bar series replays every compute (compute() never called) with
+  identical results, counted as cache hits in the worker's profiling stats (last-compute tick
+  kept, worker READY)
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from python.framework.bars.bar_rendering_controller import BarRenderingController
+from python.framework.decision_logic.abstract_decision_logic import AbstractDecisionLogic
+from python.framework.logging.bootstrap_logger import get_global_logger
+from python.framework.types.market_types.market_data_types import TickData
+from python.framework.types.mount_package_types import DataIdentityKey
+from python.framework.types.worker_types import WorkerOutputSeries, WorkerRequirement, WorkerResult, WorkerState
+from python.framework.workers.core.bollinger_worker import BollingerWorker
+from python.framework.workers.worker_orchestrator import WorkerOrchestrator
+from python.framework.persistence.worker_output_cache import WorkerOutputCache
+
+START = datetime(2026, 1, 15, 10, 0, tzinfo=timezone.utc)
+_BAR_CLOSE = {'periods': {'M5': 5}, 'deviation': 2.0, 'compute_basis': 'bar_close'}
+
+
+def _identity(**overrides) -> DataIdentityKey:
+    fields = dict(data_broker_type='kraken_spot', symbol='BTCUSD', start=START,
+                  end_date=START + timedelta(hours=2), max_ticks=None,
+                  warmup_bars=(('M5', 5),), tick_processing_budget_ms=0.0)
+    fields.update(overrides)
+    return DataIdentityKey(**fields)
+
+
+def _bollinger(params=None) -> BollingerWorker:
+    return BollingerWorker(name='bb', parameters=params or _BAR_CLOSE, logger=MagicMock())
+
+
+def _ticks(count: int = 40):
+    """One-minute ticks from a 10:00 boundary (M5 closes every 5 ticks)."""
+    return [TickData(timestamp=START + timedelta(minutes=i), symbol='BTCUSD',
+                     bid=100.0 + (i % 7) * 0.5, ask=100.1 + (i % 7) * 0.5, volume=0.1)
+            for i in range(count)]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return WorkerOutputCache(get_global_logger(), tmp_path)
+
+
+class _StubLogic(AbstractDecisionLogic):
+    """Reads every Bollinger output — no trading."""
+
+    def __init__(self):
+        super().__init__(name='stub', logger=MagicMock(), config={})
+
+    @classmethod
+    def get_required_order_types(cls, decision_logic_config):
+        return []
+
+    def get_required_workers(self):
+        return {'bb': WorkerRequirement.all('CORE/bollinger')}
+
+    def compute_tick(self, tick, worker_results):
+        return None
+
+    def _execute_decision_impl(self, decision, tick):
+        return None
+
+    def on_market_data_stale(self, status):
+        pass
+
+
+def _run(cache, worker):
+    """Drive the ticks through a real orchestrator with the cache attached; results per tick."""
+    orchestrator = WorkerOrchestrator(
+        workers=[worker], decision_logic=_StubLogic(),
+        strategy_config={'worker_instances': {'bb': 'CORE/bollinger'}},
+        parallel_workers=False,
+    )
+    orchestrator.initialize()
+    assert orchestrator.attach_output_cache(cache, 'series') == 1
+    controller = BarRenderingController(logger=MagicMock())
+    controller.register_workers([worker])
+    results = []
+    for tick in _ticks():
+        current_bars = controller.process_tick(tick)
+        orchestrator.process_workers(
+            tick, current_bars, controller.get_all_bar_history('BTCUSD'),
+            controller.consume_bar_render_state())
+        results.append(orchestrator.get_worker_result('bb').outputs)
+    orchestrator.flush_output_cache()
+    return results, orchestrator.get_worker_statistics()[0]
+
+
+def test_series_key_follows_data_identity():
+    base = WorkerOutputCache.series_key(_identity(), [('a.parquet', 1, 1)], 1000)
+    assert base == WorkerOutputCache.series_key(_identity(), [('a.parquet', 1, 1)], 1000)
+    assert base != WorkerOutputCache.series_key(_identity(symbol='ETHUSD'), [('a.parquet', 1, 1)], 1000)
+    assert base != WorkerOutputCache.series_key(_identity(), [('a.parquet', 1, 2)], 1000)
+    assert base != WorkerOutputCache.series_key(_identity(), [('a.parquet', 1, 1)], 500)
+
+
+def test_worker_key_follows_worker_config():
+    key = WorkerOutputCache.worker_key('series', _bollinger())
+    assert key == WorkerOutputCache.worker_key('series', _bollinger())
+    assert key != WorkerOutputCache.worker_key('other', _bollinger())
+    assert key != WorkerOutputCache.worker_key('series', _bollinger({**_BAR_CLOSE, 'deviation': 2.5}))
+    gated = _bollinger()
+    gated.set_requested_outputs({'position'})
+    assert key != WorkerOutputCache.worker_key('series', gated)
+
+
+def test_only_bar_close_indicator_workers_are_cacheable():
+    assert WorkerOutputCache.is_cacheable(_bollinger())
+    assert not WorkerOutputCache.is_cacheable(_bollinger({'periods': {'M5': 5}, 'deviation': 2.0}))
+
+
+def test_save_load_round_trip(cache, tmp_path):
+    series = WorkerOutputSeries(key='k1', entries={('2026-01-15T10:00:00',): WorkerResult({'upper': 1.0})})
+    assert cache.save(series, _bollinger()) is None                 # not dirty → not written
+    series.dirty = True
+    assert cache.save(series, _bollinger()) == tmp_path / 'k1'
+    assert cache.load('k1').entries == series.entries
+    assert cache.load('missing').entries == {}
+    assert cache.list_entries()[0]['entries'] == 1
+
+    (tmp_path / 'k1' / WorkerOutputCache.SERIES_FILE).write_bytes(b'not a pickle')
+    assert cache.load('k1').entries == {}                           # corrupt → miss, discarded
+    assert not (tmp_path / 'k1').exists()
+
+
+def test_eviction_keeps_max_entries(tmp_path):
+    cache = WorkerOutputCache(get_global_logger(), tmp_path, max_entries=2)
+    for key in ('a', 'b', 'c'):
+        cache.save(WorkerOutputSeries(key=key, entries={('t',): WorkerResult({})}, dirty=True),
+                   _bollinger())
+    assert len(cache.list_entries()) == 2
+    assert cache.clear() == 2
+
+
+def test_second_run_replays_every_compute(cache, monkeypatch):
+    cold, cold_stats = _run(cache, _bollinger())
+    assert cold_stats.worker_cache_hits == 0
+    assert cold_stats.worker_cache_misses == cold_stats.worker_call_count > 1
+
+    def _no_compute(self, *args, **kwargs):
+        raise AssertionError('a cached bar must not be recomputed')
+
+    monkeypatch.setattr(BollingerWorker, 'compute', _no_compute)
+    warm_worker = _bollinger()
+    warm, warm_stats = _run(cache, warm_worker)
+
+    assert repr(warm) == repr(cold)      # repr: the cold-start outputs are NaN
+    assert warm_stats.worker_call_count == 0
+    assert warm_stats.worker_cache_hits == cold_stats.worker_cache_misses
+    # A replay stands in for the compute: same last-compute tick, worker READY
+    assert warm_stats.worker_last_compute_tick == cold_stats.worker_last_compute_tick >= 0
+    assert warm_worker.state == WorkerState.READY
@@ -43,7 +43,7 @@ def make_provenance():
     def _make(param_hash='hash', run_id='20260101_000000',
               scenario_set_name='set', sweep_id=None, sweep_params=None,
               status='ok', error=None, sweep_objective=None, sweep_maximize=None,
-              run_timestamp=None):
+              run_timestamp=None, sweep_rung=None):
         return RunProvenance(
             param_hash=param_hash, status=status, error=error, run_id=run_id,
             run_timestamp=run_timestamp or datetime(2026, 1, 1, tzinfo=timezone.utc),
@@ -53,5 +53,6 @@ def make_provenance():
             worker_versions={'rsi_fast': '1.0.0'}, config_snapshot='{}',
             symbols=['BTCUSD'], data_broker_type='kraken_spot',
             sweep_id=sweep_id, sweep_params=sweep_params,
-            sweep_objective=sweep_objective, sweep_maximize=sweep_maximize)
+            sweep_objective=sweep_objective, sweep_maximize=sweep_maximize,
+            sweep_rung=sweep_rung)
     return _make
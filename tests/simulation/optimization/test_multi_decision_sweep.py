@@ -0,0 +1,82 @@
+"""Multi-decision sweep tests — eligibility, grouping, and multi_decision == per_combination results."""
+
+import json
+
+from python.configuration.app_config_manager import AppConfigManager
+from python.framework.batch.batch_orchestrator import BatchOrchestrator
+from python.framework.optimization.optimization_runner import OptimizationRunner
+from python.framework.reporting.store.run_results_ledger import RunResultsLedger
+from python.framework.types.config_types.optimization_config_types import SweepSpec
+from python.scenario.scenario_config_loader import ScenarioConfigLoader
+
+MINI_SET = 'tests/fixtures/optimization/btcusd_mini_set.json'
+MINI_GRID = 'tests/fixtures/optimization/btcusd_mini_grid.json'
+
+
+def _spec(**overrides):
+    fields = {'base_scenario_set': MINI_SET, 'execution': 'multi_decision',
+              'grid': {'decision_logic_config.min_confidence': [0.3, 0.5]}}
+    fields.update(overrides)
+    return SweepSpec(**fields)
+
+
+def _kpis_by_hash(rows):
+    """Map each ledger row to a deterministic KPI signature, keyed by param_hash."""
+    return {
+        row.param_hash: (row.status, round(row.net_pnl, 6), row.total_trades,
+                         round(row.win_rate, 6), round(row.max_drawdown, 6))
+        for row in rows
+    }
+
+
+def test_execution_shorthand_and_default():
+    assert SweepSpec(base_scenario_set=MINI_SET, grid={'a.b': [1]}).execution.mode == 'per_combination'
+    spec = _spec(execution={'mode': 'multi_decision', 'max_stacks': 3})
+    assert (spec.execution.mode, spec.execution.max_stacks) == ('multi_decision', 3)
+    assert _spec().execution.mode == 'multi_decision'
+
+
+def test_only_decision_only_grids_fan_out():
+    runner = OptimizationRunner()
+    assert runner._fans_out(_spec())
+    assert not runner._fans_out(_spec(grid={'workers.rsi_fast.periods.M5': [10, 14]}))
+    assert not runner._fans_out(_spec(execution='per_combination'))
+    assert not runner._fans_out(_spec(execution={'mode': 'multi_decision', 'max_stacks': 1}))
+
+
+def test_grouping_chunks_and_isolates_invalid_combos():
+    runner = OptimizationRunner()
+    base = ScenarioConfigLoader().load_config(MINI_SET)
+    combos = [{'decision_logic_config.min_confidence': v} for v in (0.1, 0.2, 7.0, 0.3, 0.4)]
+    spec = _spec(execution={'mode': 'multi_decision', 'max_stacks': 2})
+
+    # 7.0 is out of min_confidence's range → runs alone, recorded as its own error row
+    assert runner._group_combos(spec, base, combos, fan_out=True) == [[0, 1], [2], [3, 4]]
+    assert runner._group_combos(spec, base, combos, fan_out=False) == [[i] for i in range(5)]
+
+
+def test_multi_decision_equals_per_combination(tmp_path, monkeypatch):
+    """A decision-only grid run as one shared batch records the same KPIs as separate runs."""
+    ledger = RunResultsLedger(AppConfigManager().get_run_results_path())
+    sweep_single = OptimizationRunner().run(MINI_GRID)
+
+    grid = json.loads(open(MINI_GRID).read())
+    grid['execution'] = 'multi_decision'
+    spec = tmp_path / 'multi_grid.json'
+    spec.write_text(json.dumps(grid))
+
+    batches = []
+    original_run = BatchOrchestrator.run
+
+    def _counting_run(self, *args, **kwargs):
+        batches.append(self)
+        return original_run(self, *args, **kwargs)
+
+    monkeypatch.setattr(BatchOrchestrator, 'run', _counting_run)
+    sweep_multi = OptimizationRunner().run(str(spec))
+
+    single = _kpis_by_hash(ledger.read_rows(sweep_id=sweep_single))
+    multi = _kpis_by_hash(ledger.read_rows(sweep_id=sweep_multi))
+    assert len(single) == 4 and all(kpis[0] == 'ok' for kpis in single.values())
+    assert multi == single
+    assert len(batches) == 1, 'all four combinations should share one batch'
@@ -1,10 +1,12 @@
-"""Optimization analysis tests (#390) — ranking + one-factor sensitivity (typed rows)."""
+"""Optimization analysis tests (#390) — ranking + one-factor sensitivity (typed rows + frame path)."""
 
 from datetime import datetime, timezone
 
 import pytest
 
-from python.framework.optimization.optimization_analysis import rank, sensitivity, summarize_sweeps
+from python.framework.optimization.optimization_analysis import (
+    evaluations_to_near_best, evaluations_to_near_best_frame, rank, rank_frame, sensitivity,
+    sensitivity_frame, summarize_sweeps, summarize_sweeps_frame)
 
 
 @pytest.fixture
@@ -143,3 +145,74 @@ def test_summarize_sweeps_ignores_non_sweep_runs(tmp_ledger, make_run_summary, m
     """A plain (non-sweep) run is not a sweep → never appears in the sweep list."""
     tmp_ledger.append(make_run_summary(), make_provenance(run_id='plain'))  # no sweep_id
     assert summarize_sweeps(tmp_ledger.read_rows()) == []
+
+
+def test_evaluations_to_near_best(tmp_ledger, make_run_summary, make_provenance):
+    """Counted in run order, errored runs included; near = within 5% of the spread from the best."""
+    results = [('r0', -10.0, 'ok'), ('r1', 0.0, 'error'), ('r2', 9.7, 'ok'),
+               ('r3', 2.0, 'ok'), ('r4', 10.0, 'ok')]
+    for i, (run_id, pnl, status) in enumerate(results):
+        tmp_ledger.append(
+            make_run_summary(net_pnl=pnl),
+            make_provenance(param_hash=f'h{i}', run_id=run_id, scenario_set_name=f's__c{i:03d}',
+                            sweep_id='sweep_X', status=status, error='x' if status == 'error' else None,
+                            run_timestamp=datetime(2026, 1, 1, 0, i, tzinfo=timezone.utc)))
+    rows = tmp_ledger.read_rows(sweep_id='sweep_X')
+    assert evaluations_to_near_best(rows, 'net_pnl') == (3, 5)     # 9.7 is within 1.0 of 10.0
+    assert evaluations_to_near_best(rows, 'net_pnl', maximize=False) == (1, 5)
+    assert evaluations_to_near_best([], 'net_pnl') is None
+
+
+@pytest.fixture
+def mixed_ledger(tmp_ledger, make_run_summary, make_provenance):
+    """A 3x3 sweep with tied objectives, an error + a pruned row, a 2nd currency and a plain run."""
+    i = 0
+    for sl in (100, 150, 200):
+        for tp in (200, 300, 400):
+            status = 'error' if (sl, tp) == (150, 300) else 'pruned' if (sl, tp) == (200, 200) else 'ok'
+            tmp_ledger.append(
+                make_run_summary(net_pnl=float((sl // 50) * (tp // 100) % 5),
+                                 currency='EUR' if tp == 400 else 'USD'),
+                make_provenance(param_hash=f'h{i}', run_id=f'r{8 - i}',  # run order ≠ run_id order
+                                scenario_set_name=f's__c{i:03d}', sweep_id='sweep_M',
+                                sweep_params={'decision_logic_config.sl_pips': sl,
+                                              'decision_logic_config.tp_pips': tp},
+                                status=status, error='boom' if status == 'error' else None,
+                                sweep_objective='net_pnl', sweep_maximize=True,
+                                run_timestamp=datetime(2026, 1, 1, 0, i, tzinfo=timezone.utc)))
+            i += 1
+    tmp_ledger.append(make_run_summary(net_pnl=7.0), make_provenance(run_id='plain'))
+    return tmp_ledger
+
+
+@pytest.mark.parametrize('maximize', [True, False])
+def test_frame_path_equals_row_path(mixed_ledger, maximize):
+    """rank / sensitivity / near-best / sweep list give the same result on the analysis frame."""
+    rows = mixed_ledger.read_rows(sweep_id='sweep_M')
+    frame = mixed_ledger.read_frame(sweep_id='sweep_M')
+
+    for currency in (None, 'USD'):
+        ranked = [r.run_id for r in rank(rows, 'net_pnl', maximize, currency)]
+        assert list(rank_frame(frame, 'net_pnl', maximize, currency)['run_id']) == ranked
+        # argpartition top-n (ties across the cut included) == head of the full ranking
+        for top_n in range(0, len(ranked) + 2):
+            assert list(rank_frame(frame, 'net_pnl', maximize, currency, top_n)['run_id']) \
+                == ranked[:top_n]
+        assert evaluations_to_near_best_frame(frame, 'net_pnl', maximize, currency) \
+            == evaluations_to_near_best(rows, 'net_pnl', maximize, currency)
+
+        expected = sensitivity(rows, 'net_pnl', currency)
+        actual = sensitivity_frame(frame, 'net_pnl', currency)
+        assert [s.param for s in actual] == [s.param for s in expected]
+        for a, e in zip(actual, expected):
+            assert a.influence == pytest.approx(e.influence)
+            assert a.level_means == pytest.approx(e.level_means)
+
+    assert summarize_sweeps_frame(mixed_ledger.read_frame()) \
+        == summarize_sweeps(mixed_ledger.read_rows())
+
+
+def test_frame_path_unknown_objective_raises(mixed_ledger):
+    """Same hard error as the row path."""
+    with pytest.raises(ValueError):
+        rank_frame(mixed_ledger.read_frame(), 'nonexistent_kpi')
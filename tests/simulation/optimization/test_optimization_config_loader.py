@@ -6,6 +6,7 @@ import pytest
 from pydantic import ValidationError
 
 from python.configuration.optimization_config_loader import OptimizationConfigLoader
+from python.framework.types.config_types.optimization_config_types import ParamRange
 
 _GRID_SPEC = 'tests/fixtures/optimization/btcusd_mini_grid.json'
 
@@ -40,3 +41,23 @@ def test_unknown_key_rejected(tmp_path):
     }))
     with pytest.raises(ValidationError):
         OptimizationConfigLoader().load_spec(str(bad))
+
+
+def test_search_block_and_ranges(tmp_path):
+    """`search` parses as a block or as the bare-method shorthand; a grid entry may be a range."""
+    spec_path = tmp_path / 'bayes.json'
+    spec_path.write_text(json.dumps({
+        'base_scenario_set': 'x.json',
+        'search': {'method': 'bayes', 'budget': 20, 'seed': 7},
+        'grid': {'decision_logic_config.min_confidence': {'low': 0.2, 'high': 0.8},
+                 'decision_logic_config.lot_size': [0.01, 0.02]},
+    }))
+    spec = OptimizationConfigLoader().load_spec(str(spec_path))
+    assert (spec.search.method, spec.search.budget, spec.search.seed) == ('bayes', 20, 7)
+    assert isinstance(spec.grid['decision_logic_config.min_confidence'], ParamRange)
+    assert spec.grid['decision_logic_config.lot_size'] == [0.01, 0.02]
+
+    spec_path.write_text(json.dumps({
+        'base_scenario_set': 'x.json', 'search': 'successive_halving',
+        'grid': {'decision_logic_config.sl_pips': [100]}}))
+    assert OptimizationConfigLoader().load_spec(str(spec_path)).search.method == 'successive_halving'
@@ -119,6 +119,19 @@ def test_explicit_error_writes_error_row(tmp_ledger, make_run_summary, make_prov
     assert row.sweep_params == {'decision_logic_config.touch_zone': 0.6}   # which combo failed
 
 
+def test_pruned_run_keeps_partial_kpis(tmp_ledger, make_run_summary, make_provenance):
+    """A provenance status='pruned' → the normal KPI rows (partial), tagged pruned + the reason."""
+    tmp_ledger.append(
+        make_run_summary(net_pnl=-420.0, max_drawdown=600.0),
+        make_provenance(run_id='r1', sweep_id='s', status='pruned',
+                        error='BTCUSD_mini_01: max drawdown 600.00 exceeds the limit 500.00'))
+    row = tmp_ledger.read_rows()[0]
+    assert row.status == 'pruned'
+    assert 'exceeds the limit' in row.error
+    assert row.net_pnl == -420.0 and row.max_drawdown == 600.0
+    assert row.currency == 'USD'
+
+
 def test_no_currencies_writes_error_row(tmp_ledger, make_provenance):
     """A run with no usable data (no currencies) is recorded as an error row, never absent."""
     from python.framework.types.api.report_types import RunSummary
@@ -151,3 +164,166 @@ def test_read_handles_schema_evolution(tmp_path, tmp_ledger, make_run_summary, m
     assert rows['old'].net_pnl == 2.0
     assert rows['new'].status == 'error'     # the current fragment's status survives the union
     assert rows['new'].error == 'boom'
+
+
+def _append_sweep_and_plain(ledger, make_run_summary, make_provenance):
+    """Two sweep runs + one plain run."""
+    ledger.append(make_run_summary(net_pnl=1.0),
+                  make_provenance(run_id='r1', scenario_set_name='s__sw_c000', sweep_id='sw'))
+    ledger.append(make_run_summary(net_pnl=2.0),
+                  make_provenance(run_id='r2', scenario_set_name='s__sw_c001', sweep_id='sw'))
+    ledger.append(make_run_summary(net_pnl=3.0),
+                  make_provenance(run_id='r3', scenario_set_name='plain'))
+
+
+def test_compact_partitions_and_preserves_rows(
+        tmp_path, tmp_ledger, make_run_summary, make_provenance):
+    """Compaction moves the fragments into sweep / scenario-set partitions; reads are unchanged."""
+    _append_sweep_and_plain(tmp_ledger, make_run_summary, make_provenance)
+    before = tmp_ledger.read().sort_values('run_id').reset_index(drop=True)
+
+    assert tmp_ledger.compact() == {'sweep_id=sw': 2, 'scenario_set=plain': 1}
+    root = tmp_path / 'run_results'
+    assert list(root.glob('*.parquet')) == []
+    assert (root / 'sweep_id=sw' / 'part.parquet').exists()
+    assert (root / 'scenario_set=plain' / 'part.parquet').exists()
+
+    after = tmp_ledger.read().sort_values('run_id').reset_index(drop=True)
+    assert list(after['run_id']) == list(before['run_id'])
+    assert list(after['net_pnl']) == list(before['net_pnl'])
+    assert list(after.columns) == LEDGER_COLUMNS
+
+    # A later fragment of the same sweep merges into the existing partition
+    tmp_ledger.append(make_run_summary(net_pnl=4.0),
+                      make_provenance(run_id='r4', scenario_set_name='s__sw_c002', sweep_id='sw'))
+    assert tmp_ledger.compact() == {'sweep_id=sw': 3}
+    assert set(tmp_ledger.read(sweep_id='sw')['run_id']) == {'r1', 'r2', 'r4'}
+    assert tmp_ledger.compact() == {}
+
+
+def test_read_during_interrupted_compaction_sees_each_run_once(
+        tmp_path, tmp_ledger, make_run_summary, make_provenance):
+    """Partition file written, fragments not yet deleted: reads still return every run once."""
+    _append_sweep_and_plain(tmp_ledger, make_run_summary, make_provenance)
+    root = tmp_path / 'run_results'
+    fragments = {path: path.read_bytes() for path in root.glob('*.parquet')}
+    tmp_ledger.compact()
+    for path, content in fragments.items():
+        path.write_bytes(content)
+
+    assert sorted(tmp_ledger.read()['run_id']) == ['r1', 'r2', 'r3']
+    assert sorted(tmp_ledger.read(sweep_id='sw')['run_id']) == ['r1', 'r2']
+    assert len(tmp_ledger.read_rows()) == 3
+
+
+def test_compact_path_unsafe_scenario_set_name(
+        tmp_path, tmp_ledger, make_run_summary, make_provenance):
+    """A '/' in the free-text set name never nests a directory; the rows stay readable."""
+    tmp_ledger.append(make_run_summary(net_pnl=5.0),
+                      make_provenance(run_id='r1', scenario_set_name='team/eurusd set'))
+    tmp_ledger.append(make_run_summary(net_pnl=6.0),
+                      make_provenance(run_id='r2', scenario_set_name='team'))
+
+    root = tmp_path / 'run_results'
+    assert [p.parent for p in root.rglob('*.parquet')] == [root, root]
+    written = tmp_ledger.compact()
+    unsafe = next(name for name in written if name != 'scenario_set=team')
+    assert unsafe.startswith('scenario_set=team_eurusd_set~')
+    assert sorted(p.parent.name for p in root.rglob('part.parquet')) == sorted(written)
+
+    assert set(tmp_ledger.read()['run_id']) == {'r1', 'r2'}
+    assert list(tmp_ledger.read(scenario_set_name='team/eurusd set')['net_pnl']) == [5.0]
+    assert list(tmp_ledger.read(scenario_set_name='team')['net_pnl']) == [6.0]
+
+
+def test_filtered_read_prunes_partitions(
+        tmp_path, tmp_ledger, make_run_summary, make_provenance, monkeypatch):
+    """A sweep read opens only that sweep's partition (+ loose fragments)."""
+    import pandas as pd
+    from python.framework.reporting.store.run_results_ledger import RunResultsLedger
+    from python.framework.reporting.store.run_results_view import RunResultsView
+    _append_sweep_and_plain(tmp_ledger, make_run_summary, make_provenance)
+    tmp_ledger.compact()
+
+    opened = []
+    read_parquet = pd.read_parquet
+    monkeypatch.setattr(pd, 'read_parquet',
+                        lambda path, **kw: opened.append(path.parent.name) or read_parquet(path, **kw))
+    cold = RunResultsLedger(tmp_path / 'run_results', view=RunResultsView())
+
+    assert len(cold.read(sweep_id='sw')) == 2
+    assert opened == ['sweep_id=sw']
+    assert list(cold.read(scenario_set_name='plain')['net_pnl']) == [3.0]
+    assert 'scenario_set=plain' in opened
+
+
+def test_cached_view_reads_only_new_fragments(
+        tmp_path, make_run_summary, make_provenance, monkeypatch):
+    """Repeated reads reuse the cached view; only fragments added since are opened."""
+    import pandas as pd
+    from python.framework.reporting.store.run_results_ledger import RunResultsLedger
+    from python.framework.reporting.store.run_results_view import RunResultsView
+    ledger = RunResultsLedger(tmp_path / 'run_results', view=RunResultsView())
+    _append_sweep_and_plain(ledger, make_run_summary, make_provenance)
+
+    opened = []
+    read_parquet = pd.read_parquet
+    monkeypatch.setattr(pd, 'read_parquet',
+                        lambda path, **kw: opened.append(path.name) or read_parquet(path, **kw))
+    assert len(ledger.read()) == 3
+    assert len(opened) == 3
+    assert len(ledger.read()) == 3
+    assert len(opened) == 3                             # unchanged ledger → nothing opened
+
+    ledger.append(make_run_summary(net_pnl=4.0), make_provenance(run_id='r4'))
+    assert len(ledger.read()) == 4
+    assert opened[3:] == ['set_r4.parquet']
+
+    ledger.compact()                                    # fragments vanish → partitions rebuilt
+    assert set(ledger.read()['run_id']) == {'r1', 'r2', 'r3', 'r4'}
+
+
+def test_read_frame_parses_params_and_caches(
+        tmp_path, make_run_summary, make_provenance, monkeypatch):
+    """read_frame: typed defaults, one column per swept parameter, one build per ledger snapshot."""
+    import json
+    import pandas as pd
+    from python.framework.reporting.store.run_results_ledger import (
+        SWEEP_PARAM_COLUMN_PREFIX, RunResultsLedger, _analysis_frame)
+    from python.framework.reporting.store.run_results_view import RunResultsView
+    import python.framework.reporting.store.run_results_ledger as ledger_module
+    ledger = RunResultsLedger(tmp_path / 'run_results', view=RunResultsView())
+    ledger.append(make_run_summary(net_pnl=1.0), make_provenance(
+        run_id='r1', scenario_set_name='s__c000', sweep_id='sw', sweep_rung=1,
+        sweep_params={'decision_logic_config.x': 1, 'workers.rsi.periods.M5': 14}))
+    # An old fragment without status / KPI columns (schema evolution) → RunResultRow defaults
+    pd.DataFrame([{
+        'param_hash': 'old', 'run_id': 'old', 'run_timestamp': '2026-01-01T00:00:00+00:00',
+        'sweep_id': 'sw', 'scenario_set_name': 's__c001', 'currency': 'USD',
+        'sweep_params': json.dumps({'decision_logic_config.x': 2.5})}],
+    ).to_parquet(tmp_path / 'run_results' / 's__c001_old.parquet', index=False)
+
+    builds = []
+    monkeypatch.setattr(ledger_module, '_analysis_frame',
+                        lambda df: builds.append(1) or _analysis_frame(df))
+    frame = ledger.read_frame(sweep_id='sw').set_index('run_id')
+    assert frame.loc['old', 'status'] == 'ok' and frame.loc['old', 'total_trades'] == 0
+    assert frame['total_trades'].dtype == 'int64'
+    assert frame.loc['r1', 'sweep_rung'] == 1 and pd.isna(frame.loc['old', 'sweep_rung'])
+    assert frame[f'{SWEEP_PARAM_COLUMN_PREFIX}decision_logic_config.x'].to_dict() \
+        == {'r1': '1', 'old': '2.5'}
+    assert frame.loc['r1', f'{SWEEP_PARAM_COLUMN_PREFIX}workers.rsi.periods.M5'] == '14'
+    assert pd.isna(frame.loc['old', f'{SWEEP_PARAM_COLUMN_PREFIX}workers.rsi.periods.M5'])
+
+    # Typed rows from the frame == read_rows
+    frame = ledger.read_frame(sweep_id='sw')
+    assert ledger.to_rows(frame) == ledger.read_rows(sweep_id='sw')
+
+    # Unchanged ledger → the cached frame; a new fragment → rebuilt
+    assert ledger.read_frame(sweep_id='sw') is frame
+    assert len(builds) == 1
+    ledger.append(make_run_summary(), make_provenance(
+        run_id='r2', scenario_set_name='s__c002', sweep_id='sw',
+        sweep_params={'decision_logic_config.x': 3}))
+    assert len(ledger.read_frame(sweep_id='sw')) == 3
+    assert len(builds) == 2
@@ -0,0 +1,316 @@
+"""Vectorized screening tests — bar fills, decision hooks, the engine over synthetic bars, the runner."""
+
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from python.configuration.app_config_manager import AppConfigManager
+from python.framework.factory.decision_logic_factory import DecisionLogicFactory
+from python.framework.optimization.optimization_runner import OptimizationRunner
+from python.framework.optimization.screening_engine import (
+    ScreeningEngine, rank_screening, resolve_screening_objective, simulate_bar_fills)
+from python.framework.reporting.store.run_results_ledger import RunResultsLedger
+from python.framework.types.config_types.market_config_types import MarketType, TradingModel
+from python.framework.types.config_types.optimization_config_types import SweepSpec
+from python.framework.types.decision_logic_types import DecisionLogicAction
+from python.framework.types.market_types.market_data_types import TickData
+from python.framework.types.market_types.market_types import TradingContext
+from python.framework.types.screening_types import (
+    BarSeries, ScreeningCostModel, ScreeningKpis, ScreeningMarket, ScreeningResult,
+    ScreeningSignals)
+from python.framework.types.trading_env_types.broker_types import BrokerType, FeeType
+from python.framework.types.worker_types import WorkerResult
+from python.scenario.scenario_config_loader import ScenarioConfigLoader
+
+MINI_SET = 'tests/fixtures/optimization/btcusd_mini_set.json'
+
+# BTCUSD-like: 2 digits, tick 0.01 x contract 1 → tick_value 0.01
+_SPREAD_COSTS = ScreeningCostModel(
+    fee_model=FeeType.SPREAD, spread=0.2, digits=2, tick_value=0.01, contract_size=1)
+
+
+def _bars(opens, timeframe='M5', start=None, tick_count=10) -> BarSeries:
+    opens = np.asarray(opens, dtype=np.float64)
+    minutes = {'M5': 5, 'M30': 30}[timeframe]
+    start_msc = int((start or datetime(2026, 1, 1, tzinfo=timezone.utc)).timestamp() * 1000)
+    return BarSeries(
+        timeframe=timeframe,
+        times_msc=start_msc + np.arange(len(opens), dtype=np.int64) * minutes * 60_000,
+        open=opens, high=opens + 1.0, low=opens - 1.0, close=opens + 0.5,
+        volume=np.full(len(opens), 100.0), tick_count=np.full(len(opens), tick_count))
+
+
+def _flags(n, *indices):
+    flags = np.zeros(n, dtype=bool)
+    flags[list(indices)] = True
+    return flags
+
+
+# ============================================
+# Bar fills
+# ============================================
+
+def test_from_actions_maps_a_reversal_logic():
+    buy, sell = _flags(3, 0), _flags(3, 2)
+    signals = ScreeningSignals.from_actions(buy, sell, 0.5)
+    assert signals.long_entries is buy and signals.short_exits is buy
+    assert signals.short_entries is sell and signals.long_exits is sell
+    assert signals.lots == 0.5
+
+
+def test_bar_fills_next_open_spread_and_spread_fee():
+    """
+    Long on bar 0 → 101 + 0.1, exit on bar 2 → 103 - 0.1: gross 1.8, fee 0.2 → +1.6.
+    Short on bar 3 → 104 - 0.1, open at the end → close 105.5 + 0.1: gross -1.7 → -1.9.
+    """
+    bars = _bars([100, 101, 102, 103, 104, 105])
+    signals = ScreeningSignals.from_actions(_flags(6, 0), _flags(6, 2, 3), 1.0)
+
+    kpis = simulate_bar_fills(signals, bars, _SPREAD_COSTS)
+
+    assert kpis.total_trades == 2
+    assert (kpis.winning_trades, kpis.losing_trades) == (1, 1)
+    assert kpis.total_profit == pytest.approx(1.6)
+    assert kpis.total_loss == pytest.approx(1.9)
+    assert kpis.net_pnl == pytest.approx(-0.3)
+    assert kpis.total_fees == pytest.approx(0.4)
+    assert kpis.max_drawdown == pytest.approx(1.9)
+    assert kpis.win_rate == 0.5
+    assert kpis.profit_factor == pytest.approx(1.6 / 1.9)
+
+
+def test_bar_fills_one_action_per_bar_and_spot_drops_shorts():
+    """The reversal bar only closes; a SPOT market never opens the short."""
+    bars = _bars([100, 101, 102, 103, 104, 105])
+    signals = ScreeningSignals.from_actions(_flags(6, 0), _flags(6, 2, 3), 1.0)
+
+    kpis = simulate_bar_fills(signals, bars, _SPREAD_COSTS, allow_short=False)
+
+    assert kpis.total_trades == 1
+    assert kpis.net_pnl == pytest.approx(1.6)
+
+
+def test_bar_fills_taker_fee_and_last_bar_signal_ignored():
+    bars = _bars([100, 101, 102, 103])
+    costs = ScreeningCostModel(
+        fee_model=FeeType.MAKER_TAKER, spread=0.0, digits=2, tick_value=0.01,
+        contract_size=1, taker_rate=0.26)
+    # Entry on bar 0 fills at 101; the exit signal on the last bar has no next open
+    signals = ScreeningSignals.from_actions(_flags(4, 0), _flags(4, 3), 1.0)
+
+    kpis = simulate_bar_fills(signals, bars, costs)
+
+    assert kpis.total_trades == 1
+    assert kpis.total_fees == pytest.approx(101 * 0.0026)
+    assert kpis.net_pnl == pytest.approx((103.5 - 101) - 101 * 0.0026)
+
+
+def test_kpis_merge_sums_and_keeps_worst_drawdown():
+    total = ScreeningKpis(net_pnl=1.0, total_trades=2, max_drawdown=3.0)
+    total.merge(ScreeningKpis(net_pnl=-2.0, total_trades=1, max_drawdown=1.0))
+    assert (total.net_pnl, total.total_trades, total.max_drawdown) == (-1.0, 3, 3.0)
+
+
+# ============================================
+# Decision hooks mirror compute_tick()
+# ============================================
+
+_WORKER_OUTPUTS = {
+    'rsi_fast': lambda rsi, pos, trend: {'rsi_value': rsi, 'avg_gain': 0.0,
+                                         'avg_loss': 0.0, 'bars_used': 15},
+    'bollinger_main': lambda rsi, pos, trend: {'position': pos},
+    'obv_volume': lambda rsi, pos, trend: {'trend': trend, 'has_volume': True},
+}
+
+
+def _decision_series(n=400, seed=7):
+    rng = np.random.default_rng(seed)
+    rsi = rng.uniform(0, 100, n)
+    position = rng.uniform(-0.1, 1.1, n).clip(0, 1)
+    trend = rng.choice(np.array(['bullish', 'bearish', 'neutral'], dtype=object), n)
+    return rsi, position, trend
+
+
+@pytest.mark.parametrize('logic_type, config', [
+    ('CORE/simple_consensus', {'rsi_oversold': 40, 'rsi_overbought': 60,
+                               'bollinger_lower_threshold': 0.3,
+                               'bollinger_upper_threshold': 0.7,
+                               'min_confidence': 0.6, 'obv_filter_enabled': True}),
+    ('CORE/aggressive_trend', {'rsi_buy_threshold': 35, 'rsi_sell_threshold': 65,
+                               'bollinger_extremes': 0.25, 'min_confidence': 0.5}),
+])
+def test_compute_signals_equals_compute_tick(logic_type, config):
+    logic = DecisionLogicFactory(MagicMock()).create_logic(
+        logic_type=logic_type, logger=MagicMock(), logic_config=config)
+    rsi, position, trend = _decision_series()
+    names = [n for n in _WORKER_OUTPUTS if n in logic.get_required_workers()]
+    series = {
+        'rsi_fast': {'rsi_value': rsi},
+        'bollinger_main': {'position': position},
+        'obv_volume': {'trend': trend},
+    }
+
+    signals = logic.compute_signals(series, _bars(np.full(len(rsi), 100.0)))
+
+    tick = TickData(timestamp=datetime(2026, 1, 1, tzinfo=timezone.utc),
+                    symbol='BTCUSD', bid=100.0, ask=100.0)
+    for i in range(len(rsi)):
+        results = {name: WorkerResult(outputs=_WORKER_OUTPUTS[name](rsi[i], position[i], trend[i]))
+                   for name in names}
+        action = logic.compute_tick(tick, results).action
+        assert signals.long_entries[i] == (action == DecisionLogicAction.BUY), i
+        assert signals.short_entries[i] == (action == DecisionLogicAction.SELL), i
+    assert signals.long_entries.any() and signals.short_entries.any()
+
+
+# ============================================
+# Engine over synthetic bars
+# ============================================
+
+def _engine_with_synthetic_bars(base) -> ScreeningEngine:
+    """An engine whose market context + bar files are injected (no broker / data files)."""
+    engine = ScreeningEngine(MagicMock())
+    start = datetime(2026, 1, 24, tzinfo=timezone.utc)
+    m5 = 100.0 + 10.0 * np.sin(np.arange(576) / 9.0)
+    engine._bars[('kraken_spot', 'BTCUSD', 'M5')] = _bars(m5, 'M5', start)
+    engine._bars[('kraken_spot', 'BTCUSD', 'M30')] = _bars(m5[::6], 'M30', start)
+    for scenario in base.scenarios:
+        engine._markets[scenario.scenario_index] = ScreeningMarket(
+            trading_context=TradingContext(
+                broker_type=BrokerType.KRAKEN_SPOT, market_type=MarketType.CRYPTO,
+                symbol='BTCUSD', volume_min=0.0001, trading_model=TradingModel.MARGIN),
+            costs=_SPREAD_COSTS, currency='USD', allow_short=True)
+    return engine
+
+
+def test_engine_scores_combinations_and_reuses_worker_series():
+    base = ScenarioConfigLoader().load_config(MINI_SET)
+    engine = _engine_with_synthetic_bars(base)
+    combos = [{'decision_logic_config.min_confidence': c} for c in (0.4, 0.5, 0.6)]
+
+    results = engine.screen(base.scenarios, combos)
+
+    assert [r.combo for r in results] == combos
+    assert all(r.error is None and set(r.kpis) == {'USD'} for r in results)
+    assert results[0].kpis['USD'].total_trades > 0
+    # Decision-only grid: rsi_fast + bollinger_main computed once for all combinations
+    assert len(engine._series) == 2
+    # The screen covers the scenario window only (8 h of M5 → 96 decision bars)
+    assert len(next(iter(engine._series.values()))['rsi_value']) == 96
+
+
+def test_engine_records_a_bad_value_per_combination():
+    base = ScenarioConfigLoader().load_config(MINI_SET)
+    engine = _engine_with_synthetic_bars(base)
+
+    results = engine.screen(base.scenarios, [
+        {'decision_logic_config.min_confidence': 0.4},
+        {'decision_logic_config.min_confidence': 'not-a-number'}])
+
+    assert results[0].error is None
+    assert results[1].error is not None and not results[1].kpis
+
+
+def test_engine_rejects_a_logic_without_the_hook():
+    base = ScenarioConfigLoader().load_config(MINI_SET)
+    engine = _engine_with_synthetic_bars(base)
+    for scenario in base.scenarios:
+        scenario.strategy_config['decision_logic_type'] = 'CORE/cautious_macd'
+        scenario.strategy_config['worker_instances'] = {
+            'macd_main': 'CORE/macd', 'rsi_filter': 'CORE/rsi'}
+        scenario.strategy_config['workers'] = {
+            'macd_main': {'periods': {'M5': 50}, 'fast_period': 12, 'slow_period': 26,
+                          'signal_period': 9},
+            'rsi_filter': {'periods': {'M5': 14}}}
+        scenario.strategy_config['decision_logic_config'] = {'pip_size': 0.01}
+
+    with pytest.raises(ValueError, match='not screenable'):
+        engine.screen(base.scenarios, [{}])
+
+
+# ============================================
+# Objective + ranking
+# ============================================
+
+def test_objective_resolution():
+    spec = SweepSpec(base_scenario_set='x', grid={'a': [1]}, objective='max_drawdown',
+                     maximize=False)
+    assert resolve_screening_objective(spec) == ('max_drawdown', False, False)
+    spec = SweepSpec(base_scenario_set='x', grid={'a': [1]})     # expectancy needs an SL
+    assert resolve_screening_objective(spec) == ('net_pnl', True, True)
+    spec = SweepSpec(base_scenario_set='x', grid={'a': [1]},
+                     screening={'objective': 'total_fees'})
+    assert resolve_screening_objective(spec) == ('total_fees', False, False)
+    with pytest.raises(ValueError):
+        resolve_screening_objective(SweepSpec(
+            base_scenario_set='x', grid={'a': [1]}, screening={'objective': 'expectancy'}))
+
+
+def test_rank_screening_skips_errors_and_needs_one_currency():
+    results = [
+        ScreeningResult(combo={'p': 1}, kpis={'USD': ScreeningKpis(net_pnl=1.0)}),
+        ScreeningResult(combo={'p': 2}, error='bad value'),
+        ScreeningResult(combo={'p': 3}, kpis={'USD': ScreeningKpis(net_pnl=5.0)}),
+    ]
+    assert [r.combo['p'] for r in rank_screening(results, 'net_pnl')] == [3, 1]
+    assert [r.combo['p'] for r in rank_screening(results, 'net_pnl', maximize=False)] == [1, 3]
+
+    results.append(ScreeningResult(combo={'p': 4}, kpis={'EUR': ScreeningKpis(net_pnl=9.0)}))
+    with pytest.raises(ValueError, match='objective_currency'):
+        rank_screening(results, 'net_pnl')
+    assert [r.combo['p'] for r in rank_screening(results, 'net_pnl', True, 'EUR')] == [4]
+
+
+# ============================================
+# Runner
+# ============================================
+
+def test_runner_reruns_only_the_top_screened_combinations(
+        tmp_path, monkeypatch, make_run_summary, make_provenance):
+    spec = tmp_path / 'screening.json'
+    spec.write_text(json.dumps({
+        'base_scenario_set': MINI_SET, 'objective': 'net_pnl', 'search': 'screening',
+        'screening': {'top_n': 2},
+        'grid': {'decision_logic_config.min_confidence': [0.1, 0.2, 0.3, 0.4]}}))
+
+    def _fake_screen(self, scenarios, combos):
+        # Best screened: 0.2, then 0.4
+        scores = {0.1: 1.0, 0.2: 9.0, 0.3: -4.0, 0.4: 5.0}
+        return [ScreeningResult(combo=c, kpis={'USD': ScreeningKpis(
+            net_pnl=scores[c['decision_logic_config.min_confidence']])}) for c in combos]
+
+    monkeypatch.setattr(ScreeningEngine, 'screen', _fake_screen)
+    monkeypatch.setattr(AppConfigManager, 'get_optimization_mount_reuse_enabled', lambda self: False)
+    monkeypatch.setattr(AppConfigManager, 'get_run_results_path',
+                        lambda self: str(tmp_path / 'run_results'))
+    ledger = RunResultsLedger(Path(AppConfigManager().get_run_results_path()))
+    ran = []
+
+    def _fake_run(cfg, app_config_loader, sweep_context=None, mount=None, run_group=None):
+        ran.append(sweep_context.sweep_params['decision_logic_config.min_confidence'])
+        ledger.append(
+            make_run_summary(net_pnl=1.0),
+            make_provenance(run_id=cfg.scenario_set_name, scenario_set_name=cfg.scenario_set_name,
+                            sweep_id=sweep_context.sweep_id, sweep_params=sweep_context.sweep_params))
+        return None
+
+    monkeypatch.setattr(
+        'python.framework.optimization.optimization_runner.initialize_batch_and_run', _fake_run)
+
+    sweep_id = OptimizationRunner().run(str(spec))
+
+    assert ran == [0.2, 0.4]
+    assert len(ledger.read_rows(sweep_id=sweep_id)) == 2
+
+
+def test_runner_rejects_a_non_positive_top_n(tmp_path):
+    spec = tmp_path / 'screening.json'
+    spec.write_text(json.dumps({
+        'base_scenario_set': MINI_SET, 'search': 'screening', 'screening': {'top_n': 0},
+        'grid': {'decision_logic_config.min_confidence': [0.1]}}))
+    with pytest.raises(ValueError, match='top_n'):
+        OptimizationRunner().run(str(spec))
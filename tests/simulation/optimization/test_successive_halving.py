@@ -0,0 +1,111 @@
+"""Successive-halving tests — rung schedule, data reduction, promotion, and the runner's rung loop."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from python.configuration.app_config_manager import AppConfigManager
+from python.framework.batch.batch_orchestrator import BatchOrchestrator
+from python.framework.optimization.optimization_runner import OptimizationRunner
+from python.framework.optimization.successive_halving import (
+    final_rung_rows, reduce_base, rung_fractions, select_survivors, survivor_count)
+from python.framework.reporting.store.run_results_ledger import RunResultsLedger
+from python.framework.types.api.report_types import RunResultRow
+from python.framework.types.config_types.optimization_config_types import HalvingSpec
+from python.framework.types.mount_package_types import MountPackage
+from python.scenario.scenario_config_loader import ScenarioConfigLoader
+
+MINI_SET = 'tests/fixtures/optimization/btcusd_mini_set.json'
+
+
+def _row(run_id, net_pnl, params, status='ok', rung=None):
+    return RunResultRow(param_hash=run_id, run_id=run_id, run_timestamp='2026-01-01T00:00:00+00:00',
+                        status=status, net_pnl=net_pnl, sweep_params=params, sweep_rung=rung)
+
+
+def test_rung_fractions_grow_by_eta_and_end_on_full_data():
+    assert rung_fractions(HalvingSpec(eta=3, min_resource=1 / 9)) == pytest.approx([1 / 9, 1 / 3, 1.0])
+    assert rung_fractions(HalvingSpec(eta=2, min_resource=0.3)) == pytest.approx([0.3, 0.6, 1.0])
+    assert rung_fractions(HalvingSpec(min_resource=1.0)) == [1.0]
+    with pytest.raises(ValueError):
+        rung_fractions(HalvingSpec(eta=1))
+    with pytest.raises(ValueError):
+        rung_fractions(HalvingSpec(min_resource=0))
+
+
+def test_survivor_count_keeps_at_least_one():
+    assert survivor_count(9, 3) == 3
+    assert survivor_count(2, 3) == 1
+
+
+def test_reduce_base_span_and_scenarios():
+    base = ScenarioConfigLoader().load_config(MINI_SET)
+    scenario = base.scenarios[0]
+
+    half = reduce_base(base, 0.5, 'span')
+    assert half.scenarios[0].end_date - half.scenarios[0].start_date == \
+        (scenario.end_date - scenario.start_date) / 2
+    assert half.scenarios[0].max_ticks == scenario.max_ticks // 2
+    assert base.scenarios[0].end_date == scenario.end_date        # base never mutated
+
+    assert len(reduce_base(base, 0.1, 'scenarios').scenarios) == 1   # at least one window
+    assert reduce_base(base, 1.0, 'span') is base
+
+
+def test_select_survivors_ranks_and_skips_errors():
+    combos = [{'p': 1}, {'p': 2}, {'p': 3}]
+    rows = [_row('a', 5.0, {'p': 1}), _row('b', 9.0, {'p': 2}),
+            _row('c', 99.0, {'p': 3}, status='error')]
+    assert select_survivors(rows, combos, 2, 'net_pnl', True) == [{'p': 2}, {'p': 1}]
+    assert select_survivors(rows, combos, 1, 'net_pnl', False) == [{'p': 1}]
+
+
+def test_final_rung_rows():
+    rows = [_row('a', 1.0, {'p': 1}, rung=0), _row('b', 2.0, {'p': 1}, rung=1)]
+    assert [r.run_id for r in final_rung_rows(rows)] == ['b']
+    grid_rows = [_row('a', 1.0, {'p': 1})]
+    assert final_rung_rows(grid_rows) == grid_rows
+
+
+def test_runner_promotes_best_combinations(
+        tmp_path, monkeypatch, make_run_summary, make_provenance):
+    """4 combos, eta=2 → rung 0 runs all four on half the data, rung 1 the best two on all of it."""
+    spec = tmp_path / 'halving.json'
+    spec.write_text(json.dumps({
+        'base_scenario_set': MINI_SET, 'objective': 'net_pnl', 'maximize': True,
+        'search': 'successive_halving', 'halving': {'eta': 2, 'min_resource': 0.5},
+        'grid': {'decision_logic_config.min_confidence': [0.1, 0.2, 0.3, 0.4]}}))
+
+    mount = MountPackage(
+        scenario_packages={0: object()}, clipping_stats_map={}, broker_configs={},
+        broker_scenario_map={}, signal_scenario_map={}, requirements_map=None,
+        warmup_phases=[], batch_warmup_time=0.0, data_identity={})
+    monkeypatch.setattr(BatchOrchestrator, 'build_mount', lambda self: mount)
+    # Own ledger dir: the fake rows must not leak into other tests' sweeps
+    monkeypatch.setattr(AppConfigManager, 'get_run_results_path',
+                        lambda self: str(tmp_path / 'run_results'))
+
+    ledger = RunResultsLedger(Path(AppConfigManager().get_run_results_path()))
+    max_ticks = []
+
+    def _fake_run(cfg, app_config_loader, sweep_context=None, mount=None, run_group=None):
+        max_ticks.append(cfg.scenarios[0].max_ticks)
+        confidence = sweep_context.sweep_params['decision_logic_config.min_confidence']
+        ledger.append(
+            make_run_summary(net_pnl=confidence * 100),
+            make_provenance(run_id=cfg.scenario_set_name, scenario_set_name=cfg.scenario_set_name,
+                            sweep_id=sweep_context.sweep_id, sweep_params=sweep_context.sweep_params,
+                            sweep_rung=sweep_context.rung))
+        return None
+
+    monkeypatch.setattr(
+        'python.framework.optimization.optimization_runner.initialize_batch_and_run', _fake_run)
+
+    sweep_id = OptimizationRunner().run(str(spec))
+
+    rows = ledger.read_rows(sweep_id=sweep_id)
+    assert sorted(r.sweep_rung for r in rows) == [0, 0, 0, 0, 1, 1]
+    assert max_ticks == [2000] * 4 + [4000] * 2
+    final = final_rung_rows(rows)
+    assert sorted(r.sweep_params['decision_logic_config.min_confidence'] for r in final) == [0.3, 0.4]
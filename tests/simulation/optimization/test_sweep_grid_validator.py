@@ -9,6 +9,7 @@ TestValidateScenarioParameters). The grid validator only guards the spec shape.
 import pytest
 
 from python.framework.logging.bootstrap_logger import get_global_logger
+from python.framework.types.config_types.optimization_config_types import ParamRange
 from python.framework.validators.sweep_grid_validator import validate_sweep_grid
 
 
@@ -68,3 +69,22 @@ def test_empty_value_list_raises(log):
     """A path mapping to an empty value list is rejected."""
     with pytest.raises(ValueError):
         validate_sweep_grid({'decision_logic_config.min_confidence': []}, log)
+
+
+def test_range_needs_bayes_search(log):
+    """A numeric range cannot be enumerated by a grid — allowed only for the bayes search."""
+    grid = {'decision_logic_config.min_confidence': ParamRange(low=0.2, high=0.8)}
+    with pytest.raises(ValueError, match='bayes'):
+        validate_sweep_grid(grid, log)
+    validate_sweep_grid(grid, log, allow_ranges=True)  # no raise
+
+
+@pytest.mark.parametrize('param_range', [
+    ParamRange(low=1.0, high=1.0),
+    ParamRange(low=0.0, high=1.0, step=0),
+    ParamRange(low=0.0, high=1.0, log=True),
+])
+def test_malformed_range_raises(log, param_range):
+    """low >= high, a non-positive step and a log range reaching 0 are rejected."""
+    with pytest.raises(ValueError):
+        validate_sweep_grid({'decision_logic_config.x': param_range}, log, allow_ranges=True)
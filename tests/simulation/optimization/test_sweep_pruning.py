@@ -0,0 +1,128 @@
+"""Sweep early-pruning tests — spec validation, rule resolution, the tick-loop check, and the runner."""
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from python.configuration.app_config_manager import AppConfigManager
+from python.framework.batch.batch_orchestrator import BatchOrchestrator
+from python.framework.optimization.optimization_analysis import rank, summarize_sweeps
+from python.framework.optimization.optimization_runner import OptimizationRunner
+from python.framework.optimization.sweep_pruning import build_prune_rule, validate_prune_spec
+from python.framework.process.process_tick_loop import _check_prune_rule
+from python.framework.reporting.store.run_provenance_builder import _prune_status
+from python.framework.reporting.store.run_results_ledger import RunResultsLedger
+from python.framework.types.api.report_types import RunResultRow
+from python.framework.types.config_types.optimization_config_types import SweepSpec
+from python.framework.types.mount_package_types import MountPackage
+from python.framework.types.run_results_types import PruneRule
+
+MINI_SET = 'tests/fixtures/optimization/btcusd_mini_set.json'
+
+
+def _spec(**overrides):
+    fields = {'base_scenario_set': MINI_SET, 'grid': {'decision_logic_config.x': [1, 2]},
+              'objective': 'max_drawdown', 'maximize': False,
+              'prune': {'objective_bound_k': 2}}
+    fields.update(overrides)
+    return SweepSpec(**fields)
+
+
+def _row(run_id, max_drawdown, status='ok'):
+    return RunResultRow(param_hash=run_id, run_id=run_id, run_timestamp='2026-01-01T00:00:00+00:00',
+                        status=status, max_drawdown=max_drawdown, currency='USD')
+
+
+def test_validate_rejects_unprovable_objective_bound():
+    validate_prune_spec(_spec())
+    validate_prune_spec(_spec(objective='net_pnl', prune={'max_drawdown': 500.0}))
+    with pytest.raises(ValueError, match='can recover'):
+        validate_prune_spec(_spec(objective='net_pnl', maximize=True))
+    with pytest.raises(ValueError, match='can recover'):
+        validate_prune_spec(_spec(maximize=True))        # a maximized drawdown is not monotone-worse
+    with pytest.raises(ValueError):
+        validate_prune_spec(_spec(prune={'check_every_ticks': 0}))
+    with pytest.raises(ValueError):
+        validate_prune_spec(_spec(prune={'max_drawdown': 0}))
+
+
+def test_bound_is_kth_best_of_ok_rows():
+    spec = _spec()
+    assert build_prune_rule(spec, [_row('a', 300.0)]).objective_bound is None   # < k finished
+    rows = [_row('a', 300.0), _row('b', 100.0), _row('c', 50.0, status='pruned'),
+            _row('d', 10.0, status='error')]
+    rule = build_prune_rule(spec, rows)
+    assert rule.objective_bound == 300.0      # 2nd best of the ok rows (100, 300)
+    assert rule.check_every_ticks == 1000 and rule.max_drawdown is None
+
+
+def test_check_prune_rule():
+    stats = SimpleNamespace(max_drawdown=250.0)
+    assert _check_prune_rule(PruneRule(max_drawdown=300.0), stats, 'USD') is None
+    assert 'exceeds the limit' in _check_prune_rule(PruneRule(max_drawdown=200.0), stats, 'USD')
+    bound = PruneRule(objective_bound=200.0, objective_currency='USD')
+    assert 'k-th best' in _check_prune_rule(bound, stats, 'USD')
+    assert _check_prune_rule(bound, stats, 'EUR') is None      # bound scoped to its currency
+
+
+def test_prune_status_from_tick_loop_results():
+    def _result(name, reason):
+        return SimpleNamespace(scenario_name=name,
+                               tick_loop_results=SimpleNamespace(pruned_reason=reason))
+    summary = SimpleNamespace(process_result_list=[
+        _result('s0', None), _result('s1', 'max drawdown 9.00 exceeds the limit 5.00'),
+        SimpleNamespace(scenario_name='s2', tick_loop_results=None)])
+    assert _prune_status(summary) == ('pruned', 's1: max drawdown 9.00 exceeds the limit 5.00')
+    assert _prune_status(SimpleNamespace(process_result_list=[_result('s0', None)])) == ('ok', None)
+
+
+def test_pruned_rows_never_rank_but_are_counted(tmp_ledger, make_run_summary, make_provenance):
+    tmp_ledger.append(make_run_summary(max_drawdown=100.0),
+                      make_provenance(run_id='r1', sweep_id='s'))
+    tmp_ledger.append(make_run_summary(max_drawdown=900.0),
+                      make_provenance(run_id='r2', sweep_id='s', status='pruned', error='dd'))
+    rows = tmp_ledger.read_rows()
+    assert [r.run_id for r in rank(rows, 'max_drawdown', maximize=False)] == ['r1']
+    summary = summarize_sweeps(rows)[0]
+    assert (summary.ok_count, summary.pruned_count, summary.error_count) == (1, 1, 0)
+
+
+def test_runner_attaches_rule_with_running_bound(
+        tmp_path, monkeypatch, make_run_summary, make_provenance):
+    """k=1: the first combination runs without a bound, later ones carry the best drawdown so far."""
+    spec = tmp_path / 'prune.json'
+    spec.write_text(json.dumps({
+        'base_scenario_set': MINI_SET, 'objective': 'max_drawdown', 'maximize': False,
+        'prune': {'objective_bound_k': 1, 'max_drawdown': 5000.0, 'check_every_ticks': 50},
+        'grid': {'decision_logic_config.min_confidence': [0.3, 0.1, 0.2]}}))
+
+    mount = MountPackage(
+        scenario_packages={0: object()}, clipping_stats_map={}, broker_configs={},
+        broker_scenario_map={}, signal_scenario_map={}, requirements_map=None,
+        warmup_phases=[], batch_warmup_time=0.0, data_identity={})
+    monkeypatch.setattr(BatchOrchestrator, 'build_mount', lambda self: mount)
+    # Own ledger dir: the fake rows must not leak into other tests' sweeps
+    monkeypatch.setattr(AppConfigManager, 'get_run_results_path',
+                        lambda self: str(tmp_path / 'run_results'))
+
+    ledger = RunResultsLedger(Path(AppConfigManager().get_run_results_path()))
+    rules = []
+
+    def _fake_run(cfg, app_config_loader, sweep_context=None, mount=None, run_group=None):
+        rules.append(cfg.scenarios[0].prune_rule)
+        confidence = sweep_context.sweep_params['decision_logic_config.min_confidence']
+        ledger.append(
+            make_run_summary(max_drawdown=confidence * 1000),
+            make_provenance(run_id=cfg.scenario_set_name, scenario_set_name=cfg.scenario_set_name,
+                            sweep_id=sweep_context.sweep_id, sweep_params=sweep_context.sweep_params))
+        return None
+
+    monkeypatch.setattr(
+        'python.framework.optimization.optimization_runner.initialize_batch_and_run', _fake_run)
+
+    OptimizationRunner().run(str(spec))
+
+    assert [r.objective_bound for r in rules] == [None, 300.0, 100.0]
+    assert all(r.max_drawdown == 5000.0 and r.check_every_ticks == 50 for r in rules)
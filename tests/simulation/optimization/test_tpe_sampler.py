@@ -0,0 +1,123 @@
+"""TPE sampler tests — seeded proposals over ranges + lists, no repeats, untried fallback, model focus, bayes runner loop."""
+
+import json
+from pathlib import Path
+
+from python.configuration.app_config_manager import AppConfigManager
+from python.framework.batch.batch_orchestrator import BatchOrchestrator
+from python.framework.optimization.optimization_runner import OptimizationRunner
+from python.framework.optimization.tpe_sampler import TpeSampler, equivalent_grid_size
+from python.framework.reporting.store.run_results_ledger import RunResultsLedger
+from python.framework.types.config_types.optimization_config_types import ParamRange
+from python.framework.types.mount_package_types import MountPackage
+
+MINI_SET = 'tests/fixtures/optimization/btcusd_mini_set.json'
+
+SPACE = {
+    'decision_logic_config.x': ParamRange(low=0.0, high=1.0),
+    'decision_logic_config.kind': ['p', 'q', 'r'],
+}
+
+
+def _objective(combo):
+    """Peak at x=0.8, kind='q'."""
+    return -(combo['decision_logic_config.x'] - 0.8) ** 2 + (
+        0.1 if combo['decision_logic_config.kind'] == 'q' else 0.0)
+
+
+def _search(seed, evaluations=32, batch=4):
+    sampler = TpeSampler(SPACE, seed=seed, startup=8)
+    history, proposed = [], []
+    while len(proposed) < evaluations:
+        for combo in sampler.propose(history, proposed, batch):
+            proposed.append(combo)
+            history.append((combo, _objective(combo)))
+    return proposed
+
+
+def test_seeded_proposals_are_deterministic():
+    assert _search(seed=3) == _search(seed=3)
+    assert _search(seed=3) != _search(seed=4)
+
+
+def test_ranges_respect_bounds_step_and_log():
+    space = {'a.n': ParamRange(low=2, high=10, step=2), 'a.lr': ParamRange(low=1e-4, high=1e-1, log=True)}
+    proposals = TpeSampler(space, seed=0).propose([], [], 20)
+    assert all(c['a.n'] in (2, 4, 6, 8, 10) and isinstance(c['a.n'], int) for c in proposals)
+    assert all(1e-4 <= c['a.lr'] <= 1e-1 for c in proposals)
+
+
+def test_never_repeats_and_stops_when_exhausted():
+    space = {'a.k': [1, 2, 3], 'a.n': ParamRange(low=0, high=1, step=1)}
+    assert equivalent_grid_size(space) == 6
+    sampler = TpeSampler(space, seed=0, startup=2)
+    first = sampler.propose([], [], 4)
+    rest = sampler.propose([(c, float(c['a.k'])) for c in first], first, 4)
+    combos = [json.dumps(c, sort_keys=True) for c in first + rest]
+    assert len(combos) == 6 and len(set(combos)) == 6
+    assert sampler.propose([], first + rest, 4) == []
+
+
+def test_falls_back_to_untried_when_draws_give_up(monkeypatch):
+    """Draws that keep hitting tried combinations do not end the search — the untried ones are picked."""
+    space = {'a.k': [1, 2, 3], 'a.n': ParamRange(low=0.5, high=1.5, step=0.5)}
+    sampler = TpeSampler(space, seed=0)
+    monkeypatch.setattr(TpeSampler, '_draw', lambda self, model, seen: None)
+    first = sampler.propose([], [], 5)
+    rest = sampler.propose([], first, 5)
+    combos = {json.dumps(c, sort_keys=True) for c in first + rest}
+    assert len(first) == 5 and len(rest) == 4 and len(combos) == 9
+    assert all(c['a.n'] in (0.5, 1.0, 1.5) for c in first + rest)
+    assert sampler.propose([], first + rest, 5) == []
+
+
+def test_model_focuses_on_the_good_region():
+    """After the random startup, proposals concentrate near the optimum (random: mean |x - 0.8| ≈ 0.34)."""
+    late = _search(seed=1)[16:]
+    assert sum(abs(c['decision_logic_config.x'] - 0.8) for c in late) / len(late) < 0.25
+    assert sum(c['decision_logic_config.kind'] == 'q' for c in late) > len(late) / 2
+
+
+def test_equivalent_grid_size_unbounded_for_continuous_range():
+    assert equivalent_grid_size(SPACE) is None
+    assert equivalent_grid_size({'a.k': [1, 2], 'a.m': [1, 2, 3]}) == 6
+
+
+def test_runner_spends_the_budget_in_batches(
+        tmp_path, monkeypatch, make_run_summary, make_provenance):
+    """budget 6, batch 4 → two batches (4 + 2), six distinct combinations recorded."""
+    spec = tmp_path / 'bayes.json'
+    spec.write_text(json.dumps({
+        'base_scenario_set': MINI_SET, 'objective': 'net_pnl',
+        'search': {'method': 'bayes', 'budget': 6, 'batch_size': 4, 'startup': 4, 'seed': 1},
+        'grid': {'decision_logic_config.min_confidence': {'low': 0.1, 'high': 0.9},
+                 'decision_logic_config.lot_size': [0.01, 0.02]}}))
+
+    mount = MountPackage(
+        scenario_packages={0: object()}, clipping_stats_map={}, broker_configs={},
+        broker_scenario_map={}, signal_scenario_map={}, requirements_map=None,
+        warmup_phases=[], batch_warmup_time=0.0, data_identity={})
+    monkeypatch.setattr(BatchOrchestrator, 'build_mount', lambda self: mount)
+    monkeypatch.setattr(AppConfigManager, 'get_run_results_path',
+                        lambda self: str(tmp_path / 'run_results'))
+    ledger = RunResultsLedger(Path(AppConfigManager().get_run_results_path()))
+    batches = []
+
+    def _fake_run(cfg, app_config_loader, sweep_context=None, mount=None, run_group=None):
+        batches.append(cfg.scenario_set_name)
+        ledger.append(
+            make_run_summary(net_pnl=sweep_context.sweep_params['decision_logic_config.min_confidence']),
+            make_provenance(param_hash=cfg.scenario_set_name, run_id=cfg.scenario_set_name,
+                            scenario_set_name=cfg.scenario_set_name,
+                            sweep_id=sweep_context.sweep_id, sweep_params=sweep_context.sweep_params))
+        return None
+
+    monkeypatch.setattr(
+        'python.framework.optimization.optimization_runner.initialize_batch_and_run', _fake_run)
+
+    sweep_id = OptimizationRunner().run(str(spec))
+
+    rows = ledger.read_rows(sweep_id=sweep_id)
+    assert len(rows) == 6
+    assert len({json.dumps(r.sweep_params, sort_keys=True) for r in rows}) == 6
+    assert [name[-4:] for name in batches] == [f'c{i:03d}' for i in range(6)]
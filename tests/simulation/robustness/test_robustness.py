@@ -4,21 +4,25 @@ Robustness Validation Tests (#367).
 Multi-window + IS/OOS validation, sim-only. Covers: the time-ordered role policy, the generator
 `to_scenario_dict` cleanliness, the parameter-constancy guard, the RobustnessConfig schema, the
 DERIVE builder (distribution / IS-OOS / WFE / regime / disposition) against a REAL
-BatchExecutionSummary, and the PostRunValidator verdict (OVERFIT / drift / low-N / trust gate).
+BatchExecutionSummary, the PostRunValidator verdict (OVERFIT / drift / low-N / trust gate), and
+the single-pass span planning (WindowSpanPlanner).
 """
 import json
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import pytest
 from pydantic import ValidationError
 
+from python.framework.batch.window_span_planner import WindowSpanPlanner
+from python.framework.logging.bootstrap_logger import get_global_logger
 from python.framework.reporting.builders.robustness_report_builder import build_robustness_report_from_batch
 from python.framework.types.batch_execution_types import BatchExecutionSummary
 from python.framework.types.config_types.robustness_config_types import (
     RobustnessConfig, RobustnessMetric, RobustnessRole)
+from python.framework.types.market_types.market_data_types import TickTransportColumn
 from python.framework.types.process_data_types import (
-    BlockBoundaryReport, ProcessResult, ProcessTickLoopResult)
+    BlockBoundaryReport, ProcessDataPackage, ProcessResult, ProcessTickLoopResult)
 from python.framework.types.portfolio_types.portfolio_aggregation_types import PortfolioStats
 from python.framework.types.scenario_types.scenario_set_types import SingleScenario
 from python.framework.types.trading_env_types.broker_types import BrokerType
@@ -290,3 +294,65 @@ class TestLoaderParsing:
     def test_invalid_role_rejected(self):
         with pytest.raises(ValueError):
             ScenarioConfigLoader().load_config(str(_FIXTURE / 'robustness_bad_role.json'))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Single-pass execution — span planning + result split (WindowSpanPlanner)
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _window(name, idx, start_h, end_h, strategy=None) -> SingleScenario:
+    s = _scenario(name, idx, strategy=strategy or {'decision_logic_type': 'CORE/x'})
+    s.start_date = _DT + timedelta(hours=start_h)
+    s.end_date = _DT + timedelta(hours=end_h)
+    return s
+
+
+def _package(start_h, end_h) -> ProcessDataPackage:
+    """A data package with one tick per hour, end inclusive (the boundary tick is in both)."""
+    ticks = tuple(
+        {TickTransportColumn.TIME_MSC: int((_DT + timedelta(hours=h)).timestamp() * 1000)}
+        for h in range(start_h, end_h + 1))
+    return ProcessDataPackage(
+        ticks={'ETHUSD': ticks}, bars={}, broker_configs=(),
+        tick_ranges={'ETHUSD': (_DT + timedelta(hours=start_h), _DT + timedelta(hours=end_h))})
+
+
+class TestWindowSpanPlanner:
+    def _planner(self):
+        return WindowSpanPlanner(get_global_logger())
+
+    def test_single_pass_off_by_default(self):
+        assert RobustnessConfig().single_pass is False
+
+    def test_touching_windows_chain_into_one_span(self):
+        windows = [_window('w1', 0, 0, 4), _window('w2', 1, 4, 8), _window('w3', 2, 8, 12),
+                   _window('w4', 3, 13, 16)]   # gap before w4 → runs alone
+        packages = {i: _package(w.start_date.hour, w.end_date.hour) for i, w in enumerate(windows)}
+        assert self._planner().plan(windows, packages) == {0: [1, 2]}
+        assert [b.name for b in windows[0].window_span] == ['w2', 'w3']
+        assert [w.window_span_lead for w in windows] == [None, 0, 0, None]
+
+    def test_parameter_drift_breaks_the_span(self):
+        windows = [_window('w1', 0, 0, 4), _window('w2', 1, 4, 8, {'decision_logic_type': 'CORE/y'})]
+        packages = {0: _package(0, 4), 1: _package(4, 8)}
+        assert self._planner().plan(windows, packages) == {}
+
+    def test_span_package_assigns_boundary_ticks_once(self):
+        windows = [_window('w1', 0, 0, 4), _window('w2', 1, 4, 8)]
+        packages = {0: _package(0, 4), 1: _package(4, 8)}
+        planner = self._planner()
+        planner.plan(windows, packages)
+        span = planner.span_packages(windows, packages)[0]
+        assert span.tick_counts == {'ETHUSD': 9}          # hours 0..8, boundary hour 4 once
+        assert span.tick_ranges['ETHUSD'] == (_DT, _DT + timedelta(hours=8))
+        assert len(packages[0].ticks['ETHUSD']) == 5       # the mount's own package is untouched
+
+    def test_results_split_per_window(self):
+        windows = [_window('w1', 0, 0, 4), _window('w2', 1, 4, 8)]
+        self._planner().plan(windows, {0: _package(0, 4), 1: _package(4, 8)})
+        lead = _result('w1', 0, 10.0)
+        lead.window_tick_loop_results = [ProcessTickLoopResult(portfolio_stats=_stats(-5.0))]
+        results = self._planner().expand_results([lead, None], windows)
+        assert [(r.scenario_name, r.scenario_index) for r in results] == [('w1', 0), ('w2', 1)]
+        assert results[1].tick_loop_results.portfolio_stats.total_loss == 5.0
+        assert results[0].window_tick_loop_results is None